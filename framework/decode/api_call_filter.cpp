@@ -0,0 +1,144 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "decode/api_call_filter.h"
+
+#include "decode/decode_allocator.h"
+#include "generated/generated_vulkan_decoder.h"
+#include "generated/generated_vulkan_handle_id_consumer.h"
+
+#include <algorithm>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+ApiCallFilter::ApiCallFilter() :
+    handle_id_decoder_(std::make_unique<VulkanDecoder>()),
+    handle_id_consumer_(std::make_unique<VulkanHandleIdConsumer>())
+{
+    // The parameter data is decoded only for the consumer that collects the handle IDs, so the value and pointer
+    // decoders that are shared with replay are not involved in handle ID filtering.
+    handle_id_decoder_->AddConsumer(handle_id_consumer_.get());
+}
+
+ApiCallFilter::~ApiCallFilter() {}
+
+bool ApiCallFilter::IsApiCallIncluded(format::ApiCallId call_id, format::ThreadId thread_id, uint32_t frame_number)
+{
+    if ((frame_number < first_frame_) || (frame_number > last_frame_))
+    {
+        return false;
+    }
+
+    if (!thread_ids_.empty() && (std::find(thread_ids_.begin(), thread_ids_.end(), thread_id) == thread_ids_.end()))
+    {
+        return false;
+    }
+
+    return name_patterns_.empty() || IsApiCallNameIncluded(call_id);
+}
+
+bool ApiCallFilter::IsParameterDataIncluded(format::ApiCallId  call_id,
+                                            const ApiCallInfo& call_info,
+                                            const uint8_t*     parameter_buffer,
+                                            size_t             buffer_size)
+{
+    if (handle_ids_.empty())
+    {
+        return true;
+    }
+
+    // The consumer collects the IDs of the handle parameters and struct members, so only the parameter data that was
+    // encoded as a handle ID is matched.
+    handle_id_consumer_->ClearHandleIds();
+
+    DecodeAllocator::Begin();
+    handle_id_decoder_->DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);
+    DecodeAllocator::End();
+
+    const auto& decoded_handle_ids = handle_id_consumer_->GetHandleIds();
+    return std::any_of(decoded_handle_ids.begin(), decoded_handle_ids.end(), [this](format::HandleId handle_id) {
+        return std::find(handle_ids_.begin(), handle_ids_.end(), handle_id) != handle_ids_.end();
+    });
+}
+
+bool ApiCallFilter::MatchesPattern(const char* name, const char* pattern)
+{
+    // Position to resume matching from when a mismatch follows a '*' wildcard.
+    const char* star_pattern = nullptr;
+    const char* star_name    = nullptr;
+
+    while (*name != '\0')
+    {
+        if ((*pattern == '?') || ((*pattern != '*') && (*pattern == *name)))
+        {
+            ++pattern;
+            ++name;
+        }
+        else if (*pattern == '*')
+        {
+            star_pattern = ++pattern;
+            star_name    = name;
+        }
+        else if (star_pattern != nullptr)
+        {
+            // Let the last '*' match one more character.
+            pattern = star_pattern;
+            name    = ++star_name;
+        }
+        else
+        {
+            return false;
+        }
+    }
+
+    while (*pattern == '*')
+    {
+        ++pattern;
+    }
+
+    return (*pattern == '\0');
+}
+
+bool ApiCallFilter::IsApiCallNameIncluded(format::ApiCallId call_id)
+{
+    auto entry = name_matches_.find(call_id);
+    if (entry != name_matches_.end())
+    {
+        return entry->second;
+    }
+
+    bool        included = false;
+    const char* name     = VulkanDecoder::GetApiCallName(call_id);
+    if (name != nullptr)
+    {
+        included = std::any_of(name_patterns_.begin(), name_patterns_.end(), [name](const std::string& pattern) {
+            return MatchesPattern(name, pattern.c_str());
+        });
+    }
+
+    name_matches_.emplace(call_id, included);
+    return included;
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
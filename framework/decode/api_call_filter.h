@@ -0,0 +1,102 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_API_CALL_FILTER_H
+#define GFXRECON_DECODE_API_CALL_FILTER_H
+
+#include "decode/api_decoder.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <cstdint>
+#include <limits>
+#include <memory>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+class VulkanDecoder;
+class VulkanHandleIdConsumer;
+
+// Selects the API calls that the FileProcessor sends to its decoders.  Every criterion that has been set must match for
+// an API call to be included, and an API call is matched by a criterion when it matches any of its values.  The API
+// call name, thread ID, and frame number are checked with the function call block header, so excluded API calls are
+// skipped without reading or decompressing their parameter data.  Handle IDs are checked by decoding the parameter
+// data before it is sent to the decoders.
+class ApiCallFilter
+{
+  public:
+    ApiCallFilter();
+
+    ~ApiCallFilter();
+
+    // Includes API calls with names that match the pattern, where '*' matches any sequence of characters and '?'
+    // matches any single character.
+    void AddApiCallNamePattern(const std::string& pattern) { name_patterns_.push_back(pattern); }
+
+    void AddThreadId(format::ThreadId thread_id) { thread_ids_.push_back(thread_id); }
+
+    // Includes API calls with a handle parameter, or a handle member of a struct parameter, that has the handle ID.
+    // Other parameter values that are equal to the handle ID are not matched.
+    void AddHandleId(format::HandleId handle_id) { handle_ids_.push_back(handle_id); }
+
+    // Includes API calls from frames first_frame through last_frame, using the FileProcessor frame numbering, which
+    // starts at 0.
+    void SetFrameRange(uint32_t first_frame, uint32_t last_frame)
+    {
+        first_frame_ = first_frame;
+        last_frame_  = last_frame;
+    }
+
+    uint32_t GetFirstFrame() const { return first_frame_; }
+
+    bool IsApiCallIncluded(format::ApiCallId call_id, format::ThreadId thread_id, uint32_t frame_number);
+
+    bool IsParameterDataIncluded(format::ApiCallId  call_id,
+                                 const ApiCallInfo& call_info,
+                                 const uint8_t*     parameter_buffer,
+                                 size_t             buffer_size);
+
+    static bool MatchesPattern(const char* name, const char* pattern);
+
+  private:
+    bool IsApiCallNameIncluded(format::ApiCallId call_id);
+
+  private:
+    std::vector<std::string>                name_patterns_;
+    std::vector<format::ThreadId>           thread_ids_;
+    std::vector<format::HandleId>           handle_ids_;
+    uint32_t                                first_frame_{ 0 };
+    uint32_t                                last_frame_{ std::numeric_limits<uint32_t>::max() };
+    std::unordered_map<uint32_t, bool>      name_matches_; // Name pattern results, cached by API call ID.
+    std::unique_ptr<VulkanDecoder>          handle_id_decoder_;
+    std::unique_ptr<VulkanHandleIdConsumer> handle_id_consumer_;
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_API_CALL_FILTER_H
@@ -0,0 +1,196 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "decode/block_index.h"
+
+#include "util/logging.h"
+#include "util/platform.h"
+
+#include <cassert>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+void BlockIndex::Clear()
+{
+    capture_info_ = {};
+    blocks_.clear();
+    frame_first_blocks_.clear();
+}
+
+void BlockIndex::AddBlock(uint64_t offset, format::BlockType type, uint32_t id, uint32_t frame_number)
+{
+    assert(blocks_.empty() || ((offset > blocks_.back().offset) && (frame_number >= blocks_.back().frame_number)));
+
+    // Frames without any blocks start at the next block.
+    while (frame_first_blocks_.size() <= frame_number)
+    {
+        frame_first_blocks_.push_back(blocks_.size());
+    }
+
+    blocks_.push_back({ offset, type, id, frame_number, 0 });
+}
+
+bool BlockIndex::GetFrameFirstBlock(uint32_t frame_number, uint64_t* block_number) const
+{
+    assert(block_number != nullptr);
+
+    if ((frame_number < frame_first_blocks_.size()) && (frame_first_blocks_[frame_number] < blocks_.size()))
+    {
+        *block_number = frame_first_blocks_[frame_number];
+        return true;
+    }
+
+    return false;
+}
+
+std::vector<uint64_t> BlockIndex::GetStateMarkerBlocks() const
+{
+    std::vector<uint64_t> marker_blocks;
+
+    for (uint64_t i = 0; i < blocks_.size(); ++i)
+    {
+        if (blocks_[i].type == format::BlockType::kStateMarkerBlock)
+        {
+            marker_blocks.push_back(i);
+        }
+    }
+
+    return marker_blocks;
+}
+
+bool BlockIndex::WriteFile(const std::string& filename) const
+{
+    FILE*   file   = nullptr;
+    int32_t result = util::platform::FileOpen(&file, filename.c_str(), "wb");
+
+    if ((result != 0) || (file == nullptr))
+    {
+        GFXRECON_LOG_ERROR("Failed to open block index file %s", filename.c_str());
+        return false;
+    }
+
+    format::BlockIndexHeader header;
+    header.fourcc       = GFXRECON_BLOCK_INDEX_FOURCC;
+    header.version      = format::kBlockIndexVersion;
+    header.capture_info = capture_info_;
+    header.block_count  = blocks_.size();
+    header.frame_count  = frame_first_blocks_.size();
+
+    bool success =
+        (util::platform::FileWrite(&header, sizeof(header), 1, file) == 1) &&
+        (util::platform::FileWrite(blocks_.data(), sizeof(blocks_[0]), blocks_.size(), file) == blocks_.size()) &&
+        (util::platform::FileWrite(
+             frame_first_blocks_.data(), sizeof(frame_first_blocks_[0]), frame_first_blocks_.size(), file) ==
+         frame_first_blocks_.size());
+
+    util::platform::FileClose(file);
+
+    if (!success)
+    {
+        GFXRECON_LOG_ERROR("Failed to write block index file %s", filename.c_str());
+    }
+
+    return success;
+}
+
+bool BlockIndex::ReadFile(const std::string& filename)
+{
+    Clear();
+
+    FILE*   file   = nullptr;
+    int32_t result = util::platform::FileOpen(&file, filename.c_str(), "rb");
+
+    if ((result != 0) || (file == nullptr))
+    {
+        return false;
+    }
+
+    int64_t file_size = -1;
+
+    if (util::platform::FileSeek(file, 0, util::platform::FileSeekEnd))
+    {
+        file_size = util::platform::FileTell(file);
+    }
+
+    format::BlockIndexHeader header;
+    bool success = (file_size >= 0) && util::platform::FileSeek(file, 0, util::platform::FileSeekSet) &&
+                   (util::platform::FileRead(&header, sizeof(header), 1, file) == 1);
+
+    if (success && ((header.fourcc != GFXRECON_BLOCK_INDEX_FOURCC) || (header.version != format::kBlockIndexVersion)))
+    {
+        GFXRECON_LOG_WARNING("Ignoring block index file %s with an unrecognized format", filename.c_str());
+        success = false;
+    }
+    else if (success)
+    {
+        // The counts are checked against the file size before allocating any storage for the entries, so that a
+        // truncated or corrupt index file is ignored.  The counts are divided rather than multiplied to avoid overflow.
+        uint64_t data_size  = static_cast<uint64_t>(file_size) - sizeof(header);
+        uint64_t block_size = sizeof(format::BlockIndexEntry);
+        uint64_t frame_size = sizeof(frame_first_blocks_[0]);
+
+        if ((header.block_count > (data_size / block_size)) ||
+            (header.frame_count != ((data_size - (header.block_count * block_size)) / frame_size)) ||
+            (((data_size - (header.block_count * block_size)) % frame_size) != 0))
+        {
+            GFXRECON_LOG_WARNING("Ignoring block index file %s, which has an invalid size", filename.c_str());
+            success = false;
+        }
+    }
+
+    if (success)
+    {
+        GFXRECON_CHECK_CONVERSION_DATA_LOSS(size_t, header.block_count);
+        GFXRECON_CHECK_CONVERSION_DATA_LOSS(size_t, header.frame_count);
+
+        blocks_.resize(static_cast<size_t>(header.block_count));
+        frame_first_blocks_.resize(static_cast<size_t>(header.frame_count));
+
+        success =
+            (util::platform::FileRead(blocks_.data(), sizeof(blocks_[0]), blocks_.size(), file) == blocks_.size()) &&
+            (util::platform::FileRead(
+                 frame_first_blocks_.data(), sizeof(frame_first_blocks_[0]), frame_first_blocks_.size(), file) ==
+             frame_first_blocks_.size());
+
+        if (!success)
+        {
+            GFXRECON_LOG_WARNING("Failed to read block index file %s", filename.c_str());
+        }
+    }
+
+    util::platform::FileClose(file);
+
+    if (success)
+    {
+        capture_info_ = header.capture_info;
+    }
+    else
+    {
+        Clear();
+    }
+
+    return success;
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
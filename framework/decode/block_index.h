@@ -0,0 +1,85 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_BLOCK_INDEX_H
+#define GFXRECON_DECODE_BLOCK_INDEX_H
+
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <cstdint>
+#include <string>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Offsets, types, and frame numbers of the blocks of a capture file, which allow the FileProcessor to seek to a block
+// or frame.  The index is built by FileProcessor::BuildBlockIndex(), and can be saved to a sidecar file next to the
+// capture file.  Frames are numbered from 0, as in FileProcessor.
+class BlockIndex
+{
+  public:
+    static std::string GetIndexFilename(const std::string& capture_filename)
+    {
+        return capture_filename + GFXRECON_BLOCK_INDEX_FILE_EXTENSION;
+    }
+
+    void Clear();
+
+    // Blocks must be added in file order.
+    void AddBlock(uint64_t offset, format::BlockType type, uint32_t id, uint32_t frame_number);
+
+    void SetCaptureInfo(const format::BlockIndexCaptureInfo& capture_info) { capture_info_ = capture_info; }
+
+    const format::BlockIndexCaptureInfo& GetCaptureInfo() const { return capture_info_; }
+
+    uint64_t GetCaptureFileSize() const { return capture_info_.file_size; }
+
+    uint64_t GetBlockCount() const { return blocks_.size(); }
+
+    const format::BlockIndexEntry& GetBlock(uint64_t block_number) const { return blocks_[block_number]; }
+
+    uint32_t GetFrameCount() const { return static_cast<uint32_t>(frame_first_blocks_.size()); }
+
+    // Returns false if the index does not contain any blocks for the frame.
+    bool GetFrameFirstBlock(uint32_t frame_number, uint64_t* block_number) const;
+
+    // Returns the numbers of the state marker blocks, which delimit the state snapshot of a trimmed capture.
+    std::vector<uint64_t> GetStateMarkerBlocks() const;
+
+    bool WriteFile(const std::string& filename) const;
+
+    // Returns false if the file could not be read, or if its size does not match the block and frame counts of its
+    // header.  The caller is responsible for comparing the capture info with the capture file.
+    bool ReadFile(const std::string& filename);
+
+  private:
+    format::BlockIndexCaptureInfo        capture_info_{};
+    std::vector<format::BlockIndexEntry> blocks_;
+    std::vector<uint64_t>                frame_first_blocks_;
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_BLOCK_INDEX_H
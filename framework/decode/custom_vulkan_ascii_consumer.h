@@ -39,42 +39,46 @@
 
 #include "vulkan/vulkan.h"
 
-#include <sstream>
 #include <string>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
-inline std::string HandleIdToString(format::HandleId handleId)
+inline void HandleIdToString(std::string& strBuf, format::HandleId handleId)
 {
-    std::stringstream strStrm;
     if (handleId)
     {
-        strStrm << "\"0x" << reinterpret_cast<const void*>(handleId) << "\"";
+        util::QuotedPtrToString(strBuf, handleId);
     }
     else
     {
-        strStrm << "\"VK_NULL_HANDLE\"";
+        strBuf.append("\"VK_NULL_HANDLE\"");
     }
-    return strStrm.str();
 }
 
 template <typename VkHandleType>
-inline std::string HandlePointerDecoderToString(HandlePointerDecoder<VkHandleType>* pObj)
+inline void HandlePointerDecoderToString(std::string& strBuf, HandlePointerDecoder<VkHandleType>* pObj)
 {
     auto pDecodedObj = pObj ? pObj->GetPointer() : nullptr;
-    return HandleIdToString(pDecodedObj ? *pDecodedObj : format::kNullHandleId);
+    HandleIdToString(strBuf, pDecodedObj ? *pDecodedObj : format::kNullHandleId);
 }
 
 template <typename VkEnumType>
-inline std::string EnumPointerDecoderToString(PointerDecoder<VkEnumType>* pObj)
+inline void EnumPointerDecoderToString(std::string& strBuf, PointerDecoder<VkEnumType>* pObj)
 {
     auto pDecodedObj = pObj ? pObj->GetPointer() : nullptr;
-    return pDecodedObj ? ('"' + util::ToString(*pDecodedObj) + '"') : "null";
+    if (pDecodedObj)
+    {
+        util::QuotedToString(strBuf, *pDecodedObj);
+    }
+    else
+    {
+        strBuf.append("null");
+    }
 }
 
 template <typename T>
-inline std::string DataPointerDecoderToString(const T& pObj)
+inline void DataPointerDecoderToString(std::string& strBuf, const T& pObj)
 {
     // NOTE : Currently we just output the integer value of data void pointers, for
     //  fields that use a PointerDecoder<> we output the address of the decoder
@@ -82,23 +86,25 @@ inline std::string DataPointerDecoderToString(const T& pObj)
     //  be a terribly useful thing anyway.  There are structures that have data
     //  fields that can be interpreted correctly...if we want to output interpreted
     //  void pointer data we can implement custom handlers for those structures.
-    return "\"" + util::PtrToString(pObj) + "\"";
+    util::QuotedPtrToString(strBuf, pObj);
 }
 
 template <typename PointerDecoderType>
-inline std::string PointerDecoderToString(PointerDecoderType* pObj,
-                                          util::ToStringFlags toStringFlags = util::kToString_Default,
-                                          uint32_t            tabCount      = 0,
-                                          uint32_t            tabSize       = 4)
+inline void PointerDecoderToString(std::string&        strBuf,
+                                   PointerDecoderType* pObj,
+                                   util::ToStringFlags toStringFlags = util::kToString_Default,
+                                   uint32_t            tabCount      = 0,
+                                   uint32_t            tabSize       = 4)
 {
     auto pDecodedObj = pObj ? pObj->GetPointer() : nullptr;
-    return pDecodedObj ? util::ToString(*pDecodedObj, toStringFlags, tabCount, tabSize) : "null";
+    util::PointerToString(strBuf, pDecodedObj, toStringFlags, tabCount, tabSize);
 }
 
-inline std::string DescriptorUpdateTemplateDecoderToString(const DescriptorUpdateTemplateDecoder* pObj,
-                                                           util::ToStringFlags toStringFlags = util::kToString_Default,
-                                                           uint32_t            tabCount      = 0,
-                                                           uint32_t            tabSize       = 4)
+inline void DescriptorUpdateTemplateDecoderToString(std::string&                           strBuf,
+                                                    const DescriptorUpdateTemplateDecoder* pObj,
+                                                    util::ToStringFlags toStringFlags = util::kToString_Default,
+                                                    uint32_t            tabCount      = 0,
+                                                    uint32_t            tabSize       = 4)
 {
     VkWriteDescriptorSet                         writeDescriptorSet{};
     VkWriteDescriptorSetAccelerationStructureKHR writeDescriptorSetAccelerationStructure{};
@@ -133,13 +139,12 @@ inline std::string DescriptorUpdateTemplateDecoderToString(const DescriptorUpdat
                 pObj->GetAccelerationStructureKHRPointer();
         }
     }
-    return util::ToString(writeDescriptorSet, toStringFlags, tabCount, tabSize);
+    util::ToString(strBuf, writeDescriptorSet, toStringFlags, tabCount, tabSize);
 }
 
-inline std::string StringDecoderToString(const StringDecoder* pObj)
+inline void StringDecoderToString(std::string& strBuf, const StringDecoder* pObj)
 {
-    auto pDecodedString = pObj ? pObj->GetPointer() : nullptr;
-    return pDecodedString ? ('"' + std::string(pDecodedString) + '"') : "null";
+    util::CStrToString(strBuf, pObj ? pObj->GetPointer() : nullptr);
 }
 
 template <typename CountType>
@@ -156,57 +161,69 @@ inline uint32_t GetCount<PointerDecoder<uint32_t>*>(PointerDecoder<uint32_t>* pC
 }
 
 template <typename CountType, typename VkHandleType>
-inline std::string HandlePointerDecoderArrayToString(const CountType&                    countObj,
-                                                     HandlePointerDecoder<VkHandleType>* pObjs,
-                                                     util::ToStringFlags toStringFlags = util::kToString_Default,
-                                                     uint32_t            tabCount      = 0,
-                                                     uint32_t            tabSize       = 4)
+inline void HandlePointerDecoderArrayToString(std::string&                        strBuf,
+                                              const CountType&                    countObj,
+                                              HandlePointerDecoder<VkHandleType>* pObjs,
+                                              util::ToStringFlags toStringFlags = util::kToString_Default,
+                                              uint32_t            tabCount      = 0,
+                                              uint32_t            tabSize       = 4)
 {
     using namespace util;
-    return ArrayToString(
+    ArrayToString(
+        strBuf,
         GetCount(countObj),
         pObjs,
         toStringFlags,
         tabCount,
         tabSize,
         [&]() { return pObjs && !pObjs->IsNull(); },
-        [&](uint32_t i) { return HandleIdToString((format::HandleId)pObjs->GetPointer()[i]); });
+        [&](std::string& elementBuf, uint32_t i) {
+            HandleIdToString(elementBuf, (format::HandleId)pObjs->GetPointer()[i]);
+        });
 }
 
 template <typename CountType, typename PointerDecoderType>
-inline std::string PointerDecoderArrayToString(const CountType&    countObj,
-                                               PointerDecoderType* pObjs,
-                                               util::ToStringFlags toStringFlags = util::kToString_Default,
-                                               uint32_t            tabCount      = 0,
-                                               uint32_t            tabSize       = 4)
+inline void PointerDecoderArrayToString(std::string&        strBuf,
+                                        const CountType&    countObj,
+                                        PointerDecoderType* pObjs,
+                                        util::ToStringFlags toStringFlags = util::kToString_Default,
+                                        uint32_t            tabCount      = 0,
+                                        uint32_t            tabSize       = 4)
 {
     using namespace util;
-    return ArrayToString(
+    ArrayToString(
+        strBuf,
         GetCount(countObj),
         pObjs,
         toStringFlags,
         tabCount,
         tabSize,
         [&]() { return pObjs && !pObjs->IsNull(); },
-        [&](uint32_t i) { return ToString(pObjs->GetPointer()[i], toStringFlags, tabCount + 1, tabSize); });
+        [&](std::string& elementBuf, uint32_t i) {
+            ToString(elementBuf, pObjs->GetPointer()[i], toStringFlags, tabCount + 1, tabSize);
+        });
 }
 
 template <typename CountType, typename PointerDecoderType>
-inline std::string EnumPointerDecoderArrayToString(const CountType&    countObj,
-                                                   PointerDecoderType* pObjs,
-                                                   util::ToStringFlags toStringFlags = util::kToString_Default,
-                                                   uint32_t            tabCount      = 0,
-                                                   uint32_t            tabSize       = 4)
+inline void EnumPointerDecoderArrayToString(std::string&        strBuf,
+                                            const CountType&    countObj,
+                                            PointerDecoderType* pObjs,
+                                            util::ToStringFlags toStringFlags = util::kToString_Default,
+                                            uint32_t            tabCount      = 0,
+                                            uint32_t            tabSize       = 4)
 {
     using namespace util;
-    return ArrayToString(
+    ArrayToString(
+        strBuf,
         GetCount(countObj),
         pObjs,
         toStringFlags,
         tabCount,
         tabSize,
         [&]() { return pObjs && !pObjs->IsNull(); },
-        [&](uint32_t i) { return '"' + ToString(pObjs->GetPointer()[i], toStringFlags, tabCount + 1, tabSize) + '"'; });
+        [&](std::string& elementBuf, uint32_t i) {
+            QuotedToString(elementBuf, pObjs->GetPointer()[i], toStringFlags, tabCount + 1, tabSize);
+        });
 }
 
 GFXRECON_END_NAMESPACE(decode)
@@ -36,272 +36,323 @@ GFXRECON_BEGIN_NAMESPACE(util)
 //  need validation to interpret correctly, etc...
 
 template <>
-std::string ToString<SECURITY_ATTRIBUTES>(const SECURITY_ATTRIBUTES& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<SECURITY_ATTRIBUTES>(std::string& strBuf, const SECURITY_ATTRIBUTES& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "nLength", toStringFlags, tabCount, tabSize, ToString(obj.nLength, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "lpSecurityDescriptor", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.lpSecurityDescriptor) + '"');
-            FieldToString(strStrm, false, "bInheritHandle", toStringFlags, tabCount, tabSize, ToString(obj.bInheritHandle, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "nLength", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.nLength, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "lpSecurityDescriptor", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.lpSecurityDescriptor);
+            FieldToString(fieldBuf, false, "bInheritHandle", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.bInheritHandle, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkAccelerationStructureGeometryKHR>(const VkAccelerationStructureGeometryKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkAccelerationStructureGeometryKHR>(std::string& strBuf, const VkAccelerationStructureGeometryKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "geometryType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.geometryType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "geometry", toStringFlags, tabCount, tabSize,
-                ObjectToString(toStringFlags, tabCount, tabSize,
-                    [&](std::stringstream& subStrStrm)
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "geometryType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.geometryType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "geometry", toStringFlags, tabCount, tabSize);
+            ObjectToString(fieldBuf, toStringFlags, tabCount, tabSize,
+                [&](std::string& subStrBuf)
+                {
+                    switch (obj.geometryType)
                     {
-                        switch (obj.geometryType)
-                        {
-                        case VK_GEOMETRY_TYPE_TRIANGLES_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "triangles", toStringFlags, tabCount, tabSize, ToString(obj.geometry.triangles, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_GEOMETRY_TYPE_AABBS_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "aabbs", toStringFlags, tabCount, tabSize, ToString(obj.geometry.aabbs, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_GEOMETRY_TYPE_INSTANCES_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "instances", toStringFlags, tabCount, tabSize, ToString(obj.geometry.instances, toStringFlags, tabCount, tabSize));
-                        } break;
-                        default:
-                        {
-                        } break;
-                        }
+                    case VK_GEOMETRY_TYPE_TRIANGLES_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "triangles", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.geometry.triangles, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_GEOMETRY_TYPE_AABBS_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "aabbs", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.geometry.aabbs, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_GEOMETRY_TYPE_INSTANCES_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "instances", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.geometry.instances, toStringFlags, tabCount, tabSize);
+                    } break;
+                    default:
+                    {
+                    } break;
                     }
-                )
+                }
             );
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(obj.flags, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkAccelerationStructureMotionInstanceNV>(const VkAccelerationStructureMotionInstanceNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkAccelerationStructureMotionInstanceNV>(std::string& strBuf, const VkAccelerationStructureMotionInstanceNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "type", toStringFlags, tabCount, tabSize, '"' + ToString(obj.type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(obj.flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "data", toStringFlags, tabCount, tabSize,
-                ObjectToString(toStringFlags, tabCount, tabSize,
-                    [&](std::stringstream& subStrStrm)
+            FieldToString(fieldBuf, true, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.type, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.flags, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "data", toStringFlags, tabCount, tabSize);
+            ObjectToString(fieldBuf, toStringFlags, tabCount, tabSize,
+                [&](std::string& subStrBuf)
+                {
+                    switch (obj.type)
                     {
-                        switch (obj.type)
-                        {
-                        case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_STATIC_NV:
-                        {
-                            FieldToString(subStrStrm, true, "staticInstance", toStringFlags, tabCount, tabSize, ToString(obj.data.staticInstance, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MATRIX_MOTION_NV:
-                        {
-                            FieldToString(subStrStrm, true, "matrixMotionInstance", toStringFlags, tabCount, tabSize, ToString(obj.data.matrixMotionInstance, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_SRT_MOTION_NV:
-                        {
-                            FieldToString(subStrStrm, true, "srtMotionInstance", toStringFlags, tabCount, tabSize, ToString(obj.data.srtMotionInstance, toStringFlags, tabCount, tabSize));
-                        } break;
-                        default:
-                        {
-                        } break;
-                        }
+                    case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_STATIC_NV:
+                    {
+                        FieldToString(subStrBuf, true, "staticInstance", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.staticInstance, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_MATRIX_MOTION_NV:
+                    {
+                        FieldToString(subStrBuf, true, "matrixMotionInstance", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.matrixMotionInstance, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_ACCELERATION_STRUCTURE_MOTION_INSTANCE_TYPE_SRT_MOTION_NV:
+                    {
+                        FieldToString(subStrBuf, true, "srtMotionInstance", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.srtMotionInstance, toStringFlags, tabCount, tabSize);
+                    } break;
+                    default:
+                    {
+                    } break;
                     }
-                )
+                }
             );
         }
     );
 }
 
 template <>
-std::string ToString<VkClearColorValue>(const VkClearColorValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkClearColorValue>(std::string& strBuf, const VkClearColorValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "float32", toStringFlags, tabCount, tabSize, ArrayToString(4, obj.float32, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "int32", toStringFlags, tabCount, tabSize, ArrayToString(4, obj.int32, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "uint32", toStringFlags, tabCount, tabSize, ArrayToString(4, obj.uint32, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "float32", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, 4, obj.float32, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "int32", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, 4, obj.int32, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "uint32", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, 4, obj.uint32, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkClearValue>(const VkClearValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkClearValue>(std::string& strBuf, const VkClearValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "color", toStringFlags, tabCount, tabSize, ToString(obj.color, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "depthStencil", toStringFlags, tabCount, tabSize, ToString(obj.depthStencil, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "color", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.color, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "depthStencil", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.depthStencil, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkDescriptorImageInfo>(const VkDescriptorImageInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkDescriptorImageInfo>(std::string& strBuf, const VkDescriptorImageInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sampler", toStringFlags, tabCount, tabSize, '"' + VkHandleToString(obj.sampler) + '"');
-            FieldToString(strStrm, false, "imageView", toStringFlags, tabCount, tabSize, '"' + VkHandleToString(obj.imageView) + '"');
-            FieldToString(strStrm, false, "imageLayout", toStringFlags, tabCount, tabSize, '"'+ ToString(obj.imageLayout, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(fieldBuf, true, "sampler", toStringFlags, tabCount, tabSize);
+            QuotedVkHandleToString(fieldBuf, obj.sampler);
+            FieldToString(fieldBuf, false, "imageView", toStringFlags, tabCount, tabSize);
+            QuotedVkHandleToString(fieldBuf, obj.imageView);
+            FieldToString(fieldBuf, false, "imageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.imageLayout, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkDeviceOrHostAddressConstKHR>(const VkDeviceOrHostAddressConstKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkDeviceOrHostAddressConstKHR>(std::string& strBuf, const VkDeviceOrHostAddressConstKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "deviceAddress", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.deviceAddress) + '"');
-            FieldToString(strStrm, false, "hostAddress", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.hostAddress) + '"');
+            FieldToString(fieldBuf, true, "deviceAddress", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.deviceAddress);
+            FieldToString(fieldBuf, false, "hostAddress", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.hostAddress);
         }
     );
 }
 
 template <>
-std::string ToString<VkDeviceOrHostAddressKHR>(const VkDeviceOrHostAddressKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkDeviceOrHostAddressKHR>(std::string& strBuf, const VkDeviceOrHostAddressKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "deviceAddress", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.deviceAddress) + '"');
-            FieldToString(strStrm, false, "hostAddress", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.hostAddress) + '"');
+            FieldToString(fieldBuf, true, "deviceAddress", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.deviceAddress);
+            FieldToString(fieldBuf, false, "hostAddress", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.hostAddress);
         }
     );
 }
 
 template <>
-std::string ToString<VkPerformanceCounterResultKHR>(const VkPerformanceCounterResultKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkPerformanceCounterResultKHR>(std::string& strBuf, const VkPerformanceCounterResultKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "int32", toStringFlags, tabCount, tabSize, ToString(obj.int32, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "int64", toStringFlags, tabCount, tabSize, ToString(obj.int64, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "uint32", toStringFlags, tabCount, tabSize, ToString(obj.uint32, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "uint64", toStringFlags, tabCount, tabSize, ToString(obj.uint64, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "float32", toStringFlags, tabCount, tabSize, ToString(obj.float32, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "float64", toStringFlags, tabCount, tabSize, ToString(obj.float64, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "int32", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.int32, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "int64", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.int64, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "uint32", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.uint32, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "uint64", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.uint64, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "float32", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.float32, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "float64", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.float64, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkPerformanceValueINTEL>(const VkPerformanceValueINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkPerformanceValueINTEL>(std::string& strBuf, const VkPerformanceValueINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "type", toStringFlags, tabCount, tabSize, '"' + ToString(obj.type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "data", toStringFlags, tabCount, tabSize,
-                ObjectToString(toStringFlags, tabCount, tabSize,
-                    [&](std::stringstream& subStrStrm)
+            FieldToString(fieldBuf, true, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.type, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "data", toStringFlags, tabCount, tabSize);
+            ObjectToString(fieldBuf, toStringFlags, tabCount, tabSize,
+                [&](std::string& subStrBuf)
+                {
+                    switch (obj.type)
                     {
-                        switch (obj.type)
-                        {
-                        case VK_PERFORMANCE_VALUE_TYPE_UINT32_INTEL:
-                        {
-                            FieldToString(subStrStrm, true, "value32", toStringFlags, tabCount, tabSize, ToString(obj.data.value32, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL:
-                        {
-                            FieldToString(subStrStrm, true, "value64", toStringFlags, tabCount, tabSize, ToString(obj.data.value64, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PERFORMANCE_VALUE_TYPE_FLOAT_INTEL:
-                        {
-                            FieldToString(subStrStrm, true, "valueFloat", toStringFlags, tabCount, tabSize, ToString(obj.data.valueFloat, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PERFORMANCE_VALUE_TYPE_BOOL_INTEL:
-                        {
-                            FieldToString(subStrStrm, true, "valueBool", toStringFlags, tabCount, tabSize, ToString(obj.data.valueBool, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PERFORMANCE_VALUE_TYPE_STRING_INTEL:
-                        {
-                            FieldToString(subStrStrm, true, "valueString", toStringFlags, tabCount, tabSize, (obj.data.valueString ? ('"' + std::string(obj.data.valueString) + '"') : "null"));
-                        } break;
-                        default:
-                        {
-                        } break;
-                        }
+                    case VK_PERFORMANCE_VALUE_TYPE_UINT32_INTEL:
+                    {
+                        FieldToString(subStrBuf, true, "value32", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.value32, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PERFORMANCE_VALUE_TYPE_UINT64_INTEL:
+                    {
+                        FieldToString(subStrBuf, true, "value64", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.value64, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PERFORMANCE_VALUE_TYPE_FLOAT_INTEL:
+                    {
+                        FieldToString(subStrBuf, true, "valueFloat", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.valueFloat, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PERFORMANCE_VALUE_TYPE_BOOL_INTEL:
+                    {
+                        FieldToString(subStrBuf, true, "valueBool", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.data.valueBool, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PERFORMANCE_VALUE_TYPE_STRING_INTEL:
+                    {
+                        FieldToString(subStrBuf, true, "valueString", toStringFlags, tabCount, tabSize);
+                        CStrToString(subStrBuf, obj.data.valueString);
+                    } break;
+                    default:
+                    {
+                    } break;
                     }
-                )
+                }
             );
         }
     );
 }
 
-template <> std::string ToString<VkPipelineExecutableStatisticKHR>(const VkPipelineExecutableStatisticKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+template <> void ToString<VkPipelineExecutableStatisticKHR>(std::string& strBuf, const VkPipelineExecutableStatisticKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "name", toStringFlags, tabCount, tabSize, '"' + std::string(obj.name) + '"');
-            FieldToString(strStrm, false, "description", toStringFlags, tabCount, tabSize, '"' + std::string(obj.description) + '"');
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(obj.format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "value", toStringFlags, tabCount, tabSize,
-                ObjectToString(toStringFlags, tabCount, tabSize,
-                    [&](std::stringstream& subStrStrm)
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "name", toStringFlags, tabCount, tabSize);
+            CStrToString(fieldBuf, obj.name);
+            FieldToString(fieldBuf, false, "description", toStringFlags, tabCount, tabSize);
+            CStrToString(fieldBuf, obj.description);
+            FieldToString(fieldBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.format, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "value", toStringFlags, tabCount, tabSize);
+            ObjectToString(fieldBuf, toStringFlags, tabCount, tabSize,
+                [&](std::string& subStrBuf)
+                {
+                    switch (obj.format)
                     {
-                        switch (obj.format)
-                        {
-                        case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_BOOL32_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "b32", toStringFlags, tabCount, tabSize, ToString(obj.value.b32, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_INT64_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "i64", toStringFlags, tabCount, tabSize, ToString(obj.value.i64, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_UINT64_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "u64", toStringFlags, tabCount, tabSize, ToString(obj.value.u64, toStringFlags, tabCount, tabSize));
-                        } break;
-                        case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_FLOAT64_KHR:
-                        {
-                            FieldToString(subStrStrm, true, "f64", toStringFlags, tabCount, tabSize, ToString(obj.value.f64, toStringFlags, tabCount, tabSize));
-                        } break;
-                        default:
-                        {
-                        } break;
-                        }
+                    case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_BOOL32_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "b32", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.value.b32, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_INT64_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "i64", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.value.i64, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_UINT64_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "u64", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.value.u64, toStringFlags, tabCount, tabSize);
+                    } break;
+                    case VK_PIPELINE_EXECUTABLE_STATISTIC_FORMAT_FLOAT64_KHR:
+                    {
+                        FieldToString(subStrBuf, true, "f64", toStringFlags, tabCount, tabSize);
+                        ToString(subStrBuf, obj.value.f64, toStringFlags, tabCount, tabSize);
+                    } break;
+                    default:
+                    {
+                    } break;
                     }
-                )
+                }
             );
         }
     );
 }
 
 template <>
-std::string ToString<VkWriteDescriptorSet>(const VkWriteDescriptorSet& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkWriteDescriptorSet>(std::string& strBuf, const VkWriteDescriptorSet& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstSet", toStringFlags, tabCount, tabSize, '"' + VkHandleToString(obj.dstSet) + '"');
-            FieldToString(strStrm, false, "dstBinding", toStringFlags, tabCount, tabSize, ToString(obj.dstBinding, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstArrayElement", toStringFlags, tabCount, tabSize, ToString(obj.dstArrayElement, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "descriptorCount", toStringFlags, tabCount, tabSize, ToString(obj.descriptorCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "descriptorType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.descriptorType, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "dstSet", toStringFlags, tabCount, tabSize);
+            QuotedVkHandleToString(fieldBuf, obj.dstSet);
+            FieldToString(fieldBuf, false, "dstBinding", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.dstBinding, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "dstArrayElement", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.dstArrayElement, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "descriptorCount", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.descriptorCount, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "descriptorType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.descriptorType, toStringFlags, tabCount, tabSize);
             const VkDescriptorImageInfo* pImageInfo = nullptr;
             const VkDescriptorBufferInfo* pBufferInfo = nullptr;
             const VkBufferView* pTexelBufferView = nullptr;
@@ -329,111 +380,151 @@ std::string ToString<VkWriteDescriptorSet>(const VkWriteDescriptorSet& obj, ToSt
             } break;
             default: break;
             }
-            FieldToString(strStrm, false, "pImageInfo", toStringFlags, tabCount, tabSize, ArrayToString(obj.descriptorCount, pImageInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBufferInfo", toStringFlags, tabCount, tabSize, ArrayToString(obj.descriptorCount, pBufferInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pTexelBufferView", toStringFlags, tabCount, tabSize, VkHandleArrayToString(obj.descriptorCount, pTexelBufferView, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, false, "pImageInfo", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.descriptorCount, pImageInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pBufferInfo", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.descriptorCount, pBufferInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pTexelBufferView", toStringFlags, tabCount, tabSize);
+            VkHandleArrayToString(fieldBuf, obj.descriptorCount, pTexelBufferView, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkAccelerationStructureBuildGeometryInfoKHR>(const VkAccelerationStructureBuildGeometryInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkAccelerationStructureBuildGeometryInfoKHR>(std::string& strBuf, const VkAccelerationStructureBuildGeometryInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "type", toStringFlags, tabCount, tabSize, '"' + ToString(obj.type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(obj.flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "mode", toStringFlags, tabCount, tabSize, '"' + ToString(obj.mode, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "srcAccelerationStructure", toStringFlags, tabCount, tabSize, '"' + VkHandleToString(obj.srcAccelerationStructure) + '"');
-            FieldToString(strStrm, false, "dstAccelerationStructure", toStringFlags, tabCount, tabSize, '"' + VkHandleToString(obj.dstAccelerationStructure) + '"');
-            FieldToString(strStrm, false, "geometryCount", toStringFlags, tabCount, tabSize, ToString(obj.geometryCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pGeometries", toStringFlags, tabCount, tabSize, ArrayToString(obj.geometryCount, obj.pGeometries, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "ppGeometries", toStringFlags, tabCount, tabSize,
-                ArrayToString(obj.geometryCount, obj.pGeometries, toStringFlags, tabCount, tabSize,
-                    [&]()
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.type, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.flags, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "mode", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.mode, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "srcAccelerationStructure", toStringFlags, tabCount, tabSize);
+            QuotedVkHandleToString(fieldBuf, obj.srcAccelerationStructure);
+            FieldToString(fieldBuf, false, "dstAccelerationStructure", toStringFlags, tabCount, tabSize);
+            QuotedVkHandleToString(fieldBuf, obj.dstAccelerationStructure);
+            FieldToString(fieldBuf, false, "geometryCount", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.geometryCount, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pGeometries", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.geometryCount, obj.pGeometries, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "ppGeometries", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.geometryCount, obj.pGeometries, toStringFlags, tabCount, tabSize,
+                [&]()
+                {
+                    return obj.geometryCount && obj.ppGeometries != nullptr;
+                },
+                [&](std::string& elementBuf, uint32_t i)
+                {
+                    if (obj.ppGeometries[i])
                     {
-                        return obj.geometryCount && obj.ppGeometries != nullptr;
-                    },
-                    [&](uint32_t i)
+                        ToString(elementBuf, *obj.ppGeometries[i], toStringFlags, tabCount, tabSize);
+                    }
+                    else
                     {
-                        return obj.ppGeometries[i] ? ToString(*obj.ppGeometries[i], toStringFlags, tabCount, tabSize) : "null";
+                        elementBuf.append("null");
                     }
-                )
+                }
             );
-            FieldToString(strStrm, false, "scratchData", toStringFlags, tabCount, tabSize, ToString(obj.scratchData, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, false, "scratchData", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.scratchData, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkAccelerationStructureVersionInfoKHR>(const VkAccelerationStructureVersionInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkAccelerationStructureVersionInfoKHR>(std::string& strBuf, const VkAccelerationStructureVersionInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pVersionData", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.pVersionData) + '"');
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pVersionData", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.pVersionData);
         }
     );
 }
 
 template <>
-std::string ToString<VkPhysicalDeviceMemoryProperties>(const VkPhysicalDeviceMemoryProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkPhysicalDeviceMemoryProperties>(std::string& strBuf, const VkPhysicalDeviceMemoryProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "memoryTypeCount", toStringFlags, tabCount, tabSize, ToString(obj.memoryTypeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "memoryTypes", toStringFlags, tabCount, tabSize, ArrayToString(obj.memoryTypeCount, obj.memoryTypes, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "memoryHeapCount", toStringFlags, tabCount, tabSize, ToString(obj.memoryHeapCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "memoryHeaps", toStringFlags, tabCount, tabSize, ArrayToString(obj.memoryHeapCount, obj.memoryHeaps, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "memoryTypeCount", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.memoryTypeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "memoryTypes", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.memoryTypeCount, obj.memoryTypes, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "memoryHeapCount", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.memoryHeapCount, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "memoryHeaps", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, obj.memoryHeapCount, obj.memoryHeaps, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkPipelineMultisampleStateCreateInfo>(const VkPipelineMultisampleStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkPipelineMultisampleStateCreateInfo>(std::string& strBuf, const VkPipelineMultisampleStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(obj.flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "rasterizationSamples", toStringFlags, tabCount, tabSize, '"' + ToString(obj.rasterizationSamples, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "sampleShadingEnable", toStringFlags, tabCount, tabSize, ToString(obj.sampleShadingEnable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "minSampleShading", toStringFlags, tabCount, tabSize, ToString(obj.minSampleShading, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSampleMask", toStringFlags, tabCount, tabSize, ArrayToString(std::min(1, static_cast<int>(obj.rasterizationSamples) / 32), obj.pSampleMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "alphaToCoverageEnable", toStringFlags, tabCount, tabSize, ToString(obj.alphaToCoverageEnable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "alphaToOneEnable", toStringFlags, tabCount, tabSize, ToString(obj.alphaToOneEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.flags, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "rasterizationSamples", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.rasterizationSamples, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "sampleShadingEnable", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.sampleShadingEnable, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "minSampleShading", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.minSampleShading, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pSampleMask", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, std::min(1, static_cast<int>(obj.rasterizationSamples) / 32), obj.pSampleMask, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "alphaToCoverageEnable", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.alphaToCoverageEnable, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "alphaToOneEnable", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.alphaToOneEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
 
 template <>
-std::string ToString<VkShaderModuleCreateInfo>(const VkShaderModuleCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkShaderModuleCreateInfo>(std::string& strBuf, const VkShaderModuleCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
-            FieldToString(strStrm, true, "sType", toStringFlags, tabCount, tabSize, '"' + ToString(obj.sType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pNext", toStringFlags, tabCount, tabSize, PNextToString(obj.pNext, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(obj.flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "codeSize", toStringFlags, tabCount, tabSize, ToString(obj.codeSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCode", toStringFlags, tabCount, tabSize, '"' + PtrToString(obj.pCode) + '"');
+            FieldToString(fieldBuf, true, "sType", toStringFlags, tabCount, tabSize);
+            QuotedToString(fieldBuf, obj.sType, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pNext", toStringFlags, tabCount, tabSize);
+            PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.flags, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "codeSize", toStringFlags, tabCount, tabSize);
+            ToString(fieldBuf, obj.codeSize, toStringFlags, tabCount, tabSize);
+            FieldToString(fieldBuf, false, "pCode", toStringFlags, tabCount, tabSize);
+            QuotedPtrToString(fieldBuf, obj.pCode);
         }
     );
 }
 
 template <>
-std::string ToString<VkTransformMatrixKHR>(const VkTransformMatrixKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+void ToString<VkTransformMatrixKHR>(std::string& strBuf, const VkTransformMatrixKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
 {
-    return ObjectToString(toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+        [&](std::string& fieldBuf)
         {
             std::string strs[3][4];
             size_t maxStrLength = 0;
@@ -445,32 +536,32 @@ std::string ToString<VkTransformMatrixKHR>(const VkTransformMatrixKHR& obj, ToSt
                     maxStrLength = std::max(maxStrLength, strs[y][x].size());
                 }
             }
-            FieldToString(strStrm, true, "matrix", toStringFlags, tabCount, tabSize,
-                ArrayToString(3, obj.matrix, toStringFlags, tabCount, tabSize,
-                    [&]()
-                    {
-                        return true;
-                    },
-                    [&](uint32_t y)
+            FieldToString(fieldBuf, true, "matrix", toStringFlags, tabCount, tabSize);
+            ArrayToString(fieldBuf, 3, obj.matrix, toStringFlags, tabCount, tabSize,
+                [&]()
+                {
+                    return true;
+                },
+                [&](std::string& elementBuf, uint32_t y)
+                {
+                    elementBuf.push_back('[');
+                    AppendWhitespace(elementBuf, toStringFlags);
+                    for (size_t x = 0; x < 4; ++x)
                     {
-                        std::stringstream rowStrStrm;
-                        rowStrStrm << '[' << GetWhitespaceString(toStringFlags);
-                        for (size_t x = 0; x < 4; ++x)
+                        if (x)
+                        {
+                            elementBuf.push_back(',');
+                            AppendWhitespace(elementBuf, toStringFlags);
+                        }
+                        if (strs[y][x].size() < maxStrLength)
                         {
-                            if (x)
-                            {
-                                rowStrStrm << ',' << GetWhitespaceString(toStringFlags);
-                            }
-                            if (strs[y][x].size() < maxStrLength)
-                            {
-                                strs[y][x].insert(0, maxStrLength - strs[y][x].size(), ' ');
-                            }
-                            rowStrStrm << strs[y][x];
+                            strs[y][x].insert(0, maxStrLength - strs[y][x].size(), ' ');
                         }
-                        rowStrStrm << GetWhitespaceString(toStringFlags) << ']';
-                        return rowStrStrm.str();
+                        elementBuf.append(strs[y][x]);
                     }
-                )
+                    AppendWhitespace(elementBuf, toStringFlags);
+                    elementBuf.push_back(']');
+                }
             );
         }
     );
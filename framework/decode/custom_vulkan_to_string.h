@@ -34,158 +34,188 @@
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
-std::string PNextToString(const void* pNext, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+void PNextToString(
+    std::string& strBuf, const void* pNext, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
 
 template <>
-std::string ToString<SECURITY_ATTRIBUTES>(const SECURITY_ATTRIBUTES& obj,
-                                          ToStringFlags              toStringFlags,
-                                          uint32_t                   tabCount,
-                                          uint32_t                   tabSize);
+void ToString<SECURITY_ATTRIBUTES>(std::string&               strBuf,
+                                   const SECURITY_ATTRIBUTES& obj,
+                                   ToStringFlags              toStringFlags,
+                                   uint32_t                   tabCount,
+                                   uint32_t                   tabSize);
 
 template <>
-std::string ToString<VkAccelerationStructureGeometryKHR>(const VkAccelerationStructureGeometryKHR& obj,
-                                                         ToStringFlags                             toStringFlags,
-                                                         uint32_t                                  tabCount,
-                                                         uint32_t                                  tabSize);
+void ToString<VkAccelerationStructureGeometryKHR>(std::string&                              strBuf,
+                                                  const VkAccelerationStructureGeometryKHR& obj,
+                                                  ToStringFlags                             toStringFlags,
+                                                  uint32_t                                  tabCount,
+                                                  uint32_t                                  tabSize);
 
 template <>
-std::string ToString<VkAccelerationStructureMotionInstanceNV>(const VkAccelerationStructureMotionInstanceNV& obj,
-                                                              ToStringFlags toStringFlags,
-                                                              uint32_t      tabCount,
-                                                              uint32_t      tabSize);
+void ToString<VkAccelerationStructureMotionInstanceNV>(std::string&                                   strBuf,
+                                                       const VkAccelerationStructureMotionInstanceNV& obj,
+                                                       ToStringFlags                                  toStringFlags,
+                                                       uint32_t                                       tabCount,
+                                                       uint32_t                                       tabSize);
 
 template <>
-std::string ToString<VkClearColorValue>(const VkClearColorValue& obj,
-                                        ToStringFlags            toStringFlags,
-                                        uint32_t                 tabCount,
-                                        uint32_t                 tabSize);
+void ToString<VkClearColorValue>(std::string&             strBuf,
+                                 const VkClearColorValue& obj,
+                                 ToStringFlags            toStringFlags,
+                                 uint32_t                 tabCount,
+                                 uint32_t                 tabSize);
 
 template <>
-std::string
-ToString<VkClearValue>(const VkClearValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+void ToString<VkClearValue>(
+    std::string& strBuf, const VkClearValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
 
 template <>
-std::string ToString<VkDescriptorImageInfo>(const VkDescriptorImageInfo& obj,
-                                            ToStringFlags                toStringFlags,
-                                            uint32_t                     tabCount,
-                                            uint32_t                     tabSize);
+void ToString<VkDescriptorImageInfo>(std::string&                 strBuf,
+                                     const VkDescriptorImageInfo& obj,
+                                     ToStringFlags                toStringFlags,
+                                     uint32_t                     tabCount,
+                                     uint32_t                     tabSize);
 
 template <>
-std::string ToString<VkDeviceOrHostAddressConstKHR>(const VkDeviceOrHostAddressConstKHR& obj,
-                                                    ToStringFlags                        toStringFlags,
-                                                    uint32_t                             tabCount,
-                                                    uint32_t                             tabSize);
+void ToString<VkDeviceOrHostAddressConstKHR>(std::string&                         strBuf,
+                                             const VkDeviceOrHostAddressConstKHR& obj,
+                                             ToStringFlags                        toStringFlags,
+                                             uint32_t                             tabCount,
+                                             uint32_t                             tabSize);
 
 template <>
-std::string ToString<VkDeviceOrHostAddressKHR>(const VkDeviceOrHostAddressKHR& obj,
-                                               ToStringFlags                   toStringFlags,
-                                               uint32_t                        tabCount,
-                                               uint32_t                        tabSize);
+void ToString<VkDeviceOrHostAddressKHR>(std::string&                    strBuf,
+                                        const VkDeviceOrHostAddressKHR& obj,
+                                        ToStringFlags                   toStringFlags,
+                                        uint32_t                        tabCount,
+                                        uint32_t                        tabSize);
 
 template <>
-std::string ToString<VkLayerProperties>(const VkLayerProperties& obj,
-                                        ToStringFlags            toStringFlags,
-                                        uint32_t                 tabCount,
-                                        uint32_t                 tabSize);
+void ToString<VkLayerProperties>(std::string&             strBuf,
+                                 const VkLayerProperties& obj,
+                                 ToStringFlags            toStringFlags,
+                                 uint32_t                 tabCount,
+                                 uint32_t                 tabSize);
 
 template <>
-std::string ToString<VkPerformanceCounterResultKHR>(const VkPerformanceCounterResultKHR& obj,
-                                                    ToStringFlags                        toStringFlags,
-                                                    uint32_t                             tabCount,
-                                                    uint32_t                             tabSize);
+void ToString<VkPerformanceCounterResultKHR>(std::string&                         strBuf,
+                                             const VkPerformanceCounterResultKHR& obj,
+                                             ToStringFlags                        toStringFlags,
+                                             uint32_t                             tabCount,
+                                             uint32_t                             tabSize);
 
 template <>
-std::string ToString<VkPerformanceValueINTEL>(const VkPerformanceValueINTEL& obj,
-                                              ToStringFlags                  toStringFlags,
-                                              uint32_t                       tabCount,
-                                              uint32_t                       tabSize);
+void ToString<VkPerformanceValueINTEL>(std::string&                   strBuf,
+                                       const VkPerformanceValueINTEL& obj,
+                                       ToStringFlags                  toStringFlags,
+                                       uint32_t                       tabCount,
+                                       uint32_t                       tabSize);
 
 template <>
-std::string ToString<VkWriteDescriptorSet>(const VkWriteDescriptorSet& obj,
-                                           ToStringFlags               toStringFlags,
-                                           uint32_t                    tabCount,
-                                           uint32_t                    tabSize);
+void ToString<VkWriteDescriptorSet>(std::string&                strBuf,
+                                    const VkWriteDescriptorSet& obj,
+                                    ToStringFlags               toStringFlags,
+                                    uint32_t                    tabCount,
+                                    uint32_t                    tabSize);
 
 template <typename VkHandleType>
-inline std::string VkHandleToString(VkHandleType vkHandle)
+inline void VkHandleToString(std::string& strBuf, VkHandleType vkHandle)
 {
-    return vkHandle ? PtrToString(vkHandle) : "VK_NULL_HANDLE";
+    if (vkHandle)
+    {
+        PtrToString(strBuf, vkHandle);
+    }
+    else
+    {
+        strBuf.append("VK_NULL_HANDLE");
+    }
+}
+
+template <typename VkHandleType>
+inline void QuotedVkHandleToString(std::string& strBuf, VkHandleType vkHandle)
+{
+    strBuf.push_back('"');
+    VkHandleToString(strBuf, vkHandle);
+    strBuf.push_back('"');
 }
 
 template <typename VkHandleType>
-inline std::string VkHandleArrayToString(uint32_t            count,
-                                         const VkHandleType* pVkHandles,
-                                         ToStringFlags       toStringFlags = kToString_Default,
-                                         uint32_t            tabCount      = 0,
-                                         uint32_t            tabSize       = 4)
+inline void VkHandleArrayToString(std::string&        strBuf,
+                                  uint32_t            count,
+                                  const VkHandleType* pVkHandles,
+                                  ToStringFlags       toStringFlags = kToString_Default,
+                                  uint32_t            tabCount      = 0,
+                                  uint32_t            tabSize       = 4)
 {
-    return ArrayToString(
+    ArrayToString(
+        strBuf,
         count,
         pVkHandles,
         toStringFlags,
         tabCount,
         tabSize,
         [&]() { return pVkHandles != nullptr; },
-        [&](uint32_t i) { return VkHandleToString(pVkHandles[i]); });
+        [&](std::string& elementBuf, uint32_t i) { VkHandleToString(elementBuf, pVkHandles[i]); });
 }
 
 template <typename VkEnumType>
-inline std::string VkEnumArrayToString(uint32_t          count,
-                                       const VkEnumType* pVkEnums,
-                                       ToStringFlags     toStringFlags = kToString_Default,
-                                       uint32_t          tabCount      = 0,
-                                       uint32_t          tabSize       = 4)
+inline void VkEnumArrayToString(std::string&      strBuf,
+                                uint32_t          count,
+                                const VkEnumType* pVkEnums,
+                                ToStringFlags     toStringFlags = kToString_Default,
+                                uint32_t          tabCount      = 0,
+                                uint32_t          tabSize       = 4)
 {
-    return ArrayToString(
+    ArrayToString(
+        strBuf,
         count,
         pVkEnums,
         toStringFlags,
         tabCount,
         tabSize,
         [&]() { return pVkEnums != nullptr; },
-        [&](uint32_t i) { return "\"" + ToString(pVkEnums[i]) + "\""; });
+        [&](std::string& elementBuf, uint32_t i) { QuotedToString(elementBuf, pVkEnums[i]); });
 }
 
 template <typename VkBitmaskType>
-inline std::string BitmaskToString(VkFlags vkFlags)
+inline void BitmaskToString(std::string& strBuf, VkFlags vkFlags)
 {
-    std::string str;
-    VkFlags     index = 0;
+    const size_t start = strBuf.size();
+    VkFlags      index = 0;
     while (vkFlags)
     {
         if (vkFlags & 1)
         {
-            if (!str.empty())
+            if (strBuf.size() != start)
             {
-                str.append("|");
+                strBuf.push_back('|');
             }
-            str.append(ToString(static_cast<VkBitmaskType>(1 << index)));
+            ToString(strBuf, static_cast<VkBitmaskType>(1 << index));
         }
         ++index;
         vkFlags >>= 1;
     }
-    if (str.empty())
+    if (strBuf.size() == start)
     {
-        str.append(ToString(static_cast<VkBitmaskType>(0)));
+        ToString(strBuf, static_cast<VkBitmaskType>(0));
     }
-    return str;
 }
 
-inline std::string UIDToString(uint32_t uidSize, const uint8_t* pUid)
+inline void QuotedUIDToString(std::string& strBuf, uint32_t uidSize, const uint8_t* pUid)
 {
-    std::stringstream strStrm;
+    strBuf.push_back('"');
     if (uidSize && pUid)
     {
         for (uint32_t i = 0; i < uidSize; ++i)
         {
             if (i)
             {
-                strStrm << '-';
+                strBuf.push_back('-');
             }
-            strStrm << std::to_string(pUid[i]);
+            strBuf.append(std::to_string(pUid[i]));
         }
     }
-    return strStrm.str();
+    strBuf.push_back('"');
 }
 
 GFXRECON_END_NAMESPACE(util)
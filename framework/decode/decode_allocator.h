@@ -30,6 +30,8 @@
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+// Each thread has its own allocator instance, so that API calls can be decoded on multiple threads.  The Begin, End,
+// FreeSystemMemory, and DestroyInstance functions only affect the allocator instance of the calling thread.
 class DecodeAllocator
 {
   public:
@@ -58,8 +60,8 @@ class DecodeAllocator
     DecodeAllocator() : allocator_(kAllocatorBlockSize), can_allocate_(false) {}
 
   private:
-    static const size_t     kAllocatorBlockSize{ 64 * 1024 };
-    static DecodeAllocator* instance_;
+    static const size_t                  kAllocatorBlockSize{ 64 * 1024 };
+    static thread_local DecodeAllocator* instance_;
 
     util::MonotonicAllocator allocator_;
     bool                     can_allocate_;
@@ -23,6 +23,7 @@
 
 #include "decode/file_processor.h"
 
+#include "decode/api_call_filter.h"
 #include "decode/decode_allocator.h"
 #include "format/format_util.h"
 #include "util/compressor.h"
@@ -30,6 +31,7 @@
 #include "util/platform.h"
 
 #include <cassert>
+#include <cinttypes>
 #include <numeric>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
@@ -37,7 +39,8 @@ GFXRECON_BEGIN_NAMESPACE(decode)
 
 FileProcessor::FileProcessor() :
     file_header_{}, file_descriptor_(nullptr), current_frame_number_(0), bytes_read_(0),
-    error_state_(kErrorInvalidFileDescriptor), annotation_handler_(nullptr), compressor_(nullptr)
+    error_state_(kErrorInvalidFileDescriptor), annotation_handler_(nullptr), api_call_filter_(nullptr),
+    block_index_(nullptr), first_block_offset_(0), compressor_(nullptr)
 {}
 
 FileProcessor::~FileProcessor()
@@ -122,6 +125,230 @@ bool FileProcessor::ProcessAllFrames()
     return (error_state_ == kErrorNone);
 }
 
+bool FileProcessor::BuildBlockIndex(BlockIndex* block_index)
+{
+    assert(block_index != nullptr);
+
+    block_index->Clear();
+
+    if (file_descriptor_ == nullptr)
+    {
+        return false;
+    }
+
+    int64_t  current_offset = util::platform::FileTell(file_descriptor_);
+    uint64_t file_size      = 0;
+
+    bool success = (current_offset >= 0) && GetFileSize(&file_size) &&
+                   util::platform::FileSeek(file_descriptor_, first_block_offset_, util::platform::FileSeekSet);
+
+    if (success)
+    {
+        uint64_t                      offset       = first_block_offset_;
+        uint32_t                      frame_number = 0;
+        format::BlockIndexCaptureInfo capture_info = {};
+
+        capture_info.file_size   = file_size;
+        capture_info.file_header = file_header_;
+
+        while (success && ((offset + sizeof(format::BlockHeader)) <= file_size))
+        {
+            format::BlockHeader block_header;
+            uint32_t            id = 0;
+
+            success = (util::platform::FileRead(&block_header, sizeof(block_header), 1, file_descriptor_) == 1);
+
+            if (success && ((offset + sizeof(block_header) + block_header.size) > file_size))
+            {
+                GFXRECON_LOG_WARNING("Incomplete block at end of file");
+                break;
+            }
+
+            // The API call ID, meta-data type, marker type, or annotation type that follows the block header.
+            if (success && (block_header.size >= sizeof(id)))
+            {
+                success = (util::platform::FileRead(&id, sizeof(id), 1, file_descriptor_) == 1) &&
+                          util::platform::FileSeek(
+                              file_descriptor_, block_header.size - sizeof(id), util::platform::FileSeekCurrent);
+            }
+            else if (success)
+            {
+                success =
+                    util::platform::FileSeek(file_descriptor_, block_header.size, util::platform::FileSeekCurrent);
+            }
+
+            if (success)
+            {
+                block_index->AddBlock(offset, block_header.type, id, frame_number);
+                capture_info.last_block_header = block_header;
+
+                offset += sizeof(block_header) + block_header.size;
+
+                if ((format::RemoveCompressedBlockBit(block_header.type) == format::BlockType::kFunctionCallBlock) &&
+                    IsFrameDelimiter(static_cast<format::ApiCallId>(id)))
+                {
+                    ++frame_number;
+                }
+            }
+        }
+
+        block_index->SetCaptureInfo(capture_info);
+
+        if (!success)
+        {
+            GFXRECON_LOG_ERROR("Failed to read block header while building block index for file %s", filename_.c_str());
+        }
+    }
+
+    // Restore the file position for block processing.
+    if ((current_offset < 0) ||
+        !util::platform::FileSeek(file_descriptor_, current_offset, util::platform::FileSeekSet))
+    {
+        GFXRECON_LOG_ERROR("Failed to restore file position after building block index");
+        error_state_ = kErrorReadingFile;
+        success      = false;
+    }
+
+    return success;
+}
+
+bool FileProcessor::ReadBlockIndex(BlockIndex* block_index)
+{
+    assert(block_index != nullptr);
+
+    std::string index_filename = BlockIndex::GetIndexFilename(filename_);
+
+    if (!block_index->ReadFile(index_filename))
+    {
+        return false;
+    }
+
+    if (!IsBlockIndexCurrent(*block_index))
+    {
+        GFXRECON_LOG_WARNING("Ignoring block index file %s, which does not match the capture file",
+                             index_filename.c_str());
+        block_index->Clear();
+        return false;
+    }
+
+    return true;
+}
+
+bool FileProcessor::IsBlockIndexCurrent(const BlockIndex& block_index)
+{
+    const format::BlockIndexCaptureInfo& capture_info = block_index.GetCaptureInfo();
+    uint64_t                             file_size    = 0;
+
+    if ((file_descriptor_ == nullptr) || !GetFileSize(&file_size) || (file_size != capture_info.file_size) ||
+        (file_header_.fourcc != capture_info.file_header.fourcc) ||
+        (file_header_.major_version != capture_info.file_header.major_version) ||
+        (file_header_.minor_version != capture_info.file_header.minor_version) ||
+        (file_header_.num_options != capture_info.file_header.num_options))
+    {
+        return false;
+    }
+
+    if (block_index.GetBlockCount() == 0)
+    {
+        return true;
+    }
+
+    // Compare the header and ID of the last block in the capture file with the last entry of the index.
+    const format::BlockIndexEntry& last_block     = block_index.GetBlock(block_index.GetBlockCount() - 1);
+    int64_t                        current_offset = util::platform::FileTell(file_descriptor_);
+    format::BlockHeader            block_header   = {};
+    uint32_t                       id             = 0;
+
+    bool success = (current_offset >= 0) &&
+                   util::platform::FileSeek(
+                       file_descriptor_, static_cast<int64_t>(last_block.offset), util::platform::FileSeekSet) &&
+                   (util::platform::FileRead(&block_header, sizeof(block_header), 1, file_descriptor_) == 1);
+
+    if (success && (block_header.size >= sizeof(id)))
+    {
+        success = (util::platform::FileRead(&id, sizeof(id), 1, file_descriptor_) == 1);
+    }
+
+    if ((current_offset < 0) ||
+        !util::platform::FileSeek(file_descriptor_, current_offset, util::platform::FileSeekSet))
+    {
+        GFXRECON_LOG_ERROR("Failed to restore file position after reading block index");
+        error_state_ = kErrorReadingFile;
+        return false;
+    }
+
+    return success && (block_header.size == capture_info.last_block_header.size) &&
+           (block_header.type == capture_info.last_block_header.type) && (block_header.type == last_block.type) &&
+           (id == last_block.id);
+}
+
+bool FileProcessor::SeekToFrame(uint32_t frame_number)
+{
+    uint64_t block_number = 0;
+
+    if ((block_index_ == nullptr) || !block_index_->GetFrameFirstBlock(frame_number, &block_number))
+    {
+        GFXRECON_LOG_ERROR("Failed to seek to frame %u, which is not in the block index", frame_number);
+        return false;
+    }
+
+    return SeekToBlock(block_number);
+}
+
+bool FileProcessor::SeekToBlock(uint64_t block_number)
+{
+    if ((block_index_ == nullptr) || (block_number >= block_index_->GetBlockCount()))
+    {
+        GFXRECON_LOG_ERROR("Failed to seek to block %" PRIu64 ", which is not in the block index", block_number);
+        return false;
+    }
+
+    const format::BlockIndexEntry& block = block_index_->GetBlock(block_number);
+
+    bool success = (file_descriptor_ != nullptr) &&
+                   util::platform::FileSeek(file_descriptor_, block.offset, util::platform::FileSeekSet);
+
+    if (success)
+    {
+        bytes_read_           = block.offset;
+        current_frame_number_ = block.frame_number;
+    }
+    else
+    {
+        GFXRECON_LOG_ERROR("Failed to seek to block %" PRIu64, block_number);
+    }
+
+    return success;
+}
+
+bool FileProcessor::GetFileSize(uint64_t* file_size)
+{
+    assert(file_size != nullptr);
+
+    if (file_descriptor_ == nullptr)
+    {
+        return false;
+    }
+
+    int64_t current_offset = util::platform::FileTell(file_descriptor_);
+    int64_t end_offset     = -1;
+
+    if ((current_offset >= 0) && util::platform::FileSeek(file_descriptor_, 0, util::platform::FileSeekEnd))
+    {
+        end_offset = util::platform::FileTell(file_descriptor_);
+    }
+
+    if ((current_offset < 0) ||
+        !util::platform::FileSeek(file_descriptor_, current_offset, util::platform::FileSeekSet) || (end_offset < 0))
+    {
+        return false;
+    }
+
+    *file_size = static_cast<uint64_t>(end_offset);
+
+    return true;
+}
+
 bool FileProcessor::ProcessFileHeader()
 {
     bool success = false;
@@ -140,6 +367,8 @@ bool FileProcessor::ProcessFileHeader()
 
             if (success)
             {
+                first_block_offset_ = bytes_read_;
+
                 for (const auto& option : file_options_)
                 {
                     switch (option.key)
@@ -394,7 +623,20 @@ bool FileProcessor::ProcessFunctionCall(const format::BlockHeader& block_header,
     {
         parameter_buffer_size -= sizeof(call_info.thread_id);
 
-        if (format::IsBlockCompressed(block_header.type))
+        bool include_call = (api_call_filter_ == nullptr) ||
+                            api_call_filter_->IsApiCallIncluded(call_id, call_info.thread_id, current_frame_number_);
+
+        if (!include_call)
+        {
+            // Excluded API calls are skipped without reading or decompressing their parameter data.
+            success = SkipBytes(parameter_buffer_size);
+
+            if (!success)
+            {
+                HandleBlockReadError(kErrorReadingBlockData, "Failed to skip function call block data");
+            }
+        }
+        else if (format::IsBlockCompressed(block_header.type))
         {
             parameter_buffer_size -= sizeof(uncompressed_size);
             success = ReadBytes(&uncompressed_size, sizeof(uncompressed_size));
@@ -434,7 +676,13 @@ bool FileProcessor::ProcessFunctionCall(const format::BlockHeader& block_header,
             }
         }
 
-        if (success)
+        if (success && include_call && (api_call_filter_ != nullptr))
+        {
+            include_call = api_call_filter_->IsParameterDataIncluded(
+                call_id, call_info, parameter_buffer_.data(), parameter_buffer_size);
+        }
+
+        if (success && include_call)
         {
             for (auto decoder : decoders_)
             {
@@ -28,6 +28,7 @@
 #include "format/format.h"
 #include "decode/annotation_handler.h"
 #include "decode/api_decoder.h"
+#include "decode/block_index.h"
 #include "util/compressor.h"
 #include "util/defines.h"
 
@@ -39,6 +40,8 @@
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+class ApiCallFilter;
+
 class FileProcessor
 {
   public:
@@ -64,6 +67,9 @@ class FileProcessor
 
     void SetAnnotationProcessor(AnnotationHandler* handler) { annotation_handler_ = handler; }
 
+    // API calls that are excluded by the filter are not sent to the decoders.
+    void SetApiCallFilter(ApiCallFilter* filter) { api_call_filter_ = filter; }
+
     void AddDecoder(ApiDecoder* decoder) { decoders_.push_back(decoder); }
 
     void RemoveDecoder(ApiDecoder* decoder)
@@ -88,9 +94,33 @@ class FileProcessor
 
     uint64_t GetNumBytesRead() const { return bytes_read_; }
 
+    // Scans the block headers of the file to build an index of its blocks, without processing the blocks.  The file
+    // position is not changed.
+    bool BuildBlockIndex(BlockIndex* block_index);
+
+    // Reads the block index file that was written for the file.  Returns false if the index file does not exist or does
+    // not match the file.
+    bool ReadBlockIndex(BlockIndex* block_index);
+
+    // Sets the block index that is used to seek to frames and blocks.  The index must remain valid while it is set.
+    void SetBlockIndex(const BlockIndex* block_index) { block_index_ = block_index; }
+
+    // Sets the file position to the first block of the frame, so that the next call to ProcessNextFrame() processes it.
+    // The blocks that are skipped are not processed, so decoders do not receive the API calls that created the objects
+    // used by the frame.  Returns false if no block index has been set or the frame is not in the index.
+    bool SeekToFrame(uint32_t frame_number);
+
+    // Sets the file position to the block with the specified number, using the frame numbering from the block index.
+    bool SeekToBlock(uint64_t block_number);
+
     Error GetErrorState() const { return error_state_; }
 
   private:
+    bool GetFileSize(uint64_t* file_size);
+
+    // Compares the capture info and last block of the index with the capture file.
+    bool IsBlockIndexCurrent(const BlockIndex& block_index);
+
     bool ProcessFileHeader();
 
     bool ProcessBlocks();
@@ -133,6 +163,9 @@ class FileProcessor
     uint64_t                            bytes_read_;
     Error                               error_state_;
     AnnotationHandler*                  annotation_handler_;
+    ApiCallFilter*                      api_call_filter_;
+    const BlockIndex*                   block_index_;
+    uint64_t                            first_block_offset_;
     std::vector<ApiDecoder*>            decoders_;
     std::vector<uint8_t>                parameter_buffer_;
     std::vector<uint8_t>                compressed_parameter_buffer_;
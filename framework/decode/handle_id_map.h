@@ -0,0 +1,255 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_HANDLE_ID_MAP_H
+#define GFXRECON_DECODE_HANDLE_ID_MAP_H
+
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <cassert>
+#include <cstdint>
+#include <limits>
+#include <memory>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Map from capture handle IDs to values, for the object info tables.  Handle IDs are assigned from a counter that is
+// shared by all handle types, so the IDs for a single handle type are small but not contiguous.  The map stores its
+// values in dense pages of slots, and maps handle IDs to slots with pages of slot indices that are allocated when the
+// first ID from their range is added, so that a lookup is two shift and index operations.  IDs that are too large for
+// the page directory are mapped to slots with a hash map.
+//
+// Value pointers remain valid until the value is erased.  Erased slots are reused by later insertions.
+template <typename T>
+class HandleIdMap
+{
+  public:
+    // Inserts the value if the map does not contain the ID.  Returns a pointer to the value for the ID, and true if the
+    // value was inserted.  The value is only moved from when it is inserted.
+    std::pair<T*, bool> Emplace(format::HandleId id, T&& value)
+    {
+        assert(id != format::kNullHandleId);
+
+        uint32_t* slot_index = GetOrCreateSlotIndex(id);
+        if (*slot_index != kNoSlot)
+        {
+            return std::make_pair(&GetSlot(*slot_index - 1).value, false);
+        }
+
+        uint32_t index = 0;
+        if (!free_slots_.empty())
+        {
+            index = free_slots_.back();
+            free_slots_.pop_back();
+        }
+        else
+        {
+            assert(slot_count_ < std::numeric_limits<uint32_t>::max());
+            index = slot_count_++;
+
+            if ((index >> kPageShift) >= slot_pages_.size())
+            {
+                slot_pages_.emplace_back(new Slot[kPageSize]);
+            }
+        }
+
+        Slot& slot  = GetSlot(index);
+        slot.id     = id;
+        slot.value  = std::move(value);
+        *slot_index = index + 1;
+        ++size_;
+
+        return std::make_pair(&slot.value, true);
+    }
+
+    T* Find(format::HandleId id)
+    {
+        const uint32_t* slot_index = FindSlotIndex(id);
+        return ((slot_index != nullptr) && (*slot_index != kNoSlot)) ? &GetSlot(*slot_index - 1).value : nullptr;
+    }
+
+    const T* Find(format::HandleId id) const
+    {
+        const uint32_t* slot_index = FindSlotIndex(id);
+        return ((slot_index != nullptr) && (*slot_index != kNoSlot)) ? &GetSlot(*slot_index - 1).value : nullptr;
+    }
+
+    // Returns true if the ID was in the map.
+    bool Erase(format::HandleId id)
+    {
+        uint32_t slot_index = kNoSlot;
+
+        if (id < kMaxPagedId)
+        {
+            size_t page_index = static_cast<size_t>(id >> kPageShift);
+            if ((page_index < pages_.size()) && (pages_[page_index] != nullptr))
+            {
+                std::swap(slot_index, pages_[page_index][id & (kPageSize - 1)]);
+            }
+        }
+        else
+        {
+            auto entry = fallback_slot_indices_.find(id);
+            if (entry != fallback_slot_indices_.end())
+            {
+                slot_index = entry->second;
+                fallback_slot_indices_.erase(entry);
+            }
+        }
+
+        if (slot_index == kNoSlot)
+        {
+            return false;
+        }
+
+        // Release the resources held by the erased value.
+        Slot& slot = GetSlot(slot_index - 1);
+        slot.id    = format::kNullHandleId;
+        slot.value = T{};
+        free_slots_.push_back(slot_index - 1);
+        --size_;
+
+        return true;
+    }
+
+    void Clear()
+    {
+        pages_.clear();
+        fallback_slot_indices_.clear();
+        slot_pages_.clear();
+        free_slots_.clear();
+        slot_count_ = 0;
+        size_       = 0;
+    }
+
+    size_t GetSize() const { return size_; }
+
+    bool IsEmpty() const { return (size_ == 0); }
+
+    // Calls visitor with a pointer to each value in the map.  The visitor must not insert or erase values.
+    template <typename Visitor>
+    void Visit(Visitor visitor)
+    {
+        for (uint32_t i = 0; i < slot_count_; ++i)
+        {
+            Slot& slot = GetSlot(i);
+            if (slot.id != format::kNullHandleId)
+            {
+                visitor(&slot.value);
+            }
+        }
+    }
+
+    template <typename Visitor>
+    void Visit(Visitor visitor) const
+    {
+        for (uint32_t i = 0; i < slot_count_; ++i)
+        {
+            const Slot& slot = GetSlot(i);
+            if (slot.id != format::kNullHandleId)
+            {
+                visitor(&slot.value);
+            }
+        }
+    }
+
+  private:
+    struct Slot
+    {
+        format::HandleId id{ format::kNullHandleId }; // kNullHandleId for a slot that is not in use.
+        T                value{};
+    };
+
+    // Slot indices are stored with an offset of one, so that a new page filled with zeros maps no IDs.
+    static const uint32_t kNoSlot = 0;
+
+    static const uint32_t         kPageShift  = 8;
+    static const uint32_t         kPageSize   = 1u << kPageShift;
+    static const format::HandleId kMaxPagedId = format::HandleId(1) << 24;
+
+  private:
+    Slot& GetSlot(uint32_t index) { return slot_pages_[index >> kPageShift][index & (kPageSize - 1)]; }
+
+    const Slot& GetSlot(uint32_t index) const { return slot_pages_[index >> kPageShift][index & (kPageSize - 1)]; }
+
+    const uint32_t* FindSlotIndex(format::HandleId id) const
+    {
+        if (id < kMaxPagedId)
+        {
+            size_t page_index = static_cast<size_t>(id >> kPageShift);
+            if ((page_index < pages_.size()) && (pages_[page_index] != nullptr))
+            {
+                return &pages_[page_index][id & (kPageSize - 1)];
+            }
+        }
+        else
+        {
+            auto entry = fallback_slot_indices_.find(id);
+            if (entry != fallback_slot_indices_.end())
+            {
+                return &entry->second;
+            }
+        }
+
+        return nullptr;
+    }
+
+    uint32_t* GetOrCreateSlotIndex(format::HandleId id)
+    {
+        if (id < kMaxPagedId)
+        {
+            size_t page_index = static_cast<size_t>(id >> kPageShift);
+            if (page_index >= pages_.size())
+            {
+                pages_.resize(page_index + 1);
+            }
+
+            auto& page = pages_[page_index];
+            if (page == nullptr)
+            {
+                page.reset(new uint32_t[kPageSize]());
+            }
+
+            return &page[id & (kPageSize - 1)];
+        }
+
+        return &fallback_slot_indices_[id];
+    }
+
+  private:
+    std::vector<std::unique_ptr<uint32_t[]>>       pages_;
+    std::unordered_map<format::HandleId, uint32_t> fallback_slot_indices_;
+    std::vector<std::unique_ptr<Slot[]>>           slot_pages_;
+    std::vector<uint32_t>                          free_slots_;
+    uint32_t                                       slot_count_{ 0 };
+    size_t                                         size_{ 0 };
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_HANDLE_ID_MAP_H
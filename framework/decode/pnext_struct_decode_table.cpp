@@ -0,0 +1,109 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "decode/pnext_struct_decode_table.h"
+
+#include <algorithm>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+PNextStructDecodeTable::PNextStructDecodeTable(const PNextStructDecodeInfo* infos, size_t count) :
+    entries_(infos, infos + count), counts_(new std::atomic<uint64_t>[count]), unrecognized_count_(0),
+    statistics_enabled_(false)
+{
+    std::sort(entries_.begin(), entries_.end(), [](const PNextStructDecodeInfo& lhs, const PNextStructDecodeInfo& rhs) {
+        return lhs.sType < rhs.sType;
+    });
+
+    ResetStatistics();
+}
+
+const PNextStructDecodeInfo* PNextStructDecodeTable::Find(VkStructureType sType)
+{
+    // Direct mapped cache of the indices of the most recently found entries. The cache is shared by all tables, so
+    // a cached index is only used when it refers to an entry with the requested struct type.
+    static thread_local size_t cache[kCacheSize] = {};
+
+    const PNextStructDecodeInfo* entry  = nullptr;
+    size_t&                      cached = cache[static_cast<uint32_t>(sType) % kCacheSize];
+
+    if ((cached < entries_.size()) && (entries_[cached].sType == sType))
+    {
+        entry = &entries_[cached];
+    }
+    else
+    {
+        auto iter = std::lower_bound(
+            entries_.begin(), entries_.end(), sType, [](const PNextStructDecodeInfo& info, VkStructureType value) {
+                return info.sType < value;
+            });
+
+        if ((iter != entries_.end()) && (iter->sType == sType))
+        {
+            entry  = &(*iter);
+            cached = static_cast<size_t>(iter - entries_.begin());
+        }
+    }
+
+    if (statistics_enabled_.load(std::memory_order_relaxed))
+    {
+        if (entry != nullptr)
+        {
+            counts_[entry - entries_.data()].fetch_add(1, std::memory_order_relaxed);
+        }
+        else
+        {
+            unrecognized_count_.fetch_add(1, std::memory_order_relaxed);
+        }
+    }
+
+    return entry;
+}
+
+void PNextStructDecodeTable::ResetStatistics()
+{
+    for (size_t i = 0; i < entries_.size(); ++i)
+    {
+        counts_[i].store(0, std::memory_order_relaxed);
+    }
+    unrecognized_count_.store(0, std::memory_order_relaxed);
+}
+
+std::vector<std::pair<VkStructureType, uint64_t>> PNextStructDecodeTable::GetStatistics() const
+{
+    std::vector<std::pair<VkStructureType, uint64_t>> statistics;
+
+    for (size_t i = 0; i < entries_.size(); ++i)
+    {
+        uint64_t count = counts_[i].load(std::memory_order_relaxed);
+        if (count > 0)
+        {
+            statistics.emplace_back(entries_[i].sType, count);
+        }
+    }
+
+    return statistics;
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
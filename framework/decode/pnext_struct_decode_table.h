@@ -0,0 +1,91 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_PNEXT_STRUCT_DECODE_TABLE_H
+#define GFXRECON_DECODE_PNEXT_STRUCT_DECODE_TABLE_H
+
+#include "decode/pnext_node.h"
+#include "util/defines.h"
+
+#include "vulkan/vulkan.h"
+
+#include <atomic>
+#include <cstdint>
+#include <memory>
+#include <utility>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Maps the VkStructureType of a struct that can be included in a pNext chain to a function that allocates the
+// PNextNode for the struct's decoder.
+struct PNextStructDecodeInfo
+{
+    VkStructureType sType;
+    PNextNode* (*allocate)();
+};
+
+// Lookup table for the pNext struct decoders. Entries are sorted by VkStructureType for binary search, and recently
+// found entries are cached per thread so that the small number of struct types dominating a capture file are found
+// without searching. The table can optionally count the number of times each struct type is found.
+class PNextStructDecodeTable
+{
+  public:
+    template <size_t N>
+    explicit PNextStructDecodeTable(const PNextStructDecodeInfo (&infos)[N]) : PNextStructDecodeTable(infos, N)
+    {}
+
+    PNextStructDecodeTable(const PNextStructDecodeInfo* infos, size_t count);
+
+    // Returns the entry for the struct type, or nullptr if the struct type is not in the table.
+    const PNextStructDecodeInfo* Find(VkStructureType sType);
+
+    void EnableStatistics(bool enable) { statistics_enabled_.store(enable, std::memory_order_relaxed); }
+
+    void ResetStatistics();
+
+    // Returns the number of times that each struct type was found while statistics were enabled, sorted by struct
+    // type. Struct types that were not found are omitted.
+    std::vector<std::pair<VkStructureType, uint64_t>> GetStatistics() const;
+
+    // Returns the number of lookups for struct types that are not in the table while statistics were enabled.
+    uint64_t GetUnrecognizedCount() const { return unrecognized_count_.load(std::memory_order_relaxed); }
+
+  private:
+    static const size_t kCacheSize = 16;
+
+    std::vector<PNextStructDecodeInfo>       entries_;
+    std::unique_ptr<std::atomic<uint64_t>[]> counts_;
+    std::atomic<uint64_t>                    unrecognized_count_;
+    std::atomic<bool>                        statistics_enabled_;
+};
+
+// Returns the table used by DecodePNextStruct to decode all of the Vulkan structs that can be included in a pNext
+// chain. Statistics are disabled by default; tools that report them should reset the statistics for each file that
+// they process.
+PNextStructDecodeTable& GetPNextStructDecodeTable();
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_PNEXT_STRUCT_DECODE_TABLE_H
@@ -34,6 +34,7 @@
 
 #include <cassert>
 #include <memory>
+#include <type_traits>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
@@ -135,15 +136,8 @@ class StructPointerDecoder : public PointerDecoderBase
 
             if (HasData())
             {
-                for (size_t i = 0; i < len; ++i)
-                {
-                    decoded_structs_[i].decoded_value = &struct_memory_[i];
-
-                    // Note: We only expect this class to be used with structs that have a decode_struct function.
-                    //       If an error is encoutered here due to a new struct type, the struct decoders need to be
-                    //       updated to support the new type.
-                    bytes_read += DecodeStruct((buffer + bytes_read), (buffer_size - bytes_read), &decoded_structs_[i]);
-                }
+                bytes_read +=
+                    DecodeStructs((buffer + bytes_read), (buffer_size - bytes_read), len, IsTriviallyDecodable<T>());
             }
         }
 
@@ -151,6 +145,44 @@ class StructPointerDecoder : public PointerDecoderBase
     }
 
   private:
+    size_t DecodeStructs(const uint8_t* buffer, size_t buffer_size, size_t len, std::false_type)
+    {
+        size_t bytes_read = 0;
+
+        for (size_t i = 0; i < len; ++i)
+        {
+            decoded_structs_[i].decoded_value = &struct_memory_[i];
+
+            // Note: We only expect this class to be used with structs that have a decode_struct function.
+            //       If an error is encoutered here due to a new struct type, the struct decoders need to be
+            //       updated to support the new type.
+            bytes_read += DecodeStruct((buffer + bytes_read), (buffer_size - bytes_read), &decoded_structs_[i]);
+        }
+
+        return bytes_read;
+    }
+
+    // Overload for structs that are encoded with the same layout as the struct, where the array can be decoded with a
+    // single copy.
+    size_t DecodeStructs(const uint8_t* buffer, size_t buffer_size, size_t len, std::true_type)
+    {
+        size_t bytes_read =
+            ValueDecoder::DecodeUInt8Array(buffer, buffer_size, struct_memory_, len * sizeof(typename T::struct_type));
+
+        if (bytes_read == 0)
+        {
+            // The buffer is too small to contain the array; decode the available structs one at a time.
+            return DecodeStructs(buffer, buffer_size, len, std::false_type());
+        }
+
+        for (size_t i = 0; i < len; ++i)
+        {
+            decoded_structs_[i].decoded_value = &struct_memory_[i];
+        }
+
+        return bytes_read;
+    }
+
     /// Memory to hold decoded data. Points to an internal allocation when #is_memory_external_ is false and
     /// to an externally provided allocation when #is_memory_external_ is true.
     T*                       decoded_structs_;
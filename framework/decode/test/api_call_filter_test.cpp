@@ -0,0 +1,123 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/api_call_filter.h"
+#include "decode/api_decoder.h"
+#include "decode/test/parameter_buffer_util.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+
+#include <cstdint>
+#include <vector>
+
+using gfxrecon::decode::test::kArrayAttributes;
+using gfxrecon::decode::test::kNullArrayAttributes;
+using gfxrecon::decode::test::kNullStructAttributes;
+using gfxrecon::decode::test::ParameterBuffer;
+
+TEST_CASE("ApiCallFilter::MatchesPattern matches wildcards", "[decode][filter]")
+{
+    using gfxrecon::decode::ApiCallFilter;
+
+    REQUIRE(ApiCallFilter::MatchesPattern("vkQueueSubmit", "vkQueueSubmit"));
+    REQUIRE(!ApiCallFilter::MatchesPattern("vkQueueSubmit2KHR", "vkQueueSubmit"));
+    REQUIRE(ApiCallFilter::MatchesPattern("vkQueueSubmit2KHR", "vkQueueSubmit*"));
+    REQUIRE(ApiCallFilter::MatchesPattern("vkCmdDrawIndexed", "vkCmdDraw*"));
+    REQUIRE(ApiCallFilter::MatchesPattern("vkCmdDrawIndexed", "*Draw*"));
+    REQUIRE(ApiCallFilter::MatchesPattern("vkCmdDrawIndexed", "vkCmd?raw*ed"));
+    REQUIRE(!ApiCallFilter::MatchesPattern("vkCmdDispatch", "vkCmdDraw*"));
+    REQUIRE(ApiCallFilter::MatchesPattern("vkCmdDispatch", "*"));
+    REQUIRE(!ApiCallFilter::MatchesPattern("vkCmdDispatch", ""));
+}
+
+TEST_CASE("ApiCallFilter includes API calls by name, thread, and frame", "[decode][filter]")
+{
+    gfxrecon::decode::ApiCallFilter filter;
+
+    REQUIRE(filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, 1, 0));
+
+    filter.AddApiCallNamePattern("vkQueueSubmit*");
+    filter.AddApiCallNamePattern("vkCmdDraw");
+    filter.AddThreadId(1);
+    filter.SetFrameRange(2, 3);
+
+    REQUIRE(filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, 1, 2));
+    REQUIRE(filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit2KHR, 1, 3));
+    REQUIRE(filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, 1, 3));
+    REQUIRE(!filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexed, 1, 3));
+    REQUIRE(!filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, 2, 2));
+    REQUIRE(!filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, 1, 1));
+    REQUIRE(!filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, 1, 4));
+    REQUIRE(!filter.IsApiCallIncluded(gfxrecon::format::ApiCallId::ApiCall_Unknown, 1, 2));
+}
+
+TEST_CASE("ApiCallFilter includes API calls with parameters that reference a handle ID", "[decode][filter]")
+{
+    const gfxrecon::format::HandleId handle_id = 0x123456789a;
+    const gfxrecon::format::HandleId other_id  = 0x42;
+    gfxrecon::decode::ApiCallInfo    call_info;
+    gfxrecon::decode::ApiCallFilter  filter;
+
+    // vkCmdDraw with vertex and instance counts that have the same encoding as the handle ID.
+    ParameterBuffer draw;
+    draw.Write<gfxrecon::format::HandleEncodeType>(other_id);
+    draw.Write<uint32_t>(static_cast<uint32_t>(handle_id));
+    draw.Write<uint32_t>(static_cast<uint32_t>(handle_id >> 32));
+    draw.Write<uint32_t>(0);
+    draw.Write<uint32_t>(0);
+
+    // vkQueueSubmit with the handle ID in the command buffer array of the submit info.
+    ParameterBuffer submit;
+    submit.Write<gfxrecon::format::HandleEncodeType>(other_id);
+    submit.Write<uint32_t>(1);
+    submit.WriteStructArrayPreamble(1);
+    submit.Write<gfxrecon::format::EnumEncodeType>(VK_STRUCTURE_TYPE_SUBMIT_INFO);
+    submit.Write<uint32_t>(kNullStructAttributes);
+    submit.Write<uint32_t>(0);
+    submit.Write<uint32_t>(kNullArrayAttributes);
+    submit.Write<uint32_t>(kNullArrayAttributes);
+    submit.Write<uint32_t>(2);
+    submit.WriteArrayPreamble(kArrayAttributes, 2);
+    submit.Write<gfxrecon::format::HandleEncodeType>(other_id);
+    submit.Write<gfxrecon::format::HandleEncodeType>(handle_id);
+    submit.Write<uint32_t>(0);
+    submit.Write<uint32_t>(kNullArrayAttributes);
+    submit.Write<gfxrecon::format::HandleEncodeType>(0);
+    submit.Write<gfxrecon::format::EnumEncodeType>(VK_SUCCESS);
+
+    REQUIRE(filter.IsParameterDataIncluded(
+        gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, call_info, draw.data.data(), draw.data.size()));
+
+    filter.AddHandleId(handle_id);
+
+    // Only the parameter data that was encoded as a handle ID is matched.
+    REQUIRE(!filter.IsParameterDataIncluded(
+        gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, call_info, draw.data.data(), draw.data.size()));
+    REQUIRE(filter.IsParameterDataIncluded(
+        gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit, call_info, submit.data.data(), submit.data.size()));
+
+    filter.AddHandleId(other_id);
+    REQUIRE(filter.IsParameterDataIncluded(
+        gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, call_info, draw.data.data(), draw.data.size()));
+}
@@ -0,0 +1,299 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/block_index.h"
+#include "decode/file_processor.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+#include "generated/generated_vulkan_decoder.h"
+#include "util/platform.h"
+
+#include <cstdio>
+#include <cstring>
+#include <string>
+#include <vector>
+
+namespace
+{
+
+const char kCaptureFilename[] = "block_index_test.gfxr";
+
+// Records the thread IDs of the decoded API calls, which are used to identify the blocks of the test capture.
+class RecordingDecoder : public gfxrecon::decode::VulkanDecoder
+{
+  public:
+    std::vector<gfxrecon::format::ThreadId> thread_ids;
+    std::vector<uint64_t>                   state_markers;
+
+    virtual void DecodeFunctionCall(gfxrecon::format::ApiCallId          call_id,
+                                    const gfxrecon::decode::ApiCallInfo& call_info,
+                                    const uint8_t*                       parameter_buffer,
+                                    size_t                               buffer_size) override
+    {
+        thread_ids.push_back(call_info.thread_id);
+    }
+
+    virtual void DispatchStateBeginMarker(uint64_t frame_number) override { state_markers.push_back(frame_number); }
+
+    virtual void DispatchStateEndMarker(uint64_t frame_number) override { state_markers.push_back(frame_number); }
+};
+
+void WriteFunctionCall(FILE* file, gfxrecon::format::ApiCallId call_id, gfxrecon::format::ThreadId thread_id)
+{
+    const uint64_t                parameter_data = 0;
+    gfxrecon::format::BlockHeader block_header;
+    block_header.type = gfxrecon::format::BlockType::kFunctionCallBlock;
+    block_header.size = sizeof(call_id) + sizeof(thread_id) + sizeof(parameter_data);
+
+    gfxrecon::util::platform::FileWrite(&block_header, sizeof(block_header), 1, file);
+    gfxrecon::util::platform::FileWrite(&call_id, sizeof(call_id), 1, file);
+    gfxrecon::util::platform::FileWrite(&thread_id, sizeof(thread_id), 1, file);
+    gfxrecon::util::platform::FileWrite(&parameter_data, sizeof(parameter_data), 1, file);
+}
+
+void WriteStateMarker(FILE* file, gfxrecon::format::MarkerType marker_type, uint64_t frame_number)
+{
+    gfxrecon::format::BlockHeader block_header;
+    block_header.type = gfxrecon::format::BlockType::kStateMarkerBlock;
+    block_header.size = sizeof(marker_type) + sizeof(frame_number);
+
+    gfxrecon::util::platform::FileWrite(&block_header, sizeof(block_header), 1, file);
+    gfxrecon::util::platform::FileWrite(&marker_type, sizeof(marker_type), 1, file);
+    gfxrecon::util::platform::FileWrite(&frame_number, sizeof(frame_number), 1, file);
+}
+
+// Writes a capture with three frames, where the first two frames end with vkQueuePresentKHR, and the second frame
+// starts with the end of the state snapshot.  The thread ID of each API call is the block number.
+// The last API call of the third frame can be changed to write a different capture of the same size.
+void WriteCaptureFile(gfxrecon::format::ApiCallId last_call_id = gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw)
+{
+    FILE* file = nullptr;
+    REQUIRE(gfxrecon::util::platform::FileOpen(&file, kCaptureFilename, "wb") == 0);
+
+    gfxrecon::format::FileHeader file_header;
+    file_header.fourcc        = GFXRECON_FOURCC;
+    file_header.major_version = 0;
+    file_header.minor_version = 0;
+    file_header.num_options   = 0;
+    gfxrecon::util::platform::FileWrite(&file_header, sizeof(file_header), 1, file);
+
+    WriteStateMarker(file, gfxrecon::format::MarkerType::kBeginMarker, 0);
+    WriteFunctionCall(file, gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, 1);
+    WriteFunctionCall(file, gfxrecon::format::ApiCallId::ApiCall_vkQueuePresentKHR, 2);
+    WriteStateMarker(file, gfxrecon::format::MarkerType::kEndMarker, 0);
+    WriteFunctionCall(file, gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw, 4);
+    WriteFunctionCall(file, gfxrecon::format::ApiCallId::ApiCall_vkQueuePresentKHR, 5);
+    WriteFunctionCall(file, last_call_id, 6);
+
+    gfxrecon::util::platform::FileClose(file);
+}
+
+} // namespace
+
+TEST_CASE("BlockIndex records the blocks and frames of a capture file", "[decode][index]")
+{
+    WriteCaptureFile();
+
+    gfxrecon::decode::BlockIndex    block_index;
+    gfxrecon::decode::FileProcessor file_processor;
+    REQUIRE(file_processor.Initialize(kCaptureFilename));
+    REQUIRE(file_processor.BuildBlockIndex(&block_index));
+
+    REQUIRE(block_index.GetBlockCount() == 7);
+    REQUIRE(block_index.GetFrameCount() == 3);
+
+    const uint64_t marker_block_size = sizeof(gfxrecon::format::BlockHeader) + 12;
+    const uint64_t call_block_size   = sizeof(gfxrecon::format::BlockHeader) + 20;
+    REQUIRE(block_index.GetBlock(0).offset == sizeof(gfxrecon::format::FileHeader));
+    REQUIRE(block_index.GetBlock(1).offset == (block_index.GetBlock(0).offset + marker_block_size));
+    REQUIRE(block_index.GetBlock(2).offset == (block_index.GetBlock(1).offset + call_block_size));
+    REQUIRE(block_index.GetCaptureFileSize() == (block_index.GetBlock(6).offset + call_block_size));
+
+    REQUIRE(block_index.GetBlock(2).type == gfxrecon::format::BlockType::kFunctionCallBlock);
+    REQUIRE(block_index.GetBlock(2).id == gfxrecon::format::ApiCallId::ApiCall_vkQueuePresentKHR);
+    REQUIRE(block_index.GetBlock(2).frame_number == 0);
+    REQUIRE(block_index.GetBlock(3).type == gfxrecon::format::BlockType::kStateMarkerBlock);
+    REQUIRE(block_index.GetBlock(3).id == gfxrecon::format::MarkerType::kEndMarker);
+    REQUIRE(block_index.GetBlock(3).frame_number == 1);
+    REQUIRE(block_index.GetBlock(6).frame_number == 2);
+
+    uint64_t block_number = 0;
+    REQUIRE(block_index.GetFrameFirstBlock(1, &block_number));
+    REQUIRE(block_number == 3);
+    REQUIRE(block_index.GetFrameFirstBlock(2, &block_number));
+    REQUIRE(block_number == 6);
+    REQUIRE(!block_index.GetFrameFirstBlock(3, &block_number));
+
+    REQUIRE(block_index.GetStateMarkerBlocks() == std::vector<uint64_t>{ 0, 3 });
+
+    // Building the index does not change the file position.
+    RecordingDecoder decoder;
+    file_processor.AddDecoder(&decoder);
+    REQUIRE(file_processor.ProcessNextFrame());
+    REQUIRE(decoder.thread_ids == std::vector<gfxrecon::format::ThreadId>{ 1, 2 });
+    REQUIRE(file_processor.GetCurrentFrameNumber() == 1);
+
+    std::remove(kCaptureFilename);
+}
+
+TEST_CASE("BlockIndex files are rejected when they do not match the capture file", "[decode][index]")
+{
+    WriteCaptureFile();
+
+    gfxrecon::decode::BlockIndex    block_index;
+    gfxrecon::decode::FileProcessor file_processor;
+    REQUIRE(file_processor.Initialize(kCaptureFilename));
+    REQUIRE(file_processor.BuildBlockIndex(&block_index));
+
+    std::string index_filename = gfxrecon::decode::BlockIndex::GetIndexFilename(kCaptureFilename);
+    REQUIRE(block_index.WriteFile(index_filename));
+
+    gfxrecon::decode::BlockIndex loaded_index;
+    REQUIRE(loaded_index.ReadFile(index_filename));
+    REQUIRE(loaded_index.GetCaptureFileSize() == block_index.GetCaptureFileSize());
+    REQUIRE(loaded_index.GetBlockCount() == block_index.GetBlockCount());
+    REQUIRE(loaded_index.GetFrameCount() == block_index.GetFrameCount());
+
+    for (uint64_t i = 0; i < block_index.GetBlockCount(); ++i)
+    {
+        REQUIRE(loaded_index.GetBlock(i).offset == block_index.GetBlock(i).offset);
+        REQUIRE(loaded_index.GetBlock(i).type == block_index.GetBlock(i).type);
+        REQUIRE(loaded_index.GetBlock(i).id == block_index.GetBlock(i).id);
+        REQUIRE(loaded_index.GetBlock(i).frame_number == block_index.GetBlock(i).frame_number);
+    }
+
+    REQUIRE(!loaded_index.ReadFile(kCaptureFilename));
+    REQUIRE(loaded_index.GetBlockCount() == 0);
+    REQUIRE(file_processor.ReadBlockIndex(&loaded_index));
+    REQUIRE(loaded_index.GetBlockCount() == block_index.GetBlockCount());
+
+    // A capture of the same size with a different last API call.
+    WriteCaptureFile(gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatch);
+
+    gfxrecon::decode::FileProcessor changed_file_processor;
+    REQUIRE(changed_file_processor.Initialize(kCaptureFilename));
+    REQUIRE(!changed_file_processor.ReadBlockIndex(&loaded_index));
+    REQUIRE(loaded_index.GetBlockCount() == 0);
+    REQUIRE(changed_file_processor.GetErrorState() == gfxrecon::decode::FileProcessor::kErrorNone);
+
+    std::remove(index_filename.c_str());
+    std::remove(kCaptureFilename);
+}
+
+TEST_CASE("BlockIndex files with invalid counts are rejected", "[decode][index]")
+{
+    WriteCaptureFile();
+
+    gfxrecon::decode::BlockIndex    block_index;
+    gfxrecon::decode::FileProcessor file_processor;
+    REQUIRE(file_processor.Initialize(kCaptureFilename));
+    REQUIRE(file_processor.BuildBlockIndex(&block_index));
+
+    std::string index_filename = gfxrecon::decode::BlockIndex::GetIndexFilename(kCaptureFilename);
+    REQUIRE(block_index.WriteFile(index_filename));
+
+    std::vector<uint8_t> index_data;
+    FILE*                file = nullptr;
+    REQUIRE(gfxrecon::util::platform::FileOpen(&file, index_filename.c_str(), "rb") == 0);
+    uint8_t byte = 0;
+    while (gfxrecon::util::platform::FileRead(&byte, sizeof(byte), 1, file) == 1)
+    {
+        index_data.push_back(byte);
+    }
+    gfxrecon::util::platform::FileClose(file);
+
+    auto write_index = [&index_filename](const std::vector<uint8_t>& data) {
+        FILE* index_file = nullptr;
+        REQUIRE(gfxrecon::util::platform::FileOpen(&index_file, index_filename.c_str(), "wb") == 0);
+        gfxrecon::util::platform::FileWrite(data.data(), 1, data.size(), index_file);
+        gfxrecon::util::platform::FileClose(index_file);
+    };
+
+    gfxrecon::decode::BlockIndex loaded_index;
+
+    // Truncated index file.
+    write_index(std::vector<uint8_t>(index_data.begin(), index_data.end() - 1));
+    REQUIRE(!loaded_index.ReadFile(index_filename));
+
+    // Block and frame counts that do not match the size of the file.
+    auto                               corrupt_data = index_data;
+    gfxrecon::format::BlockIndexHeader header;
+    std::memcpy(&header, corrupt_data.data(), sizeof(header));
+    header.block_count = UINT64_MAX / sizeof(gfxrecon::format::BlockIndexEntry);
+    std::memcpy(corrupt_data.data(), &header, sizeof(header));
+    write_index(corrupt_data);
+    REQUIRE(!loaded_index.ReadFile(index_filename));
+
+    header.block_count = block_index.GetBlockCount() - 1;
+    header.frame_count = block_index.GetFrameCount() + 2;
+    std::memcpy(corrupt_data.data(), &header, sizeof(header));
+    write_index(corrupt_data);
+    REQUIRE(!loaded_index.ReadFile(index_filename));
+    REQUIRE(loaded_index.GetBlockCount() == 0);
+
+    write_index(index_data);
+    REQUIRE(loaded_index.ReadFile(index_filename));
+    REQUIRE(loaded_index.GetBlockCount() == block_index.GetBlockCount());
+
+    std::remove(index_filename.c_str());
+    std::remove(kCaptureFilename);
+}
+
+TEST_CASE("FileProcessor seeks to frames and blocks with a BlockIndex", "[decode][index]")
+{
+    WriteCaptureFile();
+
+    gfxrecon::decode::BlockIndex    block_index;
+    gfxrecon::decode::FileProcessor file_processor;
+    RecordingDecoder                decoder;
+    REQUIRE(file_processor.Initialize(kCaptureFilename));
+    REQUIRE(file_processor.BuildBlockIndex(&block_index));
+    file_processor.AddDecoder(&decoder);
+
+    REQUIRE(!file_processor.SeekToFrame(1));
+
+    file_processor.SetBlockIndex(&block_index);
+
+    REQUIRE(file_processor.SeekToFrame(1));
+    REQUIRE(file_processor.GetCurrentFrameNumber() == 1);
+    REQUIRE(file_processor.ProcessNextFrame());
+    REQUIRE(decoder.thread_ids == std::vector<gfxrecon::format::ThreadId>{ 4, 5 });
+    REQUIRE(decoder.state_markers.size() == 1);
+    REQUIRE(file_processor.GetCurrentFrameNumber() == 2);
+
+    // Seeking after reaching the end of the file resumes processing.
+    decoder.thread_ids.clear();
+    REQUIRE(!file_processor.ProcessNextFrame());
+    REQUIRE(file_processor.SeekToBlock(1));
+    REQUIRE(file_processor.GetCurrentFrameNumber() == 0);
+    REQUIRE(file_processor.GetNumBytesRead() == block_index.GetBlock(1).offset);
+    REQUIRE(file_processor.ProcessNextFrame());
+    REQUIRE(decoder.thread_ids == std::vector<gfxrecon::format::ThreadId>{ 6, 1, 2 });
+
+    REQUIRE(!file_processor.SeekToFrame(3));
+    REQUIRE(!file_processor.SeekToBlock(block_index.GetBlockCount()));
+    REQUIRE(file_processor.GetErrorState() == gfxrecon::decode::FileProcessor::kErrorNone);
+
+    std::remove(kCaptureFilename);
+}
@@ -0,0 +1,160 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// Object info table microbenchmarks.  The test cases are hidden, and must be selected explicitly to run:
+//     gfxrecon_decode_test [benchmark]
+//
+// The benchmarks model the object info lookups for a descriptor heavy capture, where handle IDs are assigned from a
+// counter that is shared by all handle types, and most of the IDs belong to descriptor sets.
+
+#include <catch2/catch.hpp>
+
+#include "decode/handle_id_map.h"
+#include "format/format.h"
+
+#include <chrono>
+#include <cstdint>
+#include <random>
+#include <unordered_map>
+#include <vector>
+
+namespace
+{
+
+// Number of handle IDs in the synthetic capture, and number of descriptor set lookups.
+const size_t kHandleIdCount = 1024 * 1024;
+const size_t kLookupCount   = 16 * 1024 * 1024;
+
+// Object info with a size that is similar to DescriptorSetInfo.
+struct BenchmarkInfo
+{
+    gfxrecon::format::HandleId capture_id{ 0 };
+    uint64_t                   handle{ 0 };
+    uint64_t                   data[6]{};
+};
+
+// Returns the descriptor set IDs, which are 60% of the IDs, interleaved with the IDs of other handle types.
+std::vector<gfxrecon::format::HandleId> MakeDescriptorSetIds()
+{
+    std::vector<gfxrecon::format::HandleId> ids;
+    std::mt19937                            random_engine(0);
+    std::uniform_int_distribution<uint32_t> distribution(0, 9);
+
+    for (gfxrecon::format::HandleId id = 1; id <= kHandleIdCount; ++id)
+    {
+        if (distribution(random_engine) < 6)
+        {
+            ids.push_back(id);
+        }
+    }
+
+    return ids;
+}
+
+// Lookup order for the calls that reference descriptor sets.
+std::vector<gfxrecon::format::HandleId> MakeLookups(const std::vector<gfxrecon::format::HandleId>& ids)
+{
+    std::vector<gfxrecon::format::HandleId> lookups(kLookupCount);
+    std::mt19937                            random_engine(1);
+    std::uniform_int_distribution<size_t>   distribution(0, ids.size() - 1);
+
+    for (auto& lookup : lookups)
+    {
+        lookup = ids[distribution(random_engine)];
+    }
+
+    return lookups;
+}
+
+template <typename Fn>
+int64_t Measure(Fn fn)
+{
+    auto start = std::chrono::high_resolution_clock::now();
+    fn();
+    auto end = std::chrono::high_resolution_clock::now();
+
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+}
+
+} // namespace
+
+TEST_CASE("HandleIdMap and std::unordered_map descriptor set lookup cost", "[.][benchmark][handle_id_map]")
+{
+    auto ids     = MakeDescriptorSetIds();
+    auto lookups = MakeLookups(ids);
+
+    gfxrecon::decode::HandleIdMap<BenchmarkInfo>                  handle_id_map;
+    std::unordered_map<gfxrecon::format::HandleId, BenchmarkInfo> unordered_map;
+
+    auto handle_id_map_insert = Measure([&]() {
+        for (auto id : ids)
+        {
+            handle_id_map.Emplace(id, BenchmarkInfo{ id, id });
+        }
+    });
+
+    auto unordered_map_insert = Measure([&]() {
+        for (auto id : ids)
+        {
+            unordered_map.emplace(id, BenchmarkInfo{ id, id });
+        }
+    });
+
+    uint64_t handle_id_map_sum    = 0;
+    auto     handle_id_map_lookup = Measure([&]() {
+        for (auto id : lookups)
+        {
+            handle_id_map_sum += handle_id_map.Find(id)->handle;
+        }
+    });
+
+    uint64_t unordered_map_sum    = 0;
+    auto     unordered_map_lookup = Measure([&]() {
+        for (auto id : lookups)
+        {
+            unordered_map_sum += unordered_map.find(id)->second.handle;
+        }
+    });
+
+    uint64_t handle_id_map_visit_sum = 0;
+    auto     handle_id_map_visit     = Measure(
+        [&]() { handle_id_map.Visit([&](const BenchmarkInfo* info) { handle_id_map_visit_sum += info->handle; }); });
+
+    uint64_t unordered_map_visit_sum = 0;
+    auto     unordered_map_visit     = Measure([&]() {
+        for (const auto& entry : unordered_map)
+        {
+            unordered_map_visit_sum += entry.second.handle;
+        }
+    });
+
+    REQUIRE(handle_id_map_sum == unordered_map_sum);
+    REQUIRE(handle_id_map_visit_sum == unordered_map_visit_sum);
+
+    WARN(ids.size() << " descriptor sets, " << kLookupCount << " lookups\n"
+                    << "HandleIdMap: insert " << (handle_id_map_insert / 1000000.0) << " ms, lookup "
+                    << (static_cast<double>(handle_id_map_lookup) / kLookupCount) << " ns, visit "
+                    << (handle_id_map_visit / 1000000.0) << " ms\n"
+                    << "std::unordered_map: insert " << (unordered_map_insert / 1000000.0) << " ms, lookup "
+                    << (static_cast<double>(unordered_map_lookup) / kLookupCount) << " ns, visit "
+                    << (unordered_map_visit / 1000000.0) << " ms");
+}
@@ -0,0 +1,125 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/handle_id_map.h"
+
+#include <string>
+#include <vector>
+
+namespace
+{
+
+struct TestInfo
+{
+    uint64_t    value{ 0 };
+    std::string name;
+};
+
+} // namespace
+
+TEST_CASE("HandleIdMap inserts, finds, and erases values", "[decode][handle_id_map]")
+{
+    gfxrecon::decode::HandleIdMap<TestInfo> map;
+
+    REQUIRE(map.IsEmpty());
+    REQUIRE(map.Find(1) == nullptr);
+    REQUIRE(!map.Erase(1));
+
+    // IDs from the page directory, and IDs that are too large for it.
+    const std::vector<gfxrecon::format::HandleId> ids = { 1, 2, 255, 256, 1000, 1ull << 30, 0xffffffffffffffffull };
+
+    for (auto id : ids)
+    {
+        auto result = map.Emplace(id, TestInfo{ id, std::to_string(id) });
+        REQUIRE(result.second);
+        REQUIRE(result.first->value == id);
+    }
+
+    REQUIRE(map.GetSize() == ids.size());
+
+    for (auto id : ids)
+    {
+        const auto& const_map = map;
+        REQUIRE(map.Find(id) != nullptr);
+        REQUIRE(map.Find(id)->value == id);
+        REQUIRE(const_map.Find(id) == map.Find(id));
+    }
+
+    REQUIRE(map.Find(3) == nullptr);
+    REQUIRE(map.Find(257) == nullptr);
+    REQUIRE(map.Find(1ull << 31) == nullptr);
+
+    // An existing value is not replaced, and the new value is not moved from.
+    TestInfo duplicate{ 7, "duplicate" };
+    auto     result = map.Emplace(256, std::move(duplicate));
+    REQUIRE(!result.second);
+    REQUIRE(result.first->value == 256);
+    REQUIRE(duplicate.name == "duplicate");
+
+    REQUIRE(map.Erase(256));
+    REQUIRE(map.Erase(1ull << 30));
+    REQUIRE(!map.Erase(256));
+    REQUIRE(map.Find(256) == nullptr);
+    REQUIRE(map.Find(1ull << 30) == nullptr);
+    REQUIRE(map.GetSize() == ids.size() - 2);
+
+    // Erased slots are reused, without changing the other values.
+    const TestInfo* first_info = map.Find(1);
+    result                     = map.Emplace(4096, TestInfo{ 4096, "4096" });
+    REQUIRE(result.second);
+    REQUIRE(map.Find(4096)->name == "4096");
+    REQUIRE(map.Find(1) == first_info);
+    REQUIRE(first_info->name == "1");
+
+    map.Clear();
+    REQUIRE(map.IsEmpty());
+    REQUIRE(map.Find(1) == nullptr);
+}
+
+TEST_CASE("HandleIdMap visits each value", "[decode][handle_id_map]")
+{
+    gfxrecon::decode::HandleIdMap<TestInfo> map;
+
+    for (gfxrecon::format::HandleId id = 1; id <= 100; ++id)
+    {
+        map.Emplace(id * 3, TestInfo{ id, "" });
+    }
+
+    for (gfxrecon::format::HandleId id = 2; id <= 100; id += 2)
+    {
+        map.Erase(id * 3);
+    }
+
+    uint64_t sum = 0;
+    map.Visit([&sum](TestInfo* info) { sum += info->value; });
+    REQUIRE(sum == 2500);
+
+    size_t      count     = 0;
+    const auto& const_map = map;
+    const_map.Visit([&count](const TestInfo* info) {
+        REQUIRE((info->value % 2) == 1);
+        ++count;
+    });
+    REQUIRE(count == 50);
+}
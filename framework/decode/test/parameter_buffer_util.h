@@ -0,0 +1,75 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_TEST_PARAMETER_BUFFER_UTIL_H
+#define GFXRECON_DECODE_TEST_PARAMETER_BUFFER_UTIL_H
+
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <cstdint>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+GFXRECON_BEGIN_NAMESPACE(test)
+
+const uint32_t kArrayAttributes =
+    format::PointerAttributes::kIsArray | format::PointerAttributes::kHasAddress | format::PointerAttributes::kHasData;
+const uint32_t kStructArrayAttributes = kArrayAttributes | format::PointerAttributes::kIsStruct;
+const uint32_t kNullArrayAttributes   = format::PointerAttributes::kIsArray | format::PointerAttributes::kIsNull;
+const uint32_t kNullStructAttributes =
+    format::PointerAttributes::kIsStruct | format::PointerAttributes::kIsSingle | format::PointerAttributes::kIsNull;
+
+// Size of the attributes, address, and length that are written before the elements of an array.
+const size_t kArrayPreambleSize =
+    sizeof(uint32_t) + sizeof(format::AddressEncodeType) + sizeof(format::SizeTEncodeType);
+
+// Builds API call parameter data with the encoding produced by ParameterEncoder.
+class ParameterBuffer
+{
+  public:
+    template <typename T>
+    void Write(T value)
+    {
+        const uint8_t* bytes = reinterpret_cast<const uint8_t*>(&value);
+        data.insert(data.end(), bytes, bytes + sizeof(value));
+    }
+
+    // Writes the attributes, address, and length that ParameterEncoder writes before the elements of an array.
+    void WriteArrayPreamble(uint32_t attributes, size_t len)
+    {
+        Write<uint32_t>(attributes);
+        Write<format::AddressEncodeType>(0x1000);
+        Write<format::SizeTEncodeType>(len);
+    }
+
+    void WriteStructArrayPreamble(size_t len) { WriteArrayPreamble(kStructArrayAttributes, len); }
+
+    std::vector<uint8_t> data;
+};
+
+GFXRECON_END_NAMESPACE(test)
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_TEST_PARAMETER_BUFFER_UTIL_H
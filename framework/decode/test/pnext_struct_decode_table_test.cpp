@@ -0,0 +1,101 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/pnext_struct_decode_table.h"
+
+namespace
+{
+
+gfxrecon::decode::PNextNode* AllocateFirst()
+{
+    return nullptr;
+}
+
+gfxrecon::decode::PNextNode* AllocateSecond()
+{
+    return nullptr;
+}
+
+gfxrecon::decode::PNextNode* AllocateThird()
+{
+    return nullptr;
+}
+
+// Unsorted, including both core and extension struct types.
+const gfxrecon::decode::PNextStructDecodeInfo kInfos[] = {
+    { VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES, AllocateThird },
+    { VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES, AllocateFirst },
+    { VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD, AllocateSecond }
+};
+
+} // namespace
+
+TEST_CASE("PNextStructDecodeTable finds entries by struct type", "[decode][pnext]")
+{
+    gfxrecon::decode::PNextStructDecodeTable table(kInfos);
+
+    // Repeated lookups use the cached entries.
+    for (int i = 0; i < 2; ++i)
+    {
+        auto first = table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES);
+        REQUIRE(first != nullptr);
+        REQUIRE(first->allocate == AllocateFirst);
+
+        auto second = table.Find(VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD);
+        REQUIRE(second != nullptr);
+        REQUIRE(second->allocate == AllocateSecond);
+
+        auto third = table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES);
+        REQUIRE(third != nullptr);
+        REQUIRE(third->allocate == AllocateThird);
+
+        REQUIRE(table.Find(VK_STRUCTURE_TYPE_APPLICATION_INFO) == nullptr);
+    }
+}
+
+TEST_CASE("PNextStructDecodeTable counts struct types when statistics are enabled", "[decode][pnext]")
+{
+    gfxrecon::decode::PNextStructDecodeTable table(kInfos);
+
+    table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES);
+    REQUIRE(table.GetStatistics().empty());
+
+    table.EnableStatistics(true);
+    table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES);
+    table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES);
+    table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES);
+    table.Find(VK_STRUCTURE_TYPE_APPLICATION_INFO);
+
+    auto statistics = table.GetStatistics();
+    REQUIRE(statistics.size() == 2);
+    REQUIRE(statistics[0].first == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES);
+    REQUIRE(statistics[0].second == 2);
+    REQUIRE(statistics[1].first == VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES);
+    REQUIRE(statistics[1].second == 1);
+    REQUIRE(table.GetUnrecognizedCount() == 1);
+
+    table.ResetStatistics();
+    REQUIRE(table.GetStatistics().empty());
+    REQUIRE(table.GetUnrecognizedCount() == 0);
+}
@@ -0,0 +1,120 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/decode_allocator.h"
+#include "decode/struct_pointer_decoder.h"
+#include "decode/test/parameter_buffer_util.h"
+#include "format/format.h"
+#include "generated/generated_vulkan_struct_decoders.h"
+
+#include <cstring>
+#include <vector>
+
+using gfxrecon::decode::test::kArrayPreambleSize;
+using gfxrecon::decode::test::ParameterBuffer;
+
+TEST_CASE("StructPointerDecoder decodes arrays of trivially decodable structs", "[decode][struct]")
+{
+    REQUIRE(gfxrecon::decode::IsTriviallyDecodable<gfxrecon::decode::Decoded_VkBufferCopy>::value);
+
+    const VkBufferCopy regions[] = { { 1, 2, 3 }, { 4, 5, 6 }, { 7, 8, 9 } };
+    const size_t       count     = sizeof(regions) / sizeof(regions[0]);
+
+    ParameterBuffer buffer;
+    buffer.WriteStructArrayPreamble(count);
+    for (const auto& region : regions)
+    {
+        buffer.Write<gfxrecon::format::DeviceSizeEncodeType>(region.srcOffset);
+        buffer.Write<gfxrecon::format::DeviceSizeEncodeType>(region.dstOffset);
+        buffer.Write<gfxrecon::format::DeviceSizeEncodeType>(region.size);
+    }
+
+    gfxrecon::decode::DecodeAllocator::Begin();
+
+    SECTION("The complete array is decoded")
+    {
+        gfxrecon::decode::StructPointerDecoder<gfxrecon::decode::Decoded_VkBufferCopy> decoder;
+        REQUIRE(decoder.Decode(buffer.data.data(), buffer.data.size()) == buffer.data.size());
+        REQUIRE(decoder.GetLength() == count);
+
+        const VkBufferCopy* decoded = decoder.GetPointer();
+        auto                meta    = decoder.GetMetaStructPointer();
+        for (size_t i = 0; i < count; ++i)
+        {
+            REQUIRE(decoded[i].srcOffset == regions[i].srcOffset);
+            REQUIRE(decoded[i].dstOffset == regions[i].dstOffset);
+            REQUIRE(decoded[i].size == regions[i].size);
+            REQUIRE(meta[i].decoded_value == &decoded[i]);
+        }
+    }
+
+    SECTION("A truncated array decodes the available structs")
+    {
+        size_t truncated_size = buffer.data.size() - sizeof(gfxrecon::format::DeviceSizeEncodeType);
+
+        gfxrecon::decode::StructPointerDecoder<gfxrecon::decode::Decoded_VkBufferCopy> decoder;
+        REQUIRE(decoder.Decode(buffer.data.data(), truncated_size) == truncated_size);
+
+        const VkBufferCopy* decoded = decoder.GetPointer();
+        REQUIRE(decoded[0].srcOffset == regions[0].srcOffset);
+        REQUIRE(decoded[1].size == regions[1].size);
+        REQUIRE(decoded[2].dstOffset == regions[2].dstOffset);
+    }
+
+    gfxrecon::decode::DecodeAllocator::End();
+}
+
+TEST_CASE("StructPointerDecoder decodes arrays of structs with padding member by member", "[decode][struct]")
+{
+    // The encoded struct does not include the padding that follows memoryTypeBits.
+    REQUIRE_FALSE(gfxrecon::decode::IsTriviallyDecodable<gfxrecon::decode::Decoded_VkMemoryRequirements>::value);
+
+    const VkMemoryRequirements requirements[] = { { 256, 16, 0x3 }, { 512, 64, 0x5 } };
+    const size_t               count          = sizeof(requirements) / sizeof(requirements[0]);
+
+    ParameterBuffer buffer;
+    buffer.WriteStructArrayPreamble(count);
+    for (const auto& requirement : requirements)
+    {
+        buffer.Write<gfxrecon::format::DeviceSizeEncodeType>(requirement.size);
+        buffer.Write<gfxrecon::format::DeviceSizeEncodeType>(requirement.alignment);
+        buffer.Write<uint32_t>(requirement.memoryTypeBits);
+    }
+
+    gfxrecon::decode::DecodeAllocator::Begin();
+
+    gfxrecon::decode::StructPointerDecoder<gfxrecon::decode::Decoded_VkMemoryRequirements> decoder;
+    REQUIRE(decoder.Decode(buffer.data.data(), buffer.data.size()) == buffer.data.size());
+    REQUIRE(buffer.data.size() == (kArrayPreambleSize + (count * 20)));
+
+    const VkMemoryRequirements* decoded = decoder.GetPointer();
+    for (size_t i = 0; i < count; ++i)
+    {
+        REQUIRE(decoded[i].size == requirements[i].size);
+        REQUIRE(decoded[i].alignment == requirements[i].alignment);
+        REQUIRE(decoded[i].memoryTypeBits == requirements[i].memoryTypeBits);
+    }
+
+    gfxrecon::decode::DecodeAllocator::End();
+}
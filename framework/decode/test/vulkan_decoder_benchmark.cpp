@@ -0,0 +1,171 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// Decoder microbenchmarks.  The test cases are hidden, and must be selected explicitly to run:
+//     gfxrecon_decode_test [benchmark]
+//
+// The benchmarks only use the public decoder and consumer interfaces, so the same test can be
+// built against different versions of the generated code to compare their performance.
+
+#include <catch2/catch.hpp>
+
+#include "decode/api_decoder.h"
+#include "format/api_call_id.h"
+#include "generated/generated_vulkan_consumer.h"
+#include "generated/generated_vulkan_decoder.h"
+
+#include <chrono>
+#include <cstdint>
+#include <random>
+#include <vector>
+
+namespace
+{
+
+// Number of packets in the synthetic capture.
+const size_t kPacketCount = 4 * 1024 * 1024;
+
+// All of the benchmarked API calls have scalar and handle parameters, which are decoded from a zero
+// filled parameter buffer that is large enough for any of them.
+const size_t kParameterBufferSize = 64;
+
+const gfxrecon::format::ApiCallId kApiCallIds[] = { gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexed,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatch,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdSetLineWidth,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdSetDepthBias,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdSetStencilReference,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdSetDeviceMask,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdEndRenderPass,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdNextSubpass,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkQueueWaitIdle,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkDeviceWaitIdle,
+                                                    gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatchBase };
+
+// Consumer that counts the processed API calls.
+class CountingConsumer : public gfxrecon::decode::VulkanConsumer
+{
+  public:
+    size_t count{ 0 };
+
+    virtual void Process_vkCmdDraw(gfxrecon::format::HandleId, uint32_t, uint32_t, uint32_t, uint32_t) override
+    {
+        ++count;
+    }
+
+    virtual void
+        Process_vkCmdDrawIndexed(gfxrecon::format::HandleId, uint32_t, uint32_t, uint32_t, int32_t, uint32_t) override
+    {
+        ++count;
+    }
+
+    virtual void Process_vkCmdDispatch(gfxrecon::format::HandleId, uint32_t, uint32_t, uint32_t) override { ++count; }
+
+    virtual void Process_vkCmdSetLineWidth(gfxrecon::format::HandleId, float) override { ++count; }
+
+    virtual void Process_vkCmdSetDepthBias(gfxrecon::format::HandleId, float, float, float) override { ++count; }
+
+    virtual void Process_vkCmdSetStencilReference(gfxrecon::format::HandleId, VkStencilFaceFlags, uint32_t) override
+    {
+        ++count;
+    }
+
+    virtual void Process_vkCmdSetDeviceMask(gfxrecon::format::HandleId, uint32_t) override { ++count; }
+
+    virtual void Process_vkCmdEndRenderPass(gfxrecon::format::HandleId) override { ++count; }
+
+    virtual void Process_vkCmdNextSubpass(gfxrecon::format::HandleId, VkSubpassContents) override { ++count; }
+
+    virtual void Process_vkQueueWaitIdle(VkResult, gfxrecon::format::HandleId) override { ++count; }
+
+    virtual void Process_vkDeviceWaitIdle(VkResult, gfxrecon::format::HandleId) override { ++count; }
+
+    virtual void Process_vkCmdDispatchBase(
+        gfxrecon::format::HandleId, uint32_t, uint32_t, uint32_t, uint32_t, uint32_t, uint32_t) override
+    {
+        ++count;
+    }
+};
+
+// Synthetic capture with a random sequence of API calls.
+std::vector<gfxrecon::format::ApiCallId> MakePackets()
+{
+    std::vector<gfxrecon::format::ApiCallId> packets(kPacketCount);
+    std::mt19937                             random_engine(0);
+    std::uniform_int_distribution<size_t>    distribution(0, (sizeof(kApiCallIds) / sizeof(kApiCallIds[0])) - 1);
+    for (auto& packet : packets)
+    {
+        packet = kApiCallIds[distribution(random_engine)];
+    }
+    return packets;
+}
+
+// Decode the packets, returning the elapsed time in nanoseconds.
+int64_t DecodePackets(gfxrecon::decode::VulkanDecoder& decoder, const std::vector<gfxrecon::format::ApiCallId>& packets)
+{
+    const uint8_t                 parameter_buffer[kParameterBufferSize] = {};
+    gfxrecon::decode::ApiCallInfo call_info;
+
+    auto start = std::chrono::high_resolution_clock::now();
+    for (auto call_id : packets)
+    {
+        decoder.DecodeFunctionCall(call_id, call_info, parameter_buffer, kParameterBufferSize);
+    }
+    auto end = std::chrono::high_resolution_clock::now();
+
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+}
+
+} // namespace
+
+TEST_CASE("VulkanDecoder::DecodeFunctionCall per-packet dispatch cost", "[.][benchmark][decoder]")
+{
+    auto                            packets = MakePackets();
+    gfxrecon::decode::VulkanDecoder decoder;
+    CountingConsumer                consumer;
+    decoder.AddConsumer(&consumer);
+
+    auto elapsed = DecodePackets(decoder, packets);
+
+    REQUIRE(consumer.count == kPacketCount);
+
+    WARN("Decoded " << kPacketCount << " packets in " << (elapsed / 1000000.0) << " ms, "
+                    << (static_cast<double>(elapsed) / kPacketCount) << " ns per packet");
+}
+
+TEST_CASE("VulkanDecoder::DecodeFunctionCall per-packet dispatch cost with two consumers", "[.][benchmark][decoder]")
+{
+    auto                            packets = MakePackets();
+    gfxrecon::decode::VulkanDecoder decoder;
+    CountingConsumer                first_consumer;
+    CountingConsumer                second_consumer;
+    decoder.AddConsumer(&first_consumer);
+    decoder.AddConsumer(&second_consumer);
+
+    auto elapsed = DecodePackets(decoder, packets);
+
+    REQUIRE(first_consumer.count == kPacketCount);
+    REQUIRE(second_consumer.count == kPacketCount);
+
+    WARN("Decoded " << kPacketCount << " packets in " << (elapsed / 1000000.0) << " ms, "
+                    << (static_cast<double>(elapsed) / kPacketCount) << " ns per packet");
+}
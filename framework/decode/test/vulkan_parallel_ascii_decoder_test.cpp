@@ -0,0 +1,266 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "decode/api_decoder.h"
+#include "decode/decode_allocator.h"
+#include "decode/test/parameter_buffer_util.h"
+#include "decode/vulkan_parallel_ascii_decoder.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+#include "generated/generated_vulkan_ascii_consumer.h"
+#include "generated/generated_vulkan_decoder.h"
+
+#include <cstdint>
+#include <cstdio>
+#include <fstream>
+#include <iterator>
+#include <random>
+#include <string>
+#include <utility>
+#include <vector>
+
+namespace
+{
+
+using gfxrecon::decode::test::kArrayAttributes;
+using gfxrecon::decode::test::kNullArrayAttributes;
+using gfxrecon::decode::test::kNullStructAttributes;
+using gfxrecon::decode::test::kStructArrayAttributes;
+using gfxrecon::decode::test::ParameterBuffer;
+
+// Enough packets for several batches.
+const size_t kPacketCount = 20000;
+
+// The API calls with scalar and handle parameters are decoded from a random parameter buffer that is large enough for
+// any of them.
+const size_t kParameterBufferSize = 64;
+
+const gfxrecon::format::ApiCallId kApiCallIds[] = {
+    gfxrecon::format::ApiCallId::ApiCall_vkCmdDraw,          gfxrecon::format::ApiCallId::ApiCall_vkCmdDrawIndexed,
+    gfxrecon::format::ApiCallId::ApiCall_vkCmdDispatch,      gfxrecon::format::ApiCallId::ApiCall_vkCmdSetLineWidth,
+    gfxrecon::format::ApiCallId::ApiCall_vkCmdSetDepthBias,  gfxrecon::format::ApiCallId::ApiCall_vkCmdSetDeviceMask,
+    gfxrecon::format::ApiCallId::ApiCall_vkCmdEndRenderPass, gfxrecon::format::ApiCallId::ApiCall_vkQueueWaitIdle,
+    gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit,      gfxrecon::format::ApiCallId::ApiCall_vkUpdateDescriptorSets
+};
+
+struct Packet
+{
+    gfxrecon::format::ApiCallId call_id;
+    std::vector<uint8_t>        parameter_buffer;
+};
+
+// Writes parameters with the encoding produced by ParameterEncoder, using random values for the handles and scalars.
+class RandomParameterBuffer : public ParameterBuffer
+{
+  public:
+    RandomParameterBuffer(std::mt19937* random_engine) : random_engine_(random_engine) {}
+
+    template <typename T>
+    void WriteRandom()
+    {
+        Write<T>(static_cast<T>(value_distribution_(*random_engine_)));
+    }
+
+    uint32_t RandomCount() { return count_distribution_(*random_engine_); }
+
+    void WriteHandleArray(size_t len)
+    {
+        WriteArrayPreamble(kArrayAttributes, len);
+        for (size_t i = 0; i < len; ++i)
+        {
+            WriteRandom<gfxrecon::format::HandleEncodeType>();
+        }
+    }
+
+    void WriteFlagsArray(size_t len)
+    {
+        WriteArrayPreamble(kArrayAttributes, len);
+        for (size_t i = 0; i < len; ++i)
+        {
+            WriteRandom<gfxrecon::format::FlagsEncodeType>();
+        }
+    }
+
+  private:
+    std::mt19937*                           random_engine_;
+    std::uniform_int_distribution<uint64_t> value_distribution_;
+    std::uniform_int_distribution<uint32_t> count_distribution_{ 0, 3 };
+};
+
+void WriteQueueSubmit(RandomParameterBuffer* buffer)
+{
+    uint32_t submit_count = buffer->RandomCount();
+
+    buffer->WriteRandom<gfxrecon::format::HandleEncodeType>();
+    buffer->Write<uint32_t>(submit_count);
+    buffer->WriteArrayPreamble(kStructArrayAttributes, submit_count);
+    for (uint32_t i = 0; i < submit_count; ++i)
+    {
+        uint32_t wait_count = buffer->RandomCount();
+
+        buffer->Write<gfxrecon::format::EnumEncodeType>(VK_STRUCTURE_TYPE_SUBMIT_INFO);
+        buffer->Write<uint32_t>(kNullStructAttributes);
+        buffer->Write<uint32_t>(wait_count);
+        buffer->WriteHandleArray(wait_count);
+        buffer->WriteFlagsArray(wait_count);
+
+        uint32_t command_buffer_count = buffer->RandomCount();
+        buffer->Write<uint32_t>(command_buffer_count);
+        buffer->WriteHandleArray(command_buffer_count);
+
+        uint32_t signal_count = buffer->RandomCount();
+        buffer->Write<uint32_t>(signal_count);
+        buffer->WriteHandleArray(signal_count);
+    }
+    buffer->WriteRandom<gfxrecon::format::HandleEncodeType>();
+    buffer->Write<gfxrecon::format::EnumEncodeType>(VK_SUCCESS);
+}
+
+void WriteUpdateDescriptorSets(RandomParameterBuffer* buffer)
+{
+    uint32_t write_count = buffer->RandomCount();
+
+    buffer->WriteRandom<gfxrecon::format::HandleEncodeType>();
+    buffer->Write<uint32_t>(write_count);
+    buffer->WriteArrayPreamble(kStructArrayAttributes, write_count);
+    for (uint32_t i = 0; i < write_count; ++i)
+    {
+        uint32_t descriptor_count = buffer->RandomCount();
+
+        buffer->Write<gfxrecon::format::EnumEncodeType>(VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET);
+        buffer->Write<uint32_t>(kNullStructAttributes);
+        buffer->WriteRandom<gfxrecon::format::HandleEncodeType>();
+        buffer->WriteRandom<uint32_t>();
+        buffer->WriteRandom<uint32_t>();
+        buffer->Write<uint32_t>(descriptor_count);
+        buffer->Write<gfxrecon::format::EnumEncodeType>(VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER);
+
+        // Only the buffer info is encoded for uniform buffer descriptors; the image info and texel buffer view arrays
+        // are encoded without data.
+        buffer->WriteArrayPreamble(kStructArrayAttributes & ~gfxrecon::format::PointerAttributes::kHasData,
+                                   descriptor_count);
+        buffer->WriteArrayPreamble(kStructArrayAttributes, descriptor_count);
+        for (uint32_t j = 0; j < descriptor_count; ++j)
+        {
+            buffer->WriteRandom<gfxrecon::format::HandleEncodeType>();
+            buffer->WriteRandom<gfxrecon::format::DeviceSizeEncodeType>();
+            buffer->WriteRandom<gfxrecon::format::DeviceSizeEncodeType>();
+        }
+        buffer->WriteArrayPreamble(kArrayAttributes & ~gfxrecon::format::PointerAttributes::kHasData, descriptor_count);
+    }
+    buffer->Write<uint32_t>(0);
+    buffer->Write<uint32_t>(kNullArrayAttributes | gfxrecon::format::PointerAttributes::kIsStruct);
+}
+
+std::vector<Packet> MakePackets()
+{
+    std::vector<Packet>                   packets(kPacketCount);
+    std::mt19937                          random_engine(0);
+    std::uniform_int_distribution<size_t> call_distribution(0, (sizeof(kApiCallIds) / sizeof(kApiCallIds[0])) - 1);
+    std::uniform_int_distribution<int>    byte_distribution(0, 255);
+    for (auto& packet : packets)
+    {
+        RandomParameterBuffer buffer(&random_engine);
+
+        packet.call_id = kApiCallIds[call_distribution(random_engine)];
+        if (packet.call_id == gfxrecon::format::ApiCallId::ApiCall_vkQueueSubmit)
+        {
+            WriteQueueSubmit(&buffer);
+            packet.parameter_buffer = std::move(buffer.data);
+        }
+        else if (packet.call_id == gfxrecon::format::ApiCallId::ApiCall_vkUpdateDescriptorSets)
+        {
+            WriteUpdateDescriptorSets(&buffer);
+            packet.parameter_buffer = std::move(buffer.data);
+        }
+        else
+        {
+            packet.parameter_buffer.resize(kParameterBufferSize);
+            for (auto& value : packet.parameter_buffer)
+            {
+                value = static_cast<uint8_t>(byte_distribution(random_engine));
+            }
+        }
+    }
+    return packets;
+}
+
+// Decodes the packets the same way as the FileProcessor, with each API call decoded between DecodeAllocator::Begin and
+// DecodeAllocator::End.
+void DecodePackets(gfxrecon::decode::ApiDecoder* decoder, const std::vector<Packet>& packets)
+{
+    gfxrecon::decode::ApiCallInfo call_info;
+    for (const auto& packet : packets)
+    {
+        gfxrecon::decode::DecodeAllocator::Begin();
+        decoder->DecodeFunctionCall(
+            packet.call_id, call_info, packet.parameter_buffer.data(), packet.parameter_buffer.size());
+        gfxrecon::decode::DecodeAllocator::End();
+    }
+}
+
+std::string ReadFile(const std::string& filename)
+{
+    std::ifstream file(filename, std::ios::binary);
+    return std::string(std::istreambuf_iterator<char>(file), std::istreambuf_iterator<char>());
+}
+
+} // namespace
+
+TEST_CASE("VulkanParallelAsciiDecoder output matches serial output", "[decode][ascii]")
+{
+    const std::string serial_filename   = "gfxrecon_parallel_ascii_decoder_test_serial.txt";
+    const std::string parallel_filename = "gfxrecon_parallel_ascii_decoder_test_parallel.txt";
+
+    auto packets = MakePackets();
+
+    {
+        gfxrecon::decode::VulkanAsciiConsumer consumer;
+        REQUIRE(consumer.Initialize(serial_filename));
+
+        gfxrecon::decode::VulkanDecoder decoder;
+        decoder.AddConsumer(&consumer);
+        DecodePackets(&decoder, packets);
+    }
+
+    auto serial_output = ReadFile(serial_filename);
+    REQUIRE(!serial_output.empty());
+
+    for (uint32_t thread_count : { 2, 4 })
+    {
+        {
+            gfxrecon::decode::VulkanAsciiConsumer consumer;
+            REQUIRE(consumer.Initialize(parallel_filename));
+
+            gfxrecon::decode::VulkanParallelAsciiDecoder decoder(&consumer, thread_count);
+            DecodePackets(&decoder, packets);
+            decoder.Finish();
+        }
+
+        REQUIRE(ReadFile(parallel_filename) == serial_output);
+    }
+
+    std::remove(serial_filename.c_str());
+    std::remove(parallel_filename.c_str());
+}
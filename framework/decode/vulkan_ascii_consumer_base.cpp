@@ -48,7 +48,8 @@ bool VulkanAsciiConsumerBase::Initialize(const std::string& filename)
         {
             success    = true;
             m_filename = filename;
-            fprintf(m_file, "{");
+            m_outputBuffer.reserve(2 * kOutputBufferFlushSize);
+            m_outputBuffer.push_back('{');
         }
     }
 
@@ -59,8 +60,51 @@ void VulkanAsciiConsumerBase::Destroy()
 {
     if (m_file != nullptr)
     {
-        fprintf(m_file, "\n}\n");
+        m_outputBuffer.append("\n}\n");
+        FlushOutputBuffer();
         util::platform::FileClose(m_file);
+        m_file = nullptr;
+    }
+}
+
+void VulkanAsciiConsumerBase::WriteBatch(const VulkanAsciiBatch& batch)
+{
+    size_t begin = 0;
+    for (const auto& apiCall : batch.apiCalls)
+    {
+        WriteApiCallName(apiCall.functionName, apiCall.toStringFlags);
+        m_outputBuffer.append(batch.output, begin, apiCall.end - begin);
+        begin = apiCall.end;
+
+        if (m_outputBuffer.size() >= kOutputBufferFlushSize)
+        {
+            FlushOutputBuffer();
+        }
+    }
+}
+
+void VulkanAsciiConsumerBase::WriteApiCallName(const char* functionName, util::ToStringFlags toStringFlags)
+{
+    if (m_apiCallCount)
+    {
+        m_outputBuffer.push_back(',');
+    }
+    m_outputBuffer.append("\n\"[");
+    util::ToString(m_outputBuffer, m_apiCallCount++);
+    m_outputBuffer.push_back(']');
+    m_outputBuffer.append(functionName);
+    m_outputBuffer.append("\":");
+    util::AppendWhitespace(m_outputBuffer, toStringFlags);
+}
+
+void VulkanAsciiConsumerBase::FlushOutputBuffer()
+{
+    if (!m_outputBuffer.empty())
+    {
+        util::platform::FileWrite(m_outputBuffer.data(), sizeof(char), m_outputBuffer.size(), m_file);
+
+        // Clearing the string keeps its capacity, so the buffer is only allocated once.
+        m_outputBuffer.clear();
     }
 }
 
@@ -82,14 +126,18 @@ void VulkanAsciiConsumerBase::Process_vkAllocateCommandBuffers(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAllocateCommandBuffers", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAllocateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocateInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAllocateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocateInfo, toStringFlags, tabCount, tabSize);
             auto pDecodedAllocateInfo = pAllocateInfo ? pAllocateInfo->GetPointer() : nullptr;
             auto commandBufferCount = pDecodedAllocateInfo ? pDecodedAllocateInfo->commandBufferCount : 0;
-            FieldToString(strStrm, false, "[out]pCommandBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, false, "[out]pCommandBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -106,14 +154,18 @@ void VulkanAsciiConsumerBase::Process_vkAllocateDescriptorSets(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAllocateDescriptorSets", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAllocateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocateInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAllocateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocateInfo, toStringFlags, tabCount, tabSize);
             auto pDecodedAllocateInfo = pAllocateInfo ? pAllocateInfo->GetPointer() : nullptr;
             auto descriptorSetCount = pDecodedAllocateInfo ? pDecodedAllocateInfo->descriptorSetCount : 0;
-            FieldToString(strStrm, false, "[out]pDescriptorSets", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, false, "[out]pDescriptorSets", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -132,26 +184,30 @@ void VulkanAsciiConsumerBase::Process_vkCmdBuildAccelerationStructuresIndirectKH
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBuildAccelerationStructuresIndirectKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "infoCount", toStringFlags, tabCount, tabSize, ToString(infoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(infoCount, pInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pIndirectDeviceAddresses", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(infoCount, pIndirectDeviceAddresses, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pIndirectStrides", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(infoCount, pIndirectStrides, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "infoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, infoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, infoCount, pInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pIndirectDeviceAddresses", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, infoCount, pIndirectDeviceAddresses, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pIndirectStrides", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, infoCount, pIndirectStrides, toStringFlags, tabCount, tabSize);
             auto pDecodedInfos = pInfos ? pInfos->GetPointer() : nullptr;
             auto ppDecodedMaxPrimitiveCounts = ppMaxPrimitiveCounts ? ppMaxPrimitiveCounts->GetPointer() : nullptr;
-            FieldToString(strStrm, false, "ppMaxPrimitiveCounts", toStringFlags, tabCount, tabSize,
-                ArrayToString(infoCount, pInfos, toStringFlags, tabCount++, tabSize,
-                    [&]()
-                    {
-                        return infoCount && pDecodedInfos && ppDecodedMaxPrimitiveCounts;
-                    },
-                    [&](uint32_t info_i)
-                    {
-                        return ArrayToString(pDecodedInfos[info_i].geometryCount, ppDecodedMaxPrimitiveCounts[info_i], toStringFlags, tabCount--, tabSize);
-                    }
-                )
+            FieldToString(strBuf, false, "ppMaxPrimitiveCounts", toStringFlags, tabCount, tabSize);
+            ArrayToString(strBuf, infoCount, pInfos, toStringFlags, tabCount++, tabSize,
+                [&]()
+                {
+                    return infoCount && pDecodedInfos && ppDecodedMaxPrimitiveCounts;
+                },
+                [&](std::string& elementBuf, uint32_t info_i)
+                {
+                    ArrayToString(elementBuf, pDecodedInfos[info_i].geometryCount, ppDecodedMaxPrimitiveCounts[info_i], toStringFlags, tabCount--, tabSize);
+                }
             );
         }
     );
@@ -169,24 +225,26 @@ void VulkanAsciiConsumerBase::Process_vkCmdBuildAccelerationStructuresKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBuildAccelerationStructuresKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "infoCount", toStringFlags, tabCount, tabSize, ToString(infoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(infoCount, pInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "infoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, infoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, infoCount, pInfos, toStringFlags, tabCount, tabSize);
             auto pDecodedInfos = pInfos ? pInfos->GetPointer() : nullptr;
             auto ppDecodedBuildRangeInfos = ppBuildRangeInfos ? ppBuildRangeInfos->GetPointer() : nullptr;
-            FieldToString(strStrm, false, "ppBuildRangeInfos", toStringFlags, tabCount, tabSize,
-                ArrayToString(infoCount, pInfos, toStringFlags, tabCount++, tabSize,
-                    [&]()
-                    {
-                        return infoCount && pDecodedInfos && ppDecodedBuildRangeInfos;
-                    },
-                    [&](uint32_t info_i)
-                    {
-                        return ArrayToString(pDecodedInfos[info_i].geometryCount, ppDecodedBuildRangeInfos[info_i], toStringFlags, tabCount--, tabSize);
-                    }
-                )
+            FieldToString(strBuf, false, "ppBuildRangeInfos", toStringFlags, tabCount, tabSize);
+            ArrayToString(strBuf, infoCount, pInfos, toStringFlags, tabCount++, tabSize,
+                [&]()
+                {
+                    return infoCount && pDecodedInfos && ppDecodedBuildRangeInfos;
+                },
+                [&](std::string& elementBuf, uint32_t info_i)
+                {
+                    ArrayToString(elementBuf, pDecodedInfos[info_i].geometryCount, ppDecodedBuildRangeInfos[info_i], toStringFlags, tabCount--, tabSize);
+                }
             );
         }
     );
@@ -205,16 +263,21 @@ void VulkanAsciiConsumerBase::Process_vkGetAccelerationStructureBuildSizesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetAccelerationStructureBuildSizesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "buildType", toStringFlags, tabCount, tabSize, '"' + ToString(buildType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pBuildInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pBuildInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "buildType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, buildType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBuildInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pBuildInfo, toStringFlags, tabCount, tabSize);
             auto pDecodedBuildInfo = pBuildInfo ? pBuildInfo->GetPointer() : nullptr;
             auto geometryCount = pDecodedBuildInfo ? pDecodedBuildInfo->geometryCount : 0;
             auto pDecodedMaxPrimitiveCounts = pMaxPrimitiveCounts ? pMaxPrimitiveCounts->GetPointer() : nullptr;
-            FieldToString(strStrm, false, "pMaxPrimitiveCounts", toStringFlags, tabCount, tabSize, ArrayToString(geometryCount, pDecodedMaxPrimitiveCounts, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSizeInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSizeInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, false, "pMaxPrimitiveCounts", toStringFlags, tabCount, tabSize);
+            ArrayToString(strBuf, geometryCount, pDecodedMaxPrimitiveCounts, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSizeInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSizeInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -232,12 +295,16 @@ void VulkanAsciiConsumerBase::Process_vkCmdPushDescriptorSetWithTemplateKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPushDescriptorSetWithTemplateKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorUpdateTemplate));
-            FieldToString(strStrm, false, "layout", toStringFlags, tabCount, tabSize, HandleIdToString(layout));
-            FieldToString(strStrm, false, "pData", toStringFlags, tabCount, tabSize, DescriptorUpdateTemplateDecoderToString(pData));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorUpdateTemplate);
+            FieldToString(strBuf, false, "layout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, layout);
+            FieldToString(strBuf, false, "pData", toStringFlags, tabCount, tabSize);
+            DescriptorUpdateTemplateDecoderToString(strBuf, pData);
         }
     );
 }
@@ -254,12 +321,16 @@ void VulkanAsciiConsumerBase::Process_vkUpdateDescriptorSetWithTemplate(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkUpdateDescriptorSetWithTemplate", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorSet", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorSet));
-            FieldToString(strStrm, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorUpdateTemplate));
-            FieldToString(strStrm, false, "pData", toStringFlags, tabCount, tabSize, DescriptorUpdateTemplateDecoderToString(pData));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorSet", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorSet);
+            FieldToString(strBuf, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorUpdateTemplate);
+            FieldToString(strBuf, false, "pData", toStringFlags, tabCount, tabSize);
+            DescriptorUpdateTemplateDecoderToString(strBuf, pData);
         }
     );
 }
@@ -276,12 +347,16 @@ void VulkanAsciiConsumerBase::Process_vkUpdateDescriptorSetWithTemplateKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkUpdateDescriptorSetWithTemplateKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorSet", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorSet));
-            FieldToString(strStrm, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorUpdateTemplate));
-            FieldToString(strStrm, false, "pData", toStringFlags, tabCount, tabSize, DescriptorUpdateTemplateDecoderToString(pData));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorSet", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorSet);
+            FieldToString(strBuf, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorUpdateTemplate);
+            FieldToString(strBuf, false, "pData", toStringFlags, tabCount, tabSize);
+            DescriptorUpdateTemplateDecoderToString(strBuf, pData);
         }
     );
 }
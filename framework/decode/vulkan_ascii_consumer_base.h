@@ -33,10 +33,33 @@
 
 #include <cstdio>
 #include <string>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+// Text for a batch of API calls that was converted separately from the output file, such as on a worker thread.  The
+// API call objects are stored back to back in output, without the numbered API call names that precede them in the
+// file, which are added when the batch is written.
+struct VulkanAsciiBatch
+{
+    struct ApiCall
+    {
+        const char*         functionName;
+        util::ToStringFlags toStringFlags;
+        size_t              end; // Offset in output of the end of the API call's object.
+    };
+
+    std::vector<ApiCall> apiCalls;
+    std::string          output;
+
+    void Clear()
+    {
+        apiCalls.clear();
+        output.clear();
+    }
+};
+
 class VulkanAsciiConsumerBase : public VulkanConsumer
 {
   public:
@@ -52,6 +75,13 @@ class VulkanAsciiConsumerBase : public VulkanConsumer
 
     const std::string& GetFilename() const { return m_filename; }
 
+    // When a batch is set, API calls are appended to the batch instead of being written to the file.  Set the batch to
+    // nullptr to resume writing to the file.
+    void SetBatch(VulkanAsciiBatch* batch) { m_batch = batch; }
+
+    // Writes the API calls from a batch to the file, numbered after the API calls that were already written.
+    void WriteBatch(const VulkanAsciiBatch& batch);
+
     virtual void
     Process_vkAllocateCommandBuffers(VkResult                                                   returnValue,
                                      format::HandleId                                           device,
@@ -103,23 +133,42 @@ class VulkanAsciiConsumerBase : public VulkanConsumer
 
   protected:
     template <typename ToStringFunctionType>
-    inline void WriteApiCallToFile(const std::string&   functionName,
+    inline void WriteApiCallToFile(const char*          functionName,
                                    util::ToStringFlags  toStringFlags,
                                    uint32_t&            tabCount,
                                    uint32_t             tabSize,
                                    ToStringFunctionType toStringFunction)
     {
         using namespace util;
-        fprintf(m_file, "%s\n", (m_apiCallCount ? "," : ""));
-        fprintf(m_file, "\"[%s]%s\":", std::to_string(m_apiCallCount++).c_str(), functionName.c_str());
-        fprintf(m_file, "%s", GetWhitespaceString(toStringFlags).c_str());
-        fprintf(m_file, "%s", ObjectToString(toStringFlags, tabCount, tabSize, toStringFunction).c_str());
+        if (m_batch != nullptr)
+        {
+            ObjectToString(m_batch->output, toStringFlags, tabCount, tabSize, toStringFunction);
+            m_batch->apiCalls.push_back({ functionName, toStringFlags, m_batch->output.size() });
+            return;
+        }
+
+        WriteApiCallName(functionName, toStringFlags);
+        ObjectToString(m_outputBuffer, toStringFlags, tabCount, tabSize, toStringFunction);
+
+        if (m_outputBuffer.size() >= kOutputBufferFlushSize)
+        {
+            FlushOutputBuffer();
+        }
     }
 
   private:
-    FILE*       m_file;
-    std::string m_filename;
-    uint64_t    m_apiCallCount{ 0 };
+    // API calls are written to a reusable buffer, which is written to the file in chunks of at least this size.
+    static const size_t kOutputBufferFlushSize = 64 * 1024;
+
+    void WriteApiCallName(const char* functionName, util::ToStringFlags toStringFlags);
+
+    void FlushOutputBuffer();
+
+    FILE*             m_file;
+    std::string       m_filename;
+    uint64_t          m_apiCallCount{ 0 };
+    std::string       m_outputBuffer;
+    VulkanAsciiBatch* m_batch{ nullptr };
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -27,9 +27,34 @@
 #include "decode/pointer_decoder.h"
 #include "decode/value_decoder.h"
 
+#if defined(GFXRECON_DECODE_DIRECT_REPLAY_CONSUMER)
+#include "generated/generated_vulkan_replay_consumer.h"
+
+#include <typeinfo>
+#endif
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+void VulkanDecoderBase::UpdateSingleConsumer()
+{
+    single_consumer_ = nullptr;
+
+    if (consumers_.size() == 1)
+    {
+#if defined(GFXRECON_DECODE_DIRECT_REPLAY_CONSUMER)
+        // The generated decode functions bind single consumer calls directly to the VulkanReplayConsumer methods,
+        // which is only valid for consumers that do not override them.  Other consumers use the virtual calls.
+        if (typeid(*consumers_[0]) != typeid(VulkanReplayConsumer))
+        {
+            return;
+        }
+#endif
+
+        single_consumer_ = consumers_[0];
+    }
+}
+
 void VulkanDecoderBase::DispatchStateBeginMarker(uint64_t frame_number)
 {
     for (auto consumer : consumers_)
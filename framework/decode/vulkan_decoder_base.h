@@ -46,11 +46,16 @@ class VulkanDecoderBase : public ApiDecoder
 
     virtual ~VulkanDecoderBase() override {}
 
-    void AddConsumer(VulkanConsumer* consumer) { consumers_.push_back(consumer); }
+    void AddConsumer(VulkanConsumer* consumer)
+    {
+        consumers_.push_back(consumer);
+        UpdateSingleConsumer();
+    }
 
     void RemoveConsumer(VulkanConsumer* consumer)
     {
         consumers_.erase(std::remove(consumers_.begin(), consumers_.end(), consumer));
+        UpdateSingleConsumer();
     }
 
     virtual bool SupportsApiCall(format::ApiCallId call_id) override
@@ -157,6 +162,15 @@ class VulkanDecoderBase : public ApiDecoder
   protected:
     const std::vector<VulkanConsumer*>& GetConsumers() const { return consumers_; }
 
+    // Returns the consumer when the decoder has exactly one consumer, or nullptr when API calls must be dispatched to
+    // every consumer in the list returned by GetConsumers().  When the decoder is built with
+    // GFXRECON_DECODE_DIRECT_REPLAY_CONSUMER defined, the single consumer is only returned when it is a
+    // VulkanReplayConsumer, which the generated decode functions call without virtual dispatch.
+    VulkanConsumer* GetSingleConsumer() const { return single_consumer_; }
+
+  private:
+    void UpdateSingleConsumer();
+
   private:
     size_t Decode_vkUpdateDescriptorSetWithTemplate(const uint8_t* parameter_buffer, size_t buffer_size);
 
@@ -166,6 +180,7 @@ class VulkanDecoderBase : public ApiDecoder
 
   private:
     std::vector<VulkanConsumer*> consumers_;
+    VulkanConsumer*              single_consumer_{ nullptr };
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -0,0 +1,171 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "decode/vulkan_handle_id_consumer_base.h"
+
+#include "generated/generated_vulkan_handle_id_consumer.h"
+#include "generated/generated_vulkan_struct_decoders.h"
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+void AddStructHandleIds(VkDescriptorType                     type,
+                        const Decoded_VkDescriptorImageInfo* wrapper,
+                        std::vector<format::HandleId>*       handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        // The handles that are not used by the descriptor type may not be valid, matching the handle mapping for
+        // replay.
+        if ((type == VK_DESCRIPTOR_TYPE_SAMPLER) || (type == VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER))
+        {
+            AddHandleId(wrapper->sampler, handle_ids);
+        }
+
+        if (type != VK_DESCRIPTOR_TYPE_SAMPLER)
+        {
+            AddHandleId(wrapper->imageView, handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkWriteDescriptorSet* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if ((wrapper != nullptr) && (wrapper->decoded_value != nullptr))
+    {
+        const VkWriteDescriptorSet* value = wrapper->decoded_value;
+
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddHandleId(wrapper->dstSet, handle_ids);
+
+        switch (value->descriptorType)
+        {
+            case VK_DESCRIPTOR_TYPE_SAMPLER:
+            case VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER:
+            case VK_DESCRIPTOR_TYPE_SAMPLED_IMAGE:
+            case VK_DESCRIPTOR_TYPE_STORAGE_IMAGE:
+            case VK_DESCRIPTOR_TYPE_INPUT_ATTACHMENT:
+                if ((wrapper->pImageInfo != nullptr) && !wrapper->pImageInfo->IsNull())
+                {
+                    size_t                               len     = wrapper->pImageInfo->GetLength();
+                    const Decoded_VkDescriptorImageInfo* structs = wrapper->pImageInfo->GetMetaStructPointer();
+                    for (size_t i = 0; i < len; ++i)
+                    {
+                        AddStructHandleIds(value->descriptorType, &structs[i], handle_ids);
+                    }
+                }
+                break;
+            case VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER:
+            case VK_DESCRIPTOR_TYPE_STORAGE_BUFFER:
+            case VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER_DYNAMIC:
+            case VK_DESCRIPTOR_TYPE_STORAGE_BUFFER_DYNAMIC:
+                AddStructArrayHandleIds(wrapper->pBufferInfo, handle_ids);
+                break;
+            case VK_DESCRIPTOR_TYPE_UNIFORM_TEXEL_BUFFER:
+            case VK_DESCRIPTOR_TYPE_STORAGE_TEXEL_BUFFER:
+                AddHandleIds(&wrapper->pTexelBufferView, handle_ids);
+                break;
+            default:
+                // Acceleration structure handles are added from the structures in the pNext chain.
+                break;
+        }
+    }
+}
+
+void VulkanHandleIdConsumerBase::Process_vkUpdateDescriptorSetWithTemplate(format::HandleId device,
+                                                                           format::HandleId descriptorSet,
+                                                                           format::HandleId descriptorUpdateTemplate,
+                                                                           DescriptorUpdateTemplateDecoder* pData)
+{
+    AddHandleId(device, &handle_ids_);
+    AddHandleId(descriptorSet, &handle_ids_);
+    AddHandleId(descriptorUpdateTemplate, &handle_ids_);
+    AddTemplateHandleIds(pData);
+}
+
+void VulkanHandleIdConsumerBase::Process_vkCmdPushDescriptorSetWithTemplateKHR(
+    format::HandleId                 commandBuffer,
+    format::HandleId                 descriptorUpdateTemplate,
+    format::HandleId                 layout,
+    uint32_t                         set,
+    DescriptorUpdateTemplateDecoder* pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(set);
+
+    AddHandleId(commandBuffer, &handle_ids_);
+    AddHandleId(descriptorUpdateTemplate, &handle_ids_);
+    AddHandleId(layout, &handle_ids_);
+    AddTemplateHandleIds(pData);
+}
+
+void VulkanHandleIdConsumerBase::Process_vkUpdateDescriptorSetWithTemplateKHR(format::HandleId device,
+                                                                              format::HandleId descriptorSet,
+                                                                              format::HandleId descriptorUpdateTemplate,
+                                                                              DescriptorUpdateTemplateDecoder* pData)
+{
+    AddHandleId(device, &handle_ids_);
+    AddHandleId(descriptorSet, &handle_ids_);
+    AddHandleId(descriptorUpdateTemplate, &handle_ids_);
+    AddTemplateHandleIds(pData);
+}
+
+void VulkanHandleIdConsumerBase::AddTemplateHandleIds(const DescriptorUpdateTemplateDecoder* decoder)
+{
+    assert(decoder != nullptr);
+
+    // The descriptor types of the image infos are only known from the descriptor update template create info, so both
+    // image info handles are added.
+    size_t                               image_info_count = decoder->GetImageInfoCount();
+    const Decoded_VkDescriptorImageInfo* image_infos      = decoder->GetImageInfoMetaStructPointer();
+    for (size_t i = 0; i < image_info_count; ++i)
+    {
+        AddStructHandleIds(VK_DESCRIPTOR_TYPE_COMBINED_IMAGE_SAMPLER, &image_infos[i], &handle_ids_);
+    }
+
+    size_t                                buffer_info_count = decoder->GetBufferInfoCount();
+    const Decoded_VkDescriptorBufferInfo* buffer_infos      = decoder->GetBufferInfoMetaStructPointer();
+    for (size_t i = 0; i < buffer_info_count; ++i)
+    {
+        AddStructHandleIds(&buffer_infos[i], &handle_ids_);
+    }
+
+    size_t                  texel_buffer_view_count = decoder->GetTexelBufferViewCount();
+    const format::HandleId* texel_buffer_view_ids   = decoder->GetTexelBufferViewHandleIdsPointer();
+    for (size_t i = 0; i < texel_buffer_view_count; ++i)
+    {
+        AddHandleId(texel_buffer_view_ids[i], &handle_ids_);
+    }
+
+    size_t                  accel_struct_count = decoder->GetAccelerationStructureKHRCount();
+    const format::HandleId* accel_struct_ids   = decoder->GetAccelerationStructureKHRHandleIdsPointer();
+    for (size_t i = 0; i < accel_struct_count; ++i)
+    {
+        AddHandleId(accel_struct_ids[i], &handle_ids_);
+    }
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
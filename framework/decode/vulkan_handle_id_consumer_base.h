@@ -0,0 +1,128 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_VULKAN_HANDLE_ID_CONSUMER_BASE_H
+#define GFXRECON_DECODE_VULKAN_HANDLE_ID_CONSUMER_BASE_H
+
+#include "decode/custom_vulkan_struct_decoders.h"
+#include "decode/descriptor_update_template_decoder.h"
+#include "decode/handle_pointer_decoder.h"
+#include "decode/struct_pointer_decoder.h"
+#include "format/format.h"
+#include "generated/generated_vulkan_consumer.h"
+#include "util/defines.h"
+
+#include "vulkan/vulkan.h"
+
+#include <cassert>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Functions that add the IDs of handle parameters and handle struct members to a list.  Null handle IDs are not added.
+inline void AddHandleId(format::HandleId handle_id, std::vector<format::HandleId>* handle_ids)
+{
+    assert(handle_ids != nullptr);
+
+    if (handle_id != format::kNullHandleId)
+    {
+        handle_ids->push_back(handle_id);
+    }
+}
+
+template <typename T>
+void AddHandleIds(const HandlePointerDecoder<T>* handles, std::vector<format::HandleId>* handle_ids)
+{
+    if ((handles != nullptr) && !handles->IsNull() && handles->HasData())
+    {
+        size_t                  len = handles->GetLength();
+        const format::HandleId* ids = handles->GetPointer();
+
+        for (size_t i = 0; i < len; ++i)
+        {
+            AddHandleId(ids[i], handle_ids);
+        }
+    }
+}
+
+template <typename T>
+void AddStructArrayHandleIds(const StructPointerDecoder<T>* wrappers, std::vector<format::HandleId>* handle_ids)
+{
+    if ((wrappers != nullptr) && !wrappers->IsNull() && wrappers->HasData())
+    {
+        size_t   len     = wrappers->GetLength();
+        const T* structs = wrappers->GetMetaStructPointer();
+
+        for (size_t i = 0; i < len; ++i)
+        {
+            AddStructHandleIds(&structs[i], handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(VkDescriptorType                     type,
+                        const Decoded_VkDescriptorImageInfo* wrapper,
+                        std::vector<format::HandleId>*       handle_ids);
+
+void AddStructHandleIds(const Decoded_VkWriteDescriptorSet* wrapper, std::vector<format::HandleId>* handle_ids);
+
+// Collects the IDs of the handles that are referenced by the parameters of the API calls that it processes, which
+// includes the handle members of struct parameters and of the structs in their pNext chains.  The generated
+// VulkanHandleIdConsumer processes the API calls with handle parameters.
+class VulkanHandleIdConsumerBase : public VulkanConsumer
+{
+  public:
+    const std::vector<format::HandleId>& GetHandleIds() const { return handle_ids_; }
+
+    void ClearHandleIds() { handle_ids_.clear(); }
+
+    virtual void Process_vkUpdateDescriptorSetWithTemplate(format::HandleId                 device,
+                                                           format::HandleId                 descriptorSet,
+                                                           format::HandleId                 descriptorUpdateTemplate,
+                                                           DescriptorUpdateTemplateDecoder* pData) override;
+
+    virtual void Process_vkCmdPushDescriptorSetWithTemplateKHR(format::HandleId commandBuffer,
+                                                               format::HandleId descriptorUpdateTemplate,
+                                                               format::HandleId layout,
+                                                               uint32_t         set,
+                                                               DescriptorUpdateTemplateDecoder* pData) override;
+
+    virtual void Process_vkUpdateDescriptorSetWithTemplateKHR(format::HandleId                 device,
+                                                              format::HandleId                 descriptorSet,
+                                                              format::HandleId                 descriptorUpdateTemplate,
+                                                              DescriptorUpdateTemplateDecoder* pData) override;
+
+  protected:
+    std::vector<format::HandleId>* GetHandleIdList() { return &handle_ids_; }
+
+  private:
+    void AddTemplateHandleIds(const DescriptorUpdateTemplateDecoder* decoder);
+
+  private:
+    std::vector<format::HandleId> handle_ids_;
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_VULKAN_HANDLE_ID_CONSUMER_BASE_H
@@ -34,26 +34,22 @@ class VulkanObjectInfoTable : public VulkanObjectInfoTableBase2
   public:
     void ReplaceSemaphore(VkSemaphore target, VkSemaphore replacement)
     {
-        for (auto& entry : semaphore_map_)
-        {
-            if (entry.second.handle == target)
+        semaphore_map_.Visit([target, replacement](SemaphoreInfo* info) {
+            if (info->handle == target)
             {
-                entry.second.handle = replacement;
-                break;
+                info->handle = replacement;
             }
-        }
+        });
     }
 
     void ReplaceFence(VkFence target, VkFence replacement)
     {
-        for (auto& entry : fence_map_)
-        {
-            if (entry.second.handle == target)
+        fence_map_.Visit([target, replacement](FenceInfo* info) {
+            if (info->handle == target)
             {
-                entry.second.handle = replacement;
-                break;
+                info->handle = replacement;
             }
-        }
+        });
     }
 };
 
@@ -24,6 +24,7 @@
 #ifndef GFXRECON_DECODE_VULKAN_OBJECT_MAPPER_BASE_H
 #define GFXRECON_DECODE_VULKAN_OBJECT_MAPPER_BASE_H
 
+#include "decode/handle_id_map.h"
 #include "decode/vulkan_object_info.h"
 #include "format/format.h"
 #include "util/defines.h"
@@ -32,7 +33,6 @@
 
 #include <cassert>
 #include <functional>
-#include <unordered_map>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
@@ -41,13 +41,13 @@ class VulkanObjectInfoTableBase
 {
   protected:
     template <typename T>
-    void AddObjectInfo(T&& info, std::unordered_map<format::HandleId, T>* map)
+    void AddObjectInfo(T&& info, HandleIdMap<T>* map)
     {
         assert(map != nullptr);
 
         if ((info.capture_id != 0) && (info.handle != VK_NULL_HANDLE))
         {
-            auto result = map->emplace(info.capture_id, std::forward<T>(info));
+            auto result = map->Emplace(info.capture_id, std::forward<T>(info));
 
             if (!result.second)
             {
@@ -59,17 +59,17 @@ class VulkanObjectInfoTableBase
                 // temporary objects created during the trimmed file state setup. IDs may be reused when creating these
                 // temporary objects, creating a case where we have a new handle that is not a duplicate of the existing
                 // map entry. In this case, the map entry needs to be updated with the new object's info.
-                auto iter = result.first;
-                if (iter->second.handle != info.handle)
+                auto existing_info = result.first;
+                if (existing_info->handle != info.handle)
                 {
-                    iter->second = std::forward<T>(info);
+                    *existing_info = std::forward<T>(info);
                 }
             }
         }
     }
 
     template <typename T>
-    const T* GetObjectInfo(format::HandleId id, const std::unordered_map<format::HandleId, T>* map) const
+    const T* GetObjectInfo(format::HandleId id, const HandleIdMap<T>* map) const
     {
         assert(map != nullptr);
 
@@ -77,19 +77,14 @@ class VulkanObjectInfoTableBase
 
         if (id != 0)
         {
-            const auto entry = map->find(id);
-
-            if (entry != map->end())
-            {
-                object_info = &entry->second;
-            }
+            object_info = map->Find(id);
         }
 
         return object_info;
     }
 
     template <typename T>
-    T* GetObjectInfo(format::HandleId id, std::unordered_map<format::HandleId, T>* map)
+    T* GetObjectInfo(format::HandleId id, HandleIdMap<T>* map)
     {
         assert(map != nullptr);
 
@@ -97,12 +92,7 @@ class VulkanObjectInfoTableBase
 
         if (id != 0)
         {
-            auto entry = map->find(id);
-
-            if (entry != map->end())
-            {
-                object_info = &entry->second;
-            }
+            object_info = map->Find(id);
         }
 
         return object_info;
@@ -0,0 +1,225 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "decode/vulkan_parallel_ascii_decoder.h"
+
+#include "decode/decode_allocator.h"
+#include "generated/generated_vulkan_ascii_consumer.h"
+
+#include <algorithm>
+#include <cassert>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+VulkanParallelAsciiDecoder::VulkanParallelAsciiDecoder(VulkanAsciiConsumerBase* output_consumer,
+                                                       uint32_t                 thread_count) :
+    output_consumer_(output_consumer)
+{
+    assert(output_consumer != nullptr);
+
+    if (thread_count == 0)
+    {
+        thread_count = std::max(std::thread::hardware_concurrency(), 1u);
+    }
+
+    // Allow each worker thread to have a batch queued while it is converting another, in addition to the batch that is
+    // being filled.  Any further batches wait for earlier batches to be written, which bounds memory usage.
+    max_batch_count_ = (2 * thread_count) + 1;
+
+    for (uint32_t i = 0; i < thread_count; ++i)
+    {
+        threads_.emplace_back(&VulkanParallelAsciiDecoder::ProcessBatches, this);
+    }
+}
+
+VulkanParallelAsciiDecoder::~VulkanParallelAsciiDecoder()
+{
+    Finish();
+}
+
+void VulkanParallelAsciiDecoder::DecodeFunctionCall(format::ApiCallId  call_id,
+                                                    const ApiCallInfo& call_info,
+                                                    const uint8_t*     parameter_buffer,
+                                                    size_t             buffer_size)
+{
+    if (!current_batch_)
+    {
+        current_batch_ = AcquireBatch();
+    }
+
+    // The parameter buffer is only valid for the duration of this call, so the parameter data is copied to the batch.
+    auto& parameter_data = current_batch_->parameter_data;
+    current_batch_->packets.push_back({ call_id, call_info, parameter_data.size(), buffer_size });
+    parameter_data.insert(parameter_data.end(), parameter_buffer, parameter_buffer + buffer_size);
+
+    if ((current_batch_->packets.size() >= kBatchPacketCount) || (parameter_data.size() >= kBatchDataSize))
+    {
+        SubmitBatch();
+    }
+}
+
+void VulkanParallelAsciiDecoder::Finish()
+{
+    if (threads_.empty())
+    {
+        return;
+    }
+
+    if (current_batch_)
+    {
+        SubmitBatch();
+    }
+
+    {
+        std::unique_lock<std::mutex> lock(mutex_);
+        write_condition_.wait(lock,
+                              [this]() { return (next_write_sequence_number_ == next_sequence_number_) && !writing_; });
+        stop_ = true;
+    }
+
+    work_condition_.notify_all();
+
+    for (auto& thread : threads_)
+    {
+        thread.join();
+    }
+
+    threads_.clear();
+}
+
+std::unique_ptr<VulkanParallelAsciiDecoder::Batch> VulkanParallelAsciiDecoder::AcquireBatch()
+{
+    std::unique_lock<std::mutex> lock(mutex_);
+
+    if (free_batches_.empty() && (batch_count_ < max_batch_count_))
+    {
+        ++batch_count_;
+        return std::make_unique<Batch>();
+    }
+
+    write_condition_.wait(lock, [this]() { return !free_batches_.empty(); });
+
+    auto batch = std::move(free_batches_.back());
+    free_batches_.pop_back();
+    return batch;
+}
+
+void VulkanParallelAsciiDecoder::SubmitBatch()
+{
+    {
+        std::lock_guard<std::mutex> lock(mutex_);
+        current_batch_->sequence_number = next_sequence_number_++;
+        pending_batches_.push_back(std::move(current_batch_));
+    }
+
+    work_condition_.notify_one();
+}
+
+void VulkanParallelAsciiDecoder::CompleteBatch(std::unique_ptr<Batch> batch)
+{
+    std::unique_lock<std::mutex> lock(mutex_);
+
+    completed_batches_.emplace(batch->sequence_number, std::move(batch));
+
+    // Only one thread writes at a time.  If another thread is writing, it will also write this batch when the batch is
+    // next in sequence.
+    if (writing_)
+    {
+        return;
+    }
+
+    writing_ = true;
+
+    auto entry = completed_batches_.find(next_write_sequence_number_);
+    while (entry != completed_batches_.end())
+    {
+        auto next_batch = std::move(entry->second);
+        completed_batches_.erase(entry);
+
+        // The output is written without holding the lock, so that the worker threads can continue to complete batches.
+        lock.unlock();
+
+        output_consumer_->WriteBatch(next_batch->text);
+
+        next_batch->packets.clear();
+        next_batch->parameter_data.clear();
+        next_batch->text.Clear();
+
+        lock.lock();
+
+        free_batches_.push_back(std::move(next_batch));
+        ++next_write_sequence_number_;
+        write_condition_.notify_all();
+
+        entry = completed_batches_.find(next_write_sequence_number_);
+    }
+
+    writing_ = false;
+    write_condition_.notify_all();
+}
+
+void VulkanParallelAsciiDecoder::ProcessBatches()
+{
+    // Each worker thread converts API calls with its own decoder and consumer.
+    VulkanDecoder       decoder;
+    VulkanAsciiConsumer consumer;
+    decoder.AddConsumer(&consumer);
+
+    for (;;)
+    {
+        std::unique_ptr<Batch> batch;
+
+        {
+            std::unique_lock<std::mutex> lock(mutex_);
+            work_condition_.wait(lock, [this]() { return stop_ || !pending_batches_.empty(); });
+
+            if (pending_batches_.empty())
+            {
+                break;
+            }
+
+            batch = std::move(pending_batches_.front());
+            pending_batches_.pop_front();
+        }
+
+        consumer.SetBatch(&batch->text);
+
+        const uint8_t* parameter_data = batch->parameter_data.data();
+        for (const auto& packet : batch->packets)
+        {
+            // The decode allocator is thread local, so each worker thread allocates from its own instance.
+            DecodeAllocator::Begin();
+            decoder.DecodeFunctionCall(packet.call_id, packet.call_info, parameter_data + packet.offset, packet.size);
+            DecodeAllocator::End();
+        }
+
+        consumer.SetBatch(nullptr);
+
+        CompleteBatch(std::move(batch));
+    }
+
+    DecodeAllocator::DestroyInstance();
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,117 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_DECODE_VULKAN_PARALLEL_ASCII_DECODER_H
+#define GFXRECON_DECODE_VULKAN_PARALLEL_ASCII_DECODER_H
+
+#include "decode/api_decoder.h"
+#include "decode/vulkan_ascii_consumer_base.h"
+#include "format/api_call_id.h"
+#include "generated/generated_vulkan_decoder.h"
+#include "util/defines.h"
+
+#include <condition_variable>
+#include <cstdint>
+#include <deque>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+// Decoder that converts Vulkan API calls to text on a pool of worker threads.  The API call packets are copied into
+// batches by the thread that reads the capture file, each batch is decoded and converted to text by a worker thread
+// with its own decoder and consumer, and the converted batches are written to the output consumer in capture order.
+// The output is identical to the output of a VulkanAsciiConsumer that is added to a VulkanDecoder.
+class VulkanParallelAsciiDecoder : public VulkanDecoder
+{
+  public:
+    // The converted API calls are written to output_consumer, which must already be initialized with the output file.
+    // A thread_count of 0 starts one worker thread per hardware thread.
+    VulkanParallelAsciiDecoder(VulkanAsciiConsumerBase* output_consumer, uint32_t thread_count);
+
+    virtual ~VulkanParallelAsciiDecoder() override;
+
+    virtual void DecodeFunctionCall(format::ApiCallId  call_id,
+                                    const ApiCallInfo& call_info,
+                                    const uint8_t*     parameter_buffer,
+                                    size_t             buffer_size) override;
+
+    // Converts the API calls from the last partial batch, waits for all batches to be written to the output consumer,
+    // and stops the worker threads.  Must be called after the capture file has been processed.
+    void Finish();
+
+  private:
+    struct Packet
+    {
+        format::ApiCallId call_id;
+        ApiCallInfo       call_info;
+        size_t            offset;
+        size_t            size;
+    };
+
+    struct Batch
+    {
+        uint64_t             sequence_number{ 0 };
+        std::vector<Packet>  packets;
+        std::vector<uint8_t> parameter_data;
+        VulkanAsciiBatch     text;
+    };
+
+    // A batch is submitted for conversion when it reaches either limit.
+    static const size_t kBatchPacketCount = 4096;
+    static const size_t kBatchDataSize    = 4 * 1024 * 1024;
+
+  private:
+    std::unique_ptr<Batch> AcquireBatch();
+
+    void SubmitBatch();
+
+    void CompleteBatch(std::unique_ptr<Batch> batch);
+
+    void ProcessBatches();
+
+  private:
+    VulkanAsciiConsumerBase*                   output_consumer_;
+    std::vector<std::thread>                   threads_;
+    std::unique_ptr<Batch>                     current_batch_;
+    std::mutex                                 mutex_;
+    std::condition_variable                    work_condition_;
+    std::condition_variable                    write_condition_;
+    std::deque<std::unique_ptr<Batch>>         pending_batches_;
+    std::map<uint64_t, std::unique_ptr<Batch>> completed_batches_;
+    std::vector<std::unique_ptr<Batch>>        free_batches_;
+    size_t                                     batch_count_{ 0 };
+    size_t                                     max_batch_count_{ 0 };
+    uint64_t                                   next_sequence_number_{ 0 };
+    uint64_t                                   next_write_sequence_number_{ 0 };
+    bool                                       writing_{ false };
+    bool                                       stop_{ false };
+};
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_DECODE_VULKAN_PARALLEL_ASCII_DECODER_H
@@ -0,0 +1,261 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_ENCODE_HANDLE_WRAPPER_MAP_H
+#define GFXRECON_ENCODE_HANDLE_WRAPPER_MAP_H
+
+#include "format/format.h"
+#include "util/defines.h"
+
+#include <algorithm>
+#include <cassert>
+#include <cstdint>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(encode)
+
+// Map from handle IDs to handle wrappers, for the state table.  The wrappers are stored in an array that is sorted by
+// handle ID, so that they are visited in the order that they were created, and an open addressing hash table maps
+// handle IDs to array positions.  Handle IDs are assigned from an increasing counter, so new wrappers are almost always
+// appended to the array.  Erased wrappers are marked as removed, and the array is compacted when more than half of its
+// entries have been removed, so that insertion and removal do not allocate memory in the common case.
+template <typename Wrapper>
+class HandleWrapperMap
+{
+  public:
+    // Returns false if the map already contains the ID.
+    bool Insert(format::HandleId id, Wrapper* wrapper)
+    {
+        assert((id != format::kNullHandleId) && (wrapper != nullptr));
+
+        if (FindIndexEntry(id) != nullptr)
+        {
+            return false;
+        }
+
+        size_t position = entries_.size();
+
+        if (entries_.empty() || (id > entries_.back().id))
+        {
+            entries_.push_back({ id, wrapper });
+        }
+        else
+        {
+            auto entry = std::lower_bound(entries_.begin(), entries_.end(), id, IsEntryIdLess);
+            position   = static_cast<size_t>(entry - entries_.begin());
+
+            if (entry->id == id)
+            {
+                // Reuse the removed entry for the ID.
+                entry->wrapper = wrapper;
+            }
+            else
+            {
+                entries_.insert(entry, Entry{ id, wrapper });
+
+                // Update the positions of the entries that were moved, which are near the end of the array.
+                for (size_t i = position + 1; i < entries_.size(); ++i)
+                {
+                    if (entries_[i].wrapper != nullptr)
+                    {
+                        FindIndexEntry(entries_[i].id)->position = i;
+                    }
+                }
+            }
+        }
+
+        InsertIndexEntry(id, position);
+
+        return true;
+    }
+
+    // Returns false if the map does not contain the ID.
+    bool Erase(format::HandleId id)
+    {
+        IndexEntry* index_entry = FindIndexEntry(id);
+
+        if (index_entry == nullptr)
+        {
+            return false;
+        }
+
+        entries_[index_entry->position].wrapper = nullptr;
+        RemoveIndexEntry(index_entry);
+
+        size_t removed_count = entries_.size() - index_count_;
+        if ((removed_count > kMinCompactCount) && (removed_count > index_count_))
+        {
+            Compact();
+        }
+
+        return true;
+    }
+
+    Wrapper* Find(format::HandleId id) const
+    {
+        const IndexEntry* index_entry = FindIndexEntry(id);
+        return (index_entry != nullptr) ? entries_[index_entry->position].wrapper : nullptr;
+    }
+
+    size_t GetSize() const { return index_count_; }
+
+    // Visits the wrappers in order of increasing handle ID.  The visitor must not insert or erase wrappers.
+    template <typename Visitor>
+    void Visit(Visitor visitor) const
+    {
+        for (const auto& entry : entries_)
+        {
+            if (entry.wrapper != nullptr)
+            {
+                visitor(entry.wrapper);
+            }
+        }
+    }
+
+  private:
+    struct Entry
+    {
+        format::HandleId id;
+        Wrapper*         wrapper; // nullptr for an entry that has been removed.
+    };
+
+    struct IndexEntry
+    {
+        format::HandleId id; // kNullHandleId for an empty index entry.
+        size_t           position;
+    };
+
+    static const size_t kMinIndexCapacity = 16;
+    static const size_t kMinCompactCount  = 64;
+
+  private:
+    static bool IsEntryIdLess(const Entry& entry, format::HandleId id) { return entry.id < id; }
+
+    size_t GetHomeIndex(format::HandleId id) const
+    {
+        // Fibonacci hashing spreads the sequential handle IDs across the table.
+        return static_cast<size_t>((id * 0x9e3779b97f4a7c15ull) >> 32) & (index_.size() - 1);
+    }
+
+    const IndexEntry* FindIndexEntry(format::HandleId id) const
+    {
+        if (!index_.empty())
+        {
+            for (size_t i = GetHomeIndex(id);; i = (i + 1) & (index_.size() - 1))
+            {
+                if (index_[i].id == id)
+                {
+                    return &index_[i];
+                }
+                else if (index_[i].id == format::kNullHandleId)
+                {
+                    break;
+                }
+            }
+        }
+
+        return nullptr;
+    }
+
+    IndexEntry* FindIndexEntry(format::HandleId id)
+    {
+        return const_cast<IndexEntry*>(static_cast<const HandleWrapperMap*>(this)->FindIndexEntry(id));
+    }
+
+    void InsertIndexEntry(format::HandleId id, size_t position)
+    {
+        // Keep the load factor at or below one half.
+        if (((index_count_ + 1) * 2) > index_.size())
+        {
+            ResizeIndex(index_.empty() ? kMinIndexCapacity : (index_.size() * 2));
+        }
+
+        size_t i = GetHomeIndex(id);
+        while (index_[i].id != format::kNullHandleId)
+        {
+            i = (i + 1) & (index_.size() - 1);
+        }
+
+        index_[i] = { id, position };
+        ++index_count_;
+    }
+
+    void RemoveIndexEntry(IndexEntry* index_entry)
+    {
+        // Backward shift deletion, which moves the following entries of the probe sequence into the empty entry when
+        // doing so does not move them before their home index.
+        size_t mask  = index_.size() - 1;
+        size_t empty = static_cast<size_t>(index_entry - index_.data());
+
+        for (size_t i = (empty + 1) & mask; index_[i].id != format::kNullHandleId; i = (i + 1) & mask)
+        {
+            size_t home = GetHomeIndex(index_[i].id);
+            if (((i - home) & mask) >= ((i - empty) & mask))
+            {
+                index_[empty] = index_[i];
+                empty         = i;
+            }
+        }
+
+        index_[empty].id = format::kNullHandleId;
+        --index_count_;
+    }
+
+    void ResizeIndex(size_t capacity)
+    {
+        std::vector<IndexEntry> index(capacity, IndexEntry{ format::kNullHandleId, 0 });
+        index_.swap(index);
+        index_count_ = 0;
+
+        for (const auto& index_entry : index)
+        {
+            if (index_entry.id != format::kNullHandleId)
+            {
+                InsertIndexEntry(index_entry.id, index_entry.position);
+            }
+        }
+    }
+
+    void Compact()
+    {
+        entries_.erase(std::remove_if(entries_.begin(),
+                                      entries_.end(),
+                                      [](const Entry& entry) { return entry.wrapper == nullptr; }),
+                       entries_.end());
+
+        for (size_t i = 0; i < entries_.size(); ++i)
+        {
+            FindIndexEntry(entries_[i].id)->position = i;
+        }
+    }
+
+  private:
+    std::vector<Entry>      entries_;
+    std::vector<IndexEntry> index_;
+    size_t                  index_count_{ 0 };
+};
+
+GFXRECON_END_NAMESPACE(encode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_ENCODE_HANDLE_WRAPPER_MAP_H
@@ -195,6 +195,9 @@ class ParameterEncoder
         }
     }
 
+    // Write the data for an array of structs that are encoded with the same layout as the struct.
+    void EncodeStructArrayData(const void* arr, size_t size) { output_stream_->Write(arr, size); }
+
   private:
     uint32_t GetPointerAttributeMask(const void* ptr, bool omit_data, bool omit_addr)
     {
@@ -0,0 +1,60 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "encode/pnext_struct_encode_table.h"
+
+#include <algorithm>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(encode)
+
+PNextStructEncodeTable::PNextStructEncodeTable(const PNextStructEncodeInfo* infos, size_t count) :
+    entries_(infos, infos + count)
+{
+    std::sort(entries_.begin(), entries_.end(), [](const PNextStructEncodeInfo& lhs, const PNextStructEncodeInfo& rhs) {
+        return lhs.sType < rhs.sType;
+    });
+}
+
+const PNextStructEncodeInfo* PNextStructEncodeTable::Find(VkStructureType sType) const
+{
+    auto iter = std::lower_bound(
+        entries_.begin(), entries_.end(), sType, [](const PNextStructEncodeInfo& info, VkStructureType value) {
+            return info.sType < value;
+        });
+
+    if ((iter != entries_.end()) && (iter->sType == sType))
+    {
+        return &(*iter);
+    }
+
+    return nullptr;
+}
+
+bool PNextStructEncodeTable::MarkUnrecognized(VkStructureType sType)
+{
+    std::lock_guard<std::mutex> lock(unrecognized_mutex_);
+    return unrecognized_.insert(static_cast<uint32_t>(sType)).second;
+}
+
+GFXRECON_END_NAMESPACE(encode)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -0,0 +1,80 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#ifndef GFXRECON_ENCODE_PNEXT_STRUCT_ENCODE_TABLE_H
+#define GFXRECON_ENCODE_PNEXT_STRUCT_ENCODE_TABLE_H
+
+#include "encode/parameter_encoder.h"
+#include "util/defines.h"
+
+#include "vulkan/vulkan.h"
+
+#include <cstdint>
+#include <mutex>
+#include <unordered_set>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(encode)
+
+// Maps the VkStructureType of a struct that can be included in a pNext chain to the function that encodes a pointer to
+// the struct. Struct types with a null encode function are skipped when encoding a pNext chain, which is used for the
+// structs that the loader adds to the chain.
+struct PNextStructEncodeInfo
+{
+    VkStructureType sType;
+    void (*encode)(ParameterEncoder* encoder, const void* value);
+};
+
+// Lookup table for the pNext struct encoders. Entries are sorted by VkStructureType for binary search. The table also
+// tracks the unrecognized struct types that have been reported, so that a struct type that is not supported by the
+// capture layer is reported once instead of each time it is encoded.
+class PNextStructEncodeTable
+{
+  public:
+    template <size_t N>
+    explicit PNextStructEncodeTable(const PNextStructEncodeInfo (&infos)[N]) : PNextStructEncodeTable(infos, N)
+    {}
+
+    PNextStructEncodeTable(const PNextStructEncodeInfo* infos, size_t count);
+
+    // Returns the entry for the struct type, or nullptr if the struct type is not in the table.
+    const PNextStructEncodeInfo* Find(VkStructureType sType) const;
+
+    // Records that an unrecognized struct type was omitted from the capture file. Returns true if this is the first
+    // time that the struct type was recorded, indicating that it should be reported.
+    bool MarkUnrecognized(VkStructureType sType);
+
+  private:
+    std::vector<PNextStructEncodeInfo> entries_;
+    std::unordered_set<uint32_t>       unrecognized_;
+    std::mutex                         unrecognized_mutex_;
+};
+
+// Returns the table used by EncodePNextStruct to encode all of the Vulkan structs that can be included in a pNext
+// chain.
+PNextStructEncodeTable& GetPNextStructEncodeTable();
+
+GFXRECON_END_NAMESPACE(encode)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+#endif // GFXRECON_ENCODE_PNEXT_STRUCT_ENCODE_TABLE_H
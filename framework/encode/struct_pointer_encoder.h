@@ -30,6 +30,8 @@
 #include "generated/generated_vulkan_struct_encoders.h"
 #include "util/defines.h"
 
+#include <type_traits>
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(encode)
 
@@ -44,6 +46,23 @@ void EncodeStructPtr(ParameterEncoder* encoder, const T* value, bool omit_data =
     }
 }
 
+template <typename T>
+void EncodeStructArrayElements(ParameterEncoder* encoder, const T* value, size_t len, std::false_type)
+{
+    for (size_t i = 0; i < len; ++i)
+    {
+        EncodeStruct(encoder, value[i]);
+    }
+}
+
+// Overload for structs that are encoded with the same layout as the struct, where the array can be written with a
+// single write.
+template <typename T>
+void EncodeStructArrayElements(ParameterEncoder* encoder, const T* value, size_t len, std::true_type)
+{
+    encoder->EncodeStructArrayData(value, len * sizeof(T));
+}
+
 template <typename T>
 void EncodeStructArray(
     ParameterEncoder* encoder, const T* value, size_t len, bool omit_data = false, bool omit_addr = false)
@@ -52,10 +71,7 @@ void EncodeStructArray(
 
     if ((value != nullptr) && (len > 0) && !omit_data)
     {
-        for (size_t i = 0; i < len; ++i)
-        {
-            EncodeStruct(encoder, value[i]);
-        }
+        EncodeStructArrayElements(encoder, value, len, IsTriviallyEncodable<T>());
     }
 }
 
@@ -74,10 +90,7 @@ void EncodeStructArray2D(ParameterEncoder* encoder,
         for (size_t i = 0; i < m; ++i)
         {
             encoder->EncodeStructArrayPreamble(value[i], n, omit_data, omit_addr);
-            for (size_t j = 0; j < n; ++j)
-            {
-                EncodeStruct(encoder, value[i][j]);
-            }
+            EncodeStructArrayElements(encoder, value[i], n, IsTriviallyEncodable<T>());
         }
     }
 }
@@ -98,10 +111,7 @@ typename std::enable_if<!std::is_integral<SizeT>::value>::type EncodeStructArray
         {
             const size_t inner_len = size_2d[i];
             encoder->EncodeStructArrayPreamble(value[i], inner_len, omit_data, omit_addr);
-            for (size_t j = 0; j < inner_len; ++j)
-            {
-                EncodeStruct(encoder, value[i][j]);
-            }
+            EncodeStructArrayElements(encoder, value[i], inner_len, IsTriviallyEncodable<T>());
         }
     }
 }
@@ -0,0 +1,511 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// Capture overhead benchmark.  Runs representative API call sequences through the generated API call encoders, with
+// the capture framework loaded on top of a stub driver so that no GPU is required, and reports the time, capture file
+// bytes, and memory allocations per call for each API call.
+//
+// Capture settings are read from the environment, as with the capture layer, so the benchmark can be run with
+// different compression types and memory tracking modes.  The capture file name is set by the benchmark.
+
+#include "encode/test/stub_icd.h"
+
+#include "decode/block_index.h"
+#include "decode/file_processor.h"
+#include "encode/trace_manager.h"
+#include "format/api_call_id.h"
+#include "format/format.h"
+#include "format/format_util.h"
+#include "generated/generated_vulkan_api_call_encoders.h"
+#include "generated/generated_vulkan_decoder.h"
+#include "util/argument_parser.h"
+#include "util/logging.h"
+
+#include "vulkan/vulkan.h"
+
+#include <atomic>
+#include <chrono>
+#include <cinttypes>
+#include <cstdint>
+#include <cstdlib>
+#include <cstring>
+#include <new>
+#include <string>
+#include <vector>
+
+// Allocations made through operator new, which include the allocations made by the capture framework.
+static std::atomic<uint64_t> allocation_count{ 0 };
+
+void* operator new(size_t size)
+{
+    allocation_count.fetch_add(1, std::memory_order_relaxed);
+
+    void* memory = malloc((size > 0) ? size : 1);
+    if (memory == nullptr)
+    {
+        throw std::bad_alloc();
+    }
+
+    return memory;
+}
+
+void* operator new[](size_t size)
+{
+    return operator new(size);
+}
+
+void operator delete(void* memory) noexcept
+{
+    free(memory);
+}
+
+void operator delete[](void* memory) noexcept
+{
+    free(memory);
+}
+
+const char kHelpShortOption[]     = "-h";
+const char kHelpLongOption[]      = "--help";
+const char kIterationsArgument[]  = "--iterations";
+const char kCaptureFileArgument[] = "--capture-file";
+
+const char kOptions[]   = "-h|--help";
+const char kArguments[] = "--iterations,--capture-file";
+
+const char     kDefaultCaptureFile[] = "gfxrecon_capture_benchmark" GFXRECON_FILE_EXTENSION;
+const uint32_t kDefaultIterations    = 100000;
+
+const char kCaptureFileEnvVar[]          = "GFXRECON_CAPTURE_FILE";
+const char kCaptureFileTimestampEnvVar[] = "GFXRECON_CAPTURE_FILE_TIMESTAMP";
+
+// Host visible memory that is mapped for the duration of the vkQueueSubmit benchmark, with one page sized region
+// written between submits.
+const VkDeviceSize kMappedMemorySize = 1024 * 1024;
+const size_t       kMappedWriteSize  = 4096;
+
+const uint32_t kDescriptorSetCount = 2;
+
+struct CallStatistics
+{
+    gfxrecon::format::ApiCallId call_id{ gfxrecon::format::ApiCallId::ApiCall_Unknown };
+    uint64_t                    call_count{ 0 };
+    int64_t                     elapsed{ 0 };
+    uint64_t                    allocation_count{ 0 };
+    uint64_t                    byte_count{ 0 };
+};
+
+static void PrintUsage(const char* exe_name)
+{
+    std::string app_name     = exe_name;
+    size_t      dir_location = app_name.find_last_of("/\\");
+    if (dir_location >= 0)
+    {
+        app_name.replace(0, dir_location + 1, "");
+    }
+    GFXRECON_WRITE_CONSOLE("\n%s - Measure the capture overhead of the generated API call encoders.\n",
+                           app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("Usage:");
+    GFXRECON_WRITE_CONSOLE("  %s [-h | --help] [--iterations <N>] [--capture-file <file>]\n", app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("Optional arguments:");
+    GFXRECON_WRITE_CONSOLE("  -h\t\t\tPrint usage information and exit (same as --help).");
+    GFXRECON_WRITE_CONSOLE("  --iterations <N>\tNumber of calls to make for each benchmarked API call.");
+    GFXRECON_WRITE_CONSOLE("          \t\tDefault is %u.", kDefaultIterations);
+    GFXRECON_WRITE_CONSOLE("  --capture-file <file>\tName of the capture file to write.  Default is");
+    GFXRECON_WRITE_CONSOLE("          \t\t%s.", kDefaultCaptureFile);
+    GFXRECON_WRITE_CONSOLE("\nOther capture settings, such as %s, are read from the environment.",
+                           "GFXRECON_CAPTURE_COMPRESSION_TYPE and GFXRECON_MEMORY_TRACKING_MODE");
+}
+
+static void SetEnv(const char* name, const char* value)
+{
+#if defined(WIN32)
+    _putenv_s(name, value);
+#else
+    setenv(name, value, 1);
+#endif
+}
+
+// Replacements for the capture layer's vkCreateInstance and vkCreateDevice implementations, which call the stub driver
+// directly instead of the next layer in the loader's chain.
+static VKAPI_ATTR VkResult VKAPI_CALL dispatch_CreateInstance(const VkInstanceCreateInfo*  pCreateInfo,
+                                                              const VkAllocationCallbacks* pAllocator,
+                                                              VkInstance*                  pInstance)
+{
+    VkResult result = gfxrecon::stub_icd::CreateInstance(pCreateInfo, pAllocator, pInstance);
+
+    if (result == VK_SUCCESS)
+    {
+        gfxrecon::encode::TraceManager::Get()->InitInstance(pInstance, gfxrecon::stub_icd::GetInstanceProcAddr);
+    }
+
+    return result;
+}
+
+static VKAPI_ATTR VkResult VKAPI_CALL dispatch_CreateDevice(VkPhysicalDevice             physicalDevice,
+                                                            const VkDeviceCreateInfo*    pCreateInfo,
+                                                            const VkAllocationCallbacks* pAllocator,
+                                                            VkDevice*                    pDevice)
+{
+    VkResult result = gfxrecon::stub_icd::CreateDevice(physicalDevice, pCreateInfo, pAllocator, pDevice);
+
+    if (result == VK_SUCCESS)
+    {
+        gfxrecon::encode::TraceManager::Get()->InitDevice(pDevice, gfxrecon::stub_icd::GetDeviceProcAddr);
+    }
+
+    return result;
+}
+
+// Makes the specified number of calls, recording the elapsed time and allocation count.
+template <typename Call>
+static CallStatistics MeasureCalls(gfxrecon::format::ApiCallId call_id, uint32_t iterations, Call call)
+{
+    CallStatistics statistics;
+    statistics.call_id    = call_id;
+    statistics.call_count = iterations;
+
+    uint64_t start_allocation_count = allocation_count.load();
+    auto     start                  = std::chrono::high_resolution_clock::now();
+
+    for (uint32_t i = 0; i < iterations; ++i)
+    {
+        call(i);
+    }
+
+    auto end = std::chrono::high_resolution_clock::now();
+
+    statistics.allocation_count = allocation_count.load() - start_allocation_count;
+    statistics.elapsed          = std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+
+    return statistics;
+}
+
+static bool RunCapture(uint32_t iterations, std::vector<CallStatistics>* statistics)
+{
+    using namespace gfxrecon;
+
+    VkApplicationInfo app_info = { VK_STRUCTURE_TYPE_APPLICATION_INFO };
+    app_info.pApplicationName  = "gfxrecon-capture-benchmark";
+    app_info.apiVersion        = VK_API_VERSION_1_1;
+
+    VkInstanceCreateInfo instance_info = { VK_STRUCTURE_TYPE_INSTANCE_CREATE_INFO };
+    instance_info.pApplicationInfo     = &app_info;
+
+    VkInstance instance = VK_NULL_HANDLE;
+    if (encode::CreateInstance(&instance_info, nullptr, &instance) != VK_SUCCESS)
+    {
+        GFXRECON_WRITE_CONSOLE("Failed to initialize the capture framework");
+        return false;
+    }
+
+    uint32_t         physical_device_count = 1;
+    VkPhysicalDevice physical_device       = VK_NULL_HANDLE;
+    encode::EnumeratePhysicalDevices(instance, &physical_device_count, &physical_device);
+
+    const float             queue_priority = 1.0f;
+    VkDeviceQueueCreateInfo queue_info     = { VK_STRUCTURE_TYPE_DEVICE_QUEUE_CREATE_INFO };
+    queue_info.queueFamilyIndex            = 0;
+    queue_info.queueCount                  = 1;
+    queue_info.pQueuePriorities            = &queue_priority;
+
+    VkDeviceCreateInfo device_info   = { VK_STRUCTURE_TYPE_DEVICE_CREATE_INFO };
+    device_info.queueCreateInfoCount = 1;
+    device_info.pQueueCreateInfos    = &queue_info;
+
+    VkDevice device = VK_NULL_HANDLE;
+    VkQueue  queue  = VK_NULL_HANDLE;
+    encode::CreateDevice(physical_device, &device_info, nullptr, &device);
+    encode::GetDeviceQueue(device, 0, 0, &queue);
+
+    VkCommandPoolCreateInfo command_pool_info = { VK_STRUCTURE_TYPE_COMMAND_POOL_CREATE_INFO };
+    command_pool_info.queueFamilyIndex        = 0;
+
+    VkCommandPool command_pool = VK_NULL_HANDLE;
+    encode::CreateCommandPool(device, &command_pool_info, nullptr, &command_pool);
+
+    VkCommandBufferAllocateInfo command_buffer_info = { VK_STRUCTURE_TYPE_COMMAND_BUFFER_ALLOCATE_INFO };
+    command_buffer_info.commandPool                 = command_pool;
+    command_buffer_info.level                       = VK_COMMAND_BUFFER_LEVEL_PRIMARY;
+    command_buffer_info.commandBufferCount          = 1;
+
+    VkCommandBuffer command_buffer = VK_NULL_HANDLE;
+    encode::AllocateCommandBuffers(device, &command_buffer_info, &command_buffer);
+
+    VkBufferCreateInfo buffer_info = { VK_STRUCTURE_TYPE_BUFFER_CREATE_INFO };
+    buffer_info.size               = kMappedMemorySize;
+    buffer_info.usage              = VK_BUFFER_USAGE_UNIFORM_BUFFER_BIT | VK_BUFFER_USAGE_STORAGE_BUFFER_BIT;
+    buffer_info.sharingMode        = VK_SHARING_MODE_EXCLUSIVE;
+
+    VkBuffer uniform_buffer = VK_NULL_HANDLE;
+    VkBuffer storage_buffer = VK_NULL_HANDLE;
+    encode::CreateBuffer(device, &buffer_info, nullptr, &uniform_buffer);
+    encode::CreateBuffer(device, &buffer_info, nullptr, &storage_buffer);
+
+    VkMemoryAllocateInfo memory_info = { VK_STRUCTURE_TYPE_MEMORY_ALLOCATE_INFO };
+    memory_info.allocationSize       = kMappedMemorySize;
+    memory_info.memoryTypeIndex      = 0;
+
+    VkDeviceMemory memory = VK_NULL_HANDLE;
+    encode::AllocateMemory(device, &memory_info, nullptr, &memory);
+
+    VkDescriptorSetLayoutBinding layout_bindings[2] = {};
+    layout_bindings[0].binding                      = 0;
+    layout_bindings[0].descriptorType               = VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER;
+    layout_bindings[0].descriptorCount              = 1;
+    layout_bindings[0].stageFlags                   = VK_SHADER_STAGE_ALL_GRAPHICS;
+    layout_bindings[1].binding                      = 1;
+    layout_bindings[1].descriptorType               = VK_DESCRIPTOR_TYPE_STORAGE_BUFFER;
+    layout_bindings[1].descriptorCount              = 1;
+    layout_bindings[1].stageFlags                   = VK_SHADER_STAGE_ALL_GRAPHICS;
+
+    VkDescriptorSetLayoutCreateInfo set_layout_info = { VK_STRUCTURE_TYPE_DESCRIPTOR_SET_LAYOUT_CREATE_INFO };
+    set_layout_info.bindingCount                    = 2;
+    set_layout_info.pBindings                       = layout_bindings;
+
+    VkDescriptorSetLayout set_layout = VK_NULL_HANDLE;
+    encode::CreateDescriptorSetLayout(device, &set_layout_info, nullptr, &set_layout);
+
+    VkDescriptorSetLayout set_layouts[kDescriptorSetCount] = { set_layout, set_layout };
+
+    VkPipelineLayoutCreateInfo pipeline_layout_info = { VK_STRUCTURE_TYPE_PIPELINE_LAYOUT_CREATE_INFO };
+    pipeline_layout_info.setLayoutCount             = kDescriptorSetCount;
+    pipeline_layout_info.pSetLayouts                = set_layouts;
+
+    VkPipelineLayout pipeline_layout = VK_NULL_HANDLE;
+    encode::CreatePipelineLayout(device, &pipeline_layout_info, nullptr, &pipeline_layout);
+
+    VkDescriptorPoolSize pool_sizes[2] = { { VK_DESCRIPTOR_TYPE_UNIFORM_BUFFER, kDescriptorSetCount },
+                                           { VK_DESCRIPTOR_TYPE_STORAGE_BUFFER, kDescriptorSetCount } };
+
+    VkDescriptorPoolCreateInfo descriptor_pool_info = { VK_STRUCTURE_TYPE_DESCRIPTOR_POOL_CREATE_INFO };
+    descriptor_pool_info.maxSets                    = kDescriptorSetCount;
+    descriptor_pool_info.poolSizeCount              = 2;
+    descriptor_pool_info.pPoolSizes                 = pool_sizes;
+
+    VkDescriptorPool descriptor_pool = VK_NULL_HANDLE;
+    encode::CreateDescriptorPool(device, &descriptor_pool_info, nullptr, &descriptor_pool);
+
+    VkDescriptorSetAllocateInfo descriptor_set_info = { VK_STRUCTURE_TYPE_DESCRIPTOR_SET_ALLOCATE_INFO };
+    descriptor_set_info.descriptorPool              = descriptor_pool;
+    descriptor_set_info.descriptorSetCount          = kDescriptorSetCount;
+    descriptor_set_info.pSetLayouts                 = set_layouts;
+
+    VkDescriptorSet descriptor_sets[kDescriptorSetCount] = {};
+    encode::AllocateDescriptorSets(device, &descriptor_set_info, descriptor_sets);
+
+    // Update both bindings of one descriptor set per call.
+    VkDescriptorBufferInfo descriptor_buffer_infos[2] = { { uniform_buffer, 0, VK_WHOLE_SIZE },
+                                                          { storage_buffer, 0, VK_WHOLE_SIZE } };
+
+    VkWriteDescriptorSet descriptor_writes[2] = {};
+    for (uint32_t i = 0; i < 2; ++i)
+    {
+        descriptor_writes[i].sType           = VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET;
+        descriptor_writes[i].dstBinding      = layout_bindings[i].binding;
+        descriptor_writes[i].descriptorCount = 1;
+        descriptor_writes[i].descriptorType  = layout_bindings[i].descriptorType;
+        descriptor_writes[i].pBufferInfo     = &descriptor_buffer_infos[i];
+    }
+
+    statistics->push_back(MeasureCalls(format::ApiCallId::ApiCall_vkUpdateDescriptorSets, iterations, [&](uint32_t i) {
+        descriptor_writes[0].dstSet = descriptor_sets[i % kDescriptorSetCount];
+        descriptor_writes[1].dstSet = descriptor_sets[i % kDescriptorSetCount];
+        encode::UpdateDescriptorSets(device, 2, descriptor_writes, 0, nullptr);
+    }));
+
+    VkCommandBufferBeginInfo begin_info = { VK_STRUCTURE_TYPE_COMMAND_BUFFER_BEGIN_INFO };
+    encode::BeginCommandBuffer(command_buffer, &begin_info);
+
+    statistics->push_back(MeasureCalls(format::ApiCallId::ApiCall_vkCmdBindDescriptorSets, iterations, [&](uint32_t) {
+        encode::CmdBindDescriptorSets(command_buffer,
+                                      VK_PIPELINE_BIND_POINT_GRAPHICS,
+                                      pipeline_layout,
+                                      0,
+                                      kDescriptorSetCount,
+                                      descriptor_sets,
+                                      0,
+                                      nullptr);
+    }));
+
+    statistics->push_back(MeasureCalls(format::ApiCallId::ApiCall_vkCmdDraw, iterations, [&](uint32_t i) {
+        encode::CmdDraw(command_buffer, 3, 1, i, 0);
+    }));
+
+    encode::EndCommandBuffer(command_buffer);
+
+    // Submit after writing to mapped memory, so that each submit also writes the modified memory to the capture file.
+    void* mapped_data = nullptr;
+    encode::MapMemory(device, memory, 0, VK_WHOLE_SIZE, 0, &mapped_data);
+
+    VkSubmitInfo submit_info       = { VK_STRUCTURE_TYPE_SUBMIT_INFO };
+    submit_info.commandBufferCount = 1;
+    submit_info.pCommandBuffers    = &command_buffer;
+
+    const size_t mapped_write_count = static_cast<size_t>(kMappedMemorySize) / kMappedWriteSize;
+
+    statistics->push_back(MeasureCalls(format::ApiCallId::ApiCall_vkQueueSubmit, iterations, [&](uint32_t i) {
+        memset(reinterpret_cast<uint8_t*>(mapped_data) + ((i % mapped_write_count) * kMappedWriteSize),
+               static_cast<int>(i),
+               kMappedWriteSize);
+        encode::QueueSubmit(queue, 1, &submit_info, VK_NULL_HANDLE);
+    }));
+
+    encode::UnmapMemory(device, memory);
+
+    encode::DestroyDescriptorPool(device, descriptor_pool, nullptr);
+    encode::DestroyPipelineLayout(device, pipeline_layout, nullptr);
+    encode::DestroyDescriptorSetLayout(device, set_layout, nullptr);
+    encode::FreeMemory(device, memory, nullptr);
+    encode::DestroyBuffer(device, storage_buffer, nullptr);
+    encode::DestroyBuffer(device, uniform_buffer, nullptr);
+    encode::FreeCommandBuffers(device, command_pool, 1, &command_buffer);
+    encode::DestroyCommandPool(device, command_pool, nullptr);
+    encode::DestroyDevice(device, nullptr);
+
+    // Destroying the last instance closes the capture file.
+    encode::DestroyInstance(instance, nullptr);
+
+    return true;
+}
+
+// Adds the size of the capture file blocks written for each API call to the statistics.  Meta-data blocks are counted
+// with the function call block that follows them, as the capture framework writes meta-data, such as the mapped memory
+// updates for vkQueueSubmit, before the function call.
+static bool ReadCaptureFileSizes(const std::string& filename, std::vector<CallStatistics>* statistics)
+{
+    gfxrecon::decode::FileProcessor file_processor;
+    gfxrecon::decode::BlockIndex    block_index;
+
+    if (!file_processor.Initialize(filename) || !file_processor.BuildBlockIndex(&block_index))
+    {
+        return false;
+    }
+
+    uint64_t block_count        = block_index.GetBlockCount();
+    uint64_t pending_byte_count = 0;
+
+    for (uint64_t i = 0; i < block_count; ++i)
+    {
+        const auto& block       = block_index.GetBlock(i);
+        uint64_t    next_offset = block_index.GetCaptureFileSize();
+
+        if ((i + 1) < block_count)
+        {
+            next_offset = block_index.GetBlock(i + 1).offset;
+        }
+
+        uint64_t size = next_offset - block.offset;
+
+        if (gfxrecon::format::RemoveCompressedBlockBit(block.type) != gfxrecon::format::BlockType::kFunctionCallBlock)
+        {
+            pending_byte_count += size;
+            continue;
+        }
+
+        for (auto& entry : *statistics)
+        {
+            if (static_cast<uint32_t>(entry.call_id) == block.id)
+            {
+                entry.byte_count += pending_byte_count + size;
+                break;
+            }
+        }
+
+        pending_byte_count = 0;
+    }
+
+    return true;
+}
+
+int main(int argc, const char** argv)
+{
+    gfxrecon::util::Log::Init();
+
+    gfxrecon::util::ArgumentParser arg_parser(argc, argv, kOptions, kArguments);
+
+    if (arg_parser.IsOptionSet(kHelpShortOption) || arg_parser.IsOptionSet(kHelpLongOption))
+    {
+        PrintUsage(argv[0]);
+        gfxrecon::util::Log::Release();
+        exit(0);
+    }
+    else if (arg_parser.IsInvalid() || (arg_parser.GetPositionalArgumentsCount() != 0))
+    {
+        PrintUsage(argv[0]);
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+
+    uint32_t    iterations   = kDefaultIterations;
+    std::string capture_file = kDefaultCaptureFile;
+
+    const auto& iterations_value = arg_parser.GetArgumentValue(kIterationsArgument);
+    if (!iterations_value.empty())
+    {
+        iterations = static_cast<uint32_t>(std::strtoul(iterations_value.c_str(), nullptr, 10));
+
+        if (iterations == 0)
+        {
+            GFXRECON_WRITE_CONSOLE("Invalid iteration count %s", iterations_value.c_str());
+            gfxrecon::util::Log::Release();
+            exit(-1);
+        }
+    }
+
+    const auto& capture_file_value = arg_parser.GetArgumentValue(kCaptureFileArgument);
+    if (!capture_file_value.empty())
+    {
+        capture_file = capture_file_value;
+    }
+
+    SetEnv(kCaptureFileEnvVar, capture_file.c_str());
+    SetEnv(kCaptureFileTimestampEnvVar, "false");
+
+    gfxrecon::encode::TraceManager::SetLayerFuncs(dispatch_CreateInstance, dispatch_CreateDevice);
+
+    std::vector<CallStatistics> statistics;
+
+    if (!RunCapture(iterations, &statistics) || !ReadCaptureFileSizes(capture_file, &statistics))
+    {
+        GFXRECON_WRITE_CONSOLE("Failed to capture or read capture file %s", capture_file.c_str());
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+
+    GFXRECON_WRITE_CONSOLE("Capture file: %s", capture_file.c_str());
+    GFXRECON_WRITE_CONSOLE("%-28s %12s %12s %12s %12s", "API call", "calls", "ns/call", "bytes/call", "allocs/call");
+
+    for (const auto& entry : statistics)
+    {
+        double call_count = static_cast<double>(entry.call_count);
+
+        GFXRECON_WRITE_CONSOLE("%-28s %12" PRIu64 " %12.1f %12.1f %12.2f",
+                               gfxrecon::decode::VulkanDecoder::GetApiCallName(entry.call_id),
+                               entry.call_count,
+                               entry.elapsed / call_count,
+                               entry.byte_count / call_count,
+                               entry.allocation_count / call_count);
+    }
+
+    gfxrecon::util::Log::Release();
+    return 0;
+}
@@ -0,0 +1,108 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// State table microbenchmarks.  The test cases are hidden, and must be selected explicitly to run:
+//     gfxrecon_encode_test [benchmark]
+
+#include <catch2/catch.hpp>
+
+#include "encode/handle_wrapper_map.h"
+#include "format/format.h"
+
+#include <chrono>
+#include <cstdint>
+#include <map>
+#include <vector>
+
+namespace
+{
+
+// An application that keeps a set of long lived objects, and creates and destroys transient objects every frame.
+const size_t kLongLivedCount         = 16 * 1024;
+const size_t kTransientCountPerFrame = 4 * 1024;
+const size_t kFrameCount             = 1000;
+
+struct BenchmarkWrapper
+{
+    gfxrecon::format::HandleId handle_id{ 0 };
+};
+
+// Creates and destroys the objects, returning the elapsed time in nanoseconds.
+template <typename InsertFn, typename EraseFn>
+int64_t ProcessFrames(InsertFn insert, EraseFn erase)
+{
+    BenchmarkWrapper           wrapper;
+    gfxrecon::format::HandleId next_id = 1;
+
+    auto start = std::chrono::high_resolution_clock::now();
+
+    for (size_t i = 0; i < kLongLivedCount; ++i)
+    {
+        insert(next_id++, &wrapper);
+    }
+
+    for (size_t frame = 0; frame < kFrameCount; ++frame)
+    {
+        gfxrecon::format::HandleId first_id = next_id;
+
+        for (size_t i = 0; i < kTransientCountPerFrame; ++i)
+        {
+            insert(next_id++, &wrapper);
+        }
+
+        for (gfxrecon::format::HandleId id = first_id; id < next_id; ++id)
+        {
+            erase(id);
+        }
+    }
+
+    auto end = std::chrono::high_resolution_clock::now();
+
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+}
+
+} // namespace
+
+TEST_CASE("HandleWrapperMap and std::map create and destroy cost", "[.][benchmark][handle_wrapper_map]")
+{
+    gfxrecon::encode::HandleWrapperMap<BenchmarkWrapper>    handle_wrapper_map;
+    std::map<gfxrecon::format::HandleId, BenchmarkWrapper*> map;
+
+    auto handle_wrapper_map_elapsed = ProcessFrames(
+        [&](gfxrecon::format::HandleId id, BenchmarkWrapper* wrapper) { handle_wrapper_map.Insert(id, wrapper); },
+        [&](gfxrecon::format::HandleId id) { handle_wrapper_map.Erase(id); });
+
+    auto map_elapsed = ProcessFrames(
+        [&](gfxrecon::format::HandleId id, BenchmarkWrapper* wrapper) { map.insert(std::make_pair(id, wrapper)); },
+        [&](gfxrecon::format::HandleId id) { map.erase(id); });
+
+    REQUIRE(handle_wrapper_map.GetSize() == kLongLivedCount);
+    REQUIRE(map.size() == kLongLivedCount);
+
+    const size_t operation_count = kLongLivedCount + (kFrameCount * kTransientCountPerFrame * 2);
+
+    WARN("HandleWrapperMap: " << (handle_wrapper_map_elapsed / 1000000.0) << " ms, "
+                              << (static_cast<double>(handle_wrapper_map_elapsed) / operation_count)
+                              << " ns per operation\n"
+                              << "std::map: " << (map_elapsed / 1000000.0) << " ms, "
+                              << (static_cast<double>(map_elapsed) / operation_count) << " ns per operation");
+}
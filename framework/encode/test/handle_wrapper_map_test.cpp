@@ -0,0 +1,140 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "encode/handle_wrapper_map.h"
+
+#include <algorithm>
+#include <map>
+#include <random>
+#include <vector>
+
+namespace
+{
+
+struct TestWrapper
+{
+    gfxrecon::format::HandleId handle_id{ 0 };
+};
+
+std::vector<gfxrecon::format::HandleId> GetVisitOrder(const gfxrecon::encode::HandleWrapperMap<TestWrapper>& map)
+{
+    std::vector<gfxrecon::format::HandleId> ids;
+    map.Visit([&ids](TestWrapper* wrapper) { ids.push_back(wrapper->handle_id); });
+    return ids;
+}
+
+} // namespace
+
+TEST_CASE("HandleWrapperMap inserts, finds, and erases wrappers", "[encode][handle_wrapper_map]")
+{
+    gfxrecon::encode::HandleWrapperMap<TestWrapper> map;
+    TestWrapper                                     wrappers[6] = { { 1 }, { 2 }, { 3 }, { 4 }, { 5 }, { 6 } };
+
+    REQUIRE(map.Find(1) == nullptr);
+    REQUIRE(!map.Erase(1));
+
+    // Wrappers that are inserted out of order are visited in order of handle ID.
+    REQUIRE(map.Insert(1, &wrappers[0]));
+    REQUIRE(map.Insert(4, &wrappers[3]));
+    REQUIRE(map.Insert(2, &wrappers[1]));
+    REQUIRE(map.Insert(6, &wrappers[5]));
+    REQUIRE(map.Insert(3, &wrappers[2]));
+    REQUIRE(!map.Insert(3, &wrappers[4]));
+    REQUIRE(map.GetSize() == 5);
+    REQUIRE(GetVisitOrder(map) == std::vector<gfxrecon::format::HandleId>{ 1, 2, 3, 4, 6 });
+
+    for (auto id : { 1, 2, 3, 4, 6 })
+    {
+        REQUIRE(map.Find(id) == &wrappers[id - 1]);
+    }
+
+    REQUIRE(map.Find(5) == nullptr);
+
+    REQUIRE(map.Erase(3));
+    REQUIRE(!map.Erase(3));
+    REQUIRE(map.Find(3) == nullptr);
+    REQUIRE(map.Find(4) == &wrappers[3]);
+    REQUIRE(GetVisitOrder(map) == std::vector<gfxrecon::format::HandleId>{ 1, 2, 4, 6 });
+
+    // Reinserting a removed ID, and inserting an ID between the existing IDs.
+    REQUIRE(map.Insert(3, &wrappers[2]));
+    REQUIRE(map.Insert(5, &wrappers[4]));
+    REQUIRE(map.GetSize() == 6);
+    REQUIRE(GetVisitOrder(map) == std::vector<gfxrecon::format::HandleId>{ 1, 2, 3, 4, 5, 6 });
+    REQUIRE(map.Find(6) == &wrappers[5]);
+}
+
+TEST_CASE("HandleWrapperMap matches std::map for random insertions and removals", "[encode][handle_wrapper_map]")
+{
+    gfxrecon::encode::HandleWrapperMap<TestWrapper>    map;
+    std::map<gfxrecon::format::HandleId, TestWrapper*> reference;
+    std::vector<TestWrapper>                           wrappers(4096);
+    std::mt19937                                       random_engine(0);
+
+    for (size_t i = 0; i < wrappers.size(); ++i)
+    {
+        wrappers[i].handle_id = i + 1;
+    }
+
+    // Mostly increasing IDs, with some reordering, and bursts of removals that compact the map.
+    std::uniform_int_distribution<size_t> offset_distribution(0, 7);
+    std::uniform_int_distribution<size_t> id_distribution(0, wrappers.size() - 1);
+    size_t                                next_index = 0;
+
+    for (size_t step = 0; step < 20000; ++step)
+    {
+        if (((step / 1000) % 2) == 0)
+        {
+            size_t index = std::min(next_index + offset_distribution(random_engine), wrappers.size() - 1);
+            next_index   = (next_index + 1) % wrappers.size();
+
+            TestWrapper* wrapper = &wrappers[index];
+            REQUIRE(map.Insert(wrapper->handle_id, wrapper) == reference.emplace(wrapper->handle_id, wrapper).second);
+        }
+        else
+        {
+            auto id = id_distribution(random_engine) + 1;
+            REQUIRE(map.Erase(id) == (reference.erase(id) != 0));
+        }
+
+        if ((step % 997) == 0)
+        {
+            std::vector<gfxrecon::format::HandleId> expected_ids;
+            for (const auto& entry : reference)
+            {
+                expected_ids.push_back(entry.first);
+            }
+
+            REQUIRE(GetVisitOrder(map) == expected_ids);
+        }
+    }
+
+    REQUIRE(map.GetSize() == reference.size());
+
+    for (const auto& wrapper : wrappers)
+    {
+        auto entry = reference.find(wrapper.handle_id);
+        REQUIRE(map.Find(wrapper.handle_id) == ((entry != reference.end()) ? entry->second : nullptr));
+    }
+}
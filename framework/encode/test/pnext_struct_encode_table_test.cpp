@@ -0,0 +1,72 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "encode/pnext_struct_encode_table.h"
+
+namespace
+{
+
+void EncodeFirst(gfxrecon::encode::ParameterEncoder*, const void*) {}
+
+void EncodeSecond(gfxrecon::encode::ParameterEncoder*, const void*) {}
+
+// Unsorted, including a struct type without an encoder.
+const gfxrecon::encode::PNextStructEncodeInfo kInfos[] = {
+    { VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES, EncodeFirst },
+    { VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES, nullptr },
+    { VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD, EncodeSecond }
+};
+
+} // namespace
+
+TEST_CASE("PNextStructEncodeTable finds entries by struct type", "[encode][pnext]")
+{
+    gfxrecon::encode::PNextStructEncodeTable table(kInfos);
+
+    auto first = table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_SUBGROUP_PROPERTIES);
+    REQUIRE(first != nullptr);
+    REQUIRE(first->encode == EncodeFirst);
+
+    auto second = table.Find(VK_STRUCTURE_TYPE_PIPELINE_RASTERIZATION_STATE_RASTERIZATION_ORDER_AMD);
+    REQUIRE(second != nullptr);
+    REQUIRE(second->encode == EncodeSecond);
+
+    auto skipped = table.Find(VK_STRUCTURE_TYPE_PHYSICAL_DEVICE_VULKAN_12_FEATURES);
+    REQUIRE(skipped != nullptr);
+    REQUIRE(skipped->encode == nullptr);
+
+    REQUIRE(table.Find(VK_STRUCTURE_TYPE_APPLICATION_INFO) == nullptr);
+}
+
+TEST_CASE("PNextStructEncodeTable reports each unrecognized struct type once", "[encode][pnext]")
+{
+    gfxrecon::encode::PNextStructEncodeTable table(kInfos);
+
+    REQUIRE(table.MarkUnrecognized(VK_STRUCTURE_TYPE_APPLICATION_INFO));
+    REQUIRE_FALSE(table.MarkUnrecognized(VK_STRUCTURE_TYPE_APPLICATION_INFO));
+
+    // Each table tracks its own unrecognized struct types.
+    gfxrecon::encode::PNextStructEncodeTable other_table(kInfos);
+    REQUIRE(other_table.MarkUnrecognized(VK_STRUCTURE_TYPE_APPLICATION_INFO));
+}
@@ -0,0 +1,87 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "encode/parameter_encoder.h"
+#include "encode/struct_pointer_encoder.h"
+#include "util/memory_output_stream.h"
+
+#include "vulkan/vulkan.h"
+
+#include <cstring>
+#include <type_traits>
+
+namespace
+{
+
+// Encode an array with both the bulk and the member by member struct encoders, which must produce identical data.
+template <typename T, size_t N>
+void CheckStructArrayEncoding(const T (&values)[N], size_t expected_struct_size)
+{
+    gfxrecon::util::MemoryOutputStream bulk_stream;
+    gfxrecon::encode::ParameterEncoder bulk_encoder(&bulk_stream);
+    gfxrecon::encode::EncodeStructArray(&bulk_encoder, values, N);
+
+    gfxrecon::util::MemoryOutputStream member_stream;
+    gfxrecon::encode::ParameterEncoder member_encoder(&member_stream);
+    member_encoder.EncodeStructArrayPreamble(values, N);
+    gfxrecon::encode::EncodeStructArrayElements(&member_encoder, values, N, std::false_type());
+
+    REQUIRE(bulk_stream.GetDataSize() == member_stream.GetDataSize());
+    REQUIRE(std::memcmp(bulk_stream.GetData(), member_stream.GetData(), bulk_stream.GetDataSize()) == 0);
+
+    // The encoded array is preceded by the pointer attributes, address, and array length.
+    const size_t preamble_size =
+        sizeof(uint32_t) + sizeof(gfxrecon::format::AddressEncodeType) + sizeof(gfxrecon::format::SizeTEncodeType);
+    REQUIRE(bulk_stream.GetDataSize() == (preamble_size + (N * expected_struct_size)));
+}
+
+} // namespace
+
+TEST_CASE("Arrays of trivially encodable structs are encoded with a single write", "[encode][struct]")
+{
+    SECTION("Struct with scalar members")
+    {
+        REQUIRE(gfxrecon::encode::IsTriviallyEncodable<VkBufferCopy>::value);
+
+        const VkBufferCopy regions[] = { { 1, 2, 3 }, { 4, 5, 6 }, { 7, 8, 9 } };
+        CheckStructArrayEncoding(regions, 24);
+    }
+
+    SECTION("Struct with nested struct members")
+    {
+        REQUIRE(gfxrecon::encode::IsTriviallyEncodable<VkRect2D>::value);
+
+        const VkRect2D scissors[] = { { { 0, 0 }, { 640, 480 } }, { { -8, 16 }, { 32, 64 } } };
+        CheckStructArrayEncoding(scissors, 16);
+    }
+}
+
+TEST_CASE("Arrays of structs with padding are encoded member by member", "[encode][struct]")
+{
+    // The encoded struct does not include the padding that follows memoryTypeBits.
+    REQUIRE_FALSE(gfxrecon::encode::IsTriviallyEncodable<VkMemoryRequirements>::value);
+
+    const VkMemoryRequirements requirements[] = { { 256, 16, 0x3 }, { 512, 64, 0x5 } };
+    CheckStructArrayEncoding(requirements, 20);
+}
@@ -0,0 +1,419 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "encode/test/stub_icd.h"
+
+#include "format/format.h"
+#include "format/format_util.h"
+
+#include <atomic>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <vector>
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(stub_icd)
+namespace
+{
+
+const char         kDeviceName[]        = "GFXReconstruct Stub Device";
+const VkDeviceSize kMemoryHeapSize      = 1024 * 1024 * 1024;
+const uint32_t     kQueueFamilyCount    = 1;
+const uint32_t     kPhysicalDeviceCount = 1;
+
+// Dispatchable handles point to an object with the loader's dispatch table pointer as its first member.  The capture
+// framework uses that pointer as the dispatch key, and copies it from parent objects to queue and command buffer
+// objects.
+struct DispatchableObject
+{
+    void* loader_data{ nullptr };
+};
+
+struct InstanceObject
+{
+    DispatchableObject instance;
+    DispatchableObject physical_device;
+};
+
+struct DeviceObject
+{
+    DispatchableObject device;
+    DispatchableObject queue;
+};
+
+struct CommandPoolObject
+{
+    std::vector<std::unique_ptr<DispatchableObject>> command_buffers;
+};
+
+struct DeviceMemoryObject
+{
+    std::vector<uint8_t> data;
+};
+
+std::atomic<format::HandleId> next_handle_value{ 0 };
+
+template <typename T>
+T CreateNonDispatchableHandle()
+{
+    return format::FromHandleId<T>(++next_handle_value);
+}
+
+// Non-dispatchable handles for objects with stub state are the addresses of the state objects.
+template <typename T, typename Object>
+T GetNonDispatchableHandle(Object* object)
+{
+    return format::FromHandleId<T>(static_cast<format::HandleId>(reinterpret_cast<uintptr_t>(object)));
+}
+
+template <typename Object, typename T>
+Object* GetNonDispatchableObject(T handle)
+{
+    return reinterpret_cast<Object*>(static_cast<uintptr_t>(format::ToHandleId(handle)));
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyInstance(VkInstance instance, const VkAllocationCallbacks*)
+{
+    delete reinterpret_cast<InstanceObject*>(instance);
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL EnumeratePhysicalDevices(VkInstance        instance,
+                                                        uint32_t*         pPhysicalDeviceCount,
+                                                        VkPhysicalDevice* pPhysicalDevices)
+{
+    if (pPhysicalDevices == nullptr)
+    {
+        *pPhysicalDeviceCount = kPhysicalDeviceCount;
+        return VK_SUCCESS;
+    }
+
+    if (*pPhysicalDeviceCount < kPhysicalDeviceCount)
+    {
+        return VK_INCOMPLETE;
+    }
+
+    auto instance_object  = reinterpret_cast<InstanceObject*>(instance);
+    pPhysicalDevices[0]   = reinterpret_cast<VkPhysicalDevice>(&instance_object->physical_device);
+    *pPhysicalDeviceCount = kPhysicalDeviceCount;
+
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceProperties(VkPhysicalDevice, VkPhysicalDeviceProperties* pProperties)
+{
+    memset(pProperties, 0, sizeof(*pProperties));
+    pProperties->apiVersion    = VK_API_VERSION_1_1;
+    pProperties->driverVersion = 1;
+    pProperties->deviceType    = VK_PHYSICAL_DEVICE_TYPE_OTHER;
+    memcpy(pProperties->deviceName, kDeviceName, sizeof(kDeviceName));
+}
+
+VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceMemoryProperties(VkPhysicalDevice,
+                                                             VkPhysicalDeviceMemoryProperties* pMemoryProperties)
+{
+    memset(pMemoryProperties, 0, sizeof(*pMemoryProperties));
+    pMemoryProperties->memoryTypeCount              = 1;
+    pMemoryProperties->memoryTypes[0].propertyFlags = VK_MEMORY_PROPERTY_DEVICE_LOCAL_BIT |
+                                                      VK_MEMORY_PROPERTY_HOST_VISIBLE_BIT |
+                                                      VK_MEMORY_PROPERTY_HOST_COHERENT_BIT;
+    pMemoryProperties->memoryTypes[0].heapIndex = 0;
+    pMemoryProperties->memoryHeapCount          = 1;
+    pMemoryProperties->memoryHeaps[0].size      = kMemoryHeapSize;
+    pMemoryProperties->memoryHeaps[0].flags     = VK_MEMORY_HEAP_DEVICE_LOCAL_BIT;
+}
+
+VKAPI_ATTR void VKAPI_CALL GetPhysicalDeviceQueueFamilyProperties(VkPhysicalDevice,
+                                                                  uint32_t*                pQueueFamilyPropertyCount,
+                                                                  VkQueueFamilyProperties* pQueueFamilyProperties)
+{
+    if (pQueueFamilyProperties == nullptr)
+    {
+        *pQueueFamilyPropertyCount = kQueueFamilyCount;
+        return;
+    }
+
+    if (*pQueueFamilyPropertyCount >= kQueueFamilyCount)
+    {
+        memset(pQueueFamilyProperties, 0, sizeof(*pQueueFamilyProperties));
+        pQueueFamilyProperties[0].queueFlags = VK_QUEUE_GRAPHICS_BIT | VK_QUEUE_COMPUTE_BIT | VK_QUEUE_TRANSFER_BIT;
+        pQueueFamilyProperties[0].queueCount = 1;
+        *pQueueFamilyPropertyCount           = kQueueFamilyCount;
+    }
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyDevice(VkDevice device, const VkAllocationCallbacks*)
+{
+    delete reinterpret_cast<DeviceObject*>(device);
+}
+
+VKAPI_ATTR void VKAPI_CALL GetDeviceQueue(VkDevice device, uint32_t, uint32_t, VkQueue* pQueue)
+{
+    *pQueue = reinterpret_cast<VkQueue>(&reinterpret_cast<DeviceObject*>(device)->queue);
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL QueueSubmit(VkQueue, uint32_t, const VkSubmitInfo*, VkFence)
+{
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL AllocateMemory(VkDevice,
+                                              const VkMemoryAllocateInfo* pAllocateInfo,
+                                              const VkAllocationCallbacks*,
+                                              VkDeviceMemory* pMemory)
+{
+    auto memory_object = new DeviceMemoryObject;
+    memory_object->data.resize(static_cast<size_t>(pAllocateInfo->allocationSize));
+    *pMemory = GetNonDispatchableHandle<VkDeviceMemory>(memory_object);
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL FreeMemory(VkDevice, VkDeviceMemory memory, const VkAllocationCallbacks*)
+{
+    delete GetNonDispatchableObject<DeviceMemoryObject>(memory);
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL
+MapMemory(VkDevice, VkDeviceMemory memory, VkDeviceSize offset, VkDeviceSize, VkMemoryMapFlags, void** ppData)
+{
+    auto memory_object = GetNonDispatchableObject<DeviceMemoryObject>(memory);
+    *ppData            = memory_object->data.data() + offset;
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL UnmapMemory(VkDevice, VkDeviceMemory) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateBuffer(VkDevice,
+                                            const VkBufferCreateInfo*,
+                                            const VkAllocationCallbacks*,
+                                            VkBuffer* pBuffer)
+{
+    *pBuffer = CreateNonDispatchableHandle<VkBuffer>();
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyBuffer(VkDevice, VkBuffer, const VkAllocationCallbacks*) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateDescriptorSetLayout(VkDevice,
+                                                         const VkDescriptorSetLayoutCreateInfo*,
+                                                         const VkAllocationCallbacks*,
+                                                         VkDescriptorSetLayout* pSetLayout)
+{
+    *pSetLayout = CreateNonDispatchableHandle<VkDescriptorSetLayout>();
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyDescriptorSetLayout(VkDevice, VkDescriptorSetLayout, const VkAllocationCallbacks*) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreatePipelineLayout(VkDevice,
+                                                    const VkPipelineLayoutCreateInfo*,
+                                                    const VkAllocationCallbacks*,
+                                                    VkPipelineLayout* pPipelineLayout)
+{
+    *pPipelineLayout = CreateNonDispatchableHandle<VkPipelineLayout>();
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyPipelineLayout(VkDevice, VkPipelineLayout, const VkAllocationCallbacks*) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateDescriptorPool(VkDevice,
+                                                    const VkDescriptorPoolCreateInfo*,
+                                                    const VkAllocationCallbacks*,
+                                                    VkDescriptorPool* pDescriptorPool)
+{
+    *pDescriptorPool = CreateNonDispatchableHandle<VkDescriptorPool>();
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyDescriptorPool(VkDevice, VkDescriptorPool, const VkAllocationCallbacks*) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL AllocateDescriptorSets(VkDevice,
+                                                      const VkDescriptorSetAllocateInfo* pAllocateInfo,
+                                                      VkDescriptorSet*                   pDescriptorSets)
+{
+    for (uint32_t i = 0; i < pAllocateInfo->descriptorSetCount; ++i)
+    {
+        pDescriptorSets[i] = CreateNonDispatchableHandle<VkDescriptorSet>();
+    }
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL
+UpdateDescriptorSets(VkDevice, uint32_t, const VkWriteDescriptorSet*, uint32_t, const VkCopyDescriptorSet*)
+{}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateCommandPool(VkDevice,
+                                                 const VkCommandPoolCreateInfo*,
+                                                 const VkAllocationCallbacks*,
+                                                 VkCommandPool* pCommandPool)
+{
+    *pCommandPool = GetNonDispatchableHandle<VkCommandPool>(new CommandPoolObject);
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL DestroyCommandPool(VkDevice, VkCommandPool commandPool, const VkAllocationCallbacks*)
+{
+    delete GetNonDispatchableObject<CommandPoolObject>(commandPool);
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL AllocateCommandBuffers(VkDevice                           device,
+                                                      const VkCommandBufferAllocateInfo* pAllocateInfo,
+                                                      VkCommandBuffer*                   pCommandBuffers)
+{
+    auto pool_object = GetNonDispatchableObject<CommandPoolObject>(pAllocateInfo->commandPool);
+
+    for (uint32_t i = 0; i < pAllocateInfo->commandBufferCount; ++i)
+    {
+        auto command_buffer         = std::make_unique<DispatchableObject>();
+        command_buffer->loader_data = reinterpret_cast<DispatchableObject*>(device)->loader_data;
+        pCommandBuffers[i]          = reinterpret_cast<VkCommandBuffer>(command_buffer.get());
+        pool_object->command_buffers.emplace_back(std::move(command_buffer));
+    }
+
+    return VK_SUCCESS;
+}
+
+// Command buffers are released when their pool is destroyed.
+VKAPI_ATTR void VKAPI_CALL FreeCommandBuffers(VkDevice, VkCommandPool, uint32_t, const VkCommandBuffer*) {}
+
+VKAPI_ATTR VkResult VKAPI_CALL BeginCommandBuffer(VkCommandBuffer, const VkCommandBufferBeginInfo*)
+{
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL EndCommandBuffer(VkCommandBuffer)
+{
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR void VKAPI_CALL CmdBindDescriptorSets(VkCommandBuffer,
+                                                 VkPipelineBindPoint,
+                                                 VkPipelineLayout,
+                                                 uint32_t,
+                                                 uint32_t,
+                                                 const VkDescriptorSet*,
+                                                 uint32_t,
+                                                 const uint32_t*)
+{}
+
+VKAPI_ATTR void VKAPI_CALL CmdDraw(VkCommandBuffer, uint32_t, uint32_t, uint32_t, uint32_t) {}
+
+struct ProcEntry
+{
+    const char*        name;
+    PFN_vkVoidFunction proc;
+};
+
+#define GFXRECON_STUB_ICD_PROC(name)                           \
+    {                                                          \
+        "vk" #name, reinterpret_cast<PFN_vkVoidFunction>(name) \
+    }
+
+const ProcEntry kProcs[] = {
+    GFXRECON_STUB_ICD_PROC(CreateInstance),
+    GFXRECON_STUB_ICD_PROC(DestroyInstance),
+    GFXRECON_STUB_ICD_PROC(EnumeratePhysicalDevices),
+    GFXRECON_STUB_ICD_PROC(GetPhysicalDeviceProperties),
+    GFXRECON_STUB_ICD_PROC(GetPhysicalDeviceMemoryProperties),
+    GFXRECON_STUB_ICD_PROC(GetPhysicalDeviceQueueFamilyProperties),
+    GFXRECON_STUB_ICD_PROC(GetInstanceProcAddr),
+    GFXRECON_STUB_ICD_PROC(GetDeviceProcAddr),
+    GFXRECON_STUB_ICD_PROC(CreateDevice),
+    GFXRECON_STUB_ICD_PROC(DestroyDevice),
+    GFXRECON_STUB_ICD_PROC(GetDeviceQueue),
+    GFXRECON_STUB_ICD_PROC(QueueSubmit),
+    GFXRECON_STUB_ICD_PROC(AllocateMemory),
+    GFXRECON_STUB_ICD_PROC(FreeMemory),
+    GFXRECON_STUB_ICD_PROC(MapMemory),
+    GFXRECON_STUB_ICD_PROC(UnmapMemory),
+    GFXRECON_STUB_ICD_PROC(CreateBuffer),
+    GFXRECON_STUB_ICD_PROC(DestroyBuffer),
+    GFXRECON_STUB_ICD_PROC(CreateDescriptorSetLayout),
+    GFXRECON_STUB_ICD_PROC(DestroyDescriptorSetLayout),
+    GFXRECON_STUB_ICD_PROC(CreatePipelineLayout),
+    GFXRECON_STUB_ICD_PROC(DestroyPipelineLayout),
+    GFXRECON_STUB_ICD_PROC(CreateDescriptorPool),
+    GFXRECON_STUB_ICD_PROC(DestroyDescriptorPool),
+    GFXRECON_STUB_ICD_PROC(AllocateDescriptorSets),
+    GFXRECON_STUB_ICD_PROC(UpdateDescriptorSets),
+    GFXRECON_STUB_ICD_PROC(CreateCommandPool),
+    GFXRECON_STUB_ICD_PROC(DestroyCommandPool),
+    GFXRECON_STUB_ICD_PROC(AllocateCommandBuffers),
+    GFXRECON_STUB_ICD_PROC(FreeCommandBuffers),
+    GFXRECON_STUB_ICD_PROC(BeginCommandBuffer),
+    GFXRECON_STUB_ICD_PROC(EndCommandBuffer),
+    GFXRECON_STUB_ICD_PROC(CmdBindDescriptorSets),
+    GFXRECON_STUB_ICD_PROC(CmdDraw),
+};
+
+#undef GFXRECON_STUB_ICD_PROC
+
+PFN_vkVoidFunction GetProcAddr(const char* name)
+{
+    for (const auto& entry : kProcs)
+    {
+        if (strcmp(entry.name, name) == 0)
+        {
+            return entry.proc;
+        }
+    }
+
+    return nullptr;
+}
+
+} // namespace
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateInstance(const VkInstanceCreateInfo*,
+                                              const VkAllocationCallbacks*,
+                                              VkInstance* pInstance)
+{
+    auto instance_object                         = new InstanceObject;
+    instance_object->instance.loader_data        = &instance_object->instance;
+    instance_object->physical_device.loader_data = &instance_object->instance;
+    *pInstance                                   = reinterpret_cast<VkInstance>(&instance_object->instance);
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR VkResult VKAPI_CALL CreateDevice(VkPhysicalDevice,
+                                            const VkDeviceCreateInfo*,
+                                            const VkAllocationCallbacks*,
+                                            VkDevice* pDevice)
+{
+    auto device_object                = new DeviceObject;
+    device_object->device.loader_data = &device_object->device;
+    device_object->queue.loader_data  = &device_object->device;
+    *pDevice                          = reinterpret_cast<VkDevice>(&device_object->device);
+    return VK_SUCCESS;
+}
+
+VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance, const char* pName)
+{
+    return GetProcAddr(pName);
+}
+
+VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice, const char* pName)
+{
+    return GetProcAddr(pName);
+}
+
+GFXRECON_END_NAMESPACE(stub_icd)
+GFXRECON_END_NAMESPACE(gfxrecon)
@@ -23,6 +23,7 @@
 #ifndef GFXRECON_ENCODE_VULKAN_STATE_TABLE_BASE_H
 #define GFXRECON_ENCODE_VULKAN_STATE_TABLE_BASE_H
 
+#include "encode/handle_wrapper_map.h"
 #include "encode/vulkan_handle_wrappers.h"
 #include "format/format.h"
 #include "util/defines.h"
@@ -31,7 +32,6 @@
 
 #include <cassert>
 #include <functional>
-#include <map>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(encode)
@@ -45,31 +45,28 @@ class VulkanStateTableBase
 
   protected:
     template <typename T>
-    bool InsertEntry(format::HandleId id, T* wrapper, std::map<format::HandleId, T*>& map)
+    bool InsertEntry(format::HandleId id, T* wrapper, HandleWrapperMap<T>& map)
     {
-        const auto& inserted = map.insert(std::make_pair(id, wrapper));
-        return inserted.second;
+        return map.Insert(id, wrapper);
     }
 
     template <typename Wrapper>
-    bool RemoveEntry(const Wrapper* wrapper, std::map<format::HandleId, Wrapper*>& map)
+    bool RemoveEntry(const Wrapper* wrapper, HandleWrapperMap<Wrapper>& map)
     {
         assert(wrapper != nullptr);
-        return (map.erase(wrapper->handle_id) != 0);
+        return map.Erase(wrapper->handle_id);
     }
 
     template <typename T>
-    T* GetWrapper(format::HandleId id, std::map<format::HandleId, T*>& map)
+    T* GetWrapper(format::HandleId id, HandleWrapperMap<T>& map)
     {
-        auto entry = map.find(id);
-        return (entry != map.end()) ? entry->second : nullptr;
+        return map.Find(id);
     }
 
     template <typename T>
-    const T* GetWrapper(format::HandleId id, const std::map<format::HandleId, T*>& map) const
+    const T* GetWrapper(format::HandleId id, const HandleWrapperMap<T>& map) const
     {
-        auto entry = map.find(id);
-        return (entry != map.end()) ? entry->second : nullptr;
+        return map.Find(id);
     }
 };
 
@@ -34,6 +34,9 @@
 #define GFXRECON_FOURCC GFXRECON_MAKE_FOURCC('G', 'F', 'X', 'R')
 #define GFXRECON_FILE_EXTENSION ".gfxr"
 
+#define GFXRECON_BLOCK_INDEX_FOURCC GFXRECON_MAKE_FOURCC('G', 'F', 'X', 'I')
+#define GFXRECON_BLOCK_INDEX_FILE_EXTENSION ".index"
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(format)
 
@@ -414,6 +417,38 @@ struct SetRayTracingShaderGroupHandlesCommandHeader
     size_t           data_size;
 };
 
+// Block index sidecar file, with the name of the capture file followed by GFXRECON_BLOCK_INDEX_FILE_EXTENSION.  The
+// file contains a BlockIndexHeader, followed by a BlockIndexEntry for each block of the capture file, followed by the
+// uint64_t number of the first block of each frame.
+const uint32_t kBlockIndexVersion = 2;
+
+// Properties of the indexed capture file, which are used to detect an index file that is out of date.  The ID that
+// follows the header of the last block is also compared with the last BlockIndexEntry.
+struct BlockIndexCaptureInfo
+{
+    uint64_t    file_size;
+    FileHeader  file_header;
+    BlockHeader last_block_header;
+};
+
+struct BlockIndexHeader
+{
+    uint32_t              fourcc;
+    uint32_t              version;
+    BlockIndexCaptureInfo capture_info;
+    uint64_t              block_count;
+    uint64_t              frame_count;
+};
+
+struct BlockIndexEntry
+{
+    uint64_t  offset; // Offset of the block header from the start of the capture file.
+    BlockType type;
+    uint32_t  id; // The ApiCallId, MetaDataType, MarkerType, or AnnotationType, as determined by the block type.
+    uint32_t  frame_number;
+    uint32_t  reserved; // Keeps the 64-bit offsets of consecutive entries aligned.
+};
+
 #pragma pack(pop)
 
 GFXRECON_END_NAMESPACE(format)
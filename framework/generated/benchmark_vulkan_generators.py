@@ -0,0 +1,511 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+# Benchmark for the Vulkan code generators.
+#
+# Each generator target is run in a separate gencode.py process for each registry
+# snapshot in the corpus, recording the wall time, peak resident set size, and size
+# of the generated file.  The corpus is pinned by a manifest that lists a source
+# archive and SHA-256 digests for each snapshot, which are downloaded once and
+# verified before every run.  Synthetic registries that repeat the structs and commands
+# of each snapshot in additional extensions can be included to measure how the
+# generators scale with the size of the registry.  Results can be stored as a
+# baseline and compared with later runs to detect regressions.
+
+import argparse
+import copy
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+import urllib.request
+import xml.etree.ElementTree as etree
+
+from generate_vulkan import generate_targets, generator_path, registry_path
+
+# Version of the results file format.
+results_version = 1
+
+# Manifest listing the registry snapshots of the default corpus, and the version of
+# its format.
+corpus_manifest = 'benchmark_vulkan_generators_corpus.json'
+corpus_version = 1
+
+# Default directory for the downloaded corpus snapshots.
+default_corpus_dir = os.path.join(
+    tempfile.gettempdir(), 'gfxrecon_benchmark_corpus'
+)
+
+# Metrics that are compared with the baseline, with the label used to report them.
+compared_metrics = [('wall_time', 'wall time'), ('peak_rss', 'peak RSS')]
+
+# Extension number of the first extension added to synthetic registries, chosen to
+# be well above the range of extension numbers used by the Vulkan registry.
+scaled_extension_number = 9000
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the Vulkan code generators.'
+    )
+    parser.add_argument(
+        '-r',
+        '--registry',
+        dest='registries',
+        metavar='[NAME=]FILE',
+        action='append',
+        help=
+        'Registry snapshot to generate the targets from, which may be specified more than '
+        'once; NAME defaults to the file name without extension (default: the snapshots '
+        'listed in {})'.format(corpus_manifest)
+    )
+    parser.add_argument(
+        '--corpus-dir',
+        metavar='DIR',
+        default=default_corpus_dir,
+        help=
+        'Directory for the downloaded corpus snapshots (default: {})'.format(
+            default_corpus_dir
+        )
+    )
+    parser.add_argument(
+        '--scale',
+        metavar='FACTOR',
+        type=int,
+        action='append',
+        help=
+        'Also benchmark a synthetic registry for each snapshot that contains FACTOR copies of '
+        'its structs and commands, which may be specified more than once (default: 2)'
+    )
+    parser.add_argument(
+        '--no-scale',
+        action='store_true',
+        help='Benchmark only the registry snapshots'
+    )
+    parser.add_argument(
+        '-n',
+        '--repeat',
+        type=int,
+        default=1,
+        help=
+        'Number of times to run each target, reporting the fastest run (default: 1)'
+    )
+    parser.add_argument(
+        '-o',
+        '--output',
+        metavar='FILE',
+        help='Write the results to a JSON file'
+    )
+    parser.add_argument(
+        '-b',
+        '--baseline',
+        metavar='FILE',
+        help='Compare the results with the results stored in a JSON file'
+    )
+    parser.add_argument(
+        '-t',
+        '--threshold',
+        type=float,
+        default=10.0,
+        help=
+        'Percentage increase over the baseline that is reported as a regression (default: 10)'
+    )
+    parser.add_argument(
+        'targets',
+        metavar='target',
+        nargs='*',
+        help='Benchmark only the specified targets (default: all targets)'
+    )
+    return parser.parse_args()
+
+
+# Return the names of the commands and types required by the core versions and the
+# supported extensions of a registry.
+def get_required_names(root):
+    interfaces = root.findall('feature')
+    for extension in root.findall('extensions/extension'):
+        if 'vulkan' in extension.get('supported', '').split(','):
+            interfaces.append(extension)
+
+    commands = set()
+    types = set()
+    for interface in interfaces:
+        for elem in interface.findall('require/command'):
+            commands.add(elem.get('name'))
+        for elem in interface.findall('require/type'):
+            types.add(elem.get('name'))
+    return commands, types
+
+
+# Write a registry that extends the source registry with (factor - 1) copies of its
+# structs and commands.  Each copy renames the structs and commands with a numbered
+# suffix and adds them to a new extension, so that the generators process them like
+# any other extension.  Structs and commands in the blacklists, aliases, and those
+# that are not part of a supported interface are not copied.
+def write_scaled_registry(source, destination, factor, blacklists):
+    tree = etree.parse(source)
+    root = tree.getroot()
+
+    required_commands, required_types = get_required_names(root)
+    types = root.find('types')
+    commands = root.find('commands')
+    extensions = root.find('extensions')
+
+    structs = [
+        elem for elem in types.findall('type')
+        if elem.get('category') == 'struct' and not elem.get('alias')
+        and elem.get('name') in required_types
+        and elem.get('name') not in blacklists['structures']
+    ]
+    cmds = [
+        elem for elem in commands.findall('command')
+        if not elem.get('alias') and elem.find('proto/name').text in
+        required_commands and elem.find('proto/name').text not in
+        blacklists['functions']
+    ]
+
+    for copy_index in range(1, factor):
+        suffix = 'Scale{}'.format(copy_index)
+        extension = etree.SubElement(
+            extensions, 'extension', {
+                'name': 'VK_GFXR_benchmark_scale_{}'.format(copy_index),
+                'number': str(scaled_extension_number + copy_index),
+                'type': 'device',
+                'supported': 'vulkan'
+            }
+        )
+        require = etree.SubElement(extension, 'require')
+
+        for elem in structs:
+            clone = copy.deepcopy(elem)
+            clone.set('name', elem.get('name') + suffix)
+            types.append(clone)
+            etree.SubElement(require, 'type', {'name': clone.get('name')})
+
+        for elem in cmds:
+            clone = copy.deepcopy(elem)
+            name = clone.find('proto/name')
+            name.text += suffix
+            commands.append(clone)
+            etree.SubElement(require, 'command', {'name': name.text})
+
+    tree.write(destination, encoding='utf-8', xml_declaration=True)
+
+
+# Return the peak resident set size in bytes from a resource usage structure.
+def get_peak_rss(rusage):
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    if sys.platform == 'darwin':
+        return rusage.ru_maxrss
+    return rusage.ru_maxrss * 1024
+
+
+# Run gencode.py for a single target, returning the measurements for the run.
+def run_target(target, registry, output_dir, env):
+    report_file = os.path.join(output_dir, target + '.timing.json')
+    command = [
+        sys.executable,
+        os.path.join(generator_dir, 'gencode.py'), '-o', output_dir,
+        '-configs', generator_dir, '-registry', registry, '-timing-report',
+        report_file, target
+    ]
+
+    start_time = time.perf_counter()
+    process = subprocess.Popen(command, env=env)
+    if hasattr(os, 'wait4'):
+        # Wait for the specific process to get its resource usage, instead of the
+        # combined usage of all of the children of this process.
+        _, status, rusage = os.wait4(process.pid, 0)
+        process.returncode = os.WEXITSTATUS(status) if os.WIFEXITED(
+            status
+        ) else -1
+        peak_rss = get_peak_rss(rusage)
+    else:
+        process.wait()
+        peak_rss = None
+    wall_time = time.perf_counter() - start_time
+
+    if process.returncode != 0:
+        return None
+
+    with open(report_file, 'r') as f:
+        report = json.load(f)
+
+    return {
+        'wall_time': wall_time,
+        'peak_rss': peak_rss,
+        'output_size': os.path.getsize(os.path.join(output_dir, target)),
+        'phases': report['phases']
+    }
+
+
+# Run each target for each registry, returning a map of registry names to maps of
+# target names to measurements.
+def run_benchmarks(registries, targets, repeat, output_dir):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(
+        [generator_dir, registry_dir] +
+        ([env['PYTHONPATH']] if env.get('PYTHONPATH') else [])
+    )
+
+    results = {}
+    failed = False
+    for name, registry in registries:
+        results[name] = {}
+        for target in targets:
+            runs = []
+            for _ in range(repeat):
+                result = run_target(target, registry, output_dir, env)
+                if not result:
+                    break
+                runs.append(result)
+
+            if len(runs) < repeat:
+                print(
+                    'Failed to generate {} from {}'.format(target, name),
+                    file=sys.stderr
+                )
+                failed = True
+                continue
+
+            result = min(runs, key=lambda run: run['wall_time'])
+            results[name][target] = result
+            print(
+                '{:<12} {:<52} {:>8.3f} s {:>8} MiB {:>10} bytes'.format(
+                    name, target, result['wall_time'],
+                    format_mib(result['peak_rss']), result['output_size']
+                )
+            )
+    return results, failed
+
+
+def format_mib(size):
+    if size is None:
+        return 'n/a'
+    return '{:.1f}'.format(size / (1024 * 1024))
+
+
+# Compare results with a baseline, printing the measurements that exceed the baseline by
+# more than the threshold percentage.  Returns True if a regression was found.
+def compare_results(results, baseline, threshold):
+    regressed = False
+    for name, targets in results.items():
+        baseline_targets = baseline.get(name)
+        if baseline_targets is None:
+            print('No baseline for registry', name)
+            continue
+
+        for target, result in targets.items():
+            baseline_result = baseline_targets.get(target)
+            if baseline_result is None:
+                print('No baseline for', name, target)
+                continue
+
+            for metric, label in compared_metrics:
+                value = result.get(metric)
+                baseline_value = baseline_result.get(metric)
+                if not value or not baseline_value:
+                    continue
+
+                change = (value - baseline_value) * 100.0 / baseline_value
+                if change > threshold:
+                    regressed = True
+                    print(
+                        'Regression: {} {} {} increased by {:.1f}% ({} -> {})'.
+                        format(
+                            name, target, label, change, baseline_value, value
+                        )
+                    )
+
+            if result['output_size'] != baseline_result.get('output_size'):
+                print(
+                    'Changed: {} {} output size {} -> {}'.format(
+                        name, target, baseline_result.get('output_size'),
+                        result['output_size']
+                    )
+                )
+    return regressed
+
+
+# Return the SHA-256 digest of a file as a hexadecimal string.
+def get_sha256(filename):
+    digest = hashlib.sha256()
+    with open(filename, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Download the archive that contains a corpus snapshot and extract the snapshot,
+# verifying the digests of both.  Returns False if either digest does not match.
+def fetch_snapshot(snapshot, filename):
+    archive = snapshot['archive']
+    archive_file = filename + '.archive'
+    print('Downloading', archive['url'])
+    try:
+        with urllib.request.urlopen(archive['url']) as response:
+            with open(archive_file, 'wb') as f:
+                shutil.copyfileobj(response, f)
+
+        if get_sha256(archive_file) != archive['sha256']:
+            print('Digest mismatch for', archive['url'], file=sys.stderr)
+            return False
+
+        with tarfile.open(archive_file, 'r:*') as tar:
+            member = tar.extractfile(archive['member'])
+            with open(filename, 'wb') as f:
+                shutil.copyfileobj(member, f)
+    finally:
+        if os.path.exists(archive_file):
+            os.remove(archive_file)
+
+    if get_sha256(filename) != snapshot['sha256']:
+        print(
+            'Digest mismatch for', archive['member'], 'in', archive['url'],
+            file=sys.stderr
+        )
+        os.remove(filename)
+        return False
+    return True
+
+
+# Return a list of (name, file) tuples for the snapshots listed in the corpus
+# manifest, downloading the snapshots that are not already in the corpus directory.
+# The registry file of each snapshot is verified with its SHA-256 digest, so a
+# snapshot that has been modified after it was downloaded is downloaded again.
+def get_corpus_registries(corpus_dir):
+    with open(os.path.join(current_dir, corpus_manifest), 'r') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != corpus_version:
+        print('Unsupported corpus manifest:', corpus_manifest, file=sys.stderr)
+        sys.exit(1)
+
+    if not os.path.isdir(corpus_dir):
+        os.makedirs(corpus_dir)
+
+    registries = []
+    for snapshot in manifest['snapshots']:
+        filename = os.path.join(corpus_dir, snapshot['name'] + '.xml')
+        if not os.path.isfile(filename) or (
+            get_sha256(filename) != snapshot['sha256']
+        ):
+            if not fetch_snapshot(snapshot, filename):
+                sys.exit(1)
+        registries.append((snapshot['name'], filename))
+    return registries
+
+
+# Return a list of (name, file) tuples for the registry arguments.
+def get_registries(registry_args, corpus_dir):
+    if not registry_args:
+        return get_corpus_registries(corpus_dir)
+
+    registries = []
+    for arg in registry_args:
+        name, separator, filename = arg.partition('=')
+        if not separator:
+            filename = arg
+            name = os.path.splitext(os.path.basename(arg))[0]
+
+        if not os.path.isfile(filename):
+            print('Registry file not found:', filename, file=sys.stderr)
+            sys.exit(1)
+        if name in [registry[0] for registry in registries]:
+            print('Duplicate registry name:', name, file=sys.stderr)
+            sys.exit(1)
+        registries.append((name, os.path.abspath(filename)))
+    return registries
+
+
+if __name__ == '__main__':
+    args = parse_args()
+
+    current_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
+    generator_dir = os.path.normpath(os.path.join(current_dir, generator_path))
+    registry_dir = os.path.normpath(os.path.join(current_dir, registry_path))
+
+    targets = args.targets if args.targets else generate_targets
+    for target in targets:
+        if target not in generate_targets:
+            print('Unknown target:', target, file=sys.stderr)
+            sys.exit(1)
+
+    snapshots = get_registries(args.registries, args.corpus_dir)
+    scales = [] if args.no_scale else (args.scale if args.scale else [2])
+
+    with open(os.path.join(generator_dir, 'blacklists.json'), 'r') as f:
+        blacklists = json.load(f)
+
+    work_dir = tempfile.mkdtemp(prefix='benchmark_vulkan_generators_')
+    try:
+        registries = list(snapshots)
+        for name, registry in snapshots:
+            for factor in scales:
+                if factor > 1:
+                    scaled_name = '{}_x{}'.format(name, factor)
+                    scaled_registry = os.path.join(
+                        work_dir, scaled_name + '.xml'
+                    )
+                    write_scaled_registry(
+                        registry, scaled_registry, factor, blacklists
+                    )
+                    registries.append((scaled_name, scaled_registry))
+
+        output_dir = os.path.join(work_dir, 'output')
+        os.makedirs(output_dir)
+        results, failed = run_benchmarks(
+            registries, targets, max(args.repeat, 1), output_dir
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(
+                {
+                    'version': results_version,
+                    'results': results
+                },
+                f,
+                indent=4,
+                sort_keys=True
+            )
+            f.write('\n')
+
+    regressed = False
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        if baseline.get('version') != results_version:
+            print('Unsupported baseline file:', args.baseline, file=sys.stderr)
+            sys.exit(1)
+        regressed = compare_results(
+            results, baseline['results'], args.threshold
+        )
+
+    if failed or regressed:
+        sys.exit(1)
@@ -21,9 +21,16 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
 # IN THE SOFTWARE.
 
+import argparse
+import hashlib
+import json
+import multiprocessing
 import os
+import shutil
 import sys
-import subprocess
+import tempfile
+import time
+import traceback
 
 # Relative path from code generators to directory containing the Vulkan XML Registry.
 registry_path = '../../external/Vulkan-Headers/registry'
@@ -31,6 +38,13 @@ registry_path = '../../external/Vulkan-Headers/registry'
 # Relative path to vulkan code generators for trace encode/decode.
 generator_path = './vulkan_generators'
 
+# Directory for the cache of the parsed registry, shared by all generator processes.
+registry_cache_path = '.registry_cache'
+
+# Manifest recording the hashes of the files that each target was generated from.
+manifest_file = '.generate_vulkan_manifest.json'
+manifest_version = 1
+
 # File names to provide to the Vulkan XML Registry generator script.
 generate_targets = [
     'generated_encode_pnext_struct.cpp', 'generated_vulkan_struct_encoders.h',
@@ -52,6 +66,8 @@ generate_targets = [
     'generated_vulkan_replay_consumer.cpp',
     'generated_vulkan_referenced_resource_consumer.h',
     'generated_vulkan_referenced_resource_consumer.cpp',
+    'generated_vulkan_handle_id_consumer.h',
+    'generated_vulkan_handle_id_consumer.cpp',
     'generated_vulkan_struct_handle_mappers.h',
     'generated_vulkan_struct_handle_mappers.cpp',
     'generated_vulkan_feature_util.cpp', 'generated_vulkan_enum_to_string.h',
@@ -63,7 +79,286 @@ generate_targets = [
     'generated_vulkan_state_table.h'
 ]
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description='Generate the Vulkan encode/decode framework source files.'
+    )
+    parser.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=os.cpu_count(),
+        help=
+        'Number of worker processes used to generate targets in parallel '
+        '(default: number of CPUs)'
+    )
+    parser.add_argument(
+        '-s',
+        '--single-process',
+        action='store_true',
+        help=
+        'Generate all targets in this process, without starting any worker '
+        'processes'
+    )
+    parser.add_argument(
+        '-f',
+        '--force',
+        action='store_true',
+        help=
+        'Generate all requested targets, including targets whose inputs have '
+        'not changed since they were last generated'
+    )
+    parser.add_argument(
+        '--no-registry-cache',
+        dest='registry_cache',
+        action='store_false',
+        help=
+        'Always parse the registry XML, instead of loading the parsed registry '
+        'from the cache written by an earlier run'
+    )
+    parser.add_argument(
+        '--timing-report',
+        metavar='FILE',
+        help=
+        'Write a JSON report of the time spent in each phase of generation, '
+        'for each target and in total, to the specified file'
+    )
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help=
+        'Profile the generation of each target, adding the top cumulative '
+        'cProfile entries to the timing report'
+    )
+    parser.add_argument(
+        'targets',
+        metavar='target',
+        nargs='*',
+        help='Generate only the specified targets (default: all targets)'
+    )
+    return parser.parse_args()
+
+
+class TargetGenerator():
+    """Generates targets from a registry that is parsed once, on first use, and shared by all targets."""
+
+    def __init__(
+        self, generator_dir, registry_dir, output_dir, cache_dir, timing,
+        profile
+    ):
+        import gencode
+        import timing_report
+
+        gencode_args = [
+            '-o', output_dir, '-configs', generator_dir, '-registry',
+            os.path.join(registry_dir, 'vk.xml')
+        ]
+        if cache_dir:
+            gencode_args += ['-registry-cache', cache_dir]
+        if profile:
+            gencode_args += ['-profile']
+
+        self.gencode = gencode
+        self.timing_report = timing_report
+        self.args = gencode.makeArgParser().parse_args(gencode_args)
+        self.timing = timing
+        self.reg = None
+
+    # Generate a target, returning an (error, report) tuple, where error is None on success or the
+    # formatted exception on failure, and report is the target's timing report when timing is enabled.
+    def generate(self, target):
+        report = None
+        try:
+            self.args.target = target
+            (gen, options) = self.gencode.genTarget(self.args)
+            if self.timing:
+                gen.timingReport = self.timing_report.TimingReport(target)
+            if self.reg is None:
+                self.reg = self.gencode.loadRegistry(self.args, gen, options)
+            else:
+                self.gencode.bindRegistry(self.reg, gen, options)
+            self.gencode.genRegistry(self.args, self.reg, options)
+            if self.timing:
+                report = gen.timingReport.toDict()
+        except Exception:
+            return (traceback.format_exc(), None)
+        return (None, report)
+
+
+# Generator owned by each worker process of the parallel generation pool.
+worker_generator = None
+
+
+def init_worker(
+    generator_dir, registry_dir, output_dir, cache_dir, timing, profile
+):
+    global worker_generator
+
+    sys.path.append(generator_dir)
+    sys.path.append(registry_dir)
+    worker_generator = TargetGenerator(
+        generator_dir, registry_dir, output_dir, cache_dir, timing, profile
+    )
+
+
+def generate_worker_target(target):
+    return worker_generator.generate(target)
+
+
+# Generate the targets, returning a list of (target, error) tuples for the targets that
+# failed and a list of the timing reports for the targets that were generated.
+def generate_single_process(
+    targets, generator_dir, registry_dir, output_dir, cache_dir, timing,
+    profile
+):
+    generator = TargetGenerator(
+        generator_dir, registry_dir, output_dir, cache_dir, timing, profile
+    )
+
+    errors = []
+    reports = []
+    for target in targets:
+        print('Generating', target)
+        error, report = generator.generate(target)
+        if error:
+            errors.append((target, error))
+        if report:
+            reports.append(report)
+    return errors, reports
+
+
+def generate_parallel(
+    targets, jobs, generator_dir, registry_dir, output_dir, cache_dir, timing,
+    profile
+):
+    # Each worker parses the registry once and then generates any of the targets assigned to it.
+    # Every target writes its own output file, so the results do not depend on the scheduling order.
+    pool = multiprocessing.Pool(
+        processes=min(jobs, len(targets)),
+        initializer=init_worker,
+        initargs=(
+            generator_dir, registry_dir, output_dir, cache_dir, timing, profile
+        )
+    )
+
+    try:
+        results = [
+            pool.apply_async(generate_worker_target, (target, ))
+            for target in targets
+        ]
+
+        errors = []
+        reports = []
+        for target, result in zip(targets, results):
+            error, report = result.get()
+            print('Generated', target)
+            if error:
+                errors.append((target, error))
+            if report:
+                reports.append(report)
+    finally:
+        pool.close()
+        pool.join()
+
+    return errors, reports
+
+
+def hash_file(filename):
+    with open(filename, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_manifest(filename):
+    try:
+        with open(filename, 'r') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == manifest_version:
+            return manifest['targets']
+    except (OSError, ValueError, KeyError):
+        pass
+    return {}
+
+
+def save_manifest(filename, targets):
+    with open(filename, 'w') as f:
+        json.dump(
+            {
+                'version': manifest_version,
+                'targets': targets
+            },
+            f,
+            indent=4,
+            sort_keys=True
+        )
+        f.write('\n')
+
+
+# Build the manifest entry for a target, mapping each of its input files to a content hash.
+def get_target_hashes(target, generator_dir, registry_dir, output_dir, cache):
+    import gencode
+
+    args = gencode.makeArgParser().parse_args(
+        [
+            '-o', output_dir, '-configs', generator_dir, '-registry',
+            os.path.join(registry_dir, 'vk.xml'), target
+        ]
+    )
+
+    hashes = {}
+    for filename in gencode.getTargetInputs(args):
+        if filename not in cache:
+            cache[filename] = hash_file(filename)
+        key = os.path.relpath(filename, output_dir).replace(os.sep, '/')
+        hashes[key] = cache[filename]
+    return hashes
+
+
+# Replace the output file with the generated file only when their contents differ,
+# leaving the timestamps of unchanged files alone so they are not rebuilt.
+def update_file(generated, output):
+    if os.path.isfile(output):
+        with open(generated, 'rb') as f:
+            new_content = f.read()
+        with open(output, 'rb') as f:
+            old_content = f.read()
+        if new_content == old_content:
+            return False
+    os.replace(generated, output)
+    return True
+
+
+# Write the timing reports for all generated targets, with their combined phase times, to a JSON file.
+def save_timing_report(filename, reports, wall_time, jobs):
+    import timing_report
+
+    report = timing_report.combineReports(reports)
+    report['wall_time'] = wall_time
+    report['jobs'] = jobs
+    with open(filename, 'w') as f:
+        json.dump(report, f, indent=4)
+        f.write('\n')
+
+
+def print_errors(errors):
+    for target, error in errors:
+        print('Error generating', target, file=sys.stderr)
+        print(error, file=sys.stderr)
+
+    print(
+        'Failed to generate {} target(s):'.format(len(errors)),
+        file=sys.stderr
+    )
+    for target, error in errors:
+        print(
+            '    {}: {}'.format(target, error.strip().splitlines()[-1]),
+            file=sys.stderr
+        )
+
+
 if __name__ == '__main__':
+    args = parse_args()
+
     current_dir = os.path.dirname(os.path.abspath(sys.argv[0]))
     generator_dir = os.path.normpath(os.path.join(current_dir, generator_path))
     registry_dir = os.path.normpath(os.path.join(current_dir, registry_path))
@@ -71,18 +366,74 @@ if __name__ == '__main__':
     sys.path.append(generator_dir)
     sys.path.append(registry_dir)
 
-    env = os.environ
-    env['PYTHONPATH'] = os.pathsep.join(sys.path)
+    targets = args.targets if args.targets else generate_targets
+    for target in targets:
+        if target not in generate_targets:
+            print('Unknown target:', target, file=sys.stderr)
+            sys.exit(1)
 
-    for target in generate_targets:
-        print('Generating', target)
-        subprocess.call(
-            [
-                sys.executable,
-                os.path.join(generator_dir, 'gencode.py'), '-o', current_dir,
-                '-configs', generator_dir, '-registry',
-                os.path.join(registry_dir, 'vk.xml'), target
-            ],
-            shell=False,
-            env=env
+    # Skip the targets that were generated from the same inputs as the current output files.
+    manifest_path = os.path.join(current_dir, manifest_file)
+    manifest = load_manifest(manifest_path)
+    hash_cache = {}
+    target_hashes = {}
+    stale_targets = []
+    for target in targets:
+        target_hashes[target] = get_target_hashes(
+            target, generator_dir, registry_dir, current_dir, hash_cache
         )
+        if args.force or (manifest.get(target) != target_hashes[target]) or (
+            not os.path.isfile(os.path.join(current_dir, target))
+        ):
+            stale_targets.append(target)
+        else:
+            print('Up to date', target)
+
+    cache_dir = None
+    if args.registry_cache:
+        cache_dir = os.path.join(current_dir, registry_cache_path)
+
+    timing = args.timing_report is not None
+    jobs = 1
+
+    # Generate into a staging directory, so that existing files are only replaced when their content changes.
+    staging_dir = tempfile.mkdtemp(prefix='.generate_vulkan_', dir=current_dir)
+    start_time = time.perf_counter()
+    try:
+        if not stale_targets:
+            errors, reports = [], []
+        elif args.single_process or args.jobs <= 1 or len(stale_targets) == 1:
+            errors, reports = generate_single_process(
+                stale_targets, generator_dir, registry_dir, staging_dir,
+                cache_dir, timing, args.profile
+            )
+        else:
+            jobs = min(args.jobs, len(stale_targets))
+            errors, reports = generate_parallel(
+                stale_targets, args.jobs, generator_dir, registry_dir,
+                staging_dir, cache_dir, timing, args.profile
+            )
+        wall_time = time.perf_counter() - start_time
+
+        failed_targets = [target for target, error in errors]
+        for target in stale_targets:
+            if target in failed_targets:
+                manifest.pop(target, None)
+            else:
+                if update_file(
+                    os.path.join(staging_dir, target),
+                    os.path.join(current_dir, target)
+                ):
+                    print('Updated', target)
+                manifest[target] = target_hashes[target]
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+    save_manifest(manifest_path, manifest)
+
+    if timing:
+        save_timing_report(args.timing_report, reports, wall_time, jobs)
+
+    if errors:
+        print_errors(errors)
+        sys.exit(1)
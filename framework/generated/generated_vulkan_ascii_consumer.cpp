@@ -49,12 +49,16 @@ void VulkanAsciiConsumer::Process_vkCreateInstance(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateInstance", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pInstance", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pInstance));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pInstance", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pInstance);
         }
     );
 }
@@ -68,10 +72,12 @@ void VulkanAsciiConsumer::Process_vkDestroyInstance(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyInstance", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -87,12 +93,16 @@ void VulkanAsciiConsumer::Process_vkEnumeratePhysicalDevices(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkEnumeratePhysicalDevices", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "[out]pPhysicalDeviceCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPhysicalDeviceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPhysicalDevices", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(pPhysicalDeviceCount, pPhysicalDevices, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "[out]pPhysicalDeviceCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPhysicalDeviceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPhysicalDevices", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, pPhysicalDeviceCount, pPhysicalDevices, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -106,10 +116,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFeatures(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFeatures", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pFeatures", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFeatures, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pFeatures", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFeatures, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -124,11 +136,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFormatProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFormatProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -148,16 +163,24 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceImageFormatProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceImageFormatProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "type", toStringFlags, tabCount, tabSize, '"' + ToString(type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "tiling", toStringFlags, tabCount, tabSize, '"' + ToString(tiling, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "usage", toStringFlags, tabCount, tabSize, ToString(usage, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, type, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "tiling", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, tiling, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "usage", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, usage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -171,10 +194,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -189,11 +214,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceQueueFamilyProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -207,10 +235,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceMemoryProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceMemoryProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -227,13 +257,18 @@ void VulkanAsciiConsumer::Process_vkCreateDevice(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDevice", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDevice", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDevice));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDevice", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDevice);
         }
     );
 }
@@ -247,10 +282,12 @@ void VulkanAsciiConsumer::Process_vkDestroyDevice(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDevice", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -266,12 +303,16 @@ void VulkanAsciiConsumer::Process_vkGetDeviceQueue(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceQueue", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queueIndex", toStringFlags, tabCount, tabSize, ToString(queueIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueue", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pQueue));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queueIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueue", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pQueue);
         }
     );
 }
@@ -288,13 +329,18 @@ void VulkanAsciiConsumer::Process_vkQueueSubmit(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueSubmit", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "submitCount", toStringFlags, tabCount, tabSize, ToString(submitCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubmits", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(submitCount, pSubmits, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "submitCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, submitCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubmits", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, submitCount, pSubmits, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
         }
     );
 }
@@ -308,10 +354,12 @@ void VulkanAsciiConsumer::Process_vkQueueWaitIdle(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueWaitIdle", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
         }
     );
 }
@@ -325,10 +373,12 @@ void VulkanAsciiConsumer::Process_vkDeviceWaitIdle(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDeviceWaitIdle", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
         }
     );
 }
@@ -345,13 +395,18 @@ void VulkanAsciiConsumer::Process_vkAllocateMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAllocateMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAllocateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemory", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pMemory));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAllocateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemory", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pMemory);
         }
     );
 }
@@ -366,11 +421,14 @@ void VulkanAsciiConsumer::Process_vkFreeMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkFreeMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -389,15 +447,22 @@ void VulkanAsciiConsumer::Process_vkMapMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkMapMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "size", toStringFlags, tabCount, tabSize, ToString(size, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]ppData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(ppData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "size", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, size, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]ppData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, ppData);
         }
     );
 }
@@ -411,10 +476,12 @@ void VulkanAsciiConsumer::Process_vkUnmapMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkUnmapMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
         }
     );
 }
@@ -430,12 +497,16 @@ void VulkanAsciiConsumer::Process_vkFlushMappedMemoryRanges(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkFlushMappedMemoryRanges", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memoryRangeCount", toStringFlags, tabCount, tabSize, ToString(memoryRangeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMemoryRanges", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(memoryRangeCount, pMemoryRanges, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memoryRangeCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryRangeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMemoryRanges", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, memoryRangeCount, pMemoryRanges, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -451,12 +522,16 @@ void VulkanAsciiConsumer::Process_vkInvalidateMappedMemoryRanges(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkInvalidateMappedMemoryRanges", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memoryRangeCount", toStringFlags, tabCount, tabSize, ToString(memoryRangeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMemoryRanges", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(memoryRangeCount, pMemoryRanges, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memoryRangeCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryRangeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMemoryRanges", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, memoryRangeCount, pMemoryRanges, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -471,11 +546,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceMemoryCommitment(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceMemoryCommitment", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "[out]pCommittedMemoryInBytes", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCommittedMemoryInBytes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "[out]pCommittedMemoryInBytes", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCommittedMemoryInBytes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -492,13 +570,18 @@ void VulkanAsciiConsumer::Process_vkBindBufferMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindBufferMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "memoryOffset", toStringFlags, tabCount, tabSize, ToString(memoryOffset, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "memoryOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryOffset, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -515,13 +598,18 @@ void VulkanAsciiConsumer::Process_vkBindImageMemory(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindImageMemory", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "memoryOffset", toStringFlags, tabCount, tabSize, ToString(memoryOffset, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "memoryOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryOffset, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -536,11 +624,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferMemoryRequirements(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferMemoryRequirements", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -555,11 +646,14 @@ void VulkanAsciiConsumer::Process_vkGetImageMemoryRequirements(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageMemoryRequirements", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -575,12 +669,16 @@ void VulkanAsciiConsumer::Process_vkGetImageSparseMemoryRequirements(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageSparseMemoryRequirements", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -600,16 +698,24 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSparseImageFormatProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "type", toStringFlags, tabCount, tabSize, '"' + ToString(type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "samples", toStringFlags, tabCount, tabSize, '"' + ToString(samples, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "usage", toStringFlags, tabCount, tabSize, ToString(usage, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "tiling", toStringFlags, tabCount, tabSize, '"' + ToString(tiling, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, type, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "samples", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, samples, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "usage", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, usage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "tiling", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, tiling, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -626,13 +732,18 @@ void VulkanAsciiConsumer::Process_vkQueueBindSparse(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueBindSparse", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfo", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
         }
     );
 }
@@ -649,13 +760,18 @@ void VulkanAsciiConsumer::Process_vkCreateFence(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateFence", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFence", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pFence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFence", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pFence);
         }
     );
 }
@@ -670,11 +786,14 @@ void VulkanAsciiConsumer::Process_vkDestroyFence(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyFence", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -690,12 +809,16 @@ void VulkanAsciiConsumer::Process_vkResetFences(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetFences", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "fenceCount", toStringFlags, tabCount, tabSize, ToString(fenceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pFences", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(fenceCount, pFences, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "fenceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, fenceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pFences", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, fenceCount, pFences, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -710,11 +833,14 @@ void VulkanAsciiConsumer::Process_vkGetFenceStatus(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetFenceStatus", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
         }
     );
 }
@@ -732,14 +858,20 @@ void VulkanAsciiConsumer::Process_vkWaitForFences(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkWaitForFences", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "fenceCount", toStringFlags, tabCount, tabSize, ToString(fenceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pFences", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(fenceCount, pFences, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "waitAll", toStringFlags, tabCount, tabSize, ToString(waitAll, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "timeout", toStringFlags, tabCount, tabSize, ToString(timeout, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "fenceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, fenceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pFences", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, fenceCount, pFences, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "waitAll", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, waitAll, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "timeout", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timeout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -756,13 +888,18 @@ void VulkanAsciiConsumer::Process_vkCreateSemaphore(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSemaphore", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSemaphore", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSemaphore));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSemaphore", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSemaphore);
         }
     );
 }
@@ -777,11 +914,14 @@ void VulkanAsciiConsumer::Process_vkDestroySemaphore(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySemaphore", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "semaphore", toStringFlags, tabCount, tabSize, HandleIdToString(semaphore));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "semaphore", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, semaphore);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -798,13 +938,18 @@ void VulkanAsciiConsumer::Process_vkCreateEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pEvent", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pEvent));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pEvent", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pEvent);
         }
     );
 }
@@ -819,11 +964,14 @@ void VulkanAsciiConsumer::Process_vkDestroyEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -838,11 +986,14 @@ void VulkanAsciiConsumer::Process_vkGetEventStatus(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetEventStatus", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
         }
     );
 }
@@ -857,11 +1008,14 @@ void VulkanAsciiConsumer::Process_vkSetEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
         }
     );
 }
@@ -876,11 +1030,14 @@ void VulkanAsciiConsumer::Process_vkResetEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
         }
     );
 }
@@ -897,13 +1054,18 @@ void VulkanAsciiConsumer::Process_vkCreateQueryPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateQueryPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueryPool", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pQueryPool));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueryPool", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pQueryPool);
         }
     );
 }
@@ -918,11 +1080,14 @@ void VulkanAsciiConsumer::Process_vkDestroyQueryPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyQueryPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -943,17 +1108,26 @@ void VulkanAsciiConsumer::Process_vkGetQueryPoolResults(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetQueryPoolResults", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryCount", toStringFlags, tabCount, tabSize, ToString(queryCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queryCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -970,13 +1144,18 @@ void VulkanAsciiConsumer::Process_vkCreateBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pBuffer", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pBuffer));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pBuffer", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pBuffer);
         }
     );
 }
@@ -991,11 +1170,14 @@ void VulkanAsciiConsumer::Process_vkDestroyBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1012,13 +1194,18 @@ void VulkanAsciiConsumer::Process_vkCreateBufferView(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateBufferView", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pView", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pView));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pView", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pView);
         }
     );
 }
@@ -1033,11 +1220,14 @@ void VulkanAsciiConsumer::Process_vkDestroyBufferView(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyBufferView", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bufferView", toStringFlags, tabCount, tabSize, HandleIdToString(bufferView));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bufferView", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, bufferView);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1054,13 +1244,18 @@ void VulkanAsciiConsumer::Process_vkCreateImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pImage", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pImage));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pImage", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pImage);
         }
     );
 }
@@ -1075,11 +1270,14 @@ void VulkanAsciiConsumer::Process_vkDestroyImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1095,12 +1293,16 @@ void VulkanAsciiConsumer::Process_vkGetImageSubresourceLayout(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageSubresourceLayout", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "pSubresource", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubresource, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pLayout", toStringFlags, tabCount, tabSize, PointerDecoderToString(pLayout, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "pSubresource", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubresource, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pLayout", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pLayout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1117,13 +1319,18 @@ void VulkanAsciiConsumer::Process_vkCreateImageView(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateImageView", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pView", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pView));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pView", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pView);
         }
     );
 }
@@ -1138,11 +1345,14 @@ void VulkanAsciiConsumer::Process_vkDestroyImageView(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyImageView", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "imageView", toStringFlags, tabCount, tabSize, HandleIdToString(imageView));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "imageView", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, imageView);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1159,13 +1369,18 @@ void VulkanAsciiConsumer::Process_vkCreateShaderModule(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateShaderModule", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pShaderModule", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pShaderModule));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pShaderModule", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pShaderModule);
         }
     );
 }
@@ -1180,11 +1395,14 @@ void VulkanAsciiConsumer::Process_vkDestroyShaderModule(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyShaderModule", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "shaderModule", toStringFlags, tabCount, tabSize, HandleIdToString(shaderModule));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "shaderModule", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, shaderModule);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1201,13 +1419,18 @@ void VulkanAsciiConsumer::Process_vkCreatePipelineCache(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreatePipelineCache", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelineCache", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pPipelineCache));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelineCache", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pPipelineCache);
         }
     );
 }
@@ -1222,11 +1445,14 @@ void VulkanAsciiConsumer::Process_vkDestroyPipelineCache(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyPipelineCache", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1243,13 +1469,18 @@ void VulkanAsciiConsumer::Process_vkGetPipelineCacheData(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPipelineCacheData", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "[out]pDataSize", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "[out]pDataSize", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -1266,13 +1497,18 @@ void VulkanAsciiConsumer::Process_vkMergePipelineCaches(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkMergePipelineCaches", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "dstCache", toStringFlags, tabCount, tabSize, HandleIdToString(dstCache));
-            FieldToString(strStrm, false, "srcCacheCount", toStringFlags, tabCount, tabSize, ToString(srcCacheCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSrcCaches", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(srcCacheCount, pSrcCaches, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "dstCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstCache);
+            FieldToString(strBuf, false, "srcCacheCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, srcCacheCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSrcCaches", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, srcCacheCount, pSrcCaches, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1291,15 +1527,22 @@ void VulkanAsciiConsumer::Process_vkCreateGraphicsPipelines(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateGraphicsPipelines", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "createInfoCount", toStringFlags, tabCount, tabSize, ToString(createInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCreateInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelines", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(createInfoCount, pPipelines, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "createInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, createInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelines", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, createInfoCount, pPipelines, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1318,15 +1561,22 @@ void VulkanAsciiConsumer::Process_vkCreateComputePipelines(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateComputePipelines", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "createInfoCount", toStringFlags, tabCount, tabSize, ToString(createInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCreateInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelines", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(createInfoCount, pPipelines, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "createInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, createInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelines", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, createInfoCount, pPipelines, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1341,11 +1591,14 @@ void VulkanAsciiConsumer::Process_vkDestroyPipeline(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyPipeline", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1362,13 +1615,18 @@ void VulkanAsciiConsumer::Process_vkCreatePipelineLayout(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreatePipelineLayout", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelineLayout", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pPipelineLayout));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelineLayout", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pPipelineLayout);
         }
     );
 }
@@ -1383,11 +1641,14 @@ void VulkanAsciiConsumer::Process_vkDestroyPipelineLayout(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyPipelineLayout", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineLayout", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineLayout));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineLayout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineLayout);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1404,13 +1665,18 @@ void VulkanAsciiConsumer::Process_vkCreateSampler(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSampler", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSampler", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSampler));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSampler", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSampler);
         }
     );
 }
@@ -1425,11 +1691,14 @@ void VulkanAsciiConsumer::Process_vkDestroySampler(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySampler", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "sampler", toStringFlags, tabCount, tabSize, HandleIdToString(sampler));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "sampler", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, sampler);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1446,13 +1715,18 @@ void VulkanAsciiConsumer::Process_vkCreateDescriptorSetLayout(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDescriptorSetLayout", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSetLayout", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSetLayout));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSetLayout", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSetLayout);
         }
     );
 }
@@ -1467,11 +1741,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDescriptorSetLayout(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDescriptorSetLayout", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorSetLayout", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorSetLayout));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorSetLayout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorSetLayout);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1488,13 +1765,18 @@ void VulkanAsciiConsumer::Process_vkCreateDescriptorPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDescriptorPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDescriptorPool", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDescriptorPool));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDescriptorPool", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDescriptorPool);
         }
     );
 }
@@ -1509,11 +1791,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDescriptorPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDescriptorPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorPool", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorPool));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorPool);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1529,12 +1814,16 @@ void VulkanAsciiConsumer::Process_vkResetDescriptorPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetDescriptorPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorPool", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorPool));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorPool);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1551,13 +1840,18 @@ void VulkanAsciiConsumer::Process_vkFreeDescriptorSets(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkFreeDescriptorSets", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorPool", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorPool));
-            FieldToString(strStrm, false, "descriptorSetCount", toStringFlags, tabCount, tabSize, ToString(descriptorSetCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDescriptorSets", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorPool);
+            FieldToString(strBuf, false, "descriptorSetCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, descriptorSetCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDescriptorSets", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1574,13 +1868,18 @@ void VulkanAsciiConsumer::Process_vkUpdateDescriptorSets(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkUpdateDescriptorSets", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorWriteCount", toStringFlags, tabCount, tabSize, ToString(descriptorWriteCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDescriptorWrites", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(descriptorWriteCount, pDescriptorWrites, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "descriptorCopyCount", toStringFlags, tabCount, tabSize, ToString(descriptorCopyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDescriptorCopies", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(descriptorCopyCount, pDescriptorCopies, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorWriteCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, descriptorWriteCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDescriptorWrites", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, descriptorWriteCount, pDescriptorWrites, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "descriptorCopyCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, descriptorCopyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDescriptorCopies", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, descriptorCopyCount, pDescriptorCopies, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1597,13 +1896,18 @@ void VulkanAsciiConsumer::Process_vkCreateFramebuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateFramebuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFramebuffer", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pFramebuffer));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFramebuffer", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pFramebuffer);
         }
     );
 }
@@ -1618,11 +1922,14 @@ void VulkanAsciiConsumer::Process_vkDestroyFramebuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyFramebuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "framebuffer", toStringFlags, tabCount, tabSize, HandleIdToString(framebuffer));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "framebuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, framebuffer);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1639,13 +1946,18 @@ void VulkanAsciiConsumer::Process_vkCreateRenderPass(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateRenderPass", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pRenderPass));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pRenderPass);
         }
     );
 }
@@ -1660,11 +1972,14 @@ void VulkanAsciiConsumer::Process_vkDestroyRenderPass(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyRenderPass", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "renderPass", toStringFlags, tabCount, tabSize, HandleIdToString(renderPass));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "renderPass", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, renderPass);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1679,11 +1994,14 @@ void VulkanAsciiConsumer::Process_vkGetRenderAreaGranularity(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRenderAreaGranularity", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "renderPass", toStringFlags, tabCount, tabSize, HandleIdToString(renderPass));
-            FieldToString(strStrm, false, "[out]pGranularity", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGranularity, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "renderPass", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, renderPass);
+            FieldToString(strBuf, false, "[out]pGranularity", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGranularity, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1700,13 +2018,18 @@ void VulkanAsciiConsumer::Process_vkCreateCommandPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateCommandPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCommandPool", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pCommandPool));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCommandPool", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pCommandPool);
         }
     );
 }
@@ -1721,11 +2044,14 @@ void VulkanAsciiConsumer::Process_vkDestroyCommandPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyCommandPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "commandPool", toStringFlags, tabCount, tabSize, HandleIdToString(commandPool));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "commandPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandPool);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1741,12 +2067,16 @@ void VulkanAsciiConsumer::Process_vkResetCommandPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetCommandPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "commandPool", toStringFlags, tabCount, tabSize, HandleIdToString(commandPool));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "commandPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandPool);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1762,12 +2092,16 @@ void VulkanAsciiConsumer::Process_vkFreeCommandBuffers(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkFreeCommandBuffers", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "commandPool", toStringFlags, tabCount, tabSize, HandleIdToString(commandPool));
-            FieldToString(strStrm, false, "commandBufferCount", toStringFlags, tabCount, tabSize, ToString(commandBufferCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCommandBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "commandPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandPool);
+            FieldToString(strBuf, false, "commandBufferCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, commandBufferCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCommandBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1782,11 +2116,14 @@ void VulkanAsciiConsumer::Process_vkBeginCommandBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBeginCommandBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pBeginInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pBeginInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pBeginInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pBeginInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1800,10 +2137,12 @@ void VulkanAsciiConsumer::Process_vkEndCommandBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkEndCommandBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
         }
     );
 }
@@ -1818,11 +2157,14 @@ void VulkanAsciiConsumer::Process_vkResetCommandBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetCommandBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1837,11 +2179,14 @@ void VulkanAsciiConsumer::Process_vkCmdBindPipeline(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindPipeline", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineBindPoint, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineBindPoint, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
         }
     );
 }
@@ -1857,12 +2202,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetViewport(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetViewport", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstViewport", toStringFlags, tabCount, tabSize, ToString(firstViewport, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "viewportCount", toStringFlags, tabCount, tabSize, ToString(viewportCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pViewports", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(viewportCount, pViewports, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstViewport", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstViewport, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "viewportCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, viewportCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pViewports", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, viewportCount, pViewports, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1878,12 +2227,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetScissor(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetScissor", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstScissor", toStringFlags, tabCount, tabSize, ToString(firstScissor, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "scissorCount", toStringFlags, tabCount, tabSize, ToString(scissorCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pScissors", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(scissorCount, pScissors, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstScissor", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstScissor, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "scissorCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, scissorCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pScissors", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, scissorCount, pScissors, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1897,10 +2250,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetLineWidth(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetLineWidth", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "lineWidth", toStringFlags, tabCount, tabSize, ToString(lineWidth, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "lineWidth", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, lineWidth, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1916,12 +2271,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthBias(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthBias", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthBiasConstantFactor", toStringFlags, tabCount, tabSize, ToString(depthBiasConstantFactor, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "depthBiasClamp", toStringFlags, tabCount, tabSize, ToString(depthBiasClamp, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "depthBiasSlopeFactor", toStringFlags, tabCount, tabSize, ToString(depthBiasSlopeFactor, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthBiasConstantFactor", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthBiasConstantFactor, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "depthBiasClamp", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthBiasClamp, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "depthBiasSlopeFactor", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthBiasSlopeFactor, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1935,10 +2294,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetBlendConstants(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetBlendConstants", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "blendConstants", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(4, blendConstants, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "blendConstants", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, 4, blendConstants, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1953,11 +2314,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthBounds(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthBounds", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "minDepthBounds", toStringFlags, tabCount, tabSize, ToString(minDepthBounds, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDepthBounds", toStringFlags, tabCount, tabSize, ToString(maxDepthBounds, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "minDepthBounds", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, minDepthBounds, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDepthBounds", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDepthBounds, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1972,11 +2336,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetStencilCompareMask(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetStencilCompareMask", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "faceMask", toStringFlags, tabCount, tabSize, ToString(faceMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "compareMask", toStringFlags, tabCount, tabSize, ToString(compareMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "faceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, faceMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "compareMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, compareMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -1991,11 +2358,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetStencilWriteMask(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetStencilWriteMask", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "faceMask", toStringFlags, tabCount, tabSize, ToString(faceMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "writeMask", toStringFlags, tabCount, tabSize, ToString(writeMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "faceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, faceMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "writeMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, writeMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2010,11 +2380,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetStencilReference(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetStencilReference", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "faceMask", toStringFlags, tabCount, tabSize, ToString(faceMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "reference", toStringFlags, tabCount, tabSize, ToString(reference, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "faceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, faceMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "reference", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, reference, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2034,16 +2407,24 @@ void VulkanAsciiConsumer::Process_vkCmdBindDescriptorSets(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindDescriptorSets", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineBindPoint, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "layout", toStringFlags, tabCount, tabSize, HandleIdToString(layout));
-            FieldToString(strStrm, false, "firstSet", toStringFlags, tabCount, tabSize, ToString(firstSet, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "descriptorSetCount", toStringFlags, tabCount, tabSize, ToString(descriptorSetCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDescriptorSets", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dynamicOffsetCount", toStringFlags, tabCount, tabSize, ToString(dynamicOffsetCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDynamicOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(dynamicOffsetCount, pDynamicOffsets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineBindPoint, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "layout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, layout);
+            FieldToString(strBuf, false, "firstSet", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstSet, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "descriptorSetCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, descriptorSetCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDescriptorSets", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, descriptorSetCount, pDescriptorSets, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dynamicOffsetCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dynamicOffsetCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDynamicOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, dynamicOffsetCount, pDynamicOffsets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2059,12 +2440,16 @@ void VulkanAsciiConsumer::Process_vkCmdBindIndexBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindIndexBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "indexType", toStringFlags, tabCount, tabSize, '"' + ToString(indexType, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "indexType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, indexType, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2081,13 +2466,18 @@ void VulkanAsciiConsumer::Process_vkCmdBindVertexBuffers(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindVertexBuffers", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstBinding", toStringFlags, tabCount, tabSize, ToString(firstBinding, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "bindingCount", toStringFlags, tabCount, tabSize, ToString(bindingCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(bindingCount, pBuffers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pOffsets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstBinding", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstBinding, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "bindingCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindingCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, bindingCount, pBuffers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pOffsets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2104,13 +2494,18 @@ void VulkanAsciiConsumer::Process_vkCmdDraw(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDraw", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "vertexCount", toStringFlags, tabCount, tabSize, ToString(vertexCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "instanceCount", toStringFlags, tabCount, tabSize, ToString(instanceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstVertex", toStringFlags, tabCount, tabSize, ToString(firstVertex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstInstance", toStringFlags, tabCount, tabSize, ToString(firstInstance, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "vertexCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, vertexCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instanceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstVertex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstVertex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstInstance", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstInstance, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2128,14 +2523,20 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndexed(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndexed", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "indexCount", toStringFlags, tabCount, tabSize, ToString(indexCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "instanceCount", toStringFlags, tabCount, tabSize, ToString(instanceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstIndex", toStringFlags, tabCount, tabSize, ToString(firstIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "vertexOffset", toStringFlags, tabCount, tabSize, ToString(vertexOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstInstance", toStringFlags, tabCount, tabSize, ToString(firstInstance, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "indexCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, indexCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instanceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "vertexOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, vertexOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstInstance", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstInstance, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2152,13 +2553,18 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndirect(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndirect", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "drawCount", toStringFlags, tabCount, tabSize, ToString(drawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "drawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2175,13 +2581,18 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndexedIndirect(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndexedIndirect", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "drawCount", toStringFlags, tabCount, tabSize, ToString(drawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "drawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2197,12 +2608,16 @@ void VulkanAsciiConsumer::Process_vkCmdDispatch(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDispatch", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "groupCountX", toStringFlags, tabCount, tabSize, ToString(groupCountX, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountY", toStringFlags, tabCount, tabSize, ToString(groupCountY, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountZ", toStringFlags, tabCount, tabSize, ToString(groupCountZ, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "groupCountX", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountX, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountY", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountY, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountZ", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountZ, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2217,11 +2632,14 @@ void VulkanAsciiConsumer::Process_vkCmdDispatchIndirect(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDispatchIndirect", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2238,13 +2656,18 @@ void VulkanAsciiConsumer::Process_vkCmdCopyBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(srcBuffer));
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcBuffer);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2263,15 +2686,22 @@ void VulkanAsciiConsumer::Process_vkCmdCopyImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcImage", toStringFlags, tabCount, tabSize, HandleIdToString(srcImage));
-            FieldToString(strStrm, false, "srcImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(srcImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dstImage", toStringFlags, tabCount, tabSize, HandleIdToString(dstImage));
-            FieldToString(strStrm, false, "dstImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(dstImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcImage);
+            FieldToString(strBuf, false, "srcImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, srcImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstImage);
+            FieldToString(strBuf, false, "dstImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, dstImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2291,16 +2721,24 @@ void VulkanAsciiConsumer::Process_vkCmdBlitImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBlitImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcImage", toStringFlags, tabCount, tabSize, HandleIdToString(srcImage));
-            FieldToString(strStrm, false, "srcImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(srcImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dstImage", toStringFlags, tabCount, tabSize, HandleIdToString(dstImage));
-            FieldToString(strStrm, false, "dstImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(dstImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "filter", toStringFlags, tabCount, tabSize, '"' + ToString(filter, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcImage);
+            FieldToString(strBuf, false, "srcImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, srcImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstImage);
+            FieldToString(strBuf, false, "dstImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, dstImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "filter", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, filter, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2318,14 +2756,20 @@ void VulkanAsciiConsumer::Process_vkCmdCopyBufferToImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyBufferToImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(srcBuffer));
-            FieldToString(strStrm, false, "dstImage", toStringFlags, tabCount, tabSize, HandleIdToString(dstImage));
-            FieldToString(strStrm, false, "dstImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(dstImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcBuffer);
+            FieldToString(strBuf, false, "dstImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstImage);
+            FieldToString(strBuf, false, "dstImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, dstImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2343,14 +2787,20 @@ void VulkanAsciiConsumer::Process_vkCmdCopyImageToBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyImageToBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcImage", toStringFlags, tabCount, tabSize, HandleIdToString(srcImage));
-            FieldToString(strStrm, false, "srcImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(srcImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcImage);
+            FieldToString(strBuf, false, "srcImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, srcImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2367,13 +2817,18 @@ void VulkanAsciiConsumer::Process_vkCmdUpdateBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdUpdateBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "dstOffset", toStringFlags, tabCount, tabSize, ToString(dstOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "dstOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -2390,13 +2845,18 @@ void VulkanAsciiConsumer::Process_vkCmdFillBuffer(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdFillBuffer", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "dstOffset", toStringFlags, tabCount, tabSize, ToString(dstOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "size", toStringFlags, tabCount, tabSize, ToString(size, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "data", toStringFlags, tabCount, tabSize, ToString(data, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "dstOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "size", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, size, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "data", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, data, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2414,14 +2874,20 @@ void VulkanAsciiConsumer::Process_vkCmdClearColorImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdClearColorImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "imageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(imageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pColor", toStringFlags, tabCount, tabSize, PointerDecoderToString(pColor, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "rangeCount", toStringFlags, tabCount, tabSize, ToString(rangeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRanges", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(rangeCount, pRanges, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "imageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, imageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pColor", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pColor, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "rangeCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, rangeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRanges", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, rangeCount, pRanges, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2439,14 +2905,20 @@ void VulkanAsciiConsumer::Process_vkCmdClearDepthStencilImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdClearDepthStencilImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "imageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(imageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pDepthStencil", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDepthStencil, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "rangeCount", toStringFlags, tabCount, tabSize, ToString(rangeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRanges", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(rangeCount, pRanges, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "imageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, imageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDepthStencil", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDepthStencil, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "rangeCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, rangeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRanges", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, rangeCount, pRanges, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2463,13 +2935,18 @@ void VulkanAsciiConsumer::Process_vkCmdClearAttachments(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdClearAttachments", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "attachmentCount", toStringFlags, tabCount, tabSize, ToString(attachmentCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAttachments", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(attachmentCount, pAttachments, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "rectCount", toStringFlags, tabCount, tabSize, ToString(rectCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRects", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(rectCount, pRects, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "attachmentCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, attachmentCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAttachments", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, attachmentCount, pAttachments, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "rectCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, rectCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRects", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, rectCount, pRects, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2488,15 +2965,22 @@ void VulkanAsciiConsumer::Process_vkCmdResolveImage(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdResolveImage", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcImage", toStringFlags, tabCount, tabSize, HandleIdToString(srcImage));
-            FieldToString(strStrm, false, "srcImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(srcImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dstImage", toStringFlags, tabCount, tabSize, HandleIdToString(dstImage));
-            FieldToString(strStrm, false, "dstImageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(dstImageLayout, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "regionCount", toStringFlags, tabCount, tabSize, ToString(regionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pRegions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(regionCount, pRegions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, srcImage);
+            FieldToString(strBuf, false, "srcImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, srcImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstImage", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstImage);
+            FieldToString(strBuf, false, "dstImageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, dstImageLayout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "regionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, regionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pRegions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, regionCount, pRegions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2511,11 +2995,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
-            FieldToString(strStrm, false, "stageMask", toStringFlags, tabCount, tabSize, ToString(stageMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
+            FieldToString(strBuf, false, "stageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stageMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2530,11 +3017,14 @@ void VulkanAsciiConsumer::Process_vkCmdResetEvent(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdResetEvent", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
-            FieldToString(strStrm, false, "stageMask", toStringFlags, tabCount, tabSize, ToString(stageMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
+            FieldToString(strBuf, false, "stageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stageMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2557,19 +3047,30 @@ void VulkanAsciiConsumer::Process_vkCmdWaitEvents(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWaitEvents", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "eventCount", toStringFlags, tabCount, tabSize, ToString(eventCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pEvents", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(eventCount, pEvents, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "srcStageMask", toStringFlags, tabCount, tabSize, ToString(srcStageMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstStageMask", toStringFlags, tabCount, tabSize, ToString(dstStageMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "memoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(memoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(memoryBarrierCount, pMemoryBarriers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "bufferMemoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(bufferMemoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBufferMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bufferMemoryBarrierCount, pBufferMemoryBarriers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "imageMemoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(imageMemoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pImageMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(imageMemoryBarrierCount, pImageMemoryBarriers, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "eventCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, eventCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pEvents", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, eventCount, pEvents, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "srcStageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, srcStageMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstStageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstStageMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "memoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, memoryBarrierCount, pMemoryBarriers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "bufferMemoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bufferMemoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBufferMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bufferMemoryBarrierCount, pBufferMemoryBarriers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "imageMemoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, imageMemoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pImageMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, imageMemoryBarrierCount, pImageMemoryBarriers, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2591,18 +3092,28 @@ void VulkanAsciiConsumer::Process_vkCmdPipelineBarrier(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPipelineBarrier", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "srcStageMask", toStringFlags, tabCount, tabSize, ToString(srcStageMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstStageMask", toStringFlags, tabCount, tabSize, ToString(dstStageMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dependencyFlags", toStringFlags, tabCount, tabSize, ToString(dependencyFlags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "memoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(memoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(memoryBarrierCount, pMemoryBarriers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "bufferMemoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(bufferMemoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBufferMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bufferMemoryBarrierCount, pBufferMemoryBarriers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "imageMemoryBarrierCount", toStringFlags, tabCount, tabSize, ToString(imageMemoryBarrierCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pImageMemoryBarriers", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(imageMemoryBarrierCount, pImageMemoryBarriers, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "srcStageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, srcStageMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstStageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstStageMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dependencyFlags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dependencyFlags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "memoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, memoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, memoryBarrierCount, pMemoryBarriers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "bufferMemoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bufferMemoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBufferMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bufferMemoryBarrierCount, pBufferMemoryBarriers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "imageMemoryBarrierCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, imageMemoryBarrierCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pImageMemoryBarriers", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, imageMemoryBarrierCount, pImageMemoryBarriers, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2618,12 +3129,16 @@ void VulkanAsciiConsumer::Process_vkCmdBeginQuery(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginQuery", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2638,11 +3153,14 @@ void VulkanAsciiConsumer::Process_vkCmdEndQuery(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndQuery", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2658,12 +3176,16 @@ void VulkanAsciiConsumer::Process_vkCmdResetQueryPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdResetQueryPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryCount", toStringFlags, tabCount, tabSize, ToString(queryCount, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queryCount, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2679,12 +3201,16 @@ void VulkanAsciiConsumer::Process_vkCmdWriteTimestamp(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteTimestamp", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineStage", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineStage, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineStage", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineStage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2704,16 +3230,24 @@ void VulkanAsciiConsumer::Process_vkCmdCopyQueryPoolResults(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyQueryPoolResults", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryCount", toStringFlags, tabCount, tabSize, ToString(queryCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "dstOffset", toStringFlags, tabCount, tabSize, ToString(dstOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queryCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "dstOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2731,14 +3265,20 @@ void VulkanAsciiConsumer::Process_vkCmdPushConstants(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPushConstants", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "layout", toStringFlags, tabCount, tabSize, HandleIdToString(layout));
-            FieldToString(strStrm, false, "stageFlags", toStringFlags, tabCount, tabSize, ToString(stageFlags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "size", toStringFlags, tabCount, tabSize, ToString(size, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pValues", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pValues));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "layout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, layout);
+            FieldToString(strBuf, false, "stageFlags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stageFlags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "size", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, size, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pValues", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pValues);
         }
     );
 }
@@ -2753,11 +3293,14 @@ void VulkanAsciiConsumer::Process_vkCmdBeginRenderPass(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginRenderPass", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRenderPassBegin, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "contents", toStringFlags, tabCount, tabSize, '"' + ToString(contents, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRenderPassBegin, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "contents", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, contents, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2771,10 +3314,12 @@ void VulkanAsciiConsumer::Process_vkCmdNextSubpass(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdNextSubpass", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "contents", toStringFlags, tabCount, tabSize, '"' + ToString(contents, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "contents", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, contents, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2787,9 +3332,10 @@ void VulkanAsciiConsumer::Process_vkCmdEndRenderPass(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndRenderPass", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
         }
     );
 }
@@ -2804,11 +3350,14 @@ void VulkanAsciiConsumer::Process_vkCmdExecuteCommands(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdExecuteCommands", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "commandBufferCount", toStringFlags, tabCount, tabSize, ToString(commandBufferCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCommandBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "commandBufferCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, commandBufferCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCommandBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, commandBufferCount, pCommandBuffers, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2824,12 +3373,16 @@ void VulkanAsciiConsumer::Process_vkBindBufferMemory2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindBufferMemory2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2845,12 +3398,16 @@ void VulkanAsciiConsumer::Process_vkBindImageMemory2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindImageMemory2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2867,13 +3424,18 @@ void VulkanAsciiConsumer::Process_vkGetDeviceGroupPeerMemoryFeatures(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceGroupPeerMemoryFeatures", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "heapIndex", toStringFlags, tabCount, tabSize, ToString(heapIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "localDeviceIndex", toStringFlags, tabCount, tabSize, ToString(localDeviceIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "remoteDeviceIndex", toStringFlags, tabCount, tabSize, ToString(remoteDeviceIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPeerMemoryFeatures", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPeerMemoryFeatures, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "heapIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, heapIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "localDeviceIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, localDeviceIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "remoteDeviceIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, remoteDeviceIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPeerMemoryFeatures", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPeerMemoryFeatures, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2887,10 +3449,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDeviceMask(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDeviceMask", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "deviceMask", toStringFlags, tabCount, tabSize, ToString(deviceMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "deviceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, deviceMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2909,15 +3473,22 @@ void VulkanAsciiConsumer::Process_vkCmdDispatchBase(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDispatchBase", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "baseGroupX", toStringFlags, tabCount, tabSize, ToString(baseGroupX, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "baseGroupY", toStringFlags, tabCount, tabSize, ToString(baseGroupY, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "baseGroupZ", toStringFlags, tabCount, tabSize, ToString(baseGroupZ, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountX", toStringFlags, tabCount, tabSize, ToString(groupCountX, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountY", toStringFlags, tabCount, tabSize, ToString(groupCountY, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountZ", toStringFlags, tabCount, tabSize, ToString(groupCountZ, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "baseGroupX", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupX, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "baseGroupY", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupY, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "baseGroupZ", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupZ, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountX", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountX, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountY", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountY, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountZ", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountZ, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2933,12 +3504,16 @@ void VulkanAsciiConsumer::Process_vkEnumeratePhysicalDeviceGroups(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkEnumeratePhysicalDeviceGroups", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "[out]pPhysicalDeviceGroupCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPhysicalDeviceGroupCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPhysicalDeviceGroupProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPhysicalDeviceGroupCount, pPhysicalDeviceGroupProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "[out]pPhysicalDeviceGroupCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPhysicalDeviceGroupCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPhysicalDeviceGroupProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPhysicalDeviceGroupCount, pPhysicalDeviceGroupProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2953,11 +3528,14 @@ void VulkanAsciiConsumer::Process_vkGetImageMemoryRequirements2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageMemoryRequirements2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2972,11 +3550,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferMemoryRequirements2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferMemoryRequirements2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -2992,12 +3573,16 @@ void VulkanAsciiConsumer::Process_vkGetImageSparseMemoryRequirements2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageSparseMemoryRequirements2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3011,10 +3596,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFeatures2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFeatures2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pFeatures", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFeatures, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pFeatures", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFeatures, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3028,10 +3615,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceProperties2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3046,11 +3635,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFormatProperties2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFormatProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3066,12 +3658,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceImageFormatProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pImageFormatInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageFormatInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pImageFormatInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageFormatInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3086,11 +3682,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceQueueFamilyProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3104,10 +3703,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceMemoryProperties2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceMemoryProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3123,12 +3724,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSparseImageFormatProperties2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pFormatInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFormatInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pFormatInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFormatInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3143,11 +3748,14 @@ void VulkanAsciiConsumer::Process_vkTrimCommandPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkTrimCommandPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "commandPool", toStringFlags, tabCount, tabSize, HandleIdToString(commandPool));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "commandPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandPool);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3162,11 +3770,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceQueue2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceQueue2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pQueueInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pQueueInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueue", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pQueue));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pQueueInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pQueueInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueue", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pQueue);
         }
     );
 }
@@ -3183,13 +3794,18 @@ void VulkanAsciiConsumer::Process_vkCreateSamplerYcbcrConversion(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSamplerYcbcrConversion", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pYcbcrConversion", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pYcbcrConversion));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pYcbcrConversion", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pYcbcrConversion);
         }
     );
 }
@@ -3204,11 +3820,14 @@ void VulkanAsciiConsumer::Process_vkDestroySamplerYcbcrConversion(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySamplerYcbcrConversion", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "ycbcrConversion", toStringFlags, tabCount, tabSize, HandleIdToString(ycbcrConversion));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "ycbcrConversion", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, ycbcrConversion);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3225,13 +3844,18 @@ void VulkanAsciiConsumer::Process_vkCreateDescriptorUpdateTemplate(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDescriptorUpdateTemplate));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDescriptorUpdateTemplate);
         }
     );
 }
@@ -3246,11 +3870,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDescriptorUpdateTemplate(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorUpdateTemplate));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorUpdateTemplate);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3265,11 +3892,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalBufferProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalBufferProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalBufferInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalBufferInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalBufferProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalBufferProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalBufferInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalBufferInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalBufferProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalBufferProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3284,11 +3914,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalFenceProperties(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalFenceProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalFenceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalFenceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalFenceProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalFenceProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalFenceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalFenceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalFenceProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalFenceProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3303,11 +3936,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalSemaphoreProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalSemaphoreProperties", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalSemaphoreInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalSemaphoreInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalSemaphoreProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalSemaphoreProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalSemaphoreInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalSemaphoreInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalSemaphoreProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalSemaphoreProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3322,11 +3958,14 @@ void VulkanAsciiConsumer::Process_vkGetDescriptorSetLayoutSupport(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDescriptorSetLayoutSupport", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSupport", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSupport, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSupport", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSupport, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3345,15 +3984,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndirectCount(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndirectCount", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3372,15 +4018,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndexedIndirectCount(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndexedIndirectCount", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3397,13 +4050,18 @@ void VulkanAsciiConsumer::Process_vkCreateRenderPass2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateRenderPass2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pRenderPass));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pRenderPass);
         }
     );
 }
@@ -3418,11 +4076,14 @@ void VulkanAsciiConsumer::Process_vkCmdBeginRenderPass2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginRenderPass2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRenderPassBegin, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassBeginInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRenderPassBegin, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassBeginInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3437,11 +4098,14 @@ void VulkanAsciiConsumer::Process_vkCmdNextSubpass2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdNextSubpass2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassBeginInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassEndInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassBeginInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassEndInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3455,10 +4119,12 @@ void VulkanAsciiConsumer::Process_vkCmdEndRenderPass2(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndRenderPass2", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassEndInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassEndInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3474,12 +4140,16 @@ void VulkanAsciiConsumer::Process_vkResetQueryPool(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetQueryPool", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryCount", toStringFlags, tabCount, tabSize, ToString(queryCount, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queryCount, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3495,12 +4165,16 @@ void VulkanAsciiConsumer::Process_vkGetSemaphoreCounterValue(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSemaphoreCounterValue", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "semaphore", toStringFlags, tabCount, tabSize, HandleIdToString(semaphore));
-            FieldToString(strStrm, false, "[out]pValue", toStringFlags, tabCount, tabSize, PointerDecoderToString(pValue, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "semaphore", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, semaphore);
+            FieldToString(strBuf, false, "[out]pValue", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pValue, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3516,12 +4190,16 @@ void VulkanAsciiConsumer::Process_vkWaitSemaphores(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkWaitSemaphores", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pWaitInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pWaitInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "timeout", toStringFlags, tabCount, tabSize, ToString(timeout, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pWaitInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pWaitInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "timeout", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timeout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3536,11 +4214,14 @@ void VulkanAsciiConsumer::Process_vkSignalSemaphore(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSignalSemaphore", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pSignalInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSignalInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pSignalInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSignalInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3555,11 +4236,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferDeviceAddress(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferDeviceAddress", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3574,11 +4258,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferOpaqueCaptureAddress(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferOpaqueCaptureAddress", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3593,11 +4280,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddress(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceMemoryOpaqueCaptureAddress", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3612,11 +4302,14 @@ void VulkanAsciiConsumer::Process_vkDestroySurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3633,13 +4326,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceSupportKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pSupported", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSupported, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pSupported", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSupported, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3655,12 +4353,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceCapabilitiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3677,13 +4379,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceFormatsKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceFormatsKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pSurfaceFormatCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceFormatCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurfaceFormats", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pSurfaceFormatCount, pSurfaceFormats, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pSurfaceFormatCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceFormatCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurfaceFormats", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pSurfaceFormatCount, pSurfaceFormats, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3700,13 +4407,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfacePresentModesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfacePresentModesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pPresentModeCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPresentModeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPresentModes", toStringFlags, tabCount, tabSize, EnumPointerDecoderArrayToString(pPresentModeCount, pPresentModes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pPresentModeCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPresentModeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPresentModes", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderArrayToString(strBuf, pPresentModeCount, pPresentModes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3723,13 +4435,18 @@ void VulkanAsciiConsumer::Process_vkCreateSwapchainKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSwapchainKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSwapchain", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSwapchain));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSwapchain", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSwapchain);
         }
     );
 }
@@ -3744,11 +4461,14 @@ void VulkanAsciiConsumer::Process_vkDestroySwapchainKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySwapchainKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3765,13 +4485,18 @@ void VulkanAsciiConsumer::Process_vkGetSwapchainImagesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSwapchainImagesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "[out]pSwapchainImageCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSwapchainImageCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSwapchainImages", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(pSwapchainImageCount, pSwapchainImages, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "[out]pSwapchainImageCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSwapchainImageCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSwapchainImages", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, pSwapchainImageCount, pSwapchainImages, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3790,15 +4515,22 @@ void VulkanAsciiConsumer::Process_vkAcquireNextImageKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireNextImageKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "timeout", toStringFlags, tabCount, tabSize, ToString(timeout, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "semaphore", toStringFlags, tabCount, tabSize, HandleIdToString(semaphore));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
-            FieldToString(strStrm, false, "[out]pImageIndex", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageIndex, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "timeout", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timeout, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "semaphore", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, semaphore);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
+            FieldToString(strBuf, false, "[out]pImageIndex", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageIndex, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3813,11 +4545,14 @@ void VulkanAsciiConsumer::Process_vkQueuePresentKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueuePresentKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "pPresentInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPresentInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "pPresentInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPresentInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3832,11 +4567,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceGroupPresentCapabilitiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceGroupPresentCapabilitiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "[out]pDeviceGroupPresentCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDeviceGroupPresentCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "[out]pDeviceGroupPresentCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDeviceGroupPresentCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3852,12 +4590,16 @@ void VulkanAsciiConsumer::Process_vkGetDeviceGroupSurfacePresentModesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceGroupSurfacePresentModesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pModes", toStringFlags, tabCount, tabSize, PointerDecoderToString(pModes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pModes", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pModes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3874,13 +4616,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDevicePresentRectanglesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDevicePresentRectanglesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pRectCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRectCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pRects", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pRectCount, pRects, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pRectCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRectCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pRects", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pRectCount, pRects, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3896,12 +4643,16 @@ void VulkanAsciiConsumer::Process_vkAcquireNextImage2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireNextImage2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAcquireInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAcquireInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pImageIndex", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageIndex, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAcquireInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAcquireInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pImageIndex", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageIndex, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3917,12 +4668,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceDisplayPropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceDisplayPropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3938,12 +4693,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceDisplayPlanePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3960,13 +4719,18 @@ void VulkanAsciiConsumer::Process_vkGetDisplayPlaneSupportedDisplaysKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDisplayPlaneSupportedDisplaysKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "planeIndex", toStringFlags, tabCount, tabSize, ToString(planeIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDisplayCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDisplayCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDisplays", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(pDisplayCount, pDisplays, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "planeIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, planeIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDisplayCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDisplayCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDisplays", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, pDisplayCount, pDisplays, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -3983,13 +4747,18 @@ void VulkanAsciiConsumer::Process_vkGetDisplayModePropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDisplayModePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4007,14 +4776,20 @@ void VulkanAsciiConsumer::Process_vkCreateDisplayModeKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDisplayModeKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMode", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pMode));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMode", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pMode);
         }
     );
 }
@@ -4031,13 +4806,18 @@ void VulkanAsciiConsumer::Process_vkGetDisplayPlaneCapabilitiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDisplayPlaneCapabilitiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "mode", toStringFlags, tabCount, tabSize, HandleIdToString(mode));
-            FieldToString(strStrm, false, "planeIndex", toStringFlags, tabCount, tabSize, ToString(planeIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "mode", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, mode);
+            FieldToString(strBuf, false, "planeIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, planeIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4054,13 +4834,18 @@ void VulkanAsciiConsumer::Process_vkCreateDisplayPlaneSurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDisplayPlaneSurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4078,14 +4863,20 @@ void VulkanAsciiConsumer::Process_vkCreateSharedSwapchainsKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSharedSwapchainsKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchainCount", toStringFlags, tabCount, tabSize, ToString(swapchainCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCreateInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(swapchainCount, pCreateInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSwapchains", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(swapchainCount, pSwapchains, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchainCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, swapchainCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, swapchainCount, pCreateInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSwapchains", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, swapchainCount, pSwapchains, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4102,13 +4893,18 @@ void VulkanAsciiConsumer::Process_vkCreateXlibSurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateXlibSurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4125,13 +4921,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceXlibPresentationSupportKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceXlibPresentationSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dpy", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(dpy));
-            FieldToString(strStrm, false, "visualID", toStringFlags, tabCount, tabSize, ToString(visualID, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dpy", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, dpy);
+            FieldToString(strBuf, false, "visualID", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, visualID, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4148,13 +4949,18 @@ void VulkanAsciiConsumer::Process_vkCreateXcbSurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateXcbSurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4171,13 +4977,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceXcbPresentationSupportKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceXcbPresentationSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "connection", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(connection));
-            FieldToString(strStrm, false, "visual_id", toStringFlags, tabCount, tabSize, ToString(visual_id, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "connection", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, connection);
+            FieldToString(strBuf, false, "visual_id", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, visual_id, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4194,13 +5005,18 @@ void VulkanAsciiConsumer::Process_vkCreateWaylandSurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateWaylandSurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4216,12 +5032,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceWaylandPresentationSupportK
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceWaylandPresentationSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, display);
         }
     );
 }
@@ -4238,13 +5058,18 @@ void VulkanAsciiConsumer::Process_vkCreateAndroidSurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateAndroidSurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4261,13 +5086,18 @@ void VulkanAsciiConsumer::Process_vkCreateWin32SurfaceKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateWin32SurfaceKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -4282,11 +5112,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceWin32PresentationSupportKHR
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceWin32PresentationSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4300,10 +5133,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFeatures2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFeatures2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pFeatures", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFeatures, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pFeatures", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFeatures, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4317,10 +5152,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4335,11 +5172,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFormatProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFormatProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4355,12 +5195,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceImageFormatProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pImageFormatInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageFormatInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImageFormatProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pImageFormatInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageFormatInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pImageFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImageFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4375,11 +5219,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceQueueFamilyProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pQueueFamilyPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pQueueFamilyPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pQueueFamilyProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pQueueFamilyPropertyCount, pQueueFamilyProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4393,10 +5240,12 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceMemoryProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceMemoryProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pMemoryProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4412,12 +5261,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSparseImageFormatProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pFormatInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFormatInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pFormatInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFormatInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4434,13 +5287,18 @@ void VulkanAsciiConsumer::Process_vkGetDeviceGroupPeerMemoryFeaturesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceGroupPeerMemoryFeaturesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "heapIndex", toStringFlags, tabCount, tabSize, ToString(heapIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "localDeviceIndex", toStringFlags, tabCount, tabSize, ToString(localDeviceIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "remoteDeviceIndex", toStringFlags, tabCount, tabSize, ToString(remoteDeviceIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPeerMemoryFeatures", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPeerMemoryFeatures, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "heapIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, heapIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "localDeviceIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, localDeviceIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "remoteDeviceIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, remoteDeviceIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPeerMemoryFeatures", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPeerMemoryFeatures, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4454,10 +5312,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDeviceMaskKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDeviceMaskKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "deviceMask", toStringFlags, tabCount, tabSize, ToString(deviceMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "deviceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, deviceMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4476,15 +5336,22 @@ void VulkanAsciiConsumer::Process_vkCmdDispatchBaseKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDispatchBaseKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "baseGroupX", toStringFlags, tabCount, tabSize, ToString(baseGroupX, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "baseGroupY", toStringFlags, tabCount, tabSize, ToString(baseGroupY, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "baseGroupZ", toStringFlags, tabCount, tabSize, ToString(baseGroupZ, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountX", toStringFlags, tabCount, tabSize, ToString(groupCountX, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountY", toStringFlags, tabCount, tabSize, ToString(groupCountY, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCountZ", toStringFlags, tabCount, tabSize, ToString(groupCountZ, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "baseGroupX", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupX, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "baseGroupY", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupY, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "baseGroupZ", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, baseGroupZ, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountX", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountX, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountY", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountY, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCountZ", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCountZ, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4499,11 +5366,14 @@ void VulkanAsciiConsumer::Process_vkTrimCommandPoolKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkTrimCommandPoolKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "commandPool", toStringFlags, tabCount, tabSize, HandleIdToString(commandPool));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "commandPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandPool);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4519,12 +5389,16 @@ void VulkanAsciiConsumer::Process_vkEnumeratePhysicalDeviceGroupsKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkEnumeratePhysicalDeviceGroupsKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "[out]pPhysicalDeviceGroupCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPhysicalDeviceGroupCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPhysicalDeviceGroupProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPhysicalDeviceGroupCount, pPhysicalDeviceGroupProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "[out]pPhysicalDeviceGroupCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPhysicalDeviceGroupCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPhysicalDeviceGroupProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPhysicalDeviceGroupCount, pPhysicalDeviceGroupProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4539,11 +5413,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalBufferPropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalBufferInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalBufferInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalBufferProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalBufferProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalBufferInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalBufferInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalBufferProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalBufferProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4559,12 +5436,16 @@ void VulkanAsciiConsumer::Process_vkGetMemoryWin32HandleKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryWin32HandleKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetWin32HandleInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pHandle", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pHandle));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetWin32HandleInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pHandle", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pHandle);
         }
     );
 }
@@ -4581,13 +5462,18 @@ void VulkanAsciiConsumer::Process_vkGetMemoryWin32HandlePropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryWin32HandlePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "handleType", toStringFlags, tabCount, tabSize, '"' + ToString(handleType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "handle", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(handle));
-            FieldToString(strStrm, false, "[out]pMemoryWin32HandleProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryWin32HandleProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "handleType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, handleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "handle", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, handle);
+            FieldToString(strBuf, false, "[out]pMemoryWin32HandleProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryWin32HandleProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4603,12 +5489,16 @@ void VulkanAsciiConsumer::Process_vkGetMemoryFdKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryFdKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetFdInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetFdInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFd", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFd, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetFdInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetFdInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFd", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFd, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4625,13 +5515,18 @@ void VulkanAsciiConsumer::Process_vkGetMemoryFdPropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryFdPropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "handleType", toStringFlags, tabCount, tabSize, '"' + ToString(handleType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "fd", toStringFlags, tabCount, tabSize, ToString(fd, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryFdProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryFdProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "handleType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, handleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "fd", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, fd, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryFdProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryFdProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4646,11 +5541,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalSemaphoreProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalSemaphorePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalSemaphoreInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalSemaphoreInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalSemaphoreProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalSemaphoreProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalSemaphoreInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalSemaphoreInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalSemaphoreProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalSemaphoreProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4665,11 +5563,14 @@ void VulkanAsciiConsumer::Process_vkImportSemaphoreWin32HandleKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkImportSemaphoreWin32HandleKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pImportSemaphoreWin32HandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImportSemaphoreWin32HandleInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pImportSemaphoreWin32HandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImportSemaphoreWin32HandleInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4685,12 +5586,16 @@ void VulkanAsciiConsumer::Process_vkGetSemaphoreWin32HandleKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSemaphoreWin32HandleKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetWin32HandleInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pHandle", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pHandle));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetWin32HandleInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pHandle", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pHandle);
         }
     );
 }
@@ -4705,11 +5610,14 @@ void VulkanAsciiConsumer::Process_vkImportSemaphoreFdKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkImportSemaphoreFdKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pImportSemaphoreFdInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImportSemaphoreFdInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pImportSemaphoreFdInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImportSemaphoreFdInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4725,12 +5633,16 @@ void VulkanAsciiConsumer::Process_vkGetSemaphoreFdKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSemaphoreFdKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetFdInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetFdInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFd", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFd, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetFdInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetFdInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFd", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFd, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4748,14 +5660,20 @@ void VulkanAsciiConsumer::Process_vkCmdPushDescriptorSetKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPushDescriptorSetKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineBindPoint, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "layout", toStringFlags, tabCount, tabSize, HandleIdToString(layout));
-            FieldToString(strStrm, false, "set", toStringFlags, tabCount, tabSize, ToString(set, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "descriptorWriteCount", toStringFlags, tabCount, tabSize, ToString(descriptorWriteCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDescriptorWrites", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(descriptorWriteCount, pDescriptorWrites, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineBindPoint, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "layout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, layout);
+            FieldToString(strBuf, false, "set", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, set, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "descriptorWriteCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, descriptorWriteCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDescriptorWrites", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, descriptorWriteCount, pDescriptorWrites, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4772,13 +5690,18 @@ void VulkanAsciiConsumer::Process_vkCreateDescriptorUpdateTemplateKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDescriptorUpdateTemplateKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDescriptorUpdateTemplate));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDescriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDescriptorUpdateTemplate);
         }
     );
 }
@@ -4793,11 +5716,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDescriptorUpdateTemplateKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDescriptorUpdateTemplateKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize, HandleIdToString(descriptorUpdateTemplate));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "descriptorUpdateTemplate", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, descriptorUpdateTemplate);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4814,13 +5740,18 @@ void VulkanAsciiConsumer::Process_vkCreateRenderPass2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateRenderPass2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pRenderPass));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pRenderPass", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pRenderPass);
         }
     );
 }
@@ -4835,11 +5766,14 @@ void VulkanAsciiConsumer::Process_vkCmdBeginRenderPass2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginRenderPass2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRenderPassBegin, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassBeginInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pRenderPassBegin", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRenderPassBegin, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassBeginInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4854,11 +5788,14 @@ void VulkanAsciiConsumer::Process_vkCmdNextSubpass2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdNextSubpass2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassBeginInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassEndInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pSubpassBeginInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassBeginInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassEndInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4872,10 +5809,12 @@ void VulkanAsciiConsumer::Process_vkCmdEndRenderPass2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndRenderPass2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSubpassEndInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pSubpassEndInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSubpassEndInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4890,11 +5829,14 @@ void VulkanAsciiConsumer::Process_vkGetSwapchainStatusKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSwapchainStatusKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
         }
     );
 }
@@ -4909,11 +5851,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalFencePropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalFencePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pExternalFenceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalFenceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalFenceProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalFenceProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pExternalFenceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalFenceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalFenceProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalFenceProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4928,11 +5873,14 @@ void VulkanAsciiConsumer::Process_vkImportFenceWin32HandleKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkImportFenceWin32HandleKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pImportFenceWin32HandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImportFenceWin32HandleInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pImportFenceWin32HandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImportFenceWin32HandleInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4948,12 +5896,16 @@ void VulkanAsciiConsumer::Process_vkGetFenceWin32HandleKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetFenceWin32HandleKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetWin32HandleInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pHandle", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pHandle));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetWin32HandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetWin32HandleInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pHandle", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pHandle);
         }
     );
 }
@@ -4968,11 +5920,14 @@ void VulkanAsciiConsumer::Process_vkImportFenceFdKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkImportFenceFdKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pImportFenceFdInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImportFenceFdInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pImportFenceFdInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImportFenceFdInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -4988,12 +5943,16 @@ void VulkanAsciiConsumer::Process_vkGetFenceFdKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetFenceFdKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetFdInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetFdInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFd", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFd, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetFdInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetFdInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFd", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFd, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5011,14 +5970,20 @@ void VulkanAsciiConsumer::Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanc
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCounterCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCounterCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCounters", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pCounterCount, pCounters, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCounterDescriptions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pCounterCount, pCounterDescriptions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCounterCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCounterCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCounters", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pCounterCount, pCounters, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCounterDescriptions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pCounterCount, pCounterDescriptions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5033,11 +5998,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceQueueFamilyPerformanceQuery
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pPerformanceQueryCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPerformanceQueryCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pNumPasses", toStringFlags, tabCount, tabSize, PointerDecoderToString(pNumPasses, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pPerformanceQueryCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPerformanceQueryCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pNumPasses", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pNumPasses, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5052,11 +6020,14 @@ void VulkanAsciiConsumer::Process_vkAcquireProfilingLockKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireProfilingLockKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5069,9 +6040,10 @@ void VulkanAsciiConsumer::Process_vkReleaseProfilingLockKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkReleaseProfilingLockKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
         }
     );
 }
@@ -5087,12 +6059,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceCapabilities2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5109,13 +6085,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceFormats2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceFormats2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurfaceFormatCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceFormatCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurfaceFormats", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pSurfaceFormatCount, pSurfaceFormats, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurfaceFormatCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceFormatCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurfaceFormats", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pSurfaceFormatCount, pSurfaceFormats, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5131,12 +6112,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceDisplayProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceDisplayProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5152,12 +6137,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceDisplayPlaneProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5174,13 +6163,18 @@ void VulkanAsciiConsumer::Process_vkGetDisplayModeProperties2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDisplayModeProperties2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5196,12 +6190,16 @@ void VulkanAsciiConsumer::Process_vkGetDisplayPlaneCapabilities2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDisplayPlaneCapabilities2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pDisplayPlaneInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDisplayPlaneInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pDisplayPlaneInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDisplayPlaneInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5216,11 +6214,14 @@ void VulkanAsciiConsumer::Process_vkGetImageMemoryRequirements2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageMemoryRequirements2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5235,11 +6236,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferMemoryRequirements2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferMemoryRequirements2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5255,12 +6259,16 @@ void VulkanAsciiConsumer::Process_vkGetImageSparseMemoryRequirements2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageSparseMemoryRequirements2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirementCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSparseMemoryRequirementCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSparseMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pSparseMemoryRequirementCount, pSparseMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5277,13 +6285,18 @@ void VulkanAsciiConsumer::Process_vkCreateSamplerYcbcrConversionKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateSamplerYcbcrConversionKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pYcbcrConversion", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pYcbcrConversion));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pYcbcrConversion", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pYcbcrConversion);
         }
     );
 }
@@ -5298,11 +6311,14 @@ void VulkanAsciiConsumer::Process_vkDestroySamplerYcbcrConversionKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroySamplerYcbcrConversionKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "ycbcrConversion", toStringFlags, tabCount, tabSize, HandleIdToString(ycbcrConversion));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "ycbcrConversion", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, ycbcrConversion);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5318,12 +6334,16 @@ void VulkanAsciiConsumer::Process_vkBindBufferMemory2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindBufferMemory2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5339,12 +6359,16 @@ void VulkanAsciiConsumer::Process_vkBindImageMemory2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindImageMemory2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5359,11 +6383,14 @@ void VulkanAsciiConsumer::Process_vkGetDescriptorSetLayoutSupportKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDescriptorSetLayoutSupportKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSupport", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSupport, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSupport", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSupport, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5382,15 +6409,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndirectCountKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndirectCountKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5409,15 +6443,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndexedIndirectCountKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndexedIndirectCountKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5433,12 +6474,16 @@ void VulkanAsciiConsumer::Process_vkGetSemaphoreCounterValueKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSemaphoreCounterValueKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "semaphore", toStringFlags, tabCount, tabSize, HandleIdToString(semaphore));
-            FieldToString(strStrm, false, "[out]pValue", toStringFlags, tabCount, tabSize, PointerDecoderToString(pValue, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "semaphore", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, semaphore);
+            FieldToString(strBuf, false, "[out]pValue", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pValue, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5454,12 +6499,16 @@ void VulkanAsciiConsumer::Process_vkWaitSemaphoresKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkWaitSemaphoresKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pWaitInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pWaitInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "timeout", toStringFlags, tabCount, tabSize, ToString(timeout, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pWaitInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pWaitInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "timeout", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timeout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5474,11 +6523,14 @@ void VulkanAsciiConsumer::Process_vkSignalSemaphoreKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSignalSemaphoreKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pSignalInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSignalInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pSignalInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSignalInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5494,12 +6546,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceFragmentShadingRatesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceFragmentShadingRatesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pFragmentShadingRateCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFragmentShadingRateCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFragmentShadingRates", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pFragmentShadingRateCount, pFragmentShadingRates, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pFragmentShadingRateCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFragmentShadingRateCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFragmentShadingRates", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pFragmentShadingRateCount, pFragmentShadingRates, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5514,11 +6570,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetFragmentShadingRateKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetFragmentShadingRateKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pFragmentSize", toStringFlags, tabCount, tabSize, PointerDecoderToString(pFragmentSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "combinerOps", toStringFlags, tabCount, tabSize, EnumPointerDecoderArrayToString(2, combinerOps, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pFragmentSize", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pFragmentSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "combinerOps", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderArrayToString(strBuf, 2, combinerOps, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5535,13 +6594,18 @@ void VulkanAsciiConsumer::Process_vkWaitForPresentKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkWaitForPresentKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "presentId", toStringFlags, tabCount, tabSize, ToString(presentId, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "timeout", toStringFlags, tabCount, tabSize, ToString(timeout, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "presentId", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, presentId, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "timeout", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timeout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5556,11 +6620,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferDeviceAddressKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferDeviceAddressKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5575,11 +6642,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferOpaqueCaptureAddressKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferOpaqueCaptureAddressKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5594,11 +6664,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceMemoryOpaqueCaptureAddressKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5614,12 +6687,16 @@ void VulkanAsciiConsumer::Process_vkCreateDeferredOperationKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDeferredOperationKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDeferredOperation", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDeferredOperation));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDeferredOperation", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDeferredOperation);
         }
     );
 }
@@ -5634,11 +6711,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDeferredOperationKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDeferredOperationKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "operation", toStringFlags, tabCount, tabSize, HandleIdToString(operation));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "operation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, operation);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5653,11 +6733,14 @@ void VulkanAsciiConsumer::Process_vkGetDeferredOperationMaxConcurrencyKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeferredOperationMaxConcurrencyKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "operation", toStringFlags, tabCount, tabSize, HandleIdToString(operation));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "operation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, operation);
         }
     );
 }
@@ -5672,11 +6755,14 @@ void VulkanAsciiConsumer::Process_vkGetDeferredOperationResultKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeferredOperationResultKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "operation", toStringFlags, tabCount, tabSize, HandleIdToString(operation));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "operation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, operation);
         }
     );
 }
@@ -5691,11 +6777,14 @@ void VulkanAsciiConsumer::Process_vkDeferredOperationJoinKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDeferredOperationJoinKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "operation", toStringFlags, tabCount, tabSize, HandleIdToString(operation));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "operation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, operation);
         }
     );
 }
@@ -5712,13 +6801,18 @@ void VulkanAsciiConsumer::Process_vkGetPipelineExecutablePropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPipelineExecutablePropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pPipelineInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPipelineInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExecutableCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExecutableCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pExecutableCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pPipelineInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPipelineInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExecutableCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExecutableCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pExecutableCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5735,13 +6829,18 @@ void VulkanAsciiConsumer::Process_vkGetPipelineExecutableStatisticsKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPipelineExecutableStatisticsKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pExecutableInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExecutableInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pStatisticCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pStatisticCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pStatistics", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pStatisticCount, pStatistics, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pExecutableInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExecutableInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pStatisticCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pStatisticCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pStatistics", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pStatisticCount, pStatistics, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5758,13 +6857,18 @@ void VulkanAsciiConsumer::Process_vkGetPipelineExecutableInternalRepresentations
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPipelineExecutableInternalRepresentationsKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pExecutableInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExecutableInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pInternalRepresentationCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInternalRepresentationCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pInternalRepresentations", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pInternalRepresentationCount, pInternalRepresentations, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pExecutableInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExecutableInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pInternalRepresentationCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInternalRepresentationCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pInternalRepresentations", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pInternalRepresentationCount, pInternalRepresentations, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5779,11 +6883,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetEvent2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetEvent2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
-            FieldToString(strStrm, false, "pDependencyInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDependencyInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
+            FieldToString(strBuf, false, "pDependencyInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDependencyInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5798,11 +6905,14 @@ void VulkanAsciiConsumer::Process_vkCmdResetEvent2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdResetEvent2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "event", toStringFlags, tabCount, tabSize, HandleIdToString(event));
-            FieldToString(strStrm, false, "stageMask", toStringFlags, tabCount, tabSize, ToString(stageMask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "event", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, event);
+            FieldToString(strBuf, false, "stageMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stageMask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5818,12 +6928,16 @@ void VulkanAsciiConsumer::Process_vkCmdWaitEvents2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWaitEvents2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "eventCount", toStringFlags, tabCount, tabSize, ToString(eventCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pEvents", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(eventCount, pEvents, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDependencyInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(eventCount, pDependencyInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "eventCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, eventCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pEvents", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, eventCount, pEvents, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDependencyInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, eventCount, pDependencyInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5837,10 +6951,12 @@ void VulkanAsciiConsumer::Process_vkCmdPipelineBarrier2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPipelineBarrier2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pDependencyInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDependencyInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pDependencyInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDependencyInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5856,12 +6972,16 @@ void VulkanAsciiConsumer::Process_vkCmdWriteTimestamp2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteTimestamp2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "stage", toStringFlags, tabCount, tabSize, ToString(stage, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "stage", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5878,13 +6998,18 @@ void VulkanAsciiConsumer::Process_vkQueueSubmit2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueSubmit2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "submitCount", toStringFlags, tabCount, tabSize, ToString(submitCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSubmits", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(submitCount, pSubmits, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "fence", toStringFlags, tabCount, tabSize, HandleIdToString(fence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "submitCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, submitCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSubmits", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, submitCount, pSubmits, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "fence", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, fence);
         }
     );
 }
@@ -5901,13 +7026,18 @@ void VulkanAsciiConsumer::Process_vkCmdWriteBufferMarker2AMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteBufferMarker2AMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "stage", toStringFlags, tabCount, tabSize, ToString(stage, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "dstOffset", toStringFlags, tabCount, tabSize, ToString(dstOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "marker", toStringFlags, tabCount, tabSize, ToString(marker, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "stage", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "dstOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "marker", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, marker, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5922,11 +7052,14 @@ void VulkanAsciiConsumer::Process_vkGetQueueCheckpointData2NV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetQueueCheckpointData2NV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "[out]pCheckpointDataCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCheckpointDataCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCheckpointData", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pCheckpointDataCount, pCheckpointData, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "[out]pCheckpointDataCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCheckpointDataCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCheckpointData", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pCheckpointDataCount, pCheckpointData, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5940,10 +7073,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyBuffer2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyBuffer2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pCopyBufferInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCopyBufferInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pCopyBufferInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCopyBufferInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5957,10 +7092,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyImage2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyImage2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pCopyImageInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCopyImageInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pCopyImageInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCopyImageInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5974,10 +7111,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyBufferToImage2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyBufferToImage2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pCopyBufferToImageInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCopyBufferToImageInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pCopyBufferToImageInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCopyBufferToImageInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -5991,10 +7130,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyImageToBuffer2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyImageToBuffer2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pCopyImageToBufferInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCopyImageToBufferInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pCopyImageToBufferInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCopyImageToBufferInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6008,10 +7149,12 @@ void VulkanAsciiConsumer::Process_vkCmdBlitImage2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBlitImage2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pBlitImageInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pBlitImageInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pBlitImageInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pBlitImageInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6025,10 +7168,12 @@ void VulkanAsciiConsumer::Process_vkCmdResolveImage2KHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdResolveImage2KHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pResolveImageInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pResolveImageInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pResolveImageInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pResolveImageInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6045,13 +7190,18 @@ void VulkanAsciiConsumer::Process_vkCreateDebugReportCallbackEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDebugReportCallbackEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCallback", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pCallback));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCallback", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pCallback);
         }
     );
 }
@@ -6066,11 +7216,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDebugReportCallbackEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDebugReportCallbackEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "callback", toStringFlags, tabCount, tabSize, HandleIdToString(callback));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "callback", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, callback);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6090,16 +7243,24 @@ void VulkanAsciiConsumer::Process_vkDebugReportMessageEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDebugReportMessageEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "objectType", toStringFlags, tabCount, tabSize, '"' + ToString(objectType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "object", toStringFlags, tabCount, tabSize, ToString(object, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "location", toStringFlags, tabCount, tabSize, ToString(location, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "messageCode", toStringFlags, tabCount, tabSize, ToString(messageCode, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pLayerPrefix", toStringFlags, tabCount, tabSize, StringDecoderToString(pLayerPrefix));
-            FieldToString(strStrm, false, "pMessage", toStringFlags, tabCount, tabSize, StringDecoderToString(pMessage));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "objectType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, objectType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "object", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, object, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "location", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, location, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "messageCode", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, messageCode, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pLayerPrefix", toStringFlags, tabCount, tabSize);
+            StringDecoderToString(strBuf, pLayerPrefix);
+            FieldToString(strBuf, false, "pMessage", toStringFlags, tabCount, tabSize);
+            StringDecoderToString(strBuf, pMessage);
         }
     );
 }
@@ -6114,11 +7275,14 @@ void VulkanAsciiConsumer::Process_vkDebugMarkerSetObjectTagEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDebugMarkerSetObjectTagEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pTagInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pTagInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pTagInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pTagInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6133,11 +7297,14 @@ void VulkanAsciiConsumer::Process_vkDebugMarkerSetObjectNameEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDebugMarkerSetObjectNameEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pNameInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pNameInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pNameInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pNameInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6151,10 +7318,12 @@ void VulkanAsciiConsumer::Process_vkCmdDebugMarkerBeginEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDebugMarkerBeginEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pMarkerInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMarkerInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pMarkerInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMarkerInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6167,9 +7336,10 @@ void VulkanAsciiConsumer::Process_vkCmdDebugMarkerEndEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDebugMarkerEndEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
         }
     );
 }
@@ -6183,10 +7353,12 @@ void VulkanAsciiConsumer::Process_vkCmdDebugMarkerInsertEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDebugMarkerInsertEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pMarkerInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMarkerInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pMarkerInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMarkerInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6204,14 +7376,20 @@ void VulkanAsciiConsumer::Process_vkCmdBindTransformFeedbackBuffersEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindTransformFeedbackBuffersEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstBinding", toStringFlags, tabCount, tabSize, ToString(firstBinding, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "bindingCount", toStringFlags, tabCount, tabSize, ToString(bindingCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(bindingCount, pBuffers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pOffsets, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSizes", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pSizes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstBinding", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstBinding, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "bindingCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindingCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, bindingCount, pBuffers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pOffsets, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSizes", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pSizes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6228,13 +7406,18 @@ void VulkanAsciiConsumer::Process_vkCmdBeginTransformFeedbackEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginTransformFeedbackEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstCounterBuffer", toStringFlags, tabCount, tabSize, ToString(firstCounterBuffer, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "counterBufferCount", toStringFlags, tabCount, tabSize, ToString(counterBufferCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCounterBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(counterBufferCount, pCounterBuffers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCounterBufferOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(counterBufferCount, pCounterBufferOffsets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstCounterBuffer", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstCounterBuffer, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "counterBufferCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, counterBufferCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCounterBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, counterBufferCount, pCounterBuffers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCounterBufferOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, counterBufferCount, pCounterBufferOffsets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6251,13 +7434,18 @@ void VulkanAsciiConsumer::Process_vkCmdEndTransformFeedbackEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndTransformFeedbackEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstCounterBuffer", toStringFlags, tabCount, tabSize, ToString(firstCounterBuffer, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "counterBufferCount", toStringFlags, tabCount, tabSize, ToString(counterBufferCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCounterBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(counterBufferCount, pCounterBuffers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCounterBufferOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(counterBufferCount, pCounterBufferOffsets, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstCounterBuffer", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstCounterBuffer, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "counterBufferCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, counterBufferCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCounterBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, counterBufferCount, pCounterBuffers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCounterBufferOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, counterBufferCount, pCounterBufferOffsets, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6274,13 +7462,18 @@ void VulkanAsciiConsumer::Process_vkCmdBeginQueryIndexedEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginQueryIndexedEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "index", toStringFlags, tabCount, tabSize, ToString(index, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "index", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, index, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6296,12 +7489,16 @@ void VulkanAsciiConsumer::Process_vkCmdEndQueryIndexedEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndQueryIndexedEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "query", toStringFlags, tabCount, tabSize, ToString(query, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "index", toStringFlags, tabCount, tabSize, ToString(index, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "query", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, query, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "index", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, index, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6320,15 +7517,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndirectByteCountEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndirectByteCountEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "instanceCount", toStringFlags, tabCount, tabSize, ToString(instanceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstInstance", toStringFlags, tabCount, tabSize, ToString(firstInstance, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "counterBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(counterBuffer));
-            FieldToString(strStrm, false, "counterBufferOffset", toStringFlags, tabCount, tabSize, ToString(counterBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "counterOffset", toStringFlags, tabCount, tabSize, ToString(counterOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "vertexStride", toStringFlags, tabCount, tabSize, ToString(vertexStride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "instanceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstInstance", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstInstance, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "counterBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, counterBuffer);
+            FieldToString(strBuf, false, "counterBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, counterBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "counterOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, counterOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "vertexStride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, vertexStride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6343,11 +7547,14 @@ void VulkanAsciiConsumer::Process_vkGetImageViewHandleNVX(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageViewHandleNVX", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6363,12 +7570,16 @@ void VulkanAsciiConsumer::Process_vkGetImageViewAddressNVX(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageViewAddressNVX", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "imageView", toStringFlags, tabCount, tabSize, HandleIdToString(imageView));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "imageView", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, imageView);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6387,15 +7598,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndirectCountAMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndirectCountAMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6414,15 +7632,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawIndexedIndirectCountAMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawIndexedIndirectCountAMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6441,15 +7666,22 @@ void VulkanAsciiConsumer::Process_vkGetShaderInfoAMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetShaderInfoAMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "shaderStage", toStringFlags, tabCount, tabSize, '"' + ToString(shaderStage, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "infoType", toStringFlags, tabCount, tabSize, '"' + ToString(infoType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pInfoSize", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfoSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pInfo", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pInfo));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "shaderStage", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, shaderStage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "infoType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, infoType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pInfoSize", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfoSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pInfo", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pInfo);
         }
     );
 }
@@ -6466,13 +7698,18 @@ void VulkanAsciiConsumer::Process_vkCreateStreamDescriptorSurfaceGGP(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateStreamDescriptorSurfaceGGP", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -6493,17 +7730,26 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceExternalImageFormatProperti
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceExternalImageFormatPropertiesNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "format", toStringFlags, tabCount, tabSize, '"' + ToString(format, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "type", toStringFlags, tabCount, tabSize, '"' + ToString(type, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "tiling", toStringFlags, tabCount, tabSize, '"' + ToString(tiling, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "usage", toStringFlags, tabCount, tabSize, ToString(usage, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "flags", toStringFlags, tabCount, tabSize, ToString(flags, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "externalHandleType", toStringFlags, tabCount, tabSize, ToString(externalHandleType, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pExternalImageFormatProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pExternalImageFormatProperties, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "format", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, format, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "type", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, type, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "tiling", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, tiling, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "usage", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, usage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "flags", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, flags, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "externalHandleType", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, externalHandleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pExternalImageFormatProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pExternalImageFormatProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6520,13 +7766,18 @@ void VulkanAsciiConsumer::Process_vkGetMemoryWin32HandleNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryWin32HandleNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "memory", toStringFlags, tabCount, tabSize, HandleIdToString(memory));
-            FieldToString(strStrm, false, "handleType", toStringFlags, tabCount, tabSize, ToString(handleType, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pHandle", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pHandle));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "memory", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, memory);
+            FieldToString(strBuf, false, "handleType", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, handleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pHandle", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pHandle);
         }
     );
 }
@@ -6543,13 +7794,18 @@ void VulkanAsciiConsumer::Process_vkCreateViSurfaceNN(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateViSurfaceNN", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -6563,10 +7819,12 @@ void VulkanAsciiConsumer::Process_vkCmdBeginConditionalRenderingEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginConditionalRenderingEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pConditionalRenderingBegin", toStringFlags, tabCount, tabSize, PointerDecoderToString(pConditionalRenderingBegin, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pConditionalRenderingBegin", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pConditionalRenderingBegin, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6579,9 +7837,10 @@ void VulkanAsciiConsumer::Process_vkCmdEndConditionalRenderingEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndConditionalRenderingEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
         }
     );
 }
@@ -6597,12 +7856,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetViewportWScalingNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetViewportWScalingNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstViewport", toStringFlags, tabCount, tabSize, ToString(firstViewport, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "viewportCount", toStringFlags, tabCount, tabSize, ToString(viewportCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pViewportWScalings", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(viewportCount, pViewportWScalings, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstViewport", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstViewport, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "viewportCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, viewportCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pViewportWScalings", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, viewportCount, pViewportWScalings, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6617,11 +7880,14 @@ void VulkanAsciiConsumer::Process_vkReleaseDisplayEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkReleaseDisplayEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
         }
     );
 }
@@ -6637,12 +7903,16 @@ void VulkanAsciiConsumer::Process_vkAcquireXlibDisplayEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireXlibDisplayEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "dpy", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(dpy));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "dpy", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, dpy);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
         }
     );
 }
@@ -6659,13 +7929,18 @@ void VulkanAsciiConsumer::Process_vkGetRandROutputDisplayEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRandROutputDisplayEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "dpy", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(dpy));
-            FieldToString(strStrm, false, "rrOutput", toStringFlags, tabCount, tabSize, ToString(rrOutput, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDisplay", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDisplay));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "dpy", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, dpy);
+            FieldToString(strBuf, false, "rrOutput", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, rrOutput, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDisplay", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDisplay);
         }
     );
 }
@@ -6681,12 +7956,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfaceCapabilities2EXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "surface", toStringFlags, tabCount, tabSize, HandleIdToString(surface));
-            FieldToString(strStrm, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceCapabilities, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "surface", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, surface);
+            FieldToString(strBuf, false, "[out]pSurfaceCapabilities", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceCapabilities, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6702,12 +7981,16 @@ void VulkanAsciiConsumer::Process_vkDisplayPowerControlEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDisplayPowerControlEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
-            FieldToString(strStrm, false, "pDisplayPowerInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDisplayPowerInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
+            FieldToString(strBuf, false, "pDisplayPowerInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDisplayPowerInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6724,13 +8007,18 @@ void VulkanAsciiConsumer::Process_vkRegisterDeviceEventEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkRegisterDeviceEventEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pDeviceEventInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDeviceEventInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFence", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pFence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pDeviceEventInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDeviceEventInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFence", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pFence);
         }
     );
 }
@@ -6748,14 +8036,20 @@ void VulkanAsciiConsumer::Process_vkRegisterDisplayEventEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkRegisterDisplayEventEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
-            FieldToString(strStrm, false, "pDisplayEventInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDisplayEventInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pFence", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pFence));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
+            FieldToString(strBuf, false, "pDisplayEventInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDisplayEventInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pFence", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pFence);
         }
     );
 }
@@ -6772,13 +8066,18 @@ void VulkanAsciiConsumer::Process_vkGetSwapchainCounterEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSwapchainCounterEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "counter", toStringFlags, tabCount, tabSize, '"' + ToString(counter, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pCounterValue", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCounterValue, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "counter", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, counter, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCounterValue", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCounterValue, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6794,12 +8093,16 @@ void VulkanAsciiConsumer::Process_vkGetRefreshCycleDurationGOOGLE(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRefreshCycleDurationGOOGLE", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "[out]pDisplayTimingProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDisplayTimingProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "[out]pDisplayTimingProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDisplayTimingProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6816,13 +8119,18 @@ void VulkanAsciiConsumer::Process_vkGetPastPresentationTimingGOOGLE(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPastPresentationTimingGOOGLE", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
-            FieldToString(strStrm, false, "[out]pPresentationTimingCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPresentationTimingCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPresentationTimings", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPresentationTimingCount, pPresentationTimings, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
+            FieldToString(strBuf, false, "[out]pPresentationTimingCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPresentationTimingCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPresentationTimings", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPresentationTimingCount, pPresentationTimings, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6838,12 +8146,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetDiscardRectangleEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDiscardRectangleEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstDiscardRectangle", toStringFlags, tabCount, tabSize, ToString(firstDiscardRectangle, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "discardRectangleCount", toStringFlags, tabCount, tabSize, ToString(discardRectangleCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pDiscardRectangles", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(discardRectangleCount, pDiscardRectangles, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstDiscardRectangle", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstDiscardRectangle, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "discardRectangleCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, discardRectangleCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pDiscardRectangles", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, discardRectangleCount, pDiscardRectangles, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6859,12 +8171,16 @@ void VulkanAsciiConsumer::Process_vkSetHdrMetadataEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetHdrMetadataEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchainCount", toStringFlags, tabCount, tabSize, ToString(swapchainCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSwapchains", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(swapchainCount, pSwapchains, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMetadata", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(swapchainCount, pMetadata, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchainCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, swapchainCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSwapchains", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, swapchainCount, pSwapchains, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMetadata", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, swapchainCount, pMetadata, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6881,13 +8197,18 @@ void VulkanAsciiConsumer::Process_vkCreateIOSSurfaceMVK(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateIOSSurfaceMVK", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -6904,13 +8225,18 @@ void VulkanAsciiConsumer::Process_vkCreateMacOSSurfaceMVK(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateMacOSSurfaceMVK", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -6925,11 +8251,14 @@ void VulkanAsciiConsumer::Process_vkSetDebugUtilsObjectNameEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetDebugUtilsObjectNameEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pNameInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pNameInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pNameInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pNameInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6944,11 +8273,14 @@ void VulkanAsciiConsumer::Process_vkSetDebugUtilsObjectTagEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetDebugUtilsObjectTagEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pTagInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pTagInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pTagInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pTagInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6962,10 +8294,12 @@ void VulkanAsciiConsumer::Process_vkQueueBeginDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueBeginDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "pLabelInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pLabelInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "pLabelInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pLabelInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -6978,9 +8312,10 @@ void VulkanAsciiConsumer::Process_vkQueueEndDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueEndDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
+            FieldToString(strBuf, true, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
         }
     );
 }
@@ -6994,10 +8329,12 @@ void VulkanAsciiConsumer::Process_vkQueueInsertDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueInsertDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "pLabelInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pLabelInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "pLabelInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pLabelInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7011,10 +8348,12 @@ void VulkanAsciiConsumer::Process_vkCmdBeginDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBeginDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pLabelInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pLabelInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pLabelInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pLabelInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7027,9 +8366,10 @@ void VulkanAsciiConsumer::Process_vkCmdEndDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdEndDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
         }
     );
 }
@@ -7043,10 +8383,12 @@ void VulkanAsciiConsumer::Process_vkCmdInsertDebugUtilsLabelEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdInsertDebugUtilsLabelEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pLabelInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pLabelInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pLabelInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pLabelInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7063,13 +8405,18 @@ void VulkanAsciiConsumer::Process_vkCreateDebugUtilsMessengerEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDebugUtilsMessengerEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMessenger", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pMessenger));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMessenger", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pMessenger);
         }
     );
 }
@@ -7084,11 +8431,14 @@ void VulkanAsciiConsumer::Process_vkDestroyDebugUtilsMessengerEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyDebugUtilsMessengerEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "messenger", toStringFlags, tabCount, tabSize, HandleIdToString(messenger));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "messenger", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, messenger);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7104,12 +8454,16 @@ void VulkanAsciiConsumer::Process_vkSubmitDebugUtilsMessageEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSubmitDebugUtilsMessageEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "messageSeverity", toStringFlags, tabCount, tabSize, '"' + ToString(messageSeverity, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "messageTypes", toStringFlags, tabCount, tabSize, ToString(messageTypes, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCallbackData", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCallbackData, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "messageSeverity", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, messageSeverity, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "messageTypes", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, messageTypes, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCallbackData", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCallbackData, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7125,12 +8479,16 @@ void VulkanAsciiConsumer::Process_vkGetAndroidHardwareBufferPropertiesANDROID(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetAndroidHardwareBufferPropertiesANDROID", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(buffer));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, buffer);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7146,12 +8504,16 @@ void VulkanAsciiConsumer::Process_vkGetMemoryAndroidHardwareBufferANDROID(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryAndroidHardwareBufferANDROID", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pBuffer", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pBuffer));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pBuffer", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pBuffer);
         }
     );
 }
@@ -7165,10 +8527,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetSampleLocationsEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetSampleLocationsEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pSampleLocationsInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSampleLocationsInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pSampleLocationsInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSampleLocationsInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7183,11 +8547,14 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceMultisamplePropertiesEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceMultisamplePropertiesEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "samples", toStringFlags, tabCount, tabSize, '"' + ToString(samples, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pMultisampleProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMultisampleProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "samples", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, samples, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMultisampleProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMultisampleProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7203,12 +8570,16 @@ void VulkanAsciiConsumer::Process_vkGetImageDrmFormatModifierPropertiesEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetImageDrmFormatModifierPropertiesEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "image", toStringFlags, tabCount, tabSize, HandleIdToString(image));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "image", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, image);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7225,13 +8596,18 @@ void VulkanAsciiConsumer::Process_vkCreateValidationCacheEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateValidationCacheEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pValidationCache", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pValidationCache));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pValidationCache", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pValidationCache);
         }
     );
 }
@@ -7246,11 +8622,14 @@ void VulkanAsciiConsumer::Process_vkDestroyValidationCacheEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyValidationCacheEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "validationCache", toStringFlags, tabCount, tabSize, HandleIdToString(validationCache));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "validationCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, validationCache);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7267,13 +8646,18 @@ void VulkanAsciiConsumer::Process_vkMergeValidationCachesEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkMergeValidationCachesEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "dstCache", toStringFlags, tabCount, tabSize, HandleIdToString(dstCache));
-            FieldToString(strStrm, false, "srcCacheCount", toStringFlags, tabCount, tabSize, ToString(srcCacheCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSrcCaches", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(srcCacheCount, pSrcCaches, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "dstCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstCache);
+            FieldToString(strBuf, false, "srcCacheCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, srcCacheCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSrcCaches", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, srcCacheCount, pSrcCaches, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7290,13 +8674,18 @@ void VulkanAsciiConsumer::Process_vkGetValidationCacheDataEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetValidationCacheDataEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "validationCache", toStringFlags, tabCount, tabSize, HandleIdToString(validationCache));
-            FieldToString(strStrm, false, "[out]pDataSize", toStringFlags, tabCount, tabSize, PointerDecoderToString(pDataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "validationCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, validationCache);
+            FieldToString(strBuf, false, "[out]pDataSize", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pDataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -7311,11 +8700,14 @@ void VulkanAsciiConsumer::Process_vkCmdBindShadingRateImageNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindShadingRateImageNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "imageView", toStringFlags, tabCount, tabSize, HandleIdToString(imageView));
-            FieldToString(strStrm, false, "imageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(imageLayout, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "imageView", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, imageView);
+            FieldToString(strBuf, false, "imageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, imageLayout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7331,12 +8723,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetViewportShadingRatePaletteNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetViewportShadingRatePaletteNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstViewport", toStringFlags, tabCount, tabSize, ToString(firstViewport, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "viewportCount", toStringFlags, tabCount, tabSize, ToString(viewportCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pShadingRatePalettes", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(viewportCount, pShadingRatePalettes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstViewport", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstViewport, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "viewportCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, viewportCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pShadingRatePalettes", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, viewportCount, pShadingRatePalettes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7352,12 +8748,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetCoarseSampleOrderNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetCoarseSampleOrderNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "sampleOrderType", toStringFlags, tabCount, tabSize, '"' + ToString(sampleOrderType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "customSampleOrderCount", toStringFlags, tabCount, tabSize, ToString(customSampleOrderCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCustomSampleOrders", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(customSampleOrderCount, pCustomSampleOrders, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "sampleOrderType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, sampleOrderType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "customSampleOrderCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, customSampleOrderCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCustomSampleOrders", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, customSampleOrderCount, pCustomSampleOrders, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7374,13 +8774,18 @@ void VulkanAsciiConsumer::Process_vkCreateAccelerationStructureNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateAccelerationStructureNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pAccelerationStructure", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pAccelerationStructure));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pAccelerationStructure", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pAccelerationStructure);
         }
     );
 }
@@ -7395,11 +8800,14 @@ void VulkanAsciiConsumer::Process_vkDestroyAccelerationStructureNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyAccelerationStructureNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "accelerationStructure", toStringFlags, tabCount, tabSize, HandleIdToString(accelerationStructure));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "accelerationStructure", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, accelerationStructure);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7414,11 +8822,14 @@ void VulkanAsciiConsumer::Process_vkGetAccelerationStructureMemoryRequirementsNV
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetAccelerationStructureMemoryRequirementsNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7434,12 +8845,16 @@ void VulkanAsciiConsumer::Process_vkBindAccelerationStructureMemoryNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkBindAccelerationStructureMemoryNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "bindInfoCount", toStringFlags, tabCount, tabSize, ToString(bindInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBindInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "bindInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBindInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindInfoCount, pBindInfos, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7460,17 +8875,26 @@ void VulkanAsciiConsumer::Process_vkCmdBuildAccelerationStructureNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBuildAccelerationStructureNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "instanceData", toStringFlags, tabCount, tabSize, HandleIdToString(instanceData));
-            FieldToString(strStrm, false, "instanceOffset", toStringFlags, tabCount, tabSize, ToString(instanceOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "update", toStringFlags, tabCount, tabSize, ToString(update, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dst", toStringFlags, tabCount, tabSize, HandleIdToString(dst));
-            FieldToString(strStrm, false, "src", toStringFlags, tabCount, tabSize, HandleIdToString(src));
-            FieldToString(strStrm, false, "scratch", toStringFlags, tabCount, tabSize, HandleIdToString(scratch));
-            FieldToString(strStrm, false, "scratchOffset", toStringFlags, tabCount, tabSize, ToString(scratchOffset, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instanceData", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instanceData);
+            FieldToString(strBuf, false, "instanceOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "update", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, update, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dst", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dst);
+            FieldToString(strBuf, false, "src", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, src);
+            FieldToString(strBuf, false, "scratch", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, scratch);
+            FieldToString(strBuf, false, "scratchOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, scratchOffset, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7486,12 +8910,16 @@ void VulkanAsciiConsumer::Process_vkCmdCopyAccelerationStructureNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyAccelerationStructureNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "dst", toStringFlags, tabCount, tabSize, HandleIdToString(dst));
-            FieldToString(strStrm, false, "src", toStringFlags, tabCount, tabSize, HandleIdToString(src));
-            FieldToString(strStrm, false, "mode", toStringFlags, tabCount, tabSize, '"' + ToString(mode, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "dst", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dst);
+            FieldToString(strBuf, false, "src", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, src);
+            FieldToString(strBuf, false, "mode", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, mode, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7518,23 +8946,38 @@ void VulkanAsciiConsumer::Process_vkCmdTraceRaysNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdTraceRaysNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
-        {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "raygenShaderBindingTableBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(raygenShaderBindingTableBuffer));
-            FieldToString(strStrm, false, "raygenShaderBindingOffset", toStringFlags, tabCount, tabSize, ToString(raygenShaderBindingOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "missShaderBindingTableBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(missShaderBindingTableBuffer));
-            FieldToString(strStrm, false, "missShaderBindingOffset", toStringFlags, tabCount, tabSize, ToString(missShaderBindingOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "missShaderBindingStride", toStringFlags, tabCount, tabSize, ToString(missShaderBindingStride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "hitShaderBindingTableBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(hitShaderBindingTableBuffer));
-            FieldToString(strStrm, false, "hitShaderBindingOffset", toStringFlags, tabCount, tabSize, ToString(hitShaderBindingOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "hitShaderBindingStride", toStringFlags, tabCount, tabSize, ToString(hitShaderBindingStride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "callableShaderBindingTableBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(callableShaderBindingTableBuffer));
-            FieldToString(strStrm, false, "callableShaderBindingOffset", toStringFlags, tabCount, tabSize, ToString(callableShaderBindingOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "callableShaderBindingStride", toStringFlags, tabCount, tabSize, ToString(callableShaderBindingStride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "width", toStringFlags, tabCount, tabSize, ToString(width, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "height", toStringFlags, tabCount, tabSize, ToString(height, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "depth", toStringFlags, tabCount, tabSize, ToString(depth, toStringFlags, tabCount, tabSize));
+        [&](std::string& strBuf)
+        {
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "raygenShaderBindingTableBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, raygenShaderBindingTableBuffer);
+            FieldToString(strBuf, false, "raygenShaderBindingOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, raygenShaderBindingOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "missShaderBindingTableBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, missShaderBindingTableBuffer);
+            FieldToString(strBuf, false, "missShaderBindingOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, missShaderBindingOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "missShaderBindingStride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, missShaderBindingStride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "hitShaderBindingTableBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, hitShaderBindingTableBuffer);
+            FieldToString(strBuf, false, "hitShaderBindingOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, hitShaderBindingOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "hitShaderBindingStride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, hitShaderBindingStride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "callableShaderBindingTableBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, callableShaderBindingTableBuffer);
+            FieldToString(strBuf, false, "callableShaderBindingOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, callableShaderBindingOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "callableShaderBindingStride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, callableShaderBindingStride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "width", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, width, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "height", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, height, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "depth", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depth, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7553,15 +8996,22 @@ void VulkanAsciiConsumer::Process_vkCreateRayTracingPipelinesNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateRayTracingPipelinesNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "createInfoCount", toStringFlags, tabCount, tabSize, ToString(createInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCreateInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelines", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(createInfoCount, pPipelines, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "createInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, createInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelines", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, createInfoCount, pPipelines, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7580,15 +9030,22 @@ void VulkanAsciiConsumer::Process_vkGetRayTracingShaderGroupHandlesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRayTracingShaderGroupHandlesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "firstGroup", toStringFlags, tabCount, tabSize, ToString(firstGroup, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCount", toStringFlags, tabCount, tabSize, ToString(groupCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "firstGroup", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstGroup, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -7607,15 +9064,22 @@ void VulkanAsciiConsumer::Process_vkGetRayTracingShaderGroupHandlesNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRayTracingShaderGroupHandlesNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "firstGroup", toStringFlags, tabCount, tabSize, ToString(firstGroup, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCount", toStringFlags, tabCount, tabSize, ToString(groupCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "firstGroup", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstGroup, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -7632,13 +9096,18 @@ void VulkanAsciiConsumer::Process_vkGetAccelerationStructureHandleNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetAccelerationStructureHandleNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "accelerationStructure", toStringFlags, tabCount, tabSize, HandleIdToString(accelerationStructure));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "accelerationStructure", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, accelerationStructure);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -7656,14 +9125,20 @@ void VulkanAsciiConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteAccelerationStructuresPropertiesNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize, ToString(accelerationStructureCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryType", toStringFlags, tabCount, tabSize, '"' + ToString(queryType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, accelerationStructureCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, queryType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7679,12 +9154,16 @@ void VulkanAsciiConsumer::Process_vkCompileDeferredNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCompileDeferredNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "shader", toStringFlags, tabCount, tabSize, ToString(shader, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "shader", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, shader, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7701,13 +9180,18 @@ void VulkanAsciiConsumer::Process_vkGetMemoryHostPointerPropertiesEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryHostPointerPropertiesEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "handleType", toStringFlags, tabCount, tabSize, '"' + ToString(handleType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pHostPointer", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pHostPointer));
-            FieldToString(strStrm, false, "[out]pMemoryHostPointerProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryHostPointerProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "handleType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, handleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pHostPointer", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pHostPointer);
+            FieldToString(strBuf, false, "[out]pMemoryHostPointerProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryHostPointerProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7724,13 +9208,18 @@ void VulkanAsciiConsumer::Process_vkCmdWriteBufferMarkerAMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteBufferMarkerAMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineStage", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineStage, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dstBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(dstBuffer));
-            FieldToString(strStrm, false, "dstOffset", toStringFlags, tabCount, tabSize, ToString(dstOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "marker", toStringFlags, tabCount, tabSize, ToString(marker, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineStage", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineStage, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dstBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, dstBuffer);
+            FieldToString(strBuf, false, "dstOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dstOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "marker", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, marker, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7746,12 +9235,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceCalibrateableTimeDomainsEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pTimeDomainCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pTimeDomainCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pTimeDomains", toStringFlags, tabCount, tabSize, EnumPointerDecoderArrayToString(pTimeDomainCount, pTimeDomains, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pTimeDomainCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pTimeDomainCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pTimeDomains", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderArrayToString(strBuf, pTimeDomainCount, pTimeDomains, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7769,14 +9262,20 @@ void VulkanAsciiConsumer::Process_vkGetCalibratedTimestampsEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetCalibratedTimestampsEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "timestampCount", toStringFlags, tabCount, tabSize, ToString(timestampCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pTimestampInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(timestampCount, pTimestampInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pTimestamps", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(timestampCount, pTimestamps, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMaxDeviation", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMaxDeviation, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "timestampCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, timestampCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pTimestampInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, timestampCount, pTimestampInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pTimestamps", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, timestampCount, pTimestamps, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMaxDeviation", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMaxDeviation, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7791,11 +9290,14 @@ void VulkanAsciiConsumer::Process_vkCmdDrawMeshTasksNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawMeshTasksNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "taskCount", toStringFlags, tabCount, tabSize, ToString(taskCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstTask", toStringFlags, tabCount, tabSize, ToString(firstTask, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "taskCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, taskCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstTask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstTask, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7812,13 +9314,18 @@ void VulkanAsciiConsumer::Process_vkCmdDrawMeshTasksIndirectNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawMeshTasksIndirectNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "drawCount", toStringFlags, tabCount, tabSize, ToString(drawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "drawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7837,15 +9344,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawMeshTasksIndirectCountNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawMeshTasksIndirectCountNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "buffer", toStringFlags, tabCount, tabSize, HandleIdToString(buffer));
-            FieldToString(strStrm, false, "offset", toStringFlags, tabCount, tabSize, ToString(offset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "countBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(countBuffer));
-            FieldToString(strStrm, false, "countBufferOffset", toStringFlags, tabCount, tabSize, ToString(countBufferOffset, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "maxDrawCount", toStringFlags, tabCount, tabSize, ToString(maxDrawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "buffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, buffer);
+            FieldToString(strBuf, false, "offset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, offset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "countBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, countBuffer);
+            FieldToString(strBuf, false, "countBufferOffset", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, countBufferOffset, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "maxDrawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, maxDrawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7861,12 +9375,16 @@ void VulkanAsciiConsumer::Process_vkCmdSetExclusiveScissorNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetExclusiveScissorNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstExclusiveScissor", toStringFlags, tabCount, tabSize, ToString(firstExclusiveScissor, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "exclusiveScissorCount", toStringFlags, tabCount, tabSize, ToString(exclusiveScissorCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pExclusiveScissors", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(exclusiveScissorCount, pExclusiveScissors, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstExclusiveScissor", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstExclusiveScissor, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "exclusiveScissorCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, exclusiveScissorCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pExclusiveScissors", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, exclusiveScissorCount, pExclusiveScissors, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7880,10 +9398,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetCheckpointNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetCheckpointNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pCheckpointMarker", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pCheckpointMarker));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pCheckpointMarker", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pCheckpointMarker);
         }
     );
 }
@@ -7898,11 +9418,14 @@ void VulkanAsciiConsumer::Process_vkGetQueueCheckpointDataNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetQueueCheckpointDataNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "[out]pCheckpointDataCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCheckpointDataCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCheckpointData", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pCheckpointDataCount, pCheckpointData, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "[out]pCheckpointDataCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCheckpointDataCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCheckpointData", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pCheckpointDataCount, pCheckpointData, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7917,11 +9440,14 @@ void VulkanAsciiConsumer::Process_vkInitializePerformanceApiINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkInitializePerformanceApiINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInitializeInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInitializeInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInitializeInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInitializeInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7934,9 +9460,10 @@ void VulkanAsciiConsumer::Process_vkUninitializePerformanceApiINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkUninitializePerformanceApiINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
         }
     );
 }
@@ -7951,11 +9478,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetPerformanceMarkerINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPerformanceMarkerINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pMarkerInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMarkerInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pMarkerInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMarkerInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7970,11 +9500,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetPerformanceStreamMarkerINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPerformanceStreamMarkerINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pMarkerInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMarkerInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pMarkerInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMarkerInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -7989,11 +9522,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetPerformanceOverrideINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPerformanceOverrideINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pOverrideInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pOverrideInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pOverrideInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pOverrideInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8009,12 +9545,16 @@ void VulkanAsciiConsumer::Process_vkAcquirePerformanceConfigurationINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquirePerformanceConfigurationINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pAcquireInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAcquireInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pConfiguration", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pConfiguration));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pAcquireInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAcquireInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pConfiguration", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pConfiguration);
         }
     );
 }
@@ -8029,11 +9569,14 @@ void VulkanAsciiConsumer::Process_vkReleasePerformanceConfigurationINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkReleasePerformanceConfigurationINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "configuration", toStringFlags, tabCount, tabSize, HandleIdToString(configuration));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "configuration", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, configuration);
         }
     );
 }
@@ -8048,11 +9591,14 @@ void VulkanAsciiConsumer::Process_vkQueueSetPerformanceConfigurationINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkQueueSetPerformanceConfigurationINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queue", toStringFlags, tabCount, tabSize, HandleIdToString(queue));
-            FieldToString(strStrm, false, "configuration", toStringFlags, tabCount, tabSize, HandleIdToString(configuration));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queue", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queue);
+            FieldToString(strBuf, false, "configuration", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, configuration);
         }
     );
 }
@@ -8068,12 +9614,16 @@ void VulkanAsciiConsumer::Process_vkGetPerformanceParameterINTEL(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPerformanceParameterINTEL", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "parameter", toStringFlags, tabCount, tabSize, '"' + ToString(parameter, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "[out]pValue", toStringFlags, tabCount, tabSize, PointerDecoderToString(pValue, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "parameter", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, parameter, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pValue", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pValue, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8088,11 +9638,14 @@ void VulkanAsciiConsumer::Process_vkSetLocalDimmingAMD(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetLocalDimmingAMD", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapChain", toStringFlags, tabCount, tabSize, HandleIdToString(swapChain));
-            FieldToString(strStrm, false, "localDimmingEnable", toStringFlags, tabCount, tabSize, ToString(localDimmingEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapChain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapChain);
+            FieldToString(strBuf, false, "localDimmingEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, localDimmingEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8109,13 +9662,18 @@ void VulkanAsciiConsumer::Process_vkCreateImagePipeSurfaceFUCHSIA(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateImagePipeSurfaceFUCHSIA", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -8132,13 +9690,18 @@ void VulkanAsciiConsumer::Process_vkCreateMetalSurfaceEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateMetalSurfaceEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -8153,11 +9716,14 @@ void VulkanAsciiConsumer::Process_vkGetBufferDeviceAddressEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetBufferDeviceAddressEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8173,12 +9739,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceToolPropertiesEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceToolPropertiesEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pToolCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pToolCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pToolProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pToolCount, pToolProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pToolCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pToolCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pToolProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pToolCount, pToolProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8194,12 +9764,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceCooperativeMatrixProperties
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceCooperativeMatrixPropertiesNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPropertyCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pProperties", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pPropertyCount, pProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pPropertyCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPropertyCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pPropertyCount, pProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8215,12 +9789,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSupportedFramebufferMixedSa
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "[out]pCombinationCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCombinationCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCombinations", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(pCombinationCount, pCombinations, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "[out]pCombinationCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCombinationCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCombinations", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, pCombinationCount, pCombinations, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8237,13 +9815,18 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceSurfacePresentModes2EXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceSurfacePresentModes2EXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPresentModeCount", toStringFlags, tabCount, tabSize, PointerDecoderToString(pPresentModeCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPresentModes", toStringFlags, tabCount, tabSize, EnumPointerDecoderArrayToString(pPresentModeCount, pPresentModes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPresentModeCount", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pPresentModeCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPresentModes", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderArrayToString(strBuf, pPresentModeCount, pPresentModes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8258,11 +9841,14 @@ void VulkanAsciiConsumer::Process_vkAcquireFullScreenExclusiveModeEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireFullScreenExclusiveModeEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
         }
     );
 }
@@ -8277,11 +9863,14 @@ void VulkanAsciiConsumer::Process_vkReleaseFullScreenExclusiveModeEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkReleaseFullScreenExclusiveModeEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "swapchain", toStringFlags, tabCount, tabSize, HandleIdToString(swapchain));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "swapchain", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, swapchain);
         }
     );
 }
@@ -8297,12 +9886,16 @@ void VulkanAsciiConsumer::Process_vkGetDeviceGroupSurfacePresentModes2EXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceGroupSurfacePresentModes2EXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pSurfaceInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pModes", toStringFlags, tabCount, tabSize, PointerDecoderToString(pModes, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pSurfaceInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pSurfaceInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pModes", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pModes, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8319,13 +9912,18 @@ void VulkanAsciiConsumer::Process_vkCreateHeadlessSurfaceEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateHeadlessSurfaceEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -8340,11 +9938,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetLineStippleEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetLineStippleEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "lineStippleFactor", toStringFlags, tabCount, tabSize, ToString(lineStippleFactor, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "lineStipplePattern", toStringFlags, tabCount, tabSize, ToString(lineStipplePattern, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "lineStippleFactor", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, lineStippleFactor, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "lineStipplePattern", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, lineStipplePattern, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8360,12 +9961,16 @@ void VulkanAsciiConsumer::Process_vkResetQueryPoolEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkResetQueryPoolEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryCount", toStringFlags, tabCount, tabSize, ToString(queryCount, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queryCount, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8379,10 +9984,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetCullModeEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetCullModeEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "cullMode", toStringFlags, tabCount, tabSize, ToString(cullMode, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "cullMode", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, cullMode, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8396,10 +10003,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetFrontFaceEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetFrontFaceEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "frontFace", toStringFlags, tabCount, tabSize, '"' + ToString(frontFace, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "frontFace", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, frontFace, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8413,10 +10022,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetPrimitiveTopologyEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPrimitiveTopologyEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "primitiveTopology", toStringFlags, tabCount, tabSize, '"' + ToString(primitiveTopology, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "primitiveTopology", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, primitiveTopology, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8431,11 +10042,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetViewportWithCountEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetViewportWithCountEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "viewportCount", toStringFlags, tabCount, tabSize, ToString(viewportCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pViewports", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(viewportCount, pViewports, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "viewportCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, viewportCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pViewports", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, viewportCount, pViewports, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8450,11 +10064,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetScissorWithCountEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetScissorWithCountEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "scissorCount", toStringFlags, tabCount, tabSize, ToString(scissorCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pScissors", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(scissorCount, pScissors, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "scissorCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, scissorCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pScissors", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, scissorCount, pScissors, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8473,15 +10090,22 @@ void VulkanAsciiConsumer::Process_vkCmdBindVertexBuffers2EXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindVertexBuffers2EXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "firstBinding", toStringFlags, tabCount, tabSize, ToString(firstBinding, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "bindingCount", toStringFlags, tabCount, tabSize, ToString(bindingCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pBuffers", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(bindingCount, pBuffers, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pOffsets", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pOffsets, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pSizes", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pSizes, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pStrides", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(bindingCount, pStrides, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "firstBinding", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstBinding, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "bindingCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, bindingCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pBuffers", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, bindingCount, pBuffers, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pOffsets", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pOffsets, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pSizes", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pSizes, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pStrides", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, bindingCount, pStrides, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8495,10 +10119,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthTestEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthTestEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthTestEnable", toStringFlags, tabCount, tabSize, ToString(depthTestEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthTestEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthTestEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8512,10 +10138,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthWriteEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthWriteEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthWriteEnable", toStringFlags, tabCount, tabSize, ToString(depthWriteEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthWriteEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthWriteEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8529,10 +10157,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthCompareOpEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthCompareOpEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthCompareOp", toStringFlags, tabCount, tabSize, '"' + ToString(depthCompareOp, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthCompareOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, depthCompareOp, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8546,10 +10176,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthBoundsTestEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthBoundsTestEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthBoundsTestEnable", toStringFlags, tabCount, tabSize, ToString(depthBoundsTestEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthBoundsTestEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthBoundsTestEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8563,10 +10195,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetStencilTestEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetStencilTestEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "stencilTestEnable", toStringFlags, tabCount, tabSize, ToString(stencilTestEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "stencilTestEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stencilTestEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8584,14 +10218,20 @@ void VulkanAsciiConsumer::Process_vkCmdSetStencilOpEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetStencilOpEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "faceMask", toStringFlags, tabCount, tabSize, ToString(faceMask, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "failOp", toStringFlags, tabCount, tabSize, '"' + ToString(failOp, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "passOp", toStringFlags, tabCount, tabSize, '"' + ToString(passOp, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "depthFailOp", toStringFlags, tabCount, tabSize, '"' + ToString(depthFailOp, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "compareOp", toStringFlags, tabCount, tabSize, '"' + ToString(compareOp, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "faceMask", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, faceMask, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "failOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, failOp, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "passOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, passOp, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "depthFailOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, depthFailOp, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "compareOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, compareOp, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8606,11 +10246,14 @@ void VulkanAsciiConsumer::Process_vkGetGeneratedCommandsMemoryRequirementsNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetGeneratedCommandsMemoryRequirementsNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryRequirements, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryRequirements", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryRequirements, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8624,10 +10267,12 @@ void VulkanAsciiConsumer::Process_vkCmdPreprocessGeneratedCommandsNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdPreprocessGeneratedCommandsNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pGeneratedCommandsInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGeneratedCommandsInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pGeneratedCommandsInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGeneratedCommandsInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8642,11 +10287,14 @@ void VulkanAsciiConsumer::Process_vkCmdExecuteGeneratedCommandsNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdExecuteGeneratedCommandsNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "isPreprocessed", toStringFlags, tabCount, tabSize, ToString(isPreprocessed, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pGeneratedCommandsInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGeneratedCommandsInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "isPreprocessed", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, isPreprocessed, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pGeneratedCommandsInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGeneratedCommandsInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8662,12 +10310,16 @@ void VulkanAsciiConsumer::Process_vkCmdBindPipelineShaderGroupNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindPipelineShaderGroupNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize, '"' + ToString(pipelineBindPoint, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "groupIndex", toStringFlags, tabCount, tabSize, ToString(groupIndex, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineBindPoint", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, pipelineBindPoint, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "groupIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupIndex, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8684,13 +10336,18 @@ void VulkanAsciiConsumer::Process_vkCreateIndirectCommandsLayoutNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateIndirectCommandsLayoutNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pIndirectCommandsLayout", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pIndirectCommandsLayout));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pIndirectCommandsLayout", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pIndirectCommandsLayout);
         }
     );
 }
@@ -8705,11 +10362,14 @@ void VulkanAsciiConsumer::Process_vkDestroyIndirectCommandsLayoutNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyIndirectCommandsLayoutNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "indirectCommandsLayout", toStringFlags, tabCount, tabSize, HandleIdToString(indirectCommandsLayout));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "indirectCommandsLayout", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, indirectCommandsLayout);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8725,12 +10385,16 @@ void VulkanAsciiConsumer::Process_vkAcquireDrmDisplayEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireDrmDisplayEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "drmFd", toStringFlags, tabCount, tabSize, ToString(drmFd, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "drmFd", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drmFd, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
         }
     );
 }
@@ -8747,13 +10411,18 @@ void VulkanAsciiConsumer::Process_vkGetDrmDisplayEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDrmDisplayEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "drmFd", toStringFlags, tabCount, tabSize, ToString(drmFd, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "connectorId", toStringFlags, tabCount, tabSize, ToString(connectorId, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]display", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "drmFd", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drmFd, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "connectorId", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, connectorId, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]display", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, display);
         }
     );
 }
@@ -8770,13 +10439,18 @@ void VulkanAsciiConsumer::Process_vkCreatePrivateDataSlotEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreatePrivateDataSlotEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPrivateDataSlot", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pPrivateDataSlot));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPrivateDataSlot", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pPrivateDataSlot);
         }
     );
 }
@@ -8791,11 +10465,14 @@ void VulkanAsciiConsumer::Process_vkDestroyPrivateDataSlotEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyPrivateDataSlotEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "privateDataSlot", toStringFlags, tabCount, tabSize, HandleIdToString(privateDataSlot));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "privateDataSlot", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, privateDataSlot);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8813,14 +10490,20 @@ void VulkanAsciiConsumer::Process_vkSetPrivateDataEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkSetPrivateDataEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "objectType", toStringFlags, tabCount, tabSize, '"' + ToString(objectType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "objectHandle", toStringFlags, tabCount, tabSize, ToString(objectHandle, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "privateDataSlot", toStringFlags, tabCount, tabSize, HandleIdToString(privateDataSlot));
-            FieldToString(strStrm, false, "data", toStringFlags, tabCount, tabSize, ToString(data, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "objectType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, objectType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "objectHandle", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, objectHandle, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "privateDataSlot", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, privateDataSlot);
+            FieldToString(strBuf, false, "data", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, data, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8837,13 +10520,18 @@ void VulkanAsciiConsumer::Process_vkGetPrivateDataEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPrivateDataEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "objectType", toStringFlags, tabCount, tabSize, '"' + ToString(objectType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "objectHandle", toStringFlags, tabCount, tabSize, ToString(objectHandle, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "privateDataSlot", toStringFlags, tabCount, tabSize, HandleIdToString(privateDataSlot));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, PointerDecoderToString(pData, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "objectType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, objectType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "objectHandle", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, objectHandle, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "privateDataSlot", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, privateDataSlot);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pData, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8858,11 +10546,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetFragmentShadingRateEnumNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetFragmentShadingRateEnumNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "shadingRate", toStringFlags, tabCount, tabSize, '"' + ToString(shadingRate, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "combinerOps", toStringFlags, tabCount, tabSize, EnumPointerDecoderArrayToString(2, combinerOps, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "shadingRate", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, shadingRate, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "combinerOps", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderArrayToString(strBuf, 2, combinerOps, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8877,11 +10568,14 @@ void VulkanAsciiConsumer::Process_vkAcquireWinrtDisplayNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkAcquireWinrtDisplayNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "display", toStringFlags, tabCount, tabSize, HandleIdToString(display));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "display", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, display);
         }
     );
 }
@@ -8897,12 +10591,16 @@ void VulkanAsciiConsumer::Process_vkGetWinrtDisplayNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetWinrtDisplayNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "deviceRelativeId", toStringFlags, tabCount, tabSize, ToString(deviceRelativeId, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pDisplay", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pDisplay));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "deviceRelativeId", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, deviceRelativeId, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pDisplay", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pDisplay);
         }
     );
 }
@@ -8919,13 +10617,18 @@ void VulkanAsciiConsumer::Process_vkCreateDirectFBSurfaceEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateDirectFBSurfaceEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -8941,12 +10644,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceDirectFBPresentationSupport
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceDirectFBPresentationSupportEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dfb", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(dfb));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dfb", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, dfb);
         }
     );
 }
@@ -8963,13 +10670,18 @@ void VulkanAsciiConsumer::Process_vkCmdSetVertexInputEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetVertexInputEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "vertexBindingDescriptionCount", toStringFlags, tabCount, tabSize, ToString(vertexBindingDescriptionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pVertexBindingDescriptions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(vertexBindingDescriptionCount, pVertexBindingDescriptions, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "vertexAttributeDescriptionCount", toStringFlags, tabCount, tabSize, ToString(vertexAttributeDescriptionCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pVertexAttributeDescriptions", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(vertexAttributeDescriptionCount, pVertexAttributeDescriptions, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "vertexBindingDescriptionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, vertexBindingDescriptionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pVertexBindingDescriptions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, vertexBindingDescriptionCount, pVertexBindingDescriptions, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "vertexAttributeDescriptionCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, vertexAttributeDescriptionCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pVertexAttributeDescriptions", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, vertexAttributeDescriptionCount, pVertexAttributeDescriptions, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -8985,12 +10697,16 @@ void VulkanAsciiConsumer::Process_vkGetMemoryZirconHandleFUCHSIA(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryZirconHandleFUCHSIA", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetZirconHandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetZirconHandleInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pZirconHandle", toStringFlags, tabCount, tabSize, PointerDecoderToString(pZirconHandle, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetZirconHandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetZirconHandleInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pZirconHandle", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pZirconHandle, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9007,13 +10723,18 @@ void VulkanAsciiConsumer::Process_vkGetMemoryZirconHandlePropertiesFUCHSIA(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryZirconHandlePropertiesFUCHSIA", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "handleType", toStringFlags, tabCount, tabSize, '"' + ToString(handleType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "zirconHandle", toStringFlags, tabCount, tabSize, ToString(zirconHandle, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pMemoryZirconHandleProperties", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryZirconHandleProperties, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "handleType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, handleType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "zirconHandle", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, zirconHandle, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pMemoryZirconHandleProperties", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryZirconHandleProperties, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9028,11 +10749,14 @@ void VulkanAsciiConsumer::Process_vkImportSemaphoreZirconHandleFUCHSIA(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkImportSemaphoreZirconHandleFUCHSIA", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pImportSemaphoreZirconHandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pImportSemaphoreZirconHandleInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pImportSemaphoreZirconHandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pImportSemaphoreZirconHandleInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9048,12 +10772,16 @@ void VulkanAsciiConsumer::Process_vkGetSemaphoreZirconHandleFUCHSIA(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetSemaphoreZirconHandleFUCHSIA", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pGetZirconHandleInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pGetZirconHandleInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pZirconHandle", toStringFlags, tabCount, tabSize, PointerDecoderToString(pZirconHandle, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pGetZirconHandleInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pGetZirconHandleInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pZirconHandle", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pZirconHandle, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9068,11 +10796,14 @@ void VulkanAsciiConsumer::Process_vkCmdBindInvocationMaskHUAWEI(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdBindInvocationMaskHUAWEI", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "imageView", toStringFlags, tabCount, tabSize, HandleIdToString(imageView));
-            FieldToString(strStrm, false, "imageLayout", toStringFlags, tabCount, tabSize, '"' + ToString(imageLayout, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "imageView", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, imageView);
+            FieldToString(strBuf, false, "imageLayout", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, imageLayout, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9088,12 +10819,16 @@ void VulkanAsciiConsumer::Process_vkGetMemoryRemoteAddressNV(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetMemoryRemoteAddressNV", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pMemoryGetRemoteAddressInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMemoryGetRemoteAddressInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pAddress", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pAddress));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pMemoryGetRemoteAddressInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMemoryGetRemoteAddressInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pAddress", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pAddress);
         }
     );
 }
@@ -9107,10 +10842,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetPatchControlPointsEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPatchControlPointsEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "patchControlPoints", toStringFlags, tabCount, tabSize, ToString(patchControlPoints, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "patchControlPoints", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, patchControlPoints, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9124,10 +10861,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetRasterizerDiscardEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetRasterizerDiscardEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "rasterizerDiscardEnable", toStringFlags, tabCount, tabSize, ToString(rasterizerDiscardEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "rasterizerDiscardEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, rasterizerDiscardEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9141,10 +10880,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetDepthBiasEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetDepthBiasEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "depthBiasEnable", toStringFlags, tabCount, tabSize, ToString(depthBiasEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "depthBiasEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depthBiasEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9158,10 +10899,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetLogicOpEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetLogicOpEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "logicOp", toStringFlags, tabCount, tabSize, '"' + ToString(logicOp, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "logicOp", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, logicOp, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9175,10 +10918,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetPrimitiveRestartEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetPrimitiveRestartEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "primitiveRestartEnable", toStringFlags, tabCount, tabSize, ToString(primitiveRestartEnable, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "primitiveRestartEnable", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, primitiveRestartEnable, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9195,13 +10940,18 @@ void VulkanAsciiConsumer::Process_vkCreateScreenSurfaceQNX(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateScreenSurfaceQNX", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "instance", toStringFlags, tabCount, tabSize, HandleIdToString(instance));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pSurface", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pSurface));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instance", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, instance);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pSurface", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pSurface);
         }
     );
 }
@@ -9217,12 +10967,16 @@ void VulkanAsciiConsumer::Process_vkGetPhysicalDeviceScreenPresentationSupportQN
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetPhysicalDeviceScreenPresentationSupportQNX", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "physicalDevice", toStringFlags, tabCount, tabSize, HandleIdToString(physicalDevice));
-            FieldToString(strStrm, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize, ToString(queueFamilyIndex, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "window", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(window));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "physicalDevice", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, physicalDevice);
+            FieldToString(strBuf, false, "queueFamilyIndex", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, queueFamilyIndex, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "window", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, window);
         }
     );
 }
@@ -9237,11 +10991,14 @@ void VulkanAsciiConsumer::Process_vkCmdSetColorWriteEnableEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetColorWriteEnableEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "attachmentCount", toStringFlags, tabCount, tabSize, ToString(attachmentCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pColorWriteEnables", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(attachmentCount, pColorWriteEnables, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "attachmentCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, attachmentCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pColorWriteEnables", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, attachmentCount, pColorWriteEnables, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9259,14 +11016,20 @@ void VulkanAsciiConsumer::Process_vkCmdDrawMultiEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawMultiEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "drawCount", toStringFlags, tabCount, tabSize, ToString(drawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pVertexInfo", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(drawCount, pVertexInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "instanceCount", toStringFlags, tabCount, tabSize, ToString(instanceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstInstance", toStringFlags, tabCount, tabSize, ToString(firstInstance, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "drawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pVertexInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, drawCount, pVertexInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instanceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstInstance", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstInstance, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9285,15 +11048,22 @@ void VulkanAsciiConsumer::Process_vkCmdDrawMultiIndexedEXT(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdDrawMultiIndexedEXT", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "drawCount", toStringFlags, tabCount, tabSize, ToString(drawCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pIndexInfo", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(drawCount, pIndexInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "instanceCount", toStringFlags, tabCount, tabSize, ToString(instanceCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "firstInstance", toStringFlags, tabCount, tabSize, ToString(firstInstance, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pVertexOffset", toStringFlags, tabCount, tabSize, PointerDecoderToString(pVertexOffset, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "drawCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, drawCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pIndexInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, drawCount, pIndexInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "instanceCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, instanceCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "firstInstance", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstInstance, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pVertexOffset", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pVertexOffset, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9310,13 +11080,18 @@ void VulkanAsciiConsumer::Process_vkCreateAccelerationStructureKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateAccelerationStructureKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pCreateInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCreateInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pAccelerationStructure", toStringFlags, tabCount, tabSize, HandlePointerDecoderToString(pAccelerationStructure));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pCreateInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCreateInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pAccelerationStructure", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderToString(strBuf, pAccelerationStructure);
         }
     );
 }
@@ -9331,11 +11106,14 @@ void VulkanAsciiConsumer::Process_vkDestroyAccelerationStructureKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkDestroyAccelerationStructureKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "accelerationStructure", toStringFlags, tabCount, tabSize, HandleIdToString(accelerationStructure));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "accelerationStructure", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, accelerationStructure);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9351,12 +11129,16 @@ void VulkanAsciiConsumer::Process_vkCopyAccelerationStructureToMemoryKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCopyAccelerationStructureToMemoryKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "deferredOperation", toStringFlags, tabCount, tabSize, HandleIdToString(deferredOperation));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "deferredOperation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, deferredOperation);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9372,12 +11154,16 @@ void VulkanAsciiConsumer::Process_vkCopyMemoryToAccelerationStructureKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCopyMemoryToAccelerationStructureKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "deferredOperation", toStringFlags, tabCount, tabSize, HandleIdToString(deferredOperation));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "deferredOperation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, deferredOperation);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9397,16 +11183,24 @@ void VulkanAsciiConsumer::Process_vkWriteAccelerationStructuresPropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkWriteAccelerationStructuresPropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize, ToString(accelerationStructureCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryType", toStringFlags, tabCount, tabSize, '"' + ToString(queryType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
-            FieldToString(strStrm, false, "stride", toStringFlags, tabCount, tabSize, ToString(stride, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, accelerationStructureCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, queryType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
+            FieldToString(strBuf, false, "stride", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, stride, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9420,10 +11214,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyAccelerationStructureKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyAccelerationStructureKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9437,10 +11233,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyAccelerationStructureToMemoryKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyAccelerationStructureToMemoryKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9454,10 +11252,12 @@ void VulkanAsciiConsumer::Process_vkCmdCopyMemoryToAccelerationStructureKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdCopyMemoryToAccelerationStructureKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9472,11 +11272,14 @@ void VulkanAsciiConsumer::Process_vkGetAccelerationStructureDeviceAddressKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetAccelerationStructureDeviceAddressKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pInfo, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pInfo, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9494,14 +11297,20 @@ void VulkanAsciiConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdWriteAccelerationStructuresPropertiesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize, ToString(accelerationStructureCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "queryType", toStringFlags, tabCount, tabSize, '"' + ToString(queryType, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "queryPool", toStringFlags, tabCount, tabSize, HandleIdToString(queryPool));
-            FieldToString(strStrm, false, "firstQuery", toStringFlags, tabCount, tabSize, ToString(firstQuery, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "accelerationStructureCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, accelerationStructureCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAccelerationStructures", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, accelerationStructureCount, pAccelerationStructures, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryType", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, queryType, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "queryPool", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, queryPool);
+            FieldToString(strBuf, false, "firstQuery", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstQuery, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9516,11 +11325,14 @@ void VulkanAsciiConsumer::Process_vkGetDeviceAccelerationStructureCompatibilityK
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetDeviceAccelerationStructureCompatibilityKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pVersionInfo", toStringFlags, tabCount, tabSize, PointerDecoderToString(pVersionInfo, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pCompatibility", toStringFlags, tabCount, tabSize, EnumPointerDecoderToString(pCompatibility));
+            FieldToString(strBuf, true, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pVersionInfo", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pVersionInfo, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pCompatibility", toStringFlags, tabCount, tabSize);
+            EnumPointerDecoderToString(strBuf, pCompatibility);
         }
     );
 }
@@ -9540,16 +11352,24 @@ void VulkanAsciiConsumer::Process_vkCmdTraceRaysKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdTraceRaysKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pRaygenShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRaygenShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMissShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMissShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pHitShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pHitShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCallableShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCallableShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "width", toStringFlags, tabCount, tabSize, ToString(width, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "height", toStringFlags, tabCount, tabSize, ToString(height, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "depth", toStringFlags, tabCount, tabSize, ToString(depth, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pRaygenShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRaygenShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMissShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMissShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pHitShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pHitShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCallableShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCallableShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "width", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, width, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "height", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, height, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "depth", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, depth, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9569,16 +11389,24 @@ void VulkanAsciiConsumer::Process_vkCreateRayTracingPipelinesKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCreateRayTracingPipelinesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "deferredOperation", toStringFlags, tabCount, tabSize, HandleIdToString(deferredOperation));
-            FieldToString(strStrm, false, "pipelineCache", toStringFlags, tabCount, tabSize, HandleIdToString(pipelineCache));
-            FieldToString(strStrm, false, "createInfoCount", toStringFlags, tabCount, tabSize, ToString(createInfoCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCreateInfos", toStringFlags, tabCount, tabSize, PointerDecoderArrayToString(createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pAllocator", toStringFlags, tabCount, tabSize, PointerDecoderToString(pAllocator, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pPipelines", toStringFlags, tabCount, tabSize, HandlePointerDecoderArrayToString(createInfoCount, pPipelines, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "deferredOperation", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, deferredOperation);
+            FieldToString(strBuf, false, "pipelineCache", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipelineCache);
+            FieldToString(strBuf, false, "createInfoCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, createInfoCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCreateInfos", toStringFlags, tabCount, tabSize);
+            PointerDecoderArrayToString(strBuf, createInfoCount, pCreateInfos, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pAllocator", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pAllocator, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pPipelines", toStringFlags, tabCount, tabSize);
+            HandlePointerDecoderArrayToString(strBuf, createInfoCount, pPipelines, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9597,15 +11425,22 @@ void VulkanAsciiConsumer::Process_vkGetRayTracingCaptureReplayShaderGroupHandles
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRayTracingCaptureReplayShaderGroupHandlesKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "firstGroup", toStringFlags, tabCount, tabSize, ToString(firstGroup, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupCount", toStringFlags, tabCount, tabSize, ToString(groupCount, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "dataSize", toStringFlags, tabCount, tabSize, ToString(dataSize, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "[out]pData", toStringFlags, tabCount, tabSize, DataPointerDecoderToString(pData));
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "firstGroup", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, firstGroup, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupCount", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, groupCount, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "dataSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, dataSize, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "[out]pData", toStringFlags, tabCount, tabSize);
+            DataPointerDecoderToString(strBuf, pData);
         }
     );
 }
@@ -9623,14 +11458,20 @@ void VulkanAsciiConsumer::Process_vkCmdTraceRaysIndirectKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdTraceRaysIndirectKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pRaygenShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pRaygenShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pMissShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pMissShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pHitShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pHitShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "pCallableShaderBindingTable", toStringFlags, tabCount, tabSize, PointerDecoderToString(pCallableShaderBindingTable, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "indirectDeviceAddress", toStringFlags, tabCount, tabSize, ToString(indirectDeviceAddress, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pRaygenShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pRaygenShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pMissShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pMissShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pHitShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pHitShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "pCallableShaderBindingTable", toStringFlags, tabCount, tabSize);
+            PointerDecoderToString(strBuf, pCallableShaderBindingTable, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "indirectDeviceAddress", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, indirectDeviceAddress, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9647,13 +11488,18 @@ void VulkanAsciiConsumer::Process_vkGetRayTracingShaderGroupStackSizeKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkGetRayTracingShaderGroupStackSizeKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, '"' + ToString(returnValue, toStringFlags, tabCount, tabSize) + '"');
-            FieldToString(strStrm, false, "device", toStringFlags, tabCount, tabSize, HandleIdToString(device));
-            FieldToString(strStrm, false, "pipeline", toStringFlags, tabCount, tabSize, HandleIdToString(pipeline));
-            FieldToString(strStrm, false, "group", toStringFlags, tabCount, tabSize, ToString(group, toStringFlags, tabCount, tabSize));
-            FieldToString(strStrm, false, "groupShader", toStringFlags, tabCount, tabSize, '"' + ToString(groupShader, toStringFlags, tabCount, tabSize) + '"');
+            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "device", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, device);
+            FieldToString(strBuf, false, "pipeline", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, pipeline);
+            FieldToString(strBuf, false, "group", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, group, toStringFlags, tabCount, tabSize);
+            FieldToString(strBuf, false, "groupShader", toStringFlags, tabCount, tabSize);
+            QuotedToString(strBuf, groupShader, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -9667,10 +11513,12 @@ void VulkanAsciiConsumer::Process_vkCmdSetRayTracingPipelineStackSizeKHR(
     uint32_t tabCount = 0;
     uint32_t tabSize = 4;
     WriteApiCallToFile("vkCmdSetRayTracingPipelineStackSizeKHR", toStringFlags, tabCount, tabSize,
-        [&](std::stringstream& strStrm)
+        [&](std::string& strBuf)
         {
-            FieldToString(strStrm, true, "commandBuffer", toStringFlags, tabCount, tabSize, HandleIdToString(commandBuffer));
-            FieldToString(strStrm, false, "pipelineStackSize", toStringFlags, tabCount, tabSize, ToString(pipelineStackSize, toStringFlags, tabCount, tabSize));
+            FieldToString(strBuf, true, "commandBuffer", toStringFlags, tabCount, tabSize);
+            HandleIdToString(strBuf, commandBuffer);
+            FieldToString(strBuf, false, "pipelineStackSize", toStringFlags, tabCount, tabSize);
+            ToString(strBuf, pipelineStackSize, toStringFlags, tabCount, tabSize);
         }
     );
 }
@@ -41,6 +41,16 @@
 
 #include <cstddef>
 
+#if defined(GFXRECON_DECODE_DIRECT_REPLAY_CONSUMER)
+#include "generated/generated_vulkan_replay_consumer.h"
+
+// The single consumer is always a VulkanReplayConsumer, which is called without virtual dispatch.
+#define GFXRECON_DECODE_SINGLE_CONSUMER_CALL(consumer, method) \
+    static_cast<VulkanReplayConsumer*>(consumer)->VulkanReplayConsumer::method
+#else
+#define GFXRECON_DECODE_SINGLE_CONSUMER_CALL(consumer, method) (consumer)->method
+#endif
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
@@ -58,9 +68,17 @@ size_t VulkanDecoder::Decode_vkCreateInstance(const uint8_t* parameter_buffer, s
     bytes_read += pInstance.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateInstance)(return_value, &pCreateInfo, &pAllocator, &pInstance);
+    }
+    else
     {
-        consumer->Process_vkCreateInstance(return_value, &pCreateInfo, &pAllocator, &pInstance);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateInstance(return_value, &pCreateInfo, &pAllocator, &pInstance);
+        }
     }
 
     return bytes_read;
@@ -76,9 +94,17 @@ size_t VulkanDecoder::Decode_vkDestroyInstance(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &instance);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyInstance(instance, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyInstance)(instance, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyInstance(instance, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -98,9 +124,17 @@ size_t VulkanDecoder::Decode_vkEnumeratePhysicalDevices(const uint8_t* parameter
     bytes_read += pPhysicalDevices.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkEnumeratePhysicalDevices)(return_value, instance, &pPhysicalDeviceCount, &pPhysicalDevices);
+    }
+    else
     {
-        consumer->Process_vkEnumeratePhysicalDevices(return_value, instance, &pPhysicalDeviceCount, &pPhysicalDevices);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkEnumeratePhysicalDevices(return_value, instance, &pPhysicalDeviceCount, &pPhysicalDevices);
+        }
     }
 
     return bytes_read;
@@ -116,9 +150,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pFeatures.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceFeatures(physicalDevice, &pFeatures);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFeatures)(physicalDevice, &pFeatures);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFeatures(physicalDevice, &pFeatures);
+        }
     }
 
     return bytes_read;
@@ -136,9 +178,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties(const uint8_t*
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &format);
     bytes_read += pFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFormatProperties)(physicalDevice, format, &pFormatProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceFormatProperties(physicalDevice, format, &pFormatProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFormatProperties(physicalDevice, format, &pFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -166,9 +216,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties(const uint
     bytes_read += pImageFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceImageFormatProperties(return_value, physicalDevice, format, type, tiling, usage, flags, &pImageFormatProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceImageFormatProperties)(return_value, physicalDevice, format, type, tiling, usage, flags, &pImageFormatProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceImageFormatProperties(return_value, physicalDevice, format, type, tiling, usage, flags, &pImageFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -184,9 +242,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceProperties(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceProperties)(physicalDevice, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceProperties(physicalDevice, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceProperties(physicalDevice, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -204,9 +270,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties(const uint
     bytes_read += pQueueFamilyPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pQueueFamilyProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceQueueFamilyProperties)(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        }
     }
 
     return bytes_read;
@@ -222,9 +296,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties(const uint8_t*
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pMemoryProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceMemoryProperties)(physicalDevice, &pMemoryProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceMemoryProperties(physicalDevice, &pMemoryProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceMemoryProperties(physicalDevice, &pMemoryProperties);
+        }
     }
 
     return bytes_read;
@@ -246,9 +328,17 @@ size_t VulkanDecoder::Decode_vkCreateDevice(const uint8_t* parameter_buffer, siz
     bytes_read += pDevice.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateDevice(return_value, physicalDevice, &pCreateInfo, &pAllocator, &pDevice);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDevice)(return_value, physicalDevice, &pCreateInfo, &pAllocator, &pDevice);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDevice(return_value, physicalDevice, &pCreateInfo, &pAllocator, &pDevice);
+        }
     }
 
     return bytes_read;
@@ -264,9 +354,17 @@ size_t VulkanDecoder::Decode_vkDestroyDevice(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &device);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDevice)(device, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyDevice(device, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDevice(device, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -286,9 +384,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceQueue(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queueIndex);
     bytes_read += pQueue.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeviceQueue(device, queueFamilyIndex, queueIndex, &pQueue);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceQueue)(device, queueFamilyIndex, queueIndex, &pQueue);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceQueue(device, queueFamilyIndex, queueIndex, &pQueue);
+        }
     }
 
     return bytes_read;
@@ -310,9 +416,17 @@ size_t VulkanDecoder::Decode_vkQueueSubmit(const uint8_t* parameter_buffer, size
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &fence);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueSubmit)(return_value, queue, submitCount, &pSubmits, fence);
+    }
+    else
     {
-        consumer->Process_vkQueueSubmit(return_value, queue, submitCount, &pSubmits, fence);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueSubmit(return_value, queue, submitCount, &pSubmits, fence);
+        }
     }
 
     return bytes_read;
@@ -328,9 +442,17 @@ size_t VulkanDecoder::Decode_vkQueueWaitIdle(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queue);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkQueueWaitIdle(return_value, queue);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueWaitIdle)(return_value, queue);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueWaitIdle(return_value, queue);
+        }
     }
 
     return bytes_read;
@@ -346,9 +468,17 @@ size_t VulkanDecoder::Decode_vkDeviceWaitIdle(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &device);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDeviceWaitIdle)(return_value, device);
+    }
+    else
     {
-        consumer->Process_vkDeviceWaitIdle(return_value, device);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDeviceWaitIdle(return_value, device);
+        }
     }
 
     return bytes_read;
@@ -370,9 +500,17 @@ size_t VulkanDecoder::Decode_vkAllocateMemory(const uint8_t* parameter_buffer, s
     bytes_read += pMemory.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAllocateMemory(return_value, device, &pAllocateInfo, &pAllocator, &pMemory);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAllocateMemory)(return_value, device, &pAllocateInfo, &pAllocator, &pMemory);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAllocateMemory(return_value, device, &pAllocateInfo, &pAllocator, &pMemory);
+        }
     }
 
     return bytes_read;
@@ -390,9 +528,17 @@ size_t VulkanDecoder::Decode_vkFreeMemory(const uint8_t* parameter_buffer, size_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &memory);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkFreeMemory)(device, memory, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkFreeMemory(device, memory, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkFreeMemory(device, memory, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -418,9 +564,17 @@ size_t VulkanDecoder::Decode_vkMapMemory(const uint8_t* parameter_buffer, size_t
     bytes_read += ppData.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkMapMemory(return_value, device, memory, offset, size, flags, &ppData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkMapMemory)(return_value, device, memory, offset, size, flags, &ppData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkMapMemory(return_value, device, memory, offset, size, flags, &ppData);
+        }
     }
 
     return bytes_read;
@@ -436,9 +590,17 @@ size_t VulkanDecoder::Decode_vkUnmapMemory(const uint8_t* parameter_buffer, size
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &device);
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &memory);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkUnmapMemory)(device, memory);
+    }
+    else
     {
-        consumer->Process_vkUnmapMemory(device, memory);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkUnmapMemory(device, memory);
+        }
     }
 
     return bytes_read;
@@ -458,9 +620,17 @@ size_t VulkanDecoder::Decode_vkFlushMappedMemoryRanges(const uint8_t* parameter_
     bytes_read += pMemoryRanges.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkFlushMappedMemoryRanges(return_value, device, memoryRangeCount, &pMemoryRanges);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkFlushMappedMemoryRanges)(return_value, device, memoryRangeCount, &pMemoryRanges);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkFlushMappedMemoryRanges(return_value, device, memoryRangeCount, &pMemoryRanges);
+        }
     }
 
     return bytes_read;
@@ -480,9 +650,17 @@ size_t VulkanDecoder::Decode_vkInvalidateMappedMemoryRanges(const uint8_t* param
     bytes_read += pMemoryRanges.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkInvalidateMappedMemoryRanges)(return_value, device, memoryRangeCount, &pMemoryRanges);
+    }
+    else
     {
-        consumer->Process_vkInvalidateMappedMemoryRanges(return_value, device, memoryRangeCount, &pMemoryRanges);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkInvalidateMappedMemoryRanges(return_value, device, memoryRangeCount, &pMemoryRanges);
+        }
     }
 
     return bytes_read;
@@ -500,9 +678,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceMemoryCommitment(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &memory);
     bytes_read += pCommittedMemoryInBytes.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeviceMemoryCommitment(device, memory, &pCommittedMemoryInBytes);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceMemoryCommitment)(device, memory, &pCommittedMemoryInBytes);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceMemoryCommitment(device, memory, &pCommittedMemoryInBytes);
+        }
     }
 
     return bytes_read;
@@ -524,9 +710,17 @@ size_t VulkanDecoder::Decode_vkBindBufferMemory(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &memoryOffset);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindBufferMemory)(return_value, device, buffer, memory, memoryOffset);
+    }
+    else
     {
-        consumer->Process_vkBindBufferMemory(return_value, device, buffer, memory, memoryOffset);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindBufferMemory(return_value, device, buffer, memory, memoryOffset);
+        }
     }
 
     return bytes_read;
@@ -548,9 +742,17 @@ size_t VulkanDecoder::Decode_vkBindImageMemory(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &memoryOffset);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkBindImageMemory(return_value, device, image, memory, memoryOffset);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindImageMemory)(return_value, device, image, memory, memoryOffset);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindImageMemory(return_value, device, image, memory, memoryOffset);
+        }
     }
 
     return bytes_read;
@@ -568,9 +770,17 @@ size_t VulkanDecoder::Decode_vkGetBufferMemoryRequirements(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &buffer);
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferMemoryRequirements)(device, buffer, &pMemoryRequirements);
+    }
+    else
     {
-        consumer->Process_vkGetBufferMemoryRequirements(device, buffer, &pMemoryRequirements);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferMemoryRequirements(device, buffer, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -588,9 +798,17 @@ size_t VulkanDecoder::Decode_vkGetImageMemoryRequirements(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &image);
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageMemoryRequirements(device, image, &pMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageMemoryRequirements)(device, image, &pMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageMemoryRequirements(device, image, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -610,9 +828,17 @@ size_t VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements(const uint8_t* p
     bytes_read += pSparseMemoryRequirementCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSparseMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageSparseMemoryRequirements)(device, image, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+    }
+    else
     {
-        consumer->Process_vkGetImageSparseMemoryRequirements(device, image, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageSparseMemoryRequirements(device, image, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -640,9 +866,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties(cons
     bytes_read += pPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties(physicalDevice, format, type, samples, usage, tiling, &pPropertyCount, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSparseImageFormatProperties)(physicalDevice, format, type, samples, usage, tiling, &pPropertyCount, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties(physicalDevice, format, type, samples, usage, tiling, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -664,9 +898,17 @@ size_t VulkanDecoder::Decode_vkQueueBindSparse(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &fence);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueBindSparse)(return_value, queue, bindInfoCount, &pBindInfo, fence);
+    }
+    else
     {
-        consumer->Process_vkQueueBindSparse(return_value, queue, bindInfoCount, &pBindInfo, fence);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueBindSparse(return_value, queue, bindInfoCount, &pBindInfo, fence);
+        }
     }
 
     return bytes_read;
@@ -688,9 +930,17 @@ size_t VulkanDecoder::Decode_vkCreateFence(const uint8_t* parameter_buffer, size
     bytes_read += pFence.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateFence(return_value, device, &pCreateInfo, &pAllocator, &pFence);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateFence)(return_value, device, &pCreateInfo, &pAllocator, &pFence);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateFence(return_value, device, &pCreateInfo, &pAllocator, &pFence);
+        }
     }
 
     return bytes_read;
@@ -708,9 +958,17 @@ size_t VulkanDecoder::Decode_vkDestroyFence(const uint8_t* parameter_buffer, siz
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &fence);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyFence)(device, fence, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyFence(device, fence, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyFence(device, fence, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -730,9 +988,17 @@ size_t VulkanDecoder::Decode_vkResetFences(const uint8_t* parameter_buffer, size
     bytes_read += pFences.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkResetFences(return_value, device, fenceCount, &pFences);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetFences)(return_value, device, fenceCount, &pFences);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetFences(return_value, device, fenceCount, &pFences);
+        }
     }
 
     return bytes_read;
@@ -750,9 +1016,17 @@ size_t VulkanDecoder::Decode_vkGetFenceStatus(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &fence);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetFenceStatus)(return_value, device, fence);
+    }
+    else
     {
-        consumer->Process_vkGetFenceStatus(return_value, device, fence);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetFenceStatus(return_value, device, fence);
+        }
     }
 
     return bytes_read;
@@ -776,9 +1050,17 @@ size_t VulkanDecoder::Decode_vkWaitForFences(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &timeout);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkWaitForFences(return_value, device, fenceCount, &pFences, waitAll, timeout);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkWaitForFences)(return_value, device, fenceCount, &pFences, waitAll, timeout);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkWaitForFences(return_value, device, fenceCount, &pFences, waitAll, timeout);
+        }
     }
 
     return bytes_read;
@@ -800,9 +1082,17 @@ size_t VulkanDecoder::Decode_vkCreateSemaphore(const uint8_t* parameter_buffer,
     bytes_read += pSemaphore.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSemaphore)(return_value, device, &pCreateInfo, &pAllocator, &pSemaphore);
+    }
+    else
     {
-        consumer->Process_vkCreateSemaphore(return_value, device, &pCreateInfo, &pAllocator, &pSemaphore);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSemaphore(return_value, device, &pCreateInfo, &pAllocator, &pSemaphore);
+        }
     }
 
     return bytes_read;
@@ -820,9 +1110,17 @@ size_t VulkanDecoder::Decode_vkDestroySemaphore(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &semaphore);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySemaphore(device, semaphore, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySemaphore)(device, semaphore, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySemaphore(device, semaphore, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -844,9 +1142,17 @@ size_t VulkanDecoder::Decode_vkCreateEvent(const uint8_t* parameter_buffer, size
     bytes_read += pEvent.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateEvent)(return_value, device, &pCreateInfo, &pAllocator, &pEvent);
+    }
+    else
     {
-        consumer->Process_vkCreateEvent(return_value, device, &pCreateInfo, &pAllocator, &pEvent);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateEvent(return_value, device, &pCreateInfo, &pAllocator, &pEvent);
+        }
     }
 
     return bytes_read;
@@ -864,9 +1170,17 @@ size_t VulkanDecoder::Decode_vkDestroyEvent(const uint8_t* parameter_buffer, siz
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyEvent(device, event, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyEvent)(device, event, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyEvent(device, event, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -884,9 +1198,17 @@ size_t VulkanDecoder::Decode_vkGetEventStatus(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetEventStatus)(return_value, device, event);
+    }
+    else
     {
-        consumer->Process_vkGetEventStatus(return_value, device, event);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetEventStatus(return_value, device, event);
+        }
     }
 
     return bytes_read;
@@ -904,9 +1226,17 @@ size_t VulkanDecoder::Decode_vkSetEvent(const uint8_t* parameter_buffer, size_t
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkSetEvent(return_value, device, event);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetEvent)(return_value, device, event);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetEvent(return_value, device, event);
+        }
     }
 
     return bytes_read;
@@ -924,9 +1254,17 @@ size_t VulkanDecoder::Decode_vkResetEvent(const uint8_t* parameter_buffer, size_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetEvent)(return_value, device, event);
+    }
+    else
     {
-        consumer->Process_vkResetEvent(return_value, device, event);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetEvent(return_value, device, event);
+        }
     }
 
     return bytes_read;
@@ -948,9 +1286,17 @@ size_t VulkanDecoder::Decode_vkCreateQueryPool(const uint8_t* parameter_buffer,
     bytes_read += pQueryPool.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateQueryPool(return_value, device, &pCreateInfo, &pAllocator, &pQueryPool);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateQueryPool)(return_value, device, &pCreateInfo, &pAllocator, &pQueryPool);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateQueryPool(return_value, device, &pCreateInfo, &pAllocator, &pQueryPool);
+        }
     }
 
     return bytes_read;
@@ -968,9 +1314,17 @@ size_t VulkanDecoder::Decode_vkDestroyQueryPool(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyQueryPool)(device, queryPool, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyQueryPool(device, queryPool, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyQueryPool(device, queryPool, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1000,9 +1354,17 @@ size_t VulkanDecoder::Decode_vkGetQueryPoolResults(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetQueryPoolResults(return_value, device, queryPool, firstQuery, queryCount, dataSize, &pData, stride, flags);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetQueryPoolResults)(return_value, device, queryPool, firstQuery, queryCount, dataSize, &pData, stride, flags);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetQueryPoolResults(return_value, device, queryPool, firstQuery, queryCount, dataSize, &pData, stride, flags);
+        }
     }
 
     return bytes_read;
@@ -1024,9 +1386,17 @@ size_t VulkanDecoder::Decode_vkCreateBuffer(const uint8_t* parameter_buffer, siz
     bytes_read += pBuffer.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateBuffer)(return_value, device, &pCreateInfo, &pAllocator, &pBuffer);
+    }
+    else
     {
-        consumer->Process_vkCreateBuffer(return_value, device, &pCreateInfo, &pAllocator, &pBuffer);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateBuffer(return_value, device, &pCreateInfo, &pAllocator, &pBuffer);
+        }
     }
 
     return bytes_read;
@@ -1044,9 +1414,17 @@ size_t VulkanDecoder::Decode_vkDestroyBuffer(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &buffer);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyBuffer(device, buffer, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyBuffer)(device, buffer, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyBuffer(device, buffer, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1068,9 +1446,17 @@ size_t VulkanDecoder::Decode_vkCreateBufferView(const uint8_t* parameter_buffer,
     bytes_read += pView.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateBufferView)(return_value, device, &pCreateInfo, &pAllocator, &pView);
+    }
+    else
     {
-        consumer->Process_vkCreateBufferView(return_value, device, &pCreateInfo, &pAllocator, &pView);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateBufferView(return_value, device, &pCreateInfo, &pAllocator, &pView);
+        }
     }
 
     return bytes_read;
@@ -1088,9 +1474,17 @@ size_t VulkanDecoder::Decode_vkDestroyBufferView(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &bufferView);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyBufferView(device, bufferView, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyBufferView)(device, bufferView, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyBufferView(device, bufferView, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1112,9 +1506,17 @@ size_t VulkanDecoder::Decode_vkCreateImage(const uint8_t* parameter_buffer, size
     bytes_read += pImage.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateImage)(return_value, device, &pCreateInfo, &pAllocator, &pImage);
+    }
+    else
     {
-        consumer->Process_vkCreateImage(return_value, device, &pCreateInfo, &pAllocator, &pImage);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateImage(return_value, device, &pCreateInfo, &pAllocator, &pImage);
+        }
     }
 
     return bytes_read;
@@ -1132,9 +1534,17 @@ size_t VulkanDecoder::Decode_vkDestroyImage(const uint8_t* parameter_buffer, siz
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &image);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyImage(device, image, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyImage)(device, image, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyImage(device, image, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1154,9 +1564,17 @@ size_t VulkanDecoder::Decode_vkGetImageSubresourceLayout(const uint8_t* paramete
     bytes_read += pSubresource.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pLayout.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageSubresourceLayout)(device, image, &pSubresource, &pLayout);
+    }
+    else
     {
-        consumer->Process_vkGetImageSubresourceLayout(device, image, &pSubresource, &pLayout);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageSubresourceLayout(device, image, &pSubresource, &pLayout);
+        }
     }
 
     return bytes_read;
@@ -1178,9 +1596,17 @@ size_t VulkanDecoder::Decode_vkCreateImageView(const uint8_t* parameter_buffer,
     bytes_read += pView.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateImageView(return_value, device, &pCreateInfo, &pAllocator, &pView);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateImageView)(return_value, device, &pCreateInfo, &pAllocator, &pView);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateImageView(return_value, device, &pCreateInfo, &pAllocator, &pView);
+        }
     }
 
     return bytes_read;
@@ -1198,9 +1624,17 @@ size_t VulkanDecoder::Decode_vkDestroyImageView(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageView);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyImageView)(device, imageView, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyImageView(device, imageView, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyImageView(device, imageView, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1222,9 +1656,17 @@ size_t VulkanDecoder::Decode_vkCreateShaderModule(const uint8_t* parameter_buffe
     bytes_read += pShaderModule.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateShaderModule(return_value, device, &pCreateInfo, &pAllocator, &pShaderModule);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateShaderModule)(return_value, device, &pCreateInfo, &pAllocator, &pShaderModule);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateShaderModule(return_value, device, &pCreateInfo, &pAllocator, &pShaderModule);
+        }
     }
 
     return bytes_read;
@@ -1242,9 +1684,17 @@ size_t VulkanDecoder::Decode_vkDestroyShaderModule(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &shaderModule);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyShaderModule)(device, shaderModule, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyShaderModule(device, shaderModule, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyShaderModule(device, shaderModule, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1266,9 +1716,17 @@ size_t VulkanDecoder::Decode_vkCreatePipelineCache(const uint8_t* parameter_buff
     bytes_read += pPipelineCache.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreatePipelineCache(return_value, device, &pCreateInfo, &pAllocator, &pPipelineCache);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreatePipelineCache)(return_value, device, &pCreateInfo, &pAllocator, &pPipelineCache);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreatePipelineCache(return_value, device, &pCreateInfo, &pAllocator, &pPipelineCache);
+        }
     }
 
     return bytes_read;
@@ -1286,9 +1744,17 @@ size_t VulkanDecoder::Decode_vkDestroyPipelineCache(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipelineCache);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyPipelineCache)(device, pipelineCache, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyPipelineCache(device, pipelineCache, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyPipelineCache(device, pipelineCache, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1310,9 +1776,17 @@ size_t VulkanDecoder::Decode_vkGetPipelineCacheData(const uint8_t* parameter_buf
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPipelineCacheData(return_value, device, pipelineCache, &pDataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPipelineCacheData)(return_value, device, pipelineCache, &pDataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPipelineCacheData(return_value, device, pipelineCache, &pDataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -1334,9 +1808,17 @@ size_t VulkanDecoder::Decode_vkMergePipelineCaches(const uint8_t* parameter_buff
     bytes_read += pSrcCaches.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkMergePipelineCaches)(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+    }
+    else
     {
-        consumer->Process_vkMergePipelineCaches(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkMergePipelineCaches(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+        }
     }
 
     return bytes_read;
@@ -1362,9 +1844,17 @@ size_t VulkanDecoder::Decode_vkCreateGraphicsPipelines(const uint8_t* parameter_
     bytes_read += pPipelines.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateGraphicsPipelines(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateGraphicsPipelines)(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateGraphicsPipelines(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        }
     }
 
     return bytes_read;
@@ -1390,9 +1880,17 @@ size_t VulkanDecoder::Decode_vkCreateComputePipelines(const uint8_t* parameter_b
     bytes_read += pPipelines.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateComputePipelines)(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+    }
+    else
     {
-        consumer->Process_vkCreateComputePipelines(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateComputePipelines(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        }
     }
 
     return bytes_read;
@@ -1410,9 +1908,17 @@ size_t VulkanDecoder::Decode_vkDestroyPipeline(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipeline);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyPipeline(device, pipeline, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyPipeline)(device, pipeline, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyPipeline(device, pipeline, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1434,9 +1940,17 @@ size_t VulkanDecoder::Decode_vkCreatePipelineLayout(const uint8_t* parameter_buf
     bytes_read += pPipelineLayout.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreatePipelineLayout)(return_value, device, &pCreateInfo, &pAllocator, &pPipelineLayout);
+    }
+    else
     {
-        consumer->Process_vkCreatePipelineLayout(return_value, device, &pCreateInfo, &pAllocator, &pPipelineLayout);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreatePipelineLayout(return_value, device, &pCreateInfo, &pAllocator, &pPipelineLayout);
+        }
     }
 
     return bytes_read;
@@ -1454,9 +1968,17 @@ size_t VulkanDecoder::Decode_vkDestroyPipelineLayout(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipelineLayout);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyPipelineLayout(device, pipelineLayout, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyPipelineLayout)(device, pipelineLayout, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyPipelineLayout(device, pipelineLayout, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1478,9 +2000,17 @@ size_t VulkanDecoder::Decode_vkCreateSampler(const uint8_t* parameter_buffer, si
     bytes_read += pSampler.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSampler)(return_value, device, &pCreateInfo, &pAllocator, &pSampler);
+    }
+    else
     {
-        consumer->Process_vkCreateSampler(return_value, device, &pCreateInfo, &pAllocator, &pSampler);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSampler(return_value, device, &pCreateInfo, &pAllocator, &pSampler);
+        }
     }
 
     return bytes_read;
@@ -1498,9 +2028,17 @@ size_t VulkanDecoder::Decode_vkDestroySampler(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &sampler);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySampler(device, sampler, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySampler)(device, sampler, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySampler(device, sampler, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1522,9 +2060,17 @@ size_t VulkanDecoder::Decode_vkCreateDescriptorSetLayout(const uint8_t* paramete
     bytes_read += pSetLayout.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDescriptorSetLayout)(return_value, device, &pCreateInfo, &pAllocator, &pSetLayout);
+    }
+    else
     {
-        consumer->Process_vkCreateDescriptorSetLayout(return_value, device, &pCreateInfo, &pAllocator, &pSetLayout);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDescriptorSetLayout(return_value, device, &pCreateInfo, &pAllocator, &pSetLayout);
+        }
     }
 
     return bytes_read;
@@ -1542,9 +2088,17 @@ size_t VulkanDecoder::Decode_vkDestroyDescriptorSetLayout(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorSetLayout);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDescriptorSetLayout(device, descriptorSetLayout, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDescriptorSetLayout)(device, descriptorSetLayout, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDescriptorSetLayout(device, descriptorSetLayout, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1566,9 +2120,17 @@ size_t VulkanDecoder::Decode_vkCreateDescriptorPool(const uint8_t* parameter_buf
     bytes_read += pDescriptorPool.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDescriptorPool)(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorPool);
+    }
+    else
     {
-        consumer->Process_vkCreateDescriptorPool(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorPool);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDescriptorPool(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorPool);
+        }
     }
 
     return bytes_read;
@@ -1586,9 +2148,17 @@ size_t VulkanDecoder::Decode_vkDestroyDescriptorPool(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorPool);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDescriptorPool(device, descriptorPool, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDescriptorPool)(device, descriptorPool, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDescriptorPool(device, descriptorPool, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1608,9 +2178,17 @@ size_t VulkanDecoder::Decode_vkResetDescriptorPool(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetDescriptorPool)(return_value, device, descriptorPool, flags);
+    }
+    else
     {
-        consumer->Process_vkResetDescriptorPool(return_value, device, descriptorPool, flags);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetDescriptorPool(return_value, device, descriptorPool, flags);
+        }
     }
 
     return bytes_read;
@@ -1630,9 +2208,17 @@ size_t VulkanDecoder::Decode_vkAllocateDescriptorSets(const uint8_t* parameter_b
     bytes_read += pDescriptorSets.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAllocateDescriptorSets(return_value, device, &pAllocateInfo, &pDescriptorSets);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAllocateDescriptorSets)(return_value, device, &pAllocateInfo, &pDescriptorSets);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAllocateDescriptorSets(return_value, device, &pAllocateInfo, &pDescriptorSets);
+        }
     }
 
     return bytes_read;
@@ -1654,9 +2240,17 @@ size_t VulkanDecoder::Decode_vkFreeDescriptorSets(const uint8_t* parameter_buffe
     bytes_read += pDescriptorSets.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkFreeDescriptorSets)(return_value, device, descriptorPool, descriptorSetCount, &pDescriptorSets);
+    }
+    else
     {
-        consumer->Process_vkFreeDescriptorSets(return_value, device, descriptorPool, descriptorSetCount, &pDescriptorSets);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkFreeDescriptorSets(return_value, device, descriptorPool, descriptorSetCount, &pDescriptorSets);
+        }
     }
 
     return bytes_read;
@@ -1678,9 +2272,17 @@ size_t VulkanDecoder::Decode_vkUpdateDescriptorSets(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorCopyCount);
     bytes_read += pDescriptorCopies.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkUpdateDescriptorSets(device, descriptorWriteCount, &pDescriptorWrites, descriptorCopyCount, &pDescriptorCopies);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkUpdateDescriptorSets)(device, descriptorWriteCount, &pDescriptorWrites, descriptorCopyCount, &pDescriptorCopies);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkUpdateDescriptorSets(device, descriptorWriteCount, &pDescriptorWrites, descriptorCopyCount, &pDescriptorCopies);
+        }
     }
 
     return bytes_read;
@@ -1702,9 +2304,17 @@ size_t VulkanDecoder::Decode_vkCreateFramebuffer(const uint8_t* parameter_buffer
     bytes_read += pFramebuffer.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateFramebuffer)(return_value, device, &pCreateInfo, &pAllocator, &pFramebuffer);
+    }
+    else
     {
-        consumer->Process_vkCreateFramebuffer(return_value, device, &pCreateInfo, &pAllocator, &pFramebuffer);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateFramebuffer(return_value, device, &pCreateInfo, &pAllocator, &pFramebuffer);
+        }
     }
 
     return bytes_read;
@@ -1722,9 +2332,17 @@ size_t VulkanDecoder::Decode_vkDestroyFramebuffer(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &framebuffer);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyFramebuffer(device, framebuffer, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyFramebuffer)(device, framebuffer, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyFramebuffer(device, framebuffer, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1746,9 +2364,17 @@ size_t VulkanDecoder::Decode_vkCreateRenderPass(const uint8_t* parameter_buffer,
     bytes_read += pRenderPass.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateRenderPass)(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+    }
+    else
     {
-        consumer->Process_vkCreateRenderPass(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateRenderPass(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        }
     }
 
     return bytes_read;
@@ -1766,9 +2392,17 @@ size_t VulkanDecoder::Decode_vkDestroyRenderPass(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &renderPass);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyRenderPass(device, renderPass, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyRenderPass)(device, renderPass, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyRenderPass(device, renderPass, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1786,9 +2420,17 @@ size_t VulkanDecoder::Decode_vkGetRenderAreaGranularity(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &renderPass);
     bytes_read += pGranularity.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRenderAreaGranularity)(device, renderPass, &pGranularity);
+    }
+    else
     {
-        consumer->Process_vkGetRenderAreaGranularity(device, renderPass, &pGranularity);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRenderAreaGranularity(device, renderPass, &pGranularity);
+        }
     }
 
     return bytes_read;
@@ -1810,9 +2452,17 @@ size_t VulkanDecoder::Decode_vkCreateCommandPool(const uint8_t* parameter_buffer
     bytes_read += pCommandPool.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateCommandPool(return_value, device, &pCreateInfo, &pAllocator, &pCommandPool);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateCommandPool)(return_value, device, &pCreateInfo, &pAllocator, &pCommandPool);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateCommandPool(return_value, device, &pCreateInfo, &pAllocator, &pCommandPool);
+        }
     }
 
     return bytes_read;
@@ -1830,9 +2480,17 @@ size_t VulkanDecoder::Decode_vkDestroyCommandPool(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandPool);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyCommandPool)(device, commandPool, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyCommandPool(device, commandPool, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyCommandPool(device, commandPool, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -1852,9 +2510,17 @@ size_t VulkanDecoder::Decode_vkResetCommandPool(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkResetCommandPool(return_value, device, commandPool, flags);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetCommandPool)(return_value, device, commandPool, flags);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetCommandPool(return_value, device, commandPool, flags);
+        }
     }
 
     return bytes_read;
@@ -1874,9 +2540,17 @@ size_t VulkanDecoder::Decode_vkAllocateCommandBuffers(const uint8_t* parameter_b
     bytes_read += pCommandBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAllocateCommandBuffers)(return_value, device, &pAllocateInfo, &pCommandBuffers);
+    }
+    else
     {
-        consumer->Process_vkAllocateCommandBuffers(return_value, device, &pAllocateInfo, &pCommandBuffers);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAllocateCommandBuffers(return_value, device, &pAllocateInfo, &pCommandBuffers);
+        }
     }
 
     return bytes_read;
@@ -1896,9 +2570,17 @@ size_t VulkanDecoder::Decode_vkFreeCommandBuffers(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBufferCount);
     bytes_read += pCommandBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkFreeCommandBuffers(device, commandPool, commandBufferCount, &pCommandBuffers);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkFreeCommandBuffers)(device, commandPool, commandBufferCount, &pCommandBuffers);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkFreeCommandBuffers(device, commandPool, commandBufferCount, &pCommandBuffers);
+        }
     }
 
     return bytes_read;
@@ -1916,9 +2598,17 @@ size_t VulkanDecoder::Decode_vkBeginCommandBuffer(const uint8_t* parameter_buffe
     bytes_read += pBeginInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBeginCommandBuffer)(return_value, commandBuffer, &pBeginInfo);
+    }
+    else
     {
-        consumer->Process_vkBeginCommandBuffer(return_value, commandBuffer, &pBeginInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBeginCommandBuffer(return_value, commandBuffer, &pBeginInfo);
+        }
     }
 
     return bytes_read;
@@ -1934,9 +2624,17 @@ size_t VulkanDecoder::Decode_vkEndCommandBuffer(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkEndCommandBuffer(return_value, commandBuffer);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkEndCommandBuffer)(return_value, commandBuffer);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkEndCommandBuffer(return_value, commandBuffer);
+        }
     }
 
     return bytes_read;
@@ -1954,9 +2652,17 @@ size_t VulkanDecoder::Decode_vkResetCommandBuffer(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetCommandBuffer)(return_value, commandBuffer, flags);
+    }
+    else
     {
-        consumer->Process_vkResetCommandBuffer(return_value, commandBuffer, flags);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetCommandBuffer(return_value, commandBuffer, flags);
+        }
     }
 
     return bytes_read;
@@ -1974,9 +2680,17 @@ size_t VulkanDecoder::Decode_vkCmdBindPipeline(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipelineBindPoint);
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipeline);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBindPipeline(commandBuffer, pipelineBindPoint, pipeline);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindPipeline)(commandBuffer, pipelineBindPoint, pipeline);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindPipeline(commandBuffer, pipelineBindPoint, pipeline);
+        }
     }
 
     return bytes_read;
@@ -1996,9 +2710,17 @@ size_t VulkanDecoder::Decode_vkCmdSetViewport(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &viewportCount);
     bytes_read += pViewports.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetViewport)(commandBuffer, firstViewport, viewportCount, &pViewports);
+    }
+    else
     {
-        consumer->Process_vkCmdSetViewport(commandBuffer, firstViewport, viewportCount, &pViewports);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetViewport(commandBuffer, firstViewport, viewportCount, &pViewports);
+        }
     }
 
     return bytes_read;
@@ -2018,9 +2740,17 @@ size_t VulkanDecoder::Decode_vkCmdSetScissor(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &scissorCount);
     bytes_read += pScissors.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetScissor(commandBuffer, firstScissor, scissorCount, &pScissors);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetScissor)(commandBuffer, firstScissor, scissorCount, &pScissors);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetScissor(commandBuffer, firstScissor, scissorCount, &pScissors);
+        }
     }
 
     return bytes_read;
@@ -2036,9 +2766,17 @@ size_t VulkanDecoder::Decode_vkCmdSetLineWidth(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeFloatValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &lineWidth);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetLineWidth)(commandBuffer, lineWidth);
+    }
+    else
     {
-        consumer->Process_vkCmdSetLineWidth(commandBuffer, lineWidth);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetLineWidth(commandBuffer, lineWidth);
+        }
     }
 
     return bytes_read;
@@ -2058,9 +2796,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthBias(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeFloatValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthBiasClamp);
     bytes_read += ValueDecoder::DecodeFloatValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthBiasSlopeFactor);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDepthBias(commandBuffer, depthBiasConstantFactor, depthBiasClamp, depthBiasSlopeFactor);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthBias)(commandBuffer, depthBiasConstantFactor, depthBiasClamp, depthBiasSlopeFactor);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthBias(commandBuffer, depthBiasConstantFactor, depthBiasClamp, depthBiasSlopeFactor);
+        }
     }
 
     return bytes_read;
@@ -2076,9 +2822,17 @@ size_t VulkanDecoder::Decode_vkCmdSetBlendConstants(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += blendConstants.DecodeFloat((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetBlendConstants)(commandBuffer, &blendConstants);
+    }
+    else
     {
-        consumer->Process_vkCmdSetBlendConstants(commandBuffer, &blendConstants);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetBlendConstants(commandBuffer, &blendConstants);
+        }
     }
 
     return bytes_read;
@@ -2096,9 +2850,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthBounds(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeFloatValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &minDepthBounds);
     bytes_read += ValueDecoder::DecodeFloatValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDepthBounds);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDepthBounds(commandBuffer, minDepthBounds, maxDepthBounds);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthBounds)(commandBuffer, minDepthBounds, maxDepthBounds);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthBounds(commandBuffer, minDepthBounds, maxDepthBounds);
+        }
     }
 
     return bytes_read;
@@ -2116,9 +2878,17 @@ size_t VulkanDecoder::Decode_vkCmdSetStencilCompareMask(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &faceMask);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &compareMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetStencilCompareMask)(commandBuffer, faceMask, compareMask);
+    }
+    else
     {
-        consumer->Process_vkCmdSetStencilCompareMask(commandBuffer, faceMask, compareMask);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetStencilCompareMask(commandBuffer, faceMask, compareMask);
+        }
     }
 
     return bytes_read;
@@ -2136,9 +2906,17 @@ size_t VulkanDecoder::Decode_vkCmdSetStencilWriteMask(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &faceMask);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &writeMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetStencilWriteMask(commandBuffer, faceMask, writeMask);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetStencilWriteMask)(commandBuffer, faceMask, writeMask);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetStencilWriteMask(commandBuffer, faceMask, writeMask);
+        }
     }
 
     return bytes_read;
@@ -2156,9 +2934,17 @@ size_t VulkanDecoder::Decode_vkCmdSetStencilReference(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &faceMask);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &reference);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetStencilReference)(commandBuffer, faceMask, reference);
+    }
+    else
     {
-        consumer->Process_vkCmdSetStencilReference(commandBuffer, faceMask, reference);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetStencilReference(commandBuffer, faceMask, reference);
+        }
     }
 
     return bytes_read;
@@ -2186,9 +2972,17 @@ size_t VulkanDecoder::Decode_vkCmdBindDescriptorSets(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &dynamicOffsetCount);
     bytes_read += pDynamicOffsets.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBindDescriptorSets(commandBuffer, pipelineBindPoint, layout, firstSet, descriptorSetCount, &pDescriptorSets, dynamicOffsetCount, &pDynamicOffsets);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindDescriptorSets)(commandBuffer, pipelineBindPoint, layout, firstSet, descriptorSetCount, &pDescriptorSets, dynamicOffsetCount, &pDynamicOffsets);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindDescriptorSets(commandBuffer, pipelineBindPoint, layout, firstSet, descriptorSetCount, &pDescriptorSets, dynamicOffsetCount, &pDynamicOffsets);
+        }
     }
 
     return bytes_read;
@@ -2208,9 +3002,17 @@ size_t VulkanDecoder::Decode_vkCmdBindIndexBuffer(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &offset);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &indexType);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindIndexBuffer)(commandBuffer, buffer, offset, indexType);
+    }
+    else
     {
-        consumer->Process_vkCmdBindIndexBuffer(commandBuffer, buffer, offset, indexType);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindIndexBuffer(commandBuffer, buffer, offset, indexType);
+        }
     }
 
     return bytes_read;
@@ -2232,9 +3034,17 @@ size_t VulkanDecoder::Decode_vkCmdBindVertexBuffers(const uint8_t* parameter_buf
     bytes_read += pBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pOffsets.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBindVertexBuffers(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindVertexBuffers)(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindVertexBuffers(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets);
+        }
     }
 
     return bytes_read;
@@ -2256,9 +3066,17 @@ size_t VulkanDecoder::Decode_vkCmdDraw(const uint8_t* parameter_buffer, size_t b
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstVertex);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstInstance);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDraw)(commandBuffer, vertexCount, instanceCount, firstVertex, firstInstance);
+    }
+    else
     {
-        consumer->Process_vkCmdDraw(commandBuffer, vertexCount, instanceCount, firstVertex, firstInstance);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDraw(commandBuffer, vertexCount, instanceCount, firstVertex, firstInstance);
+        }
     }
 
     return bytes_read;
@@ -2282,9 +3100,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndexed(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &vertexOffset);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstInstance);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawIndexed(commandBuffer, indexCount, instanceCount, firstIndex, vertexOffset, firstInstance);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndexed)(commandBuffer, indexCount, instanceCount, firstIndex, vertexOffset, firstInstance);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndexed(commandBuffer, indexCount, instanceCount, firstIndex, vertexOffset, firstInstance);
+        }
     }
 
     return bytes_read;
@@ -2306,9 +3132,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndirect(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &drawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndirect)(commandBuffer, buffer, offset, drawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawIndirect(commandBuffer, buffer, offset, drawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndirect(commandBuffer, buffer, offset, drawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -2330,9 +3164,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndexedIndirect(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &drawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawIndexedIndirect(commandBuffer, buffer, offset, drawCount, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndexedIndirect)(commandBuffer, buffer, offset, drawCount, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndexedIndirect(commandBuffer, buffer, offset, drawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -2352,9 +3194,17 @@ size_t VulkanDecoder::Decode_vkCmdDispatch(const uint8_t* parameter_buffer, size
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountY);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountZ);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDispatch)(commandBuffer, groupCountX, groupCountY, groupCountZ);
+    }
+    else
     {
-        consumer->Process_vkCmdDispatch(commandBuffer, groupCountX, groupCountY, groupCountZ);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDispatch(commandBuffer, groupCountX, groupCountY, groupCountZ);
+        }
     }
 
     return bytes_read;
@@ -2372,9 +3222,17 @@ size_t VulkanDecoder::Decode_vkCmdDispatchIndirect(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &buffer);
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &offset);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDispatchIndirect(commandBuffer, buffer, offset);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDispatchIndirect)(commandBuffer, buffer, offset);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDispatchIndirect(commandBuffer, buffer, offset);
+        }
     }
 
     return bytes_read;
@@ -2396,9 +3254,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyBuffer(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &regionCount);
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyBuffer)(commandBuffer, srcBuffer, dstBuffer, regionCount, &pRegions);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyBuffer(commandBuffer, srcBuffer, dstBuffer, regionCount, &pRegions);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyBuffer(commandBuffer, srcBuffer, dstBuffer, regionCount, &pRegions);
+        }
     }
 
     return bytes_read;
@@ -2424,9 +3290,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyImage(const uint8_t* parameter_buffer, siz
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &regionCount);
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyImage)(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+        }
     }
 
     return bytes_read;
@@ -2454,9 +3328,17 @@ size_t VulkanDecoder::Decode_vkCmdBlitImage(const uint8_t* parameter_buffer, siz
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &filter);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBlitImage)(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions, filter);
+    }
+    else
     {
-        consumer->Process_vkCmdBlitImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions, filter);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBlitImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions, filter);
+        }
     }
 
     return bytes_read;
@@ -2480,9 +3362,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyBufferToImage(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &regionCount);
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyBufferToImage(commandBuffer, srcBuffer, dstImage, dstImageLayout, regionCount, &pRegions);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyBufferToImage)(commandBuffer, srcBuffer, dstImage, dstImageLayout, regionCount, &pRegions);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyBufferToImage(commandBuffer, srcBuffer, dstImage, dstImageLayout, regionCount, &pRegions);
+        }
     }
 
     return bytes_read;
@@ -2506,9 +3396,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyImageToBuffer(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &regionCount);
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyImageToBuffer)(commandBuffer, srcImage, srcImageLayout, dstBuffer, regionCount, &pRegions);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyImageToBuffer(commandBuffer, srcImage, srcImageLayout, dstBuffer, regionCount, &pRegions);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyImageToBuffer(commandBuffer, srcImage, srcImageLayout, dstBuffer, regionCount, &pRegions);
+        }
     }
 
     return bytes_read;
@@ -2530,9 +3428,17 @@ size_t VulkanDecoder::Decode_vkCmdUpdateBuffer(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &dataSize);
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdUpdateBuffer(commandBuffer, dstBuffer, dstOffset, dataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdUpdateBuffer)(commandBuffer, dstBuffer, dstOffset, dataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdUpdateBuffer(commandBuffer, dstBuffer, dstOffset, dataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -2554,9 +3460,17 @@ size_t VulkanDecoder::Decode_vkCmdFillBuffer(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &size);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &data);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdFillBuffer)(commandBuffer, dstBuffer, dstOffset, size, data);
+    }
+    else
     {
-        consumer->Process_vkCmdFillBuffer(commandBuffer, dstBuffer, dstOffset, size, data);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdFillBuffer(commandBuffer, dstBuffer, dstOffset, size, data);
+        }
     }
 
     return bytes_read;
@@ -2580,9 +3494,17 @@ size_t VulkanDecoder::Decode_vkCmdClearColorImage(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &rangeCount);
     bytes_read += pRanges.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdClearColorImage(commandBuffer, image, imageLayout, &pColor, rangeCount, &pRanges);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdClearColorImage)(commandBuffer, image, imageLayout, &pColor, rangeCount, &pRanges);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdClearColorImage(commandBuffer, image, imageLayout, &pColor, rangeCount, &pRanges);
+        }
     }
 
     return bytes_read;
@@ -2606,9 +3528,17 @@ size_t VulkanDecoder::Decode_vkCmdClearDepthStencilImage(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &rangeCount);
     bytes_read += pRanges.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdClearDepthStencilImage)(commandBuffer, image, imageLayout, &pDepthStencil, rangeCount, &pRanges);
+    }
+    else
     {
-        consumer->Process_vkCmdClearDepthStencilImage(commandBuffer, image, imageLayout, &pDepthStencil, rangeCount, &pRanges);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdClearDepthStencilImage(commandBuffer, image, imageLayout, &pDepthStencil, rangeCount, &pRanges);
+        }
     }
 
     return bytes_read;
@@ -2630,9 +3560,17 @@ size_t VulkanDecoder::Decode_vkCmdClearAttachments(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &rectCount);
     bytes_read += pRects.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdClearAttachments(commandBuffer, attachmentCount, &pAttachments, rectCount, &pRects);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdClearAttachments)(commandBuffer, attachmentCount, &pAttachments, rectCount, &pRects);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdClearAttachments(commandBuffer, attachmentCount, &pAttachments, rectCount, &pRects);
+        }
     }
 
     return bytes_read;
@@ -2658,9 +3596,17 @@ size_t VulkanDecoder::Decode_vkCmdResolveImage(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &regionCount);
     bytes_read += pRegions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdResolveImage)(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+    }
+    else
     {
-        consumer->Process_vkCmdResolveImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdResolveImage(commandBuffer, srcImage, srcImageLayout, dstImage, dstImageLayout, regionCount, &pRegions);
+        }
     }
 
     return bytes_read;
@@ -2678,9 +3624,17 @@ size_t VulkanDecoder::Decode_vkCmdSetEvent(const uint8_t* parameter_buffer, size
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stageMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetEvent(commandBuffer, event, stageMask);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetEvent)(commandBuffer, event, stageMask);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetEvent(commandBuffer, event, stageMask);
+        }
     }
 
     return bytes_read;
@@ -2698,9 +3652,17 @@ size_t VulkanDecoder::Decode_vkCmdResetEvent(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stageMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdResetEvent)(commandBuffer, event, stageMask);
+    }
+    else
     {
-        consumer->Process_vkCmdResetEvent(commandBuffer, event, stageMask);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdResetEvent(commandBuffer, event, stageMask);
+        }
     }
 
     return bytes_read;
@@ -2734,9 +3696,17 @@ size_t VulkanDecoder::Decode_vkCmdWaitEvents(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageMemoryBarrierCount);
     bytes_read += pImageMemoryBarriers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdWaitEvents(commandBuffer, eventCount, &pEvents, srcStageMask, dstStageMask, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWaitEvents)(commandBuffer, eventCount, &pEvents, srcStageMask, dstStageMask, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWaitEvents(commandBuffer, eventCount, &pEvents, srcStageMask, dstStageMask, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+        }
     }
 
     return bytes_read;
@@ -2768,9 +3738,17 @@ size_t VulkanDecoder::Decode_vkCmdPipelineBarrier(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageMemoryBarrierCount);
     bytes_read += pImageMemoryBarriers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdPipelineBarrier)(commandBuffer, srcStageMask, dstStageMask, dependencyFlags, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+    }
+    else
     {
-        consumer->Process_vkCmdPipelineBarrier(commandBuffer, srcStageMask, dstStageMask, dependencyFlags, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdPipelineBarrier(commandBuffer, srcStageMask, dstStageMask, dependencyFlags, memoryBarrierCount, &pMemoryBarriers, bufferMemoryBarrierCount, &pBufferMemoryBarriers, imageMemoryBarrierCount, &pImageMemoryBarriers);
+        }
     }
 
     return bytes_read;
@@ -2790,9 +3768,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginQuery(const uint8_t* parameter_buffer, si
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &query);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBeginQuery(commandBuffer, queryPool, query, flags);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginQuery)(commandBuffer, queryPool, query, flags);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginQuery(commandBuffer, queryPool, query, flags);
+        }
     }
 
     return bytes_read;
@@ -2810,9 +3796,17 @@ size_t VulkanDecoder::Decode_vkCmdEndQuery(const uint8_t* parameter_buffer, size
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &query);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndQuery)(commandBuffer, queryPool, query);
+    }
+    else
     {
-        consumer->Process_vkCmdEndQuery(commandBuffer, queryPool, query);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndQuery(commandBuffer, queryPool, query);
+        }
     }
 
     return bytes_read;
@@ -2832,9 +3826,17 @@ size_t VulkanDecoder::Decode_vkCmdResetQueryPool(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstQuery);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryCount);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdResetQueryPool(commandBuffer, queryPool, firstQuery, queryCount);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdResetQueryPool)(commandBuffer, queryPool, firstQuery, queryCount);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdResetQueryPool(commandBuffer, queryPool, firstQuery, queryCount);
+        }
     }
 
     return bytes_read;
@@ -2854,9 +3856,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteTimestamp(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &query);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteTimestamp)(commandBuffer, pipelineStage, queryPool, query);
+    }
+    else
     {
-        consumer->Process_vkCmdWriteTimestamp(commandBuffer, pipelineStage, queryPool, query);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteTimestamp(commandBuffer, pipelineStage, queryPool, query);
+        }
     }
 
     return bytes_read;
@@ -2884,9 +3894,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyQueryPoolResults(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyQueryPoolResults(commandBuffer, queryPool, firstQuery, queryCount, dstBuffer, dstOffset, stride, flags);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyQueryPoolResults)(commandBuffer, queryPool, firstQuery, queryCount, dstBuffer, dstOffset, stride, flags);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyQueryPoolResults(commandBuffer, queryPool, firstQuery, queryCount, dstBuffer, dstOffset, stride, flags);
+        }
     }
 
     return bytes_read;
@@ -2910,9 +3928,17 @@ size_t VulkanDecoder::Decode_vkCmdPushConstants(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &size);
     bytes_read += pValues.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdPushConstants)(commandBuffer, layout, stageFlags, offset, size, &pValues);
+    }
+    else
     {
-        consumer->Process_vkCmdPushConstants(commandBuffer, layout, stageFlags, offset, size, &pValues);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdPushConstants(commandBuffer, layout, stageFlags, offset, size, &pValues);
+        }
     }
 
     return bytes_read;
@@ -2930,9 +3956,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginRenderPass(const uint8_t* parameter_buffe
     bytes_read += pRenderPassBegin.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &contents);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBeginRenderPass(commandBuffer, &pRenderPassBegin, contents);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginRenderPass)(commandBuffer, &pRenderPassBegin, contents);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginRenderPass(commandBuffer, &pRenderPassBegin, contents);
+        }
     }
 
     return bytes_read;
@@ -2948,9 +3982,17 @@ size_t VulkanDecoder::Decode_vkCmdNextSubpass(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &contents);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdNextSubpass)(commandBuffer, contents);
+    }
+    else
     {
-        consumer->Process_vkCmdNextSubpass(commandBuffer, contents);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdNextSubpass(commandBuffer, contents);
+        }
     }
 
     return bytes_read;
@@ -2964,9 +4006,17 @@ size_t VulkanDecoder::Decode_vkCmdEndRenderPass(const uint8_t* parameter_buffer,
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdEndRenderPass(commandBuffer);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndRenderPass)(commandBuffer);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndRenderPass(commandBuffer);
+        }
     }
 
     return bytes_read;
@@ -2984,9 +4034,17 @@ size_t VulkanDecoder::Decode_vkCmdExecuteCommands(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBufferCount);
     bytes_read += pCommandBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdExecuteCommands)(commandBuffer, commandBufferCount, &pCommandBuffers);
+    }
+    else
     {
-        consumer->Process_vkCmdExecuteCommands(commandBuffer, commandBufferCount, &pCommandBuffers);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdExecuteCommands(commandBuffer, commandBufferCount, &pCommandBuffers);
+        }
     }
 
     return bytes_read;
@@ -3006,9 +4064,17 @@ size_t VulkanDecoder::Decode_vkBindBufferMemory2(const uint8_t* parameter_buffer
     bytes_read += pBindInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindBufferMemory2)(return_value, device, bindInfoCount, &pBindInfos);
+    }
+    else
     {
-        consumer->Process_vkBindBufferMemory2(return_value, device, bindInfoCount, &pBindInfos);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindBufferMemory2(return_value, device, bindInfoCount, &pBindInfos);
+        }
     }
 
     return bytes_read;
@@ -3028,9 +4094,17 @@ size_t VulkanDecoder::Decode_vkBindImageMemory2(const uint8_t* parameter_buffer,
     bytes_read += pBindInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkBindImageMemory2(return_value, device, bindInfoCount, &pBindInfos);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindImageMemory2)(return_value, device, bindInfoCount, &pBindInfos);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindImageMemory2(return_value, device, bindInfoCount, &pBindInfos);
+        }
     }
 
     return bytes_read;
@@ -3052,9 +4126,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceGroupPeerMemoryFeatures(const uint8_t* p
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &remoteDeviceIndex);
     bytes_read += pPeerMemoryFeatures.DecodeFlags((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceGroupPeerMemoryFeatures)(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceGroupPeerMemoryFeatures(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceGroupPeerMemoryFeatures(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+        }
     }
 
     return bytes_read;
@@ -3070,9 +4152,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDeviceMask(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &deviceMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDeviceMask(commandBuffer, deviceMask);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDeviceMask)(commandBuffer, deviceMask);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDeviceMask(commandBuffer, deviceMask);
+        }
     }
 
     return bytes_read;
@@ -3098,9 +4188,17 @@ size_t VulkanDecoder::Decode_vkCmdDispatchBase(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountY);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountZ);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDispatchBase)(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+    }
+    else
     {
-        consumer->Process_vkCmdDispatchBase(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDispatchBase(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+        }
     }
 
     return bytes_read;
@@ -3120,9 +4218,17 @@ size_t VulkanDecoder::Decode_vkEnumeratePhysicalDeviceGroups(const uint8_t* para
     bytes_read += pPhysicalDeviceGroupProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkEnumeratePhysicalDeviceGroups(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkEnumeratePhysicalDeviceGroups)(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkEnumeratePhysicalDeviceGroups(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+        }
     }
 
     return bytes_read;
@@ -3140,9 +4246,17 @@ size_t VulkanDecoder::Decode_vkGetImageMemoryRequirements2(const uint8_t* parame
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageMemoryRequirements2(device, &pInfo, &pMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageMemoryRequirements2)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageMemoryRequirements2(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -3160,9 +4274,17 @@ size_t VulkanDecoder::Decode_vkGetBufferMemoryRequirements2(const uint8_t* param
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferMemoryRequirements2)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
     {
-        consumer->Process_vkGetBufferMemoryRequirements2(device, &pInfo, &pMemoryRequirements);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferMemoryRequirements2(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -3182,9 +4304,17 @@ size_t VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements2(const uint8_t*
     bytes_read += pSparseMemoryRequirementCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSparseMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageSparseMemoryRequirements2(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageSparseMemoryRequirements2)(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageSparseMemoryRequirements2(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -3200,9 +4330,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures2(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pFeatures.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceFeatures2(physicalDevice, &pFeatures);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFeatures2)(physicalDevice, &pFeatures);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFeatures2(physicalDevice, &pFeatures);
+        }
     }
 
     return bytes_read;
@@ -3218,9 +4356,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceProperties2(const uint8_t* param
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceProperties2)(physicalDevice, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceProperties2(physicalDevice, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceProperties2(physicalDevice, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -3238,9 +4384,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties2(const uint8_t*
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &format);
     bytes_read += pFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceFormatProperties2(physicalDevice, format, &pFormatProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFormatProperties2)(physicalDevice, format, &pFormatProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFormatProperties2(physicalDevice, format, &pFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -3260,9 +4414,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties2(const uin
     bytes_read += pImageFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceImageFormatProperties2)(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceImageFormatProperties2(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceImageFormatProperties2(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -3280,9 +4442,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties2(const uin
     bytes_read += pQueueFamilyPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pQueueFamilyProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties2(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceQueueFamilyProperties2)(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties2(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        }
     }
 
     return bytes_read;
@@ -3298,9 +4468,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties2(const uint8_t*
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pMemoryProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceMemoryProperties2)(physicalDevice, &pMemoryProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceMemoryProperties2(physicalDevice, &pMemoryProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceMemoryProperties2(physicalDevice, &pMemoryProperties);
+        }
     }
 
     return bytes_read;
@@ -3320,9 +4498,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties2(con
     bytes_read += pPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSparseImageFormatProperties2)(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties2(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties2(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -3340,9 +4526,17 @@ size_t VulkanDecoder::Decode_vkTrimCommandPool(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandPool);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkTrimCommandPool(device, commandPool, flags);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkTrimCommandPool)(device, commandPool, flags);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkTrimCommandPool(device, commandPool, flags);
+        }
     }
 
     return bytes_read;
@@ -3360,9 +4554,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceQueue2(const uint8_t* parameter_buffer,
     bytes_read += pQueueInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pQueue.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceQueue2)(device, &pQueueInfo, &pQueue);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceQueue2(device, &pQueueInfo, &pQueue);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceQueue2(device, &pQueueInfo, &pQueue);
+        }
     }
 
     return bytes_read;
@@ -3384,9 +4586,17 @@ size_t VulkanDecoder::Decode_vkCreateSamplerYcbcrConversion(const uint8_t* param
     bytes_read += pYcbcrConversion.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateSamplerYcbcrConversion(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSamplerYcbcrConversion)(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSamplerYcbcrConversion(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+        }
     }
 
     return bytes_read;
@@ -3404,9 +4614,17 @@ size_t VulkanDecoder::Decode_vkDestroySamplerYcbcrConversion(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &ycbcrConversion);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySamplerYcbcrConversion(device, ycbcrConversion, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySamplerYcbcrConversion)(device, ycbcrConversion, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySamplerYcbcrConversion(device, ycbcrConversion, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -3428,9 +4646,17 @@ size_t VulkanDecoder::Decode_vkCreateDescriptorUpdateTemplate(const uint8_t* par
     bytes_read += pDescriptorUpdateTemplate.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDescriptorUpdateTemplate)(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+    }
+    else
     {
-        consumer->Process_vkCreateDescriptorUpdateTemplate(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDescriptorUpdateTemplate(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+        }
     }
 
     return bytes_read;
@@ -3448,9 +4674,17 @@ size_t VulkanDecoder::Decode_vkDestroyDescriptorUpdateTemplate(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorUpdateTemplate);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDescriptorUpdateTemplate(device, descriptorUpdateTemplate, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDescriptorUpdateTemplate)(device, descriptorUpdateTemplate, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDescriptorUpdateTemplate(device, descriptorUpdateTemplate, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -3468,9 +4702,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalBufferProperties(const u
     bytes_read += pExternalBufferInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalBufferProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceExternalBufferProperties(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalBufferProperties)(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalBufferProperties(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+        }
     }
 
     return bytes_read;
@@ -3488,9 +4730,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalFenceProperties(const ui
     bytes_read += pExternalFenceInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalFenceProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalFenceProperties)(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceExternalFenceProperties(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalFenceProperties(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+        }
     }
 
     return bytes_read;
@@ -3508,9 +4758,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalSemaphoreProperties(cons
     bytes_read += pExternalSemaphoreInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalSemaphoreProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceExternalSemaphoreProperties(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalSemaphoreProperties)(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalSemaphoreProperties(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+        }
     }
 
     return bytes_read;
@@ -3528,9 +4786,17 @@ size_t VulkanDecoder::Decode_vkGetDescriptorSetLayoutSupport(const uint8_t* para
     bytes_read += pCreateInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSupport.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDescriptorSetLayoutSupport)(device, &pCreateInfo, &pSupport);
+    }
+    else
     {
-        consumer->Process_vkGetDescriptorSetLayoutSupport(device, &pCreateInfo, &pSupport);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDescriptorSetLayoutSupport(device, &pCreateInfo, &pSupport);
+        }
     }
 
     return bytes_read;
@@ -3556,9 +4822,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndirectCount(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndirectCount)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -3584,9 +4858,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCount(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndexedIndirectCount)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawIndexedIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndexedIndirectCount(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -3608,9 +4890,17 @@ size_t VulkanDecoder::Decode_vkCreateRenderPass2(const uint8_t* parameter_buffer
     bytes_read += pRenderPass.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateRenderPass2)(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+    }
+    else
     {
-        consumer->Process_vkCreateRenderPass2(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateRenderPass2(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        }
     }
 
     return bytes_read;
@@ -3628,9 +4918,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginRenderPass2(const uint8_t* parameter_buff
     bytes_read += pRenderPassBegin.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSubpassBeginInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBeginRenderPass2(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginRenderPass2)(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginRenderPass2(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+        }
     }
 
     return bytes_read;
@@ -3648,9 +4946,17 @@ size_t VulkanDecoder::Decode_vkCmdNextSubpass2(const uint8_t* parameter_buffer,
     bytes_read += pSubpassBeginInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSubpassEndInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdNextSubpass2)(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdNextSubpass2(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdNextSubpass2(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+        }
     }
 
     return bytes_read;
@@ -3666,9 +4972,17 @@ size_t VulkanDecoder::Decode_vkCmdEndRenderPass2(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pSubpassEndInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdEndRenderPass2(commandBuffer, &pSubpassEndInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndRenderPass2)(commandBuffer, &pSubpassEndInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndRenderPass2(commandBuffer, &pSubpassEndInfo);
+        }
     }
 
     return bytes_read;
@@ -3688,9 +5002,17 @@ size_t VulkanDecoder::Decode_vkResetQueryPool(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstQuery);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryCount);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkResetQueryPool(device, queryPool, firstQuery, queryCount);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetQueryPool)(device, queryPool, firstQuery, queryCount);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetQueryPool(device, queryPool, firstQuery, queryCount);
+        }
     }
 
     return bytes_read;
@@ -3710,9 +5032,17 @@ size_t VulkanDecoder::Decode_vkGetSemaphoreCounterValue(const uint8_t* parameter
     bytes_read += pValue.DecodeUInt64((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSemaphoreCounterValue)(return_value, device, semaphore, &pValue);
+    }
+    else
     {
-        consumer->Process_vkGetSemaphoreCounterValue(return_value, device, semaphore, &pValue);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSemaphoreCounterValue(return_value, device, semaphore, &pValue);
+        }
     }
 
     return bytes_read;
@@ -3732,9 +5062,17 @@ size_t VulkanDecoder::Decode_vkWaitSemaphores(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &timeout);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkWaitSemaphores(return_value, device, &pWaitInfo, timeout);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkWaitSemaphores)(return_value, device, &pWaitInfo, timeout);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkWaitSemaphores(return_value, device, &pWaitInfo, timeout);
+        }
     }
 
     return bytes_read;
@@ -3752,9 +5090,17 @@ size_t VulkanDecoder::Decode_vkSignalSemaphore(const uint8_t* parameter_buffer,
     bytes_read += pSignalInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSignalSemaphore)(return_value, device, &pSignalInfo);
+    }
+    else
     {
-        consumer->Process_vkSignalSemaphore(return_value, device, &pSignalInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSignalSemaphore(return_value, device, &pSignalInfo);
+        }
     }
 
     return bytes_read;
@@ -3772,9 +5118,17 @@ size_t VulkanDecoder::Decode_vkGetBufferDeviceAddress(const uint8_t* parameter_b
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeVkDeviceAddressValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferDeviceAddress)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetBufferDeviceAddress(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferDeviceAddress(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -3792,9 +5146,17 @@ size_t VulkanDecoder::Decode_vkGetBufferOpaqueCaptureAddress(const uint8_t* para
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetBufferOpaqueCaptureAddress(return_value, device, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferOpaqueCaptureAddress)(return_value, device, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferOpaqueCaptureAddress(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -3812,9 +5174,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceMemoryOpaqueCaptureAddress(const uint8_t
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceMemoryOpaqueCaptureAddress)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceMemoryOpaqueCaptureAddress(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceMemoryOpaqueCaptureAddress(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -3832,9 +5202,17 @@ size_t VulkanDecoder::Decode_vkDestroySurfaceKHR(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &surface);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySurfaceKHR(instance, surface, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySurfaceKHR)(instance, surface, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySurfaceKHR(instance, surface, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -3856,9 +5234,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceSupportKHR(const uint8_t*
     bytes_read += pSupported.DecodeVkBool32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceSupportKHR)(return_value, physicalDevice, queueFamilyIndex, surface, &pSupported);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceSupportKHR(return_value, physicalDevice, queueFamilyIndex, surface, &pSupported);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceSupportKHR(return_value, physicalDevice, queueFamilyIndex, surface, &pSupported);
+        }
     }
 
     return bytes_read;
@@ -3878,9 +5264,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(const uin
     bytes_read += pSurfaceCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR)(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+        }
     }
 
     return bytes_read;
@@ -3902,9 +5296,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceFormatsKHR(const uint8_t*
     bytes_read += pSurfaceFormats.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceFormatsKHR(return_value, physicalDevice, surface, &pSurfaceFormatCount, &pSurfaceFormats);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceFormatsKHR)(return_value, physicalDevice, surface, &pSurfaceFormatCount, &pSurfaceFormats);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceFormatsKHR(return_value, physicalDevice, surface, &pSurfaceFormatCount, &pSurfaceFormats);
+        }
     }
 
     return bytes_read;
@@ -3926,9 +5328,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfacePresentModesKHR(const uin
     bytes_read += pPresentModes.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfacePresentModesKHR)(return_value, physicalDevice, surface, &pPresentModeCount, &pPresentModes);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfacePresentModesKHR(return_value, physicalDevice, surface, &pPresentModeCount, &pPresentModes);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfacePresentModesKHR(return_value, physicalDevice, surface, &pPresentModeCount, &pPresentModes);
+        }
     }
 
     return bytes_read;
@@ -3950,9 +5360,17 @@ size_t VulkanDecoder::Decode_vkCreateSwapchainKHR(const uint8_t* parameter_buffe
     bytes_read += pSwapchain.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateSwapchainKHR(return_value, device, &pCreateInfo, &pAllocator, &pSwapchain);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSwapchainKHR)(return_value, device, &pCreateInfo, &pAllocator, &pSwapchain);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSwapchainKHR(return_value, device, &pCreateInfo, &pAllocator, &pSwapchain);
+        }
     }
 
     return bytes_read;
@@ -3970,9 +5388,17 @@ size_t VulkanDecoder::Decode_vkDestroySwapchainKHR(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &swapchain);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySwapchainKHR(device, swapchain, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySwapchainKHR)(device, swapchain, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySwapchainKHR(device, swapchain, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -3994,9 +5420,17 @@ size_t VulkanDecoder::Decode_vkGetSwapchainImagesKHR(const uint8_t* parameter_bu
     bytes_read += pSwapchainImages.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSwapchainImagesKHR)(return_value, device, swapchain, &pSwapchainImageCount, &pSwapchainImages);
+    }
+    else
     {
-        consumer->Process_vkGetSwapchainImagesKHR(return_value, device, swapchain, &pSwapchainImageCount, &pSwapchainImages);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSwapchainImagesKHR(return_value, device, swapchain, &pSwapchainImageCount, &pSwapchainImages);
+        }
     }
 
     return bytes_read;
@@ -4022,9 +5456,17 @@ size_t VulkanDecoder::Decode_vkAcquireNextImageKHR(const uint8_t* parameter_buff
     bytes_read += pImageIndex.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquireNextImageKHR(return_value, device, swapchain, timeout, semaphore, fence, &pImageIndex);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireNextImageKHR)(return_value, device, swapchain, timeout, semaphore, fence, &pImageIndex);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireNextImageKHR(return_value, device, swapchain, timeout, semaphore, fence, &pImageIndex);
+        }
     }
 
     return bytes_read;
@@ -4042,9 +5484,17 @@ size_t VulkanDecoder::Decode_vkQueuePresentKHR(const uint8_t* parameter_buffer,
     bytes_read += pPresentInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkQueuePresentKHR(return_value, queue, &pPresentInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueuePresentKHR)(return_value, queue, &pPresentInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueuePresentKHR(return_value, queue, &pPresentInfo);
+        }
     }
 
     return bytes_read;
@@ -4062,9 +5512,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceGroupPresentCapabilitiesKHR(const uint8_
     bytes_read += pDeviceGroupPresentCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceGroupPresentCapabilitiesKHR)(return_value, device, &pDeviceGroupPresentCapabilities);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceGroupPresentCapabilitiesKHR(return_value, device, &pDeviceGroupPresentCapabilities);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceGroupPresentCapabilitiesKHR(return_value, device, &pDeviceGroupPresentCapabilities);
+        }
     }
 
     return bytes_read;
@@ -4084,9 +5542,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceGroupSurfacePresentModesKHR(const uint8_
     bytes_read += pModes.DecodeFlags((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeviceGroupSurfacePresentModesKHR(return_value, device, surface, &pModes);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceGroupSurfacePresentModesKHR)(return_value, device, surface, &pModes);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceGroupSurfacePresentModesKHR(return_value, device, surface, &pModes);
+        }
     }
 
     return bytes_read;
@@ -4108,9 +5574,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDevicePresentRectanglesKHR(const uint8
     bytes_read += pRects.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDevicePresentRectanglesKHR)(return_value, physicalDevice, surface, &pRectCount, &pRects);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDevicePresentRectanglesKHR(return_value, physicalDevice, surface, &pRectCount, &pRects);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDevicePresentRectanglesKHR(return_value, physicalDevice, surface, &pRectCount, &pRects);
+        }
     }
 
     return bytes_read;
@@ -4130,9 +5604,17 @@ size_t VulkanDecoder::Decode_vkAcquireNextImage2KHR(const uint8_t* parameter_buf
     bytes_read += pImageIndex.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquireNextImage2KHR(return_value, device, &pAcquireInfo, &pImageIndex);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireNextImage2KHR)(return_value, device, &pAcquireInfo, &pImageIndex);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireNextImage2KHR(return_value, device, &pAcquireInfo, &pImageIndex);
+        }
     }
 
     return bytes_read;
@@ -4152,9 +5634,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPropertiesKHR(const uint8
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceDisplayPropertiesKHR)(return_value, physicalDevice, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceDisplayPropertiesKHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceDisplayPropertiesKHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -4174,9 +5664,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(const
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR)(return_value, physicalDevice, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -4198,9 +5696,17 @@ size_t VulkanDecoder::Decode_vkGetDisplayPlaneSupportedDisplaysKHR(const uint8_t
     bytes_read += pDisplays.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDisplayPlaneSupportedDisplaysKHR(return_value, physicalDevice, planeIndex, &pDisplayCount, &pDisplays);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDisplayPlaneSupportedDisplaysKHR)(return_value, physicalDevice, planeIndex, &pDisplayCount, &pDisplays);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDisplayPlaneSupportedDisplaysKHR(return_value, physicalDevice, planeIndex, &pDisplayCount, &pDisplays);
+        }
     }
 
     return bytes_read;
@@ -4222,9 +5728,17 @@ size_t VulkanDecoder::Decode_vkGetDisplayModePropertiesKHR(const uint8_t* parame
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDisplayModePropertiesKHR)(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetDisplayModePropertiesKHR(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDisplayModePropertiesKHR(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -4248,9 +5762,17 @@ size_t VulkanDecoder::Decode_vkCreateDisplayModeKHR(const uint8_t* parameter_buf
     bytes_read += pMode.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateDisplayModeKHR(return_value, physicalDevice, display, &pCreateInfo, &pAllocator, &pMode);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDisplayModeKHR)(return_value, physicalDevice, display, &pCreateInfo, &pAllocator, &pMode);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDisplayModeKHR(return_value, physicalDevice, display, &pCreateInfo, &pAllocator, &pMode);
+        }
     }
 
     return bytes_read;
@@ -4272,9 +5794,17 @@ size_t VulkanDecoder::Decode_vkGetDisplayPlaneCapabilitiesKHR(const uint8_t* par
     bytes_read += pCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDisplayPlaneCapabilitiesKHR(return_value, physicalDevice, mode, planeIndex, &pCapabilities);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDisplayPlaneCapabilitiesKHR)(return_value, physicalDevice, mode, planeIndex, &pCapabilities);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDisplayPlaneCapabilitiesKHR(return_value, physicalDevice, mode, planeIndex, &pCapabilities);
+        }
     }
 
     return bytes_read;
@@ -4296,9 +5826,17 @@ size_t VulkanDecoder::Decode_vkCreateDisplayPlaneSurfaceKHR(const uint8_t* param
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDisplayPlaneSurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateDisplayPlaneSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDisplayPlaneSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4322,9 +5860,17 @@ size_t VulkanDecoder::Decode_vkCreateSharedSwapchainsKHR(const uint8_t* paramete
     bytes_read += pSwapchains.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateSharedSwapchainsKHR(return_value, device, swapchainCount, &pCreateInfos, &pAllocator, &pSwapchains);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSharedSwapchainsKHR)(return_value, device, swapchainCount, &pCreateInfos, &pAllocator, &pSwapchains);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSharedSwapchainsKHR(return_value, device, swapchainCount, &pCreateInfos, &pAllocator, &pSwapchains);
+        }
     }
 
     return bytes_read;
@@ -4346,9 +5892,17 @@ size_t VulkanDecoder::Decode_vkCreateXlibSurfaceKHR(const uint8_t* parameter_buf
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateXlibSurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateXlibSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateXlibSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4370,9 +5924,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceXlibPresentationSupportKHR(const
     bytes_read += ValueDecoder::DecodeSizeTValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &visualID);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceXlibPresentationSupportKHR)(return_value, physicalDevice, queueFamilyIndex, dpy, visualID);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceXlibPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, dpy, visualID);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceXlibPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, dpy, visualID);
+        }
     }
 
     return bytes_read;
@@ -4394,9 +5956,17 @@ size_t VulkanDecoder::Decode_vkCreateXcbSurfaceKHR(const uint8_t* parameter_buff
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateXcbSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateXcbSurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateXcbSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4418,9 +5988,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceXcbPresentationSupportKHR(const
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &visual_id);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceXcbPresentationSupportKHR)(return_value, physicalDevice, queueFamilyIndex, connection, visual_id);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceXcbPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, connection, visual_id);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceXcbPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, connection, visual_id);
+        }
     }
 
     return bytes_read;
@@ -4442,9 +6020,17 @@ size_t VulkanDecoder::Decode_vkCreateWaylandSurfaceKHR(const uint8_t* parameter_
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateWaylandSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateWaylandSurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateWaylandSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4464,9 +6050,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceWaylandPresentationSupportKHR(co
     bytes_read += ValueDecoder::DecodeAddress((parameter_buffer + bytes_read), (buffer_size - bytes_read), &display);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR)(return_value, physicalDevice, queueFamilyIndex, display);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, display);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex, display);
+        }
     }
 
     return bytes_read;
@@ -4488,9 +6082,17 @@ size_t VulkanDecoder::Decode_vkCreateAndroidSurfaceKHR(const uint8_t* parameter_
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateAndroidSurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateAndroidSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateAndroidSurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4512,9 +6114,17 @@ size_t VulkanDecoder::Decode_vkCreateWin32SurfaceKHR(const uint8_t* parameter_bu
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateWin32SurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateWin32SurfaceKHR)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateWin32SurfaceKHR(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -4532,9 +6142,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceWin32PresentationSupportKHR(cons
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queueFamilyIndex);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceWin32PresentationSupportKHR)(return_value, physicalDevice, queueFamilyIndex);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceWin32PresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceWin32PresentationSupportKHR(return_value, physicalDevice, queueFamilyIndex);
+        }
     }
 
     return bytes_read;
@@ -4550,9 +6168,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures2KHR(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pFeatures.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceFeatures2KHR(physicalDevice, &pFeatures);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFeatures2KHR)(physicalDevice, &pFeatures);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFeatures2KHR(physicalDevice, &pFeatures);
+        }
     }
 
     return bytes_read;
@@ -4568,9 +6194,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceProperties2KHR(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceProperties2KHR(physicalDevice, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceProperties2KHR)(physicalDevice, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceProperties2KHR(physicalDevice, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -4588,9 +6222,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties2KHR(const uint8
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &format);
     bytes_read += pFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFormatProperties2KHR)(physicalDevice, format, &pFormatProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceFormatProperties2KHR(physicalDevice, format, &pFormatProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFormatProperties2KHR(physicalDevice, format, &pFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -4610,9 +6252,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties2KHR(const
     bytes_read += pImageFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceImageFormatProperties2KHR(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceImageFormatProperties2KHR)(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceImageFormatProperties2KHR(return_value, physicalDevice, &pImageFormatInfo, &pImageFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -4630,9 +6280,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties2KHR(const
     bytes_read += pQueueFamilyPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pQueueFamilyProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR)(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR(physicalDevice, &pQueueFamilyPropertyCount, &pQueueFamilyProperties);
+        }
     }
 
     return bytes_read;
@@ -4648,9 +6306,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties2KHR(const uint8
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &physicalDevice);
     bytes_read += pMemoryProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceMemoryProperties2KHR)(physicalDevice, &pMemoryProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceMemoryProperties2KHR(physicalDevice, &pMemoryProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceMemoryProperties2KHR(physicalDevice, &pMemoryProperties);
+        }
     }
 
     return bytes_read;
@@ -4670,9 +6336,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties2KHR(
     bytes_read += pPropertyCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR)(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR(physicalDevice, &pFormatInfo, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -4694,9 +6368,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceGroupPeerMemoryFeaturesKHR(const uint8_t
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &remoteDeviceIndex);
     bytes_read += pPeerMemoryFeatures.DecodeFlags((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceGroupPeerMemoryFeaturesKHR)(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceGroupPeerMemoryFeaturesKHR(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceGroupPeerMemoryFeaturesKHR(device, heapIndex, localDeviceIndex, remoteDeviceIndex, &pPeerMemoryFeatures);
+        }
     }
 
     return bytes_read;
@@ -4712,9 +6394,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDeviceMaskKHR(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &deviceMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDeviceMaskKHR(commandBuffer, deviceMask);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDeviceMaskKHR)(commandBuffer, deviceMask);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDeviceMaskKHR(commandBuffer, deviceMask);
+        }
     }
 
     return bytes_read;
@@ -4740,9 +6430,17 @@ size_t VulkanDecoder::Decode_vkCmdDispatchBaseKHR(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountY);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupCountZ);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDispatchBaseKHR)(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+    }
+    else
     {
-        consumer->Process_vkCmdDispatchBaseKHR(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDispatchBaseKHR(commandBuffer, baseGroupX, baseGroupY, baseGroupZ, groupCountX, groupCountY, groupCountZ);
+        }
     }
 
     return bytes_read;
@@ -4760,9 +6458,17 @@ size_t VulkanDecoder::Decode_vkTrimCommandPoolKHR(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandPool);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkTrimCommandPoolKHR)(device, commandPool, flags);
+    }
+    else
     {
-        consumer->Process_vkTrimCommandPoolKHR(device, commandPool, flags);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkTrimCommandPoolKHR(device, commandPool, flags);
+        }
     }
 
     return bytes_read;
@@ -4782,9 +6488,17 @@ size_t VulkanDecoder::Decode_vkEnumeratePhysicalDeviceGroupsKHR(const uint8_t* p
     bytes_read += pPhysicalDeviceGroupProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkEnumeratePhysicalDeviceGroupsKHR(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkEnumeratePhysicalDeviceGroupsKHR)(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkEnumeratePhysicalDeviceGroupsKHR(return_value, instance, &pPhysicalDeviceGroupCount, &pPhysicalDeviceGroupProperties);
+        }
     }
 
     return bytes_read;
@@ -4802,9 +6516,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalBufferPropertiesKHR(cons
     bytes_read += pExternalBufferInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalBufferProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR)(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR(physicalDevice, &pExternalBufferInfo, &pExternalBufferProperties);
+        }
     }
 
     return bytes_read;
@@ -4824,9 +6546,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryWin32HandleKHR(const uint8_t* parameter_
     bytes_read += pHandle.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetMemoryWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryWin32HandleKHR)(return_value, device, &pGetWin32HandleInfo, &pHandle);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        }
     }
 
     return bytes_read;
@@ -4848,9 +6578,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryWin32HandlePropertiesKHR(const uint8_t*
     bytes_read += pMemoryWin32HandleProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetMemoryWin32HandlePropertiesKHR(return_value, device, handleType, handle, &pMemoryWin32HandleProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryWin32HandlePropertiesKHR)(return_value, device, handleType, handle, &pMemoryWin32HandleProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryWin32HandlePropertiesKHR(return_value, device, handleType, handle, &pMemoryWin32HandleProperties);
+        }
     }
 
     return bytes_read;
@@ -4870,9 +6608,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryFdKHR(const uint8_t* parameter_buffer, s
     bytes_read += pFd.DecodeInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryFdKHR)(return_value, device, &pGetFdInfo, &pFd);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        }
     }
 
     return bytes_read;
@@ -4894,9 +6640,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryFdPropertiesKHR(const uint8_t* parameter
     bytes_read += pMemoryFdProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetMemoryFdPropertiesKHR(return_value, device, handleType, fd, &pMemoryFdProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryFdPropertiesKHR)(return_value, device, handleType, fd, &pMemoryFdProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryFdPropertiesKHR(return_value, device, handleType, fd, &pMemoryFdProperties);
+        }
     }
 
     return bytes_read;
@@ -4914,9 +6668,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR(c
     bytes_read += pExternalSemaphoreInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalSemaphoreProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR)(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR(physicalDevice, &pExternalSemaphoreInfo, &pExternalSemaphoreProperties);
+        }
     }
 
     return bytes_read;
@@ -4934,9 +6696,17 @@ size_t VulkanDecoder::Decode_vkImportSemaphoreWin32HandleKHR(const uint8_t* para
     bytes_read += pImportSemaphoreWin32HandleInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkImportSemaphoreWin32HandleKHR)(return_value, device, &pImportSemaphoreWin32HandleInfo);
+    }
+    else
     {
-        consumer->Process_vkImportSemaphoreWin32HandleKHR(return_value, device, &pImportSemaphoreWin32HandleInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkImportSemaphoreWin32HandleKHR(return_value, device, &pImportSemaphoreWin32HandleInfo);
+        }
     }
 
     return bytes_read;
@@ -4956,9 +6726,17 @@ size_t VulkanDecoder::Decode_vkGetSemaphoreWin32HandleKHR(const uint8_t* paramet
     bytes_read += pHandle.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetSemaphoreWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSemaphoreWin32HandleKHR)(return_value, device, &pGetWin32HandleInfo, &pHandle);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSemaphoreWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        }
     }
 
     return bytes_read;
@@ -4976,9 +6754,17 @@ size_t VulkanDecoder::Decode_vkImportSemaphoreFdKHR(const uint8_t* parameter_buf
     bytes_read += pImportSemaphoreFdInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkImportSemaphoreFdKHR)(return_value, device, &pImportSemaphoreFdInfo);
+    }
+    else
     {
-        consumer->Process_vkImportSemaphoreFdKHR(return_value, device, &pImportSemaphoreFdInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkImportSemaphoreFdKHR(return_value, device, &pImportSemaphoreFdInfo);
+        }
     }
 
     return bytes_read;
@@ -4998,9 +6784,17 @@ size_t VulkanDecoder::Decode_vkGetSemaphoreFdKHR(const uint8_t* parameter_buffer
     bytes_read += pFd.DecodeInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetSemaphoreFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSemaphoreFdKHR)(return_value, device, &pGetFdInfo, &pFd);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSemaphoreFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        }
     }
 
     return bytes_read;
@@ -5024,9 +6818,17 @@ size_t VulkanDecoder::Decode_vkCmdPushDescriptorSetKHR(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorWriteCount);
     bytes_read += pDescriptorWrites.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdPushDescriptorSetKHR)(commandBuffer, pipelineBindPoint, layout, set, descriptorWriteCount, &pDescriptorWrites);
+    }
+    else
     {
-        consumer->Process_vkCmdPushDescriptorSetKHR(commandBuffer, pipelineBindPoint, layout, set, descriptorWriteCount, &pDescriptorWrites);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdPushDescriptorSetKHR(commandBuffer, pipelineBindPoint, layout, set, descriptorWriteCount, &pDescriptorWrites);
+        }
     }
 
     return bytes_read;
@@ -5048,9 +6850,17 @@ size_t VulkanDecoder::Decode_vkCreateDescriptorUpdateTemplateKHR(const uint8_t*
     bytes_read += pDescriptorUpdateTemplate.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDescriptorUpdateTemplateKHR)(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+    }
+    else
     {
-        consumer->Process_vkCreateDescriptorUpdateTemplateKHR(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDescriptorUpdateTemplateKHR(return_value, device, &pCreateInfo, &pAllocator, &pDescriptorUpdateTemplate);
+        }
     }
 
     return bytes_read;
@@ -5068,9 +6878,17 @@ size_t VulkanDecoder::Decode_vkDestroyDescriptorUpdateTemplateKHR(const uint8_t*
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &descriptorUpdateTemplate);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDescriptorUpdateTemplateKHR(device, descriptorUpdateTemplate, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDescriptorUpdateTemplateKHR)(device, descriptorUpdateTemplate, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDescriptorUpdateTemplateKHR(device, descriptorUpdateTemplate, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -5092,9 +6910,17 @@ size_t VulkanDecoder::Decode_vkCreateRenderPass2KHR(const uint8_t* parameter_buf
     bytes_read += pRenderPass.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateRenderPass2KHR)(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+    }
+    else
     {
-        consumer->Process_vkCreateRenderPass2KHR(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateRenderPass2KHR(return_value, device, &pCreateInfo, &pAllocator, &pRenderPass);
+        }
     }
 
     return bytes_read;
@@ -5112,9 +6938,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginRenderPass2KHR(const uint8_t* parameter_b
     bytes_read += pRenderPassBegin.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSubpassBeginInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBeginRenderPass2KHR(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginRenderPass2KHR)(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginRenderPass2KHR(commandBuffer, &pRenderPassBegin, &pSubpassBeginInfo);
+        }
     }
 
     return bytes_read;
@@ -5132,9 +6966,17 @@ size_t VulkanDecoder::Decode_vkCmdNextSubpass2KHR(const uint8_t* parameter_buffe
     bytes_read += pSubpassBeginInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSubpassEndInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdNextSubpass2KHR(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdNextSubpass2KHR)(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdNextSubpass2KHR(commandBuffer, &pSubpassBeginInfo, &pSubpassEndInfo);
+        }
     }
 
     return bytes_read;
@@ -5150,9 +6992,17 @@ size_t VulkanDecoder::Decode_vkCmdEndRenderPass2KHR(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pSubpassEndInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndRenderPass2KHR)(commandBuffer, &pSubpassEndInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdEndRenderPass2KHR(commandBuffer, &pSubpassEndInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndRenderPass2KHR(commandBuffer, &pSubpassEndInfo);
+        }
     }
 
     return bytes_read;
@@ -5170,9 +7020,17 @@ size_t VulkanDecoder::Decode_vkGetSwapchainStatusKHR(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &swapchain);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetSwapchainStatusKHR(return_value, device, swapchain);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSwapchainStatusKHR)(return_value, device, swapchain);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSwapchainStatusKHR(return_value, device, swapchain);
+        }
     }
 
     return bytes_read;
@@ -5190,9 +7048,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalFencePropertiesKHR(const
     bytes_read += pExternalFenceInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pExternalFenceProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalFencePropertiesKHR)(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceExternalFencePropertiesKHR(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalFencePropertiesKHR(physicalDevice, &pExternalFenceInfo, &pExternalFenceProperties);
+        }
     }
 
     return bytes_read;
@@ -5210,9 +7076,17 @@ size_t VulkanDecoder::Decode_vkImportFenceWin32HandleKHR(const uint8_t* paramete
     bytes_read += pImportFenceWin32HandleInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkImportFenceWin32HandleKHR)(return_value, device, &pImportFenceWin32HandleInfo);
+    }
+    else
     {
-        consumer->Process_vkImportFenceWin32HandleKHR(return_value, device, &pImportFenceWin32HandleInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkImportFenceWin32HandleKHR(return_value, device, &pImportFenceWin32HandleInfo);
+        }
     }
 
     return bytes_read;
@@ -5232,9 +7106,17 @@ size_t VulkanDecoder::Decode_vkGetFenceWin32HandleKHR(const uint8_t* parameter_b
     bytes_read += pHandle.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetFenceWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetFenceWin32HandleKHR)(return_value, device, &pGetWin32HandleInfo, &pHandle);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetFenceWin32HandleKHR(return_value, device, &pGetWin32HandleInfo, &pHandle);
+        }
     }
 
     return bytes_read;
@@ -5252,9 +7134,17 @@ size_t VulkanDecoder::Decode_vkImportFenceFdKHR(const uint8_t* parameter_buffer,
     bytes_read += pImportFenceFdInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkImportFenceFdKHR)(return_value, device, &pImportFenceFdInfo);
+    }
+    else
     {
-        consumer->Process_vkImportFenceFdKHR(return_value, device, &pImportFenceFdInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkImportFenceFdKHR(return_value, device, &pImportFenceFdInfo);
+        }
     }
 
     return bytes_read;
@@ -5274,9 +7164,17 @@ size_t VulkanDecoder::Decode_vkGetFenceFdKHR(const uint8_t* parameter_buffer, si
     bytes_read += pFd.DecodeInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetFenceFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetFenceFdKHR)(return_value, device, &pGetFdInfo, &pFd);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetFenceFdKHR(return_value, device, &pGetFdInfo, &pFd);
+        }
     }
 
     return bytes_read;
@@ -5300,9 +7198,17 @@ size_t VulkanDecoder::Decode_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQuer
     bytes_read += pCounterDescriptions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR)(return_value, physicalDevice, queueFamilyIndex, &pCounterCount, &pCounters, &pCounterDescriptions);
+    }
+    else
     {
-        consumer->Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(return_value, physicalDevice, queueFamilyIndex, &pCounterCount, &pCounters, &pCounterDescriptions);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(return_value, physicalDevice, queueFamilyIndex, &pCounterCount, &pCounters, &pCounterDescriptions);
+        }
     }
 
     return bytes_read;
@@ -5320,9 +7226,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPasse
     bytes_read += pPerformanceQueryCreateInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pNumPasses.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(physicalDevice, &pPerformanceQueryCreateInfo, &pNumPasses);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR)(physicalDevice, &pPerformanceQueryCreateInfo, &pNumPasses);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(physicalDevice, &pPerformanceQueryCreateInfo, &pNumPasses);
+        }
     }
 
     return bytes_read;
@@ -5340,9 +7254,17 @@ size_t VulkanDecoder::Decode_vkAcquireProfilingLockKHR(const uint8_t* parameter_
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquireProfilingLockKHR(return_value, device, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireProfilingLockKHR)(return_value, device, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireProfilingLockKHR(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -5356,9 +7278,17 @@ size_t VulkanDecoder::Decode_vkReleaseProfilingLockKHR(const uint8_t* parameter_
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &device);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkReleaseProfilingLockKHR)(device);
+    }
+    else
     {
-        consumer->Process_vkReleaseProfilingLockKHR(device);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkReleaseProfilingLockKHR(device);
+        }
     }
 
     return bytes_read;
@@ -5378,9 +7308,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilities2KHR(const ui
     bytes_read += pSurfaceCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceCapabilities);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR)(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceCapabilities);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceCapabilities);
+        }
     }
 
     return bytes_read;
@@ -5402,9 +7340,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceFormats2KHR(const uint8_t
     bytes_read += pSurfaceFormats.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceFormats2KHR)(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceFormatCount, &pSurfaceFormats);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceFormats2KHR(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceFormatCount, &pSurfaceFormats);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceFormats2KHR(return_value, physicalDevice, &pSurfaceInfo, &pSurfaceFormatCount, &pSurfaceFormats);
+        }
     }
 
     return bytes_read;
@@ -5424,9 +7370,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayProperties2KHR(const uint
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceDisplayProperties2KHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceDisplayProperties2KHR)(return_value, physicalDevice, &pPropertyCount, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceDisplayProperties2KHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -5446,9 +7400,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(const
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR)(return_value, physicalDevice, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -5470,9 +7432,17 @@ size_t VulkanDecoder::Decode_vkGetDisplayModeProperties2KHR(const uint8_t* param
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDisplayModeProperties2KHR)(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetDisplayModeProperties2KHR(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDisplayModeProperties2KHR(return_value, physicalDevice, display, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -5492,9 +7462,17 @@ size_t VulkanDecoder::Decode_vkGetDisplayPlaneCapabilities2KHR(const uint8_t* pa
     bytes_read += pCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDisplayPlaneCapabilities2KHR(return_value, physicalDevice, &pDisplayPlaneInfo, &pCapabilities);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDisplayPlaneCapabilities2KHR)(return_value, physicalDevice, &pDisplayPlaneInfo, &pCapabilities);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDisplayPlaneCapabilities2KHR(return_value, physicalDevice, &pDisplayPlaneInfo, &pCapabilities);
+        }
     }
 
     return bytes_read;
@@ -5512,9 +7490,17 @@ size_t VulkanDecoder::Decode_vkGetImageMemoryRequirements2KHR(const uint8_t* par
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageMemoryRequirements2KHR)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
     {
-        consumer->Process_vkGetImageMemoryRequirements2KHR(device, &pInfo, &pMemoryRequirements);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageMemoryRequirements2KHR(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -5532,9 +7518,17 @@ size_t VulkanDecoder::Decode_vkGetBufferMemoryRequirements2KHR(const uint8_t* pa
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetBufferMemoryRequirements2KHR(device, &pInfo, &pMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferMemoryRequirements2KHR)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferMemoryRequirements2KHR(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -5554,9 +7548,17 @@ size_t VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements2KHR(const uint8_
     bytes_read += pSparseMemoryRequirementCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSparseMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageSparseMemoryRequirements2KHR(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageSparseMemoryRequirements2KHR)(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageSparseMemoryRequirements2KHR(device, &pInfo, &pSparseMemoryRequirementCount, &pSparseMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -5578,9 +7580,17 @@ size_t VulkanDecoder::Decode_vkCreateSamplerYcbcrConversionKHR(const uint8_t* pa
     bytes_read += pYcbcrConversion.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateSamplerYcbcrConversionKHR)(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+    }
+    else
     {
-        consumer->Process_vkCreateSamplerYcbcrConversionKHR(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateSamplerYcbcrConversionKHR(return_value, device, &pCreateInfo, &pAllocator, &pYcbcrConversion);
+        }
     }
 
     return bytes_read;
@@ -5598,9 +7608,17 @@ size_t VulkanDecoder::Decode_vkDestroySamplerYcbcrConversionKHR(const uint8_t* p
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &ycbcrConversion);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroySamplerYcbcrConversionKHR(device, ycbcrConversion, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroySamplerYcbcrConversionKHR)(device, ycbcrConversion, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroySamplerYcbcrConversionKHR(device, ycbcrConversion, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -5620,9 +7638,17 @@ size_t VulkanDecoder::Decode_vkBindBufferMemory2KHR(const uint8_t* parameter_buf
     bytes_read += pBindInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindBufferMemory2KHR)(return_value, device, bindInfoCount, &pBindInfos);
+    }
+    else
     {
-        consumer->Process_vkBindBufferMemory2KHR(return_value, device, bindInfoCount, &pBindInfos);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindBufferMemory2KHR(return_value, device, bindInfoCount, &pBindInfos);
+        }
     }
 
     return bytes_read;
@@ -5642,9 +7668,17 @@ size_t VulkanDecoder::Decode_vkBindImageMemory2KHR(const uint8_t* parameter_buff
     bytes_read += pBindInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindImageMemory2KHR)(return_value, device, bindInfoCount, &pBindInfos);
+    }
+    else
     {
-        consumer->Process_vkBindImageMemory2KHR(return_value, device, bindInfoCount, &pBindInfos);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindImageMemory2KHR(return_value, device, bindInfoCount, &pBindInfos);
+        }
     }
 
     return bytes_read;
@@ -5662,9 +7696,17 @@ size_t VulkanDecoder::Decode_vkGetDescriptorSetLayoutSupportKHR(const uint8_t* p
     bytes_read += pCreateInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSupport.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDescriptorSetLayoutSupportKHR(device, &pCreateInfo, &pSupport);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDescriptorSetLayoutSupportKHR)(device, &pCreateInfo, &pSupport);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDescriptorSetLayoutSupportKHR(device, &pCreateInfo, &pSupport);
+        }
     }
 
     return bytes_read;
@@ -5690,9 +7732,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndirectCountKHR(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndirectCountKHR)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawIndirectCountKHR(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndirectCountKHR(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -5718,9 +7768,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCountKHR(const uint8_t* par
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawIndexedIndirectCountKHR(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndexedIndirectCountKHR)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndexedIndirectCountKHR(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -5740,9 +7798,17 @@ size_t VulkanDecoder::Decode_vkGetSemaphoreCounterValueKHR(const uint8_t* parame
     bytes_read += pValue.DecodeUInt64((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSemaphoreCounterValueKHR)(return_value, device, semaphore, &pValue);
+    }
+    else
     {
-        consumer->Process_vkGetSemaphoreCounterValueKHR(return_value, device, semaphore, &pValue);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSemaphoreCounterValueKHR(return_value, device, semaphore, &pValue);
+        }
     }
 
     return bytes_read;
@@ -5762,9 +7828,17 @@ size_t VulkanDecoder::Decode_vkWaitSemaphoresKHR(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &timeout);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkWaitSemaphoresKHR)(return_value, device, &pWaitInfo, timeout);
+    }
+    else
     {
-        consumer->Process_vkWaitSemaphoresKHR(return_value, device, &pWaitInfo, timeout);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkWaitSemaphoresKHR(return_value, device, &pWaitInfo, timeout);
+        }
     }
 
     return bytes_read;
@@ -5782,9 +7856,17 @@ size_t VulkanDecoder::Decode_vkSignalSemaphoreKHR(const uint8_t* parameter_buffe
     bytes_read += pSignalInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkSignalSemaphoreKHR(return_value, device, &pSignalInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSignalSemaphoreKHR)(return_value, device, &pSignalInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSignalSemaphoreKHR(return_value, device, &pSignalInfo);
+        }
     }
 
     return bytes_read;
@@ -5804,9 +7886,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceFragmentShadingRatesKHR(const ui
     bytes_read += pFragmentShadingRates.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceFragmentShadingRatesKHR)(return_value, physicalDevice, &pFragmentShadingRateCount, &pFragmentShadingRates);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceFragmentShadingRatesKHR(return_value, physicalDevice, &pFragmentShadingRateCount, &pFragmentShadingRates);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceFragmentShadingRatesKHR(return_value, physicalDevice, &pFragmentShadingRateCount, &pFragmentShadingRates);
+        }
     }
 
     return bytes_read;
@@ -5824,9 +7914,17 @@ size_t VulkanDecoder::Decode_vkCmdSetFragmentShadingRateKHR(const uint8_t* param
     bytes_read += pFragmentSize.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += combinerOps.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetFragmentShadingRateKHR(commandBuffer, &pFragmentSize, &combinerOps);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetFragmentShadingRateKHR)(commandBuffer, &pFragmentSize, &combinerOps);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetFragmentShadingRateKHR(commandBuffer, &pFragmentSize, &combinerOps);
+        }
     }
 
     return bytes_read;
@@ -5848,9 +7946,17 @@ size_t VulkanDecoder::Decode_vkWaitForPresentKHR(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &timeout);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkWaitForPresentKHR(return_value, device, swapchain, presentId, timeout);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkWaitForPresentKHR)(return_value, device, swapchain, presentId, timeout);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkWaitForPresentKHR(return_value, device, swapchain, presentId, timeout);
+        }
     }
 
     return bytes_read;
@@ -5868,9 +7974,17 @@ size_t VulkanDecoder::Decode_vkGetBufferDeviceAddressKHR(const uint8_t* paramete
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeVkDeviceAddressValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferDeviceAddressKHR)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetBufferDeviceAddressKHR(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferDeviceAddressKHR(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -5888,9 +8002,17 @@ size_t VulkanDecoder::Decode_vkGetBufferOpaqueCaptureAddressKHR(const uint8_t* p
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetBufferOpaqueCaptureAddressKHR(return_value, device, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferOpaqueCaptureAddressKHR)(return_value, device, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferOpaqueCaptureAddressKHR(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -5908,9 +8030,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceMemoryOpaqueCaptureAddressKHR(const uint
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -5930,9 +8060,17 @@ size_t VulkanDecoder::Decode_vkCreateDeferredOperationKHR(const uint8_t* paramet
     bytes_read += pDeferredOperation.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDeferredOperationKHR)(return_value, device, &pAllocator, &pDeferredOperation);
+    }
+    else
     {
-        consumer->Process_vkCreateDeferredOperationKHR(return_value, device, &pAllocator, &pDeferredOperation);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDeferredOperationKHR(return_value, device, &pAllocator, &pDeferredOperation);
+        }
     }
 
     return bytes_read;
@@ -5950,9 +8088,17 @@ size_t VulkanDecoder::Decode_vkDestroyDeferredOperationKHR(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &operation);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDeferredOperationKHR(device, operation, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDeferredOperationKHR)(device, operation, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDeferredOperationKHR(device, operation, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -5970,9 +8116,17 @@ size_t VulkanDecoder::Decode_vkGetDeferredOperationMaxConcurrencyKHR(const uint8
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &operation);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeferredOperationMaxConcurrencyKHR)(return_value, device, operation);
+    }
+    else
     {
-        consumer->Process_vkGetDeferredOperationMaxConcurrencyKHR(return_value, device, operation);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeferredOperationMaxConcurrencyKHR(return_value, device, operation);
+        }
     }
 
     return bytes_read;
@@ -5990,9 +8144,17 @@ size_t VulkanDecoder::Decode_vkGetDeferredOperationResultKHR(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &operation);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeferredOperationResultKHR(return_value, device, operation);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeferredOperationResultKHR)(return_value, device, operation);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeferredOperationResultKHR(return_value, device, operation);
+        }
     }
 
     return bytes_read;
@@ -6010,9 +8172,17 @@ size_t VulkanDecoder::Decode_vkDeferredOperationJoinKHR(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &operation);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDeferredOperationJoinKHR)(return_value, device, operation);
+    }
+    else
     {
-        consumer->Process_vkDeferredOperationJoinKHR(return_value, device, operation);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDeferredOperationJoinKHR(return_value, device, operation);
+        }
     }
 
     return bytes_read;
@@ -6034,9 +8204,17 @@ size_t VulkanDecoder::Decode_vkGetPipelineExecutablePropertiesKHR(const uint8_t*
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPipelineExecutablePropertiesKHR)(return_value, device, &pPipelineInfo, &pExecutableCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPipelineExecutablePropertiesKHR(return_value, device, &pPipelineInfo, &pExecutableCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPipelineExecutablePropertiesKHR(return_value, device, &pPipelineInfo, &pExecutableCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -6058,9 +8236,17 @@ size_t VulkanDecoder::Decode_vkGetPipelineExecutableStatisticsKHR(const uint8_t*
     bytes_read += pStatistics.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPipelineExecutableStatisticsKHR(return_value, device, &pExecutableInfo, &pStatisticCount, &pStatistics);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPipelineExecutableStatisticsKHR)(return_value, device, &pExecutableInfo, &pStatisticCount, &pStatistics);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPipelineExecutableStatisticsKHR(return_value, device, &pExecutableInfo, &pStatisticCount, &pStatistics);
+        }
     }
 
     return bytes_read;
@@ -6082,9 +8268,17 @@ size_t VulkanDecoder::Decode_vkGetPipelineExecutableInternalRepresentationsKHR(c
     bytes_read += pInternalRepresentations.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPipelineExecutableInternalRepresentationsKHR)(return_value, device, &pExecutableInfo, &pInternalRepresentationCount, &pInternalRepresentations);
+    }
+    else
     {
-        consumer->Process_vkGetPipelineExecutableInternalRepresentationsKHR(return_value, device, &pExecutableInfo, &pInternalRepresentationCount, &pInternalRepresentations);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPipelineExecutableInternalRepresentationsKHR(return_value, device, &pExecutableInfo, &pInternalRepresentationCount, &pInternalRepresentations);
+        }
     }
 
     return bytes_read;
@@ -6102,9 +8296,17 @@ size_t VulkanDecoder::Decode_vkCmdSetEvent2KHR(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += pDependencyInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetEvent2KHR(commandBuffer, event, &pDependencyInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetEvent2KHR)(commandBuffer, event, &pDependencyInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetEvent2KHR(commandBuffer, event, &pDependencyInfo);
+        }
     }
 
     return bytes_read;
@@ -6122,9 +8324,17 @@ size_t VulkanDecoder::Decode_vkCmdResetEvent2KHR(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &event);
     bytes_read += ValueDecoder::DecodeFlags64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stageMask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdResetEvent2KHR(commandBuffer, event, stageMask);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdResetEvent2KHR)(commandBuffer, event, stageMask);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdResetEvent2KHR(commandBuffer, event, stageMask);
+        }
     }
 
     return bytes_read;
@@ -6144,9 +8354,17 @@ size_t VulkanDecoder::Decode_vkCmdWaitEvents2KHR(const uint8_t* parameter_buffer
     bytes_read += pEvents.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pDependencyInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWaitEvents2KHR)(commandBuffer, eventCount, &pEvents, &pDependencyInfos);
+    }
+    else
     {
-        consumer->Process_vkCmdWaitEvents2KHR(commandBuffer, eventCount, &pEvents, &pDependencyInfos);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWaitEvents2KHR(commandBuffer, eventCount, &pEvents, &pDependencyInfos);
+        }
     }
 
     return bytes_read;
@@ -6162,9 +8380,17 @@ size_t VulkanDecoder::Decode_vkCmdPipelineBarrier2KHR(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pDependencyInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdPipelineBarrier2KHR(commandBuffer, &pDependencyInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdPipelineBarrier2KHR)(commandBuffer, &pDependencyInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdPipelineBarrier2KHR(commandBuffer, &pDependencyInfo);
+        }
     }
 
     return bytes_read;
@@ -6184,9 +8410,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteTimestamp2KHR(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &query);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteTimestamp2KHR)(commandBuffer, stage, queryPool, query);
+    }
+    else
     {
-        consumer->Process_vkCmdWriteTimestamp2KHR(commandBuffer, stage, queryPool, query);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteTimestamp2KHR(commandBuffer, stage, queryPool, query);
+        }
     }
 
     return bytes_read;
@@ -6208,9 +8442,17 @@ size_t VulkanDecoder::Decode_vkQueueSubmit2KHR(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &fence);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueSubmit2KHR)(return_value, queue, submitCount, &pSubmits, fence);
+    }
+    else
     {
-        consumer->Process_vkQueueSubmit2KHR(return_value, queue, submitCount, &pSubmits, fence);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueSubmit2KHR(return_value, queue, submitCount, &pSubmits, fence);
+        }
     }
 
     return bytes_read;
@@ -6232,9 +8474,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteBufferMarker2AMD(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &dstOffset);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &marker);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdWriteBufferMarker2AMD(commandBuffer, stage, dstBuffer, dstOffset, marker);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteBufferMarker2AMD)(commandBuffer, stage, dstBuffer, dstOffset, marker);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteBufferMarker2AMD(commandBuffer, stage, dstBuffer, dstOffset, marker);
+        }
     }
 
     return bytes_read;
@@ -6252,9 +8502,17 @@ size_t VulkanDecoder::Decode_vkGetQueueCheckpointData2NV(const uint8_t* paramete
     bytes_read += pCheckpointDataCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pCheckpointData.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetQueueCheckpointData2NV)(queue, &pCheckpointDataCount, &pCheckpointData);
+    }
+    else
     {
-        consumer->Process_vkGetQueueCheckpointData2NV(queue, &pCheckpointDataCount, &pCheckpointData);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetQueueCheckpointData2NV(queue, &pCheckpointDataCount, &pCheckpointData);
+        }
     }
 
     return bytes_read;
@@ -6270,9 +8528,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyBuffer2KHR(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pCopyBufferInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyBuffer2KHR(commandBuffer, &pCopyBufferInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyBuffer2KHR)(commandBuffer, &pCopyBufferInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyBuffer2KHR(commandBuffer, &pCopyBufferInfo);
+        }
     }
 
     return bytes_read;
@@ -6288,9 +8554,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyImage2KHR(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pCopyImageInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyImage2KHR)(commandBuffer, &pCopyImageInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyImage2KHR(commandBuffer, &pCopyImageInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyImage2KHR(commandBuffer, &pCopyImageInfo);
+        }
     }
 
     return bytes_read;
@@ -6306,9 +8580,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyBufferToImage2KHR(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pCopyBufferToImageInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyBufferToImage2KHR)(commandBuffer, &pCopyBufferToImageInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyBufferToImage2KHR(commandBuffer, &pCopyBufferToImageInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyBufferToImage2KHR(commandBuffer, &pCopyBufferToImageInfo);
+        }
     }
 
     return bytes_read;
@@ -6324,9 +8606,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyImageToBuffer2KHR(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pCopyImageToBufferInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyImageToBuffer2KHR(commandBuffer, &pCopyImageToBufferInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyImageToBuffer2KHR)(commandBuffer, &pCopyImageToBufferInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyImageToBuffer2KHR(commandBuffer, &pCopyImageToBufferInfo);
+        }
     }
 
     return bytes_read;
@@ -6342,9 +8632,17 @@ size_t VulkanDecoder::Decode_vkCmdBlitImage2KHR(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pBlitImageInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBlitImage2KHR)(commandBuffer, &pBlitImageInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdBlitImage2KHR(commandBuffer, &pBlitImageInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBlitImage2KHR(commandBuffer, &pBlitImageInfo);
+        }
     }
 
     return bytes_read;
@@ -6360,9 +8658,17 @@ size_t VulkanDecoder::Decode_vkCmdResolveImage2KHR(const uint8_t* parameter_buff
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pResolveImageInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdResolveImage2KHR(commandBuffer, &pResolveImageInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdResolveImage2KHR)(commandBuffer, &pResolveImageInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdResolveImage2KHR(commandBuffer, &pResolveImageInfo);
+        }
     }
 
     return bytes_read;
@@ -6384,9 +8690,17 @@ size_t VulkanDecoder::Decode_vkCreateDebugReportCallbackEXT(const uint8_t* param
     bytes_read += pCallback.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateDebugReportCallbackEXT(return_value, instance, &pCreateInfo, &pAllocator, &pCallback);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDebugReportCallbackEXT)(return_value, instance, &pCreateInfo, &pAllocator, &pCallback);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDebugReportCallbackEXT(return_value, instance, &pCreateInfo, &pAllocator, &pCallback);
+        }
     }
 
     return bytes_read;
@@ -6404,9 +8718,17 @@ size_t VulkanDecoder::Decode_vkDestroyDebugReportCallbackEXT(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &callback);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDebugReportCallbackEXT)(instance, callback, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyDebugReportCallbackEXT(instance, callback, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDebugReportCallbackEXT(instance, callback, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -6434,9 +8756,17 @@ size_t VulkanDecoder::Decode_vkDebugReportMessageEXT(const uint8_t* parameter_bu
     bytes_read += pLayerPrefix.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMessage.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDebugReportMessageEXT(instance, flags, objectType, object, location, messageCode, &pLayerPrefix, &pMessage);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDebugReportMessageEXT)(instance, flags, objectType, object, location, messageCode, &pLayerPrefix, &pMessage);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDebugReportMessageEXT(instance, flags, objectType, object, location, messageCode, &pLayerPrefix, &pMessage);
+        }
     }
 
     return bytes_read;
@@ -6454,9 +8784,17 @@ size_t VulkanDecoder::Decode_vkDebugMarkerSetObjectTagEXT(const uint8_t* paramet
     bytes_read += pTagInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDebugMarkerSetObjectTagEXT)(return_value, device, &pTagInfo);
+    }
+    else
     {
-        consumer->Process_vkDebugMarkerSetObjectTagEXT(return_value, device, &pTagInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDebugMarkerSetObjectTagEXT(return_value, device, &pTagInfo);
+        }
     }
 
     return bytes_read;
@@ -6474,9 +8812,17 @@ size_t VulkanDecoder::Decode_vkDebugMarkerSetObjectNameEXT(const uint8_t* parame
     bytes_read += pNameInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDebugMarkerSetObjectNameEXT)(return_value, device, &pNameInfo);
+    }
+    else
     {
-        consumer->Process_vkDebugMarkerSetObjectNameEXT(return_value, device, &pNameInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDebugMarkerSetObjectNameEXT(return_value, device, &pNameInfo);
+        }
     }
 
     return bytes_read;
@@ -6492,9 +8838,17 @@ size_t VulkanDecoder::Decode_vkCmdDebugMarkerBeginEXT(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pMarkerInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDebugMarkerBeginEXT(commandBuffer, &pMarkerInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDebugMarkerBeginEXT)(commandBuffer, &pMarkerInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDebugMarkerBeginEXT(commandBuffer, &pMarkerInfo);
+        }
     }
 
     return bytes_read;
@@ -6508,9 +8862,17 @@ size_t VulkanDecoder::Decode_vkCmdDebugMarkerEndEXT(const uint8_t* parameter_buf
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDebugMarkerEndEXT)(commandBuffer);
+    }
+    else
     {
-        consumer->Process_vkCmdDebugMarkerEndEXT(commandBuffer);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDebugMarkerEndEXT(commandBuffer);
+        }
     }
 
     return bytes_read;
@@ -6526,9 +8888,17 @@ size_t VulkanDecoder::Decode_vkCmdDebugMarkerInsertEXT(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pMarkerInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDebugMarkerInsertEXT(commandBuffer, &pMarkerInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDebugMarkerInsertEXT)(commandBuffer, &pMarkerInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDebugMarkerInsertEXT(commandBuffer, &pMarkerInfo);
+        }
     }
 
     return bytes_read;
@@ -6552,9 +8922,17 @@ size_t VulkanDecoder::Decode_vkCmdBindTransformFeedbackBuffersEXT(const uint8_t*
     bytes_read += pOffsets.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSizes.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindTransformFeedbackBuffersEXT)(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes);
+    }
+    else
     {
-        consumer->Process_vkCmdBindTransformFeedbackBuffersEXT(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindTransformFeedbackBuffersEXT(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes);
+        }
     }
 
     return bytes_read;
@@ -6576,9 +8954,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginTransformFeedbackEXT(const uint8_t* param
     bytes_read += pCounterBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pCounterBufferOffsets.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginTransformFeedbackEXT)(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+    }
+    else
     {
-        consumer->Process_vkCmdBeginTransformFeedbackEXT(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginTransformFeedbackEXT(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+        }
     }
 
     return bytes_read;
@@ -6600,9 +8986,17 @@ size_t VulkanDecoder::Decode_vkCmdEndTransformFeedbackEXT(const uint8_t* paramet
     bytes_read += pCounterBuffers.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pCounterBufferOffsets.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdEndTransformFeedbackEXT(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndTransformFeedbackEXT)(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndTransformFeedbackEXT(commandBuffer, firstCounterBuffer, counterBufferCount, &pCounterBuffers, &pCounterBufferOffsets);
+        }
     }
 
     return bytes_read;
@@ -6624,9 +9018,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginQueryIndexedEXT(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &flags);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &index);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginQueryIndexedEXT)(commandBuffer, queryPool, query, flags, index);
+    }
+    else
     {
-        consumer->Process_vkCmdBeginQueryIndexedEXT(commandBuffer, queryPool, query, flags, index);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginQueryIndexedEXT(commandBuffer, queryPool, query, flags, index);
+        }
     }
 
     return bytes_read;
@@ -6646,9 +9048,17 @@ size_t VulkanDecoder::Decode_vkCmdEndQueryIndexedEXT(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &query);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &index);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdEndQueryIndexedEXT(commandBuffer, queryPool, query, index);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndQueryIndexedEXT)(commandBuffer, queryPool, query, index);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndQueryIndexedEXT(commandBuffer, queryPool, query, index);
+        }
     }
 
     return bytes_read;
@@ -6674,9 +9084,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndirectByteCountEXT(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &counterOffset);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &vertexStride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawIndirectByteCountEXT(commandBuffer, instanceCount, firstInstance, counterBuffer, counterBufferOffset, counterOffset, vertexStride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndirectByteCountEXT)(commandBuffer, instanceCount, firstInstance, counterBuffer, counterBufferOffset, counterOffset, vertexStride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndirectByteCountEXT(commandBuffer, instanceCount, firstInstance, counterBuffer, counterBufferOffset, counterOffset, vertexStride);
+        }
     }
 
     return bytes_read;
@@ -6694,9 +9112,17 @@ size_t VulkanDecoder::Decode_vkGetImageViewHandleNVX(const uint8_t* parameter_bu
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageViewHandleNVX)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetImageViewHandleNVX(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageViewHandleNVX(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -6716,9 +9142,17 @@ size_t VulkanDecoder::Decode_vkGetImageViewAddressNVX(const uint8_t* parameter_b
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageViewAddressNVX(return_value, device, imageView, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageViewAddressNVX)(return_value, device, imageView, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageViewAddressNVX(return_value, device, imageView, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -6744,9 +9178,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndirectCountAMD(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndirectCountAMD)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawIndirectCountAMD(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndirectCountAMD(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -6772,9 +9214,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCountAMD(const uint8_t* par
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawIndexedIndirectCountAMD)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawIndexedIndirectCountAMD(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawIndexedIndirectCountAMD(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -6800,9 +9250,17 @@ size_t VulkanDecoder::Decode_vkGetShaderInfoAMD(const uint8_t* parameter_buffer,
     bytes_read += pInfo.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetShaderInfoAMD(return_value, device, pipeline, shaderStage, infoType, &pInfoSize, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetShaderInfoAMD)(return_value, device, pipeline, shaderStage, infoType, &pInfoSize, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetShaderInfoAMD(return_value, device, pipeline, shaderStage, infoType, &pInfoSize, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -6824,9 +9282,17 @@ size_t VulkanDecoder::Decode_vkCreateStreamDescriptorSurfaceGGP(const uint8_t* p
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateStreamDescriptorSurfaceGGP)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateStreamDescriptorSurfaceGGP(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateStreamDescriptorSurfaceGGP(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -6856,9 +9322,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(
     bytes_read += pExternalImageFormatProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(return_value, physicalDevice, format, type, tiling, usage, flags, externalHandleType, &pExternalImageFormatProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV)(return_value, physicalDevice, format, type, tiling, usage, flags, externalHandleType, &pExternalImageFormatProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(return_value, physicalDevice, format, type, tiling, usage, flags, externalHandleType, &pExternalImageFormatProperties);
+        }
     }
 
     return bytes_read;
@@ -6880,9 +9354,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryWin32HandleNV(const uint8_t* parameter_b
     bytes_read += pHandle.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryWin32HandleNV)(return_value, device, memory, handleType, &pHandle);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryWin32HandleNV(return_value, device, memory, handleType, &pHandle);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryWin32HandleNV(return_value, device, memory, handleType, &pHandle);
+        }
     }
 
     return bytes_read;
@@ -6904,9 +9386,17 @@ size_t VulkanDecoder::Decode_vkCreateViSurfaceNN(const uint8_t* parameter_buffer
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateViSurfaceNN)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateViSurfaceNN(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateViSurfaceNN(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -6922,9 +9412,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginConditionalRenderingEXT(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pConditionalRenderingBegin.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBeginConditionalRenderingEXT(commandBuffer, &pConditionalRenderingBegin);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginConditionalRenderingEXT)(commandBuffer, &pConditionalRenderingBegin);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginConditionalRenderingEXT(commandBuffer, &pConditionalRenderingBegin);
+        }
     }
 
     return bytes_read;
@@ -6938,9 +9436,17 @@ size_t VulkanDecoder::Decode_vkCmdEndConditionalRenderingEXT(const uint8_t* para
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndConditionalRenderingEXT)(commandBuffer);
+    }
+    else
     {
-        consumer->Process_vkCmdEndConditionalRenderingEXT(commandBuffer);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndConditionalRenderingEXT(commandBuffer);
+        }
     }
 
     return bytes_read;
@@ -6960,9 +9466,17 @@ size_t VulkanDecoder::Decode_vkCmdSetViewportWScalingNV(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &viewportCount);
     bytes_read += pViewportWScalings.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetViewportWScalingNV(commandBuffer, firstViewport, viewportCount, &pViewportWScalings);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetViewportWScalingNV)(commandBuffer, firstViewport, viewportCount, &pViewportWScalings);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetViewportWScalingNV(commandBuffer, firstViewport, viewportCount, &pViewportWScalings);
+        }
     }
 
     return bytes_read;
@@ -6980,9 +9494,17 @@ size_t VulkanDecoder::Decode_vkReleaseDisplayEXT(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &display);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkReleaseDisplayEXT(return_value, physicalDevice, display);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkReleaseDisplayEXT)(return_value, physicalDevice, display);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkReleaseDisplayEXT(return_value, physicalDevice, display);
+        }
     }
 
     return bytes_read;
@@ -7002,9 +9524,17 @@ size_t VulkanDecoder::Decode_vkAcquireXlibDisplayEXT(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &display);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireXlibDisplayEXT)(return_value, physicalDevice, dpy, display);
+    }
+    else
     {
-        consumer->Process_vkAcquireXlibDisplayEXT(return_value, physicalDevice, dpy, display);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireXlibDisplayEXT(return_value, physicalDevice, dpy, display);
+        }
     }
 
     return bytes_read;
@@ -7026,9 +9556,17 @@ size_t VulkanDecoder::Decode_vkGetRandROutputDisplayEXT(const uint8_t* parameter
     bytes_read += pDisplay.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetRandROutputDisplayEXT(return_value, physicalDevice, dpy, rrOutput, &pDisplay);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRandROutputDisplayEXT)(return_value, physicalDevice, dpy, rrOutput, &pDisplay);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRandROutputDisplayEXT(return_value, physicalDevice, dpy, rrOutput, &pDisplay);
+        }
     }
 
     return bytes_read;
@@ -7048,9 +9586,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilities2EXT(const ui
     bytes_read += pSurfaceCapabilities.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT)(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT(return_value, physicalDevice, surface, &pSurfaceCapabilities);
+        }
     }
 
     return bytes_read;
@@ -7070,9 +9616,17 @@ size_t VulkanDecoder::Decode_vkDisplayPowerControlEXT(const uint8_t* parameter_b
     bytes_read += pDisplayPowerInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDisplayPowerControlEXT)(return_value, device, display, &pDisplayPowerInfo);
+    }
+    else
     {
-        consumer->Process_vkDisplayPowerControlEXT(return_value, device, display, &pDisplayPowerInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDisplayPowerControlEXT(return_value, device, display, &pDisplayPowerInfo);
+        }
     }
 
     return bytes_read;
@@ -7094,9 +9648,17 @@ size_t VulkanDecoder::Decode_vkRegisterDeviceEventEXT(const uint8_t* parameter_b
     bytes_read += pFence.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkRegisterDeviceEventEXT(return_value, device, &pDeviceEventInfo, &pAllocator, &pFence);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkRegisterDeviceEventEXT)(return_value, device, &pDeviceEventInfo, &pAllocator, &pFence);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkRegisterDeviceEventEXT(return_value, device, &pDeviceEventInfo, &pAllocator, &pFence);
+        }
     }
 
     return bytes_read;
@@ -7120,9 +9682,17 @@ size_t VulkanDecoder::Decode_vkRegisterDisplayEventEXT(const uint8_t* parameter_
     bytes_read += pFence.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkRegisterDisplayEventEXT)(return_value, device, display, &pDisplayEventInfo, &pAllocator, &pFence);
+    }
+    else
     {
-        consumer->Process_vkRegisterDisplayEventEXT(return_value, device, display, &pDisplayEventInfo, &pAllocator, &pFence);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkRegisterDisplayEventEXT(return_value, device, display, &pDisplayEventInfo, &pAllocator, &pFence);
+        }
     }
 
     return bytes_read;
@@ -7144,9 +9714,17 @@ size_t VulkanDecoder::Decode_vkGetSwapchainCounterEXT(const uint8_t* parameter_b
     bytes_read += pCounterValue.DecodeUInt64((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetSwapchainCounterEXT(return_value, device, swapchain, counter, &pCounterValue);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSwapchainCounterEXT)(return_value, device, swapchain, counter, &pCounterValue);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSwapchainCounterEXT(return_value, device, swapchain, counter, &pCounterValue);
+        }
     }
 
     return bytes_read;
@@ -7166,9 +9744,17 @@ size_t VulkanDecoder::Decode_vkGetRefreshCycleDurationGOOGLE(const uint8_t* para
     bytes_read += pDisplayTimingProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRefreshCycleDurationGOOGLE)(return_value, device, swapchain, &pDisplayTimingProperties);
+    }
+    else
     {
-        consumer->Process_vkGetRefreshCycleDurationGOOGLE(return_value, device, swapchain, &pDisplayTimingProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRefreshCycleDurationGOOGLE(return_value, device, swapchain, &pDisplayTimingProperties);
+        }
     }
 
     return bytes_read;
@@ -7190,9 +9776,17 @@ size_t VulkanDecoder::Decode_vkGetPastPresentationTimingGOOGLE(const uint8_t* pa
     bytes_read += pPresentationTimings.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPastPresentationTimingGOOGLE)(return_value, device, swapchain, &pPresentationTimingCount, &pPresentationTimings);
+    }
+    else
     {
-        consumer->Process_vkGetPastPresentationTimingGOOGLE(return_value, device, swapchain, &pPresentationTimingCount, &pPresentationTimings);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPastPresentationTimingGOOGLE(return_value, device, swapchain, &pPresentationTimingCount, &pPresentationTimings);
+        }
     }
 
     return bytes_read;
@@ -7212,9 +9806,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDiscardRectangleEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &discardRectangleCount);
     bytes_read += pDiscardRectangles.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDiscardRectangleEXT(commandBuffer, firstDiscardRectangle, discardRectangleCount, &pDiscardRectangles);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDiscardRectangleEXT)(commandBuffer, firstDiscardRectangle, discardRectangleCount, &pDiscardRectangles);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDiscardRectangleEXT(commandBuffer, firstDiscardRectangle, discardRectangleCount, &pDiscardRectangles);
+        }
     }
 
     return bytes_read;
@@ -7234,9 +9836,17 @@ size_t VulkanDecoder::Decode_vkSetHdrMetadataEXT(const uint8_t* parameter_buffer
     bytes_read += pSwapchains.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMetadata.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetHdrMetadataEXT)(device, swapchainCount, &pSwapchains, &pMetadata);
+    }
+    else
     {
-        consumer->Process_vkSetHdrMetadataEXT(device, swapchainCount, &pSwapchains, &pMetadata);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetHdrMetadataEXT(device, swapchainCount, &pSwapchains, &pMetadata);
+        }
     }
 
     return bytes_read;
@@ -7258,9 +9868,17 @@ size_t VulkanDecoder::Decode_vkCreateIOSSurfaceMVK(const uint8_t* parameter_buff
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateIOSSurfaceMVK(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateIOSSurfaceMVK)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateIOSSurfaceMVK(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -7282,9 +9900,17 @@ size_t VulkanDecoder::Decode_vkCreateMacOSSurfaceMVK(const uint8_t* parameter_bu
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateMacOSSurfaceMVK(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateMacOSSurfaceMVK)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateMacOSSurfaceMVK(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -7302,9 +9928,17 @@ size_t VulkanDecoder::Decode_vkSetDebugUtilsObjectNameEXT(const uint8_t* paramet
     bytes_read += pNameInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetDebugUtilsObjectNameEXT)(return_value, device, &pNameInfo);
+    }
+    else
     {
-        consumer->Process_vkSetDebugUtilsObjectNameEXT(return_value, device, &pNameInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetDebugUtilsObjectNameEXT(return_value, device, &pNameInfo);
+        }
     }
 
     return bytes_read;
@@ -7322,9 +9956,17 @@ size_t VulkanDecoder::Decode_vkSetDebugUtilsObjectTagEXT(const uint8_t* paramete
     bytes_read += pTagInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkSetDebugUtilsObjectTagEXT(return_value, device, &pTagInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetDebugUtilsObjectTagEXT)(return_value, device, &pTagInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetDebugUtilsObjectTagEXT(return_value, device, &pTagInfo);
+        }
     }
 
     return bytes_read;
@@ -7340,9 +9982,17 @@ size_t VulkanDecoder::Decode_vkQueueBeginDebugUtilsLabelEXT(const uint8_t* param
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queue);
     bytes_read += pLabelInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueBeginDebugUtilsLabelEXT)(queue, &pLabelInfo);
+    }
+    else
     {
-        consumer->Process_vkQueueBeginDebugUtilsLabelEXT(queue, &pLabelInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueBeginDebugUtilsLabelEXT(queue, &pLabelInfo);
+        }
     }
 
     return bytes_read;
@@ -7356,9 +10006,17 @@ size_t VulkanDecoder::Decode_vkQueueEndDebugUtilsLabelEXT(const uint8_t* paramet
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queue);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueEndDebugUtilsLabelEXT)(queue);
+    }
+    else
     {
-        consumer->Process_vkQueueEndDebugUtilsLabelEXT(queue);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueEndDebugUtilsLabelEXT(queue);
+        }
     }
 
     return bytes_read;
@@ -7374,9 +10032,17 @@ size_t VulkanDecoder::Decode_vkQueueInsertDebugUtilsLabelEXT(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queue);
     bytes_read += pLabelInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkQueueInsertDebugUtilsLabelEXT(queue, &pLabelInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueInsertDebugUtilsLabelEXT)(queue, &pLabelInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueInsertDebugUtilsLabelEXT(queue, &pLabelInfo);
+        }
     }
 
     return bytes_read;
@@ -7392,9 +10058,17 @@ size_t VulkanDecoder::Decode_vkCmdBeginDebugUtilsLabelEXT(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pLabelInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBeginDebugUtilsLabelEXT)(commandBuffer, &pLabelInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdBeginDebugUtilsLabelEXT(commandBuffer, &pLabelInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBeginDebugUtilsLabelEXT(commandBuffer, &pLabelInfo);
+        }
     }
 
     return bytes_read;
@@ -7408,9 +10082,17 @@ size_t VulkanDecoder::Decode_vkCmdEndDebugUtilsLabelEXT(const uint8_t* parameter
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdEndDebugUtilsLabelEXT(commandBuffer);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdEndDebugUtilsLabelEXT)(commandBuffer);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdEndDebugUtilsLabelEXT(commandBuffer);
+        }
     }
 
     return bytes_read;
@@ -7426,9 +10108,17 @@ size_t VulkanDecoder::Decode_vkCmdInsertDebugUtilsLabelEXT(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pLabelInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdInsertDebugUtilsLabelEXT)(commandBuffer, &pLabelInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdInsertDebugUtilsLabelEXT(commandBuffer, &pLabelInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdInsertDebugUtilsLabelEXT(commandBuffer, &pLabelInfo);
+        }
     }
 
     return bytes_read;
@@ -7450,9 +10140,17 @@ size_t VulkanDecoder::Decode_vkCreateDebugUtilsMessengerEXT(const uint8_t* param
     bytes_read += pMessenger.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDebugUtilsMessengerEXT)(return_value, instance, &pCreateInfo, &pAllocator, &pMessenger);
+    }
+    else
     {
-        consumer->Process_vkCreateDebugUtilsMessengerEXT(return_value, instance, &pCreateInfo, &pAllocator, &pMessenger);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDebugUtilsMessengerEXT(return_value, instance, &pCreateInfo, &pAllocator, &pMessenger);
+        }
     }
 
     return bytes_read;
@@ -7470,9 +10168,17 @@ size_t VulkanDecoder::Decode_vkDestroyDebugUtilsMessengerEXT(const uint8_t* para
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &messenger);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyDebugUtilsMessengerEXT(instance, messenger, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyDebugUtilsMessengerEXT)(instance, messenger, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyDebugUtilsMessengerEXT(instance, messenger, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -7492,9 +10198,17 @@ size_t VulkanDecoder::Decode_vkSubmitDebugUtilsMessageEXT(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &messageTypes);
     bytes_read += pCallbackData.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSubmitDebugUtilsMessageEXT)(instance, messageSeverity, messageTypes, &pCallbackData);
+    }
+    else
     {
-        consumer->Process_vkSubmitDebugUtilsMessageEXT(instance, messageSeverity, messageTypes, &pCallbackData);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSubmitDebugUtilsMessageEXT(instance, messageSeverity, messageTypes, &pCallbackData);
+        }
     }
 
     return bytes_read;
@@ -7514,9 +10228,17 @@ size_t VulkanDecoder::Decode_vkGetAndroidHardwareBufferPropertiesANDROID(const u
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetAndroidHardwareBufferPropertiesANDROID(return_value, device, buffer, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetAndroidHardwareBufferPropertiesANDROID)(return_value, device, buffer, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetAndroidHardwareBufferPropertiesANDROID(return_value, device, buffer, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -7536,9 +10258,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryAndroidHardwareBufferANDROID(const uint8
     bytes_read += pBuffer.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryAndroidHardwareBufferANDROID)(return_value, device, &pInfo, &pBuffer);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryAndroidHardwareBufferANDROID(return_value, device, &pInfo, &pBuffer);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryAndroidHardwareBufferANDROID(return_value, device, &pInfo, &pBuffer);
+        }
     }
 
     return bytes_read;
@@ -7554,9 +10284,17 @@ size_t VulkanDecoder::Decode_vkCmdSetSampleLocationsEXT(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pSampleLocationsInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetSampleLocationsEXT(commandBuffer, &pSampleLocationsInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetSampleLocationsEXT)(commandBuffer, &pSampleLocationsInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetSampleLocationsEXT(commandBuffer, &pSampleLocationsInfo);
+        }
     }
 
     return bytes_read;
@@ -7574,9 +10312,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceMultisamplePropertiesEXT(const u
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &samples);
     bytes_read += pMultisampleProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceMultisamplePropertiesEXT)(physicalDevice, samples, &pMultisampleProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceMultisamplePropertiesEXT(physicalDevice, samples, &pMultisampleProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceMultisamplePropertiesEXT(physicalDevice, samples, &pMultisampleProperties);
+        }
     }
 
     return bytes_read;
@@ -7596,9 +10342,17 @@ size_t VulkanDecoder::Decode_vkGetImageDrmFormatModifierPropertiesEXT(const uint
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetImageDrmFormatModifierPropertiesEXT(return_value, device, image, &pProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetImageDrmFormatModifierPropertiesEXT)(return_value, device, image, &pProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetImageDrmFormatModifierPropertiesEXT(return_value, device, image, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -7620,9 +10374,17 @@ size_t VulkanDecoder::Decode_vkCreateValidationCacheEXT(const uint8_t* parameter
     bytes_read += pValidationCache.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateValidationCacheEXT)(return_value, device, &pCreateInfo, &pAllocator, &pValidationCache);
+    }
+    else
     {
-        consumer->Process_vkCreateValidationCacheEXT(return_value, device, &pCreateInfo, &pAllocator, &pValidationCache);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateValidationCacheEXT(return_value, device, &pCreateInfo, &pAllocator, &pValidationCache);
+        }
     }
 
     return bytes_read;
@@ -7640,9 +10402,17 @@ size_t VulkanDecoder::Decode_vkDestroyValidationCacheEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &validationCache);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkDestroyValidationCacheEXT(device, validationCache, &pAllocator);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyValidationCacheEXT)(device, validationCache, &pAllocator);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyValidationCacheEXT(device, validationCache, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -7664,9 +10434,17 @@ size_t VulkanDecoder::Decode_vkMergeValidationCachesEXT(const uint8_t* parameter
     bytes_read += pSrcCaches.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkMergeValidationCachesEXT)(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+    }
+    else
     {
-        consumer->Process_vkMergeValidationCachesEXT(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkMergeValidationCachesEXT(return_value, device, dstCache, srcCacheCount, &pSrcCaches);
+        }
     }
 
     return bytes_read;
@@ -7688,9 +10466,17 @@ size_t VulkanDecoder::Decode_vkGetValidationCacheDataEXT(const uint8_t* paramete
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetValidationCacheDataEXT(return_value, device, validationCache, &pDataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetValidationCacheDataEXT)(return_value, device, validationCache, &pDataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetValidationCacheDataEXT(return_value, device, validationCache, &pDataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -7708,9 +10494,17 @@ size_t VulkanDecoder::Decode_vkCmdBindShadingRateImageNV(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageView);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageLayout);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindShadingRateImageNV)(commandBuffer, imageView, imageLayout);
+    }
+    else
     {
-        consumer->Process_vkCmdBindShadingRateImageNV(commandBuffer, imageView, imageLayout);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindShadingRateImageNV(commandBuffer, imageView, imageLayout);
+        }
     }
 
     return bytes_read;
@@ -7730,9 +10524,17 @@ size_t VulkanDecoder::Decode_vkCmdSetViewportShadingRatePaletteNV(const uint8_t*
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &viewportCount);
     bytes_read += pShadingRatePalettes.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetViewportShadingRatePaletteNV(commandBuffer, firstViewport, viewportCount, &pShadingRatePalettes);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetViewportShadingRatePaletteNV)(commandBuffer, firstViewport, viewportCount, &pShadingRatePalettes);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetViewportShadingRatePaletteNV(commandBuffer, firstViewport, viewportCount, &pShadingRatePalettes);
+        }
     }
 
     return bytes_read;
@@ -7752,9 +10554,17 @@ size_t VulkanDecoder::Decode_vkCmdSetCoarseSampleOrderNV(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &customSampleOrderCount);
     bytes_read += pCustomSampleOrders.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetCoarseSampleOrderNV)(commandBuffer, sampleOrderType, customSampleOrderCount, &pCustomSampleOrders);
+    }
+    else
     {
-        consumer->Process_vkCmdSetCoarseSampleOrderNV(commandBuffer, sampleOrderType, customSampleOrderCount, &pCustomSampleOrders);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetCoarseSampleOrderNV(commandBuffer, sampleOrderType, customSampleOrderCount, &pCustomSampleOrders);
+        }
     }
 
     return bytes_read;
@@ -7776,9 +10586,17 @@ size_t VulkanDecoder::Decode_vkCreateAccelerationStructureNV(const uint8_t* para
     bytes_read += pAccelerationStructure.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateAccelerationStructureNV(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateAccelerationStructureNV)(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateAccelerationStructureNV(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+        }
     }
 
     return bytes_read;
@@ -7796,9 +10614,17 @@ size_t VulkanDecoder::Decode_vkDestroyAccelerationStructureNV(const uint8_t* par
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &accelerationStructure);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyAccelerationStructureNV)(device, accelerationStructure, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyAccelerationStructureNV(device, accelerationStructure, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyAccelerationStructureNV(device, accelerationStructure, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -7816,9 +10642,17 @@ size_t VulkanDecoder::Decode_vkGetAccelerationStructureMemoryRequirementsNV(cons
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetAccelerationStructureMemoryRequirementsNV(device, &pInfo, &pMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetAccelerationStructureMemoryRequirementsNV)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetAccelerationStructureMemoryRequirementsNV(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -7838,9 +10672,17 @@ size_t VulkanDecoder::Decode_vkBindAccelerationStructureMemoryNV(const uint8_t*
     bytes_read += pBindInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkBindAccelerationStructureMemoryNV)(return_value, device, bindInfoCount, &pBindInfos);
+    }
+    else
     {
-        consumer->Process_vkBindAccelerationStructureMemoryNV(return_value, device, bindInfoCount, &pBindInfos);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkBindAccelerationStructureMemoryNV(return_value, device, bindInfoCount, &pBindInfos);
+        }
     }
 
     return bytes_read;
@@ -7870,9 +10712,17 @@ size_t VulkanDecoder::Decode_vkCmdBuildAccelerationStructureNV(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &scratch);
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &scratchOffset);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBuildAccelerationStructureNV(commandBuffer, &pInfo, instanceData, instanceOffset, update, dst, src, scratch, scratchOffset);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBuildAccelerationStructureNV)(commandBuffer, &pInfo, instanceData, instanceOffset, update, dst, src, scratch, scratchOffset);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBuildAccelerationStructureNV(commandBuffer, &pInfo, instanceData, instanceOffset, update, dst, src, scratch, scratchOffset);
+        }
     }
 
     return bytes_read;
@@ -7892,9 +10742,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyAccelerationStructureNV(const uint8_t* par
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &src);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &mode);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyAccelerationStructureNV)(commandBuffer, dst, src, mode);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyAccelerationStructureNV(commandBuffer, dst, src, mode);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyAccelerationStructureNV(commandBuffer, dst, src, mode);
+        }
     }
 
     return bytes_read;
@@ -7936,9 +10794,17 @@ size_t VulkanDecoder::Decode_vkCmdTraceRaysNV(const uint8_t* parameter_buffer, s
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &height);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depth);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdTraceRaysNV(commandBuffer, raygenShaderBindingTableBuffer, raygenShaderBindingOffset, missShaderBindingTableBuffer, missShaderBindingOffset, missShaderBindingStride, hitShaderBindingTableBuffer, hitShaderBindingOffset, hitShaderBindingStride, callableShaderBindingTableBuffer, callableShaderBindingOffset, callableShaderBindingStride, width, height, depth);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdTraceRaysNV)(commandBuffer, raygenShaderBindingTableBuffer, raygenShaderBindingOffset, missShaderBindingTableBuffer, missShaderBindingOffset, missShaderBindingStride, hitShaderBindingTableBuffer, hitShaderBindingOffset, hitShaderBindingStride, callableShaderBindingTableBuffer, callableShaderBindingOffset, callableShaderBindingStride, width, height, depth);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdTraceRaysNV(commandBuffer, raygenShaderBindingTableBuffer, raygenShaderBindingOffset, missShaderBindingTableBuffer, missShaderBindingOffset, missShaderBindingStride, hitShaderBindingTableBuffer, hitShaderBindingOffset, hitShaderBindingStride, callableShaderBindingTableBuffer, callableShaderBindingOffset, callableShaderBindingStride, width, height, depth);
+        }
     }
 
     return bytes_read;
@@ -7964,9 +10830,17 @@ size_t VulkanDecoder::Decode_vkCreateRayTracingPipelinesNV(const uint8_t* parame
     bytes_read += pPipelines.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateRayTracingPipelinesNV)(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+    }
+    else
     {
-        consumer->Process_vkCreateRayTracingPipelinesNV(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateRayTracingPipelinesNV(return_value, device, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        }
     }
 
     return bytes_read;
@@ -7992,9 +10866,17 @@ size_t VulkanDecoder::Decode_vkGetRayTracingShaderGroupHandlesKHR(const uint8_t*
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetRayTracingShaderGroupHandlesKHR(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRayTracingShaderGroupHandlesKHR)(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRayTracingShaderGroupHandlesKHR(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -8020,9 +10902,17 @@ size_t VulkanDecoder::Decode_vkGetRayTracingShaderGroupHandlesNV(const uint8_t*
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRayTracingShaderGroupHandlesNV)(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+    }
+    else
     {
-        consumer->Process_vkGetRayTracingShaderGroupHandlesNV(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRayTracingShaderGroupHandlesNV(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -8044,9 +10934,17 @@ size_t VulkanDecoder::Decode_vkGetAccelerationStructureHandleNV(const uint8_t* p
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetAccelerationStructureHandleNV(return_value, device, accelerationStructure, dataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetAccelerationStructureHandleNV)(return_value, device, accelerationStructure, dataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetAccelerationStructureHandleNV(return_value, device, accelerationStructure, dataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -8070,9 +10968,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteAccelerationStructuresPropertiesNV(const
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstQuery);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteAccelerationStructuresPropertiesNV)(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+    }
+    else
     {
-        consumer->Process_vkCmdWriteAccelerationStructuresPropertiesNV(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteAccelerationStructuresPropertiesNV(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+        }
     }
 
     return bytes_read;
@@ -8092,9 +10998,17 @@ size_t VulkanDecoder::Decode_vkCompileDeferredNV(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &shader);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCompileDeferredNV(return_value, device, pipeline, shader);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCompileDeferredNV)(return_value, device, pipeline, shader);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCompileDeferredNV(return_value, device, pipeline, shader);
+        }
     }
 
     return bytes_read;
@@ -8116,9 +11030,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryHostPointerPropertiesEXT(const uint8_t*
     bytes_read += pMemoryHostPointerProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryHostPointerPropertiesEXT)(return_value, device, handleType, pHostPointer, &pMemoryHostPointerProperties);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryHostPointerPropertiesEXT(return_value, device, handleType, pHostPointer, &pMemoryHostPointerProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryHostPointerPropertiesEXT(return_value, device, handleType, pHostPointer, &pMemoryHostPointerProperties);
+        }
     }
 
     return bytes_read;
@@ -8140,9 +11062,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteBufferMarkerAMD(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &dstOffset);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &marker);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdWriteBufferMarkerAMD(commandBuffer, pipelineStage, dstBuffer, dstOffset, marker);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteBufferMarkerAMD)(commandBuffer, pipelineStage, dstBuffer, dstOffset, marker);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteBufferMarkerAMD(commandBuffer, pipelineStage, dstBuffer, dstOffset, marker);
+        }
     }
 
     return bytes_read;
@@ -8162,9 +11092,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT(cons
     bytes_read += pTimeDomains.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT)(return_value, physicalDevice, &pTimeDomainCount, &pTimeDomains);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT(return_value, physicalDevice, &pTimeDomainCount, &pTimeDomains);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT(return_value, physicalDevice, &pTimeDomainCount, &pTimeDomains);
+        }
     }
 
     return bytes_read;
@@ -8188,9 +11126,17 @@ size_t VulkanDecoder::Decode_vkGetCalibratedTimestampsEXT(const uint8_t* paramet
     bytes_read += pMaxDeviation.DecodeUInt64((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetCalibratedTimestampsEXT(return_value, device, timestampCount, &pTimestampInfos, &pTimestamps, &pMaxDeviation);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetCalibratedTimestampsEXT)(return_value, device, timestampCount, &pTimestampInfos, &pTimestamps, &pMaxDeviation);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetCalibratedTimestampsEXT(return_value, device, timestampCount, &pTimestampInfos, &pTimestamps, &pMaxDeviation);
+        }
     }
 
     return bytes_read;
@@ -8208,9 +11154,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawMeshTasksNV(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &taskCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstTask);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawMeshTasksNV)(commandBuffer, taskCount, firstTask);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawMeshTasksNV(commandBuffer, taskCount, firstTask);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawMeshTasksNV(commandBuffer, taskCount, firstTask);
+        }
     }
 
     return bytes_read;
@@ -8232,9 +11186,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawMeshTasksIndirectNV(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &drawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawMeshTasksIndirectNV(commandBuffer, buffer, offset, drawCount, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawMeshTasksIndirectNV)(commandBuffer, buffer, offset, drawCount, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawMeshTasksIndirectNV(commandBuffer, buffer, offset, drawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -8260,9 +11222,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawMeshTasksIndirectCountNV(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &maxDrawCount);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawMeshTasksIndirectCountNV)(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawMeshTasksIndirectCountNV(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawMeshTasksIndirectCountNV(commandBuffer, buffer, offset, countBuffer, countBufferOffset, maxDrawCount, stride);
+        }
     }
 
     return bytes_read;
@@ -8282,9 +11252,17 @@ size_t VulkanDecoder::Decode_vkCmdSetExclusiveScissorNV(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &exclusiveScissorCount);
     bytes_read += pExclusiveScissors.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetExclusiveScissorNV(commandBuffer, firstExclusiveScissor, exclusiveScissorCount, &pExclusiveScissors);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetExclusiveScissorNV)(commandBuffer, firstExclusiveScissor, exclusiveScissorCount, &pExclusiveScissors);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetExclusiveScissorNV(commandBuffer, firstExclusiveScissor, exclusiveScissorCount, &pExclusiveScissors);
+        }
     }
 
     return bytes_read;
@@ -8300,9 +11278,17 @@ size_t VulkanDecoder::Decode_vkCmdSetCheckpointNV(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeAddress((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pCheckpointMarker);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetCheckpointNV)(commandBuffer, pCheckpointMarker);
+    }
+    else
     {
-        consumer->Process_vkCmdSetCheckpointNV(commandBuffer, pCheckpointMarker);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetCheckpointNV(commandBuffer, pCheckpointMarker);
+        }
     }
 
     return bytes_read;
@@ -8320,9 +11306,17 @@ size_t VulkanDecoder::Decode_vkGetQueueCheckpointDataNV(const uint8_t* parameter
     bytes_read += pCheckpointDataCount.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pCheckpointData.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetQueueCheckpointDataNV(queue, &pCheckpointDataCount, &pCheckpointData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetQueueCheckpointDataNV)(queue, &pCheckpointDataCount, &pCheckpointData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetQueueCheckpointDataNV(queue, &pCheckpointDataCount, &pCheckpointData);
+        }
     }
 
     return bytes_read;
@@ -8340,9 +11334,17 @@ size_t VulkanDecoder::Decode_vkInitializePerformanceApiINTEL(const uint8_t* para
     bytes_read += pInitializeInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkInitializePerformanceApiINTEL)(return_value, device, &pInitializeInfo);
+    }
+    else
     {
-        consumer->Process_vkInitializePerformanceApiINTEL(return_value, device, &pInitializeInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkInitializePerformanceApiINTEL(return_value, device, &pInitializeInfo);
+        }
     }
 
     return bytes_read;
@@ -8356,9 +11358,17 @@ size_t VulkanDecoder::Decode_vkUninitializePerformanceApiINTEL(const uint8_t* pa
 
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &device);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkUninitializePerformanceApiINTEL(device);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkUninitializePerformanceApiINTEL)(device);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkUninitializePerformanceApiINTEL(device);
+        }
     }
 
     return bytes_read;
@@ -8376,9 +11386,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPerformanceMarkerINTEL(const uint8_t* param
     bytes_read += pMarkerInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPerformanceMarkerINTEL)(return_value, commandBuffer, &pMarkerInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdSetPerformanceMarkerINTEL(return_value, commandBuffer, &pMarkerInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPerformanceMarkerINTEL(return_value, commandBuffer, &pMarkerInfo);
+        }
     }
 
     return bytes_read;
@@ -8396,9 +11414,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPerformanceStreamMarkerINTEL(const uint8_t*
     bytes_read += pMarkerInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetPerformanceStreamMarkerINTEL(return_value, commandBuffer, &pMarkerInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPerformanceStreamMarkerINTEL)(return_value, commandBuffer, &pMarkerInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPerformanceStreamMarkerINTEL(return_value, commandBuffer, &pMarkerInfo);
+        }
     }
 
     return bytes_read;
@@ -8416,9 +11442,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPerformanceOverrideINTEL(const uint8_t* par
     bytes_read += pOverrideInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPerformanceOverrideINTEL)(return_value, commandBuffer, &pOverrideInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdSetPerformanceOverrideINTEL(return_value, commandBuffer, &pOverrideInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPerformanceOverrideINTEL(return_value, commandBuffer, &pOverrideInfo);
+        }
     }
 
     return bytes_read;
@@ -8438,9 +11472,17 @@ size_t VulkanDecoder::Decode_vkAcquirePerformanceConfigurationINTEL(const uint8_
     bytes_read += pConfiguration.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquirePerformanceConfigurationINTEL(return_value, device, &pAcquireInfo, &pConfiguration);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquirePerformanceConfigurationINTEL)(return_value, device, &pAcquireInfo, &pConfiguration);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquirePerformanceConfigurationINTEL(return_value, device, &pAcquireInfo, &pConfiguration);
+        }
     }
 
     return bytes_read;
@@ -8458,9 +11500,17 @@ size_t VulkanDecoder::Decode_vkReleasePerformanceConfigurationINTEL(const uint8_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &configuration);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkReleasePerformanceConfigurationINTEL)(return_value, device, configuration);
+    }
+    else
     {
-        consumer->Process_vkReleasePerformanceConfigurationINTEL(return_value, device, configuration);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkReleasePerformanceConfigurationINTEL(return_value, device, configuration);
+        }
     }
 
     return bytes_read;
@@ -8478,9 +11528,17 @@ size_t VulkanDecoder::Decode_vkQueueSetPerformanceConfigurationINTEL(const uint8
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &configuration);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkQueueSetPerformanceConfigurationINTEL(return_value, queue, configuration);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkQueueSetPerformanceConfigurationINTEL)(return_value, queue, configuration);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkQueueSetPerformanceConfigurationINTEL(return_value, queue, configuration);
+        }
     }
 
     return bytes_read;
@@ -8500,9 +11558,17 @@ size_t VulkanDecoder::Decode_vkGetPerformanceParameterINTEL(const uint8_t* param
     bytes_read += pValue.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPerformanceParameterINTEL)(return_value, device, parameter, &pValue);
+    }
+    else
     {
-        consumer->Process_vkGetPerformanceParameterINTEL(return_value, device, parameter, &pValue);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPerformanceParameterINTEL(return_value, device, parameter, &pValue);
+        }
     }
 
     return bytes_read;
@@ -8520,9 +11586,17 @@ size_t VulkanDecoder::Decode_vkSetLocalDimmingAMD(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &swapChain);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &localDimmingEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkSetLocalDimmingAMD(device, swapChain, localDimmingEnable);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetLocalDimmingAMD)(device, swapChain, localDimmingEnable);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetLocalDimmingAMD(device, swapChain, localDimmingEnable);
+        }
     }
 
     return bytes_read;
@@ -8544,9 +11618,17 @@ size_t VulkanDecoder::Decode_vkCreateImagePipeSurfaceFUCHSIA(const uint8_t* para
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateImagePipeSurfaceFUCHSIA)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateImagePipeSurfaceFUCHSIA(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateImagePipeSurfaceFUCHSIA(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -8568,9 +11650,17 @@ size_t VulkanDecoder::Decode_vkCreateMetalSurfaceEXT(const uint8_t* parameter_bu
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateMetalSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateMetalSurfaceEXT)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateMetalSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -8588,9 +11678,17 @@ size_t VulkanDecoder::Decode_vkGetBufferDeviceAddressEXT(const uint8_t* paramete
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeVkDeviceAddressValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetBufferDeviceAddressEXT)(return_value, device, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkGetBufferDeviceAddressEXT(return_value, device, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetBufferDeviceAddressEXT(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -8610,9 +11708,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceToolPropertiesEXT(const uint8_t*
     bytes_read += pToolProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceToolPropertiesEXT(return_value, physicalDevice, &pToolCount, &pToolProperties);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceToolPropertiesEXT)(return_value, physicalDevice, &pToolCount, &pToolProperties);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceToolPropertiesEXT(return_value, physicalDevice, &pToolCount, &pToolProperties);
+        }
     }
 
     return bytes_read;
@@ -8632,9 +11738,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(co
     bytes_read += pProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV)(return_value, physicalDevice, &pPropertyCount, &pProperties);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(return_value, physicalDevice, &pPropertyCount, &pProperties);
+        }
     }
 
     return bytes_read;
@@ -8654,9 +11768,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSupportedFramebufferMixedSamples
     bytes_read += pCombinations.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(return_value, physicalDevice, &pCombinationCount, &pCombinations);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV)(return_value, physicalDevice, &pCombinationCount, &pCombinations);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(return_value, physicalDevice, &pCombinationCount, &pCombinations);
+        }
     }
 
     return bytes_read;
@@ -8678,9 +11800,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceSurfacePresentModes2EXT(const ui
     bytes_read += pPresentModes.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceSurfacePresentModes2EXT)(return_value, physicalDevice, &pSurfaceInfo, &pPresentModeCount, &pPresentModes);
+    }
+    else
     {
-        consumer->Process_vkGetPhysicalDeviceSurfacePresentModes2EXT(return_value, physicalDevice, &pSurfaceInfo, &pPresentModeCount, &pPresentModes);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceSurfacePresentModes2EXT(return_value, physicalDevice, &pSurfaceInfo, &pPresentModeCount, &pPresentModes);
+        }
     }
 
     return bytes_read;
@@ -8698,9 +11828,17 @@ size_t VulkanDecoder::Decode_vkAcquireFullScreenExclusiveModeEXT(const uint8_t*
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &swapchain);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquireFullScreenExclusiveModeEXT(return_value, device, swapchain);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireFullScreenExclusiveModeEXT)(return_value, device, swapchain);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireFullScreenExclusiveModeEXT(return_value, device, swapchain);
+        }
     }
 
     return bytes_read;
@@ -8718,9 +11856,17 @@ size_t VulkanDecoder::Decode_vkReleaseFullScreenExclusiveModeEXT(const uint8_t*
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &swapchain);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkReleaseFullScreenExclusiveModeEXT)(return_value, device, swapchain);
+    }
+    else
     {
-        consumer->Process_vkReleaseFullScreenExclusiveModeEXT(return_value, device, swapchain);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkReleaseFullScreenExclusiveModeEXT(return_value, device, swapchain);
+        }
     }
 
     return bytes_read;
@@ -8740,9 +11886,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceGroupSurfacePresentModes2EXT(const uint8
     bytes_read += pModes.DecodeFlags((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeviceGroupSurfacePresentModes2EXT(return_value, device, &pSurfaceInfo, &pModes);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceGroupSurfacePresentModes2EXT)(return_value, device, &pSurfaceInfo, &pModes);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceGroupSurfacePresentModes2EXT(return_value, device, &pSurfaceInfo, &pModes);
+        }
     }
 
     return bytes_read;
@@ -8764,9 +11918,17 @@ size_t VulkanDecoder::Decode_vkCreateHeadlessSurfaceEXT(const uint8_t* parameter
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateHeadlessSurfaceEXT)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateHeadlessSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateHeadlessSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -8784,9 +11946,17 @@ size_t VulkanDecoder::Decode_vkCmdSetLineStippleEXT(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &lineStippleFactor);
     bytes_read += ValueDecoder::DecodeUInt16Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &lineStipplePattern);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetLineStippleEXT(commandBuffer, lineStippleFactor, lineStipplePattern);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetLineStippleEXT)(commandBuffer, lineStippleFactor, lineStipplePattern);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetLineStippleEXT(commandBuffer, lineStippleFactor, lineStipplePattern);
+        }
     }
 
     return bytes_read;
@@ -8806,9 +11976,17 @@ size_t VulkanDecoder::Decode_vkResetQueryPoolEXT(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstQuery);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryCount);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkResetQueryPoolEXT)(device, queryPool, firstQuery, queryCount);
+    }
+    else
     {
-        consumer->Process_vkResetQueryPoolEXT(device, queryPool, firstQuery, queryCount);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkResetQueryPoolEXT(device, queryPool, firstQuery, queryCount);
+        }
     }
 
     return bytes_read;
@@ -8824,9 +12002,17 @@ size_t VulkanDecoder::Decode_vkCmdSetCullModeEXT(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeFlagsValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &cullMode);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetCullModeEXT(commandBuffer, cullMode);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetCullModeEXT)(commandBuffer, cullMode);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetCullModeEXT(commandBuffer, cullMode);
+        }
     }
 
     return bytes_read;
@@ -8842,9 +12028,17 @@ size_t VulkanDecoder::Decode_vkCmdSetFrontFaceEXT(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &frontFace);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetFrontFaceEXT)(commandBuffer, frontFace);
+    }
+    else
     {
-        consumer->Process_vkCmdSetFrontFaceEXT(commandBuffer, frontFace);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetFrontFaceEXT(commandBuffer, frontFace);
+        }
     }
 
     return bytes_read;
@@ -8860,9 +12054,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPrimitiveTopologyEXT(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &primitiveTopology);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetPrimitiveTopologyEXT(commandBuffer, primitiveTopology);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPrimitiveTopologyEXT)(commandBuffer, primitiveTopology);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPrimitiveTopologyEXT(commandBuffer, primitiveTopology);
+        }
     }
 
     return bytes_read;
@@ -8880,9 +12082,17 @@ size_t VulkanDecoder::Decode_vkCmdSetViewportWithCountEXT(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &viewportCount);
     bytes_read += pViewports.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetViewportWithCountEXT)(commandBuffer, viewportCount, &pViewports);
+    }
+    else
     {
-        consumer->Process_vkCmdSetViewportWithCountEXT(commandBuffer, viewportCount, &pViewports);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetViewportWithCountEXT(commandBuffer, viewportCount, &pViewports);
+        }
     }
 
     return bytes_read;
@@ -8900,9 +12110,17 @@ size_t VulkanDecoder::Decode_vkCmdSetScissorWithCountEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &scissorCount);
     bytes_read += pScissors.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetScissorWithCountEXT(commandBuffer, scissorCount, &pScissors);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetScissorWithCountEXT)(commandBuffer, scissorCount, &pScissors);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetScissorWithCountEXT(commandBuffer, scissorCount, &pScissors);
+        }
     }
 
     return bytes_read;
@@ -8928,9 +12146,17 @@ size_t VulkanDecoder::Decode_vkCmdBindVertexBuffers2EXT(const uint8_t* parameter
     bytes_read += pSizes.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pStrides.DecodeVkDeviceSize((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindVertexBuffers2EXT)(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes, &pStrides);
+    }
+    else
     {
-        consumer->Process_vkCmdBindVertexBuffers2EXT(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes, &pStrides);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindVertexBuffers2EXT(commandBuffer, firstBinding, bindingCount, &pBuffers, &pOffsets, &pSizes, &pStrides);
+        }
     }
 
     return bytes_read;
@@ -8946,9 +12172,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthTestEnableEXT(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthTestEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDepthTestEnableEXT(commandBuffer, depthTestEnable);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthTestEnableEXT)(commandBuffer, depthTestEnable);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthTestEnableEXT(commandBuffer, depthTestEnable);
+        }
     }
 
     return bytes_read;
@@ -8964,9 +12198,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthWriteEnableEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthWriteEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthWriteEnableEXT)(commandBuffer, depthWriteEnable);
+    }
+    else
     {
-        consumer->Process_vkCmdSetDepthWriteEnableEXT(commandBuffer, depthWriteEnable);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthWriteEnableEXT(commandBuffer, depthWriteEnable);
+        }
     }
 
     return bytes_read;
@@ -8982,9 +12224,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthCompareOpEXT(const uint8_t* parameter_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthCompareOp);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDepthCompareOpEXT(commandBuffer, depthCompareOp);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthCompareOpEXT)(commandBuffer, depthCompareOp);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthCompareOpEXT(commandBuffer, depthCompareOp);
+        }
     }
 
     return bytes_read;
@@ -9000,9 +12250,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthBoundsTestEnableEXT(const uint8_t* par
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthBoundsTestEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthBoundsTestEnableEXT)(commandBuffer, depthBoundsTestEnable);
+    }
+    else
     {
-        consumer->Process_vkCmdSetDepthBoundsTestEnableEXT(commandBuffer, depthBoundsTestEnable);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthBoundsTestEnableEXT(commandBuffer, depthBoundsTestEnable);
+        }
     }
 
     return bytes_read;
@@ -9018,9 +12276,17 @@ size_t VulkanDecoder::Decode_vkCmdSetStencilTestEnableEXT(const uint8_t* paramet
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stencilTestEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetStencilTestEnableEXT(commandBuffer, stencilTestEnable);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetStencilTestEnableEXT)(commandBuffer, stencilTestEnable);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetStencilTestEnableEXT(commandBuffer, stencilTestEnable);
+        }
     }
 
     return bytes_read;
@@ -9044,9 +12310,17 @@ size_t VulkanDecoder::Decode_vkCmdSetStencilOpEXT(const uint8_t* parameter_buffe
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthFailOp);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &compareOp);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetStencilOpEXT)(commandBuffer, faceMask, failOp, passOp, depthFailOp, compareOp);
+    }
+    else
     {
-        consumer->Process_vkCmdSetStencilOpEXT(commandBuffer, faceMask, failOp, passOp, depthFailOp, compareOp);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetStencilOpEXT(commandBuffer, faceMask, failOp, passOp, depthFailOp, compareOp);
+        }
     }
 
     return bytes_read;
@@ -9064,9 +12338,17 @@ size_t VulkanDecoder::Decode_vkGetGeneratedCommandsMemoryRequirementsNV(const ui
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pMemoryRequirements.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetGeneratedCommandsMemoryRequirementsNV(device, &pInfo, &pMemoryRequirements);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetGeneratedCommandsMemoryRequirementsNV)(device, &pInfo, &pMemoryRequirements);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetGeneratedCommandsMemoryRequirementsNV(device, &pInfo, &pMemoryRequirements);
+        }
     }
 
     return bytes_read;
@@ -9082,9 +12364,17 @@ size_t VulkanDecoder::Decode_vkCmdPreprocessGeneratedCommandsNV(const uint8_t* p
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pGeneratedCommandsInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdPreprocessGeneratedCommandsNV)(commandBuffer, &pGeneratedCommandsInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdPreprocessGeneratedCommandsNV(commandBuffer, &pGeneratedCommandsInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdPreprocessGeneratedCommandsNV(commandBuffer, &pGeneratedCommandsInfo);
+        }
     }
 
     return bytes_read;
@@ -9102,9 +12392,17 @@ size_t VulkanDecoder::Decode_vkCmdExecuteGeneratedCommandsNV(const uint8_t* para
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &isPreprocessed);
     bytes_read += pGeneratedCommandsInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdExecuteGeneratedCommandsNV(commandBuffer, isPreprocessed, &pGeneratedCommandsInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdExecuteGeneratedCommandsNV)(commandBuffer, isPreprocessed, &pGeneratedCommandsInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdExecuteGeneratedCommandsNV(commandBuffer, isPreprocessed, &pGeneratedCommandsInfo);
+        }
     }
 
     return bytes_read;
@@ -9124,9 +12422,17 @@ size_t VulkanDecoder::Decode_vkCmdBindPipelineShaderGroupNV(const uint8_t* param
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipeline);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupIndex);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindPipelineShaderGroupNV)(commandBuffer, pipelineBindPoint, pipeline, groupIndex);
+    }
+    else
     {
-        consumer->Process_vkCmdBindPipelineShaderGroupNV(commandBuffer, pipelineBindPoint, pipeline, groupIndex);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindPipelineShaderGroupNV(commandBuffer, pipelineBindPoint, pipeline, groupIndex);
+        }
     }
 
     return bytes_read;
@@ -9148,9 +12454,17 @@ size_t VulkanDecoder::Decode_vkCreateIndirectCommandsLayoutNV(const uint8_t* par
     bytes_read += pIndirectCommandsLayout.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateIndirectCommandsLayoutNV(return_value, device, &pCreateInfo, &pAllocator, &pIndirectCommandsLayout);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateIndirectCommandsLayoutNV)(return_value, device, &pCreateInfo, &pAllocator, &pIndirectCommandsLayout);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateIndirectCommandsLayoutNV(return_value, device, &pCreateInfo, &pAllocator, &pIndirectCommandsLayout);
+        }
     }
 
     return bytes_read;
@@ -9168,9 +12482,17 @@ size_t VulkanDecoder::Decode_vkDestroyIndirectCommandsLayoutNV(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &indirectCommandsLayout);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyIndirectCommandsLayoutNV)(device, indirectCommandsLayout, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyIndirectCommandsLayoutNV(device, indirectCommandsLayout, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyIndirectCommandsLayoutNV(device, indirectCommandsLayout, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -9190,9 +12512,17 @@ size_t VulkanDecoder::Decode_vkAcquireDrmDisplayEXT(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &display);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkAcquireDrmDisplayEXT(return_value, physicalDevice, drmFd, display);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireDrmDisplayEXT)(return_value, physicalDevice, drmFd, display);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireDrmDisplayEXT(return_value, physicalDevice, drmFd, display);
+        }
     }
 
     return bytes_read;
@@ -9214,9 +12544,17 @@ size_t VulkanDecoder::Decode_vkGetDrmDisplayEXT(const uint8_t* parameter_buffer,
     bytes_read += display.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDrmDisplayEXT)(return_value, physicalDevice, drmFd, connectorId, &display);
+    }
+    else
     {
-        consumer->Process_vkGetDrmDisplayEXT(return_value, physicalDevice, drmFd, connectorId, &display);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDrmDisplayEXT(return_value, physicalDevice, drmFd, connectorId, &display);
+        }
     }
 
     return bytes_read;
@@ -9238,9 +12576,17 @@ size_t VulkanDecoder::Decode_vkCreatePrivateDataSlotEXT(const uint8_t* parameter
     bytes_read += pPrivateDataSlot.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreatePrivateDataSlotEXT(return_value, device, &pCreateInfo, &pAllocator, &pPrivateDataSlot);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreatePrivateDataSlotEXT)(return_value, device, &pCreateInfo, &pAllocator, &pPrivateDataSlot);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreatePrivateDataSlotEXT(return_value, device, &pCreateInfo, &pAllocator, &pPrivateDataSlot);
+        }
     }
 
     return bytes_read;
@@ -9258,9 +12604,17 @@ size_t VulkanDecoder::Decode_vkDestroyPrivateDataSlotEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &privateDataSlot);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyPrivateDataSlotEXT)(device, privateDataSlot, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyPrivateDataSlotEXT(device, privateDataSlot, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyPrivateDataSlotEXT(device, privateDataSlot, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -9284,9 +12638,17 @@ size_t VulkanDecoder::Decode_vkSetPrivateDataEXT(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeUInt64Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &data);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkSetPrivateDataEXT(return_value, device, objectType, objectHandle, privateDataSlot, data);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkSetPrivateDataEXT)(return_value, device, objectType, objectHandle, privateDataSlot, data);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkSetPrivateDataEXT(return_value, device, objectType, objectHandle, privateDataSlot, data);
+        }
     }
 
     return bytes_read;
@@ -9308,9 +12670,17 @@ size_t VulkanDecoder::Decode_vkGetPrivateDataEXT(const uint8_t* parameter_buffer
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &privateDataSlot);
     bytes_read += pData.DecodeUInt64((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPrivateDataEXT)(device, objectType, objectHandle, privateDataSlot, &pData);
+    }
+    else
     {
-        consumer->Process_vkGetPrivateDataEXT(device, objectType, objectHandle, privateDataSlot, &pData);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPrivateDataEXT(device, objectType, objectHandle, privateDataSlot, &pData);
+        }
     }
 
     return bytes_read;
@@ -9328,9 +12698,17 @@ size_t VulkanDecoder::Decode_vkCmdSetFragmentShadingRateEnumNV(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &shadingRate);
     bytes_read += combinerOps.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetFragmentShadingRateEnumNV(commandBuffer, shadingRate, &combinerOps);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetFragmentShadingRateEnumNV)(commandBuffer, shadingRate, &combinerOps);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetFragmentShadingRateEnumNV(commandBuffer, shadingRate, &combinerOps);
+        }
     }
 
     return bytes_read;
@@ -9348,9 +12726,17 @@ size_t VulkanDecoder::Decode_vkAcquireWinrtDisplayNV(const uint8_t* parameter_bu
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &display);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkAcquireWinrtDisplayNV)(return_value, physicalDevice, display);
+    }
+    else
     {
-        consumer->Process_vkAcquireWinrtDisplayNV(return_value, physicalDevice, display);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkAcquireWinrtDisplayNV(return_value, physicalDevice, display);
+        }
     }
 
     return bytes_read;
@@ -9370,9 +12756,17 @@ size_t VulkanDecoder::Decode_vkGetWinrtDisplayNV(const uint8_t* parameter_buffer
     bytes_read += pDisplay.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetWinrtDisplayNV(return_value, physicalDevice, deviceRelativeId, &pDisplay);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetWinrtDisplayNV)(return_value, physicalDevice, deviceRelativeId, &pDisplay);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetWinrtDisplayNV(return_value, physicalDevice, deviceRelativeId, &pDisplay);
+        }
     }
 
     return bytes_read;
@@ -9394,9 +12788,17 @@ size_t VulkanDecoder::Decode_vkCreateDirectFBSurfaceEXT(const uint8_t* parameter
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateDirectFBSurfaceEXT)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateDirectFBSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateDirectFBSurfaceEXT(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -9416,9 +12818,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(c
     bytes_read += ValueDecoder::DecodeAddress((parameter_buffer + bytes_read), (buffer_size - bytes_read), &dfb);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(return_value, physicalDevice, queueFamilyIndex, dfb);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT)(return_value, physicalDevice, queueFamilyIndex, dfb);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(return_value, physicalDevice, queueFamilyIndex, dfb);
+        }
     }
 
     return bytes_read;
@@ -9440,9 +12850,17 @@ size_t VulkanDecoder::Decode_vkCmdSetVertexInputEXT(const uint8_t* parameter_buf
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &vertexAttributeDescriptionCount);
     bytes_read += pVertexAttributeDescriptions.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetVertexInputEXT)(commandBuffer, vertexBindingDescriptionCount, &pVertexBindingDescriptions, vertexAttributeDescriptionCount, &pVertexAttributeDescriptions);
+    }
+    else
     {
-        consumer->Process_vkCmdSetVertexInputEXT(commandBuffer, vertexBindingDescriptionCount, &pVertexBindingDescriptions, vertexAttributeDescriptionCount, &pVertexAttributeDescriptions);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetVertexInputEXT(commandBuffer, vertexBindingDescriptionCount, &pVertexBindingDescriptions, vertexAttributeDescriptionCount, &pVertexAttributeDescriptions);
+        }
     }
 
     return bytes_read;
@@ -9462,9 +12880,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryZirconHandleFUCHSIA(const uint8_t* param
     bytes_read += pZirconHandle.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetMemoryZirconHandleFUCHSIA(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryZirconHandleFUCHSIA)(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryZirconHandleFUCHSIA(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+        }
     }
 
     return bytes_read;
@@ -9486,9 +12912,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryZirconHandlePropertiesFUCHSIA(const uint
     bytes_read += pMemoryZirconHandleProperties.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryZirconHandlePropertiesFUCHSIA)(return_value, device, handleType, zirconHandle, &pMemoryZirconHandleProperties);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryZirconHandlePropertiesFUCHSIA(return_value, device, handleType, zirconHandle, &pMemoryZirconHandleProperties);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryZirconHandlePropertiesFUCHSIA(return_value, device, handleType, zirconHandle, &pMemoryZirconHandleProperties);
+        }
     }
 
     return bytes_read;
@@ -9506,9 +12940,17 @@ size_t VulkanDecoder::Decode_vkImportSemaphoreZirconHandleFUCHSIA(const uint8_t*
     bytes_read += pImportSemaphoreZirconHandleInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkImportSemaphoreZirconHandleFUCHSIA(return_value, device, &pImportSemaphoreZirconHandleInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkImportSemaphoreZirconHandleFUCHSIA)(return_value, device, &pImportSemaphoreZirconHandleInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkImportSemaphoreZirconHandleFUCHSIA(return_value, device, &pImportSemaphoreZirconHandleInfo);
+        }
     }
 
     return bytes_read;
@@ -9528,9 +12970,17 @@ size_t VulkanDecoder::Decode_vkGetSemaphoreZirconHandleFUCHSIA(const uint8_t* pa
     bytes_read += pZirconHandle.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetSemaphoreZirconHandleFUCHSIA)(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+    }
+    else
     {
-        consumer->Process_vkGetSemaphoreZirconHandleFUCHSIA(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetSemaphoreZirconHandleFUCHSIA(return_value, device, &pGetZirconHandleInfo, &pZirconHandle);
+        }
     }
 
     return bytes_read;
@@ -9548,9 +12998,17 @@ size_t VulkanDecoder::Decode_vkCmdBindInvocationMaskHUAWEI(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageView);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &imageLayout);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBindInvocationMaskHUAWEI(commandBuffer, imageView, imageLayout);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBindInvocationMaskHUAWEI)(commandBuffer, imageView, imageLayout);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBindInvocationMaskHUAWEI(commandBuffer, imageView, imageLayout);
+        }
     }
 
     return bytes_read;
@@ -9570,9 +13028,17 @@ size_t VulkanDecoder::Decode_vkGetMemoryRemoteAddressNV(const uint8_t* parameter
     bytes_read += pAddress.DecodeVoidPtr((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetMemoryRemoteAddressNV)(return_value, device, &pMemoryGetRemoteAddressInfo, &pAddress);
+    }
+    else
     {
-        consumer->Process_vkGetMemoryRemoteAddressNV(return_value, device, &pMemoryGetRemoteAddressInfo, &pAddress);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetMemoryRemoteAddressNV(return_value, device, &pMemoryGetRemoteAddressInfo, &pAddress);
+        }
     }
 
     return bytes_read;
@@ -9588,9 +13054,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPatchControlPointsEXT(const uint8_t* parame
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &patchControlPoints);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetPatchControlPointsEXT(commandBuffer, patchControlPoints);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPatchControlPointsEXT)(commandBuffer, patchControlPoints);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPatchControlPointsEXT(commandBuffer, patchControlPoints);
+        }
     }
 
     return bytes_read;
@@ -9606,9 +13080,17 @@ size_t VulkanDecoder::Decode_vkCmdSetRasterizerDiscardEnableEXT(const uint8_t* p
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &rasterizerDiscardEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetRasterizerDiscardEnableEXT)(commandBuffer, rasterizerDiscardEnable);
+    }
+    else
     {
-        consumer->Process_vkCmdSetRasterizerDiscardEnableEXT(commandBuffer, rasterizerDiscardEnable);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetRasterizerDiscardEnableEXT(commandBuffer, rasterizerDiscardEnable);
+        }
     }
 
     return bytes_read;
@@ -9624,9 +13106,17 @@ size_t VulkanDecoder::Decode_vkCmdSetDepthBiasEnableEXT(const uint8_t* parameter
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depthBiasEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetDepthBiasEnableEXT(commandBuffer, depthBiasEnable);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetDepthBiasEnableEXT)(commandBuffer, depthBiasEnable);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetDepthBiasEnableEXT(commandBuffer, depthBiasEnable);
+        }
     }
 
     return bytes_read;
@@ -9642,9 +13132,17 @@ size_t VulkanDecoder::Decode_vkCmdSetLogicOpEXT(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &logicOp);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetLogicOpEXT)(commandBuffer, logicOp);
+    }
+    else
     {
-        consumer->Process_vkCmdSetLogicOpEXT(commandBuffer, logicOp);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetLogicOpEXT(commandBuffer, logicOp);
+        }
     }
 
     return bytes_read;
@@ -9660,9 +13158,17 @@ size_t VulkanDecoder::Decode_vkCmdSetPrimitiveRestartEnableEXT(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &primitiveRestartEnable);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdSetPrimitiveRestartEnableEXT(commandBuffer, primitiveRestartEnable);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetPrimitiveRestartEnableEXT)(commandBuffer, primitiveRestartEnable);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetPrimitiveRestartEnableEXT(commandBuffer, primitiveRestartEnable);
+        }
     }
 
     return bytes_read;
@@ -9684,9 +13190,17 @@ size_t VulkanDecoder::Decode_vkCreateScreenSurfaceQNX(const uint8_t* parameter_b
     bytes_read += pSurface.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateScreenSurfaceQNX)(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+    }
+    else
     {
-        consumer->Process_vkCreateScreenSurfaceQNX(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateScreenSurfaceQNX(return_value, instance, &pCreateInfo, &pAllocator, &pSurface);
+        }
     }
 
     return bytes_read;
@@ -9706,9 +13220,17 @@ size_t VulkanDecoder::Decode_vkGetPhysicalDeviceScreenPresentationSupportQNX(con
     bytes_read += ValueDecoder::DecodeAddress((parameter_buffer + bytes_read), (buffer_size - bytes_read), &window);
     bytes_read += ValueDecoder::DecodeVkBool32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetPhysicalDeviceScreenPresentationSupportQNX(return_value, physicalDevice, queueFamilyIndex, window);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetPhysicalDeviceScreenPresentationSupportQNX)(return_value, physicalDevice, queueFamilyIndex, window);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetPhysicalDeviceScreenPresentationSupportQNX(return_value, physicalDevice, queueFamilyIndex, window);
+        }
     }
 
     return bytes_read;
@@ -9726,9 +13248,17 @@ size_t VulkanDecoder::Decode_vkCmdSetColorWriteEnableEXT(const uint8_t* paramete
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &attachmentCount);
     bytes_read += pColorWriteEnables.DecodeVkBool32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetColorWriteEnableEXT)(commandBuffer, attachmentCount, &pColorWriteEnables);
+    }
+    else
     {
-        consumer->Process_vkCmdSetColorWriteEnableEXT(commandBuffer, attachmentCount, &pColorWriteEnables);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetColorWriteEnableEXT(commandBuffer, attachmentCount, &pColorWriteEnables);
+        }
     }
 
     return bytes_read;
@@ -9752,9 +13282,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawMultiEXT(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstInstance);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdDrawMultiEXT(commandBuffer, drawCount, &pVertexInfo, instanceCount, firstInstance, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawMultiEXT)(commandBuffer, drawCount, &pVertexInfo, instanceCount, firstInstance, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawMultiEXT(commandBuffer, drawCount, &pVertexInfo, instanceCount, firstInstance, stride);
+        }
     }
 
     return bytes_read;
@@ -9780,9 +13318,17 @@ size_t VulkanDecoder::Decode_vkCmdDrawMultiIndexedEXT(const uint8_t* parameter_b
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
     bytes_read += pVertexOffset.DecodeInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdDrawMultiIndexedEXT)(commandBuffer, drawCount, &pIndexInfo, instanceCount, firstInstance, stride, &pVertexOffset);
+    }
+    else
     {
-        consumer->Process_vkCmdDrawMultiIndexedEXT(commandBuffer, drawCount, &pIndexInfo, instanceCount, firstInstance, stride, &pVertexOffset);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdDrawMultiIndexedEXT(commandBuffer, drawCount, &pIndexInfo, instanceCount, firstInstance, stride, &pVertexOffset);
+        }
     }
 
     return bytes_read;
@@ -9804,9 +13350,17 @@ size_t VulkanDecoder::Decode_vkCreateAccelerationStructureKHR(const uint8_t* par
     bytes_read += pAccelerationStructure.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCreateAccelerationStructureKHR(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateAccelerationStructureKHR)(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateAccelerationStructureKHR(return_value, device, &pCreateInfo, &pAllocator, &pAccelerationStructure);
+        }
     }
 
     return bytes_read;
@@ -9824,9 +13378,17 @@ size_t VulkanDecoder::Decode_vkDestroyAccelerationStructureKHR(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &accelerationStructure);
     bytes_read += pAllocator.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkDestroyAccelerationStructureKHR)(device, accelerationStructure, &pAllocator);
+    }
+    else
     {
-        consumer->Process_vkDestroyAccelerationStructureKHR(device, accelerationStructure, &pAllocator);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkDestroyAccelerationStructureKHR(device, accelerationStructure, &pAllocator);
+        }
     }
 
     return bytes_read;
@@ -9846,9 +13408,17 @@ size_t VulkanDecoder::Decode_vkCmdBuildAccelerationStructuresKHR(const uint8_t*
     bytes_read += pInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ppBuildRangeInfos.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdBuildAccelerationStructuresKHR(commandBuffer, infoCount, &pInfos, &ppBuildRangeInfos);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBuildAccelerationStructuresKHR)(commandBuffer, infoCount, &pInfos, &ppBuildRangeInfos);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBuildAccelerationStructuresKHR(commandBuffer, infoCount, &pInfos, &ppBuildRangeInfos);
+        }
     }
 
     return bytes_read;
@@ -9872,9 +13442,17 @@ size_t VulkanDecoder::Decode_vkCmdBuildAccelerationStructuresIndirectKHR(const u
     bytes_read += pIndirectStrides.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ppMaxPrimitiveCounts.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdBuildAccelerationStructuresIndirectKHR)(commandBuffer, infoCount, &pInfos, &pIndirectDeviceAddresses, &pIndirectStrides, &ppMaxPrimitiveCounts);
+    }
+    else
     {
-        consumer->Process_vkCmdBuildAccelerationStructuresIndirectKHR(commandBuffer, infoCount, &pInfos, &pIndirectDeviceAddresses, &pIndirectStrides, &ppMaxPrimitiveCounts);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdBuildAccelerationStructuresIndirectKHR(commandBuffer, infoCount, &pInfos, &pIndirectDeviceAddresses, &pIndirectStrides, &ppMaxPrimitiveCounts);
+        }
     }
 
     return bytes_read;
@@ -9894,9 +13472,17 @@ size_t VulkanDecoder::Decode_vkCopyAccelerationStructureToMemoryKHR(const uint8_
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCopyAccelerationStructureToMemoryKHR(return_value, device, deferredOperation, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCopyAccelerationStructureToMemoryKHR)(return_value, device, deferredOperation, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCopyAccelerationStructureToMemoryKHR(return_value, device, deferredOperation, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -9916,9 +13502,17 @@ size_t VulkanDecoder::Decode_vkCopyMemoryToAccelerationStructureKHR(const uint8_
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCopyMemoryToAccelerationStructureKHR)(return_value, device, deferredOperation, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkCopyMemoryToAccelerationStructureKHR(return_value, device, deferredOperation, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCopyMemoryToAccelerationStructureKHR(return_value, device, deferredOperation, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -9946,9 +13540,17 @@ size_t VulkanDecoder::Decode_vkWriteAccelerationStructuresPropertiesKHR(const ui
     bytes_read += ValueDecoder::DecodeSizeTValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &stride);
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkWriteAccelerationStructuresPropertiesKHR(return_value, device, accelerationStructureCount, &pAccelerationStructures, queryType, dataSize, &pData, stride);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkWriteAccelerationStructuresPropertiesKHR)(return_value, device, accelerationStructureCount, &pAccelerationStructures, queryType, dataSize, &pData, stride);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkWriteAccelerationStructuresPropertiesKHR(return_value, device, accelerationStructureCount, &pAccelerationStructures, queryType, dataSize, &pData, stride);
+        }
     }
 
     return bytes_read;
@@ -9964,9 +13566,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyAccelerationStructureKHR(const uint8_t* pa
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyAccelerationStructureKHR)(commandBuffer, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyAccelerationStructureKHR(commandBuffer, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyAccelerationStructureKHR(commandBuffer, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -9982,9 +13592,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyAccelerationStructureToMemoryKHR(const uin
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdCopyAccelerationStructureToMemoryKHR(commandBuffer, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyAccelerationStructureToMemoryKHR)(commandBuffer, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyAccelerationStructureToMemoryKHR(commandBuffer, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -10000,9 +13618,17 @@ size_t VulkanDecoder::Decode_vkCmdCopyMemoryToAccelerationStructureKHR(const uin
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdCopyMemoryToAccelerationStructureKHR)(commandBuffer, &pInfo);
+    }
+    else
     {
-        consumer->Process_vkCmdCopyMemoryToAccelerationStructureKHR(commandBuffer, &pInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdCopyMemoryToAccelerationStructureKHR(commandBuffer, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -10020,9 +13646,17 @@ size_t VulkanDecoder::Decode_vkGetAccelerationStructureDeviceAddressKHR(const ui
     bytes_read += pInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeVkDeviceAddressValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetAccelerationStructureDeviceAddressKHR(return_value, device, &pInfo);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetAccelerationStructureDeviceAddressKHR)(return_value, device, &pInfo);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetAccelerationStructureDeviceAddressKHR(return_value, device, &pInfo);
+        }
     }
 
     return bytes_read;
@@ -10046,9 +13680,17 @@ size_t VulkanDecoder::Decode_vkCmdWriteAccelerationStructuresPropertiesKHR(const
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &queryPool);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &firstQuery);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdWriteAccelerationStructuresPropertiesKHR)(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+    }
+    else
     {
-        consumer->Process_vkCmdWriteAccelerationStructuresPropertiesKHR(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdWriteAccelerationStructuresPropertiesKHR(commandBuffer, accelerationStructureCount, &pAccelerationStructures, queryType, queryPool, firstQuery);
+        }
     }
 
     return bytes_read;
@@ -10066,9 +13708,17 @@ size_t VulkanDecoder::Decode_vkGetDeviceAccelerationStructureCompatibilityKHR(co
     bytes_read += pVersionInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pCompatibility.DecodeEnum((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetDeviceAccelerationStructureCompatibilityKHR(device, &pVersionInfo, &pCompatibility);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetDeviceAccelerationStructureCompatibilityKHR)(device, &pVersionInfo, &pCompatibility);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetDeviceAccelerationStructureCompatibilityKHR(device, &pVersionInfo, &pCompatibility);
+        }
     }
 
     return bytes_read;
@@ -10090,9 +13740,17 @@ size_t VulkanDecoder::Decode_vkGetAccelerationStructureBuildSizesKHR(const uint8
     bytes_read += pMaxPrimitiveCounts.DecodeUInt32((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += pSizeInfo.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetAccelerationStructureBuildSizesKHR)(device, buildType, &pBuildInfo, &pMaxPrimitiveCounts, &pSizeInfo);
+    }
+    else
     {
-        consumer->Process_vkGetAccelerationStructureBuildSizesKHR(device, buildType, &pBuildInfo, &pMaxPrimitiveCounts, &pSizeInfo);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetAccelerationStructureBuildSizesKHR(device, buildType, &pBuildInfo, &pMaxPrimitiveCounts, &pSizeInfo);
+        }
     }
 
     return bytes_read;
@@ -10120,9 +13778,17 @@ size_t VulkanDecoder::Decode_vkCmdTraceRaysKHR(const uint8_t* parameter_buffer,
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &height);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &depth);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkCmdTraceRaysKHR(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, width, height, depth);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdTraceRaysKHR)(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, width, height, depth);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdTraceRaysKHR(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, width, height, depth);
+        }
     }
 
     return bytes_read;
@@ -10150,9 +13816,17 @@ size_t VulkanDecoder::Decode_vkCreateRayTracingPipelinesKHR(const uint8_t* param
     bytes_read += pPipelines.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCreateRayTracingPipelinesKHR)(return_value, device, deferredOperation, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+    }
+    else
     {
-        consumer->Process_vkCreateRayTracingPipelinesKHR(return_value, device, deferredOperation, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCreateRayTracingPipelinesKHR(return_value, device, deferredOperation, pipelineCache, createInfoCount, &pCreateInfos, &pAllocator, &pPipelines);
+        }
     }
 
     return bytes_read;
@@ -10178,9 +13852,17 @@ size_t VulkanDecoder::Decode_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(c
     bytes_read += pData.DecodeVoid((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR)(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(return_value, device, pipeline, firstGroup, groupCount, dataSize, &pData);
+        }
     }
 
     return bytes_read;
@@ -10204,9 +13886,17 @@ size_t VulkanDecoder::Decode_vkCmdTraceRaysIndirectKHR(const uint8_t* parameter_
     bytes_read += pCallableShaderBindingTable.Decode((parameter_buffer + bytes_read), (buffer_size - bytes_read));
     bytes_read += ValueDecoder::DecodeVkDeviceAddressValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &indirectDeviceAddress);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdTraceRaysIndirectKHR)(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, indirectDeviceAddress);
+    }
+    else
     {
-        consumer->Process_vkCmdTraceRaysIndirectKHR(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, indirectDeviceAddress);
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdTraceRaysIndirectKHR(commandBuffer, &pRaygenShaderBindingTable, &pMissShaderBindingTable, &pHitShaderBindingTable, &pCallableShaderBindingTable, indirectDeviceAddress);
+        }
     }
 
     return bytes_read;
@@ -10228,9 +13918,17 @@ size_t VulkanDecoder::Decode_vkGetRayTracingShaderGroupStackSizeKHR(const uint8_
     bytes_read += ValueDecoder::DecodeEnumValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &groupShader);
     bytes_read += ValueDecoder::DecodeVkDeviceSizeValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &return_value);
 
-    for (auto consumer : GetConsumers())
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
     {
-        consumer->Process_vkGetRayTracingShaderGroupStackSizeKHR(return_value, device, pipeline, group, groupShader);
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkGetRayTracingShaderGroupStackSizeKHR)(return_value, device, pipeline, group, groupShader);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkGetRayTracingShaderGroupStackSizeKHR(return_value, device, pipeline, group, groupShader);
+        }
     }
 
     return bytes_read;
@@ -10246,12 +13944,970 @@ size_t VulkanDecoder::Decode_vkCmdSetRayTracingPipelineStackSizeKHR(const uint8_
     bytes_read += ValueDecoder::DecodeHandleIdValue((parameter_buffer + bytes_read), (buffer_size - bytes_read), &commandBuffer);
     bytes_read += ValueDecoder::DecodeUInt32Value((parameter_buffer + bytes_read), (buffer_size - bytes_read), &pipelineStackSize);
 
-    for (auto consumer : GetConsumers())
-    {
-        consumer->Process_vkCmdSetRayTracingPipelineStackSizeKHR(commandBuffer, pipelineStackSize);
-    }
-
-    return bytes_read;
+    VulkanConsumer* single_consumer = GetSingleConsumer();
+    if (single_consumer != nullptr)
+    {
+        GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_vkCmdSetRayTracingPipelineStackSizeKHR)(commandBuffer, pipelineStackSize);
+    }
+    else
+    {
+        for (auto consumer : GetConsumers())
+        {
+            consumer->Process_vkCmdSetRayTracingPipelineStackSizeKHR(commandBuffer, pipelineStackSize);
+        }
+    }
+
+    return bytes_read;
+}
+
+constexpr VulkanDecoder::DecodeFunctionTable VulkanDecoder::MakeDecodeFunctionTable()
+{
+    DecodeFunctionTable table{};
+    table.functions[format::ApiCallId::ApiCall_vkCreateInstance - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateInstance;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyInstance - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyInstance;
+    table.functions[format::ApiCallId::ApiCall_vkEnumeratePhysicalDevices - kFirstApiCallId] = &VulkanDecoder::Decode_vkEnumeratePhysicalDevices;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDevice - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDevice;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDevice - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDevice;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceQueue - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceQueue;
+    table.functions[format::ApiCallId::ApiCall_vkQueueSubmit - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueSubmit;
+    table.functions[format::ApiCallId::ApiCall_vkQueueWaitIdle - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueWaitIdle;
+    table.functions[format::ApiCallId::ApiCall_vkDeviceWaitIdle - kFirstApiCallId] = &VulkanDecoder::Decode_vkDeviceWaitIdle;
+    table.functions[format::ApiCallId::ApiCall_vkAllocateMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkAllocateMemory;
+    table.functions[format::ApiCallId::ApiCall_vkFreeMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkFreeMemory;
+    table.functions[format::ApiCallId::ApiCall_vkMapMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkMapMemory;
+    table.functions[format::ApiCallId::ApiCall_vkUnmapMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkUnmapMemory;
+    table.functions[format::ApiCallId::ApiCall_vkFlushMappedMemoryRanges - kFirstApiCallId] = &VulkanDecoder::Decode_vkFlushMappedMemoryRanges;
+    table.functions[format::ApiCallId::ApiCall_vkInvalidateMappedMemoryRanges - kFirstApiCallId] = &VulkanDecoder::Decode_vkInvalidateMappedMemoryRanges;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceMemoryCommitment - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceMemoryCommitment;
+    table.functions[format::ApiCallId::ApiCall_vkBindBufferMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindBufferMemory;
+    table.functions[format::ApiCallId::ApiCall_vkBindImageMemory - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindImageMemory;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferMemoryRequirements;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageMemoryRequirements;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties;
+    table.functions[format::ApiCallId::ApiCall_vkQueueBindSparse - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueBindSparse;
+    table.functions[format::ApiCallId::ApiCall_vkCreateFence - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateFence;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyFence - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyFence;
+    table.functions[format::ApiCallId::ApiCall_vkResetFences - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetFences;
+    table.functions[format::ApiCallId::ApiCall_vkGetFenceStatus - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetFenceStatus;
+    table.functions[format::ApiCallId::ApiCall_vkWaitForFences - kFirstApiCallId] = &VulkanDecoder::Decode_vkWaitForFences;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSemaphore - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSemaphore;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySemaphore - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySemaphore;
+    table.functions[format::ApiCallId::ApiCall_vkCreateEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateEvent;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyEvent;
+    table.functions[format::ApiCallId::ApiCall_vkGetEventStatus - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetEventStatus;
+    table.functions[format::ApiCallId::ApiCall_vkSetEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetEvent;
+    table.functions[format::ApiCallId::ApiCall_vkResetEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetEvent;
+    table.functions[format::ApiCallId::ApiCall_vkCreateQueryPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateQueryPool;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyQueryPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyQueryPool;
+    table.functions[format::ApiCallId::ApiCall_vkGetQueryPoolResults - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetQueryPoolResults;
+    table.functions[format::ApiCallId::ApiCall_vkCreateBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCreateBufferView - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateBufferView;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyBufferView - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyBufferView;
+    table.functions[format::ApiCallId::ApiCall_vkCreateImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateImage;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyImage;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageSubresourceLayout - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageSubresourceLayout;
+    table.functions[format::ApiCallId::ApiCall_vkCreateImageView - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateImageView;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyImageView - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyImageView;
+    table.functions[format::ApiCallId::ApiCall_vkCreateShaderModule - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateShaderModule;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyShaderModule - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyShaderModule;
+    table.functions[format::ApiCallId::ApiCall_vkCreatePipelineCache - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreatePipelineCache;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyPipelineCache - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyPipelineCache;
+    table.functions[format::ApiCallId::ApiCall_vkGetPipelineCacheData - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPipelineCacheData;
+    table.functions[format::ApiCallId::ApiCall_vkMergePipelineCaches - kFirstApiCallId] = &VulkanDecoder::Decode_vkMergePipelineCaches;
+    table.functions[format::ApiCallId::ApiCall_vkCreateGraphicsPipelines - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateGraphicsPipelines;
+    table.functions[format::ApiCallId::ApiCall_vkCreateComputePipelines - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateComputePipelines;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyPipeline - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyPipeline;
+    table.functions[format::ApiCallId::ApiCall_vkCreatePipelineLayout - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreatePipelineLayout;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyPipelineLayout - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyPipelineLayout;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSampler - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSampler;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySampler - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySampler;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDescriptorSetLayout - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDescriptorSetLayout;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDescriptorSetLayout - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDescriptorSetLayout;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDescriptorPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDescriptorPool;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDescriptorPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDescriptorPool;
+    table.functions[format::ApiCallId::ApiCall_vkResetDescriptorPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetDescriptorPool;
+    table.functions[format::ApiCallId::ApiCall_vkAllocateDescriptorSets - kFirstApiCallId] = &VulkanDecoder::Decode_vkAllocateDescriptorSets;
+    table.functions[format::ApiCallId::ApiCall_vkFreeDescriptorSets - kFirstApiCallId] = &VulkanDecoder::Decode_vkFreeDescriptorSets;
+    table.functions[format::ApiCallId::ApiCall_vkUpdateDescriptorSets - kFirstApiCallId] = &VulkanDecoder::Decode_vkUpdateDescriptorSets;
+    table.functions[format::ApiCallId::ApiCall_vkCreateFramebuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateFramebuffer;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyFramebuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyFramebuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCreateRenderPass - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateRenderPass;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyRenderPass - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyRenderPass;
+    table.functions[format::ApiCallId::ApiCall_vkGetRenderAreaGranularity - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRenderAreaGranularity;
+    table.functions[format::ApiCallId::ApiCall_vkCreateCommandPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateCommandPool;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyCommandPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyCommandPool;
+    table.functions[format::ApiCallId::ApiCall_vkResetCommandPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetCommandPool;
+    table.functions[format::ApiCallId::ApiCall_vkAllocateCommandBuffers - kFirstApiCallId] = &VulkanDecoder::Decode_vkAllocateCommandBuffers;
+    table.functions[format::ApiCallId::ApiCall_vkFreeCommandBuffers - kFirstApiCallId] = &VulkanDecoder::Decode_vkFreeCommandBuffers;
+    table.functions[format::ApiCallId::ApiCall_vkBeginCommandBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkBeginCommandBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkEndCommandBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkEndCommandBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkResetCommandBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetCommandBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindPipeline - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindPipeline;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetViewport - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetViewport;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetScissor - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetScissor;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetLineWidth - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetLineWidth;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthBias - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthBias;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetBlendConstants - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetBlendConstants;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthBounds - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthBounds;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetStencilCompareMask - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetStencilCompareMask;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetStencilWriteMask - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetStencilWriteMask;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetStencilReference - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetStencilReference;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindDescriptorSets - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindDescriptorSets;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindIndexBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindIndexBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindVertexBuffers - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindVertexBuffers;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDraw - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDraw;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndexed - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndexed;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndirect - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndirect;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndexedIndirect;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDispatch - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDispatch;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDispatchIndirect - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDispatchIndirect;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBlitImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBlitImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyBufferToImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyBufferToImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyImageToBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdUpdateBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdUpdateBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdFillBuffer - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdFillBuffer;
+    table.functions[format::ApiCallId::ApiCall_vkCmdClearColorImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdClearColorImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdClearDepthStencilImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdClearAttachments - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdClearAttachments;
+    table.functions[format::ApiCallId::ApiCall_vkCmdResolveImage - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdResolveImage;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetEvent;
+    table.functions[format::ApiCallId::ApiCall_vkCmdResetEvent - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdResetEvent;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWaitEvents - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWaitEvents;
+    table.functions[format::ApiCallId::ApiCall_vkCmdPipelineBarrier - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdPipelineBarrier;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginQuery - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginQuery;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndQuery - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndQuery;
+    table.functions[format::ApiCallId::ApiCall_vkCmdResetQueryPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdResetQueryPool;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteTimestamp - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteTimestamp;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyQueryPoolResults;
+    table.functions[format::ApiCallId::ApiCall_vkCmdPushConstants - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdPushConstants;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginRenderPass - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginRenderPass;
+    table.functions[format::ApiCallId::ApiCall_vkCmdNextSubpass - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdNextSubpass;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndRenderPass - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndRenderPass;
+    table.functions[format::ApiCallId::ApiCall_vkCmdExecuteCommands - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdExecuteCommands;
+    table.functions[format::ApiCallId::ApiCall_vkBindBufferMemory2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindBufferMemory2;
+    table.functions[format::ApiCallId::ApiCall_vkBindImageMemory2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindImageMemory2;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeatures - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceGroupPeerMemoryFeatures;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDeviceMask - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDeviceMask;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDispatchBase - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDispatchBase;
+    table.functions[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroups - kFirstApiCallId] = &VulkanDecoder::Decode_vkEnumeratePhysicalDeviceGroups;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageMemoryRequirements2;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferMemoryRequirements2;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties2;
+    table.functions[format::ApiCallId::ApiCall_vkTrimCommandPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkTrimCommandPool;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceQueue2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceQueue2;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversion - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSamplerYcbcrConversion;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversion - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySamplerYcbcrConversion;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplate - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDescriptorUpdateTemplate;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplate - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDescriptorUpdateTemplate;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalBufferProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFenceProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalFenceProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphoreProperties - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalSemaphoreProperties;
+    table.functions[format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupport - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDescriptorSetLayoutSupport;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndirectCount - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndirectCount;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCount;
+    table.functions[format::ApiCallId::ApiCall_vkCreateRenderPass2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateRenderPass2;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginRenderPass2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginRenderPass2;
+    table.functions[format::ApiCallId::ApiCall_vkCmdNextSubpass2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdNextSubpass2;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndRenderPass2 - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndRenderPass2;
+    table.functions[format::ApiCallId::ApiCall_vkResetQueryPool - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetQueryPool;
+    table.functions[format::ApiCallId::ApiCall_vkGetSemaphoreCounterValue - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSemaphoreCounterValue;
+    table.functions[format::ApiCallId::ApiCall_vkWaitSemaphores - kFirstApiCallId] = &VulkanDecoder::Decode_vkWaitSemaphores;
+    table.functions[format::ApiCallId::ApiCall_vkSignalSemaphore - kFirstApiCallId] = &VulkanDecoder::Decode_vkSignalSemaphore;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferDeviceAddress - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferDeviceAddress;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddress - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferOpaqueCaptureAddress;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddress - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceMemoryOpaqueCaptureAddress;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilitiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilitiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormatsKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceFormatsKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfacePresentModesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSwapchainKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSwapchainKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySwapchainKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySwapchainKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetSwapchainImagesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSwapchainImagesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireNextImageKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireNextImageKHR;
+    table.functions[format::ApiCallId::ApiCall_vkQueuePresentKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueuePresentKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceGroupPresentCapabilitiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceGroupPresentCapabilitiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceGroupSurfacePresentModesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDevicePresentRectanglesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDevicePresentRectanglesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireNextImage2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireNextImage2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlanePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPlanePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDisplayPlaneSupportedDisplaysKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDisplayPlaneSupportedDisplaysKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDisplayModePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDisplayModePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDisplayModeKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDisplayModeKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilitiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDisplayPlaneCapabilitiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDisplayPlaneSurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDisplayPlaneSurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSharedSwapchainsKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSharedSwapchainsKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateXlibSurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateXlibSurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceXlibPresentationSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceXlibPresentationSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateXcbSurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateXcbSurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceXcbPresentationSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceXcbPresentationSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateWaylandSurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateWaylandSurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceWaylandPresentationSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceWaylandPresentationSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateAndroidSurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateAndroidSurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateWin32SurfaceKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateWin32SurfaceKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceWin32PresentationSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceWin32PresentationSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFeatures2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFormatProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceImageFormatProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceMemoryProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSparseImageFormatProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeaturesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceGroupPeerMemoryFeaturesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDeviceMaskKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDeviceMaskKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDispatchBaseKHR;
+    table.functions[format::ApiCallId::ApiCall_vkTrimCommandPoolKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkTrimCommandPoolKHR;
+    table.functions[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroupsKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkEnumeratePhysicalDeviceGroupsKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferPropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalBufferPropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryWin32HandleKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryWin32HandleKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryWin32HandlePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryWin32HandlePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryFdKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryFdKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryFdPropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryFdPropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkImportSemaphoreWin32HandleKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkImportSemaphoreWin32HandleKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetSemaphoreWin32HandleKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSemaphoreWin32HandleKHR;
+    table.functions[format::ApiCallId::ApiCall_vkImportSemaphoreFdKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkImportSemaphoreFdKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetSemaphoreFdKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSemaphoreFdKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdPushDescriptorSetKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplateKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDescriptorUpdateTemplateKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplateKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDescriptorUpdateTemplateKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateRenderPass2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateRenderPass2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginRenderPass2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdNextSubpass2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdNextSubpass2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndRenderPass2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndRenderPass2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetSwapchainStatusKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSwapchainStatusKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFencePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalFencePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkImportFenceWin32HandleKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkImportFenceWin32HandleKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetFenceWin32HandleKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetFenceWin32HandleKHR;
+    table.functions[format::ApiCallId::ApiCall_vkImportFenceFdKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkImportFenceFdKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetFenceFdKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetFenceFdKHR;
+    table.functions[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireProfilingLockKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireProfilingLockKHR;
+    table.functions[format::ApiCallId::ApiCall_vkReleaseProfilingLockKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkReleaseProfilingLockKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilities2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormats2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceFormats2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlaneProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceDisplayPlaneProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDisplayModeProperties2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDisplayModeProperties2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilities2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDisplayPlaneCapabilities2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageMemoryRequirements2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferMemoryRequirements2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageSparseMemoryRequirements2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversionKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateSamplerYcbcrConversionKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversionKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroySamplerYcbcrConversionKHR;
+    table.functions[format::ApiCallId::ApiCall_vkBindBufferMemory2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindBufferMemory2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkBindImageMemory2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindImageMemory2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupportKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDescriptorSetLayoutSupportKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndirectCountKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCountKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetSemaphoreCounterValueKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSemaphoreCounterValueKHR;
+    table.functions[format::ApiCallId::ApiCall_vkWaitSemaphoresKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkWaitSemaphoresKHR;
+    table.functions[format::ApiCallId::ApiCall_vkSignalSemaphoreKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkSignalSemaphoreKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFragmentShadingRatesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceFragmentShadingRatesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetFragmentShadingRateKHR;
+    table.functions[format::ApiCallId::ApiCall_vkWaitForPresentKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkWaitForPresentKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferDeviceAddressKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferDeviceAddressKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddressKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferOpaqueCaptureAddressKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddressKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceMemoryOpaqueCaptureAddressKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDeferredOperationKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDeferredOperationKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDeferredOperationKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDeferredOperationKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeferredOperationMaxConcurrencyKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeferredOperationMaxConcurrencyKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeferredOperationResultKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeferredOperationResultKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDeferredOperationJoinKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDeferredOperationJoinKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPipelineExecutablePropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPipelineExecutablePropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPipelineExecutableStatisticsKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPipelineExecutableStatisticsKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetPipelineExecutableInternalRepresentationsKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPipelineExecutableInternalRepresentationsKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetEvent2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetEvent2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdResetEvent2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdResetEvent2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWaitEvents2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdPipelineBarrier2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteTimestamp2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteTimestamp2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkQueueSubmit2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueSubmit2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteBufferMarker2AMD;
+    table.functions[format::ApiCallId::ApiCall_vkGetQueueCheckpointData2NV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetQueueCheckpointData2NV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyBuffer2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyImage2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyImage2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyBufferToImage2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyImageToBuffer2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBlitImage2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBlitImage2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdResolveImage2KHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdResolveImage2KHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDebugReportCallbackEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDebugReportCallbackEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDebugReportCallbackEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDebugReportCallbackEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDebugReportMessageEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDebugReportMessageEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDebugMarkerSetObjectTagEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDebugMarkerSetObjectTagEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDebugMarkerSetObjectNameEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDebugMarkerSetObjectNameEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDebugMarkerBeginEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDebugMarkerBeginEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDebugMarkerEndEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDebugMarkerEndEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDebugMarkerInsertEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDebugMarkerInsertEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindTransformFeedbackBuffersEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginTransformFeedbackEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndTransformFeedbackEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginQueryIndexedEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginQueryIndexedEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndQueryIndexedEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndQueryIndexedEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndirectByteCountEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageViewHandleNVX - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageViewHandleNVX;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageViewAddressNVX - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageViewAddressNVX;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndirectCountAMD;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawIndexedIndirectCountAMD;
+    table.functions[format::ApiCallId::ApiCall_vkGetShaderInfoAMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetShaderInfoAMD;
+    table.functions[format::ApiCallId::ApiCall_vkCreateStreamDescriptorSurfaceGGP - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateStreamDescriptorSurfaceGGP;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalImageFormatPropertiesNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceExternalImageFormatPropertiesNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryWin32HandleNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryWin32HandleNV;
+    table.functions[format::ApiCallId::ApiCall_vkCreateViSurfaceNN - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateViSurfaceNN;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginConditionalRenderingEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndConditionalRenderingEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndConditionalRenderingEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetViewportWScalingNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetViewportWScalingNV;
+    table.functions[format::ApiCallId::ApiCall_vkReleaseDisplayEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkReleaseDisplayEXT;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireXlibDisplayEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireXlibDisplayEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetRandROutputDisplayEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRandROutputDisplayEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2EXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfaceCapabilities2EXT;
+    table.functions[format::ApiCallId::ApiCall_vkDisplayPowerControlEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDisplayPowerControlEXT;
+    table.functions[format::ApiCallId::ApiCall_vkRegisterDeviceEventEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkRegisterDeviceEventEXT;
+    table.functions[format::ApiCallId::ApiCall_vkRegisterDisplayEventEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkRegisterDisplayEventEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetSwapchainCounterEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSwapchainCounterEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetRefreshCycleDurationGOOGLE - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRefreshCycleDurationGOOGLE;
+    table.functions[format::ApiCallId::ApiCall_vkGetPastPresentationTimingGOOGLE - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPastPresentationTimingGOOGLE;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDiscardRectangleEXT;
+    table.functions[format::ApiCallId::ApiCall_vkSetHdrMetadataEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetHdrMetadataEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateIOSSurfaceMVK - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateIOSSurfaceMVK;
+    table.functions[format::ApiCallId::ApiCall_vkCreateMacOSSurfaceMVK - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateMacOSSurfaceMVK;
+    table.functions[format::ApiCallId::ApiCall_vkSetDebugUtilsObjectNameEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetDebugUtilsObjectNameEXT;
+    table.functions[format::ApiCallId::ApiCall_vkSetDebugUtilsObjectTagEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetDebugUtilsObjectTagEXT;
+    table.functions[format::ApiCallId::ApiCall_vkQueueBeginDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueBeginDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkQueueEndDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueEndDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkQueueInsertDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueInsertDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBeginDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBeginDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdEndDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdEndDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdInsertDebugUtilsLabelEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdInsertDebugUtilsLabelEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDebugUtilsMessengerEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDebugUtilsMessengerEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyDebugUtilsMessengerEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyDebugUtilsMessengerEXT;
+    table.functions[format::ApiCallId::ApiCall_vkSubmitDebugUtilsMessageEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkSubmitDebugUtilsMessageEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetAndroidHardwareBufferPropertiesANDROID - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetAndroidHardwareBufferPropertiesANDROID;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryAndroidHardwareBufferANDROID - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryAndroidHardwareBufferANDROID;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetSampleLocationsEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMultisamplePropertiesEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceMultisamplePropertiesEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetImageDrmFormatModifierPropertiesEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetImageDrmFormatModifierPropertiesEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateValidationCacheEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateValidationCacheEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyValidationCacheEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyValidationCacheEXT;
+    table.functions[format::ApiCallId::ApiCall_vkMergeValidationCachesEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkMergeValidationCachesEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetValidationCacheDataEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetValidationCacheDataEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindShadingRateImageNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetViewportShadingRatePaletteNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetViewportShadingRatePaletteNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetCoarseSampleOrderNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetCoarseSampleOrderNV;
+    table.functions[format::ApiCallId::ApiCall_vkCreateAccelerationStructureNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateAccelerationStructureNV;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyAccelerationStructureNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyAccelerationStructureNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetAccelerationStructureMemoryRequirementsNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetAccelerationStructureMemoryRequirementsNV;
+    table.functions[format::ApiCallId::ApiCall_vkBindAccelerationStructureMemoryNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkBindAccelerationStructureMemoryNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBuildAccelerationStructureNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyAccelerationStructureNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdTraceRaysNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdTraceRaysNV;
+    table.functions[format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateRayTracingPipelinesNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRayTracingShaderGroupHandlesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRayTracingShaderGroupHandlesNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetAccelerationStructureHandleNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetAccelerationStructureHandleNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteAccelerationStructuresPropertiesNV;
+    table.functions[format::ApiCallId::ApiCall_vkCompileDeferredNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCompileDeferredNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryHostPointerPropertiesEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryHostPointerPropertiesEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteBufferMarkerAMD;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetCalibratedTimestampsEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetCalibratedTimestampsEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawMeshTasksNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawMeshTasksIndirectNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawMeshTasksIndirectCountNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetExclusiveScissorNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetCheckpointNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetCheckpointNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetQueueCheckpointDataNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetQueueCheckpointDataNV;
+    table.functions[format::ApiCallId::ApiCall_vkInitializePerformanceApiINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkInitializePerformanceApiINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkUninitializePerformanceApiINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkUninitializePerformanceApiINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPerformanceMarkerINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPerformanceMarkerINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPerformanceStreamMarkerINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPerformanceStreamMarkerINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPerformanceOverrideINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPerformanceOverrideINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkAcquirePerformanceConfigurationINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquirePerformanceConfigurationINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkReleasePerformanceConfigurationINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkReleasePerformanceConfigurationINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkQueueSetPerformanceConfigurationINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkQueueSetPerformanceConfigurationINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkGetPerformanceParameterINTEL - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPerformanceParameterINTEL;
+    table.functions[format::ApiCallId::ApiCall_vkSetLocalDimmingAMD - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetLocalDimmingAMD;
+    table.functions[format::ApiCallId::ApiCall_vkCreateImagePipeSurfaceFUCHSIA - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateImagePipeSurfaceFUCHSIA;
+    table.functions[format::ApiCallId::ApiCall_vkCreateMetalSurfaceEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateMetalSurfaceEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetBufferDeviceAddressEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetBufferDeviceAddressEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceToolPropertiesEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceToolPropertiesEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModes2EXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceSurfacePresentModes2EXT;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireFullScreenExclusiveModeEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireFullScreenExclusiveModeEXT;
+    table.functions[format::ApiCallId::ApiCall_vkReleaseFullScreenExclusiveModeEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkReleaseFullScreenExclusiveModeEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModes2EXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceGroupSurfacePresentModes2EXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateHeadlessSurfaceEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateHeadlessSurfaceEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetLineStippleEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetLineStippleEXT;
+    table.functions[format::ApiCallId::ApiCall_vkResetQueryPoolEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkResetQueryPoolEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetCullModeEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetCullModeEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetFrontFaceEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetFrontFaceEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopologyEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPrimitiveTopologyEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetViewportWithCountEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetViewportWithCountEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetScissorWithCountEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetScissorWithCountEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindVertexBuffers2EXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthTestEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthTestEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthWriteEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthCompareOpEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthCompareOpEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthBoundsTestEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetStencilTestEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetStencilTestEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetStencilOpEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetStencilOpEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetGeneratedCommandsMemoryRequirementsNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetGeneratedCommandsMemoryRequirementsNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdPreprocessGeneratedCommandsNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdExecuteGeneratedCommandsNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindPipelineShaderGroupNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindPipelineShaderGroupNV;
+    table.functions[format::ApiCallId::ApiCall_vkCreateIndirectCommandsLayoutNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateIndirectCommandsLayoutNV;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyIndirectCommandsLayoutNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyIndirectCommandsLayoutNV;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireDrmDisplayEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireDrmDisplayEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetDrmDisplayEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDrmDisplayEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreatePrivateDataSlotEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreatePrivateDataSlotEXT;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyPrivateDataSlotEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyPrivateDataSlotEXT;
+    table.functions[format::ApiCallId::ApiCall_vkSetPrivateDataEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkSetPrivateDataEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPrivateDataEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPrivateDataEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateEnumNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetFragmentShadingRateEnumNV;
+    table.functions[format::ApiCallId::ApiCall_vkAcquireWinrtDisplayNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkAcquireWinrtDisplayNV;
+    table.functions[format::ApiCallId::ApiCall_vkGetWinrtDisplayNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetWinrtDisplayNV;
+    table.functions[format::ApiCallId::ApiCall_vkCreateDirectFBSurfaceEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateDirectFBSurfaceEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDirectFBPresentationSupportEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceDirectFBPresentationSupportEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetVertexInputEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetVertexInputEXT;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryZirconHandleFUCHSIA - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryZirconHandleFUCHSIA;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryZirconHandlePropertiesFUCHSIA - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryZirconHandlePropertiesFUCHSIA;
+    table.functions[format::ApiCallId::ApiCall_vkImportSemaphoreZirconHandleFUCHSIA - kFirstApiCallId] = &VulkanDecoder::Decode_vkImportSemaphoreZirconHandleFUCHSIA;
+    table.functions[format::ApiCallId::ApiCall_vkGetSemaphoreZirconHandleFUCHSIA - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetSemaphoreZirconHandleFUCHSIA;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBindInvocationMaskHUAWEI;
+    table.functions[format::ApiCallId::ApiCall_vkGetMemoryRemoteAddressNV - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetMemoryRemoteAddressNV;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPatchControlPointsEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPatchControlPointsEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetRasterizerDiscardEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetDepthBiasEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetLogicOpEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetLogicOpEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetPrimitiveRestartEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateScreenSurfaceQNX - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateScreenSurfaceQNX;
+    table.functions[format::ApiCallId::ApiCall_vkGetPhysicalDeviceScreenPresentationSupportQNX - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetPhysicalDeviceScreenPresentationSupportQNX;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetColorWriteEnableEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetColorWriteEnableEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawMultiEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawMultiEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCmdDrawMultiIndexedEXT - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdDrawMultiIndexedEXT;
+    table.functions[format::ApiCallId::ApiCall_vkCreateAccelerationStructureKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateAccelerationStructureKHR;
+    table.functions[format::ApiCallId::ApiCall_vkDestroyAccelerationStructureKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkDestroyAccelerationStructureKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBuildAccelerationStructuresKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresIndirectKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdBuildAccelerationStructuresIndirectKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCopyAccelerationStructureToMemoryKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCopyAccelerationStructureToMemoryKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCopyMemoryToAccelerationStructureKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCopyMemoryToAccelerationStructureKHR;
+    table.functions[format::ApiCallId::ApiCall_vkWriteAccelerationStructuresPropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkWriteAccelerationStructuresPropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyAccelerationStructureKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureToMemoryKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyAccelerationStructureToMemoryKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdCopyMemoryToAccelerationStructureKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdCopyMemoryToAccelerationStructureKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetAccelerationStructureDeviceAddressKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetAccelerationStructureDeviceAddressKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdWriteAccelerationStructuresPropertiesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetDeviceAccelerationStructureCompatibilityKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetDeviceAccelerationStructureCompatibilityKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetAccelerationStructureBuildSizesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetAccelerationStructureBuildSizesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdTraceRaysKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdTraceRaysKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCreateRayTracingPipelinesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdTraceRaysIndirectKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdTraceRaysIndirectKHR;
+    table.functions[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupStackSizeKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkGetRayTracingShaderGroupStackSizeKHR;
+    table.functions[format::ApiCallId::ApiCall_vkCmdSetRayTracingPipelineStackSizeKHR - kFirstApiCallId] = &VulkanDecoder::Decode_vkCmdSetRayTracingPipelineStackSizeKHR;
+    table.names[format::ApiCallId::ApiCall_vkCreateInstance - kFirstApiCallId] = "vkCreateInstance";
+    table.names[format::ApiCallId::ApiCall_vkDestroyInstance - kFirstApiCallId] = "vkDestroyInstance";
+    table.names[format::ApiCallId::ApiCall_vkEnumeratePhysicalDevices - kFirstApiCallId] = "vkEnumeratePhysicalDevices";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures - kFirstApiCallId] = "vkGetPhysicalDeviceFeatures";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties - kFirstApiCallId] = "vkGetPhysicalDeviceFormatProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties - kFirstApiCallId] = "vkGetPhysicalDeviceImageFormatProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties - kFirstApiCallId] = "vkGetPhysicalDeviceProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties - kFirstApiCallId] = "vkGetPhysicalDeviceQueueFamilyProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties - kFirstApiCallId] = "vkGetPhysicalDeviceMemoryProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetInstanceProcAddr - kFirstApiCallId] = "vkGetInstanceProcAddr";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceProcAddr - kFirstApiCallId] = "vkGetDeviceProcAddr";
+    table.names[format::ApiCallId::ApiCall_vkCreateDevice - kFirstApiCallId] = "vkCreateDevice";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDevice - kFirstApiCallId] = "vkDestroyDevice";
+    table.names[format::ApiCallId::ApiCall_vkEnumerateInstanceExtensionProperties - kFirstApiCallId] = "vkEnumerateInstanceExtensionProperties";
+    table.names[format::ApiCallId::ApiCall_vkEnumerateDeviceExtensionProperties - kFirstApiCallId] = "vkEnumerateDeviceExtensionProperties";
+    table.names[format::ApiCallId::ApiCall_vkEnumerateInstanceLayerProperties - kFirstApiCallId] = "vkEnumerateInstanceLayerProperties";
+    table.names[format::ApiCallId::ApiCall_vkEnumerateDeviceLayerProperties - kFirstApiCallId] = "vkEnumerateDeviceLayerProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceQueue - kFirstApiCallId] = "vkGetDeviceQueue";
+    table.names[format::ApiCallId::ApiCall_vkQueueSubmit - kFirstApiCallId] = "vkQueueSubmit";
+    table.names[format::ApiCallId::ApiCall_vkQueueWaitIdle - kFirstApiCallId] = "vkQueueWaitIdle";
+    table.names[format::ApiCallId::ApiCall_vkDeviceWaitIdle - kFirstApiCallId] = "vkDeviceWaitIdle";
+    table.names[format::ApiCallId::ApiCall_vkAllocateMemory - kFirstApiCallId] = "vkAllocateMemory";
+    table.names[format::ApiCallId::ApiCall_vkFreeMemory - kFirstApiCallId] = "vkFreeMemory";
+    table.names[format::ApiCallId::ApiCall_vkMapMemory - kFirstApiCallId] = "vkMapMemory";
+    table.names[format::ApiCallId::ApiCall_vkUnmapMemory - kFirstApiCallId] = "vkUnmapMemory";
+    table.names[format::ApiCallId::ApiCall_vkFlushMappedMemoryRanges - kFirstApiCallId] = "vkFlushMappedMemoryRanges";
+    table.names[format::ApiCallId::ApiCall_vkInvalidateMappedMemoryRanges - kFirstApiCallId] = "vkInvalidateMappedMemoryRanges";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceMemoryCommitment - kFirstApiCallId] = "vkGetDeviceMemoryCommitment";
+    table.names[format::ApiCallId::ApiCall_vkBindBufferMemory - kFirstApiCallId] = "vkBindBufferMemory";
+    table.names[format::ApiCallId::ApiCall_vkBindImageMemory - kFirstApiCallId] = "vkBindImageMemory";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements - kFirstApiCallId] = "vkGetBufferMemoryRequirements";
+    table.names[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements - kFirstApiCallId] = "vkGetImageMemoryRequirements";
+    table.names[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements - kFirstApiCallId] = "vkGetImageSparseMemoryRequirements";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties - kFirstApiCallId] = "vkGetPhysicalDeviceSparseImageFormatProperties";
+    table.names[format::ApiCallId::ApiCall_vkQueueBindSparse - kFirstApiCallId] = "vkQueueBindSparse";
+    table.names[format::ApiCallId::ApiCall_vkCreateFence - kFirstApiCallId] = "vkCreateFence";
+    table.names[format::ApiCallId::ApiCall_vkDestroyFence - kFirstApiCallId] = "vkDestroyFence";
+    table.names[format::ApiCallId::ApiCall_vkResetFences - kFirstApiCallId] = "vkResetFences";
+    table.names[format::ApiCallId::ApiCall_vkGetFenceStatus - kFirstApiCallId] = "vkGetFenceStatus";
+    table.names[format::ApiCallId::ApiCall_vkWaitForFences - kFirstApiCallId] = "vkWaitForFences";
+    table.names[format::ApiCallId::ApiCall_vkCreateSemaphore - kFirstApiCallId] = "vkCreateSemaphore";
+    table.names[format::ApiCallId::ApiCall_vkDestroySemaphore - kFirstApiCallId] = "vkDestroySemaphore";
+    table.names[format::ApiCallId::ApiCall_vkCreateEvent - kFirstApiCallId] = "vkCreateEvent";
+    table.names[format::ApiCallId::ApiCall_vkDestroyEvent - kFirstApiCallId] = "vkDestroyEvent";
+    table.names[format::ApiCallId::ApiCall_vkGetEventStatus - kFirstApiCallId] = "vkGetEventStatus";
+    table.names[format::ApiCallId::ApiCall_vkSetEvent - kFirstApiCallId] = "vkSetEvent";
+    table.names[format::ApiCallId::ApiCall_vkResetEvent - kFirstApiCallId] = "vkResetEvent";
+    table.names[format::ApiCallId::ApiCall_vkCreateQueryPool - kFirstApiCallId] = "vkCreateQueryPool";
+    table.names[format::ApiCallId::ApiCall_vkDestroyQueryPool - kFirstApiCallId] = "vkDestroyQueryPool";
+    table.names[format::ApiCallId::ApiCall_vkGetQueryPoolResults - kFirstApiCallId] = "vkGetQueryPoolResults";
+    table.names[format::ApiCallId::ApiCall_vkCreateBuffer - kFirstApiCallId] = "vkCreateBuffer";
+    table.names[format::ApiCallId::ApiCall_vkDestroyBuffer - kFirstApiCallId] = "vkDestroyBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCreateBufferView - kFirstApiCallId] = "vkCreateBufferView";
+    table.names[format::ApiCallId::ApiCall_vkDestroyBufferView - kFirstApiCallId] = "vkDestroyBufferView";
+    table.names[format::ApiCallId::ApiCall_vkCreateImage - kFirstApiCallId] = "vkCreateImage";
+    table.names[format::ApiCallId::ApiCall_vkDestroyImage - kFirstApiCallId] = "vkDestroyImage";
+    table.names[format::ApiCallId::ApiCall_vkGetImageSubresourceLayout - kFirstApiCallId] = "vkGetImageSubresourceLayout";
+    table.names[format::ApiCallId::ApiCall_vkCreateImageView - kFirstApiCallId] = "vkCreateImageView";
+    table.names[format::ApiCallId::ApiCall_vkDestroyImageView - kFirstApiCallId] = "vkDestroyImageView";
+    table.names[format::ApiCallId::ApiCall_vkCreateShaderModule - kFirstApiCallId] = "vkCreateShaderModule";
+    table.names[format::ApiCallId::ApiCall_vkDestroyShaderModule - kFirstApiCallId] = "vkDestroyShaderModule";
+    table.names[format::ApiCallId::ApiCall_vkCreatePipelineCache - kFirstApiCallId] = "vkCreatePipelineCache";
+    table.names[format::ApiCallId::ApiCall_vkDestroyPipelineCache - kFirstApiCallId] = "vkDestroyPipelineCache";
+    table.names[format::ApiCallId::ApiCall_vkGetPipelineCacheData - kFirstApiCallId] = "vkGetPipelineCacheData";
+    table.names[format::ApiCallId::ApiCall_vkMergePipelineCaches - kFirstApiCallId] = "vkMergePipelineCaches";
+    table.names[format::ApiCallId::ApiCall_vkCreateGraphicsPipelines - kFirstApiCallId] = "vkCreateGraphicsPipelines";
+    table.names[format::ApiCallId::ApiCall_vkCreateComputePipelines - kFirstApiCallId] = "vkCreateComputePipelines";
+    table.names[format::ApiCallId::ApiCall_vkDestroyPipeline - kFirstApiCallId] = "vkDestroyPipeline";
+    table.names[format::ApiCallId::ApiCall_vkCreatePipelineLayout - kFirstApiCallId] = "vkCreatePipelineLayout";
+    table.names[format::ApiCallId::ApiCall_vkDestroyPipelineLayout - kFirstApiCallId] = "vkDestroyPipelineLayout";
+    table.names[format::ApiCallId::ApiCall_vkCreateSampler - kFirstApiCallId] = "vkCreateSampler";
+    table.names[format::ApiCallId::ApiCall_vkDestroySampler - kFirstApiCallId] = "vkDestroySampler";
+    table.names[format::ApiCallId::ApiCall_vkCreateDescriptorSetLayout - kFirstApiCallId] = "vkCreateDescriptorSetLayout";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDescriptorSetLayout - kFirstApiCallId] = "vkDestroyDescriptorSetLayout";
+    table.names[format::ApiCallId::ApiCall_vkCreateDescriptorPool - kFirstApiCallId] = "vkCreateDescriptorPool";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDescriptorPool - kFirstApiCallId] = "vkDestroyDescriptorPool";
+    table.names[format::ApiCallId::ApiCall_vkResetDescriptorPool - kFirstApiCallId] = "vkResetDescriptorPool";
+    table.names[format::ApiCallId::ApiCall_vkAllocateDescriptorSets - kFirstApiCallId] = "vkAllocateDescriptorSets";
+    table.names[format::ApiCallId::ApiCall_vkFreeDescriptorSets - kFirstApiCallId] = "vkFreeDescriptorSets";
+    table.names[format::ApiCallId::ApiCall_vkUpdateDescriptorSets - kFirstApiCallId] = "vkUpdateDescriptorSets";
+    table.names[format::ApiCallId::ApiCall_vkCreateFramebuffer - kFirstApiCallId] = "vkCreateFramebuffer";
+    table.names[format::ApiCallId::ApiCall_vkDestroyFramebuffer - kFirstApiCallId] = "vkDestroyFramebuffer";
+    table.names[format::ApiCallId::ApiCall_vkCreateRenderPass - kFirstApiCallId] = "vkCreateRenderPass";
+    table.names[format::ApiCallId::ApiCall_vkDestroyRenderPass - kFirstApiCallId] = "vkDestroyRenderPass";
+    table.names[format::ApiCallId::ApiCall_vkGetRenderAreaGranularity - kFirstApiCallId] = "vkGetRenderAreaGranularity";
+    table.names[format::ApiCallId::ApiCall_vkCreateCommandPool - kFirstApiCallId] = "vkCreateCommandPool";
+    table.names[format::ApiCallId::ApiCall_vkDestroyCommandPool - kFirstApiCallId] = "vkDestroyCommandPool";
+    table.names[format::ApiCallId::ApiCall_vkResetCommandPool - kFirstApiCallId] = "vkResetCommandPool";
+    table.names[format::ApiCallId::ApiCall_vkAllocateCommandBuffers - kFirstApiCallId] = "vkAllocateCommandBuffers";
+    table.names[format::ApiCallId::ApiCall_vkFreeCommandBuffers - kFirstApiCallId] = "vkFreeCommandBuffers";
+    table.names[format::ApiCallId::ApiCall_vkBeginCommandBuffer - kFirstApiCallId] = "vkBeginCommandBuffer";
+    table.names[format::ApiCallId::ApiCall_vkEndCommandBuffer - kFirstApiCallId] = "vkEndCommandBuffer";
+    table.names[format::ApiCallId::ApiCall_vkResetCommandBuffer - kFirstApiCallId] = "vkResetCommandBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindPipeline - kFirstApiCallId] = "vkCmdBindPipeline";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetViewport - kFirstApiCallId] = "vkCmdSetViewport";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetScissor - kFirstApiCallId] = "vkCmdSetScissor";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetLineWidth - kFirstApiCallId] = "vkCmdSetLineWidth";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthBias - kFirstApiCallId] = "vkCmdSetDepthBias";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetBlendConstants - kFirstApiCallId] = "vkCmdSetBlendConstants";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthBounds - kFirstApiCallId] = "vkCmdSetDepthBounds";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetStencilCompareMask - kFirstApiCallId] = "vkCmdSetStencilCompareMask";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetStencilWriteMask - kFirstApiCallId] = "vkCmdSetStencilWriteMask";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetStencilReference - kFirstApiCallId] = "vkCmdSetStencilReference";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindDescriptorSets - kFirstApiCallId] = "vkCmdBindDescriptorSets";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindIndexBuffer - kFirstApiCallId] = "vkCmdBindIndexBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindVertexBuffers - kFirstApiCallId] = "vkCmdBindVertexBuffers";
+    table.names[format::ApiCallId::ApiCall_vkCmdDraw - kFirstApiCallId] = "vkCmdDraw";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndexed - kFirstApiCallId] = "vkCmdDrawIndexed";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndirect - kFirstApiCallId] = "vkCmdDrawIndirect";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect - kFirstApiCallId] = "vkCmdDrawIndexedIndirect";
+    table.names[format::ApiCallId::ApiCall_vkCmdDispatch - kFirstApiCallId] = "vkCmdDispatch";
+    table.names[format::ApiCallId::ApiCall_vkCmdDispatchIndirect - kFirstApiCallId] = "vkCmdDispatchIndirect";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyBuffer - kFirstApiCallId] = "vkCmdCopyBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyImage - kFirstApiCallId] = "vkCmdCopyImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdBlitImage - kFirstApiCallId] = "vkCmdBlitImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyBufferToImage - kFirstApiCallId] = "vkCmdCopyBufferToImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer - kFirstApiCallId] = "vkCmdCopyImageToBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdUpdateBuffer - kFirstApiCallId] = "vkCmdUpdateBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdFillBuffer - kFirstApiCallId] = "vkCmdFillBuffer";
+    table.names[format::ApiCallId::ApiCall_vkCmdClearColorImage - kFirstApiCallId] = "vkCmdClearColorImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage - kFirstApiCallId] = "vkCmdClearDepthStencilImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdClearAttachments - kFirstApiCallId] = "vkCmdClearAttachments";
+    table.names[format::ApiCallId::ApiCall_vkCmdResolveImage - kFirstApiCallId] = "vkCmdResolveImage";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetEvent - kFirstApiCallId] = "vkCmdSetEvent";
+    table.names[format::ApiCallId::ApiCall_vkCmdResetEvent - kFirstApiCallId] = "vkCmdResetEvent";
+    table.names[format::ApiCallId::ApiCall_vkCmdWaitEvents - kFirstApiCallId] = "vkCmdWaitEvents";
+    table.names[format::ApiCallId::ApiCall_vkCmdPipelineBarrier - kFirstApiCallId] = "vkCmdPipelineBarrier";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginQuery - kFirstApiCallId] = "vkCmdBeginQuery";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndQuery - kFirstApiCallId] = "vkCmdEndQuery";
+    table.names[format::ApiCallId::ApiCall_vkCmdResetQueryPool - kFirstApiCallId] = "vkCmdResetQueryPool";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteTimestamp - kFirstApiCallId] = "vkCmdWriteTimestamp";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults - kFirstApiCallId] = "vkCmdCopyQueryPoolResults";
+    table.names[format::ApiCallId::ApiCall_vkCmdPushConstants - kFirstApiCallId] = "vkCmdPushConstants";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginRenderPass - kFirstApiCallId] = "vkCmdBeginRenderPass";
+    table.names[format::ApiCallId::ApiCall_vkCmdNextSubpass - kFirstApiCallId] = "vkCmdNextSubpass";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndRenderPass - kFirstApiCallId] = "vkCmdEndRenderPass";
+    table.names[format::ApiCallId::ApiCall_vkCmdExecuteCommands - kFirstApiCallId] = "vkCmdExecuteCommands";
+    table.names[format::ApiCallId::ApiCall_vkEnumerateInstanceVersion - kFirstApiCallId] = "vkEnumerateInstanceVersion";
+    table.names[format::ApiCallId::ApiCall_vkBindBufferMemory2 - kFirstApiCallId] = "vkBindBufferMemory2";
+    table.names[format::ApiCallId::ApiCall_vkBindImageMemory2 - kFirstApiCallId] = "vkBindImageMemory2";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeatures - kFirstApiCallId] = "vkGetDeviceGroupPeerMemoryFeatures";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDeviceMask - kFirstApiCallId] = "vkCmdSetDeviceMask";
+    table.names[format::ApiCallId::ApiCall_vkCmdDispatchBase - kFirstApiCallId] = "vkCmdDispatchBase";
+    table.names[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroups - kFirstApiCallId] = "vkEnumeratePhysicalDeviceGroups";
+    table.names[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2 - kFirstApiCallId] = "vkGetImageMemoryRequirements2";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2 - kFirstApiCallId] = "vkGetBufferMemoryRequirements2";
+    table.names[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2 - kFirstApiCallId] = "vkGetImageSparseMemoryRequirements2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2 - kFirstApiCallId] = "vkGetPhysicalDeviceFeatures2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceProperties2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceFormatProperties2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceImageFormatProperties2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceQueueFamilyProperties2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceMemoryProperties2";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2 - kFirstApiCallId] = "vkGetPhysicalDeviceSparseImageFormatProperties2";
+    table.names[format::ApiCallId::ApiCall_vkTrimCommandPool - kFirstApiCallId] = "vkTrimCommandPool";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceQueue2 - kFirstApiCallId] = "vkGetDeviceQueue2";
+    table.names[format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversion - kFirstApiCallId] = "vkCreateSamplerYcbcrConversion";
+    table.names[format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversion - kFirstApiCallId] = "vkDestroySamplerYcbcrConversion";
+    table.names[format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplate - kFirstApiCallId] = "vkCreateDescriptorUpdateTemplate";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplate - kFirstApiCallId] = "vkDestroyDescriptorUpdateTemplate";
+    table.names[format::ApiCallId::ApiCall_vkUpdateDescriptorSetWithTemplate - kFirstApiCallId] = "vkUpdateDescriptorSetWithTemplate";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferProperties - kFirstApiCallId] = "vkGetPhysicalDeviceExternalBufferProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFenceProperties - kFirstApiCallId] = "vkGetPhysicalDeviceExternalFenceProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphoreProperties - kFirstApiCallId] = "vkGetPhysicalDeviceExternalSemaphoreProperties";
+    table.names[format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupport - kFirstApiCallId] = "vkGetDescriptorSetLayoutSupport";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndirectCount - kFirstApiCallId] = "vkCmdDrawIndirectCount";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount - kFirstApiCallId] = "vkCmdDrawIndexedIndirectCount";
+    table.names[format::ApiCallId::ApiCall_vkCreateRenderPass2 - kFirstApiCallId] = "vkCreateRenderPass2";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginRenderPass2 - kFirstApiCallId] = "vkCmdBeginRenderPass2";
+    table.names[format::ApiCallId::ApiCall_vkCmdNextSubpass2 - kFirstApiCallId] = "vkCmdNextSubpass2";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndRenderPass2 - kFirstApiCallId] = "vkCmdEndRenderPass2";
+    table.names[format::ApiCallId::ApiCall_vkResetQueryPool - kFirstApiCallId] = "vkResetQueryPool";
+    table.names[format::ApiCallId::ApiCall_vkGetSemaphoreCounterValue - kFirstApiCallId] = "vkGetSemaphoreCounterValue";
+    table.names[format::ApiCallId::ApiCall_vkWaitSemaphores - kFirstApiCallId] = "vkWaitSemaphores";
+    table.names[format::ApiCallId::ApiCall_vkSignalSemaphore - kFirstApiCallId] = "vkSignalSemaphore";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferDeviceAddress - kFirstApiCallId] = "vkGetBufferDeviceAddress";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddress - kFirstApiCallId] = "vkGetBufferOpaqueCaptureAddress";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddress - kFirstApiCallId] = "vkGetDeviceMemoryOpaqueCaptureAddress";
+    table.names[format::ApiCallId::ApiCall_vkDestroySurfaceKHR - kFirstApiCallId] = "vkDestroySurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceSupportKHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilitiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceCapabilitiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormatsKHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceFormatsKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfacePresentModesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateSwapchainKHR - kFirstApiCallId] = "vkCreateSwapchainKHR";
+    table.names[format::ApiCallId::ApiCall_vkDestroySwapchainKHR - kFirstApiCallId] = "vkDestroySwapchainKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetSwapchainImagesKHR - kFirstApiCallId] = "vkGetSwapchainImagesKHR";
+    table.names[format::ApiCallId::ApiCall_vkAcquireNextImageKHR - kFirstApiCallId] = "vkAcquireNextImageKHR";
+    table.names[format::ApiCallId::ApiCall_vkQueuePresentKHR - kFirstApiCallId] = "vkQueuePresentKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceGroupPresentCapabilitiesKHR - kFirstApiCallId] = "vkGetDeviceGroupPresentCapabilitiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModesKHR - kFirstApiCallId] = "vkGetDeviceGroupSurfacePresentModesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDevicePresentRectanglesKHR - kFirstApiCallId] = "vkGetPhysicalDevicePresentRectanglesKHR";
+    table.names[format::ApiCallId::ApiCall_vkAcquireNextImage2KHR - kFirstApiCallId] = "vkAcquireNextImage2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPropertiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceDisplayPropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlanePropertiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceDisplayPlanePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDisplayPlaneSupportedDisplaysKHR - kFirstApiCallId] = "vkGetDisplayPlaneSupportedDisplaysKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDisplayModePropertiesKHR - kFirstApiCallId] = "vkGetDisplayModePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateDisplayModeKHR - kFirstApiCallId] = "vkCreateDisplayModeKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilitiesKHR - kFirstApiCallId] = "vkGetDisplayPlaneCapabilitiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateDisplayPlaneSurfaceKHR - kFirstApiCallId] = "vkCreateDisplayPlaneSurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateSharedSwapchainsKHR - kFirstApiCallId] = "vkCreateSharedSwapchainsKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateXlibSurfaceKHR - kFirstApiCallId] = "vkCreateXlibSurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceXlibPresentationSupportKHR - kFirstApiCallId] = "vkGetPhysicalDeviceXlibPresentationSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateXcbSurfaceKHR - kFirstApiCallId] = "vkCreateXcbSurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceXcbPresentationSupportKHR - kFirstApiCallId] = "vkGetPhysicalDeviceXcbPresentationSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateWaylandSurfaceKHR - kFirstApiCallId] = "vkCreateWaylandSurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceWaylandPresentationSupportKHR - kFirstApiCallId] = "vkGetPhysicalDeviceWaylandPresentationSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateAndroidSurfaceKHR - kFirstApiCallId] = "vkCreateAndroidSurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateWin32SurfaceKHR - kFirstApiCallId] = "vkCreateWin32SurfaceKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceWin32PresentationSupportKHR - kFirstApiCallId] = "vkGetPhysicalDeviceWin32PresentationSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceFeatures2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceFormatProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceImageFormatProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceQueueFamilyProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceMemoryProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceSparseImageFormatProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeaturesKHR - kFirstApiCallId] = "vkGetDeviceGroupPeerMemoryFeaturesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDeviceMaskKHR - kFirstApiCallId] = "vkCmdSetDeviceMaskKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR - kFirstApiCallId] = "vkCmdDispatchBaseKHR";
+    table.names[format::ApiCallId::ApiCall_vkTrimCommandPoolKHR - kFirstApiCallId] = "vkTrimCommandPoolKHR";
+    table.names[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroupsKHR - kFirstApiCallId] = "vkEnumeratePhysicalDeviceGroupsKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferPropertiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceExternalBufferPropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryWin32HandleKHR - kFirstApiCallId] = "vkGetMemoryWin32HandleKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryWin32HandlePropertiesKHR - kFirstApiCallId] = "vkGetMemoryWin32HandlePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryFdKHR - kFirstApiCallId] = "vkGetMemoryFdKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryFdPropertiesKHR - kFirstApiCallId] = "vkGetMemoryFdPropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceExternalSemaphorePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkImportSemaphoreWin32HandleKHR - kFirstApiCallId] = "vkImportSemaphoreWin32HandleKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetSemaphoreWin32HandleKHR - kFirstApiCallId] = "vkGetSemaphoreWin32HandleKHR";
+    table.names[format::ApiCallId::ApiCall_vkImportSemaphoreFdKHR - kFirstApiCallId] = "vkImportSemaphoreFdKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetSemaphoreFdKHR - kFirstApiCallId] = "vkGetSemaphoreFdKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR - kFirstApiCallId] = "vkCmdPushDescriptorSetKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdPushDescriptorSetWithTemplateKHR - kFirstApiCallId] = "vkCmdPushDescriptorSetWithTemplateKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplateKHR - kFirstApiCallId] = "vkCreateDescriptorUpdateTemplateKHR";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplateKHR - kFirstApiCallId] = "vkDestroyDescriptorUpdateTemplateKHR";
+    table.names[format::ApiCallId::ApiCall_vkUpdateDescriptorSetWithTemplateKHR - kFirstApiCallId] = "vkUpdateDescriptorSetWithTemplateKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateRenderPass2KHR - kFirstApiCallId] = "vkCreateRenderPass2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR - kFirstApiCallId] = "vkCmdBeginRenderPass2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdNextSubpass2KHR - kFirstApiCallId] = "vkCmdNextSubpass2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndRenderPass2KHR - kFirstApiCallId] = "vkCmdEndRenderPass2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetSwapchainStatusKHR - kFirstApiCallId] = "vkGetSwapchainStatusKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFencePropertiesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceExternalFencePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkImportFenceWin32HandleKHR - kFirstApiCallId] = "vkImportFenceWin32HandleKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetFenceWin32HandleKHR - kFirstApiCallId] = "vkGetFenceWin32HandleKHR";
+    table.names[format::ApiCallId::ApiCall_vkImportFenceFdKHR - kFirstApiCallId] = "vkImportFenceFdKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetFenceFdKHR - kFirstApiCallId] = "vkGetFenceFdKHR";
+    table.names[format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR - kFirstApiCallId] = "vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR";
+    table.names[format::ApiCallId::ApiCall_vkAcquireProfilingLockKHR - kFirstApiCallId] = "vkAcquireProfilingLockKHR";
+    table.names[format::ApiCallId::ApiCall_vkReleaseProfilingLockKHR - kFirstApiCallId] = "vkReleaseProfilingLockKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceCapabilities2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormats2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceFormats2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceDisplayProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlaneProperties2KHR - kFirstApiCallId] = "vkGetPhysicalDeviceDisplayPlaneProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDisplayModeProperties2KHR - kFirstApiCallId] = "vkGetDisplayModeProperties2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilities2KHR - kFirstApiCallId] = "vkGetDisplayPlaneCapabilities2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2KHR - kFirstApiCallId] = "vkGetImageMemoryRequirements2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2KHR - kFirstApiCallId] = "vkGetBufferMemoryRequirements2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2KHR - kFirstApiCallId] = "vkGetImageSparseMemoryRequirements2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversionKHR - kFirstApiCallId] = "vkCreateSamplerYcbcrConversionKHR";
+    table.names[format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversionKHR - kFirstApiCallId] = "vkDestroySamplerYcbcrConversionKHR";
+    table.names[format::ApiCallId::ApiCall_vkBindBufferMemory2KHR - kFirstApiCallId] = "vkBindBufferMemory2KHR";
+    table.names[format::ApiCallId::ApiCall_vkBindImageMemory2KHR - kFirstApiCallId] = "vkBindImageMemory2KHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupportKHR - kFirstApiCallId] = "vkGetDescriptorSetLayoutSupportKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR - kFirstApiCallId] = "vkCmdDrawIndirectCountKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR - kFirstApiCallId] = "vkCmdDrawIndexedIndirectCountKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetSemaphoreCounterValueKHR - kFirstApiCallId] = "vkGetSemaphoreCounterValueKHR";
+    table.names[format::ApiCallId::ApiCall_vkWaitSemaphoresKHR - kFirstApiCallId] = "vkWaitSemaphoresKHR";
+    table.names[format::ApiCallId::ApiCall_vkSignalSemaphoreKHR - kFirstApiCallId] = "vkSignalSemaphoreKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceFragmentShadingRatesKHR - kFirstApiCallId] = "vkGetPhysicalDeviceFragmentShadingRatesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateKHR - kFirstApiCallId] = "vkCmdSetFragmentShadingRateKHR";
+    table.names[format::ApiCallId::ApiCall_vkWaitForPresentKHR - kFirstApiCallId] = "vkWaitForPresentKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferDeviceAddressKHR - kFirstApiCallId] = "vkGetBufferDeviceAddressKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddressKHR - kFirstApiCallId] = "vkGetBufferOpaqueCaptureAddressKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddressKHR - kFirstApiCallId] = "vkGetDeviceMemoryOpaqueCaptureAddressKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateDeferredOperationKHR - kFirstApiCallId] = "vkCreateDeferredOperationKHR";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDeferredOperationKHR - kFirstApiCallId] = "vkDestroyDeferredOperationKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeferredOperationMaxConcurrencyKHR - kFirstApiCallId] = "vkGetDeferredOperationMaxConcurrencyKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeferredOperationResultKHR - kFirstApiCallId] = "vkGetDeferredOperationResultKHR";
+    table.names[format::ApiCallId::ApiCall_vkDeferredOperationJoinKHR - kFirstApiCallId] = "vkDeferredOperationJoinKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPipelineExecutablePropertiesKHR - kFirstApiCallId] = "vkGetPipelineExecutablePropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPipelineExecutableStatisticsKHR - kFirstApiCallId] = "vkGetPipelineExecutableStatisticsKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetPipelineExecutableInternalRepresentationsKHR - kFirstApiCallId] = "vkGetPipelineExecutableInternalRepresentationsKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetEvent2KHR - kFirstApiCallId] = "vkCmdSetEvent2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdResetEvent2KHR - kFirstApiCallId] = "vkCmdResetEvent2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR - kFirstApiCallId] = "vkCmdWaitEvents2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR - kFirstApiCallId] = "vkCmdPipelineBarrier2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteTimestamp2KHR - kFirstApiCallId] = "vkCmdWriteTimestamp2KHR";
+    table.names[format::ApiCallId::ApiCall_vkQueueSubmit2KHR - kFirstApiCallId] = "vkQueueSubmit2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD - kFirstApiCallId] = "vkCmdWriteBufferMarker2AMD";
+    table.names[format::ApiCallId::ApiCall_vkGetQueueCheckpointData2NV - kFirstApiCallId] = "vkGetQueueCheckpointData2NV";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR - kFirstApiCallId] = "vkCmdCopyBuffer2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyImage2KHR - kFirstApiCallId] = "vkCmdCopyImage2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR - kFirstApiCallId] = "vkCmdCopyBufferToImage2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR - kFirstApiCallId] = "vkCmdCopyImageToBuffer2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdBlitImage2KHR - kFirstApiCallId] = "vkCmdBlitImage2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdResolveImage2KHR - kFirstApiCallId] = "vkCmdResolveImage2KHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateDebugReportCallbackEXT - kFirstApiCallId] = "vkCreateDebugReportCallbackEXT";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDebugReportCallbackEXT - kFirstApiCallId] = "vkDestroyDebugReportCallbackEXT";
+    table.names[format::ApiCallId::ApiCall_vkDebugReportMessageEXT - kFirstApiCallId] = "vkDebugReportMessageEXT";
+    table.names[format::ApiCallId::ApiCall_vkDebugMarkerSetObjectTagEXT - kFirstApiCallId] = "vkDebugMarkerSetObjectTagEXT";
+    table.names[format::ApiCallId::ApiCall_vkDebugMarkerSetObjectNameEXT - kFirstApiCallId] = "vkDebugMarkerSetObjectNameEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDebugMarkerBeginEXT - kFirstApiCallId] = "vkCmdDebugMarkerBeginEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDebugMarkerEndEXT - kFirstApiCallId] = "vkCmdDebugMarkerEndEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDebugMarkerInsertEXT - kFirstApiCallId] = "vkCmdDebugMarkerInsertEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT - kFirstApiCallId] = "vkCmdBindTransformFeedbackBuffersEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT - kFirstApiCallId] = "vkCmdBeginTransformFeedbackEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT - kFirstApiCallId] = "vkCmdEndTransformFeedbackEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginQueryIndexedEXT - kFirstApiCallId] = "vkCmdBeginQueryIndexedEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndQueryIndexedEXT - kFirstApiCallId] = "vkCmdEndQueryIndexedEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT - kFirstApiCallId] = "vkCmdDrawIndirectByteCountEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetImageViewHandleNVX - kFirstApiCallId] = "vkGetImageViewHandleNVX";
+    table.names[format::ApiCallId::ApiCall_vkGetImageViewAddressNVX - kFirstApiCallId] = "vkGetImageViewAddressNVX";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD - kFirstApiCallId] = "vkCmdDrawIndirectCountAMD";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD - kFirstApiCallId] = "vkCmdDrawIndexedIndirectCountAMD";
+    table.names[format::ApiCallId::ApiCall_vkGetShaderInfoAMD - kFirstApiCallId] = "vkGetShaderInfoAMD";
+    table.names[format::ApiCallId::ApiCall_vkCreateStreamDescriptorSurfaceGGP - kFirstApiCallId] = "vkCreateStreamDescriptorSurfaceGGP";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalImageFormatPropertiesNV - kFirstApiCallId] = "vkGetPhysicalDeviceExternalImageFormatPropertiesNV";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryWin32HandleNV - kFirstApiCallId] = "vkGetMemoryWin32HandleNV";
+    table.names[format::ApiCallId::ApiCall_vkCreateViSurfaceNN - kFirstApiCallId] = "vkCreateViSurfaceNN";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT - kFirstApiCallId] = "vkCmdBeginConditionalRenderingEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndConditionalRenderingEXT - kFirstApiCallId] = "vkCmdEndConditionalRenderingEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetViewportWScalingNV - kFirstApiCallId] = "vkCmdSetViewportWScalingNV";
+    table.names[format::ApiCallId::ApiCall_vkReleaseDisplayEXT - kFirstApiCallId] = "vkReleaseDisplayEXT";
+    table.names[format::ApiCallId::ApiCall_vkAcquireXlibDisplayEXT - kFirstApiCallId] = "vkAcquireXlibDisplayEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetRandROutputDisplayEXT - kFirstApiCallId] = "vkGetRandROutputDisplayEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2EXT - kFirstApiCallId] = "vkGetPhysicalDeviceSurfaceCapabilities2EXT";
+    table.names[format::ApiCallId::ApiCall_vkDisplayPowerControlEXT - kFirstApiCallId] = "vkDisplayPowerControlEXT";
+    table.names[format::ApiCallId::ApiCall_vkRegisterDeviceEventEXT - kFirstApiCallId] = "vkRegisterDeviceEventEXT";
+    table.names[format::ApiCallId::ApiCall_vkRegisterDisplayEventEXT - kFirstApiCallId] = "vkRegisterDisplayEventEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetSwapchainCounterEXT - kFirstApiCallId] = "vkGetSwapchainCounterEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetRefreshCycleDurationGOOGLE - kFirstApiCallId] = "vkGetRefreshCycleDurationGOOGLE";
+    table.names[format::ApiCallId::ApiCall_vkGetPastPresentationTimingGOOGLE - kFirstApiCallId] = "vkGetPastPresentationTimingGOOGLE";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEXT - kFirstApiCallId] = "vkCmdSetDiscardRectangleEXT";
+    table.names[format::ApiCallId::ApiCall_vkSetHdrMetadataEXT - kFirstApiCallId] = "vkSetHdrMetadataEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateIOSSurfaceMVK - kFirstApiCallId] = "vkCreateIOSSurfaceMVK";
+    table.names[format::ApiCallId::ApiCall_vkCreateMacOSSurfaceMVK - kFirstApiCallId] = "vkCreateMacOSSurfaceMVK";
+    table.names[format::ApiCallId::ApiCall_vkSetDebugUtilsObjectNameEXT - kFirstApiCallId] = "vkSetDebugUtilsObjectNameEXT";
+    table.names[format::ApiCallId::ApiCall_vkSetDebugUtilsObjectTagEXT - kFirstApiCallId] = "vkSetDebugUtilsObjectTagEXT";
+    table.names[format::ApiCallId::ApiCall_vkQueueBeginDebugUtilsLabelEXT - kFirstApiCallId] = "vkQueueBeginDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkQueueEndDebugUtilsLabelEXT - kFirstApiCallId] = "vkQueueEndDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkQueueInsertDebugUtilsLabelEXT - kFirstApiCallId] = "vkQueueInsertDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBeginDebugUtilsLabelEXT - kFirstApiCallId] = "vkCmdBeginDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdEndDebugUtilsLabelEXT - kFirstApiCallId] = "vkCmdEndDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdInsertDebugUtilsLabelEXT - kFirstApiCallId] = "vkCmdInsertDebugUtilsLabelEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateDebugUtilsMessengerEXT - kFirstApiCallId] = "vkCreateDebugUtilsMessengerEXT";
+    table.names[format::ApiCallId::ApiCall_vkDestroyDebugUtilsMessengerEXT - kFirstApiCallId] = "vkDestroyDebugUtilsMessengerEXT";
+    table.names[format::ApiCallId::ApiCall_vkSubmitDebugUtilsMessageEXT - kFirstApiCallId] = "vkSubmitDebugUtilsMessageEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetAndroidHardwareBufferPropertiesANDROID - kFirstApiCallId] = "vkGetAndroidHardwareBufferPropertiesANDROID";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryAndroidHardwareBufferANDROID - kFirstApiCallId] = "vkGetMemoryAndroidHardwareBufferANDROID";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEXT - kFirstApiCallId] = "vkCmdSetSampleLocationsEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceMultisamplePropertiesEXT - kFirstApiCallId] = "vkGetPhysicalDeviceMultisamplePropertiesEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetImageDrmFormatModifierPropertiesEXT - kFirstApiCallId] = "vkGetImageDrmFormatModifierPropertiesEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateValidationCacheEXT - kFirstApiCallId] = "vkCreateValidationCacheEXT";
+    table.names[format::ApiCallId::ApiCall_vkDestroyValidationCacheEXT - kFirstApiCallId] = "vkDestroyValidationCacheEXT";
+    table.names[format::ApiCallId::ApiCall_vkMergeValidationCachesEXT - kFirstApiCallId] = "vkMergeValidationCachesEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetValidationCacheDataEXT - kFirstApiCallId] = "vkGetValidationCacheDataEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV - kFirstApiCallId] = "vkCmdBindShadingRateImageNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetViewportShadingRatePaletteNV - kFirstApiCallId] = "vkCmdSetViewportShadingRatePaletteNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetCoarseSampleOrderNV - kFirstApiCallId] = "vkCmdSetCoarseSampleOrderNV";
+    table.names[format::ApiCallId::ApiCall_vkCreateAccelerationStructureNV - kFirstApiCallId] = "vkCreateAccelerationStructureNV";
+    table.names[format::ApiCallId::ApiCall_vkDestroyAccelerationStructureNV - kFirstApiCallId] = "vkDestroyAccelerationStructureNV";
+    table.names[format::ApiCallId::ApiCall_vkGetAccelerationStructureMemoryRequirementsNV - kFirstApiCallId] = "vkGetAccelerationStructureMemoryRequirementsNV";
+    table.names[format::ApiCallId::ApiCall_vkBindAccelerationStructureMemoryNV - kFirstApiCallId] = "vkBindAccelerationStructureMemoryNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV - kFirstApiCallId] = "vkCmdBuildAccelerationStructureNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureNV - kFirstApiCallId] = "vkCmdCopyAccelerationStructureNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdTraceRaysNV - kFirstApiCallId] = "vkCmdTraceRaysNV";
+    table.names[format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesNV - kFirstApiCallId] = "vkCreateRayTracingPipelinesNV";
+    table.names[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesKHR - kFirstApiCallId] = "vkGetRayTracingShaderGroupHandlesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesNV - kFirstApiCallId] = "vkGetRayTracingShaderGroupHandlesNV";
+    table.names[format::ApiCallId::ApiCall_vkGetAccelerationStructureHandleNV - kFirstApiCallId] = "vkGetAccelerationStructureHandleNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesNV - kFirstApiCallId] = "vkCmdWriteAccelerationStructuresPropertiesNV";
+    table.names[format::ApiCallId::ApiCall_vkCompileDeferredNV - kFirstApiCallId] = "vkCompileDeferredNV";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryHostPointerPropertiesEXT - kFirstApiCallId] = "vkGetMemoryHostPointerPropertiesEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD - kFirstApiCallId] = "vkCmdWriteBufferMarkerAMD";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT - kFirstApiCallId] = "vkGetPhysicalDeviceCalibrateableTimeDomainsEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetCalibratedTimestampsEXT - kFirstApiCallId] = "vkGetCalibratedTimestampsEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV - kFirstApiCallId] = "vkCmdDrawMeshTasksNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV - kFirstApiCallId] = "vkCmdDrawMeshTasksIndirectNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV - kFirstApiCallId] = "vkCmdDrawMeshTasksIndirectCountNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorNV - kFirstApiCallId] = "vkCmdSetExclusiveScissorNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetCheckpointNV - kFirstApiCallId] = "vkCmdSetCheckpointNV";
+    table.names[format::ApiCallId::ApiCall_vkGetQueueCheckpointDataNV - kFirstApiCallId] = "vkGetQueueCheckpointDataNV";
+    table.names[format::ApiCallId::ApiCall_vkInitializePerformanceApiINTEL - kFirstApiCallId] = "vkInitializePerformanceApiINTEL";
+    table.names[format::ApiCallId::ApiCall_vkUninitializePerformanceApiINTEL - kFirstApiCallId] = "vkUninitializePerformanceApiINTEL";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPerformanceMarkerINTEL - kFirstApiCallId] = "vkCmdSetPerformanceMarkerINTEL";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPerformanceStreamMarkerINTEL - kFirstApiCallId] = "vkCmdSetPerformanceStreamMarkerINTEL";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPerformanceOverrideINTEL - kFirstApiCallId] = "vkCmdSetPerformanceOverrideINTEL";
+    table.names[format::ApiCallId::ApiCall_vkAcquirePerformanceConfigurationINTEL - kFirstApiCallId] = "vkAcquirePerformanceConfigurationINTEL";
+    table.names[format::ApiCallId::ApiCall_vkReleasePerformanceConfigurationINTEL - kFirstApiCallId] = "vkReleasePerformanceConfigurationINTEL";
+    table.names[format::ApiCallId::ApiCall_vkQueueSetPerformanceConfigurationINTEL - kFirstApiCallId] = "vkQueueSetPerformanceConfigurationINTEL";
+    table.names[format::ApiCallId::ApiCall_vkGetPerformanceParameterINTEL - kFirstApiCallId] = "vkGetPerformanceParameterINTEL";
+    table.names[format::ApiCallId::ApiCall_vkSetLocalDimmingAMD - kFirstApiCallId] = "vkSetLocalDimmingAMD";
+    table.names[format::ApiCallId::ApiCall_vkCreateImagePipeSurfaceFUCHSIA - kFirstApiCallId] = "vkCreateImagePipeSurfaceFUCHSIA";
+    table.names[format::ApiCallId::ApiCall_vkCreateMetalSurfaceEXT - kFirstApiCallId] = "vkCreateMetalSurfaceEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetBufferDeviceAddressEXT - kFirstApiCallId] = "vkGetBufferDeviceAddressEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceToolPropertiesEXT - kFirstApiCallId] = "vkGetPhysicalDeviceToolPropertiesEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV - kFirstApiCallId] = "vkGetPhysicalDeviceCooperativeMatrixPropertiesNV";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV - kFirstApiCallId] = "vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModes2EXT - kFirstApiCallId] = "vkGetPhysicalDeviceSurfacePresentModes2EXT";
+    table.names[format::ApiCallId::ApiCall_vkAcquireFullScreenExclusiveModeEXT - kFirstApiCallId] = "vkAcquireFullScreenExclusiveModeEXT";
+    table.names[format::ApiCallId::ApiCall_vkReleaseFullScreenExclusiveModeEXT - kFirstApiCallId] = "vkReleaseFullScreenExclusiveModeEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModes2EXT - kFirstApiCallId] = "vkGetDeviceGroupSurfacePresentModes2EXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateHeadlessSurfaceEXT - kFirstApiCallId] = "vkCreateHeadlessSurfaceEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetLineStippleEXT - kFirstApiCallId] = "vkCmdSetLineStippleEXT";
+    table.names[format::ApiCallId::ApiCall_vkResetQueryPoolEXT - kFirstApiCallId] = "vkResetQueryPoolEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetCullModeEXT - kFirstApiCallId] = "vkCmdSetCullModeEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetFrontFaceEXT - kFirstApiCallId] = "vkCmdSetFrontFaceEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopologyEXT - kFirstApiCallId] = "vkCmdSetPrimitiveTopologyEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetViewportWithCountEXT - kFirstApiCallId] = "vkCmdSetViewportWithCountEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetScissorWithCountEXT - kFirstApiCallId] = "vkCmdSetScissorWithCountEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT - kFirstApiCallId] = "vkCmdBindVertexBuffers2EXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthTestEnableEXT - kFirstApiCallId] = "vkCmdSetDepthTestEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnableEXT - kFirstApiCallId] = "vkCmdSetDepthWriteEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthCompareOpEXT - kFirstApiCallId] = "vkCmdSetDepthCompareOpEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnableEXT - kFirstApiCallId] = "vkCmdSetDepthBoundsTestEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetStencilTestEnableEXT - kFirstApiCallId] = "vkCmdSetStencilTestEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetStencilOpEXT - kFirstApiCallId] = "vkCmdSetStencilOpEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetGeneratedCommandsMemoryRequirementsNV - kFirstApiCallId] = "vkGetGeneratedCommandsMemoryRequirementsNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV - kFirstApiCallId] = "vkCmdPreprocessGeneratedCommandsNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV - kFirstApiCallId] = "vkCmdExecuteGeneratedCommandsNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindPipelineShaderGroupNV - kFirstApiCallId] = "vkCmdBindPipelineShaderGroupNV";
+    table.names[format::ApiCallId::ApiCall_vkCreateIndirectCommandsLayoutNV - kFirstApiCallId] = "vkCreateIndirectCommandsLayoutNV";
+    table.names[format::ApiCallId::ApiCall_vkDestroyIndirectCommandsLayoutNV - kFirstApiCallId] = "vkDestroyIndirectCommandsLayoutNV";
+    table.names[format::ApiCallId::ApiCall_vkAcquireDrmDisplayEXT - kFirstApiCallId] = "vkAcquireDrmDisplayEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetDrmDisplayEXT - kFirstApiCallId] = "vkGetDrmDisplayEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreatePrivateDataSlotEXT - kFirstApiCallId] = "vkCreatePrivateDataSlotEXT";
+    table.names[format::ApiCallId::ApiCall_vkDestroyPrivateDataSlotEXT - kFirstApiCallId] = "vkDestroyPrivateDataSlotEXT";
+    table.names[format::ApiCallId::ApiCall_vkSetPrivateDataEXT - kFirstApiCallId] = "vkSetPrivateDataEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPrivateDataEXT - kFirstApiCallId] = "vkGetPrivateDataEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateEnumNV - kFirstApiCallId] = "vkCmdSetFragmentShadingRateEnumNV";
+    table.names[format::ApiCallId::ApiCall_vkAcquireWinrtDisplayNV - kFirstApiCallId] = "vkAcquireWinrtDisplayNV";
+    table.names[format::ApiCallId::ApiCall_vkGetWinrtDisplayNV - kFirstApiCallId] = "vkGetWinrtDisplayNV";
+    table.names[format::ApiCallId::ApiCall_vkCreateDirectFBSurfaceEXT - kFirstApiCallId] = "vkCreateDirectFBSurfaceEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceDirectFBPresentationSupportEXT - kFirstApiCallId] = "vkGetPhysicalDeviceDirectFBPresentationSupportEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetVertexInputEXT - kFirstApiCallId] = "vkCmdSetVertexInputEXT";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryZirconHandleFUCHSIA - kFirstApiCallId] = "vkGetMemoryZirconHandleFUCHSIA";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryZirconHandlePropertiesFUCHSIA - kFirstApiCallId] = "vkGetMemoryZirconHandlePropertiesFUCHSIA";
+    table.names[format::ApiCallId::ApiCall_vkImportSemaphoreZirconHandleFUCHSIA - kFirstApiCallId] = "vkImportSemaphoreZirconHandleFUCHSIA";
+    table.names[format::ApiCallId::ApiCall_vkGetSemaphoreZirconHandleFUCHSIA - kFirstApiCallId] = "vkGetSemaphoreZirconHandleFUCHSIA";
+    table.names[format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI - kFirstApiCallId] = "vkCmdBindInvocationMaskHUAWEI";
+    table.names[format::ApiCallId::ApiCall_vkGetMemoryRemoteAddressNV - kFirstApiCallId] = "vkGetMemoryRemoteAddressNV";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPatchControlPointsEXT - kFirstApiCallId] = "vkCmdSetPatchControlPointsEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnableEXT - kFirstApiCallId] = "vkCmdSetRasterizerDiscardEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnableEXT - kFirstApiCallId] = "vkCmdSetDepthBiasEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetLogicOpEXT - kFirstApiCallId] = "vkCmdSetLogicOpEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnableEXT - kFirstApiCallId] = "vkCmdSetPrimitiveRestartEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateScreenSurfaceQNX - kFirstApiCallId] = "vkCreateScreenSurfaceQNX";
+    table.names[format::ApiCallId::ApiCall_vkGetPhysicalDeviceScreenPresentationSupportQNX - kFirstApiCallId] = "vkGetPhysicalDeviceScreenPresentationSupportQNX";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetColorWriteEnableEXT - kFirstApiCallId] = "vkCmdSetColorWriteEnableEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawMultiEXT - kFirstApiCallId] = "vkCmdDrawMultiEXT";
+    table.names[format::ApiCallId::ApiCall_vkCmdDrawMultiIndexedEXT - kFirstApiCallId] = "vkCmdDrawMultiIndexedEXT";
+    table.names[format::ApiCallId::ApiCall_vkCreateAccelerationStructureKHR - kFirstApiCallId] = "vkCreateAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkDestroyAccelerationStructureKHR - kFirstApiCallId] = "vkDestroyAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresKHR - kFirstApiCallId] = "vkCmdBuildAccelerationStructuresKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresIndirectKHR - kFirstApiCallId] = "vkCmdBuildAccelerationStructuresIndirectKHR";
+    table.names[format::ApiCallId::ApiCall_vkBuildAccelerationStructuresKHR - kFirstApiCallId] = "vkBuildAccelerationStructuresKHR";
+    table.names[format::ApiCallId::ApiCall_vkCopyAccelerationStructureKHR - kFirstApiCallId] = "vkCopyAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkCopyAccelerationStructureToMemoryKHR - kFirstApiCallId] = "vkCopyAccelerationStructureToMemoryKHR";
+    table.names[format::ApiCallId::ApiCall_vkCopyMemoryToAccelerationStructureKHR - kFirstApiCallId] = "vkCopyMemoryToAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkWriteAccelerationStructuresPropertiesKHR - kFirstApiCallId] = "vkWriteAccelerationStructuresPropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureKHR - kFirstApiCallId] = "vkCmdCopyAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureToMemoryKHR - kFirstApiCallId] = "vkCmdCopyAccelerationStructureToMemoryKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdCopyMemoryToAccelerationStructureKHR - kFirstApiCallId] = "vkCmdCopyMemoryToAccelerationStructureKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetAccelerationStructureDeviceAddressKHR - kFirstApiCallId] = "vkGetAccelerationStructureDeviceAddressKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesKHR - kFirstApiCallId] = "vkCmdWriteAccelerationStructuresPropertiesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetDeviceAccelerationStructureCompatibilityKHR - kFirstApiCallId] = "vkGetDeviceAccelerationStructureCompatibilityKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetAccelerationStructureBuildSizesKHR - kFirstApiCallId] = "vkGetAccelerationStructureBuildSizesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdTraceRaysKHR - kFirstApiCallId] = "vkCmdTraceRaysKHR";
+    table.names[format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesKHR - kFirstApiCallId] = "vkCreateRayTracingPipelinesKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR - kFirstApiCallId] = "vkGetRayTracingCaptureReplayShaderGroupHandlesKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdTraceRaysIndirectKHR - kFirstApiCallId] = "vkCmdTraceRaysIndirectKHR";
+    table.names[format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupStackSizeKHR - kFirstApiCallId] = "vkGetRayTracingShaderGroupStackSizeKHR";
+    table.names[format::ApiCallId::ApiCall_vkCmdSetRayTracingPipelineStackSizeKHR - kFirstApiCallId] = "vkCmdSetRayTracingPipelineStackSizeKHR";
+    return table;
+}
+
+const VulkanDecoder::DecodeFunctionTable VulkanDecoder::kDecodeFunctionTable = VulkanDecoder::MakeDecodeFunctionTable();
+
+const char* VulkanDecoder::GetApiCallName(format::ApiCallId call_id)
+{
+    const uint32_t index = static_cast<uint32_t>(call_id) - kFirstApiCallId;
+    return (index < kDecodeFunctionCount) ? kDecodeFunctionTable.names[index] : nullptr;
 }
 
 void VulkanDecoder::DecodeFunctionCall(format::ApiCallId             call_id,
@@ -10259,1398 +14915,19 @@ void VulkanDecoder::DecodeFunctionCall(format::ApiCallId             call_id,
                                        const uint8_t*                parameter_buffer,
                                        size_t                        buffer_size)
 {
-    switch(call_id)
-    {
-    default:
-        VulkanDecoderBase::DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateInstance:
-        Decode_vkCreateInstance(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyInstance:
-        Decode_vkDestroyInstance(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkEnumeratePhysicalDevices:
-        Decode_vkEnumeratePhysicalDevices(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures:
-        Decode_vkGetPhysicalDeviceFeatures(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties:
-        Decode_vkGetPhysicalDeviceFormatProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties:
-        Decode_vkGetPhysicalDeviceImageFormatProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties:
-        Decode_vkGetPhysicalDeviceProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties:
-        Decode_vkGetPhysicalDeviceQueueFamilyProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties:
-        Decode_vkGetPhysicalDeviceMemoryProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDevice:
-        Decode_vkCreateDevice(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDevice:
-        Decode_vkDestroyDevice(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceQueue:
-        Decode_vkGetDeviceQueue(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueSubmit:
-        Decode_vkQueueSubmit(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueWaitIdle:
-        Decode_vkQueueWaitIdle(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDeviceWaitIdle:
-        Decode_vkDeviceWaitIdle(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAllocateMemory:
-        Decode_vkAllocateMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkFreeMemory:
-        Decode_vkFreeMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkMapMemory:
-        Decode_vkMapMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkUnmapMemory:
-        Decode_vkUnmapMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkFlushMappedMemoryRanges:
-        Decode_vkFlushMappedMemoryRanges(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkInvalidateMappedMemoryRanges:
-        Decode_vkInvalidateMappedMemoryRanges(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceMemoryCommitment:
-        Decode_vkGetDeviceMemoryCommitment(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindBufferMemory:
-        Decode_vkBindBufferMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindImageMemory:
-        Decode_vkBindImageMemory(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements:
-        Decode_vkGetBufferMemoryRequirements(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements:
-        Decode_vkGetImageMemoryRequirements(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements:
-        Decode_vkGetImageSparseMemoryRequirements(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties:
-        Decode_vkGetPhysicalDeviceSparseImageFormatProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueBindSparse:
-        Decode_vkQueueBindSparse(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateFence:
-        Decode_vkCreateFence(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyFence:
-        Decode_vkDestroyFence(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetFences:
-        Decode_vkResetFences(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetFenceStatus:
-        Decode_vkGetFenceStatus(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkWaitForFences:
-        Decode_vkWaitForFences(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSemaphore:
-        Decode_vkCreateSemaphore(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySemaphore:
-        Decode_vkDestroySemaphore(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateEvent:
-        Decode_vkCreateEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyEvent:
-        Decode_vkDestroyEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetEventStatus:
-        Decode_vkGetEventStatus(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetEvent:
-        Decode_vkSetEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetEvent:
-        Decode_vkResetEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateQueryPool:
-        Decode_vkCreateQueryPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyQueryPool:
-        Decode_vkDestroyQueryPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetQueryPoolResults:
-        Decode_vkGetQueryPoolResults(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateBuffer:
-        Decode_vkCreateBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyBuffer:
-        Decode_vkDestroyBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateBufferView:
-        Decode_vkCreateBufferView(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyBufferView:
-        Decode_vkDestroyBufferView(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateImage:
-        Decode_vkCreateImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyImage:
-        Decode_vkDestroyImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageSubresourceLayout:
-        Decode_vkGetImageSubresourceLayout(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateImageView:
-        Decode_vkCreateImageView(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyImageView:
-        Decode_vkDestroyImageView(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateShaderModule:
-        Decode_vkCreateShaderModule(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyShaderModule:
-        Decode_vkDestroyShaderModule(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreatePipelineCache:
-        Decode_vkCreatePipelineCache(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyPipelineCache:
-        Decode_vkDestroyPipelineCache(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPipelineCacheData:
-        Decode_vkGetPipelineCacheData(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkMergePipelineCaches:
-        Decode_vkMergePipelineCaches(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateGraphicsPipelines:
-        Decode_vkCreateGraphicsPipelines(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateComputePipelines:
-        Decode_vkCreateComputePipelines(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyPipeline:
-        Decode_vkDestroyPipeline(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreatePipelineLayout:
-        Decode_vkCreatePipelineLayout(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyPipelineLayout:
-        Decode_vkDestroyPipelineLayout(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSampler:
-        Decode_vkCreateSampler(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySampler:
-        Decode_vkDestroySampler(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDescriptorSetLayout:
-        Decode_vkCreateDescriptorSetLayout(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDescriptorSetLayout:
-        Decode_vkDestroyDescriptorSetLayout(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDescriptorPool:
-        Decode_vkCreateDescriptorPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDescriptorPool:
-        Decode_vkDestroyDescriptorPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetDescriptorPool:
-        Decode_vkResetDescriptorPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAllocateDescriptorSets:
-        Decode_vkAllocateDescriptorSets(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkFreeDescriptorSets:
-        Decode_vkFreeDescriptorSets(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkUpdateDescriptorSets:
-        Decode_vkUpdateDescriptorSets(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateFramebuffer:
-        Decode_vkCreateFramebuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyFramebuffer:
-        Decode_vkDestroyFramebuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateRenderPass:
-        Decode_vkCreateRenderPass(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyRenderPass:
-        Decode_vkDestroyRenderPass(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRenderAreaGranularity:
-        Decode_vkGetRenderAreaGranularity(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateCommandPool:
-        Decode_vkCreateCommandPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyCommandPool:
-        Decode_vkDestroyCommandPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetCommandPool:
-        Decode_vkResetCommandPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAllocateCommandBuffers:
-        Decode_vkAllocateCommandBuffers(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkFreeCommandBuffers:
-        Decode_vkFreeCommandBuffers(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBeginCommandBuffer:
-        Decode_vkBeginCommandBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkEndCommandBuffer:
-        Decode_vkEndCommandBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetCommandBuffer:
-        Decode_vkResetCommandBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindPipeline:
-        Decode_vkCmdBindPipeline(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetViewport:
-        Decode_vkCmdSetViewport(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetScissor:
-        Decode_vkCmdSetScissor(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetLineWidth:
-        Decode_vkCmdSetLineWidth(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthBias:
-        Decode_vkCmdSetDepthBias(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetBlendConstants:
-        Decode_vkCmdSetBlendConstants(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthBounds:
-        Decode_vkCmdSetDepthBounds(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetStencilCompareMask:
-        Decode_vkCmdSetStencilCompareMask(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetStencilWriteMask:
-        Decode_vkCmdSetStencilWriteMask(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetStencilReference:
-        Decode_vkCmdSetStencilReference(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindDescriptorSets:
-        Decode_vkCmdBindDescriptorSets(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindIndexBuffer:
-        Decode_vkCmdBindIndexBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers:
-        Decode_vkCmdBindVertexBuffers(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDraw:
-        Decode_vkCmdDraw(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndexed:
-        Decode_vkCmdDrawIndexed(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndirect:
-        Decode_vkCmdDrawIndirect(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirect:
-        Decode_vkCmdDrawIndexedIndirect(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDispatch:
-        Decode_vkCmdDispatch(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDispatchIndirect:
-        Decode_vkCmdDispatchIndirect(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyBuffer:
-        Decode_vkCmdCopyBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyImage:
-        Decode_vkCmdCopyImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBlitImage:
-        Decode_vkCmdBlitImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage:
-        Decode_vkCmdCopyBufferToImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer:
-        Decode_vkCmdCopyImageToBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdUpdateBuffer:
-        Decode_vkCmdUpdateBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdFillBuffer:
-        Decode_vkCmdFillBuffer(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdClearColorImage:
-        Decode_vkCmdClearColorImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdClearDepthStencilImage:
-        Decode_vkCmdClearDepthStencilImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdClearAttachments:
-        Decode_vkCmdClearAttachments(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdResolveImage:
-        Decode_vkCmdResolveImage(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetEvent:
-        Decode_vkCmdSetEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdResetEvent:
-        Decode_vkCmdResetEvent(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWaitEvents:
-        Decode_vkCmdWaitEvents(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdPipelineBarrier:
-        Decode_vkCmdPipelineBarrier(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginQuery:
-        Decode_vkCmdBeginQuery(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndQuery:
-        Decode_vkCmdEndQuery(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdResetQueryPool:
-        Decode_vkCmdResetQueryPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteTimestamp:
-        Decode_vkCmdWriteTimestamp(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyQueryPoolResults:
-        Decode_vkCmdCopyQueryPoolResults(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdPushConstants:
-        Decode_vkCmdPushConstants(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginRenderPass:
-        Decode_vkCmdBeginRenderPass(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdNextSubpass:
-        Decode_vkCmdNextSubpass(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndRenderPass:
-        Decode_vkCmdEndRenderPass(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdExecuteCommands:
-        Decode_vkCmdExecuteCommands(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindBufferMemory2:
-        Decode_vkBindBufferMemory2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindImageMemory2:
-        Decode_vkBindImageMemory2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeatures:
-        Decode_vkGetDeviceGroupPeerMemoryFeatures(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDeviceMask:
-        Decode_vkCmdSetDeviceMask(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDispatchBase:
-        Decode_vkCmdDispatchBase(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroups:
-        Decode_vkEnumeratePhysicalDeviceGroups(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2:
-        Decode_vkGetImageMemoryRequirements2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2:
-        Decode_vkGetBufferMemoryRequirements2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2:
-        Decode_vkGetImageSparseMemoryRequirements2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2:
-        Decode_vkGetPhysicalDeviceFeatures2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2:
-        Decode_vkGetPhysicalDeviceProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2:
-        Decode_vkGetPhysicalDeviceFormatProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2:
-        Decode_vkGetPhysicalDeviceImageFormatProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2:
-        Decode_vkGetPhysicalDeviceQueueFamilyProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2:
-        Decode_vkGetPhysicalDeviceMemoryProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2:
-        Decode_vkGetPhysicalDeviceSparseImageFormatProperties2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkTrimCommandPool:
-        Decode_vkTrimCommandPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceQueue2:
-        Decode_vkGetDeviceQueue2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversion:
-        Decode_vkCreateSamplerYcbcrConversion(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversion:
-        Decode_vkDestroySamplerYcbcrConversion(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplate:
-        Decode_vkCreateDescriptorUpdateTemplate(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplate:
-        Decode_vkDestroyDescriptorUpdateTemplate(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferProperties:
-        Decode_vkGetPhysicalDeviceExternalBufferProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFenceProperties:
-        Decode_vkGetPhysicalDeviceExternalFenceProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphoreProperties:
-        Decode_vkGetPhysicalDeviceExternalSemaphoreProperties(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupport:
-        Decode_vkGetDescriptorSetLayoutSupport(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndirectCount:
-        Decode_vkCmdDrawIndirectCount(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCount:
-        Decode_vkCmdDrawIndexedIndirectCount(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateRenderPass2:
-        Decode_vkCreateRenderPass2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2:
-        Decode_vkCmdBeginRenderPass2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdNextSubpass2:
-        Decode_vkCmdNextSubpass2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndRenderPass2:
-        Decode_vkCmdEndRenderPass2(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetQueryPool:
-        Decode_vkResetQueryPool(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSemaphoreCounterValue:
-        Decode_vkGetSemaphoreCounterValue(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkWaitSemaphores:
-        Decode_vkWaitSemaphores(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSignalSemaphore:
-        Decode_vkSignalSemaphore(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferDeviceAddress:
-        Decode_vkGetBufferDeviceAddress(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddress:
-        Decode_vkGetBufferOpaqueCaptureAddress(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddress:
-        Decode_vkGetDeviceMemoryOpaqueCaptureAddress(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySurfaceKHR:
-        Decode_vkDestroySurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceSupportKHR:
-        Decode_vkGetPhysicalDeviceSurfaceSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilitiesKHR:
-        Decode_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormatsKHR:
-        Decode_vkGetPhysicalDeviceSurfaceFormatsKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModesKHR:
-        Decode_vkGetPhysicalDeviceSurfacePresentModesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSwapchainKHR:
-        Decode_vkCreateSwapchainKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySwapchainKHR:
-        Decode_vkDestroySwapchainKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSwapchainImagesKHR:
-        Decode_vkGetSwapchainImagesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireNextImageKHR:
-        Decode_vkAcquireNextImageKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueuePresentKHR:
-        Decode_vkQueuePresentKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceGroupPresentCapabilitiesKHR:
-        Decode_vkGetDeviceGroupPresentCapabilitiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModesKHR:
-        Decode_vkGetDeviceGroupSurfacePresentModesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDevicePresentRectanglesKHR:
-        Decode_vkGetPhysicalDevicePresentRectanglesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireNextImage2KHR:
-        Decode_vkAcquireNextImage2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPropertiesKHR:
-        Decode_vkGetPhysicalDeviceDisplayPropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlanePropertiesKHR:
-        Decode_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDisplayPlaneSupportedDisplaysKHR:
-        Decode_vkGetDisplayPlaneSupportedDisplaysKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDisplayModePropertiesKHR:
-        Decode_vkGetDisplayModePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDisplayModeKHR:
-        Decode_vkCreateDisplayModeKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilitiesKHR:
-        Decode_vkGetDisplayPlaneCapabilitiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDisplayPlaneSurfaceKHR:
-        Decode_vkCreateDisplayPlaneSurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSharedSwapchainsKHR:
-        Decode_vkCreateSharedSwapchainsKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateXlibSurfaceKHR:
-        Decode_vkCreateXlibSurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceXlibPresentationSupportKHR:
-        Decode_vkGetPhysicalDeviceXlibPresentationSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateXcbSurfaceKHR:
-        Decode_vkCreateXcbSurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceXcbPresentationSupportKHR:
-        Decode_vkGetPhysicalDeviceXcbPresentationSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateWaylandSurfaceKHR:
-        Decode_vkCreateWaylandSurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceWaylandPresentationSupportKHR:
-        Decode_vkGetPhysicalDeviceWaylandPresentationSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateAndroidSurfaceKHR:
-        Decode_vkCreateAndroidSurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateWin32SurfaceKHR:
-        Decode_vkCreateWin32SurfaceKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceWin32PresentationSupportKHR:
-        Decode_vkGetPhysicalDeviceWin32PresentationSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFeatures2KHR:
-        Decode_vkGetPhysicalDeviceFeatures2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceProperties2KHR:
-        Decode_vkGetPhysicalDeviceProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFormatProperties2KHR:
-        Decode_vkGetPhysicalDeviceFormatProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceImageFormatProperties2KHR:
-        Decode_vkGetPhysicalDeviceImageFormatProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyProperties2KHR:
-        Decode_vkGetPhysicalDeviceQueueFamilyProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMemoryProperties2KHR:
-        Decode_vkGetPhysicalDeviceMemoryProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSparseImageFormatProperties2KHR:
-        Decode_vkGetPhysicalDeviceSparseImageFormatProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceGroupPeerMemoryFeaturesKHR:
-        Decode_vkGetDeviceGroupPeerMemoryFeaturesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDeviceMaskKHR:
-        Decode_vkCmdSetDeviceMaskKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDispatchBaseKHR:
-        Decode_vkCmdDispatchBaseKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkTrimCommandPoolKHR:
-        Decode_vkTrimCommandPoolKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceGroupsKHR:
-        Decode_vkEnumeratePhysicalDeviceGroupsKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalBufferPropertiesKHR:
-        Decode_vkGetPhysicalDeviceExternalBufferPropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryWin32HandleKHR:
-        Decode_vkGetMemoryWin32HandleKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryWin32HandlePropertiesKHR:
-        Decode_vkGetMemoryWin32HandlePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryFdKHR:
-        Decode_vkGetMemoryFdKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryFdPropertiesKHR:
-        Decode_vkGetMemoryFdPropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR:
-        Decode_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkImportSemaphoreWin32HandleKHR:
-        Decode_vkImportSemaphoreWin32HandleKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSemaphoreWin32HandleKHR:
-        Decode_vkGetSemaphoreWin32HandleKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkImportSemaphoreFdKHR:
-        Decode_vkImportSemaphoreFdKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSemaphoreFdKHR:
-        Decode_vkGetSemaphoreFdKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdPushDescriptorSetKHR:
-        Decode_vkCmdPushDescriptorSetKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDescriptorUpdateTemplateKHR:
-        Decode_vkCreateDescriptorUpdateTemplateKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDescriptorUpdateTemplateKHR:
-        Decode_vkDestroyDescriptorUpdateTemplateKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateRenderPass2KHR:
-        Decode_vkCreateRenderPass2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginRenderPass2KHR:
-        Decode_vkCmdBeginRenderPass2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdNextSubpass2KHR:
-        Decode_vkCmdNextSubpass2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndRenderPass2KHR:
-        Decode_vkCmdEndRenderPass2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSwapchainStatusKHR:
-        Decode_vkGetSwapchainStatusKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalFencePropertiesKHR:
-        Decode_vkGetPhysicalDeviceExternalFencePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkImportFenceWin32HandleKHR:
-        Decode_vkImportFenceWin32HandleKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetFenceWin32HandleKHR:
-        Decode_vkGetFenceWin32HandleKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkImportFenceFdKHR:
-        Decode_vkImportFenceFdKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetFenceFdKHR:
-        Decode_vkGetFenceFdKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR:
-        Decode_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR:
-        Decode_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireProfilingLockKHR:
-        Decode_vkAcquireProfilingLockKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkReleaseProfilingLockKHR:
-        Decode_vkReleaseProfilingLockKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2KHR:
-        Decode_vkGetPhysicalDeviceSurfaceCapabilities2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceFormats2KHR:
-        Decode_vkGetPhysicalDeviceSurfaceFormats2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayProperties2KHR:
-        Decode_vkGetPhysicalDeviceDisplayProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDisplayPlaneProperties2KHR:
-        Decode_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDisplayModeProperties2KHR:
-        Decode_vkGetDisplayModeProperties2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDisplayPlaneCapabilities2KHR:
-        Decode_vkGetDisplayPlaneCapabilities2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageMemoryRequirements2KHR:
-        Decode_vkGetImageMemoryRequirements2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferMemoryRequirements2KHR:
-        Decode_vkGetBufferMemoryRequirements2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageSparseMemoryRequirements2KHR:
-        Decode_vkGetImageSparseMemoryRequirements2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateSamplerYcbcrConversionKHR:
-        Decode_vkCreateSamplerYcbcrConversionKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroySamplerYcbcrConversionKHR:
-        Decode_vkDestroySamplerYcbcrConversionKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindBufferMemory2KHR:
-        Decode_vkBindBufferMemory2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindImageMemory2KHR:
-        Decode_vkBindImageMemory2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDescriptorSetLayoutSupportKHR:
-        Decode_vkGetDescriptorSetLayoutSupportKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountKHR:
-        Decode_vkCmdDrawIndirectCountKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountKHR:
-        Decode_vkCmdDrawIndexedIndirectCountKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSemaphoreCounterValueKHR:
-        Decode_vkGetSemaphoreCounterValueKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkWaitSemaphoresKHR:
-        Decode_vkWaitSemaphoresKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSignalSemaphoreKHR:
-        Decode_vkSignalSemaphoreKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceFragmentShadingRatesKHR:
-        Decode_vkGetPhysicalDeviceFragmentShadingRatesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateKHR:
-        Decode_vkCmdSetFragmentShadingRateKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkWaitForPresentKHR:
-        Decode_vkWaitForPresentKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferDeviceAddressKHR:
-        Decode_vkGetBufferDeviceAddressKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferOpaqueCaptureAddressKHR:
-        Decode_vkGetBufferOpaqueCaptureAddressKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceMemoryOpaqueCaptureAddressKHR:
-        Decode_vkGetDeviceMemoryOpaqueCaptureAddressKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDeferredOperationKHR:
-        Decode_vkCreateDeferredOperationKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDeferredOperationKHR:
-        Decode_vkDestroyDeferredOperationKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeferredOperationMaxConcurrencyKHR:
-        Decode_vkGetDeferredOperationMaxConcurrencyKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeferredOperationResultKHR:
-        Decode_vkGetDeferredOperationResultKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDeferredOperationJoinKHR:
-        Decode_vkDeferredOperationJoinKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPipelineExecutablePropertiesKHR:
-        Decode_vkGetPipelineExecutablePropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPipelineExecutableStatisticsKHR:
-        Decode_vkGetPipelineExecutableStatisticsKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPipelineExecutableInternalRepresentationsKHR:
-        Decode_vkGetPipelineExecutableInternalRepresentationsKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetEvent2KHR:
-        Decode_vkCmdSetEvent2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdResetEvent2KHR:
-        Decode_vkCmdResetEvent2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWaitEvents2KHR:
-        Decode_vkCmdWaitEvents2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdPipelineBarrier2KHR:
-        Decode_vkCmdPipelineBarrier2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteTimestamp2KHR:
-        Decode_vkCmdWriteTimestamp2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueSubmit2KHR:
-        Decode_vkQueueSubmit2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteBufferMarker2AMD:
-        Decode_vkCmdWriteBufferMarker2AMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetQueueCheckpointData2NV:
-        Decode_vkGetQueueCheckpointData2NV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyBuffer2KHR:
-        Decode_vkCmdCopyBuffer2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyImage2KHR:
-        Decode_vkCmdCopyImage2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyBufferToImage2KHR:
-        Decode_vkCmdCopyBufferToImage2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyImageToBuffer2KHR:
-        Decode_vkCmdCopyImageToBuffer2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBlitImage2KHR:
-        Decode_vkCmdBlitImage2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdResolveImage2KHR:
-        Decode_vkCmdResolveImage2KHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDebugReportCallbackEXT:
-        Decode_vkCreateDebugReportCallbackEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDebugReportCallbackEXT:
-        Decode_vkDestroyDebugReportCallbackEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDebugReportMessageEXT:
-        Decode_vkDebugReportMessageEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDebugMarkerSetObjectTagEXT:
-        Decode_vkDebugMarkerSetObjectTagEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDebugMarkerSetObjectNameEXT:
-        Decode_vkDebugMarkerSetObjectNameEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDebugMarkerBeginEXT:
-        Decode_vkCmdDebugMarkerBeginEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDebugMarkerEndEXT:
-        Decode_vkCmdDebugMarkerEndEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDebugMarkerInsertEXT:
-        Decode_vkCmdDebugMarkerInsertEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindTransformFeedbackBuffersEXT:
-        Decode_vkCmdBindTransformFeedbackBuffersEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginTransformFeedbackEXT:
-        Decode_vkCmdBeginTransformFeedbackEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndTransformFeedbackEXT:
-        Decode_vkCmdEndTransformFeedbackEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginQueryIndexedEXT:
-        Decode_vkCmdBeginQueryIndexedEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndQueryIndexedEXT:
-        Decode_vkCmdEndQueryIndexedEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndirectByteCountEXT:
-        Decode_vkCmdDrawIndirectByteCountEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageViewHandleNVX:
-        Decode_vkGetImageViewHandleNVX(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageViewAddressNVX:
-        Decode_vkGetImageViewAddressNVX(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndirectCountAMD:
-        Decode_vkCmdDrawIndirectCountAMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawIndexedIndirectCountAMD:
-        Decode_vkCmdDrawIndexedIndirectCountAMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetShaderInfoAMD:
-        Decode_vkGetShaderInfoAMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateStreamDescriptorSurfaceGGP:
-        Decode_vkCreateStreamDescriptorSurfaceGGP(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceExternalImageFormatPropertiesNV:
-        Decode_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryWin32HandleNV:
-        Decode_vkGetMemoryWin32HandleNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateViSurfaceNN:
-        Decode_vkCreateViSurfaceNN(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginConditionalRenderingEXT:
-        Decode_vkCmdBeginConditionalRenderingEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndConditionalRenderingEXT:
-        Decode_vkCmdEndConditionalRenderingEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetViewportWScalingNV:
-        Decode_vkCmdSetViewportWScalingNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkReleaseDisplayEXT:
-        Decode_vkReleaseDisplayEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireXlibDisplayEXT:
-        Decode_vkAcquireXlibDisplayEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRandROutputDisplayEXT:
-        Decode_vkGetRandROutputDisplayEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfaceCapabilities2EXT:
-        Decode_vkGetPhysicalDeviceSurfaceCapabilities2EXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDisplayPowerControlEXT:
-        Decode_vkDisplayPowerControlEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkRegisterDeviceEventEXT:
-        Decode_vkRegisterDeviceEventEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkRegisterDisplayEventEXT:
-        Decode_vkRegisterDisplayEventEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSwapchainCounterEXT:
-        Decode_vkGetSwapchainCounterEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRefreshCycleDurationGOOGLE:
-        Decode_vkGetRefreshCycleDurationGOOGLE(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPastPresentationTimingGOOGLE:
-        Decode_vkGetPastPresentationTimingGOOGLE(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDiscardRectangleEXT:
-        Decode_vkCmdSetDiscardRectangleEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetHdrMetadataEXT:
-        Decode_vkSetHdrMetadataEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateIOSSurfaceMVK:
-        Decode_vkCreateIOSSurfaceMVK(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateMacOSSurfaceMVK:
-        Decode_vkCreateMacOSSurfaceMVK(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetDebugUtilsObjectNameEXT:
-        Decode_vkSetDebugUtilsObjectNameEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetDebugUtilsObjectTagEXT:
-        Decode_vkSetDebugUtilsObjectTagEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueBeginDebugUtilsLabelEXT:
-        Decode_vkQueueBeginDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueEndDebugUtilsLabelEXT:
-        Decode_vkQueueEndDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueInsertDebugUtilsLabelEXT:
-        Decode_vkQueueInsertDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBeginDebugUtilsLabelEXT:
-        Decode_vkCmdBeginDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdEndDebugUtilsLabelEXT:
-        Decode_vkCmdEndDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdInsertDebugUtilsLabelEXT:
-        Decode_vkCmdInsertDebugUtilsLabelEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDebugUtilsMessengerEXT:
-        Decode_vkCreateDebugUtilsMessengerEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyDebugUtilsMessengerEXT:
-        Decode_vkDestroyDebugUtilsMessengerEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSubmitDebugUtilsMessageEXT:
-        Decode_vkSubmitDebugUtilsMessageEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetAndroidHardwareBufferPropertiesANDROID:
-        Decode_vkGetAndroidHardwareBufferPropertiesANDROID(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryAndroidHardwareBufferANDROID:
-        Decode_vkGetMemoryAndroidHardwareBufferANDROID(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetSampleLocationsEXT:
-        Decode_vkCmdSetSampleLocationsEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceMultisamplePropertiesEXT:
-        Decode_vkGetPhysicalDeviceMultisamplePropertiesEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetImageDrmFormatModifierPropertiesEXT:
-        Decode_vkGetImageDrmFormatModifierPropertiesEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateValidationCacheEXT:
-        Decode_vkCreateValidationCacheEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyValidationCacheEXT:
-        Decode_vkDestroyValidationCacheEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkMergeValidationCachesEXT:
-        Decode_vkMergeValidationCachesEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetValidationCacheDataEXT:
-        Decode_vkGetValidationCacheDataEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindShadingRateImageNV:
-        Decode_vkCmdBindShadingRateImageNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetViewportShadingRatePaletteNV:
-        Decode_vkCmdSetViewportShadingRatePaletteNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetCoarseSampleOrderNV:
-        Decode_vkCmdSetCoarseSampleOrderNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateAccelerationStructureNV:
-        Decode_vkCreateAccelerationStructureNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyAccelerationStructureNV:
-        Decode_vkDestroyAccelerationStructureNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetAccelerationStructureMemoryRequirementsNV:
-        Decode_vkGetAccelerationStructureMemoryRequirementsNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkBindAccelerationStructureMemoryNV:
-        Decode_vkBindAccelerationStructureMemoryNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructureNV:
-        Decode_vkCmdBuildAccelerationStructureNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureNV:
-        Decode_vkCmdCopyAccelerationStructureNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdTraceRaysNV:
-        Decode_vkCmdTraceRaysNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesNV:
-        Decode_vkCreateRayTracingPipelinesNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesKHR:
-        Decode_vkGetRayTracingShaderGroupHandlesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupHandlesNV:
-        Decode_vkGetRayTracingShaderGroupHandlesNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetAccelerationStructureHandleNV:
-        Decode_vkGetAccelerationStructureHandleNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesNV:
-        Decode_vkCmdWriteAccelerationStructuresPropertiesNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCompileDeferredNV:
-        Decode_vkCompileDeferredNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryHostPointerPropertiesEXT:
-        Decode_vkGetMemoryHostPointerPropertiesEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteBufferMarkerAMD:
-        Decode_vkCmdWriteBufferMarkerAMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT:
-        Decode_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetCalibratedTimestampsEXT:
-        Decode_vkGetCalibratedTimestampsEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksNV:
-        Decode_vkCmdDrawMeshTasksNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectNV:
-        Decode_vkCmdDrawMeshTasksIndirectNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawMeshTasksIndirectCountNV:
-        Decode_vkCmdDrawMeshTasksIndirectCountNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetExclusiveScissorNV:
-        Decode_vkCmdSetExclusiveScissorNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetCheckpointNV:
-        Decode_vkCmdSetCheckpointNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetQueueCheckpointDataNV:
-        Decode_vkGetQueueCheckpointDataNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkInitializePerformanceApiINTEL:
-        Decode_vkInitializePerformanceApiINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkUninitializePerformanceApiINTEL:
-        Decode_vkUninitializePerformanceApiINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPerformanceMarkerINTEL:
-        Decode_vkCmdSetPerformanceMarkerINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPerformanceStreamMarkerINTEL:
-        Decode_vkCmdSetPerformanceStreamMarkerINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPerformanceOverrideINTEL:
-        Decode_vkCmdSetPerformanceOverrideINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquirePerformanceConfigurationINTEL:
-        Decode_vkAcquirePerformanceConfigurationINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkReleasePerformanceConfigurationINTEL:
-        Decode_vkReleasePerformanceConfigurationINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkQueueSetPerformanceConfigurationINTEL:
-        Decode_vkQueueSetPerformanceConfigurationINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPerformanceParameterINTEL:
-        Decode_vkGetPerformanceParameterINTEL(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetLocalDimmingAMD:
-        Decode_vkSetLocalDimmingAMD(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateImagePipeSurfaceFUCHSIA:
-        Decode_vkCreateImagePipeSurfaceFUCHSIA(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateMetalSurfaceEXT:
-        Decode_vkCreateMetalSurfaceEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetBufferDeviceAddressEXT:
-        Decode_vkGetBufferDeviceAddressEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceToolPropertiesEXT:
-        Decode_vkGetPhysicalDeviceToolPropertiesEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV:
-        Decode_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV:
-        Decode_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceSurfacePresentModes2EXT:
-        Decode_vkGetPhysicalDeviceSurfacePresentModes2EXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireFullScreenExclusiveModeEXT:
-        Decode_vkAcquireFullScreenExclusiveModeEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkReleaseFullScreenExclusiveModeEXT:
-        Decode_vkReleaseFullScreenExclusiveModeEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceGroupSurfacePresentModes2EXT:
-        Decode_vkGetDeviceGroupSurfacePresentModes2EXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateHeadlessSurfaceEXT:
-        Decode_vkCreateHeadlessSurfaceEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetLineStippleEXT:
-        Decode_vkCmdSetLineStippleEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkResetQueryPoolEXT:
-        Decode_vkResetQueryPoolEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetCullModeEXT:
-        Decode_vkCmdSetCullModeEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetFrontFaceEXT:
-        Decode_vkCmdSetFrontFaceEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPrimitiveTopologyEXT:
-        Decode_vkCmdSetPrimitiveTopologyEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetViewportWithCountEXT:
-        Decode_vkCmdSetViewportWithCountEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetScissorWithCountEXT:
-        Decode_vkCmdSetScissorWithCountEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindVertexBuffers2EXT:
-        Decode_vkCmdBindVertexBuffers2EXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthTestEnableEXT:
-        Decode_vkCmdSetDepthTestEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthWriteEnableEXT:
-        Decode_vkCmdSetDepthWriteEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthCompareOpEXT:
-        Decode_vkCmdSetDepthCompareOpEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthBoundsTestEnableEXT:
-        Decode_vkCmdSetDepthBoundsTestEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetStencilTestEnableEXT:
-        Decode_vkCmdSetStencilTestEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetStencilOpEXT:
-        Decode_vkCmdSetStencilOpEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetGeneratedCommandsMemoryRequirementsNV:
-        Decode_vkGetGeneratedCommandsMemoryRequirementsNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdPreprocessGeneratedCommandsNV:
-        Decode_vkCmdPreprocessGeneratedCommandsNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdExecuteGeneratedCommandsNV:
-        Decode_vkCmdExecuteGeneratedCommandsNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindPipelineShaderGroupNV:
-        Decode_vkCmdBindPipelineShaderGroupNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateIndirectCommandsLayoutNV:
-        Decode_vkCreateIndirectCommandsLayoutNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyIndirectCommandsLayoutNV:
-        Decode_vkDestroyIndirectCommandsLayoutNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireDrmDisplayEXT:
-        Decode_vkAcquireDrmDisplayEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDrmDisplayEXT:
-        Decode_vkGetDrmDisplayEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreatePrivateDataSlotEXT:
-        Decode_vkCreatePrivateDataSlotEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyPrivateDataSlotEXT:
-        Decode_vkDestroyPrivateDataSlotEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkSetPrivateDataEXT:
-        Decode_vkSetPrivateDataEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPrivateDataEXT:
-        Decode_vkGetPrivateDataEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetFragmentShadingRateEnumNV:
-        Decode_vkCmdSetFragmentShadingRateEnumNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkAcquireWinrtDisplayNV:
-        Decode_vkAcquireWinrtDisplayNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetWinrtDisplayNV:
-        Decode_vkGetWinrtDisplayNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateDirectFBSurfaceEXT:
-        Decode_vkCreateDirectFBSurfaceEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceDirectFBPresentationSupportEXT:
-        Decode_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetVertexInputEXT:
-        Decode_vkCmdSetVertexInputEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryZirconHandleFUCHSIA:
-        Decode_vkGetMemoryZirconHandleFUCHSIA(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryZirconHandlePropertiesFUCHSIA:
-        Decode_vkGetMemoryZirconHandlePropertiesFUCHSIA(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkImportSemaphoreZirconHandleFUCHSIA:
-        Decode_vkImportSemaphoreZirconHandleFUCHSIA(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetSemaphoreZirconHandleFUCHSIA:
-        Decode_vkGetSemaphoreZirconHandleFUCHSIA(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBindInvocationMaskHUAWEI:
-        Decode_vkCmdBindInvocationMaskHUAWEI(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetMemoryRemoteAddressNV:
-        Decode_vkGetMemoryRemoteAddressNV(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPatchControlPointsEXT:
-        Decode_vkCmdSetPatchControlPointsEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetRasterizerDiscardEnableEXT:
-        Decode_vkCmdSetRasterizerDiscardEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetDepthBiasEnableEXT:
-        Decode_vkCmdSetDepthBiasEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetLogicOpEXT:
-        Decode_vkCmdSetLogicOpEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetPrimitiveRestartEnableEXT:
-        Decode_vkCmdSetPrimitiveRestartEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateScreenSurfaceQNX:
-        Decode_vkCreateScreenSurfaceQNX(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetPhysicalDeviceScreenPresentationSupportQNX:
-        Decode_vkGetPhysicalDeviceScreenPresentationSupportQNX(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetColorWriteEnableEXT:
-        Decode_vkCmdSetColorWriteEnableEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawMultiEXT:
-        Decode_vkCmdDrawMultiEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdDrawMultiIndexedEXT:
-        Decode_vkCmdDrawMultiIndexedEXT(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateAccelerationStructureKHR:
-        Decode_vkCreateAccelerationStructureKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkDestroyAccelerationStructureKHR:
-        Decode_vkDestroyAccelerationStructureKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresKHR:
-        Decode_vkCmdBuildAccelerationStructuresKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdBuildAccelerationStructuresIndirectKHR:
-        Decode_vkCmdBuildAccelerationStructuresIndirectKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCopyAccelerationStructureToMemoryKHR:
-        Decode_vkCopyAccelerationStructureToMemoryKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCopyMemoryToAccelerationStructureKHR:
-        Decode_vkCopyMemoryToAccelerationStructureKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkWriteAccelerationStructuresPropertiesKHR:
-        Decode_vkWriteAccelerationStructuresPropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureKHR:
-        Decode_vkCmdCopyAccelerationStructureKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyAccelerationStructureToMemoryKHR:
-        Decode_vkCmdCopyAccelerationStructureToMemoryKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdCopyMemoryToAccelerationStructureKHR:
-        Decode_vkCmdCopyMemoryToAccelerationStructureKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetAccelerationStructureDeviceAddressKHR:
-        Decode_vkGetAccelerationStructureDeviceAddressKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdWriteAccelerationStructuresPropertiesKHR:
-        Decode_vkCmdWriteAccelerationStructuresPropertiesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetDeviceAccelerationStructureCompatibilityKHR:
-        Decode_vkGetDeviceAccelerationStructureCompatibilityKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetAccelerationStructureBuildSizesKHR:
-        Decode_vkGetAccelerationStructureBuildSizesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdTraceRaysKHR:
-        Decode_vkCmdTraceRaysKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCreateRayTracingPipelinesKHR:
-        Decode_vkCreateRayTracingPipelinesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR:
-        Decode_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdTraceRaysIndirectKHR:
-        Decode_vkCmdTraceRaysIndirectKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkGetRayTracingShaderGroupStackSizeKHR:
-        Decode_vkGetRayTracingShaderGroupStackSizeKHR(parameter_buffer, buffer_size);
-        break;
-    case format::ApiCallId::ApiCall_vkCmdSetRayTracingPipelineStackSizeKHR:
-        Decode_vkCmdSetRayTracingPipelineStackSizeKHR(parameter_buffer, buffer_size);
-        break;
+    // IDs below the first Vulkan API call ID wrap around to indices that are outside of the table.
+    const uint32_t index = static_cast<uint32_t>(call_id) - kFirstApiCallId;
+    if (index < kDecodeFunctionCount)
+    {
+        const DecodeFunction decode_function = kDecodeFunctionTable.functions[index];
+        if (decode_function != nullptr)
+        {
+            (this->*decode_function)(parameter_buffer, buffer_size);
+            return;
+        }
     }
+
+    VulkanDecoderBase::DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);
 }
 
 
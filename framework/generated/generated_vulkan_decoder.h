@@ -49,6 +49,9 @@ class VulkanDecoder : public VulkanDecoderBase
                                     const uint8_t*                parameter_buffer,
                                     size_t                        buffer_size) override;
 
+    // Returns the name of the Vulkan API call with the specified ID, or nullptr if the ID is not a Vulkan API call ID.
+    static const char* GetApiCallName(format::ApiCallId call_id);
+
   private:
     size_t Decode_vkCreateInstance(const uint8_t* parameter_buffer, size_t buffer_size);
 
@@ -973,6 +976,22 @@ class VulkanDecoder : public VulkanDecoderBase
     size_t Decode_vkGetRayTracingShaderGroupStackSizeKHR(const uint8_t* parameter_buffer, size_t buffer_size);
 
     size_t Decode_vkCmdSetRayTracingPipelineStackSizeKHR(const uint8_t* parameter_buffer, size_t buffer_size);
+
+    typedef size_t (VulkanDecoder::*DecodeFunction)(const uint8_t* parameter_buffer, size_t buffer_size);
+
+    // Decode functions are indexed by the API call ordinal, which is the API call ID minus the ID of the first Vulkan API call.
+    static constexpr uint32_t kFirstApiCallId      = format::ApiCallId::ApiCall_vkCreateInstance;
+    static constexpr uint32_t kDecodeFunctionCount = format::ApiCallId::ApiCall_VulkanLast - kFirstApiCallId;
+
+    struct DecodeFunctionTable
+    {
+        DecodeFunction functions[kDecodeFunctionCount];
+        const char*    names[kDecodeFunctionCount];
+    };
+
+    static constexpr DecodeFunctionTable MakeDecodeFunctionTable();
+
+    static const DecodeFunctionTable kDecodeFunctionTable;
 };
 
 GFXRECON_END_NAMESPACE(decode)
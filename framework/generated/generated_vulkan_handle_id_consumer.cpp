@@ -0,0 +1,7025 @@
+/*
+** Copyright (c) 2018-2021 Valve Corporation
+** Copyright (c) 2018-2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+/*
+** This file is generated from the Khronos Vulkan XML API Registry.
+**
+*/
+
+#include "generated/generated_vulkan_handle_id_consumer.h"
+
+#include "decode/custom_vulkan_struct_decoders.h"
+#include "generated/generated_vulkan_struct_decoders.h"
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(decode)
+
+void AddStructHandleIds(const Decoded_VkBufferMemoryBarrier* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageMemoryBarrier* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDeviceCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSubmitInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddHandleIds(&wrapper->pWaitSemaphores, handle_ids);
+
+        AddHandleIds(&wrapper->pCommandBuffers, handle_ids);
+
+        AddHandleIds(&wrapper->pSignalSemaphores, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMappedMemoryRange* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryAllocateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSparseMemoryBind* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSparseBufferMemoryBindInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pBinds, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSparseImageOpaqueMemoryBindInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pBinds, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSparseImageMemoryBind* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSparseImageMemoryBindInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pBinds, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBindSparseInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pWaitSemaphores, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pBufferBinds, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pImageOpaqueBinds, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pImageBinds, handle_ids);
+
+        AddHandleIds(&wrapper->pSignalSemaphores, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBufferViewCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageViewCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddHandleId(wrapper->image, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkShaderModuleCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPipelineShaderStageCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->module, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkComputePipelineCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddStructHandleIds(wrapper->stage, handle_ids);
+
+        AddHandleId(wrapper->layout, handle_ids);
+
+        AddHandleId(wrapper->basePipelineHandle, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGraphicsPipelineCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddStructArrayHandleIds(wrapper->pStages, handle_ids);
+
+        AddHandleId(wrapper->layout, handle_ids);
+
+        AddHandleId(wrapper->renderPass, handle_ids);
+
+        AddHandleId(wrapper->basePipelineHandle, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPipelineLayoutCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pSetLayouts, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSamplerCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyDescriptorSet* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcSet, handle_ids);
+
+        AddHandleId(wrapper->dstSet, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDescriptorBufferInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDescriptorSetAllocateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->descriptorPool, handle_ids);
+
+        AddHandleIds(&wrapper->pSetLayouts, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDescriptorSetLayoutBinding* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pImmutableSamplers, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDescriptorSetLayoutCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pBindings, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkFramebufferCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->renderPass, handle_ids);
+
+        AddHandleIds(&wrapper->pAttachments, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCommandBufferAllocateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->commandPool, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCommandBufferInheritanceInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->renderPass, handle_ids);
+
+        AddHandleId(wrapper->framebuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCommandBufferBeginInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pInheritanceInfo, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkRenderPassBeginInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddHandleId(wrapper->renderPass, handle_ids);
+
+        AddHandleId(wrapper->framebuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBindBufferMemoryInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBindImageMemoryInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddHandleId(wrapper->image, handle_ids);
+
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryDedicatedAllocateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPhysicalDeviceGroupProperties* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->physicalDevices, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDeviceGroupDeviceCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pPhysicalDevices, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBufferMemoryRequirementsInfo2* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageMemoryRequirementsInfo2* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageSparseMemoryRequirementsInfo2* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSamplerYcbcrConversionInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->conversion, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDescriptorUpdateTemplateCreateInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->descriptorSetLayout, handle_ids);
+
+        AddHandleId(wrapper->pipelineLayout, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkRenderPassAttachmentBeginInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pAttachments, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreWaitInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pSemaphores, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreSignalInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBufferDeviceAddressInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDeviceMemoryOpaqueCaptureAddressInfo* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSwapchainCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->surface, handle_ids);
+
+        AddHandleId(wrapper->oldSwapchain, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPresentInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pWaitSemaphores, handle_ids);
+
+        AddHandleIds(&wrapper->pSwapchains, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageSwapchainCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->swapchain, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBindImageMemorySwapchainInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->swapchain, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAcquireNextImageInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->swapchain, handle_ids);
+
+        AddHandleId(wrapper->semaphore, handle_ids);
+
+        AddHandleId(wrapper->fence, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayModePropertiesKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->displayMode, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayPlanePropertiesKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->currentDisplay, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayPropertiesKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->display, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplaySurfaceCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->displayMode, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryGetWin32HandleInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryGetFdInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkWin32KeyedMutexAcquireReleaseInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pAcquireSyncs, handle_ids);
+
+        AddHandleIds(&wrapper->pReleaseSyncs, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImportSemaphoreWin32HandleInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreGetWin32HandleInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImportSemaphoreFdInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreGetFdInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImportFenceWin32HandleInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->fence, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkFenceGetWin32HandleInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->fence, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImportFenceFdInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->fence, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkFenceGetFdInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->fence, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPhysicalDeviceSurfaceInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->surface, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayProperties2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->displayProperties, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayPlaneProperties2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->displayPlaneProperties, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayModeProperties2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->displayModeProperties, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDisplayPlaneInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->mode, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPipelineInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->pipeline, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPipelineExecutableInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->pipeline, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkPipelineLibraryCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pLibraries, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBufferMemoryBarrier2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageMemoryBarrier2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDependencyInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pBufferMemoryBarriers, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pImageMemoryBarriers, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreSubmitInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCommandBufferSubmitInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->commandBuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSubmitInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        if (wrapper->pNext)
+        {
+            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);
+        }
+
+        AddStructArrayHandleIds(wrapper->pWaitSemaphoreInfos, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pCommandBufferInfos, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pSignalSemaphoreInfos, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyBufferInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcBuffer, handle_ids);
+
+        AddHandleId(wrapper->dstBuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyImageInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcImage, handle_ids);
+
+        AddHandleId(wrapper->dstImage, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyBufferToImageInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcBuffer, handle_ids);
+
+        AddHandleId(wrapper->dstImage, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyImageToBufferInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcImage, handle_ids);
+
+        AddHandleId(wrapper->dstBuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBlitImageInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcImage, handle_ids);
+
+        AddHandleId(wrapper->dstImage, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkResolveImageInfo2KHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcImage, handle_ids);
+
+        AddHandleId(wrapper->dstImage, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDebugMarkerObjectNameInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->object, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDebugMarkerObjectTagInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->object, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDedicatedAllocationMemoryAllocateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->image, handle_ids);
+
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImageViewHandleInfoNVX* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->imageView, handle_ids);
+
+        AddHandleId(wrapper->sampler, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkWin32KeyedMutexAcquireReleaseInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pAcquireSyncs, handle_ids);
+
+        AddHandleIds(&wrapper->pReleaseSyncs, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkConditionalRenderingBeginInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDebugUtilsObjectNameInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->objectHandle, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkDebugUtilsObjectTagInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->objectHandle, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryGetAndroidHardwareBufferInfoANDROID* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkShaderModuleValidationCacheCreateInfoEXT* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->validationCache, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkRayTracingPipelineCreateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pStages, handle_ids);
+
+        AddHandleId(wrapper->layout, handle_ids);
+
+        AddHandleId(wrapper->basePipelineHandle, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeometryTrianglesNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->vertexData, handle_ids);
+
+        AddHandleId(wrapper->indexData, handle_ids);
+
+        AddHandleId(wrapper->transformData, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeometryAABBNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->aabbData, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeometryDataNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->triangles, handle_ids);
+
+        AddStructHandleIds(wrapper->aabbs, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeometryNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->geometry, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pGeometries, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureCreateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructHandleIds(wrapper->info, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkBindAccelerationStructureMemoryInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->accelerationStructure, handle_ids);
+
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkWriteDescriptorSetAccelerationStructureNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pAccelerationStructures, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureMemoryRequirementsInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->accelerationStructure, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGraphicsShaderGroupCreateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pStages, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGraphicsPipelineShaderGroupsCreateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pGroups, handle_ids);
+
+        AddHandleIds(&wrapper->pPipelines, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkIndirectCommandsStreamNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkIndirectCommandsLayoutTokenNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->pushconstantPipelineLayout, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkIndirectCommandsLayoutCreateInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pTokens, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeneratedCommandsInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->pipeline, handle_ids);
+
+        AddHandleId(wrapper->indirectCommandsLayout, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pStreams, handle_ids);
+
+        AddHandleId(wrapper->preprocessBuffer, handle_ids);
+
+        AddHandleId(wrapper->sequencesCountBuffer, handle_ids);
+
+        AddHandleId(wrapper->sequencesIndexBuffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkGeneratedCommandsMemoryRequirementsInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->pipeline, handle_ids);
+
+        AddHandleId(wrapper->indirectCommandsLayout, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryGetZirconHandleInfoFUCHSIA* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkImportSemaphoreZirconHandleInfoFUCHSIA* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkSemaphoreGetZirconHandleInfoFUCHSIA* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->semaphore, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkMemoryGetRemoteAddressInfoNV* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->memory, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureBuildGeometryInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->srcAccelerationStructure, handle_ids);
+
+        AddHandleId(wrapper->dstAccelerationStructure, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->buffer, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkWriteDescriptorSetAccelerationStructureKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleIds(&wrapper->pAccelerationStructures, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkAccelerationStructureDeviceAddressInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->accelerationStructure, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyAccelerationStructureToMemoryInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->src, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyMemoryToAccelerationStructureInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->dst, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkCopyAccelerationStructureInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddHandleId(wrapper->src, handle_ids);
+
+        AddHandleId(wrapper->dst, handle_ids);
+    }
+}
+
+void AddStructHandleIds(const Decoded_VkRayTracingPipelineCreateInfoKHR* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if (wrapper != nullptr)
+    {
+        AddStructArrayHandleIds(wrapper->pStages, handle_ids);
+
+        AddStructArrayHandleIds(wrapper->pLibraryInfo, handle_ids);
+
+        AddHandleId(wrapper->layout, handle_ids);
+
+        AddHandleId(wrapper->basePipelineHandle, handle_ids);
+    }
+}
+
+void AddPNextStructHandleIds(const void* value, const void* wrapper, std::vector<format::HandleId>* handle_ids)
+{
+    if ((value != nullptr) && (wrapper != nullptr))
+    {
+        const VkBaseInStructure* base = reinterpret_cast<const VkBaseInStructure*>(value);
+
+        switch (base->sType)
+        {
+        default:
+            break;
+        case VK_STRUCTURE_TYPE_MEMORY_DEDICATED_ALLOCATE_INFO:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkMemoryDedicatedAllocateInfo*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_DEVICE_GROUP_DEVICE_CREATE_INFO:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkDeviceGroupDeviceCreateInfo*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_SAMPLER_YCBCR_CONVERSION_INFO:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkSamplerYcbcrConversionInfo*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_RENDER_PASS_ATTACHMENT_BEGIN_INFO:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkRenderPassAttachmentBeginInfo*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_IMAGE_SWAPCHAIN_CREATE_INFO_KHR:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkImageSwapchainCreateInfoKHR*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_BIND_IMAGE_MEMORY_SWAPCHAIN_INFO_KHR:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkBindImageMemorySwapchainInfoKHR*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_KHR:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkWin32KeyedMutexAcquireReleaseInfoKHR*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_DEDICATED_ALLOCATION_MEMORY_ALLOCATE_INFO_NV:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkDedicatedAllocationMemoryAllocateInfoNV*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_WIN32_KEYED_MUTEX_ACQUIRE_RELEASE_INFO_NV:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkWin32KeyedMutexAcquireReleaseInfoNV*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_SHADER_MODULE_VALIDATION_CACHE_CREATE_INFO_EXT:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkShaderModuleValidationCacheCreateInfoEXT*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_NV:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkWriteDescriptorSetAccelerationStructureNV*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_GRAPHICS_PIPELINE_SHADER_GROUPS_CREATE_INFO_NV:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkGraphicsPipelineShaderGroupsCreateInfoNV*>(wrapper), handle_ids);
+            break;
+        case VK_STRUCTURE_TYPE_WRITE_DESCRIPTOR_SET_ACCELERATION_STRUCTURE_KHR:
+            AddStructHandleIds(reinterpret_cast<const Decoded_VkWriteDescriptorSetAccelerationStructureKHR*>(wrapper), handle_ids);
+            break;
+        }
+    }
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateInstance(
+    VkResult                                    returnValue,
+    StructPointerDecoder<Decoded_VkInstanceCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkInstance>*           pInstance)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleIds(pInstance, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyInstance(
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkEnumeratePhysicalDevices(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    PointerDecoder<uint32_t>*                   pPhysicalDeviceCount,
+    HandlePointerDecoder<VkPhysicalDevice>*     pPhysicalDevices)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPhysicalDeviceCount);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pPhysicalDevices, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFeatures(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceFeatures>* pFeatures)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFeatures);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFormatProperties(
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    StructPointerDecoder<Decoded_VkFormatProperties>* pFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(pFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceImageFormatProperties(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    VkImageType                                 type,
+    VkImageTiling                               tiling,
+    VkImageUsageFlags                           usage,
+    VkImageCreateFlags                          flags,
+    StructPointerDecoder<Decoded_VkImageFormatProperties>* pImageFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(type);
+    GFXRECON_UNREFERENCED_PARAMETER(tiling);
+    GFXRECON_UNREFERENCED_PARAMETER(usage);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+    GFXRECON_UNREFERENCED_PARAMETER(pImageFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceProperties(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceProperties>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties(
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pQueueFamilyPropertyCount,
+    StructPointerDecoder<Decoded_VkQueueFamilyProperties>* pQueueFamilyProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceMemoryProperties(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceMemoryProperties>* pMemoryProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDevice(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkDeviceCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDevice>*             pDevice)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDevice(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceQueue(
+    format::HandleId                            device,
+    uint32_t                                    queueFamilyIndex,
+    uint32_t                                    queueIndex,
+    HandlePointerDecoder<VkQueue>*              pQueue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(queueIndex);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pQueue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueSubmit(
+    VkResult                                    returnValue,
+    format::HandleId                            queue,
+    uint32_t                                    submitCount,
+    StructPointerDecoder<Decoded_VkSubmitInfo>* pSubmits,
+    format::HandleId                            fence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(submitCount);
+
+    AddHandleId(queue, GetHandleIdList());
+    AddStructArrayHandleIds(pSubmits, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueWaitIdle(
+    VkResult                                    returnValue,
+    format::HandleId                            queue)
+{
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDeviceWaitIdle(
+    VkResult                                    returnValue,
+    format::HandleId                            device)
+{
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAllocateMemory(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryAllocateInfo>* pAllocateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDeviceMemory>*       pMemory)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pAllocateInfo, GetHandleIdList());
+    AddHandleIds(pMemory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkFreeMemory(
+    format::HandleId                            device,
+    format::HandleId                            memory,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkMapMemory(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            memory,
+    VkDeviceSize                                offset,
+    VkDeviceSize                                size,
+    VkMemoryMapFlags                            flags,
+    PointerDecoder<uint64_t, void*>*            ppData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(size);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+    GFXRECON_UNREFERENCED_PARAMETER(ppData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkUnmapMemory(
+    format::HandleId                            device,
+    format::HandleId                            memory)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkFlushMappedMemoryRanges(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    memoryRangeCount,
+    StructPointerDecoder<Decoded_VkMappedMemoryRange>* pMemoryRanges)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(memoryRangeCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pMemoryRanges, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkInvalidateMappedMemoryRanges(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    memoryRangeCount,
+    StructPointerDecoder<Decoded_VkMappedMemoryRange>* pMemoryRanges)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(memoryRangeCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pMemoryRanges, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceMemoryCommitment(
+    format::HandleId                            device,
+    format::HandleId                            memory,
+    PointerDecoder<VkDeviceSize>*               pCommittedMemoryInBytes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCommittedMemoryInBytes);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindBufferMemory(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            buffer,
+    format::HandleId                            memory,
+    VkDeviceSize                                memoryOffset)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(memoryOffset);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindImageMemory(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            image,
+    format::HandleId                            memory,
+    VkDeviceSize                                memoryOffset)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(memoryOffset);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferMemoryRequirements(
+    format::HandleId                            device,
+    format::HandleId                            buffer,
+    StructPointerDecoder<Decoded_VkMemoryRequirements>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageMemoryRequirements(
+    format::HandleId                            device,
+    format::HandleId                            image,
+    StructPointerDecoder<Decoded_VkMemoryRequirements>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageSparseMemoryRequirements(
+    format::HandleId                            device,
+    format::HandleId                            image,
+    PointerDecoder<uint32_t>*                   pSparseMemoryRequirementCount,
+    StructPointerDecoder<Decoded_VkSparseImageMemoryRequirements>* pSparseMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirementCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties(
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    VkImageType                                 type,
+    VkSampleCountFlagBits                       samples,
+    VkImageUsageFlags                           usage,
+    VkImageTiling                               tiling,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkSparseImageFormatProperties>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(type);
+    GFXRECON_UNREFERENCED_PARAMETER(samples);
+    GFXRECON_UNREFERENCED_PARAMETER(usage);
+    GFXRECON_UNREFERENCED_PARAMETER(tiling);
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueBindSparse(
+    VkResult                                    returnValue,
+    format::HandleId                            queue,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindSparseInfo>* pBindInfo,
+    format::HandleId                            fence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(queue, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfo, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateFence(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkFenceCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkFence>*              pFence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pFence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyFence(
+    format::HandleId                            device,
+    format::HandleId                            fence,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetFences(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    fenceCount,
+    HandlePointerDecoder<VkFence>*              pFences)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(fenceCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pFences, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetFenceStatus(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            fence)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkWaitForFences(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    fenceCount,
+    HandlePointerDecoder<VkFence>*              pFences,
+    VkBool32                                    waitAll,
+    uint64_t                                    timeout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(fenceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(waitAll);
+    GFXRECON_UNREFERENCED_PARAMETER(timeout);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pFences, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSemaphore(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSemaphore>*          pSemaphore)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pSemaphore, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySemaphore(
+    format::HandleId                            device,
+    format::HandleId                            semaphore,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(semaphore, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateEvent(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkEventCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkEvent>*              pEvent)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pEvent, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyEvent(
+    format::HandleId                            device,
+    format::HandleId                            event,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetEventStatus(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            event)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetEvent(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            event)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetEvent(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            event)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateQueryPool(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkQueryPoolCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkQueryPool>*          pQueryPool)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pQueryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyQueryPool(
+    format::HandleId                            device,
+    format::HandleId                            queryPool,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetQueryPoolResults(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery,
+    uint32_t                                    queryCount,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData,
+    VkDeviceSize                                stride,
+    VkQueryResultFlags                          flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+    GFXRECON_UNREFERENCED_PARAMETER(queryCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateBuffer(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkBuffer>*             pBuffer)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyBuffer(
+    format::HandleId                            device,
+    format::HandleId                            buffer,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateBufferView(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferViewCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkBufferView>*         pView)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyBufferView(
+    format::HandleId                            device,
+    format::HandleId                            bufferView,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(bufferView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateImage(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkImage>*              pImage)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pImage, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyImage(
+    format::HandleId                            device,
+    format::HandleId                            image,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageSubresourceLayout(
+    format::HandleId                            device,
+    format::HandleId                            image,
+    StructPointerDecoder<Decoded_VkImageSubresource>* pSubresource,
+    StructPointerDecoder<Decoded_VkSubresourceLayout>* pLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubresource);
+    GFXRECON_UNREFERENCED_PARAMETER(pLayout);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateImageView(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageViewCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkImageView>*          pView)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyImageView(
+    format::HandleId                            device,
+    format::HandleId                            imageView,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(imageView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateShaderModule(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkShaderModuleCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkShaderModule>*       pShaderModule)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pShaderModule, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyShaderModule(
+    format::HandleId                            device,
+    format::HandleId                            shaderModule,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(shaderModule, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreatePipelineCache(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPipelineCacheCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipelineCache>*      pPipelineCache)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pPipelineCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyPipelineCache(
+    format::HandleId                            device,
+    format::HandleId                            pipelineCache,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPipelineCacheData(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipelineCache,
+    PointerDecoder<size_t>*                     pDataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkMergePipelineCaches(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            dstCache,
+    uint32_t                                    srcCacheCount,
+    HandlePointerDecoder<VkPipelineCache>*      pSrcCaches)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcCacheCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(dstCache, GetHandleIdList());
+    AddHandleIds(pSrcCaches, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateGraphicsPipelines(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipelineCache,
+    uint32_t                                    createInfoCount,
+    StructPointerDecoder<Decoded_VkGraphicsPipelineCreateInfo>* pCreateInfos,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipeline>*           pPipelines)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(createInfoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfos, GetHandleIdList());
+    AddHandleIds(pPipelines, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateComputePipelines(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipelineCache,
+    uint32_t                                    createInfoCount,
+    StructPointerDecoder<Decoded_VkComputePipelineCreateInfo>* pCreateInfos,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipeline>*           pPipelines)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(createInfoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfos, GetHandleIdList());
+    AddHandleIds(pPipelines, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyPipeline(
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreatePipelineLayout(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPipelineLayoutCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipelineLayout>*     pPipelineLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pPipelineLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyPipelineLayout(
+    format::HandleId                            device,
+    format::HandleId                            pipelineLayout,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSampler(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSamplerCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSampler>*            pSampler)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pSampler, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySampler(
+    format::HandleId                            device,
+    format::HandleId                            sampler,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(sampler, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDescriptorSetLayout(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorSetLayoutCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDescriptorSetLayout>* pSetLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pSetLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDescriptorSetLayout(
+    format::HandleId                            device,
+    format::HandleId                            descriptorSetLayout,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorSetLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDescriptorPool(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorPoolCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDescriptorPool>*     pDescriptorPool)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pDescriptorPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDescriptorPool(
+    format::HandleId                            device,
+    format::HandleId                            descriptorPool,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetDescriptorPool(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            descriptorPool,
+    VkDescriptorPoolResetFlags                  flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAllocateDescriptorSets(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorSetAllocateInfo>* pAllocateInfo,
+    HandlePointerDecoder<VkDescriptorSet>*      pDescriptorSets)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pAllocateInfo, GetHandleIdList());
+    AddHandleIds(pDescriptorSets, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkFreeDescriptorSets(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            descriptorPool,
+    uint32_t                                    descriptorSetCount,
+    HandlePointerDecoder<VkDescriptorSet>*      pDescriptorSets)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(descriptorSetCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorPool, GetHandleIdList());
+    AddHandleIds(pDescriptorSets, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkUpdateDescriptorSets(
+    format::HandleId                            device,
+    uint32_t                                    descriptorWriteCount,
+    StructPointerDecoder<Decoded_VkWriteDescriptorSet>* pDescriptorWrites,
+    uint32_t                                    descriptorCopyCount,
+    StructPointerDecoder<Decoded_VkCopyDescriptorSet>* pDescriptorCopies)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(descriptorWriteCount);
+    GFXRECON_UNREFERENCED_PARAMETER(descriptorCopyCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pDescriptorWrites, GetHandleIdList());
+    AddStructArrayHandleIds(pDescriptorCopies, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateFramebuffer(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkFramebufferCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkFramebuffer>*        pFramebuffer)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pFramebuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyFramebuffer(
+    format::HandleId                            device,
+    format::HandleId                            framebuffer,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(framebuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateRenderPass(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkRenderPassCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkRenderPass>*         pRenderPass)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pRenderPass, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyRenderPass(
+    format::HandleId                            device,
+    format::HandleId                            renderPass,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(renderPass, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRenderAreaGranularity(
+    format::HandleId                            device,
+    format::HandleId                            renderPass,
+    StructPointerDecoder<Decoded_VkExtent2D>*   pGranularity)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pGranularity);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(renderPass, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateCommandPool(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkCommandPoolCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkCommandPool>*        pCommandPool)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pCommandPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyCommandPool(
+    format::HandleId                            device,
+    format::HandleId                            commandPool,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(commandPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetCommandPool(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            commandPool,
+    VkCommandPoolResetFlags                     flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(commandPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAllocateCommandBuffers(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkCommandBufferAllocateInfo>* pAllocateInfo,
+    HandlePointerDecoder<VkCommandBuffer>*      pCommandBuffers)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pAllocateInfo, GetHandleIdList());
+    AddHandleIds(pCommandBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkFreeCommandBuffers(
+    format::HandleId                            device,
+    format::HandleId                            commandPool,
+    uint32_t                                    commandBufferCount,
+    HandlePointerDecoder<VkCommandBuffer>*      pCommandBuffers)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(commandBufferCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(commandPool, GetHandleIdList());
+    AddHandleIds(pCommandBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBeginCommandBuffer(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCommandBufferBeginInfo>* pBeginInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pBeginInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkEndCommandBuffer(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetCommandBuffer(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer,
+    VkCommandBufferResetFlags                   flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindPipeline(
+    format::HandleId                            commandBuffer,
+    VkPipelineBindPoint                         pipelineBindPoint,
+    format::HandleId                            pipeline)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineBindPoint);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetViewport(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstViewport,
+    uint32_t                                    viewportCount,
+    StructPointerDecoder<Decoded_VkViewport>*   pViewports)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstViewport);
+    GFXRECON_UNREFERENCED_PARAMETER(viewportCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pViewports);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetScissor(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstScissor,
+    uint32_t                                    scissorCount,
+    StructPointerDecoder<Decoded_VkRect2D>*     pScissors)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstScissor);
+    GFXRECON_UNREFERENCED_PARAMETER(scissorCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pScissors);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetLineWidth(
+    format::HandleId                            commandBuffer,
+    float                                       lineWidth)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(lineWidth);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthBias(
+    format::HandleId                            commandBuffer,
+    float                                       depthBiasConstantFactor,
+    float                                       depthBiasClamp,
+    float                                       depthBiasSlopeFactor)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthBiasConstantFactor);
+    GFXRECON_UNREFERENCED_PARAMETER(depthBiasClamp);
+    GFXRECON_UNREFERENCED_PARAMETER(depthBiasSlopeFactor);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetBlendConstants(
+    format::HandleId                            commandBuffer,
+    PointerDecoder<float>*                      blendConstants)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(blendConstants);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthBounds(
+    format::HandleId                            commandBuffer,
+    float                                       minDepthBounds,
+    float                                       maxDepthBounds)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(minDepthBounds);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDepthBounds);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetStencilCompareMask(
+    format::HandleId                            commandBuffer,
+    VkStencilFaceFlags                          faceMask,
+    uint32_t                                    compareMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(faceMask);
+    GFXRECON_UNREFERENCED_PARAMETER(compareMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetStencilWriteMask(
+    format::HandleId                            commandBuffer,
+    VkStencilFaceFlags                          faceMask,
+    uint32_t                                    writeMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(faceMask);
+    GFXRECON_UNREFERENCED_PARAMETER(writeMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetStencilReference(
+    format::HandleId                            commandBuffer,
+    VkStencilFaceFlags                          faceMask,
+    uint32_t                                    reference)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(faceMask);
+    GFXRECON_UNREFERENCED_PARAMETER(reference);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindDescriptorSets(
+    format::HandleId                            commandBuffer,
+    VkPipelineBindPoint                         pipelineBindPoint,
+    format::HandleId                            layout,
+    uint32_t                                    firstSet,
+    uint32_t                                    descriptorSetCount,
+    HandlePointerDecoder<VkDescriptorSet>*      pDescriptorSets,
+    uint32_t                                    dynamicOffsetCount,
+    PointerDecoder<uint32_t>*                   pDynamicOffsets)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineBindPoint);
+    GFXRECON_UNREFERENCED_PARAMETER(firstSet);
+    GFXRECON_UNREFERENCED_PARAMETER(descriptorSetCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dynamicOffsetCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pDynamicOffsets);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(layout, GetHandleIdList());
+    AddHandleIds(pDescriptorSets, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindIndexBuffer(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    VkIndexType                                 indexType)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(indexType);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindVertexBuffers(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstBinding,
+    uint32_t                                    bindingCount,
+    HandlePointerDecoder<VkBuffer>*             pBuffers,
+    PointerDecoder<VkDeviceSize>*               pOffsets)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstBinding);
+    GFXRECON_UNREFERENCED_PARAMETER(bindingCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pOffsets);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDraw(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    vertexCount,
+    uint32_t                                    instanceCount,
+    uint32_t                                    firstVertex,
+    uint32_t                                    firstInstance)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(vertexCount);
+    GFXRECON_UNREFERENCED_PARAMETER(instanceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstVertex);
+    GFXRECON_UNREFERENCED_PARAMETER(firstInstance);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndexed(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    indexCount,
+    uint32_t                                    instanceCount,
+    uint32_t                                    firstIndex,
+    int32_t                                     vertexOffset,
+    uint32_t                                    firstInstance)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(indexCount);
+    GFXRECON_UNREFERENCED_PARAMETER(instanceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(vertexOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(firstInstance);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndirect(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    uint32_t                                    drawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(drawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndexedIndirect(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    uint32_t                                    drawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(drawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDispatch(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    groupCountX,
+    uint32_t                                    groupCountY,
+    uint32_t                                    groupCountZ)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountX);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountY);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountZ);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDispatchIndirect(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyBuffer(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcBuffer,
+    format::HandleId                            dstBuffer,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkBufferCopy>* pRegions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcBuffer, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcImage,
+    VkImageLayout                               srcImageLayout,
+    format::HandleId                            dstImage,
+    VkImageLayout                               dstImageLayout,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkImageCopy>*  pRegions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(dstImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcImage, GetHandleIdList());
+    AddHandleId(dstImage, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBlitImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcImage,
+    VkImageLayout                               srcImageLayout,
+    format::HandleId                            dstImage,
+    VkImageLayout                               dstImageLayout,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkImageBlit>*  pRegions,
+    VkFilter                                    filter)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(dstImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+    GFXRECON_UNREFERENCED_PARAMETER(filter);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcImage, GetHandleIdList());
+    AddHandleId(dstImage, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyBufferToImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcBuffer,
+    format::HandleId                            dstImage,
+    VkImageLayout                               dstImageLayout,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkBufferImageCopy>* pRegions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dstImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcBuffer, GetHandleIdList());
+    AddHandleId(dstImage, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyImageToBuffer(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcImage,
+    VkImageLayout                               srcImageLayout,
+    format::HandleId                            dstBuffer,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkBufferImageCopy>* pRegions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcImage, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdUpdateBuffer(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            dstBuffer,
+    VkDeviceSize                                dstOffset,
+    VkDeviceSize                                dataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dstOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdFillBuffer(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            dstBuffer,
+    VkDeviceSize                                dstOffset,
+    VkDeviceSize                                size,
+    uint32_t                                    data)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dstOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(size);
+    GFXRECON_UNREFERENCED_PARAMETER(data);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdClearColorImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            image,
+    VkImageLayout                               imageLayout,
+    StructPointerDecoder<Decoded_VkClearColorValue>* pColor,
+    uint32_t                                    rangeCount,
+    StructPointerDecoder<Decoded_VkImageSubresourceRange>* pRanges)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(imageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(pColor);
+    GFXRECON_UNREFERENCED_PARAMETER(rangeCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRanges);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdClearDepthStencilImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            image,
+    VkImageLayout                               imageLayout,
+    StructPointerDecoder<Decoded_VkClearDepthStencilValue>* pDepthStencil,
+    uint32_t                                    rangeCount,
+    StructPointerDecoder<Decoded_VkImageSubresourceRange>* pRanges)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(imageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(pDepthStencil);
+    GFXRECON_UNREFERENCED_PARAMETER(rangeCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRanges);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdClearAttachments(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    attachmentCount,
+    StructPointerDecoder<Decoded_VkClearAttachment>* pAttachments,
+    uint32_t                                    rectCount,
+    StructPointerDecoder<Decoded_VkClearRect>*  pRects)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(attachmentCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAttachments);
+    GFXRECON_UNREFERENCED_PARAMETER(rectCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRects);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdResolveImage(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            srcImage,
+    VkImageLayout                               srcImageLayout,
+    format::HandleId                            dstImage,
+    VkImageLayout                               dstImageLayout,
+    uint32_t                                    regionCount,
+    StructPointerDecoder<Decoded_VkImageResolve>* pRegions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(dstImageLayout);
+    GFXRECON_UNREFERENCED_PARAMETER(regionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRegions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(srcImage, GetHandleIdList());
+    AddHandleId(dstImage, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetEvent(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            event,
+    VkPipelineStageFlags                        stageMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stageMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdResetEvent(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            event,
+    VkPipelineStageFlags                        stageMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stageMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWaitEvents(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    eventCount,
+    HandlePointerDecoder<VkEvent>*              pEvents,
+    VkPipelineStageFlags                        srcStageMask,
+    VkPipelineStageFlags                        dstStageMask,
+    uint32_t                                    memoryBarrierCount,
+    StructPointerDecoder<Decoded_VkMemoryBarrier>* pMemoryBarriers,
+    uint32_t                                    bufferMemoryBarrierCount,
+    StructPointerDecoder<Decoded_VkBufferMemoryBarrier>* pBufferMemoryBarriers,
+    uint32_t                                    imageMemoryBarrierCount,
+    StructPointerDecoder<Decoded_VkImageMemoryBarrier>* pImageMemoryBarriers)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(eventCount);
+    GFXRECON_UNREFERENCED_PARAMETER(srcStageMask);
+    GFXRECON_UNREFERENCED_PARAMETER(dstStageMask);
+    GFXRECON_UNREFERENCED_PARAMETER(memoryBarrierCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryBarriers);
+    GFXRECON_UNREFERENCED_PARAMETER(bufferMemoryBarrierCount);
+    GFXRECON_UNREFERENCED_PARAMETER(imageMemoryBarrierCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pEvents, GetHandleIdList());
+    AddStructArrayHandleIds(pBufferMemoryBarriers, GetHandleIdList());
+    AddStructArrayHandleIds(pImageMemoryBarriers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdPipelineBarrier(
+    format::HandleId                            commandBuffer,
+    VkPipelineStageFlags                        srcStageMask,
+    VkPipelineStageFlags                        dstStageMask,
+    VkDependencyFlags                           dependencyFlags,
+    uint32_t                                    memoryBarrierCount,
+    StructPointerDecoder<Decoded_VkMemoryBarrier>* pMemoryBarriers,
+    uint32_t                                    bufferMemoryBarrierCount,
+    StructPointerDecoder<Decoded_VkBufferMemoryBarrier>* pBufferMemoryBarriers,
+    uint32_t                                    imageMemoryBarrierCount,
+    StructPointerDecoder<Decoded_VkImageMemoryBarrier>* pImageMemoryBarriers)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcStageMask);
+    GFXRECON_UNREFERENCED_PARAMETER(dstStageMask);
+    GFXRECON_UNREFERENCED_PARAMETER(dependencyFlags);
+    GFXRECON_UNREFERENCED_PARAMETER(memoryBarrierCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryBarriers);
+    GFXRECON_UNREFERENCED_PARAMETER(bufferMemoryBarrierCount);
+    GFXRECON_UNREFERENCED_PARAMETER(imageMemoryBarrierCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pBufferMemoryBarriers, GetHandleIdList());
+    AddStructArrayHandleIds(pImageMemoryBarriers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginQuery(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    query,
+    VkQueryControlFlags                         flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndQuery(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    query)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdResetQueryPool(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery,
+    uint32_t                                    queryCount)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+    GFXRECON_UNREFERENCED_PARAMETER(queryCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteTimestamp(
+    format::HandleId                            commandBuffer,
+    VkPipelineStageFlagBits                     pipelineStage,
+    format::HandleId                            queryPool,
+    uint32_t                                    query)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineStage);
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyQueryPoolResults(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery,
+    uint32_t                                    queryCount,
+    format::HandleId                            dstBuffer,
+    VkDeviceSize                                dstOffset,
+    VkDeviceSize                                stride,
+    VkQueryResultFlags                          flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+    GFXRECON_UNREFERENCED_PARAMETER(queryCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dstOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdPushConstants(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            layout,
+    VkShaderStageFlags                          stageFlags,
+    uint32_t                                    offset,
+    uint32_t                                    size,
+    PointerDecoder<uint8_t>*                    pValues)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stageFlags);
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(size);
+    GFXRECON_UNREFERENCED_PARAMETER(pValues);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(layout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginRenderPass(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
+    VkSubpassContents                           contents)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(contents);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pRenderPassBegin, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdNextSubpass(
+    format::HandleId                            commandBuffer,
+    VkSubpassContents                           contents)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(contents);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndRenderPass(
+    format::HandleId                            commandBuffer)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdExecuteCommands(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    commandBufferCount,
+    HandlePointerDecoder<VkCommandBuffer>*      pCommandBuffers)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(commandBufferCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pCommandBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindBufferMemory2(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindBufferMemoryInfo>* pBindInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindImageMemory2(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindImageMemoryInfo>* pBindInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceGroupPeerMemoryFeatures(
+    format::HandleId                            device,
+    uint32_t                                    heapIndex,
+    uint32_t                                    localDeviceIndex,
+    uint32_t                                    remoteDeviceIndex,
+    PointerDecoder<VkPeerMemoryFeatureFlags>*   pPeerMemoryFeatures)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(heapIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(localDeviceIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(remoteDeviceIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pPeerMemoryFeatures);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDeviceMask(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    deviceMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(deviceMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDispatchBase(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    baseGroupX,
+    uint32_t                                    baseGroupY,
+    uint32_t                                    baseGroupZ,
+    uint32_t                                    groupCountX,
+    uint32_t                                    groupCountY,
+    uint32_t                                    groupCountZ)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupX);
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupY);
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupZ);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountX);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountY);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountZ);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkEnumeratePhysicalDeviceGroups(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    PointerDecoder<uint32_t>*                   pPhysicalDeviceGroupCount,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceGroupProperties>* pPhysicalDeviceGroupProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPhysicalDeviceGroupCount);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddStructArrayHandleIds(pPhysicalDeviceGroupProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageMemoryRequirements2(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageMemoryRequirementsInfo2>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferMemoryRequirements2(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferMemoryRequirementsInfo2>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageSparseMemoryRequirements2(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageSparseMemoryRequirementsInfo2>* pInfo,
+    PointerDecoder<uint32_t>*                   pSparseMemoryRequirementCount,
+    StructPointerDecoder<Decoded_VkSparseImageMemoryRequirements2>* pSparseMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirementCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFeatures2(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceFeatures2>* pFeatures)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFeatures);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceProperties2(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceProperties2>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFormatProperties2(
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    StructPointerDecoder<Decoded_VkFormatProperties2>* pFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(pFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceImageFormatInfo2>* pImageFormatInfo,
+    StructPointerDecoder<Decoded_VkImageFormatProperties2>* pImageFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pImageFormatInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pImageFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2(
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pQueueFamilyPropertyCount,
+    StructPointerDecoder<Decoded_VkQueueFamilyProperties2>* pQueueFamilyProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceMemoryProperties2(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceMemoryProperties2>* pMemoryProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties2(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSparseImageFormatInfo2>* pFormatInfo,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkSparseImageFormatProperties2>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFormatInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkTrimCommandPool(
+    format::HandleId                            device,
+    format::HandleId                            commandPool,
+    VkCommandPoolTrimFlags                      flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(commandPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceQueue2(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDeviceQueueInfo2>* pQueueInfo,
+    HandlePointerDecoder<VkQueue>*              pQueue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueInfo);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pQueue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSamplerYcbcrConversion(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSamplerYcbcrConversionCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSamplerYcbcrConversion>* pYcbcrConversion)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pYcbcrConversion, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySamplerYcbcrConversion(
+    format::HandleId                            device,
+    format::HandleId                            ycbcrConversion,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(ycbcrConversion, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDescriptorUpdateTemplate(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorUpdateTemplateCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDescriptorUpdateTemplate>* pDescriptorUpdateTemplate)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pDescriptorUpdateTemplate, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDescriptorUpdateTemplate(
+    format::HandleId                            device,
+    format::HandleId                            descriptorUpdateTemplate,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorUpdateTemplate, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalBufferProperties(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalBufferInfo>* pExternalBufferInfo,
+    StructPointerDecoder<Decoded_VkExternalBufferProperties>* pExternalBufferProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalBufferInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalBufferProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalFenceProperties(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalFenceInfo>* pExternalFenceInfo,
+    StructPointerDecoder<Decoded_VkExternalFenceProperties>* pExternalFenceProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalFenceInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalFenceProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalSemaphoreProperties(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalSemaphoreInfo>* pExternalSemaphoreInfo,
+    StructPointerDecoder<Decoded_VkExternalSemaphoreProperties>* pExternalSemaphoreProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalSemaphoreInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalSemaphoreProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDescriptorSetLayoutSupport(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorSetLayoutCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkDescriptorSetLayoutSupport>* pSupport)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSupport);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndirectCount(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndexedIndirectCount(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateRenderPass2(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkRenderPassCreateInfo2>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkRenderPass>*         pRenderPass)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pRenderPass, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginRenderPass2(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
+    StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassBeginInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pRenderPassBegin, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdNextSubpass2(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo,
+    StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassBeginInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassEndInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndRenderPass2(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassEndInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetQueryPool(
+    format::HandleId                            device,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery,
+    uint32_t                                    queryCount)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+    GFXRECON_UNREFERENCED_PARAMETER(queryCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSemaphoreCounterValue(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            semaphore,
+    PointerDecoder<uint64_t>*                   pValue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pValue);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(semaphore, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkWaitSemaphores(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreWaitInfo>* pWaitInfo,
+    uint64_t                                    timeout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(timeout);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pWaitInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSignalSemaphore(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreSignalInfo>* pSignalInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pSignalInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferDeviceAddress(
+    VkDeviceAddress                             returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferDeviceAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferOpaqueCaptureAddress(
+    uint64_t                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferDeviceAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddress(
+    uint64_t                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDeviceMemoryOpaqueCaptureAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySurfaceKHR(
+    format::HandleId                            instance,
+    format::HandleId                            surface,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceSupportKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    format::HandleId                            surface,
+    PointerDecoder<VkBool32>*                   pSupported)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pSupported);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilitiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            surface,
+    StructPointerDecoder<Decoded_VkSurfaceCapabilitiesKHR>* pSurfaceCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceCapabilities);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceFormatsKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            surface,
+    PointerDecoder<uint32_t>*                   pSurfaceFormatCount,
+    StructPointerDecoder<Decoded_VkSurfaceFormatKHR>* pSurfaceFormats)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceFormatCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceFormats);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfacePresentModesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            surface,
+    PointerDecoder<uint32_t>*                   pPresentModeCount,
+    PointerDecoder<VkPresentModeKHR>*           pPresentModes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentModeCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentModes);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSwapchainKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSwapchainCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSwapchainKHR>*       pSwapchain)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pSwapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySwapchainKHR(
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSwapchainImagesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    PointerDecoder<uint32_t>*                   pSwapchainImageCount,
+    HandlePointerDecoder<VkImage>*              pSwapchainImages)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSwapchainImageCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+    AddHandleIds(pSwapchainImages, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireNextImageKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    uint64_t                                    timeout,
+    format::HandleId                            semaphore,
+    format::HandleId                            fence,
+    PointerDecoder<uint32_t>*                   pImageIndex)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(timeout);
+    GFXRECON_UNREFERENCED_PARAMETER(pImageIndex);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+    AddHandleId(semaphore, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueuePresentKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            queue,
+    StructPointerDecoder<Decoded_VkPresentInfoKHR>* pPresentInfo)
+{
+    AddHandleId(queue, GetHandleIdList());
+    AddStructArrayHandleIds(pPresentInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceGroupPresentCapabilitiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDeviceGroupPresentCapabilitiesKHR>* pDeviceGroupPresentCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDeviceGroupPresentCapabilities);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceGroupSurfacePresentModesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            surface,
+    PointerDecoder<VkDeviceGroupPresentModeFlagsKHR>* pModes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pModes);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDevicePresentRectanglesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            surface,
+    PointerDecoder<uint32_t>*                   pRectCount,
+    StructPointerDecoder<Decoded_VkRect2D>*     pRects)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pRectCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pRects);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireNextImage2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAcquireNextImageInfoKHR>* pAcquireInfo,
+    PointerDecoder<uint32_t>*                   pImageIndex)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pImageIndex);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pAcquireInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceDisplayPropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayPropertiesKHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceDisplayPlanePropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayPlanePropertiesKHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDisplayPlaneSupportedDisplaysKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    planeIndex,
+    PointerDecoder<uint32_t>*                   pDisplayCount,
+    HandlePointerDecoder<VkDisplayKHR>*         pDisplays)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(planeIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pDisplayCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleIds(pDisplays, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDisplayModePropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            display,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayModePropertiesKHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDisplayModeKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            display,
+    StructPointerDecoder<Decoded_VkDisplayModeCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDisplayModeKHR>*     pMode)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+    AddHandleIds(pMode, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDisplayPlaneCapabilitiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            mode,
+    uint32_t                                    planeIndex,
+    StructPointerDecoder<Decoded_VkDisplayPlaneCapabilitiesKHR>* pCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(planeIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pCapabilities);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(mode, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDisplayPlaneSurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkDisplaySurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSharedSwapchainsKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    swapchainCount,
+    StructPointerDecoder<Decoded_VkSwapchainCreateInfoKHR>* pCreateInfos,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSwapchainKHR>*       pSwapchains)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(swapchainCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfos, GetHandleIdList());
+    AddHandleIds(pSwapchains, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateXlibSurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkXlibSurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceXlibPresentationSupportKHR(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    uint64_t                                    dpy,
+    size_t                                      visualID)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(dpy);
+    GFXRECON_UNREFERENCED_PARAMETER(visualID);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateXcbSurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkXcbSurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceXcbPresentationSupportKHR(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    uint64_t                                    connection,
+    uint32_t                                    visual_id)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(connection);
+    GFXRECON_UNREFERENCED_PARAMETER(visual_id);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateWaylandSurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkWaylandSurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceWaylandPresentationSupportKHR(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    uint64_t                                    display)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(display);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateAndroidSurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkAndroidSurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateWin32SurfaceKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkWin32SurfaceCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceWin32PresentationSupportKHR(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFeatures2KHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceFeatures2>* pFeatures)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFeatures);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceProperties2KHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceProperties2>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFormatProperties2KHR(
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    StructPointerDecoder<Decoded_VkFormatProperties2>* pFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(pFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceImageFormatProperties2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceImageFormatInfo2>* pImageFormatInfo,
+    StructPointerDecoder<Decoded_VkImageFormatProperties2>* pImageFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pImageFormatInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pImageFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceQueueFamilyProperties2KHR(
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pQueueFamilyPropertyCount,
+    StructPointerDecoder<Decoded_VkQueueFamilyProperties2>* pQueueFamilyProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pQueueFamilyProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceMemoryProperties2KHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceMemoryProperties2>* pMemoryProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSparseImageFormatProperties2KHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSparseImageFormatInfo2>* pFormatInfo,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkSparseImageFormatProperties2>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFormatInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceGroupPeerMemoryFeaturesKHR(
+    format::HandleId                            device,
+    uint32_t                                    heapIndex,
+    uint32_t                                    localDeviceIndex,
+    uint32_t                                    remoteDeviceIndex,
+    PointerDecoder<VkPeerMemoryFeatureFlags>*   pPeerMemoryFeatures)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(heapIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(localDeviceIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(remoteDeviceIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pPeerMemoryFeatures);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDeviceMaskKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    deviceMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(deviceMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDispatchBaseKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    baseGroupX,
+    uint32_t                                    baseGroupY,
+    uint32_t                                    baseGroupZ,
+    uint32_t                                    groupCountX,
+    uint32_t                                    groupCountY,
+    uint32_t                                    groupCountZ)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupX);
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupY);
+    GFXRECON_UNREFERENCED_PARAMETER(baseGroupZ);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountX);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountY);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCountZ);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkTrimCommandPoolKHR(
+    format::HandleId                            device,
+    format::HandleId                            commandPool,
+    VkCommandPoolTrimFlags                      flags)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(commandPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkEnumeratePhysicalDeviceGroupsKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    PointerDecoder<uint32_t>*                   pPhysicalDeviceGroupCount,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceGroupProperties>* pPhysicalDeviceGroupProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPhysicalDeviceGroupCount);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddStructArrayHandleIds(pPhysicalDeviceGroupProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalBufferPropertiesKHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalBufferInfo>* pExternalBufferInfo,
+    StructPointerDecoder<Decoded_VkExternalBufferProperties>* pExternalBufferProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalBufferInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalBufferProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryWin32HandleKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryGetWin32HandleInfoKHR>* pGetWin32HandleInfo,
+    PointerDecoder<uint64_t, void*>*            pHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetWin32HandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryWin32HandlePropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkExternalMemoryHandleTypeFlagBits          handleType,
+    uint64_t                                    handle,
+    StructPointerDecoder<Decoded_VkMemoryWin32HandlePropertiesKHR>* pMemoryWin32HandleProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(handleType);
+    GFXRECON_UNREFERENCED_PARAMETER(handle);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryWin32HandleProperties);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryFdKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryGetFdInfoKHR>* pGetFdInfo,
+    PointerDecoder<int>*                        pFd)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFd);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetFdInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryFdPropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkExternalMemoryHandleTypeFlagBits          handleType,
+    int                                         fd,
+    StructPointerDecoder<Decoded_VkMemoryFdPropertiesKHR>* pMemoryFdProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(handleType);
+    GFXRECON_UNREFERENCED_PARAMETER(fd);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryFdProperties);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalSemaphorePropertiesKHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalSemaphoreInfo>* pExternalSemaphoreInfo,
+    StructPointerDecoder<Decoded_VkExternalSemaphoreProperties>* pExternalSemaphoreProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalSemaphoreInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalSemaphoreProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkImportSemaphoreWin32HandleKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImportSemaphoreWin32HandleInfoKHR>* pImportSemaphoreWin32HandleInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pImportSemaphoreWin32HandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSemaphoreWin32HandleKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreGetWin32HandleInfoKHR>* pGetWin32HandleInfo,
+    PointerDecoder<uint64_t, void*>*            pHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetWin32HandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkImportSemaphoreFdKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImportSemaphoreFdInfoKHR>* pImportSemaphoreFdInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pImportSemaphoreFdInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSemaphoreFdKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreGetFdInfoKHR>* pGetFdInfo,
+    PointerDecoder<int>*                        pFd)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFd);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetFdInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdPushDescriptorSetKHR(
+    format::HandleId                            commandBuffer,
+    VkPipelineBindPoint                         pipelineBindPoint,
+    format::HandleId                            layout,
+    uint32_t                                    set,
+    uint32_t                                    descriptorWriteCount,
+    StructPointerDecoder<Decoded_VkWriteDescriptorSet>* pDescriptorWrites)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineBindPoint);
+    GFXRECON_UNREFERENCED_PARAMETER(set);
+    GFXRECON_UNREFERENCED_PARAMETER(descriptorWriteCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(layout, GetHandleIdList());
+    AddStructArrayHandleIds(pDescriptorWrites, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDescriptorUpdateTemplateKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorUpdateTemplateCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDescriptorUpdateTemplate>* pDescriptorUpdateTemplate)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pDescriptorUpdateTemplate, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDescriptorUpdateTemplateKHR(
+    format::HandleId                            device,
+    format::HandleId                            descriptorUpdateTemplate,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(descriptorUpdateTemplate, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateRenderPass2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkRenderPassCreateInfo2>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkRenderPass>*         pRenderPass)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pRenderPass, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginRenderPass2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkRenderPassBeginInfo>* pRenderPassBegin,
+    StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassBeginInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pRenderPassBegin, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdNextSubpass2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkSubpassBeginInfo>* pSubpassBeginInfo,
+    StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassBeginInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassEndInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndRenderPass2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkSubpassEndInfo>* pSubpassEndInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSubpassEndInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSwapchainStatusKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalFencePropertiesKHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceExternalFenceInfo>* pExternalFenceInfo,
+    StructPointerDecoder<Decoded_VkExternalFenceProperties>* pExternalFenceProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalFenceInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalFenceProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkImportFenceWin32HandleKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImportFenceWin32HandleInfoKHR>* pImportFenceWin32HandleInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pImportFenceWin32HandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetFenceWin32HandleKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkFenceGetWin32HandleInfoKHR>* pGetWin32HandleInfo,
+    PointerDecoder<uint64_t, void*>*            pHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetWin32HandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkImportFenceFdKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImportFenceFdInfoKHR>* pImportFenceFdInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pImportFenceFdInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetFenceFdKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkFenceGetFdInfoKHR>* pGetFdInfo,
+    PointerDecoder<int>*                        pFd)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFd);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetFdInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkEnumeratePhysicalDeviceQueueFamilyPerformanceQueryCountersKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    PointerDecoder<uint32_t>*                   pCounterCount,
+    StructPointerDecoder<Decoded_VkPerformanceCounterKHR>* pCounters,
+    StructPointerDecoder<Decoded_VkPerformanceCounterDescriptionKHR>* pCounterDescriptions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounterCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounters);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounterDescriptions);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceQueueFamilyPerformanceQueryPassesKHR(
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkQueryPoolPerformanceCreateInfoKHR>* pPerformanceQueryCreateInfo,
+    PointerDecoder<uint32_t>*                   pNumPasses)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPerformanceQueryCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pNumPasses);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireProfilingLockKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAcquireProfilingLockInfoKHR>* pInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pInfo);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkReleaseProfilingLockKHR(
+    format::HandleId                            device)
+{
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSurfaceInfo2KHR>* pSurfaceInfo,
+    StructPointerDecoder<Decoded_VkSurfaceCapabilities2KHR>* pSurfaceCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceCapabilities);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pSurfaceInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceFormats2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSurfaceInfo2KHR>* pSurfaceInfo,
+    PointerDecoder<uint32_t>*                   pSurfaceFormatCount,
+    StructPointerDecoder<Decoded_VkSurfaceFormat2KHR>* pSurfaceFormats)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceFormatCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceFormats);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pSurfaceInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceDisplayProperties2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayProperties2KHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceDisplayPlaneProperties2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayPlaneProperties2KHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDisplayModeProperties2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            display,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkDisplayModeProperties2KHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+    AddStructArrayHandleIds(pProperties, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDisplayPlaneCapabilities2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkDisplayPlaneInfo2KHR>* pDisplayPlaneInfo,
+    StructPointerDecoder<Decoded_VkDisplayPlaneCapabilities2KHR>* pCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCapabilities);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pDisplayPlaneInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageMemoryRequirements2KHR(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageMemoryRequirementsInfo2>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferMemoryRequirements2KHR(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferMemoryRequirementsInfo2>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageSparseMemoryRequirements2KHR(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageSparseMemoryRequirementsInfo2>* pInfo,
+    PointerDecoder<uint32_t>*                   pSparseMemoryRequirementCount,
+    StructPointerDecoder<Decoded_VkSparseImageMemoryRequirements2>* pSparseMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirementCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pSparseMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateSamplerYcbcrConversionKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSamplerYcbcrConversionCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSamplerYcbcrConversion>* pYcbcrConversion)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pYcbcrConversion, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroySamplerYcbcrConversionKHR(
+    format::HandleId                            device,
+    format::HandleId                            ycbcrConversion,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(ycbcrConversion, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindBufferMemory2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindBufferMemoryInfo>* pBindInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindImageMemory2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindImageMemoryInfo>* pBindInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDescriptorSetLayoutSupportKHR(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDescriptorSetLayoutCreateInfo>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkDescriptorSetLayoutSupport>* pSupport)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSupport);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndirectCountKHR(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndexedIndirectCountKHR(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSemaphoreCounterValueKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            semaphore,
+    PointerDecoder<uint64_t>*                   pValue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pValue);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(semaphore, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkWaitSemaphoresKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreWaitInfo>* pWaitInfo,
+    uint64_t                                    timeout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(timeout);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pWaitInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSignalSemaphoreKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreSignalInfo>* pSignalInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pSignalInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceFragmentShadingRatesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pFragmentShadingRateCount,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceFragmentShadingRateKHR>* pFragmentShadingRates)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFragmentShadingRateCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pFragmentShadingRates);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetFragmentShadingRateKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkExtent2D>*   pFragmentSize,
+    PointerDecoder<VkFragmentShadingRateCombinerOpKHR>* combinerOps)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pFragmentSize);
+    GFXRECON_UNREFERENCED_PARAMETER(combinerOps);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkWaitForPresentKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    uint64_t                                    presentId,
+    uint64_t                                    timeout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(presentId);
+    GFXRECON_UNREFERENCED_PARAMETER(timeout);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferDeviceAddressKHR(
+    VkDeviceAddress                             returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferDeviceAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferOpaqueCaptureAddressKHR(
+    uint64_t                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferDeviceAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceMemoryOpaqueCaptureAddressKHR(
+    uint64_t                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDeviceMemoryOpaqueCaptureAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDeferredOperationKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDeferredOperationKHR>* pDeferredOperation)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pDeferredOperation, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDeferredOperationKHR(
+    format::HandleId                            device,
+    format::HandleId                            operation,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(operation, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeferredOperationMaxConcurrencyKHR(
+    uint32_t                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            operation)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(operation, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeferredOperationResultKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            operation)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(operation, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDeferredOperationJoinKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            operation)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(operation, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPipelineExecutablePropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPipelineInfoKHR>* pPipelineInfo,
+    PointerDecoder<uint32_t>*                   pExecutableCount,
+    StructPointerDecoder<Decoded_VkPipelineExecutablePropertiesKHR>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pExecutableCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pPipelineInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPipelineExecutableStatisticsKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPipelineExecutableInfoKHR>* pExecutableInfo,
+    PointerDecoder<uint32_t>*                   pStatisticCount,
+    StructPointerDecoder<Decoded_VkPipelineExecutableStatisticKHR>* pStatistics)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pStatisticCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pStatistics);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pExecutableInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPipelineExecutableInternalRepresentationsKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPipelineExecutableInfoKHR>* pExecutableInfo,
+    PointerDecoder<uint32_t>*                   pInternalRepresentationCount,
+    StructPointerDecoder<Decoded_VkPipelineExecutableInternalRepresentationKHR>* pInternalRepresentations)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pInternalRepresentationCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pInternalRepresentations);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pExecutableInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetEvent2KHR(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            event,
+    StructPointerDecoder<Decoded_VkDependencyInfoKHR>* pDependencyInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+    AddStructArrayHandleIds(pDependencyInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdResetEvent2KHR(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            event,
+    VkPipelineStageFlags2KHR                    stageMask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stageMask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(event, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWaitEvents2KHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    eventCount,
+    HandlePointerDecoder<VkEvent>*              pEvents,
+    StructPointerDecoder<Decoded_VkDependencyInfoKHR>* pDependencyInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(eventCount);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pEvents, GetHandleIdList());
+    AddStructArrayHandleIds(pDependencyInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdPipelineBarrier2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkDependencyInfoKHR>* pDependencyInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pDependencyInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteTimestamp2KHR(
+    format::HandleId                            commandBuffer,
+    VkPipelineStageFlags2KHR                    stage,
+    format::HandleId                            queryPool,
+    uint32_t                                    query)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stage);
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueSubmit2KHR(
+    VkResult                                    returnValue,
+    format::HandleId                            queue,
+    uint32_t                                    submitCount,
+    StructPointerDecoder<Decoded_VkSubmitInfo2KHR>* pSubmits,
+    format::HandleId                            fence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(submitCount);
+
+    AddHandleId(queue, GetHandleIdList());
+    AddStructArrayHandleIds(pSubmits, GetHandleIdList());
+    AddHandleId(fence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteBufferMarker2AMD(
+    format::HandleId                            commandBuffer,
+    VkPipelineStageFlags2KHR                    stage,
+    format::HandleId                            dstBuffer,
+    VkDeviceSize                                dstOffset,
+    uint32_t                                    marker)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stage);
+    GFXRECON_UNREFERENCED_PARAMETER(dstOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(marker);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetQueueCheckpointData2NV(
+    format::HandleId                            queue,
+    PointerDecoder<uint32_t>*                   pCheckpointDataCount,
+    StructPointerDecoder<Decoded_VkCheckpointData2NV>* pCheckpointData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCheckpointDataCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCheckpointData);
+
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyBuffer2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyBufferInfo2KHR>* pCopyBufferInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pCopyBufferInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyImage2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyImageInfo2KHR>* pCopyImageInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pCopyImageInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyBufferToImage2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyBufferToImageInfo2KHR>* pCopyBufferToImageInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pCopyBufferToImageInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyImageToBuffer2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyImageToBufferInfo2KHR>* pCopyImageToBufferInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pCopyImageToBufferInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBlitImage2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkBlitImageInfo2KHR>* pBlitImageInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pBlitImageInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdResolveImage2KHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkResolveImageInfo2KHR>* pResolveImageInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pResolveImageInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDebugReportCallbackEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkDebugReportCallbackCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDebugReportCallbackEXT>* pCallback)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pCallback, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDebugReportCallbackEXT(
+    format::HandleId                            instance,
+    format::HandleId                            callback,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleId(callback, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDebugReportMessageEXT(
+    format::HandleId                            instance,
+    VkDebugReportFlagsEXT                       flags,
+    VkDebugReportObjectTypeEXT                  objectType,
+    uint64_t                                    object,
+    size_t                                      location,
+    int32_t                                     messageCode,
+    StringDecoder*                              pLayerPrefix,
+    StringDecoder*                              pMessage)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+    GFXRECON_UNREFERENCED_PARAMETER(objectType);
+    GFXRECON_UNREFERENCED_PARAMETER(location);
+    GFXRECON_UNREFERENCED_PARAMETER(messageCode);
+    GFXRECON_UNREFERENCED_PARAMETER(pLayerPrefix);
+    GFXRECON_UNREFERENCED_PARAMETER(pMessage);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleId(object, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDebugMarkerSetObjectTagEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDebugMarkerObjectTagInfoEXT>* pTagInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pTagInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDebugMarkerSetObjectNameEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDebugMarkerObjectNameInfoEXT>* pNameInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pNameInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDebugMarkerBeginEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkDebugMarkerMarkerInfoEXT>* pMarkerInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMarkerInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDebugMarkerEndEXT(
+    format::HandleId                            commandBuffer)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDebugMarkerInsertEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkDebugMarkerMarkerInfoEXT>* pMarkerInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMarkerInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindTransformFeedbackBuffersEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstBinding,
+    uint32_t                                    bindingCount,
+    HandlePointerDecoder<VkBuffer>*             pBuffers,
+    PointerDecoder<VkDeviceSize>*               pOffsets,
+    PointerDecoder<VkDeviceSize>*               pSizes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstBinding);
+    GFXRECON_UNREFERENCED_PARAMETER(bindingCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pOffsets);
+    GFXRECON_UNREFERENCED_PARAMETER(pSizes);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginTransformFeedbackEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstCounterBuffer,
+    uint32_t                                    counterBufferCount,
+    HandlePointerDecoder<VkBuffer>*             pCounterBuffers,
+    PointerDecoder<VkDeviceSize>*               pCounterBufferOffsets)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstCounterBuffer);
+    GFXRECON_UNREFERENCED_PARAMETER(counterBufferCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounterBufferOffsets);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pCounterBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndTransformFeedbackEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstCounterBuffer,
+    uint32_t                                    counterBufferCount,
+    HandlePointerDecoder<VkBuffer>*             pCounterBuffers,
+    PointerDecoder<VkDeviceSize>*               pCounterBufferOffsets)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstCounterBuffer);
+    GFXRECON_UNREFERENCED_PARAMETER(counterBufferCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounterBufferOffsets);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pCounterBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginQueryIndexedEXT(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    query,
+    VkQueryControlFlags                         flags,
+    uint32_t                                    index)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+    GFXRECON_UNREFERENCED_PARAMETER(index);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndQueryIndexedEXT(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            queryPool,
+    uint32_t                                    query,
+    uint32_t                                    index)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(query);
+    GFXRECON_UNREFERENCED_PARAMETER(index);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndirectByteCountEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    instanceCount,
+    uint32_t                                    firstInstance,
+    format::HandleId                            counterBuffer,
+    VkDeviceSize                                counterBufferOffset,
+    uint32_t                                    counterOffset,
+    uint32_t                                    vertexStride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(instanceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstInstance);
+    GFXRECON_UNREFERENCED_PARAMETER(counterBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(counterOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(vertexStride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(counterBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageViewHandleNVX(
+    uint32_t                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImageViewHandleInfoNVX>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageViewAddressNVX(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            imageView,
+    StructPointerDecoder<Decoded_VkImageViewAddressPropertiesNVX>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(imageView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndirectCountAMD(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawIndexedIndirectCountAMD(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetShaderInfoAMD(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    VkShaderStageFlagBits                       shaderStage,
+    VkShaderInfoTypeAMD                         infoType,
+    PointerDecoder<size_t>*                     pInfoSize,
+    PointerDecoder<uint8_t>*                    pInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(shaderStage);
+    GFXRECON_UNREFERENCED_PARAMETER(infoType);
+    GFXRECON_UNREFERENCED_PARAMETER(pInfoSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pInfo);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateStreamDescriptorSurfaceGGP(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkStreamDescriptorSurfaceCreateInfoGGP>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceExternalImageFormatPropertiesNV(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    VkFormat                                    format,
+    VkImageType                                 type,
+    VkImageTiling                               tiling,
+    VkImageUsageFlags                           usage,
+    VkImageCreateFlags                          flags,
+    VkExternalMemoryHandleTypeFlagsNV           externalHandleType,
+    StructPointerDecoder<Decoded_VkExternalImageFormatPropertiesNV>* pExternalImageFormatProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(format);
+    GFXRECON_UNREFERENCED_PARAMETER(type);
+    GFXRECON_UNREFERENCED_PARAMETER(tiling);
+    GFXRECON_UNREFERENCED_PARAMETER(usage);
+    GFXRECON_UNREFERENCED_PARAMETER(flags);
+    GFXRECON_UNREFERENCED_PARAMETER(externalHandleType);
+    GFXRECON_UNREFERENCED_PARAMETER(pExternalImageFormatProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryWin32HandleNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            memory,
+    VkExternalMemoryHandleTypeFlagsNV           handleType,
+    PointerDecoder<uint64_t, void*>*            pHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(handleType);
+    GFXRECON_UNREFERENCED_PARAMETER(pHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(memory, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateViSurfaceNN(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkViSurfaceCreateInfoNN>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginConditionalRenderingEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkConditionalRenderingBeginInfoEXT>* pConditionalRenderingBegin)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pConditionalRenderingBegin, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndConditionalRenderingEXT(
+    format::HandleId                            commandBuffer)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetViewportWScalingNV(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstViewport,
+    uint32_t                                    viewportCount,
+    StructPointerDecoder<Decoded_VkViewportWScalingNV>* pViewportWScalings)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstViewport);
+    GFXRECON_UNREFERENCED_PARAMETER(viewportCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pViewportWScalings);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkReleaseDisplayEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            display)
+{
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireXlibDisplayEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint64_t                                    dpy,
+    format::HandleId                            display)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dpy);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRandROutputDisplayEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint64_t                                    dpy,
+    size_t                                      rrOutput,
+    HandlePointerDecoder<VkDisplayKHR>*         pDisplay)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dpy);
+    GFXRECON_UNREFERENCED_PARAMETER(rrOutput);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleIds(pDisplay, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfaceCapabilities2EXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            surface,
+    StructPointerDecoder<Decoded_VkSurfaceCapabilities2EXT>* pSurfaceCapabilities)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSurfaceCapabilities);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(surface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDisplayPowerControlEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            display,
+    StructPointerDecoder<Decoded_VkDisplayPowerInfoEXT>* pDisplayPowerInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDisplayPowerInfo);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkRegisterDeviceEventEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDeviceEventInfoEXT>* pDeviceEventInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkFence>*              pFence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDeviceEventInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pFence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkRegisterDisplayEventEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            display,
+    StructPointerDecoder<Decoded_VkDisplayEventInfoEXT>* pDisplayEventInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkFence>*              pFence)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDisplayEventInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+    AddHandleIds(pFence, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSwapchainCounterEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    VkSurfaceCounterFlagBitsEXT                 counter,
+    PointerDecoder<uint64_t>*                   pCounterValue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(counter);
+    GFXRECON_UNREFERENCED_PARAMETER(pCounterValue);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRefreshCycleDurationGOOGLE(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    StructPointerDecoder<Decoded_VkRefreshCycleDurationGOOGLE>* pDisplayTimingProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDisplayTimingProperties);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPastPresentationTimingGOOGLE(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain,
+    PointerDecoder<uint32_t>*                   pPresentationTimingCount,
+    StructPointerDecoder<Decoded_VkPastPresentationTimingGOOGLE>* pPresentationTimings)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentationTimingCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentationTimings);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDiscardRectangleEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstDiscardRectangle,
+    uint32_t                                    discardRectangleCount,
+    StructPointerDecoder<Decoded_VkRect2D>*     pDiscardRectangles)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstDiscardRectangle);
+    GFXRECON_UNREFERENCED_PARAMETER(discardRectangleCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pDiscardRectangles);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetHdrMetadataEXT(
+    format::HandleId                            device,
+    uint32_t                                    swapchainCount,
+    HandlePointerDecoder<VkSwapchainKHR>*       pSwapchains,
+    StructPointerDecoder<Decoded_VkHdrMetadataEXT>* pMetadata)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(swapchainCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pMetadata);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pSwapchains, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateIOSSurfaceMVK(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkIOSSurfaceCreateInfoMVK>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateMacOSSurfaceMVK(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkMacOSSurfaceCreateInfoMVK>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetDebugUtilsObjectNameEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDebugUtilsObjectNameInfoEXT>* pNameInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pNameInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetDebugUtilsObjectTagEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkDebugUtilsObjectTagInfoEXT>* pTagInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pTagInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueBeginDebugUtilsLabelEXT(
+    format::HandleId                            queue,
+    StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pLabelInfo);
+
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueEndDebugUtilsLabelEXT(
+    format::HandleId                            queue)
+{
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueInsertDebugUtilsLabelEXT(
+    format::HandleId                            queue,
+    StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pLabelInfo);
+
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBeginDebugUtilsLabelEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pLabelInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdEndDebugUtilsLabelEXT(
+    format::HandleId                            commandBuffer)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdInsertDebugUtilsLabelEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkDebugUtilsLabelEXT>* pLabelInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pLabelInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDebugUtilsMessengerEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkDebugUtilsMessengerCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkDebugUtilsMessengerEXT>* pMessenger)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pMessenger, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyDebugUtilsMessengerEXT(
+    format::HandleId                            instance,
+    format::HandleId                            messenger,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleId(messenger, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSubmitDebugUtilsMessageEXT(
+    format::HandleId                            instance,
+    VkDebugUtilsMessageSeverityFlagBitsEXT      messageSeverity,
+    VkDebugUtilsMessageTypeFlagsEXT             messageTypes,
+    StructPointerDecoder<Decoded_VkDebugUtilsMessengerCallbackDataEXT>* pCallbackData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(messageSeverity);
+    GFXRECON_UNREFERENCED_PARAMETER(messageTypes);
+    GFXRECON_UNREFERENCED_PARAMETER(pCallbackData);
+
+    AddHandleId(instance, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetAndroidHardwareBufferPropertiesANDROID(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint64_t                                    buffer,
+    StructPointerDecoder<Decoded_VkAndroidHardwareBufferPropertiesANDROID>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(buffer);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryAndroidHardwareBufferANDROID(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryGetAndroidHardwareBufferInfoANDROID>* pInfo,
+    PointerDecoder<uint64_t, void*>*            pBuffer)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pBuffer);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetSampleLocationsEXT(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkSampleLocationsInfoEXT>* pSampleLocationsInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pSampleLocationsInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceMultisamplePropertiesEXT(
+    format::HandleId                            physicalDevice,
+    VkSampleCountFlagBits                       samples,
+    StructPointerDecoder<Decoded_VkMultisamplePropertiesEXT>* pMultisampleProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(samples);
+    GFXRECON_UNREFERENCED_PARAMETER(pMultisampleProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetImageDrmFormatModifierPropertiesEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            image,
+    StructPointerDecoder<Decoded_VkImageDrmFormatModifierPropertiesEXT>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(image, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateValidationCacheEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkValidationCacheCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkValidationCacheEXT>* pValidationCache)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pValidationCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyValidationCacheEXT(
+    format::HandleId                            device,
+    format::HandleId                            validationCache,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(validationCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkMergeValidationCachesEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            dstCache,
+    uint32_t                                    srcCacheCount,
+    HandlePointerDecoder<VkValidationCacheEXT>* pSrcCaches)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(srcCacheCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(dstCache, GetHandleIdList());
+    AddHandleIds(pSrcCaches, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetValidationCacheDataEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            validationCache,
+    PointerDecoder<size_t>*                     pDataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pDataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(validationCache, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindShadingRateImageNV(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            imageView,
+    VkImageLayout                               imageLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(imageLayout);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(imageView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetViewportShadingRatePaletteNV(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstViewport,
+    uint32_t                                    viewportCount,
+    StructPointerDecoder<Decoded_VkShadingRatePaletteNV>* pShadingRatePalettes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstViewport);
+    GFXRECON_UNREFERENCED_PARAMETER(viewportCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pShadingRatePalettes);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetCoarseSampleOrderNV(
+    format::HandleId                            commandBuffer,
+    VkCoarseSampleOrderTypeNV                   sampleOrderType,
+    uint32_t                                    customSampleOrderCount,
+    StructPointerDecoder<Decoded_VkCoarseSampleOrderCustomNV>* pCustomSampleOrders)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(sampleOrderType);
+    GFXRECON_UNREFERENCED_PARAMETER(customSampleOrderCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCustomSampleOrders);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateAccelerationStructureNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAccelerationStructureCreateInfoNV>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkAccelerationStructureNV>* pAccelerationStructure)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pAccelerationStructure, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyAccelerationStructureNV(
+    format::HandleId                            device,
+    format::HandleId                            accelerationStructure,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(accelerationStructure, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetAccelerationStructureMemoryRequirementsNV(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAccelerationStructureMemoryRequirementsInfoNV>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2KHR>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkBindAccelerationStructureMemoryNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    bindInfoCount,
+    StructPointerDecoder<Decoded_VkBindAccelerationStructureMemoryInfoNV>* pBindInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(bindInfoCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBindInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBuildAccelerationStructureNV(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkAccelerationStructureInfoNV>* pInfo,
+    format::HandleId                            instanceData,
+    VkDeviceSize                                instanceOffset,
+    VkBool32                                    update,
+    format::HandleId                            dst,
+    format::HandleId                            src,
+    format::HandleId                            scratch,
+    VkDeviceSize                                scratchOffset)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(instanceOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(update);
+    GFXRECON_UNREFERENCED_PARAMETER(scratchOffset);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+    AddHandleId(instanceData, GetHandleIdList());
+    AddHandleId(dst, GetHandleIdList());
+    AddHandleId(src, GetHandleIdList());
+    AddHandleId(scratch, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyAccelerationStructureNV(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            dst,
+    format::HandleId                            src,
+    VkCopyAccelerationStructureModeKHR          mode)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(mode);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(dst, GetHandleIdList());
+    AddHandleId(src, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdTraceRaysNV(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            raygenShaderBindingTableBuffer,
+    VkDeviceSize                                raygenShaderBindingOffset,
+    format::HandleId                            missShaderBindingTableBuffer,
+    VkDeviceSize                                missShaderBindingOffset,
+    VkDeviceSize                                missShaderBindingStride,
+    format::HandleId                            hitShaderBindingTableBuffer,
+    VkDeviceSize                                hitShaderBindingOffset,
+    VkDeviceSize                                hitShaderBindingStride,
+    format::HandleId                            callableShaderBindingTableBuffer,
+    VkDeviceSize                                callableShaderBindingOffset,
+    VkDeviceSize                                callableShaderBindingStride,
+    uint32_t                                    width,
+    uint32_t                                    height,
+    uint32_t                                    depth)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(raygenShaderBindingOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(missShaderBindingOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(missShaderBindingStride);
+    GFXRECON_UNREFERENCED_PARAMETER(hitShaderBindingOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(hitShaderBindingStride);
+    GFXRECON_UNREFERENCED_PARAMETER(callableShaderBindingOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(callableShaderBindingStride);
+    GFXRECON_UNREFERENCED_PARAMETER(width);
+    GFXRECON_UNREFERENCED_PARAMETER(height);
+    GFXRECON_UNREFERENCED_PARAMETER(depth);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(raygenShaderBindingTableBuffer, GetHandleIdList());
+    AddHandleId(missShaderBindingTableBuffer, GetHandleIdList());
+    AddHandleId(hitShaderBindingTableBuffer, GetHandleIdList());
+    AddHandleId(callableShaderBindingTableBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateRayTracingPipelinesNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipelineCache,
+    uint32_t                                    createInfoCount,
+    StructPointerDecoder<Decoded_VkRayTracingPipelineCreateInfoNV>* pCreateInfos,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipeline>*           pPipelines)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(createInfoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfos, GetHandleIdList());
+    AddHandleIds(pPipelines, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRayTracingShaderGroupHandlesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    uint32_t                                    firstGroup,
+    uint32_t                                    groupCount,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstGroup);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRayTracingShaderGroupHandlesNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    uint32_t                                    firstGroup,
+    uint32_t                                    groupCount,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstGroup);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetAccelerationStructureHandleNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            accelerationStructure,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(accelerationStructure, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesNV(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    accelerationStructureCount,
+    HandlePointerDecoder<VkAccelerationStructureNV>* pAccelerationStructures,
+    VkQueryType                                 queryType,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(accelerationStructureCount);
+    GFXRECON_UNREFERENCED_PARAMETER(queryType);
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pAccelerationStructures, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCompileDeferredNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    uint32_t                                    shader)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(shader);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryHostPointerPropertiesEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkExternalMemoryHandleTypeFlagBits          handleType,
+    uint64_t                                    pHostPointer,
+    StructPointerDecoder<Decoded_VkMemoryHostPointerPropertiesEXT>* pMemoryHostPointerProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(handleType);
+    GFXRECON_UNREFERENCED_PARAMETER(pHostPointer);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryHostPointerProperties);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteBufferMarkerAMD(
+    format::HandleId                            commandBuffer,
+    VkPipelineStageFlagBits                     pipelineStage,
+    format::HandleId                            dstBuffer,
+    VkDeviceSize                                dstOffset,
+    uint32_t                                    marker)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineStage);
+    GFXRECON_UNREFERENCED_PARAMETER(dstOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(marker);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(dstBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceCalibrateableTimeDomainsEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pTimeDomainCount,
+    PointerDecoder<VkTimeDomainEXT>*            pTimeDomains)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pTimeDomainCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pTimeDomains);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetCalibratedTimestampsEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    timestampCount,
+    StructPointerDecoder<Decoded_VkCalibratedTimestampInfoEXT>* pTimestampInfos,
+    PointerDecoder<uint64_t>*                   pTimestamps,
+    PointerDecoder<uint64_t>*                   pMaxDeviation)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(timestampCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pTimestampInfos);
+    GFXRECON_UNREFERENCED_PARAMETER(pTimestamps);
+    GFXRECON_UNREFERENCED_PARAMETER(pMaxDeviation);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawMeshTasksNV(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    taskCount,
+    uint32_t                                    firstTask)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(taskCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstTask);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawMeshTasksIndirectNV(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    uint32_t                                    drawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(drawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawMeshTasksIndirectCountNV(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            buffer,
+    VkDeviceSize                                offset,
+    format::HandleId                            countBuffer,
+    VkDeviceSize                                countBufferOffset,
+    uint32_t                                    maxDrawCount,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(offset);
+    GFXRECON_UNREFERENCED_PARAMETER(countBufferOffset);
+    GFXRECON_UNREFERENCED_PARAMETER(maxDrawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(buffer, GetHandleIdList());
+    AddHandleId(countBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetExclusiveScissorNV(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstExclusiveScissor,
+    uint32_t                                    exclusiveScissorCount,
+    StructPointerDecoder<Decoded_VkRect2D>*     pExclusiveScissors)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstExclusiveScissor);
+    GFXRECON_UNREFERENCED_PARAMETER(exclusiveScissorCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pExclusiveScissors);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetCheckpointNV(
+    format::HandleId                            commandBuffer,
+    uint64_t                                    pCheckpointMarker)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCheckpointMarker);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetQueueCheckpointDataNV(
+    format::HandleId                            queue,
+    PointerDecoder<uint32_t>*                   pCheckpointDataCount,
+    StructPointerDecoder<Decoded_VkCheckpointDataNV>* pCheckpointData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCheckpointDataCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCheckpointData);
+
+    AddHandleId(queue, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkInitializePerformanceApiINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkInitializePerformanceApiInfoINTEL>* pInitializeInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pInitializeInfo);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkUninitializePerformanceApiINTEL(
+    format::HandleId                            device)
+{
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPerformanceMarkerINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkPerformanceMarkerInfoINTEL>* pMarkerInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMarkerInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPerformanceStreamMarkerINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkPerformanceStreamMarkerInfoINTEL>* pMarkerInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMarkerInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPerformanceOverrideINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkPerformanceOverrideInfoINTEL>* pOverrideInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pOverrideInfo);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquirePerformanceConfigurationINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPerformanceConfigurationAcquireInfoINTEL>* pAcquireInfo,
+    HandlePointerDecoder<VkPerformanceConfigurationINTEL>* pConfiguration)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAcquireInfo);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pConfiguration, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkReleasePerformanceConfigurationINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            configuration)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(configuration, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkQueueSetPerformanceConfigurationINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            queue,
+    format::HandleId                            configuration)
+{
+    AddHandleId(queue, GetHandleIdList());
+    AddHandleId(configuration, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPerformanceParameterINTEL(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkPerformanceParameterTypeINTEL             parameter,
+    StructPointerDecoder<Decoded_VkPerformanceValueINTEL>* pValue)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(parameter);
+    GFXRECON_UNREFERENCED_PARAMETER(pValue);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetLocalDimmingAMD(
+    format::HandleId                            device,
+    format::HandleId                            swapChain,
+    VkBool32                                    localDimmingEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(localDimmingEnable);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapChain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateImagePipeSurfaceFUCHSIA(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkImagePipeSurfaceCreateInfoFUCHSIA>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateMetalSurfaceEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkMetalSurfaceCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetBufferDeviceAddressEXT(
+    VkDeviceAddress                             returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkBufferDeviceAddressInfo>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceToolPropertiesEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pToolCount,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceToolPropertiesEXT>* pToolProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pToolCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pToolProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceCooperativeMatrixPropertiesNV(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pPropertyCount,
+    StructPointerDecoder<Decoded_VkCooperativeMatrixPropertiesNV>* pProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPropertyCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pProperties);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSupportedFramebufferMixedSamplesCombinationsNV(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    PointerDecoder<uint32_t>*                   pCombinationCount,
+    StructPointerDecoder<Decoded_VkFramebufferMixedSamplesCombinationNV>* pCombinations)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCombinationCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pCombinations);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceSurfacePresentModes2EXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSurfaceInfo2KHR>* pSurfaceInfo,
+    PointerDecoder<uint32_t>*                   pPresentModeCount,
+    PointerDecoder<VkPresentModeKHR>*           pPresentModes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentModeCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pPresentModes);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddStructArrayHandleIds(pSurfaceInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireFullScreenExclusiveModeEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkReleaseFullScreenExclusiveModeEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            swapchain)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(swapchain, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceGroupSurfacePresentModes2EXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPhysicalDeviceSurfaceInfo2KHR>* pSurfaceInfo,
+    PointerDecoder<VkDeviceGroupPresentModeFlagsKHR>* pModes)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pModes);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pSurfaceInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateHeadlessSurfaceEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkHeadlessSurfaceCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetLineStippleEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    lineStippleFactor,
+    uint16_t                                    lineStipplePattern)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(lineStippleFactor);
+    GFXRECON_UNREFERENCED_PARAMETER(lineStipplePattern);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkResetQueryPoolEXT(
+    format::HandleId                            device,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery,
+    uint32_t                                    queryCount)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+    GFXRECON_UNREFERENCED_PARAMETER(queryCount);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetCullModeEXT(
+    format::HandleId                            commandBuffer,
+    VkCullModeFlags                             cullMode)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(cullMode);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetFrontFaceEXT(
+    format::HandleId                            commandBuffer,
+    VkFrontFace                                 frontFace)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(frontFace);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPrimitiveTopologyEXT(
+    format::HandleId                            commandBuffer,
+    VkPrimitiveTopology                         primitiveTopology)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(primitiveTopology);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetViewportWithCountEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    viewportCount,
+    StructPointerDecoder<Decoded_VkViewport>*   pViewports)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(viewportCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pViewports);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetScissorWithCountEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    scissorCount,
+    StructPointerDecoder<Decoded_VkRect2D>*     pScissors)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(scissorCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pScissors);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindVertexBuffers2EXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    firstBinding,
+    uint32_t                                    bindingCount,
+    HandlePointerDecoder<VkBuffer>*             pBuffers,
+    PointerDecoder<VkDeviceSize>*               pOffsets,
+    PointerDecoder<VkDeviceSize>*               pSizes,
+    PointerDecoder<VkDeviceSize>*               pStrides)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstBinding);
+    GFXRECON_UNREFERENCED_PARAMETER(bindingCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pOffsets);
+    GFXRECON_UNREFERENCED_PARAMETER(pSizes);
+    GFXRECON_UNREFERENCED_PARAMETER(pStrides);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pBuffers, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthTestEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    depthTestEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthTestEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthWriteEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    depthWriteEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthWriteEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthCompareOpEXT(
+    format::HandleId                            commandBuffer,
+    VkCompareOp                                 depthCompareOp)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthCompareOp);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthBoundsTestEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    depthBoundsTestEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthBoundsTestEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetStencilTestEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    stencilTestEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(stencilTestEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetStencilOpEXT(
+    format::HandleId                            commandBuffer,
+    VkStencilFaceFlags                          faceMask,
+    VkStencilOp                                 failOp,
+    VkStencilOp                                 passOp,
+    VkStencilOp                                 depthFailOp,
+    VkCompareOp                                 compareOp)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(faceMask);
+    GFXRECON_UNREFERENCED_PARAMETER(failOp);
+    GFXRECON_UNREFERENCED_PARAMETER(passOp);
+    GFXRECON_UNREFERENCED_PARAMETER(depthFailOp);
+    GFXRECON_UNREFERENCED_PARAMETER(compareOp);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetGeneratedCommandsMemoryRequirementsNV(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkGeneratedCommandsMemoryRequirementsInfoNV>* pInfo,
+    StructPointerDecoder<Decoded_VkMemoryRequirements2>* pMemoryRequirements)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryRequirements);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdPreprocessGeneratedCommandsNV(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkGeneratedCommandsInfoNV>* pGeneratedCommandsInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pGeneratedCommandsInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdExecuteGeneratedCommandsNV(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    isPreprocessed,
+    StructPointerDecoder<Decoded_VkGeneratedCommandsInfoNV>* pGeneratedCommandsInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(isPreprocessed);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pGeneratedCommandsInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindPipelineShaderGroupNV(
+    format::HandleId                            commandBuffer,
+    VkPipelineBindPoint                         pipelineBindPoint,
+    format::HandleId                            pipeline,
+    uint32_t                                    groupIndex)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineBindPoint);
+    GFXRECON_UNREFERENCED_PARAMETER(groupIndex);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateIndirectCommandsLayoutNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkIndirectCommandsLayoutCreateInfoNV>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkIndirectCommandsLayoutNV>* pIndirectCommandsLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pIndirectCommandsLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyIndirectCommandsLayoutNV(
+    format::HandleId                            device,
+    format::HandleId                            indirectCommandsLayout,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(indirectCommandsLayout, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireDrmDisplayEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    int32_t                                     drmFd,
+    format::HandleId                            display)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(drmFd);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDrmDisplayEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    int32_t                                     drmFd,
+    uint32_t                                    connectorId,
+    HandlePointerDecoder<VkDisplayKHR>*         display)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(drmFd);
+    GFXRECON_UNREFERENCED_PARAMETER(connectorId);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleIds(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreatePrivateDataSlotEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkPrivateDataSlotCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPrivateDataSlotEXT>* pPrivateDataSlot)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pPrivateDataSlot, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyPrivateDataSlotEXT(
+    format::HandleId                            device,
+    format::HandleId                            privateDataSlot,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(privateDataSlot, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkSetPrivateDataEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkObjectType                                objectType,
+    uint64_t                                    objectHandle,
+    format::HandleId                            privateDataSlot,
+    uint64_t                                    data)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(objectType);
+    GFXRECON_UNREFERENCED_PARAMETER(data);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(objectHandle, GetHandleIdList());
+    AddHandleId(privateDataSlot, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPrivateDataEXT(
+    format::HandleId                            device,
+    VkObjectType                                objectType,
+    uint64_t                                    objectHandle,
+    format::HandleId                            privateDataSlot,
+    PointerDecoder<uint64_t>*                   pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(objectType);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(objectHandle, GetHandleIdList());
+    AddHandleId(privateDataSlot, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetFragmentShadingRateEnumNV(
+    format::HandleId                            commandBuffer,
+    VkFragmentShadingRateNV                     shadingRate,
+    PointerDecoder<VkFragmentShadingRateCombinerOpKHR>* combinerOps)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(shadingRate);
+    GFXRECON_UNREFERENCED_PARAMETER(combinerOps);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkAcquireWinrtDisplayNV(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    format::HandleId                            display)
+{
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleId(display, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetWinrtDisplayNV(
+    VkResult                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    deviceRelativeId,
+    HandlePointerDecoder<VkDisplayKHR>*         pDisplay)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(deviceRelativeId);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+    AddHandleIds(pDisplay, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateDirectFBSurfaceEXT(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkDirectFBSurfaceCreateInfoEXT>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceDirectFBPresentationSupportEXT(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    uint64_t                                    dfb)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(dfb);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetVertexInputEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    vertexBindingDescriptionCount,
+    StructPointerDecoder<Decoded_VkVertexInputBindingDescription2EXT>* pVertexBindingDescriptions,
+    uint32_t                                    vertexAttributeDescriptionCount,
+    StructPointerDecoder<Decoded_VkVertexInputAttributeDescription2EXT>* pVertexAttributeDescriptions)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(vertexBindingDescriptionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pVertexBindingDescriptions);
+    GFXRECON_UNREFERENCED_PARAMETER(vertexAttributeDescriptionCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pVertexAttributeDescriptions);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryZirconHandleFUCHSIA(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryGetZirconHandleInfoFUCHSIA>* pGetZirconHandleInfo,
+    PointerDecoder<uint32_t>*                   pZirconHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pZirconHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetZirconHandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryZirconHandlePropertiesFUCHSIA(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    VkExternalMemoryHandleTypeFlagBits          handleType,
+    uint32_t                                    zirconHandle,
+    StructPointerDecoder<Decoded_VkMemoryZirconHandlePropertiesFUCHSIA>* pMemoryZirconHandleProperties)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(handleType);
+    GFXRECON_UNREFERENCED_PARAMETER(zirconHandle);
+    GFXRECON_UNREFERENCED_PARAMETER(pMemoryZirconHandleProperties);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkImportSemaphoreZirconHandleFUCHSIA(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkImportSemaphoreZirconHandleInfoFUCHSIA>* pImportSemaphoreZirconHandleInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pImportSemaphoreZirconHandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetSemaphoreZirconHandleFUCHSIA(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkSemaphoreGetZirconHandleInfoFUCHSIA>* pGetZirconHandleInfo,
+    PointerDecoder<uint32_t>*                   pZirconHandle)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pZirconHandle);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pGetZirconHandleInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBindInvocationMaskHUAWEI(
+    format::HandleId                            commandBuffer,
+    format::HandleId                            imageView,
+    VkImageLayout                               imageLayout)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(imageLayout);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleId(imageView, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetMemoryRemoteAddressNV(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkMemoryGetRemoteAddressInfoNV>* pMemoryGetRemoteAddressInfo,
+    PointerDecoder<uint64_t, void*>*            pAddress)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAddress);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pMemoryGetRemoteAddressInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPatchControlPointsEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    patchControlPoints)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(patchControlPoints);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetRasterizerDiscardEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    rasterizerDiscardEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(rasterizerDiscardEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetDepthBiasEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    depthBiasEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(depthBiasEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetLogicOpEXT(
+    format::HandleId                            commandBuffer,
+    VkLogicOp                                   logicOp)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(logicOp);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetPrimitiveRestartEnableEXT(
+    format::HandleId                            commandBuffer,
+    VkBool32                                    primitiveRestartEnable)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(primitiveRestartEnable);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateScreenSurfaceQNX(
+    VkResult                                    returnValue,
+    format::HandleId                            instance,
+    StructPointerDecoder<Decoded_VkScreenSurfaceCreateInfoQNX>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkSurfaceKHR>*         pSurface)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pCreateInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(instance, GetHandleIdList());
+    AddHandleIds(pSurface, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetPhysicalDeviceScreenPresentationSupportQNX(
+    VkBool32                                    returnValue,
+    format::HandleId                            physicalDevice,
+    uint32_t                                    queueFamilyIndex,
+    uint64_t                                    window)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(queueFamilyIndex);
+    GFXRECON_UNREFERENCED_PARAMETER(window);
+
+    AddHandleId(physicalDevice, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetColorWriteEnableEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    attachmentCount,
+    PointerDecoder<VkBool32>*                   pColorWriteEnables)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(attachmentCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pColorWriteEnables);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawMultiEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    drawCount,
+    StructPointerDecoder<Decoded_VkMultiDrawInfoEXT>* pVertexInfo,
+    uint32_t                                    instanceCount,
+    uint32_t                                    firstInstance,
+    uint32_t                                    stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(drawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pVertexInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(instanceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstInstance);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdDrawMultiIndexedEXT(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    drawCount,
+    StructPointerDecoder<Decoded_VkMultiDrawIndexedInfoEXT>* pIndexInfo,
+    uint32_t                                    instanceCount,
+    uint32_t                                    firstInstance,
+    uint32_t                                    stride,
+    PointerDecoder<int32_t>*                    pVertexOffset)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(drawCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pIndexInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(instanceCount);
+    GFXRECON_UNREFERENCED_PARAMETER(firstInstance);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+    GFXRECON_UNREFERENCED_PARAMETER(pVertexOffset);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateAccelerationStructureKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAccelerationStructureCreateInfoKHR>* pCreateInfo,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkAccelerationStructureKHR>* pAccelerationStructure)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfo, GetHandleIdList());
+    AddHandleIds(pAccelerationStructure, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkDestroyAccelerationStructureKHR(
+    format::HandleId                            device,
+    format::HandleId                            accelerationStructure,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(accelerationStructure, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBuildAccelerationStructuresKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    infoCount,
+    StructPointerDecoder<Decoded_VkAccelerationStructureBuildGeometryInfoKHR>* pInfos,
+    StructPointerDecoder<Decoded_VkAccelerationStructureBuildRangeInfoKHR*>* ppBuildRangeInfos)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(infoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(ppBuildRangeInfos);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdBuildAccelerationStructuresIndirectKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    infoCount,
+    StructPointerDecoder<Decoded_VkAccelerationStructureBuildGeometryInfoKHR>* pInfos,
+    PointerDecoder<VkDeviceAddress>*            pIndirectDeviceAddresses,
+    PointerDecoder<uint32_t>*                   pIndirectStrides,
+    PointerDecoder<uint32_t*>*                  ppMaxPrimitiveCounts)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(infoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pIndirectDeviceAddresses);
+    GFXRECON_UNREFERENCED_PARAMETER(pIndirectStrides);
+    GFXRECON_UNREFERENCED_PARAMETER(ppMaxPrimitiveCounts);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfos, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCopyAccelerationStructureToMemoryKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            deferredOperation,
+    StructPointerDecoder<Decoded_VkCopyAccelerationStructureToMemoryInfoKHR>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(deferredOperation, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCopyMemoryToAccelerationStructureKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            deferredOperation,
+    StructPointerDecoder<Decoded_VkCopyMemoryToAccelerationStructureInfoKHR>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(deferredOperation, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkWriteAccelerationStructuresPropertiesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    uint32_t                                    accelerationStructureCount,
+    HandlePointerDecoder<VkAccelerationStructureKHR>* pAccelerationStructures,
+    VkQueryType                                 queryType,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData,
+    size_t                                      stride)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(accelerationStructureCount);
+    GFXRECON_UNREFERENCED_PARAMETER(queryType);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+    GFXRECON_UNREFERENCED_PARAMETER(stride);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleIds(pAccelerationStructures, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyAccelerationStructureKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyAccelerationStructureInfoKHR>* pInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyAccelerationStructureToMemoryKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyAccelerationStructureToMemoryInfoKHR>* pInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdCopyMemoryToAccelerationStructureKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkCopyMemoryToAccelerationStructureInfoKHR>* pInfo)
+{
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetAccelerationStructureDeviceAddressKHR(
+    VkDeviceAddress                             returnValue,
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAccelerationStructureDeviceAddressInfoKHR>* pInfo)
+{
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdWriteAccelerationStructuresPropertiesKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    accelerationStructureCount,
+    HandlePointerDecoder<VkAccelerationStructureKHR>* pAccelerationStructures,
+    VkQueryType                                 queryType,
+    format::HandleId                            queryPool,
+    uint32_t                                    firstQuery)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(accelerationStructureCount);
+    GFXRECON_UNREFERENCED_PARAMETER(queryType);
+    GFXRECON_UNREFERENCED_PARAMETER(firstQuery);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+    AddHandleIds(pAccelerationStructures, GetHandleIdList());
+    AddHandleId(queryPool, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetDeviceAccelerationStructureCompatibilityKHR(
+    format::HandleId                            device,
+    StructPointerDecoder<Decoded_VkAccelerationStructureVersionInfoKHR>* pVersionInfo,
+    PointerDecoder<VkAccelerationStructureCompatibilityKHR>* pCompatibility)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pVersionInfo);
+    GFXRECON_UNREFERENCED_PARAMETER(pCompatibility);
+
+    AddHandleId(device, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetAccelerationStructureBuildSizesKHR(
+    format::HandleId                            device,
+    VkAccelerationStructureBuildTypeKHR         buildType,
+    StructPointerDecoder<Decoded_VkAccelerationStructureBuildGeometryInfoKHR>* pBuildInfo,
+    PointerDecoder<uint32_t>*                   pMaxPrimitiveCounts,
+    StructPointerDecoder<Decoded_VkAccelerationStructureBuildSizesInfoKHR>* pSizeInfo)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(buildType);
+    GFXRECON_UNREFERENCED_PARAMETER(pMaxPrimitiveCounts);
+    GFXRECON_UNREFERENCED_PARAMETER(pSizeInfo);
+
+    AddHandleId(device, GetHandleIdList());
+    AddStructArrayHandleIds(pBuildInfo, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdTraceRaysKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pRaygenShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pMissShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pHitShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pCallableShaderBindingTable,
+    uint32_t                                    width,
+    uint32_t                                    height,
+    uint32_t                                    depth)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pRaygenShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pMissShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pHitShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pCallableShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(width);
+    GFXRECON_UNREFERENCED_PARAMETER(height);
+    GFXRECON_UNREFERENCED_PARAMETER(depth);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCreateRayTracingPipelinesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            deferredOperation,
+    format::HandleId                            pipelineCache,
+    uint32_t                                    createInfoCount,
+    StructPointerDecoder<Decoded_VkRayTracingPipelineCreateInfoKHR>* pCreateInfos,
+    StructPointerDecoder<Decoded_VkAllocationCallbacks>* pAllocator,
+    HandlePointerDecoder<VkPipeline>*           pPipelines)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(createInfoCount);
+    GFXRECON_UNREFERENCED_PARAMETER(pAllocator);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(deferredOperation, GetHandleIdList());
+    AddHandleId(pipelineCache, GetHandleIdList());
+    AddStructArrayHandleIds(pCreateInfos, GetHandleIdList());
+    AddHandleIds(pPipelines, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRayTracingCaptureReplayShaderGroupHandlesKHR(
+    VkResult                                    returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    uint32_t                                    firstGroup,
+    uint32_t                                    groupCount,
+    size_t                                      dataSize,
+    PointerDecoder<uint8_t>*                    pData)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(firstGroup);
+    GFXRECON_UNREFERENCED_PARAMETER(groupCount);
+    GFXRECON_UNREFERENCED_PARAMETER(dataSize);
+    GFXRECON_UNREFERENCED_PARAMETER(pData);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdTraceRaysIndirectKHR(
+    format::HandleId                            commandBuffer,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pRaygenShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pMissShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pHitShaderBindingTable,
+    StructPointerDecoder<Decoded_VkStridedDeviceAddressRegionKHR>* pCallableShaderBindingTable,
+    VkDeviceAddress                             indirectDeviceAddress)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pRaygenShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pMissShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pHitShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(pCallableShaderBindingTable);
+    GFXRECON_UNREFERENCED_PARAMETER(indirectDeviceAddress);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkGetRayTracingShaderGroupStackSizeKHR(
+    VkDeviceSize                                returnValue,
+    format::HandleId                            device,
+    format::HandleId                            pipeline,
+    uint32_t                                    group,
+    VkShaderGroupShaderKHR                      groupShader)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(group);
+    GFXRECON_UNREFERENCED_PARAMETER(groupShader);
+
+    AddHandleId(device, GetHandleIdList());
+    AddHandleId(pipeline, GetHandleIdList());
+}
+
+void VulkanHandleIdConsumer::Process_vkCmdSetRayTracingPipelineStackSizeKHR(
+    format::HandleId                            commandBuffer,
+    uint32_t                                    pipelineStackSize)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(pipelineStackSize);
+
+    AddHandleId(commandBuffer, GetHandleIdList());
+}
+
+GFXRECON_END_NAMESPACE(decode)
+GFXRECON_END_NAMESPACE(gfxrecon)
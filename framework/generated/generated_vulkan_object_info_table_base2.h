@@ -82,46 +82,46 @@ class VulkanObjectInfoTableBase2 : VulkanObjectInfoTableBase
     void AddSwapchainKHRInfo(SwapchainKHRInfo&& info) { AddObjectInfo(std::move(info), &swapchainKHR_map_); }
     void AddValidationCacheEXTInfo(ValidationCacheEXTInfo&& info) { AddObjectInfo(std::move(info), &validationCacheEXT_map_); }
 
-    void RemoveAccelerationStructureKHRInfo(format::HandleId id) { accelerationStructureKHR_map_.erase(id); }
-    void RemoveAccelerationStructureNVInfo(format::HandleId id) { accelerationStructureNV_map_.erase(id); }
-    void RemoveBufferInfo(format::HandleId id) { buffer_map_.erase(id); }
-    void RemoveBufferViewInfo(format::HandleId id) { bufferView_map_.erase(id); }
-    void RemoveCommandBufferInfo(format::HandleId id) { commandBuffer_map_.erase(id); }
-    void RemoveCommandPoolInfo(format::HandleId id) { commandPool_map_.erase(id); }
-    void RemoveDebugReportCallbackEXTInfo(format::HandleId id) { debugReportCallbackEXT_map_.erase(id); }
-    void RemoveDebugUtilsMessengerEXTInfo(format::HandleId id) { debugUtilsMessengerEXT_map_.erase(id); }
-    void RemoveDeferredOperationKHRInfo(format::HandleId id) { deferredOperationKHR_map_.erase(id); }
-    void RemoveDescriptorPoolInfo(format::HandleId id) { descriptorPool_map_.erase(id); }
-    void RemoveDescriptorSetInfo(format::HandleId id) { descriptorSet_map_.erase(id); }
-    void RemoveDescriptorSetLayoutInfo(format::HandleId id) { descriptorSetLayout_map_.erase(id); }
-    void RemoveDescriptorUpdateTemplateInfo(format::HandleId id) { descriptorUpdateTemplate_map_.erase(id); }
-    void RemoveDeviceInfo(format::HandleId id) { device_map_.erase(id); }
-    void RemoveDeviceMemoryInfo(format::HandleId id) { deviceMemory_map_.erase(id); }
-    void RemoveDisplayKHRInfo(format::HandleId id) { displayKHR_map_.erase(id); }
-    void RemoveDisplayModeKHRInfo(format::HandleId id) { displayModeKHR_map_.erase(id); }
-    void RemoveEventInfo(format::HandleId id) { event_map_.erase(id); }
-    void RemoveFenceInfo(format::HandleId id) { fence_map_.erase(id); }
-    void RemoveFramebufferInfo(format::HandleId id) { framebuffer_map_.erase(id); }
-    void RemoveImageInfo(format::HandleId id) { image_map_.erase(id); }
-    void RemoveImageViewInfo(format::HandleId id) { imageView_map_.erase(id); }
-    void RemoveIndirectCommandsLayoutNVInfo(format::HandleId id) { indirectCommandsLayoutNV_map_.erase(id); }
-    void RemoveInstanceInfo(format::HandleId id) { instance_map_.erase(id); }
-    void RemovePerformanceConfigurationINTELInfo(format::HandleId id) { performanceConfigurationINTEL_map_.erase(id); }
-    void RemovePhysicalDeviceInfo(format::HandleId id) { physicalDevice_map_.erase(id); }
-    void RemovePipelineInfo(format::HandleId id) { pipeline_map_.erase(id); }
-    void RemovePipelineCacheInfo(format::HandleId id) { pipelineCache_map_.erase(id); }
-    void RemovePipelineLayoutInfo(format::HandleId id) { pipelineLayout_map_.erase(id); }
-    void RemovePrivateDataSlotEXTInfo(format::HandleId id) { privateDataSlotEXT_map_.erase(id); }
-    void RemoveQueryPoolInfo(format::HandleId id) { queryPool_map_.erase(id); }
-    void RemoveQueueInfo(format::HandleId id) { queue_map_.erase(id); }
-    void RemoveRenderPassInfo(format::HandleId id) { renderPass_map_.erase(id); }
-    void RemoveSamplerInfo(format::HandleId id) { sampler_map_.erase(id); }
-    void RemoveSamplerYcbcrConversionInfo(format::HandleId id) { samplerYcbcrConversion_map_.erase(id); }
-    void RemoveSemaphoreInfo(format::HandleId id) { semaphore_map_.erase(id); }
-    void RemoveShaderModuleInfo(format::HandleId id) { shaderModule_map_.erase(id); }
-    void RemoveSurfaceKHRInfo(format::HandleId id) { surfaceKHR_map_.erase(id); }
-    void RemoveSwapchainKHRInfo(format::HandleId id) { swapchainKHR_map_.erase(id); }
-    void RemoveValidationCacheEXTInfo(format::HandleId id) { validationCacheEXT_map_.erase(id); }
+    void RemoveAccelerationStructureKHRInfo(format::HandleId id) { accelerationStructureKHR_map_.Erase(id); }
+    void RemoveAccelerationStructureNVInfo(format::HandleId id) { accelerationStructureNV_map_.Erase(id); }
+    void RemoveBufferInfo(format::HandleId id) { buffer_map_.Erase(id); }
+    void RemoveBufferViewInfo(format::HandleId id) { bufferView_map_.Erase(id); }
+    void RemoveCommandBufferInfo(format::HandleId id) { commandBuffer_map_.Erase(id); }
+    void RemoveCommandPoolInfo(format::HandleId id) { commandPool_map_.Erase(id); }
+    void RemoveDebugReportCallbackEXTInfo(format::HandleId id) { debugReportCallbackEXT_map_.Erase(id); }
+    void RemoveDebugUtilsMessengerEXTInfo(format::HandleId id) { debugUtilsMessengerEXT_map_.Erase(id); }
+    void RemoveDeferredOperationKHRInfo(format::HandleId id) { deferredOperationKHR_map_.Erase(id); }
+    void RemoveDescriptorPoolInfo(format::HandleId id) { descriptorPool_map_.Erase(id); }
+    void RemoveDescriptorSetInfo(format::HandleId id) { descriptorSet_map_.Erase(id); }
+    void RemoveDescriptorSetLayoutInfo(format::HandleId id) { descriptorSetLayout_map_.Erase(id); }
+    void RemoveDescriptorUpdateTemplateInfo(format::HandleId id) { descriptorUpdateTemplate_map_.Erase(id); }
+    void RemoveDeviceInfo(format::HandleId id) { device_map_.Erase(id); }
+    void RemoveDeviceMemoryInfo(format::HandleId id) { deviceMemory_map_.Erase(id); }
+    void RemoveDisplayKHRInfo(format::HandleId id) { displayKHR_map_.Erase(id); }
+    void RemoveDisplayModeKHRInfo(format::HandleId id) { displayModeKHR_map_.Erase(id); }
+    void RemoveEventInfo(format::HandleId id) { event_map_.Erase(id); }
+    void RemoveFenceInfo(format::HandleId id) { fence_map_.Erase(id); }
+    void RemoveFramebufferInfo(format::HandleId id) { framebuffer_map_.Erase(id); }
+    void RemoveImageInfo(format::HandleId id) { image_map_.Erase(id); }
+    void RemoveImageViewInfo(format::HandleId id) { imageView_map_.Erase(id); }
+    void RemoveIndirectCommandsLayoutNVInfo(format::HandleId id) { indirectCommandsLayoutNV_map_.Erase(id); }
+    void RemoveInstanceInfo(format::HandleId id) { instance_map_.Erase(id); }
+    void RemovePerformanceConfigurationINTELInfo(format::HandleId id) { performanceConfigurationINTEL_map_.Erase(id); }
+    void RemovePhysicalDeviceInfo(format::HandleId id) { physicalDevice_map_.Erase(id); }
+    void RemovePipelineInfo(format::HandleId id) { pipeline_map_.Erase(id); }
+    void RemovePipelineCacheInfo(format::HandleId id) { pipelineCache_map_.Erase(id); }
+    void RemovePipelineLayoutInfo(format::HandleId id) { pipelineLayout_map_.Erase(id); }
+    void RemovePrivateDataSlotEXTInfo(format::HandleId id) { privateDataSlotEXT_map_.Erase(id); }
+    void RemoveQueryPoolInfo(format::HandleId id) { queryPool_map_.Erase(id); }
+    void RemoveQueueInfo(format::HandleId id) { queue_map_.Erase(id); }
+    void RemoveRenderPassInfo(format::HandleId id) { renderPass_map_.Erase(id); }
+    void RemoveSamplerInfo(format::HandleId id) { sampler_map_.Erase(id); }
+    void RemoveSamplerYcbcrConversionInfo(format::HandleId id) { samplerYcbcrConversion_map_.Erase(id); }
+    void RemoveSemaphoreInfo(format::HandleId id) { semaphore_map_.Erase(id); }
+    void RemoveShaderModuleInfo(format::HandleId id) { shaderModule_map_.Erase(id); }
+    void RemoveSurfaceKHRInfo(format::HandleId id) { surfaceKHR_map_.Erase(id); }
+    void RemoveSwapchainKHRInfo(format::HandleId id) { swapchainKHR_map_.Erase(id); }
+    void RemoveValidationCacheEXTInfo(format::HandleId id) { validationCacheEXT_map_.Erase(id); }
 
     const AccelerationStructureKHRInfo* GetAccelerationStructureKHRInfo(format::HandleId id) const { return GetObjectInfo<AccelerationStructureKHRInfo>(id, &accelerationStructureKHR_map_); }
     const AccelerationStructureNVInfo* GetAccelerationStructureNVInfo(format::HandleId id) const { return GetObjectInfo<AccelerationStructureNVInfo>(id, &accelerationStructureNV_map_); }
@@ -205,88 +205,88 @@ class VulkanObjectInfoTableBase2 : VulkanObjectInfoTableBase
     SwapchainKHRInfo* GetSwapchainKHRInfo(format::HandleId id) { return GetObjectInfo<SwapchainKHRInfo>(id, &swapchainKHR_map_); }
     ValidationCacheEXTInfo* GetValidationCacheEXTInfo(format::HandleId id) { return GetObjectInfo<ValidationCacheEXTInfo>(id, &validationCacheEXT_map_); }
 
-    void VisitAccelerationStructureKHRInfo(std::function<void(const AccelerationStructureKHRInfo*)> visitor) const {  for (const auto& entry : accelerationStructureKHR_map_) { visitor(&entry.second); }  }
-    void VisitAccelerationStructureNVInfo(std::function<void(const AccelerationStructureNVInfo*)> visitor) const {  for (const auto& entry : accelerationStructureNV_map_) { visitor(&entry.second); }  }
-    void VisitBufferInfo(std::function<void(const BufferInfo*)> visitor) const {  for (const auto& entry : buffer_map_) { visitor(&entry.second); }  }
-    void VisitBufferViewInfo(std::function<void(const BufferViewInfo*)> visitor) const {  for (const auto& entry : bufferView_map_) { visitor(&entry.second); }  }
-    void VisitCommandBufferInfo(std::function<void(const CommandBufferInfo*)> visitor) const {  for (const auto& entry : commandBuffer_map_) { visitor(&entry.second); }  }
-    void VisitCommandPoolInfo(std::function<void(const CommandPoolInfo*)> visitor) const {  for (const auto& entry : commandPool_map_) { visitor(&entry.second); }  }
-    void VisitDebugReportCallbackEXTInfo(std::function<void(const DebugReportCallbackEXTInfo*)> visitor) const {  for (const auto& entry : debugReportCallbackEXT_map_) { visitor(&entry.second); }  }
-    void VisitDebugUtilsMessengerEXTInfo(std::function<void(const DebugUtilsMessengerEXTInfo*)> visitor) const {  for (const auto& entry : debugUtilsMessengerEXT_map_) { visitor(&entry.second); }  }
-    void VisitDeferredOperationKHRInfo(std::function<void(const DeferredOperationKHRInfo*)> visitor) const {  for (const auto& entry : deferredOperationKHR_map_) { visitor(&entry.second); }  }
-    void VisitDescriptorPoolInfo(std::function<void(const DescriptorPoolInfo*)> visitor) const {  for (const auto& entry : descriptorPool_map_) { visitor(&entry.second); }  }
-    void VisitDescriptorSetInfo(std::function<void(const DescriptorSetInfo*)> visitor) const {  for (const auto& entry : descriptorSet_map_) { visitor(&entry.second); }  }
-    void VisitDescriptorSetLayoutInfo(std::function<void(const DescriptorSetLayoutInfo*)> visitor) const {  for (const auto& entry : descriptorSetLayout_map_) { visitor(&entry.second); }  }
-    void VisitDescriptorUpdateTemplateInfo(std::function<void(const DescriptorUpdateTemplateInfo*)> visitor) const {  for (const auto& entry : descriptorUpdateTemplate_map_) { visitor(&entry.second); }  }
-    void VisitDeviceInfo(std::function<void(const DeviceInfo*)> visitor) const {  for (const auto& entry : device_map_) { visitor(&entry.second); }  }
-    void VisitDeviceMemoryInfo(std::function<void(const DeviceMemoryInfo*)> visitor) const {  for (const auto& entry : deviceMemory_map_) { visitor(&entry.second); }  }
-    void VisitDisplayKHRInfo(std::function<void(const DisplayKHRInfo*)> visitor) const {  for (const auto& entry : displayKHR_map_) { visitor(&entry.second); }  }
-    void VisitDisplayModeKHRInfo(std::function<void(const DisplayModeKHRInfo*)> visitor) const {  for (const auto& entry : displayModeKHR_map_) { visitor(&entry.second); }  }
-    void VisitEventInfo(std::function<void(const EventInfo*)> visitor) const {  for (const auto& entry : event_map_) { visitor(&entry.second); }  }
-    void VisitFenceInfo(std::function<void(const FenceInfo*)> visitor) const {  for (const auto& entry : fence_map_) { visitor(&entry.second); }  }
-    void VisitFramebufferInfo(std::function<void(const FramebufferInfo*)> visitor) const {  for (const auto& entry : framebuffer_map_) { visitor(&entry.second); }  }
-    void VisitImageInfo(std::function<void(const ImageInfo*)> visitor) const {  for (const auto& entry : image_map_) { visitor(&entry.second); }  }
-    void VisitImageViewInfo(std::function<void(const ImageViewInfo*)> visitor) const {  for (const auto& entry : imageView_map_) { visitor(&entry.second); }  }
-    void VisitIndirectCommandsLayoutNVInfo(std::function<void(const IndirectCommandsLayoutNVInfo*)> visitor) const {  for (const auto& entry : indirectCommandsLayoutNV_map_) { visitor(&entry.second); }  }
-    void VisitInstanceInfo(std::function<void(const InstanceInfo*)> visitor) const {  for (const auto& entry : instance_map_) { visitor(&entry.second); }  }
-    void VisitPerformanceConfigurationINTELInfo(std::function<void(const PerformanceConfigurationINTELInfo*)> visitor) const {  for (const auto& entry : performanceConfigurationINTEL_map_) { visitor(&entry.second); }  }
-    void VisitPhysicalDeviceInfo(std::function<void(const PhysicalDeviceInfo*)> visitor) const {  for (const auto& entry : physicalDevice_map_) { visitor(&entry.second); }  }
-    void VisitPipelineInfo(std::function<void(const PipelineInfo*)> visitor) const {  for (const auto& entry : pipeline_map_) { visitor(&entry.second); }  }
-    void VisitPipelineCacheInfo(std::function<void(const PipelineCacheInfo*)> visitor) const {  for (const auto& entry : pipelineCache_map_) { visitor(&entry.second); }  }
-    void VisitPipelineLayoutInfo(std::function<void(const PipelineLayoutInfo*)> visitor) const {  for (const auto& entry : pipelineLayout_map_) { visitor(&entry.second); }  }
-    void VisitPrivateDataSlotEXTInfo(std::function<void(const PrivateDataSlotEXTInfo*)> visitor) const {  for (const auto& entry : privateDataSlotEXT_map_) { visitor(&entry.second); }  }
-    void VisitQueryPoolInfo(std::function<void(const QueryPoolInfo*)> visitor) const {  for (const auto& entry : queryPool_map_) { visitor(&entry.second); }  }
-    void VisitQueueInfo(std::function<void(const QueueInfo*)> visitor) const {  for (const auto& entry : queue_map_) { visitor(&entry.second); }  }
-    void VisitRenderPassInfo(std::function<void(const RenderPassInfo*)> visitor) const {  for (const auto& entry : renderPass_map_) { visitor(&entry.second); }  }
-    void VisitSamplerInfo(std::function<void(const SamplerInfo*)> visitor) const {  for (const auto& entry : sampler_map_) { visitor(&entry.second); }  }
-    void VisitSamplerYcbcrConversionInfo(std::function<void(const SamplerYcbcrConversionInfo*)> visitor) const {  for (const auto& entry : samplerYcbcrConversion_map_) { visitor(&entry.second); }  }
-    void VisitSemaphoreInfo(std::function<void(const SemaphoreInfo*)> visitor) const {  for (const auto& entry : semaphore_map_) { visitor(&entry.second); }  }
-    void VisitShaderModuleInfo(std::function<void(const ShaderModuleInfo*)> visitor) const {  for (const auto& entry : shaderModule_map_) { visitor(&entry.second); }  }
-    void VisitSurfaceKHRInfo(std::function<void(const SurfaceKHRInfo*)> visitor) const {  for (const auto& entry : surfaceKHR_map_) { visitor(&entry.second); }  }
-    void VisitSwapchainKHRInfo(std::function<void(const SwapchainKHRInfo*)> visitor) const {  for (const auto& entry : swapchainKHR_map_) { visitor(&entry.second); }  }
-    void VisitValidationCacheEXTInfo(std::function<void(const ValidationCacheEXTInfo*)> visitor) const {  for (const auto& entry : validationCacheEXT_map_) { visitor(&entry.second); }  }
+    void VisitAccelerationStructureKHRInfo(std::function<void(const AccelerationStructureKHRInfo*)> visitor) const { accelerationStructureKHR_map_.Visit(visitor); }
+    void VisitAccelerationStructureNVInfo(std::function<void(const AccelerationStructureNVInfo*)> visitor) const { accelerationStructureNV_map_.Visit(visitor); }
+    void VisitBufferInfo(std::function<void(const BufferInfo*)> visitor) const { buffer_map_.Visit(visitor); }
+    void VisitBufferViewInfo(std::function<void(const BufferViewInfo*)> visitor) const { bufferView_map_.Visit(visitor); }
+    void VisitCommandBufferInfo(std::function<void(const CommandBufferInfo*)> visitor) const { commandBuffer_map_.Visit(visitor); }
+    void VisitCommandPoolInfo(std::function<void(const CommandPoolInfo*)> visitor) const { commandPool_map_.Visit(visitor); }
+    void VisitDebugReportCallbackEXTInfo(std::function<void(const DebugReportCallbackEXTInfo*)> visitor) const { debugReportCallbackEXT_map_.Visit(visitor); }
+    void VisitDebugUtilsMessengerEXTInfo(std::function<void(const DebugUtilsMessengerEXTInfo*)> visitor) const { debugUtilsMessengerEXT_map_.Visit(visitor); }
+    void VisitDeferredOperationKHRInfo(std::function<void(const DeferredOperationKHRInfo*)> visitor) const { deferredOperationKHR_map_.Visit(visitor); }
+    void VisitDescriptorPoolInfo(std::function<void(const DescriptorPoolInfo*)> visitor) const { descriptorPool_map_.Visit(visitor); }
+    void VisitDescriptorSetInfo(std::function<void(const DescriptorSetInfo*)> visitor) const { descriptorSet_map_.Visit(visitor); }
+    void VisitDescriptorSetLayoutInfo(std::function<void(const DescriptorSetLayoutInfo*)> visitor) const { descriptorSetLayout_map_.Visit(visitor); }
+    void VisitDescriptorUpdateTemplateInfo(std::function<void(const DescriptorUpdateTemplateInfo*)> visitor) const { descriptorUpdateTemplate_map_.Visit(visitor); }
+    void VisitDeviceInfo(std::function<void(const DeviceInfo*)> visitor) const { device_map_.Visit(visitor); }
+    void VisitDeviceMemoryInfo(std::function<void(const DeviceMemoryInfo*)> visitor) const { deviceMemory_map_.Visit(visitor); }
+    void VisitDisplayKHRInfo(std::function<void(const DisplayKHRInfo*)> visitor) const { displayKHR_map_.Visit(visitor); }
+    void VisitDisplayModeKHRInfo(std::function<void(const DisplayModeKHRInfo*)> visitor) const { displayModeKHR_map_.Visit(visitor); }
+    void VisitEventInfo(std::function<void(const EventInfo*)> visitor) const { event_map_.Visit(visitor); }
+    void VisitFenceInfo(std::function<void(const FenceInfo*)> visitor) const { fence_map_.Visit(visitor); }
+    void VisitFramebufferInfo(std::function<void(const FramebufferInfo*)> visitor) const { framebuffer_map_.Visit(visitor); }
+    void VisitImageInfo(std::function<void(const ImageInfo*)> visitor) const { image_map_.Visit(visitor); }
+    void VisitImageViewInfo(std::function<void(const ImageViewInfo*)> visitor) const { imageView_map_.Visit(visitor); }
+    void VisitIndirectCommandsLayoutNVInfo(std::function<void(const IndirectCommandsLayoutNVInfo*)> visitor) const { indirectCommandsLayoutNV_map_.Visit(visitor); }
+    void VisitInstanceInfo(std::function<void(const InstanceInfo*)> visitor) const { instance_map_.Visit(visitor); }
+    void VisitPerformanceConfigurationINTELInfo(std::function<void(const PerformanceConfigurationINTELInfo*)> visitor) const { performanceConfigurationINTEL_map_.Visit(visitor); }
+    void VisitPhysicalDeviceInfo(std::function<void(const PhysicalDeviceInfo*)> visitor) const { physicalDevice_map_.Visit(visitor); }
+    void VisitPipelineInfo(std::function<void(const PipelineInfo*)> visitor) const { pipeline_map_.Visit(visitor); }
+    void VisitPipelineCacheInfo(std::function<void(const PipelineCacheInfo*)> visitor) const { pipelineCache_map_.Visit(visitor); }
+    void VisitPipelineLayoutInfo(std::function<void(const PipelineLayoutInfo*)> visitor) const { pipelineLayout_map_.Visit(visitor); }
+    void VisitPrivateDataSlotEXTInfo(std::function<void(const PrivateDataSlotEXTInfo*)> visitor) const { privateDataSlotEXT_map_.Visit(visitor); }
+    void VisitQueryPoolInfo(std::function<void(const QueryPoolInfo*)> visitor) const { queryPool_map_.Visit(visitor); }
+    void VisitQueueInfo(std::function<void(const QueueInfo*)> visitor) const { queue_map_.Visit(visitor); }
+    void VisitRenderPassInfo(std::function<void(const RenderPassInfo*)> visitor) const { renderPass_map_.Visit(visitor); }
+    void VisitSamplerInfo(std::function<void(const SamplerInfo*)> visitor) const { sampler_map_.Visit(visitor); }
+    void VisitSamplerYcbcrConversionInfo(std::function<void(const SamplerYcbcrConversionInfo*)> visitor) const { samplerYcbcrConversion_map_.Visit(visitor); }
+    void VisitSemaphoreInfo(std::function<void(const SemaphoreInfo*)> visitor) const { semaphore_map_.Visit(visitor); }
+    void VisitShaderModuleInfo(std::function<void(const ShaderModuleInfo*)> visitor) const { shaderModule_map_.Visit(visitor); }
+    void VisitSurfaceKHRInfo(std::function<void(const SurfaceKHRInfo*)> visitor) const { surfaceKHR_map_.Visit(visitor); }
+    void VisitSwapchainKHRInfo(std::function<void(const SwapchainKHRInfo*)> visitor) const { swapchainKHR_map_.Visit(visitor); }
+    void VisitValidationCacheEXTInfo(std::function<void(const ValidationCacheEXTInfo*)> visitor) const { validationCacheEXT_map_.Visit(visitor); }
 
   protected:
-     std::unordered_map<format::HandleId, AccelerationStructureKHRInfo> accelerationStructureKHR_map_;
-     std::unordered_map<format::HandleId, AccelerationStructureNVInfo> accelerationStructureNV_map_;
-     std::unordered_map<format::HandleId, BufferInfo> buffer_map_;
-     std::unordered_map<format::HandleId, BufferViewInfo> bufferView_map_;
-     std::unordered_map<format::HandleId, CommandBufferInfo> commandBuffer_map_;
-     std::unordered_map<format::HandleId, CommandPoolInfo> commandPool_map_;
-     std::unordered_map<format::HandleId, DebugReportCallbackEXTInfo> debugReportCallbackEXT_map_;
-     std::unordered_map<format::HandleId, DebugUtilsMessengerEXTInfo> debugUtilsMessengerEXT_map_;
-     std::unordered_map<format::HandleId, DeferredOperationKHRInfo> deferredOperationKHR_map_;
-     std::unordered_map<format::HandleId, DescriptorPoolInfo> descriptorPool_map_;
-     std::unordered_map<format::HandleId, DescriptorSetInfo> descriptorSet_map_;
-     std::unordered_map<format::HandleId, DescriptorSetLayoutInfo> descriptorSetLayout_map_;
-     std::unordered_map<format::HandleId, DescriptorUpdateTemplateInfo> descriptorUpdateTemplate_map_;
-     std::unordered_map<format::HandleId, DeviceInfo> device_map_;
-     std::unordered_map<format::HandleId, DeviceMemoryInfo> deviceMemory_map_;
-     std::unordered_map<format::HandleId, DisplayKHRInfo> displayKHR_map_;
-     std::unordered_map<format::HandleId, DisplayModeKHRInfo> displayModeKHR_map_;
-     std::unordered_map<format::HandleId, EventInfo> event_map_;
-     std::unordered_map<format::HandleId, FenceInfo> fence_map_;
-     std::unordered_map<format::HandleId, FramebufferInfo> framebuffer_map_;
-     std::unordered_map<format::HandleId, ImageInfo> image_map_;
-     std::unordered_map<format::HandleId, ImageViewInfo> imageView_map_;
-     std::unordered_map<format::HandleId, IndirectCommandsLayoutNVInfo> indirectCommandsLayoutNV_map_;
-     std::unordered_map<format::HandleId, InstanceInfo> instance_map_;
-     std::unordered_map<format::HandleId, PerformanceConfigurationINTELInfo> performanceConfigurationINTEL_map_;
-     std::unordered_map<format::HandleId, PhysicalDeviceInfo> physicalDevice_map_;
-     std::unordered_map<format::HandleId, PipelineInfo> pipeline_map_;
-     std::unordered_map<format::HandleId, PipelineCacheInfo> pipelineCache_map_;
-     std::unordered_map<format::HandleId, PipelineLayoutInfo> pipelineLayout_map_;
-     std::unordered_map<format::HandleId, PrivateDataSlotEXTInfo> privateDataSlotEXT_map_;
-     std::unordered_map<format::HandleId, QueryPoolInfo> queryPool_map_;
-     std::unordered_map<format::HandleId, QueueInfo> queue_map_;
-     std::unordered_map<format::HandleId, RenderPassInfo> renderPass_map_;
-     std::unordered_map<format::HandleId, SamplerInfo> sampler_map_;
-     std::unordered_map<format::HandleId, SamplerYcbcrConversionInfo> samplerYcbcrConversion_map_;
-     std::unordered_map<format::HandleId, SemaphoreInfo> semaphore_map_;
-     std::unordered_map<format::HandleId, ShaderModuleInfo> shaderModule_map_;
-     std::unordered_map<format::HandleId, SurfaceKHRInfo> surfaceKHR_map_;
-     std::unordered_map<format::HandleId, SwapchainKHRInfo> swapchainKHR_map_;
-     std::unordered_map<format::HandleId, ValidationCacheEXTInfo> validationCacheEXT_map_;
+     HandleIdMap<AccelerationStructureKHRInfo> accelerationStructureKHR_map_;
+     HandleIdMap<AccelerationStructureNVInfo> accelerationStructureNV_map_;
+     HandleIdMap<BufferInfo> buffer_map_;
+     HandleIdMap<BufferViewInfo> bufferView_map_;
+     HandleIdMap<CommandBufferInfo> commandBuffer_map_;
+     HandleIdMap<CommandPoolInfo> commandPool_map_;
+     HandleIdMap<DebugReportCallbackEXTInfo> debugReportCallbackEXT_map_;
+     HandleIdMap<DebugUtilsMessengerEXTInfo> debugUtilsMessengerEXT_map_;
+     HandleIdMap<DeferredOperationKHRInfo> deferredOperationKHR_map_;
+     HandleIdMap<DescriptorPoolInfo> descriptorPool_map_;
+     HandleIdMap<DescriptorSetInfo> descriptorSet_map_;
+     HandleIdMap<DescriptorSetLayoutInfo> descriptorSetLayout_map_;
+     HandleIdMap<DescriptorUpdateTemplateInfo> descriptorUpdateTemplate_map_;
+     HandleIdMap<DeviceInfo> device_map_;
+     HandleIdMap<DeviceMemoryInfo> deviceMemory_map_;
+     HandleIdMap<DisplayKHRInfo> displayKHR_map_;
+     HandleIdMap<DisplayModeKHRInfo> displayModeKHR_map_;
+     HandleIdMap<EventInfo> event_map_;
+     HandleIdMap<FenceInfo> fence_map_;
+     HandleIdMap<FramebufferInfo> framebuffer_map_;
+     HandleIdMap<ImageInfo> image_map_;
+     HandleIdMap<ImageViewInfo> imageView_map_;
+     HandleIdMap<IndirectCommandsLayoutNVInfo> indirectCommandsLayoutNV_map_;
+     HandleIdMap<InstanceInfo> instance_map_;
+     HandleIdMap<PerformanceConfigurationINTELInfo> performanceConfigurationINTEL_map_;
+     HandleIdMap<PhysicalDeviceInfo> physicalDevice_map_;
+     HandleIdMap<PipelineInfo> pipeline_map_;
+     HandleIdMap<PipelineCacheInfo> pipelineCache_map_;
+     HandleIdMap<PipelineLayoutInfo> pipelineLayout_map_;
+     HandleIdMap<PrivateDataSlotEXTInfo> privateDataSlotEXT_map_;
+     HandleIdMap<QueryPoolInfo> queryPool_map_;
+     HandleIdMap<QueueInfo> queue_map_;
+     HandleIdMap<RenderPassInfo> renderPass_map_;
+     HandleIdMap<SamplerInfo> sampler_map_;
+     HandleIdMap<SamplerYcbcrConversionInfo> samplerYcbcrConversion_map_;
+     HandleIdMap<SemaphoreInfo> semaphore_map_;
+     HandleIdMap<ShaderModuleInfo> shaderModule_map_;
+     HandleIdMap<SurfaceKHRInfo> surfaceKHR_map_;
+     HandleIdMap<SwapchainKHRInfo> swapchainKHR_map_;
+     HandleIdMap<ValidationCacheEXTInfo> validationCacheEXT_map_;
 };
 
 GFXRECON_END_NAMESPACE(decode)
@@ -205,88 +205,88 @@ class VulkanStateTable : VulkanStateTableBase
     SwapchainKHRWrapper* GetSwapchainKHRWrapper(format::HandleId id) { return GetWrapper<SwapchainKHRWrapper>(id, swapchainKHR_map_); }
     ValidationCacheEXTWrapper* GetValidationCacheEXTWrapper(format::HandleId id) { return GetWrapper<ValidationCacheEXTWrapper>(id, validationCacheEXT_map_); }
 
-    void VisitWrappers(std::function<void(AccelerationStructureKHRWrapper*)> visitor) const { for (auto entry : accelerationStructureKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(AccelerationStructureNVWrapper*)> visitor) const { for (auto entry : accelerationStructureNV_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(BufferWrapper*)> visitor) const { for (auto entry : buffer_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(BufferViewWrapper*)> visitor) const { for (auto entry : bufferView_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(CommandBufferWrapper*)> visitor) const { for (auto entry : commandBuffer_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(CommandPoolWrapper*)> visitor) const { for (auto entry : commandPool_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DebugReportCallbackEXTWrapper*)> visitor) const { for (auto entry : debugReportCallbackEXT_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DebugUtilsMessengerEXTWrapper*)> visitor) const { for (auto entry : debugUtilsMessengerEXT_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DeferredOperationKHRWrapper*)> visitor) const { for (auto entry : deferredOperationKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DescriptorPoolWrapper*)> visitor) const { for (auto entry : descriptorPool_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DescriptorSetWrapper*)> visitor) const { for (auto entry : descriptorSet_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DescriptorSetLayoutWrapper*)> visitor) const { for (auto entry : descriptorSetLayout_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DescriptorUpdateTemplateWrapper*)> visitor) const { for (auto entry : descriptorUpdateTemplate_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DeviceWrapper*)> visitor) const { for (auto entry : device_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DeviceMemoryWrapper*)> visitor) const { for (auto entry : deviceMemory_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DisplayKHRWrapper*)> visitor) const { for (auto entry : displayKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(DisplayModeKHRWrapper*)> visitor) const { for (auto entry : displayModeKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(EventWrapper*)> visitor) const { for (auto entry : event_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(FenceWrapper*)> visitor) const { for (auto entry : fence_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(FramebufferWrapper*)> visitor) const { for (auto entry : framebuffer_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(ImageWrapper*)> visitor) const { for (auto entry : image_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(ImageViewWrapper*)> visitor) const { for (auto entry : imageView_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(IndirectCommandsLayoutNVWrapper*)> visitor) const { for (auto entry : indirectCommandsLayoutNV_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(InstanceWrapper*)> visitor) const { for (auto entry : instance_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PerformanceConfigurationINTELWrapper*)> visitor) const { for (auto entry : performanceConfigurationINTEL_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PhysicalDeviceWrapper*)> visitor) const { for (auto entry : physicalDevice_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PipelineWrapper*)> visitor) const { for (auto entry : pipeline_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PipelineCacheWrapper*)> visitor) const { for (auto entry : pipelineCache_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PipelineLayoutWrapper*)> visitor) const { for (auto entry : pipelineLayout_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(PrivateDataSlotEXTWrapper*)> visitor) const { for (auto entry : privateDataSlotEXT_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(QueryPoolWrapper*)> visitor) const { for (auto entry : queryPool_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(QueueWrapper*)> visitor) const { for (auto entry : queue_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(RenderPassWrapper*)> visitor) const { for (auto entry : renderPass_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(SamplerWrapper*)> visitor) const { for (auto entry : sampler_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(SamplerYcbcrConversionWrapper*)> visitor) const { for (auto entry : samplerYcbcrConversion_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(SemaphoreWrapper*)> visitor) const { for (auto entry : semaphore_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(ShaderModuleWrapper*)> visitor) const { for (auto entry : shaderModule_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(SurfaceKHRWrapper*)> visitor) const { for (auto entry : surfaceKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(SwapchainKHRWrapper*)> visitor) const { for (auto entry : swapchainKHR_map_) { visitor(entry.second); } }
-    void VisitWrappers(std::function<void(ValidationCacheEXTWrapper*)> visitor) const { for (auto entry : validationCacheEXT_map_) { visitor(entry.second); } }
+    void VisitWrappers(std::function<void(AccelerationStructureKHRWrapper*)> visitor) const { accelerationStructureKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(AccelerationStructureNVWrapper*)> visitor) const { accelerationStructureNV_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(BufferWrapper*)> visitor) const { buffer_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(BufferViewWrapper*)> visitor) const { bufferView_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(CommandBufferWrapper*)> visitor) const { commandBuffer_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(CommandPoolWrapper*)> visitor) const { commandPool_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DebugReportCallbackEXTWrapper*)> visitor) const { debugReportCallbackEXT_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DebugUtilsMessengerEXTWrapper*)> visitor) const { debugUtilsMessengerEXT_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DeferredOperationKHRWrapper*)> visitor) const { deferredOperationKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DescriptorPoolWrapper*)> visitor) const { descriptorPool_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DescriptorSetWrapper*)> visitor) const { descriptorSet_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DescriptorSetLayoutWrapper*)> visitor) const { descriptorSetLayout_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DescriptorUpdateTemplateWrapper*)> visitor) const { descriptorUpdateTemplate_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DeviceWrapper*)> visitor) const { device_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DeviceMemoryWrapper*)> visitor) const { deviceMemory_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DisplayKHRWrapper*)> visitor) const { displayKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(DisplayModeKHRWrapper*)> visitor) const { displayModeKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(EventWrapper*)> visitor) const { event_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(FenceWrapper*)> visitor) const { fence_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(FramebufferWrapper*)> visitor) const { framebuffer_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(ImageWrapper*)> visitor) const { image_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(ImageViewWrapper*)> visitor) const { imageView_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(IndirectCommandsLayoutNVWrapper*)> visitor) const { indirectCommandsLayoutNV_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(InstanceWrapper*)> visitor) const { instance_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PerformanceConfigurationINTELWrapper*)> visitor) const { performanceConfigurationINTEL_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PhysicalDeviceWrapper*)> visitor) const { physicalDevice_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PipelineWrapper*)> visitor) const { pipeline_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PipelineCacheWrapper*)> visitor) const { pipelineCache_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PipelineLayoutWrapper*)> visitor) const { pipelineLayout_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(PrivateDataSlotEXTWrapper*)> visitor) const { privateDataSlotEXT_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(QueryPoolWrapper*)> visitor) const { queryPool_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(QueueWrapper*)> visitor) const { queue_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(RenderPassWrapper*)> visitor) const { renderPass_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(SamplerWrapper*)> visitor) const { sampler_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(SamplerYcbcrConversionWrapper*)> visitor) const { samplerYcbcrConversion_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(SemaphoreWrapper*)> visitor) const { semaphore_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(ShaderModuleWrapper*)> visitor) const { shaderModule_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(SurfaceKHRWrapper*)> visitor) const { surfaceKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(SwapchainKHRWrapper*)> visitor) const { swapchainKHR_map_.Visit(visitor); }
+    void VisitWrappers(std::function<void(ValidationCacheEXTWrapper*)> visitor) const { validationCacheEXT_map_.Visit(visitor); }
 
   private:
-    std::map<format::HandleId, AccelerationStructureKHRWrapper*> accelerationStructureKHR_map_;
-    std::map<format::HandleId, AccelerationStructureNVWrapper*> accelerationStructureNV_map_;
-    std::map<format::HandleId, BufferWrapper*> buffer_map_;
-    std::map<format::HandleId, BufferViewWrapper*> bufferView_map_;
-    std::map<format::HandleId, CommandBufferWrapper*> commandBuffer_map_;
-    std::map<format::HandleId, CommandPoolWrapper*> commandPool_map_;
-    std::map<format::HandleId, DebugReportCallbackEXTWrapper*> debugReportCallbackEXT_map_;
-    std::map<format::HandleId, DebugUtilsMessengerEXTWrapper*> debugUtilsMessengerEXT_map_;
-    std::map<format::HandleId, DeferredOperationKHRWrapper*> deferredOperationKHR_map_;
-    std::map<format::HandleId, DescriptorPoolWrapper*> descriptorPool_map_;
-    std::map<format::HandleId, DescriptorSetWrapper*> descriptorSet_map_;
-    std::map<format::HandleId, DescriptorSetLayoutWrapper*> descriptorSetLayout_map_;
-    std::map<format::HandleId, DescriptorUpdateTemplateWrapper*> descriptorUpdateTemplate_map_;
-    std::map<format::HandleId, DeviceWrapper*> device_map_;
-    std::map<format::HandleId, DeviceMemoryWrapper*> deviceMemory_map_;
-    std::map<format::HandleId, DisplayKHRWrapper*> displayKHR_map_;
-    std::map<format::HandleId, DisplayModeKHRWrapper*> displayModeKHR_map_;
-    std::map<format::HandleId, EventWrapper*> event_map_;
-    std::map<format::HandleId, FenceWrapper*> fence_map_;
-    std::map<format::HandleId, FramebufferWrapper*> framebuffer_map_;
-    std::map<format::HandleId, ImageWrapper*> image_map_;
-    std::map<format::HandleId, ImageViewWrapper*> imageView_map_;
-    std::map<format::HandleId, IndirectCommandsLayoutNVWrapper*> indirectCommandsLayoutNV_map_;
-    std::map<format::HandleId, InstanceWrapper*> instance_map_;
-    std::map<format::HandleId, PerformanceConfigurationINTELWrapper*> performanceConfigurationINTEL_map_;
-    std::map<format::HandleId, PhysicalDeviceWrapper*> physicalDevice_map_;
-    std::map<format::HandleId, PipelineWrapper*> pipeline_map_;
-    std::map<format::HandleId, PipelineCacheWrapper*> pipelineCache_map_;
-    std::map<format::HandleId, PipelineLayoutWrapper*> pipelineLayout_map_;
-    std::map<format::HandleId, PrivateDataSlotEXTWrapper*> privateDataSlotEXT_map_;
-    std::map<format::HandleId, QueryPoolWrapper*> queryPool_map_;
-    std::map<format::HandleId, QueueWrapper*> queue_map_;
-    std::map<format::HandleId, RenderPassWrapper*> renderPass_map_;
-    std::map<format::HandleId, SamplerWrapper*> sampler_map_;
-    std::map<format::HandleId, SamplerYcbcrConversionWrapper*> samplerYcbcrConversion_map_;
-    std::map<format::HandleId, SemaphoreWrapper*> semaphore_map_;
-    std::map<format::HandleId, ShaderModuleWrapper*> shaderModule_map_;
-    std::map<format::HandleId, SurfaceKHRWrapper*> surfaceKHR_map_;
-    std::map<format::HandleId, SwapchainKHRWrapper*> swapchainKHR_map_;
-    std::map<format::HandleId, ValidationCacheEXTWrapper*> validationCacheEXT_map_;
+    HandleWrapperMap<AccelerationStructureKHRWrapper> accelerationStructureKHR_map_;
+    HandleWrapperMap<AccelerationStructureNVWrapper> accelerationStructureNV_map_;
+    HandleWrapperMap<BufferWrapper> buffer_map_;
+    HandleWrapperMap<BufferViewWrapper> bufferView_map_;
+    HandleWrapperMap<CommandBufferWrapper> commandBuffer_map_;
+    HandleWrapperMap<CommandPoolWrapper> commandPool_map_;
+    HandleWrapperMap<DebugReportCallbackEXTWrapper> debugReportCallbackEXT_map_;
+    HandleWrapperMap<DebugUtilsMessengerEXTWrapper> debugUtilsMessengerEXT_map_;
+    HandleWrapperMap<DeferredOperationKHRWrapper> deferredOperationKHR_map_;
+    HandleWrapperMap<DescriptorPoolWrapper> descriptorPool_map_;
+    HandleWrapperMap<DescriptorSetWrapper> descriptorSet_map_;
+    HandleWrapperMap<DescriptorSetLayoutWrapper> descriptorSetLayout_map_;
+    HandleWrapperMap<DescriptorUpdateTemplateWrapper> descriptorUpdateTemplate_map_;
+    HandleWrapperMap<DeviceWrapper> device_map_;
+    HandleWrapperMap<DeviceMemoryWrapper> deviceMemory_map_;
+    HandleWrapperMap<DisplayKHRWrapper> displayKHR_map_;
+    HandleWrapperMap<DisplayModeKHRWrapper> displayModeKHR_map_;
+    HandleWrapperMap<EventWrapper> event_map_;
+    HandleWrapperMap<FenceWrapper> fence_map_;
+    HandleWrapperMap<FramebufferWrapper> framebuffer_map_;
+    HandleWrapperMap<ImageWrapper> image_map_;
+    HandleWrapperMap<ImageViewWrapper> imageView_map_;
+    HandleWrapperMap<IndirectCommandsLayoutNVWrapper> indirectCommandsLayoutNV_map_;
+    HandleWrapperMap<InstanceWrapper> instance_map_;
+    HandleWrapperMap<PerformanceConfigurationINTELWrapper> performanceConfigurationINTEL_map_;
+    HandleWrapperMap<PhysicalDeviceWrapper> physicalDevice_map_;
+    HandleWrapperMap<PipelineWrapper> pipeline_map_;
+    HandleWrapperMap<PipelineCacheWrapper> pipelineCache_map_;
+    HandleWrapperMap<PipelineLayoutWrapper> pipelineLayout_map_;
+    HandleWrapperMap<PrivateDataSlotEXTWrapper> privateDataSlotEXT_map_;
+    HandleWrapperMap<QueryPoolWrapper> queryPool_map_;
+    HandleWrapperMap<QueueWrapper> queue_map_;
+    HandleWrapperMap<RenderPassWrapper> renderPass_map_;
+    HandleWrapperMap<SamplerWrapper> sampler_map_;
+    HandleWrapperMap<SamplerYcbcrConversionWrapper> samplerYcbcrConversion_map_;
+    HandleWrapperMap<SemaphoreWrapper> semaphore_map_;
+    HandleWrapperMap<ShaderModuleWrapper> shaderModule_map_;
+    HandleWrapperMap<SurfaceKHRWrapper> surfaceKHR_map_;
+    HandleWrapperMap<SwapchainKHRWrapper> swapchainKHR_map_;
+    HandleWrapperMap<ValidationCacheEXTWrapper> validationCacheEXT_map_;
 };
 
 GFXRECON_END_NAMESPACE(encode)
@@ -34,10 +34,17 @@
 #include "vulkan/vulkan.h"
 
 #include <cstdint>
+#include <type_traits>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(decode)
 
+// Identifies the decoded struct types for Vulkan structs that are encoded with the same layout as the struct,
+// allowing arrays of the structs to be decoded with a single copy.
+template <typename T>
+struct IsTriviallyDecodable : std::false_type
+{};
+
 struct Decoded_VkExtent2D;
 struct Decoded_VkExtent3D;
 struct Decoded_VkOffset2D;
@@ -248,6 +255,37 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkImageResolve* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkRenderPassBeginInfo* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkExtent2D> : std::integral_constant<bool, sizeof(VkExtent2D) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkExtent3D> : std::integral_constant<bool, sizeof(VkExtent3D) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkOffset2D> : std::integral_constant<bool, sizeof(VkOffset2D) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkOffset3D> : std::integral_constant<bool, sizeof(VkOffset3D) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkDispatchIndirectCommand> : std::integral_constant<bool, sizeof(VkDispatchIndirectCommand) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkDrawIndexedIndirectCommand> : std::integral_constant<bool, sizeof(VkDrawIndexedIndirectCommand) == 20> {};
+template <> struct IsTriviallyDecodable<Decoded_VkDrawIndirectCommand> : std::integral_constant<bool, sizeof(VkDrawIndirectCommand) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkImageSubresourceRange> : std::integral_constant<bool, sizeof(VkImageSubresourceRange) == 20> {};
+template <> struct IsTriviallyDecodable<Decoded_VkFormatProperties> : std::integral_constant<bool, sizeof(VkFormatProperties) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkMemoryHeap> : std::integral_constant<bool, sizeof(VkMemoryHeap) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkMemoryType> : std::integral_constant<bool, sizeof(VkMemoryType) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPhysicalDeviceFeatures> : std::integral_constant<bool, sizeof(VkPhysicalDeviceFeatures) == 220> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPhysicalDeviceSparseProperties> : std::integral_constant<bool, sizeof(VkPhysicalDeviceSparseProperties) == 20> {};
+template <> struct IsTriviallyDecodable<Decoded_VkMemoryRequirements> : std::integral_constant<bool, sizeof(VkMemoryRequirements) == 20> {};
+template <> struct IsTriviallyDecodable<Decoded_VkImageSubresource> : std::integral_constant<bool, sizeof(VkImageSubresource) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkSubresourceLayout> : std::integral_constant<bool, sizeof(VkSubresourceLayout) == 40> {};
+template <> struct IsTriviallyDecodable<Decoded_VkComponentMapping> : std::integral_constant<bool, sizeof(VkComponentMapping) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkVertexInputBindingDescription> : std::integral_constant<bool, sizeof(VkVertexInputBindingDescription) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkVertexInputAttributeDescription> : std::integral_constant<bool, sizeof(VkVertexInputAttributeDescription) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkViewport> : std::integral_constant<bool, sizeof(VkViewport) == 24> {};
+template <> struct IsTriviallyDecodable<Decoded_VkStencilOpState> : std::integral_constant<bool, sizeof(VkStencilOpState) == 28> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPipelineColorBlendAttachmentState> : std::integral_constant<bool, sizeof(VkPipelineColorBlendAttachmentState) == 32> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPushConstantRange> : std::integral_constant<bool, sizeof(VkPushConstantRange) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkDescriptorPoolSize> : std::integral_constant<bool, sizeof(VkDescriptorPoolSize) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkAttachmentDescription> : std::integral_constant<bool, sizeof(VkAttachmentDescription) == 36> {};
+template <> struct IsTriviallyDecodable<Decoded_VkAttachmentReference> : std::integral_constant<bool, sizeof(VkAttachmentReference) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkSubpassDependency> : std::integral_constant<bool, sizeof(VkSubpassDependency) == 28> {};
+template <> struct IsTriviallyDecodable<Decoded_VkBufferCopy> : std::integral_constant<bool, sizeof(VkBufferCopy) == 24> {};
+template <> struct IsTriviallyDecodable<Decoded_VkImageSubresourceLayers> : std::integral_constant<bool, sizeof(VkImageSubresourceLayers) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkClearDepthStencilValue> : std::integral_constant<bool, sizeof(VkClearDepthStencilValue) == 8> {};
+
 struct Decoded_VkPhysicalDeviceSubgroupProperties;
 struct Decoded_VkBindBufferMemoryInfo;
 struct Decoded_VkBindImageMemoryInfo;
@@ -386,6 +424,9 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkDescriptorSetLayoutSupport* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceShaderDrawParametersFeatures* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkInputAttachmentAspectReference> : std::integral_constant<bool, sizeof(VkInputAttachmentAspectReference) == 12> {};
+template <> struct IsTriviallyDecodable<Decoded_VkExternalMemoryProperties> : std::integral_constant<bool, sizeof(VkExternalMemoryProperties) == 12> {};
+
 struct Decoded_VkPhysicalDeviceVulkan11Features;
 struct Decoded_VkPhysicalDeviceVulkan11Properties;
 struct Decoded_VkPhysicalDeviceVulkan12Features;
@@ -490,12 +531,16 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkMemoryOpaqueCaptureAddressAllocateInfo* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkDeviceMemoryOpaqueCaptureAddressInfo* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkConformanceVersion> : std::integral_constant<bool, sizeof(VkConformanceVersion) == 4> {};
+
 struct Decoded_VkSurfaceCapabilitiesKHR;
 struct Decoded_VkSurfaceFormatKHR;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkSurfaceCapabilitiesKHR* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkSurfaceFormatKHR* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkSurfaceFormatKHR> : std::integral_constant<bool, sizeof(VkSurfaceFormatKHR) == 8> {};
+
 struct Decoded_VkSwapchainCreateInfoKHR;
 struct Decoded_VkPresentInfoKHR;
 struct Decoded_VkImageSwapchainCreateInfoKHR;
@@ -882,6 +927,8 @@ struct Decoded_VkPipelineViewportWScalingStateCreateInfoNV;
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkViewportWScalingNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineViewportWScalingStateCreateInfoNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkViewportWScalingNV> : std::integral_constant<bool, sizeof(VkViewportWScalingNV) == 8> {};
+
 struct Decoded_VkSurfaceCapabilities2EXT;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkSurfaceCapabilities2EXT* wrapper);
@@ -906,6 +953,10 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPresentTimeGOOGLE* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPresentTimesInfoGOOGLE* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkRefreshCycleDurationGOOGLE> : std::integral_constant<bool, sizeof(VkRefreshCycleDurationGOOGLE) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPastPresentationTimingGOOGLE> : std::integral_constant<bool, sizeof(VkPastPresentationTimingGOOGLE) == 36> {};
+template <> struct IsTriviallyDecodable<Decoded_VkPresentTimeGOOGLE> : std::integral_constant<bool, sizeof(VkPresentTimeGOOGLE) == 12> {};
+
 struct Decoded_VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX* wrapper);
@@ -916,6 +967,8 @@ struct Decoded_VkPipelineViewportSwizzleStateCreateInfoNV;
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkViewportSwizzleNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineViewportSwizzleStateCreateInfoNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkViewportSwizzleNV> : std::integral_constant<bool, sizeof(VkViewportSwizzleNV) == 16> {};
+
 struct Decoded_VkPhysicalDeviceDiscardRectanglePropertiesEXT;
 struct Decoded_VkPipelineDiscardRectangleStateCreateInfoEXT;
 
@@ -940,6 +993,8 @@ struct Decoded_VkHdrMetadataEXT;
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkXYColorEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkHdrMetadataEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkXYColorEXT> : std::integral_constant<bool, sizeof(VkXYColorEXT) == 8> {};
+
 struct Decoded_VkIOSSurfaceCreateInfoMVK;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkIOSSurfaceCreateInfoMVK* wrapper);
@@ -1002,6 +1057,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceSampleLocationsPropertiesEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkMultisamplePropertiesEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkSampleLocationEXT> : std::integral_constant<bool, sizeof(VkSampleLocationEXT) == 8> {};
+
 struct Decoded_VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT;
 struct Decoded_VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT;
 struct Decoded_VkPipelineColorBlendAdvancedStateCreateInfoEXT;
@@ -1038,6 +1095,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkImageDrmFormatModifierExplicitCreateInfoEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkImageDrmFormatModifierPropertiesEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkDrmFormatModifierPropertiesEXT> : std::integral_constant<bool, sizeof(VkDrmFormatModifierPropertiesEXT) == 16> {};
+
 struct Decoded_VkValidationCacheCreateInfoEXT;
 struct Decoded_VkShaderModuleValidationCacheCreateInfoEXT;
 
@@ -1060,6 +1119,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkCoarseSampleOrderCustomNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineViewportCoarseSampleOrderStateCreateInfoNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkCoarseSampleLocationNV> : std::integral_constant<bool, sizeof(VkCoarseSampleLocationNV) == 12> {};
+
 struct Decoded_VkRayTracingShaderGroupCreateInfoNV;
 struct Decoded_VkRayTracingPipelineCreateInfoNV;
 struct Decoded_VkGeometryTrianglesNV;
@@ -1092,6 +1153,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkAabbPositionsKHR* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkAccelerationStructureInstanceKHR* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkAabbPositionsKHR> : std::integral_constant<bool, sizeof(VkAabbPositionsKHR) == 24> {};
+
 struct Decoded_VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV;
 struct Decoded_VkPipelineRepresentativeFragmentTestStateCreateInfoNV;
 
@@ -1142,6 +1205,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineVertexInputDivisorStateCreateInfoEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkVertexInputBindingDivisorDescriptionEXT> : std::integral_constant<bool, sizeof(VkVertexInputBindingDivisorDescriptionEXT) == 8> {};
+
 struct Decoded_VkPresentFrameTokenGGP;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPresentFrameTokenGGP* wrapper);
@@ -1152,6 +1217,8 @@ struct Decoded_VkPipelineCreationFeedbackCreateInfoEXT;
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineCreationFeedbackEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPipelineCreationFeedbackCreateInfoEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkPipelineCreationFeedbackEXT> : std::integral_constant<bool, sizeof(VkPipelineCreationFeedbackEXT) == 12> {};
+
 struct Decoded_VkPhysicalDeviceComputeShaderDerivativesFeaturesNV;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceComputeShaderDerivativesFeaturesNV* wrapper);
@@ -1164,6 +1231,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceMeshShaderPropertiesNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkDrawMeshTasksIndirectCommandNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkDrawMeshTasksIndirectCommandNV> : std::integral_constant<bool, sizeof(VkDrawMeshTasksIndirectCommandNV) == 8> {};
+
 struct Decoded_VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV* wrapper);
@@ -1376,6 +1445,11 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkGeneratedCommandsInfoNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkGeneratedCommandsMemoryRequirementsInfoNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkBindShaderGroupIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindShaderGroupIndirectCommandNV) == 4> {};
+template <> struct IsTriviallyDecodable<Decoded_VkBindIndexBufferIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindIndexBufferIndirectCommandNV) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkBindVertexBufferIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindVertexBufferIndirectCommandNV) == 16> {};
+template <> struct IsTriviallyDecodable<Decoded_VkSetStateFlagsIndirectCommandNV> : std::integral_constant<bool, sizeof(VkSetStateFlagsIndirectCommandNV) == 4> {};
+
 struct Decoded_VkPhysicalDeviceInheritedViewportScissorFeaturesNV;
 struct Decoded_VkCommandBufferInheritanceViewportScissorInfoNV;
 
@@ -1456,6 +1530,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkAccelerationStructureSRTMotionInstanceNV* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceRayTracingMotionBlurFeaturesNV* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkSRTDataNV> : std::integral_constant<bool, sizeof(VkSRTDataNV) == 64> {};
+
 struct Decoded_VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT* wrapper);
@@ -1556,6 +1632,9 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkMultiDrawInfoEXT* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkMultiDrawIndexedInfoEXT* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkMultiDrawInfoEXT> : std::integral_constant<bool, sizeof(VkMultiDrawInfoEXT) == 8> {};
+template <> struct IsTriviallyDecodable<Decoded_VkMultiDrawIndexedInfoEXT> : std::integral_constant<bool, sizeof(VkMultiDrawIndexedInfoEXT) == 12> {};
+
 struct Decoded_VkAccelerationStructureBuildRangeInfoKHR;
 struct Decoded_VkAccelerationStructureGeometryTrianglesDataKHR;
 struct Decoded_VkAccelerationStructureGeometryAabbsDataKHR;
@@ -1588,6 +1667,8 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkCopyAccelerationStructureInfoKHR* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkAccelerationStructureBuildSizesInfoKHR* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkAccelerationStructureBuildRangeInfoKHR> : std::integral_constant<bool, sizeof(VkAccelerationStructureBuildRangeInfoKHR) == 16> {};
+
 struct Decoded_VkRayTracingShaderGroupCreateInfoKHR;
 struct Decoded_VkRayTracingPipelineInterfaceCreateInfoKHR;
 struct Decoded_VkRayTracingPipelineCreateInfoKHR;
@@ -1604,6 +1685,9 @@ size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkStridedDeviceAddressRegionKHR* wrapper);
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkTraceRaysIndirectCommandKHR* wrapper);
 
+template <> struct IsTriviallyDecodable<Decoded_VkStridedDeviceAddressRegionKHR> : std::integral_constant<bool, sizeof(VkStridedDeviceAddressRegionKHR) == 24> {};
+template <> struct IsTriviallyDecodable<Decoded_VkTraceRaysIndirectCommandKHR> : std::integral_constant<bool, sizeof(VkTraceRaysIndirectCommandKHR) == 12> {};
+
 struct Decoded_VkPhysicalDeviceRayQueryFeaturesKHR;
 
 size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_VkPhysicalDeviceRayQueryFeaturesKHR* wrapper);
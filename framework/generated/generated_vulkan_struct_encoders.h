@@ -36,10 +36,17 @@
 #include "vulkan/vulkan.h"
 
 #include <cstdint>
+#include <type_traits>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(encode)
 
+// Identifies the Vulkan structs that are encoded with the same layout as the struct, allowing arrays of the
+// structs to be encoded with a single write.
+template <typename T>
+struct IsTriviallyEncodable : std::false_type
+{};
+
 void EncodePNextStruct(ParameterEncoder* encoder, const void* value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkExtent2D& value);
@@ -147,6 +154,46 @@ void EncodeStruct(ParameterEncoder* encoder, const VkImageCopy& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkImageResolve& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkRenderPassBeginInfo& value);
 
+template <> struct IsTriviallyEncodable<VkExtent2D> : std::integral_constant<bool, sizeof(VkExtent2D) == 8> {};
+template <> struct IsTriviallyEncodable<VkExtent3D> : std::integral_constant<bool, sizeof(VkExtent3D) == 12> {};
+template <> struct IsTriviallyEncodable<VkOffset2D> : std::integral_constant<bool, sizeof(VkOffset2D) == 8> {};
+template <> struct IsTriviallyEncodable<VkOffset3D> : std::integral_constant<bool, sizeof(VkOffset3D) == 12> {};
+template <> struct IsTriviallyEncodable<VkRect2D> : std::integral_constant<bool, sizeof(VkRect2D) == 16> {};
+template <> struct IsTriviallyEncodable<VkDispatchIndirectCommand> : std::integral_constant<bool, sizeof(VkDispatchIndirectCommand) == 12> {};
+template <> struct IsTriviallyEncodable<VkDrawIndexedIndirectCommand> : std::integral_constant<bool, sizeof(VkDrawIndexedIndirectCommand) == 20> {};
+template <> struct IsTriviallyEncodable<VkDrawIndirectCommand> : std::integral_constant<bool, sizeof(VkDrawIndirectCommand) == 16> {};
+template <> struct IsTriviallyEncodable<VkImageSubresourceRange> : std::integral_constant<bool, sizeof(VkImageSubresourceRange) == 20> {};
+template <> struct IsTriviallyEncodable<VkFormatProperties> : std::integral_constant<bool, sizeof(VkFormatProperties) == 12> {};
+template <> struct IsTriviallyEncodable<VkImageFormatProperties> : std::integral_constant<bool, sizeof(VkImageFormatProperties) == 32> {};
+template <> struct IsTriviallyEncodable<VkMemoryHeap> : std::integral_constant<bool, sizeof(VkMemoryHeap) == 12> {};
+template <> struct IsTriviallyEncodable<VkMemoryType> : std::integral_constant<bool, sizeof(VkMemoryType) == 8> {};
+template <> struct IsTriviallyEncodable<VkPhysicalDeviceFeatures> : std::integral_constant<bool, sizeof(VkPhysicalDeviceFeatures) == 220> {};
+template <> struct IsTriviallyEncodable<VkPhysicalDeviceSparseProperties> : std::integral_constant<bool, sizeof(VkPhysicalDeviceSparseProperties) == 20> {};
+template <> struct IsTriviallyEncodable<VkQueueFamilyProperties> : std::integral_constant<bool, sizeof(VkQueueFamilyProperties) == 24> {};
+template <> struct IsTriviallyEncodable<VkMemoryRequirements> : std::integral_constant<bool, sizeof(VkMemoryRequirements) == 20> {};
+template <> struct IsTriviallyEncodable<VkImageSubresource> : std::integral_constant<bool, sizeof(VkImageSubresource) == 12> {};
+template <> struct IsTriviallyEncodable<VkSparseImageFormatProperties> : std::integral_constant<bool, sizeof(VkSparseImageFormatProperties) == 20> {};
+template <> struct IsTriviallyEncodable<VkSparseImageMemoryRequirements> : std::integral_constant<bool, sizeof(VkSparseImageMemoryRequirements) == 48> {};
+template <> struct IsTriviallyEncodable<VkSubresourceLayout> : std::integral_constant<bool, sizeof(VkSubresourceLayout) == 40> {};
+template <> struct IsTriviallyEncodable<VkComponentMapping> : std::integral_constant<bool, sizeof(VkComponentMapping) == 16> {};
+template <> struct IsTriviallyEncodable<VkVertexInputBindingDescription> : std::integral_constant<bool, sizeof(VkVertexInputBindingDescription) == 12> {};
+template <> struct IsTriviallyEncodable<VkVertexInputAttributeDescription> : std::integral_constant<bool, sizeof(VkVertexInputAttributeDescription) == 16> {};
+template <> struct IsTriviallyEncodable<VkViewport> : std::integral_constant<bool, sizeof(VkViewport) == 24> {};
+template <> struct IsTriviallyEncodable<VkStencilOpState> : std::integral_constant<bool, sizeof(VkStencilOpState) == 28> {};
+template <> struct IsTriviallyEncodable<VkPipelineColorBlendAttachmentState> : std::integral_constant<bool, sizeof(VkPipelineColorBlendAttachmentState) == 32> {};
+template <> struct IsTriviallyEncodable<VkPushConstantRange> : std::integral_constant<bool, sizeof(VkPushConstantRange) == 12> {};
+template <> struct IsTriviallyEncodable<VkDescriptorPoolSize> : std::integral_constant<bool, sizeof(VkDescriptorPoolSize) == 8> {};
+template <> struct IsTriviallyEncodable<VkAttachmentDescription> : std::integral_constant<bool, sizeof(VkAttachmentDescription) == 36> {};
+template <> struct IsTriviallyEncodable<VkAttachmentReference> : std::integral_constant<bool, sizeof(VkAttachmentReference) == 8> {};
+template <> struct IsTriviallyEncodable<VkSubpassDependency> : std::integral_constant<bool, sizeof(VkSubpassDependency) == 28> {};
+template <> struct IsTriviallyEncodable<VkBufferCopy> : std::integral_constant<bool, sizeof(VkBufferCopy) == 24> {};
+template <> struct IsTriviallyEncodable<VkImageSubresourceLayers> : std::integral_constant<bool, sizeof(VkImageSubresourceLayers) == 16> {};
+template <> struct IsTriviallyEncodable<VkBufferImageCopy> : std::integral_constant<bool, sizeof(VkBufferImageCopy) == 56> {};
+template <> struct IsTriviallyEncodable<VkClearDepthStencilValue> : std::integral_constant<bool, sizeof(VkClearDepthStencilValue) == 8> {};
+template <> struct IsTriviallyEncodable<VkClearRect> : std::integral_constant<bool, sizeof(VkClearRect) == 24> {};
+template <> struct IsTriviallyEncodable<VkImageCopy> : std::integral_constant<bool, sizeof(VkImageCopy) == 68> {};
+template <> struct IsTriviallyEncodable<VkImageResolve> : std::integral_constant<bool, sizeof(VkImageResolve) == 68> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceSubgroupProperties& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkBindBufferMemoryInfo& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkBindImageMemoryInfo& value);
@@ -216,6 +263,9 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceMaintenance3P
 void EncodeStruct(ParameterEncoder* encoder, const VkDescriptorSetLayoutSupport& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceShaderDrawParametersFeatures& value);
 
+template <> struct IsTriviallyEncodable<VkInputAttachmentAspectReference> : std::integral_constant<bool, sizeof(VkInputAttachmentAspectReference) == 12> {};
+template <> struct IsTriviallyEncodable<VkExternalMemoryProperties> : std::integral_constant<bool, sizeof(VkExternalMemoryProperties) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceVulkan11Features& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceVulkan11Properties& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceVulkan12Features& value);
@@ -268,9 +318,14 @@ void EncodeStruct(ParameterEncoder* encoder, const VkBufferOpaqueCaptureAddressC
 void EncodeStruct(ParameterEncoder* encoder, const VkMemoryOpaqueCaptureAddressAllocateInfo& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkDeviceMemoryOpaqueCaptureAddressInfo& value);
 
+template <> struct IsTriviallyEncodable<VkConformanceVersion> : std::integral_constant<bool, sizeof(VkConformanceVersion) == 4> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkSurfaceCapabilitiesKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkSurfaceFormatKHR& value);
 
+template <> struct IsTriviallyEncodable<VkSurfaceCapabilitiesKHR> : std::integral_constant<bool, sizeof(VkSurfaceCapabilitiesKHR) == 52> {};
+template <> struct IsTriviallyEncodable<VkSurfaceFormatKHR> : std::integral_constant<bool, sizeof(VkSurfaceFormatKHR) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkSwapchainCreateInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkImageSwapchainCreateInfoKHR& value);
@@ -288,6 +343,9 @@ void EncodeStruct(ParameterEncoder* encoder, const VkDisplayPlanePropertiesKHR&
 void EncodeStruct(ParameterEncoder* encoder, const VkDisplayPropertiesKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkDisplaySurfaceCreateInfoKHR& value);
 
+template <> struct IsTriviallyEncodable<VkDisplayModeParametersKHR> : std::integral_constant<bool, sizeof(VkDisplayModeParametersKHR) == 12> {};
+template <> struct IsTriviallyEncodable<VkDisplayPlaneCapabilitiesKHR> : std::integral_constant<bool, sizeof(VkDisplayPlaneCapabilitiesKHR) == 68> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkDisplayPresentInfoKHR& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkXlibSurfaceCreateInfoKHR& value);
@@ -325,6 +383,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkRectLayerKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentRegionKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentRegionsKHR& value);
 
+template <> struct IsTriviallyEncodable<VkRectLayerKHR> : std::integral_constant<bool, sizeof(VkRectLayerKHR) == 20> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkSharedPresentSurfaceCapabilitiesKHR& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkImportFenceWin32HandleInfoKHR& value);
@@ -440,6 +500,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceCornerSampled
 
 void EncodeStruct(ParameterEncoder* encoder, const VkExternalImageFormatPropertiesNV& value);
 
+template <> struct IsTriviallyEncodable<VkExternalImageFormatPropertiesNV> : std::integral_constant<bool, sizeof(VkExternalImageFormatPropertiesNV) == 44> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkExternalMemoryImageCreateInfoNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkExportMemoryAllocateInfoNV& value);
 
@@ -464,6 +526,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkCommandBufferInheritanceCon
 void EncodeStruct(ParameterEncoder* encoder, const VkViewportWScalingNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineViewportWScalingStateCreateInfoNV& value);
 
+template <> struct IsTriviallyEncodable<VkViewportWScalingNV> : std::integral_constant<bool, sizeof(VkViewportWScalingNV) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkSurfaceCapabilities2EXT& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkDisplayPowerInfoEXT& value);
@@ -476,11 +540,17 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPastPresentationTimingGOOGL
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentTimeGOOGLE& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentTimesInfoGOOGLE& value);
 
+template <> struct IsTriviallyEncodable<VkRefreshCycleDurationGOOGLE> : std::integral_constant<bool, sizeof(VkRefreshCycleDurationGOOGLE) == 8> {};
+template <> struct IsTriviallyEncodable<VkPastPresentationTimingGOOGLE> : std::integral_constant<bool, sizeof(VkPastPresentationTimingGOOGLE) == 36> {};
+template <> struct IsTriviallyEncodable<VkPresentTimeGOOGLE> : std::integral_constant<bool, sizeof(VkPresentTimeGOOGLE) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkViewportSwizzleNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineViewportSwizzleStateCreateInfoNV& value);
 
+template <> struct IsTriviallyEncodable<VkViewportSwizzleNV> : std::integral_constant<bool, sizeof(VkViewportSwizzleNV) == 16> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceDiscardRectanglePropertiesEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineDiscardRectangleStateCreateInfoEXT& value);
 
@@ -493,6 +563,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPipelineRasterizationDepthC
 void EncodeStruct(ParameterEncoder* encoder, const VkXYColorEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkHdrMetadataEXT& value);
 
+template <> struct IsTriviallyEncodable<VkXYColorEXT> : std::integral_constant<bool, sizeof(VkXYColorEXT) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkIOSSurfaceCreateInfoMVK& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkMacOSSurfaceCreateInfoMVK& value);
@@ -524,6 +596,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPipelineSampleLocationsStat
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceSampleLocationsPropertiesEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkMultisamplePropertiesEXT& value);
 
+template <> struct IsTriviallyEncodable<VkSampleLocationEXT> : std::integral_constant<bool, sizeof(VkSampleLocationEXT) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineColorBlendAdvancedStateCreateInfoEXT& value);
@@ -542,6 +616,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkImageDrmFormatModifierListC
 void EncodeStruct(ParameterEncoder* encoder, const VkImageDrmFormatModifierExplicitCreateInfoEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkImageDrmFormatModifierPropertiesEXT& value);
 
+template <> struct IsTriviallyEncodable<VkDrmFormatModifierPropertiesEXT> : std::integral_constant<bool, sizeof(VkDrmFormatModifierPropertiesEXT) == 16> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkValidationCacheCreateInfoEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkShaderModuleValidationCacheCreateInfoEXT& value);
 
@@ -553,6 +629,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkCoarseSampleLocationNV& val
 void EncodeStruct(ParameterEncoder* encoder, const VkCoarseSampleOrderCustomNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineViewportCoarseSampleOrderStateCreateInfoNV& value);
 
+template <> struct IsTriviallyEncodable<VkCoarseSampleLocationNV> : std::integral_constant<bool, sizeof(VkCoarseSampleLocationNV) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkRayTracingShaderGroupCreateInfoNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkRayTracingPipelineCreateInfoNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkGeometryTrianglesNV& value);
@@ -569,6 +647,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkTransformMatrixKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAabbPositionsKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureInstanceKHR& value);
 
+template <> struct IsTriviallyEncodable<VkAabbPositionsKHR> : std::integral_constant<bool, sizeof(VkAabbPositionsKHR) == 24> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineRepresentativeFragmentTestStateCreateInfoNV& value);
 
@@ -594,17 +674,23 @@ void EncodeStruct(ParameterEncoder* encoder, const VkVertexInputBindingDivisorDe
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineVertexInputDivisorStateCreateInfoEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT& value);
 
+template <> struct IsTriviallyEncodable<VkVertexInputBindingDivisorDescriptionEXT> : std::integral_constant<bool, sizeof(VkVertexInputBindingDivisorDescriptionEXT) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPresentFrameTokenGGP& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineCreationFeedbackEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPipelineCreationFeedbackCreateInfoEXT& value);
 
+template <> struct IsTriviallyEncodable<VkPipelineCreationFeedbackEXT> : std::integral_constant<bool, sizeof(VkPipelineCreationFeedbackEXT) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceComputeShaderDerivativesFeaturesNV& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceMeshShaderFeaturesNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceMeshShaderPropertiesNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkDrawMeshTasksIndirectCommandNV& value);
 
+template <> struct IsTriviallyEncodable<VkDrawMeshTasksIndirectCommandNV> : std::integral_constant<bool, sizeof(VkDrawMeshTasksIndirectCommandNV) == 8> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceShaderImageFootprintFeaturesNV& value);
@@ -711,6 +797,11 @@ void EncodeStruct(ParameterEncoder* encoder, const VkIndirectCommandsLayoutCreat
 void EncodeStruct(ParameterEncoder* encoder, const VkGeneratedCommandsInfoNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkGeneratedCommandsMemoryRequirementsInfoNV& value);
 
+template <> struct IsTriviallyEncodable<VkBindShaderGroupIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindShaderGroupIndirectCommandNV) == 4> {};
+template <> struct IsTriviallyEncodable<VkBindIndexBufferIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindIndexBufferIndirectCommandNV) == 16> {};
+template <> struct IsTriviallyEncodable<VkBindVertexBufferIndirectCommandNV> : std::integral_constant<bool, sizeof(VkBindVertexBufferIndirectCommandNV) == 16> {};
+template <> struct IsTriviallyEncodable<VkSetStateFlagsIndirectCommandNV> : std::integral_constant<bool, sizeof(VkSetStateFlagsIndirectCommandNV) == 4> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceInheritedViewportScissorFeaturesNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkCommandBufferInheritanceViewportScissorInfoNV& value);
 
@@ -751,6 +842,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkSRTDataNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureSRTMotionInstanceNV& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceRayTracingMotionBlurFeaturesNV& value);
 
+template <> struct IsTriviallyEncodable<VkSRTDataNV> : std::integral_constant<bool, sizeof(VkSRTDataNV) == 64> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT& value);
 
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceFragmentDensityMap2FeaturesEXT& value);
@@ -801,6 +894,9 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceMultiDrawProp
 void EncodeStruct(ParameterEncoder* encoder, const VkMultiDrawInfoEXT& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkMultiDrawIndexedInfoEXT& value);
 
+template <> struct IsTriviallyEncodable<VkMultiDrawInfoEXT> : std::integral_constant<bool, sizeof(VkMultiDrawInfoEXT) == 8> {};
+template <> struct IsTriviallyEncodable<VkMultiDrawIndexedInfoEXT> : std::integral_constant<bool, sizeof(VkMultiDrawIndexedInfoEXT) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureBuildRangeInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureGeometryTrianglesDataKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureGeometryAabbsDataKHR& value);
@@ -817,6 +913,8 @@ void EncodeStruct(ParameterEncoder* encoder, const VkCopyMemoryToAccelerationStr
 void EncodeStruct(ParameterEncoder* encoder, const VkCopyAccelerationStructureInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkAccelerationStructureBuildSizesInfoKHR& value);
 
+template <> struct IsTriviallyEncodable<VkAccelerationStructureBuildRangeInfoKHR> : std::integral_constant<bool, sizeof(VkAccelerationStructureBuildRangeInfoKHR) == 16> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkRayTracingShaderGroupCreateInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkRayTracingPipelineInterfaceCreateInfoKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkRayTracingPipelineCreateInfoKHR& value);
@@ -825,6 +923,9 @@ void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceRayTracingPip
 void EncodeStruct(ParameterEncoder* encoder, const VkStridedDeviceAddressRegionKHR& value);
 void EncodeStruct(ParameterEncoder* encoder, const VkTraceRaysIndirectCommandKHR& value);
 
+template <> struct IsTriviallyEncodable<VkStridedDeviceAddressRegionKHR> : std::integral_constant<bool, sizeof(VkStridedDeviceAddressRegionKHR) == 24> {};
+template <> struct IsTriviallyEncodable<VkTraceRaysIndirectCommandKHR> : std::integral_constant<bool, sizeof(VkTraceRaysIndirectCommandKHR) == 12> {};
+
 void EncodeStruct(ParameterEncoder* encoder, const VkPhysicalDeviceRayQueryFeaturesKHR& value);
 
 GFXRECON_END_NAMESPACE(encode)
@@ -36,629 +36,629 @@
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
-template <> std::string ToString<VkExtent2D>(const VkExtent2D& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExtent3D>(const VkExtent3D& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkOffset2D>(const VkOffset2D& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkOffset3D>(const VkOffset3D& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRect2D>(const VkRect2D& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferMemoryBarrier>(const VkBufferMemoryBarrier& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDispatchIndirectCommand>(const VkDispatchIndirectCommand& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDrawIndexedIndirectCommand>(const VkDrawIndexedIndirectCommand& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDrawIndirectCommand>(const VkDrawIndirectCommand& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageSubresourceRange>(const VkImageSubresourceRange& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageMemoryBarrier>(const VkImageMemoryBarrier& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryBarrier>(const VkMemoryBarrier& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCacheHeaderVersionOne>(const VkPipelineCacheHeaderVersionOne& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAllocationCallbacks>(const VkAllocationCallbacks& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkApplicationInfo>(const VkApplicationInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFormatProperties>(const VkFormatProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageFormatProperties>(const VkImageFormatProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkInstanceCreateInfo>(const VkInstanceCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryHeap>(const VkMemoryHeap& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryType>(const VkMemoryType& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFeatures>(const VkPhysicalDeviceFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceLimits>(const VkPhysicalDeviceLimits& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMemoryProperties>(const VkPhysicalDeviceMemoryProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSparseProperties>(const VkPhysicalDeviceSparseProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProperties>(const VkPhysicalDeviceProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueueFamilyProperties>(const VkQueueFamilyProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceQueueCreateInfo>(const VkDeviceQueueCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceCreateInfo>(const VkDeviceCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExtensionProperties>(const VkExtensionProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkLayerProperties>(const VkLayerProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubmitInfo>(const VkSubmitInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMappedMemoryRange>(const VkMappedMemoryRange& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryAllocateInfo>(const VkMemoryAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryRequirements>(const VkMemoryRequirements& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseMemoryBind>(const VkSparseMemoryBind& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseBufferMemoryBindInfo>(const VkSparseBufferMemoryBindInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageOpaqueMemoryBindInfo>(const VkSparseImageOpaqueMemoryBindInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageSubresource>(const VkImageSubresource& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageMemoryBind>(const VkSparseImageMemoryBind& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageMemoryBindInfo>(const VkSparseImageMemoryBindInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindSparseInfo>(const VkBindSparseInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageFormatProperties>(const VkSparseImageFormatProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageMemoryRequirements>(const VkSparseImageMemoryRequirements& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFenceCreateInfo>(const VkFenceCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreCreateInfo>(const VkSemaphoreCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkEventCreateInfo>(const VkEventCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueryPoolCreateInfo>(const VkQueryPoolCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferCreateInfo>(const VkBufferCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferViewCreateInfo>(const VkBufferViewCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageCreateInfo>(const VkImageCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubresourceLayout>(const VkSubresourceLayout& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkComponentMapping>(const VkComponentMapping& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageViewCreateInfo>(const VkImageViewCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkShaderModuleCreateInfo>(const VkShaderModuleCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCacheCreateInfo>(const VkPipelineCacheCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSpecializationMapEntry>(const VkSpecializationMapEntry& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSpecializationInfo>(const VkSpecializationInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineShaderStageCreateInfo>(const VkPipelineShaderStageCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkComputePipelineCreateInfo>(const VkComputePipelineCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkVertexInputBindingDescription>(const VkVertexInputBindingDescription& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkVertexInputAttributeDescription>(const VkVertexInputAttributeDescription& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineVertexInputStateCreateInfo>(const VkPipelineVertexInputStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineInputAssemblyStateCreateInfo>(const VkPipelineInputAssemblyStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineTessellationStateCreateInfo>(const VkPipelineTessellationStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkViewport>(const VkViewport& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportStateCreateInfo>(const VkPipelineViewportStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationStateCreateInfo>(const VkPipelineRasterizationStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineMultisampleStateCreateInfo>(const VkPipelineMultisampleStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkStencilOpState>(const VkStencilOpState& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineDepthStencilStateCreateInfo>(const VkPipelineDepthStencilStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineColorBlendAttachmentState>(const VkPipelineColorBlendAttachmentState& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineColorBlendStateCreateInfo>(const VkPipelineColorBlendStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineDynamicStateCreateInfo>(const VkPipelineDynamicStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGraphicsPipelineCreateInfo>(const VkGraphicsPipelineCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPushConstantRange>(const VkPushConstantRange& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineLayoutCreateInfo>(const VkPipelineLayoutCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerCreateInfo>(const VkSamplerCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyDescriptorSet>(const VkCopyDescriptorSet& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorBufferInfo>(const VkDescriptorBufferInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorPoolSize>(const VkDescriptorPoolSize& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorPoolCreateInfo>(const VkDescriptorPoolCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetAllocateInfo>(const VkDescriptorSetAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetLayoutBinding>(const VkDescriptorSetLayoutBinding& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetLayoutCreateInfo>(const VkDescriptorSetLayoutCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentDescription>(const VkAttachmentDescription& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentReference>(const VkAttachmentReference& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFramebufferCreateInfo>(const VkFramebufferCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassDescription>(const VkSubpassDescription& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassDependency>(const VkSubpassDependency& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassCreateInfo>(const VkRenderPassCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandPoolCreateInfo>(const VkCommandPoolCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferAllocateInfo>(const VkCommandBufferAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferInheritanceInfo>(const VkCommandBufferInheritanceInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferBeginInfo>(const VkCommandBufferBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferCopy>(const VkBufferCopy& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageSubresourceLayers>(const VkImageSubresourceLayers& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferImageCopy>(const VkBufferImageCopy& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkClearDepthStencilValue>(const VkClearDepthStencilValue& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkClearAttachment>(const VkClearAttachment& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkClearRect>(const VkClearRect& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageBlit>(const VkImageBlit& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageCopy>(const VkImageCopy& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageResolve>(const VkImageResolve& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassBeginInfo>(const VkRenderPassBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSubgroupProperties>(const VkPhysicalDeviceSubgroupProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindBufferMemoryInfo>(const VkBindBufferMemoryInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindImageMemoryInfo>(const VkBindImageMemoryInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevice16BitStorageFeatures>(const VkPhysicalDevice16BitStorageFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryDedicatedRequirements>(const VkMemoryDedicatedRequirements& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryDedicatedAllocateInfo>(const VkMemoryDedicatedAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryAllocateFlagsInfo>(const VkMemoryAllocateFlagsInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupRenderPassBeginInfo>(const VkDeviceGroupRenderPassBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupCommandBufferBeginInfo>(const VkDeviceGroupCommandBufferBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupSubmitInfo>(const VkDeviceGroupSubmitInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupBindSparseInfo>(const VkDeviceGroupBindSparseInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindBufferMemoryDeviceGroupInfo>(const VkBindBufferMemoryDeviceGroupInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindImageMemoryDeviceGroupInfo>(const VkBindImageMemoryDeviceGroupInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceGroupProperties>(const VkPhysicalDeviceGroupProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupDeviceCreateInfo>(const VkDeviceGroupDeviceCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferMemoryRequirementsInfo2>(const VkBufferMemoryRequirementsInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageMemoryRequirementsInfo2>(const VkImageMemoryRequirementsInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageSparseMemoryRequirementsInfo2>(const VkImageSparseMemoryRequirementsInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryRequirements2>(const VkMemoryRequirements2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageMemoryRequirements2>(const VkSparseImageMemoryRequirements2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFeatures2>(const VkPhysicalDeviceFeatures2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProperties2>(const VkPhysicalDeviceProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFormatProperties2>(const VkFormatProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageFormatProperties2>(const VkImageFormatProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceImageFormatInfo2>(const VkPhysicalDeviceImageFormatInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueueFamilyProperties2>(const VkQueueFamilyProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMemoryProperties2>(const VkPhysicalDeviceMemoryProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSparseImageFormatProperties2>(const VkSparseImageFormatProperties2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSparseImageFormatInfo2>(const VkPhysicalDeviceSparseImageFormatInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePointClippingProperties>(const VkPhysicalDevicePointClippingProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkInputAttachmentAspectReference>(const VkInputAttachmentAspectReference& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassInputAttachmentAspectCreateInfo>(const VkRenderPassInputAttachmentAspectCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageViewUsageCreateInfo>(const VkImageViewUsageCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineTessellationDomainOriginStateCreateInfo>(const VkPipelineTessellationDomainOriginStateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassMultiviewCreateInfo>(const VkRenderPassMultiviewCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMultiviewFeatures>(const VkPhysicalDeviceMultiviewFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMultiviewProperties>(const VkPhysicalDeviceMultiviewProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVariablePointersFeatures>(const VkPhysicalDeviceVariablePointersFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProtectedMemoryFeatures>(const VkPhysicalDeviceProtectedMemoryFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProtectedMemoryProperties>(const VkPhysicalDeviceProtectedMemoryProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceQueueInfo2>(const VkDeviceQueueInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkProtectedSubmitInfo>(const VkProtectedSubmitInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerYcbcrConversionCreateInfo>(const VkSamplerYcbcrConversionCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerYcbcrConversionInfo>(const VkSamplerYcbcrConversionInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindImagePlaneMemoryInfo>(const VkBindImagePlaneMemoryInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImagePlaneMemoryRequirementsInfo>(const VkImagePlaneMemoryRequirementsInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSamplerYcbcrConversionFeatures>(const VkPhysicalDeviceSamplerYcbcrConversionFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerYcbcrConversionImageFormatProperties>(const VkSamplerYcbcrConversionImageFormatProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorUpdateTemplateEntry>(const VkDescriptorUpdateTemplateEntry& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorUpdateTemplateCreateInfo>(const VkDescriptorUpdateTemplateCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalMemoryProperties>(const VkExternalMemoryProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalImageFormatInfo>(const VkPhysicalDeviceExternalImageFormatInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalImageFormatProperties>(const VkExternalImageFormatProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalBufferInfo>(const VkPhysicalDeviceExternalBufferInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalBufferProperties>(const VkExternalBufferProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceIDProperties>(const VkPhysicalDeviceIDProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalMemoryImageCreateInfo>(const VkExternalMemoryImageCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalMemoryBufferCreateInfo>(const VkExternalMemoryBufferCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportMemoryAllocateInfo>(const VkExportMemoryAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalFenceInfo>(const VkPhysicalDeviceExternalFenceInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalFenceProperties>(const VkExternalFenceProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportFenceCreateInfo>(const VkExportFenceCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportSemaphoreCreateInfo>(const VkExportSemaphoreCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalSemaphoreInfo>(const VkPhysicalDeviceExternalSemaphoreInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalSemaphoreProperties>(const VkExternalSemaphoreProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMaintenance3Properties>(const VkPhysicalDeviceMaintenance3Properties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetLayoutSupport>(const VkDescriptorSetLayoutSupport& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderDrawParametersFeatures>(const VkPhysicalDeviceShaderDrawParametersFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVulkan11Features>(const VkPhysicalDeviceVulkan11Features& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVulkan11Properties>(const VkPhysicalDeviceVulkan11Properties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVulkan12Features>(const VkPhysicalDeviceVulkan12Features& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkConformanceVersion>(const VkConformanceVersion& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVulkan12Properties>(const VkPhysicalDeviceVulkan12Properties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageFormatListCreateInfo>(const VkImageFormatListCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentDescription2>(const VkAttachmentDescription2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentReference2>(const VkAttachmentReference2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassDescription2>(const VkSubpassDescription2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassDependency2>(const VkSubpassDependency2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassCreateInfo2>(const VkRenderPassCreateInfo2& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassBeginInfo>(const VkSubpassBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassEndInfo>(const VkSubpassEndInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevice8BitStorageFeatures>(const VkPhysicalDevice8BitStorageFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDriverProperties>(const VkPhysicalDeviceDriverProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderAtomicInt64Features>(const VkPhysicalDeviceShaderAtomicInt64Features& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderFloat16Int8Features>(const VkPhysicalDeviceShaderFloat16Int8Features& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFloatControlsProperties>(const VkPhysicalDeviceFloatControlsProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetLayoutBindingFlagsCreateInfo>(const VkDescriptorSetLayoutBindingFlagsCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDescriptorIndexingFeatures>(const VkPhysicalDeviceDescriptorIndexingFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDescriptorIndexingProperties>(const VkPhysicalDeviceDescriptorIndexingProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetVariableDescriptorCountAllocateInfo>(const VkDescriptorSetVariableDescriptorCountAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorSetVariableDescriptorCountLayoutSupport>(const VkDescriptorSetVariableDescriptorCountLayoutSupport& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassDescriptionDepthStencilResolve>(const VkSubpassDescriptionDepthStencilResolve& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDepthStencilResolveProperties>(const VkPhysicalDeviceDepthStencilResolveProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceScalarBlockLayoutFeatures>(const VkPhysicalDeviceScalarBlockLayoutFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageStencilUsageCreateInfo>(const VkImageStencilUsageCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerReductionModeCreateInfo>(const VkSamplerReductionModeCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSamplerFilterMinmaxProperties>(const VkPhysicalDeviceSamplerFilterMinmaxProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVulkanMemoryModelFeatures>(const VkPhysicalDeviceVulkanMemoryModelFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceImagelessFramebufferFeatures>(const VkPhysicalDeviceImagelessFramebufferFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFramebufferAttachmentImageInfo>(const VkFramebufferAttachmentImageInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFramebufferAttachmentsCreateInfo>(const VkFramebufferAttachmentsCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassAttachmentBeginInfo>(const VkRenderPassAttachmentBeginInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceUniformBufferStandardLayoutFeatures>(const VkPhysicalDeviceUniformBufferStandardLayoutFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures>(const VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures>(const VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentReferenceStencilLayout>(const VkAttachmentReferenceStencilLayout& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentDescriptionStencilLayout>(const VkAttachmentDescriptionStencilLayout& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceHostQueryResetFeatures>(const VkPhysicalDeviceHostQueryResetFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTimelineSemaphoreFeatures>(const VkPhysicalDeviceTimelineSemaphoreFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTimelineSemaphoreProperties>(const VkPhysicalDeviceTimelineSemaphoreProperties& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreTypeCreateInfo>(const VkSemaphoreTypeCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkTimelineSemaphoreSubmitInfo>(const VkTimelineSemaphoreSubmitInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreWaitInfo>(const VkSemaphoreWaitInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreSignalInfo>(const VkSemaphoreSignalInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceBufferDeviceAddressFeatures>(const VkPhysicalDeviceBufferDeviceAddressFeatures& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferDeviceAddressInfo>(const VkBufferDeviceAddressInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferOpaqueCaptureAddressCreateInfo>(const VkBufferOpaqueCaptureAddressCreateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryOpaqueCaptureAddressAllocateInfo>(const VkMemoryOpaqueCaptureAddressAllocateInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceMemoryOpaqueCaptureAddressInfo>(const VkDeviceMemoryOpaqueCaptureAddressInfo& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceCapabilitiesKHR>(const VkSurfaceCapabilitiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceFormatKHR>(const VkSurfaceFormatKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSwapchainCreateInfoKHR>(const VkSwapchainCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentInfoKHR>(const VkPresentInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageSwapchainCreateInfoKHR>(const VkImageSwapchainCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindImageMemorySwapchainInfoKHR>(const VkBindImageMemorySwapchainInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAcquireNextImageInfoKHR>(const VkAcquireNextImageInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupPresentCapabilitiesKHR>(const VkDeviceGroupPresentCapabilitiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupPresentInfoKHR>(const VkDeviceGroupPresentInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceGroupSwapchainCreateInfoKHR>(const VkDeviceGroupSwapchainCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayModeParametersKHR>(const VkDisplayModeParametersKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayModeCreateInfoKHR>(const VkDisplayModeCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayModePropertiesKHR>(const VkDisplayModePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPlaneCapabilitiesKHR>(const VkDisplayPlaneCapabilitiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPlanePropertiesKHR>(const VkDisplayPlanePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPropertiesKHR>(const VkDisplayPropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplaySurfaceCreateInfoKHR>(const VkDisplaySurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPresentInfoKHR>(const VkDisplayPresentInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkXlibSurfaceCreateInfoKHR>(const VkXlibSurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkXcbSurfaceCreateInfoKHR>(const VkXcbSurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWaylandSurfaceCreateInfoKHR>(const VkWaylandSurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAndroidSurfaceCreateInfoKHR>(const VkAndroidSurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWin32SurfaceCreateInfoKHR>(const VkWin32SurfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportMemoryWin32HandleInfoKHR>(const VkImportMemoryWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportMemoryWin32HandleInfoKHR>(const VkExportMemoryWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryWin32HandlePropertiesKHR>(const VkMemoryWin32HandlePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryGetWin32HandleInfoKHR>(const VkMemoryGetWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportMemoryFdInfoKHR>(const VkImportMemoryFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryFdPropertiesKHR>(const VkMemoryFdPropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryGetFdInfoKHR>(const VkMemoryGetFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWin32KeyedMutexAcquireReleaseInfoKHR>(const VkWin32KeyedMutexAcquireReleaseInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportSemaphoreWin32HandleInfoKHR>(const VkImportSemaphoreWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportSemaphoreWin32HandleInfoKHR>(const VkExportSemaphoreWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkD3D12FenceSubmitInfoKHR>(const VkD3D12FenceSubmitInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreGetWin32HandleInfoKHR>(const VkSemaphoreGetWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportSemaphoreFdInfoKHR>(const VkImportSemaphoreFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreGetFdInfoKHR>(const VkSemaphoreGetFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePushDescriptorPropertiesKHR>(const VkPhysicalDevicePushDescriptorPropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRectLayerKHR>(const VkRectLayerKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentRegionKHR>(const VkPresentRegionKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentRegionsKHR>(const VkPresentRegionsKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSharedPresentSurfaceCapabilitiesKHR>(const VkSharedPresentSurfaceCapabilitiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportFenceWin32HandleInfoKHR>(const VkImportFenceWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportFenceWin32HandleInfoKHR>(const VkExportFenceWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFenceGetWin32HandleInfoKHR>(const VkFenceGetWin32HandleInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportFenceFdInfoKHR>(const VkImportFenceFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFenceGetFdInfoKHR>(const VkFenceGetFdInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePerformanceQueryFeaturesKHR>(const VkPhysicalDevicePerformanceQueryFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePerformanceQueryPropertiesKHR>(const VkPhysicalDevicePerformanceQueryPropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceCounterKHR>(const VkPerformanceCounterKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceCounterDescriptionKHR>(const VkPerformanceCounterDescriptionKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueryPoolPerformanceCreateInfoKHR>(const VkQueryPoolPerformanceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAcquireProfilingLockInfoKHR>(const VkAcquireProfilingLockInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceQuerySubmitInfoKHR>(const VkPerformanceQuerySubmitInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSurfaceInfo2KHR>(const VkPhysicalDeviceSurfaceInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceCapabilities2KHR>(const VkSurfaceCapabilities2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceFormat2KHR>(const VkSurfaceFormat2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayProperties2KHR>(const VkDisplayProperties2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPlaneProperties2KHR>(const VkDisplayPlaneProperties2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayModeProperties2KHR>(const VkDisplayModeProperties2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPlaneInfo2KHR>(const VkDisplayPlaneInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPlaneCapabilities2KHR>(const VkDisplayPlaneCapabilities2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePortabilitySubsetFeaturesKHR>(const VkPhysicalDevicePortabilitySubsetFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePortabilitySubsetPropertiesKHR>(const VkPhysicalDevicePortabilitySubsetPropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderClockFeaturesKHR>(const VkPhysicalDeviceShaderClockFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderTerminateInvocationFeaturesKHR>(const VkPhysicalDeviceShaderTerminateInvocationFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFragmentShadingRateAttachmentInfoKHR>(const VkFragmentShadingRateAttachmentInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineFragmentShadingRateStateCreateInfoKHR>(const VkPipelineFragmentShadingRateStateCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShadingRateFeaturesKHR>(const VkPhysicalDeviceFragmentShadingRateFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShadingRatePropertiesKHR>(const VkPhysicalDeviceFragmentShadingRatePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShadingRateKHR>(const VkPhysicalDeviceFragmentShadingRateKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceProtectedCapabilitiesKHR>(const VkSurfaceProtectedCapabilitiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePresentWaitFeaturesKHR>(const VkPhysicalDevicePresentWaitFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR>(const VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineInfoKHR>(const VkPipelineInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineExecutablePropertiesKHR>(const VkPipelineExecutablePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineExecutableInfoKHR>(const VkPipelineExecutableInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineExecutableStatisticKHR>(const VkPipelineExecutableStatisticKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineExecutableInternalRepresentationKHR>(const VkPipelineExecutableInternalRepresentationKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineLibraryCreateInfoKHR>(const VkPipelineLibraryCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentIdKHR>(const VkPresentIdKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePresentIdFeaturesKHR>(const VkPhysicalDevicePresentIdFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryBarrier2KHR>(const VkMemoryBarrier2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferMemoryBarrier2KHR>(const VkBufferMemoryBarrier2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageMemoryBarrier2KHR>(const VkImageMemoryBarrier2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDependencyInfoKHR>(const VkDependencyInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreSubmitInfoKHR>(const VkSemaphoreSubmitInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferSubmitInfoKHR>(const VkCommandBufferSubmitInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubmitInfo2KHR>(const VkSubmitInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSynchronization2FeaturesKHR>(const VkPhysicalDeviceSynchronization2FeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueueFamilyCheckpointProperties2NV>(const VkQueueFamilyCheckpointProperties2NV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCheckpointData2NV>(const VkCheckpointData2NV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR>(const VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR>(const VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR>(const VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferCopy2KHR>(const VkBufferCopy2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyBufferInfo2KHR>(const VkCopyBufferInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageCopy2KHR>(const VkImageCopy2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyImageInfo2KHR>(const VkCopyImageInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferImageCopy2KHR>(const VkBufferImageCopy2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyBufferToImageInfo2KHR>(const VkCopyBufferToImageInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyImageToBufferInfo2KHR>(const VkCopyImageToBufferInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageBlit2KHR>(const VkImageBlit2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBlitImageInfo2KHR>(const VkBlitImageInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageResolve2KHR>(const VkImageResolve2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkResolveImageInfo2KHR>(const VkResolveImageInfo2KHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugReportCallbackCreateInfoEXT>(const VkDebugReportCallbackCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationStateRasterizationOrderAMD>(const VkPipelineRasterizationStateRasterizationOrderAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugMarkerObjectNameInfoEXT>(const VkDebugMarkerObjectNameInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugMarkerObjectTagInfoEXT>(const VkDebugMarkerObjectTagInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugMarkerMarkerInfoEXT>(const VkDebugMarkerMarkerInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDedicatedAllocationImageCreateInfoNV>(const VkDedicatedAllocationImageCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDedicatedAllocationBufferCreateInfoNV>(const VkDedicatedAllocationBufferCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDedicatedAllocationMemoryAllocateInfoNV>(const VkDedicatedAllocationMemoryAllocateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTransformFeedbackFeaturesEXT>(const VkPhysicalDeviceTransformFeedbackFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTransformFeedbackPropertiesEXT>(const VkPhysicalDeviceTransformFeedbackPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationStateStreamCreateInfoEXT>(const VkPipelineRasterizationStateStreamCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageViewHandleInfoNVX>(const VkImageViewHandleInfoNVX& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageViewAddressPropertiesNVX>(const VkImageViewAddressPropertiesNVX& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkTextureLODGatherFormatPropertiesAMD>(const VkTextureLODGatherFormatPropertiesAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkShaderResourceUsageAMD>(const VkShaderResourceUsageAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkShaderStatisticsInfoAMD>(const VkShaderStatisticsInfoAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkStreamDescriptorSurfaceCreateInfoGGP>(const VkStreamDescriptorSurfaceCreateInfoGGP& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCornerSampledImageFeaturesNV>(const VkPhysicalDeviceCornerSampledImageFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalImageFormatPropertiesNV>(const VkExternalImageFormatPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalMemoryImageCreateInfoNV>(const VkExternalMemoryImageCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportMemoryAllocateInfoNV>(const VkExportMemoryAllocateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportMemoryWin32HandleInfoNV>(const VkImportMemoryWin32HandleInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExportMemoryWin32HandleInfoNV>(const VkExportMemoryWin32HandleInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWin32KeyedMutexAcquireReleaseInfoNV>(const VkWin32KeyedMutexAcquireReleaseInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkValidationFlagsEXT>(const VkValidationFlagsEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkViSurfaceCreateInfoNN>(const VkViSurfaceCreateInfoNN& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTextureCompressionASTCHDRFeaturesEXT>(const VkPhysicalDeviceTextureCompressionASTCHDRFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageViewASTCDecodeModeEXT>(const VkImageViewASTCDecodeModeEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceASTCDecodeFeaturesEXT>(const VkPhysicalDeviceASTCDecodeFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkConditionalRenderingBeginInfoEXT>(const VkConditionalRenderingBeginInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceConditionalRenderingFeaturesEXT>(const VkPhysicalDeviceConditionalRenderingFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferInheritanceConditionalRenderingInfoEXT>(const VkCommandBufferInheritanceConditionalRenderingInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkViewportWScalingNV>(const VkViewportWScalingNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportWScalingStateCreateInfoNV>(const VkPipelineViewportWScalingStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceCapabilities2EXT>(const VkSurfaceCapabilities2EXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayPowerInfoEXT>(const VkDisplayPowerInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceEventInfoEXT>(const VkDeviceEventInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayEventInfoEXT>(const VkDisplayEventInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSwapchainCounterCreateInfoEXT>(const VkSwapchainCounterCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRefreshCycleDurationGOOGLE>(const VkRefreshCycleDurationGOOGLE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPastPresentationTimingGOOGLE>(const VkPastPresentationTimingGOOGLE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentTimeGOOGLE>(const VkPresentTimeGOOGLE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentTimesInfoGOOGLE>(const VkPresentTimesInfoGOOGLE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX>(const VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkViewportSwizzleNV>(const VkViewportSwizzleNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportSwizzleStateCreateInfoNV>(const VkPipelineViewportSwizzleStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDiscardRectanglePropertiesEXT>(const VkPhysicalDeviceDiscardRectanglePropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineDiscardRectangleStateCreateInfoEXT>(const VkPipelineDiscardRectangleStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceConservativeRasterizationPropertiesEXT>(const VkPhysicalDeviceConservativeRasterizationPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationConservativeStateCreateInfoEXT>(const VkPipelineRasterizationConservativeStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDepthClipEnableFeaturesEXT>(const VkPhysicalDeviceDepthClipEnableFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationDepthClipStateCreateInfoEXT>(const VkPipelineRasterizationDepthClipStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkXYColorEXT>(const VkXYColorEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkHdrMetadataEXT>(const VkHdrMetadataEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkIOSSurfaceCreateInfoMVK>(const VkIOSSurfaceCreateInfoMVK& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMacOSSurfaceCreateInfoMVK>(const VkMacOSSurfaceCreateInfoMVK& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugUtilsLabelEXT>(const VkDebugUtilsLabelEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugUtilsObjectNameInfoEXT>(const VkDebugUtilsObjectNameInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugUtilsMessengerCallbackDataEXT>(const VkDebugUtilsMessengerCallbackDataEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugUtilsMessengerCreateInfoEXT>(const VkDebugUtilsMessengerCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDebugUtilsObjectTagInfoEXT>(const VkDebugUtilsObjectTagInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAndroidHardwareBufferUsageANDROID>(const VkAndroidHardwareBufferUsageANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAndroidHardwareBufferPropertiesANDROID>(const VkAndroidHardwareBufferPropertiesANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAndroidHardwareBufferFormatPropertiesANDROID>(const VkAndroidHardwareBufferFormatPropertiesANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportAndroidHardwareBufferInfoANDROID>(const VkImportAndroidHardwareBufferInfoANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryGetAndroidHardwareBufferInfoANDROID>(const VkMemoryGetAndroidHardwareBufferInfoANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkExternalFormatANDROID>(const VkExternalFormatANDROID& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceInlineUniformBlockFeaturesEXT>(const VkPhysicalDeviceInlineUniformBlockFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceInlineUniformBlockPropertiesEXT>(const VkPhysicalDeviceInlineUniformBlockPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWriteDescriptorSetInlineUniformBlockEXT>(const VkWriteDescriptorSetInlineUniformBlockEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDescriptorPoolInlineUniformBlockCreateInfoEXT>(const VkDescriptorPoolInlineUniformBlockCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSampleLocationEXT>(const VkSampleLocationEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSampleLocationsInfoEXT>(const VkSampleLocationsInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAttachmentSampleLocationsEXT>(const VkAttachmentSampleLocationsEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSubpassSampleLocationsEXT>(const VkSubpassSampleLocationsEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassSampleLocationsBeginInfoEXT>(const VkRenderPassSampleLocationsBeginInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineSampleLocationsStateCreateInfoEXT>(const VkPipelineSampleLocationsStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSampleLocationsPropertiesEXT>(const VkPhysicalDeviceSampleLocationsPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMultisamplePropertiesEXT>(const VkMultisamplePropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT>(const VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT>(const VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineColorBlendAdvancedStateCreateInfoEXT>(const VkPipelineColorBlendAdvancedStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCoverageToColorStateCreateInfoNV>(const VkPipelineCoverageToColorStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCoverageModulationStateCreateInfoNV>(const VkPipelineCoverageModulationStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderSMBuiltinsPropertiesNV>(const VkPhysicalDeviceShaderSMBuiltinsPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderSMBuiltinsFeaturesNV>(const VkPhysicalDeviceShaderSMBuiltinsFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDrmFormatModifierPropertiesEXT>(const VkDrmFormatModifierPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDrmFormatModifierPropertiesListEXT>(const VkDrmFormatModifierPropertiesListEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceImageDrmFormatModifierInfoEXT>(const VkPhysicalDeviceImageDrmFormatModifierInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageDrmFormatModifierListCreateInfoEXT>(const VkImageDrmFormatModifierListCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageDrmFormatModifierExplicitCreateInfoEXT>(const VkImageDrmFormatModifierExplicitCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImageDrmFormatModifierPropertiesEXT>(const VkImageDrmFormatModifierPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkValidationCacheCreateInfoEXT>(const VkValidationCacheCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkShaderModuleValidationCacheCreateInfoEXT>(const VkShaderModuleValidationCacheCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkShadingRatePaletteNV>(const VkShadingRatePaletteNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportShadingRateImageStateCreateInfoNV>(const VkPipelineViewportShadingRateImageStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShadingRateImageFeaturesNV>(const VkPhysicalDeviceShadingRateImageFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShadingRateImagePropertiesNV>(const VkPhysicalDeviceShadingRateImagePropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCoarseSampleLocationNV>(const VkCoarseSampleLocationNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCoarseSampleOrderCustomNV>(const VkCoarseSampleOrderCustomNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportCoarseSampleOrderStateCreateInfoNV>(const VkPipelineViewportCoarseSampleOrderStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRayTracingShaderGroupCreateInfoNV>(const VkRayTracingShaderGroupCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRayTracingPipelineCreateInfoNV>(const VkRayTracingPipelineCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeometryTrianglesNV>(const VkGeometryTrianglesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeometryAABBNV>(const VkGeometryAABBNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeometryDataNV>(const VkGeometryDataNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeometryNV>(const VkGeometryNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureInfoNV>(const VkAccelerationStructureInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureCreateInfoNV>(const VkAccelerationStructureCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindAccelerationStructureMemoryInfoNV>(const VkBindAccelerationStructureMemoryInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWriteDescriptorSetAccelerationStructureNV>(const VkWriteDescriptorSetAccelerationStructureNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureMemoryRequirementsInfoNV>(const VkAccelerationStructureMemoryRequirementsInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRayTracingPropertiesNV>(const VkPhysicalDeviceRayTracingPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkTransformMatrixKHR>(const VkTransformMatrixKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAabbPositionsKHR>(const VkAabbPositionsKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureInstanceKHR>(const VkAccelerationStructureInstanceKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV>(const VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRepresentativeFragmentTestStateCreateInfoNV>(const VkPipelineRepresentativeFragmentTestStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceImageViewImageFormatInfoEXT>(const VkPhysicalDeviceImageViewImageFormatInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFilterCubicImageViewImageFormatPropertiesEXT>(const VkFilterCubicImageViewImageFormatPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceQueueGlobalPriorityCreateInfoEXT>(const VkDeviceQueueGlobalPriorityCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportMemoryHostPointerInfoEXT>(const VkImportMemoryHostPointerInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryHostPointerPropertiesEXT>(const VkMemoryHostPointerPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalMemoryHostPropertiesEXT>(const VkPhysicalDeviceExternalMemoryHostPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCompilerControlCreateInfoAMD>(const VkPipelineCompilerControlCreateInfoAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCalibratedTimestampInfoEXT>(const VkCalibratedTimestampInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderCorePropertiesAMD>(const VkPhysicalDeviceShaderCorePropertiesAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceMemoryOverallocationCreateInfoAMD>(const VkDeviceMemoryOverallocationCreateInfoAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT>(const VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkVertexInputBindingDivisorDescriptionEXT>(const VkVertexInputBindingDivisorDescriptionEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineVertexInputDivisorStateCreateInfoEXT>(const VkPipelineVertexInputDivisorStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT>(const VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPresentFrameTokenGGP>(const VkPresentFrameTokenGGP& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCreationFeedbackEXT>(const VkPipelineCreationFeedbackEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCreationFeedbackCreateInfoEXT>(const VkPipelineCreationFeedbackCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceComputeShaderDerivativesFeaturesNV>(const VkPhysicalDeviceComputeShaderDerivativesFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMeshShaderFeaturesNV>(const VkPhysicalDeviceMeshShaderFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMeshShaderPropertiesNV>(const VkPhysicalDeviceMeshShaderPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDrawMeshTasksIndirectCommandNV>(const VkDrawMeshTasksIndirectCommandNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV>(const VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderImageFootprintFeaturesNV>(const VkPhysicalDeviceShaderImageFootprintFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineViewportExclusiveScissorStateCreateInfoNV>(const VkPipelineViewportExclusiveScissorStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExclusiveScissorFeaturesNV>(const VkPhysicalDeviceExclusiveScissorFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueueFamilyCheckpointPropertiesNV>(const VkQueueFamilyCheckpointPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCheckpointDataNV>(const VkCheckpointDataNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL>(const VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkInitializePerformanceApiInfoINTEL>(const VkInitializePerformanceApiInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueryPoolPerformanceQueryCreateInfoINTEL>(const VkQueryPoolPerformanceQueryCreateInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceMarkerInfoINTEL>(const VkPerformanceMarkerInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceStreamMarkerInfoINTEL>(const VkPerformanceStreamMarkerInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceOverrideInfoINTEL>(const VkPerformanceOverrideInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPerformanceConfigurationAcquireInfoINTEL>(const VkPerformanceConfigurationAcquireInfoINTEL& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePCIBusInfoPropertiesEXT>(const VkPhysicalDevicePCIBusInfoPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDisplayNativeHdrSurfaceCapabilitiesAMD>(const VkDisplayNativeHdrSurfaceCapabilitiesAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSwapchainDisplayNativeHdrCreateInfoAMD>(const VkSwapchainDisplayNativeHdrCreateInfoAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImagePipeSurfaceCreateInfoFUCHSIA>(const VkImagePipeSurfaceCreateInfoFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMetalSurfaceCreateInfoEXT>(const VkMetalSurfaceCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentDensityMapFeaturesEXT>(const VkPhysicalDeviceFragmentDensityMapFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentDensityMapPropertiesEXT>(const VkPhysicalDeviceFragmentDensityMapPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassFragmentDensityMapCreateInfoEXT>(const VkRenderPassFragmentDensityMapCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSubgroupSizeControlFeaturesEXT>(const VkPhysicalDeviceSubgroupSizeControlFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceSubgroupSizeControlPropertiesEXT>(const VkPhysicalDeviceSubgroupSizeControlPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineShaderStageRequiredSubgroupSizeCreateInfoEXT>(const VkPipelineShaderStageRequiredSubgroupSizeCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderCoreProperties2AMD>(const VkPhysicalDeviceShaderCoreProperties2AMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCoherentMemoryFeaturesAMD>(const VkPhysicalDeviceCoherentMemoryFeaturesAMD& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT>(const VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMemoryBudgetPropertiesEXT>(const VkPhysicalDeviceMemoryBudgetPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMemoryPriorityFeaturesEXT>(const VkPhysicalDeviceMemoryPriorityFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryPriorityAllocateInfoEXT>(const VkMemoryPriorityAllocateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV>(const VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceBufferDeviceAddressFeaturesEXT>(const VkPhysicalDeviceBufferDeviceAddressFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBufferDeviceAddressCreateInfoEXT>(const VkBufferDeviceAddressCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceToolPropertiesEXT>(const VkPhysicalDeviceToolPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkValidationFeaturesEXT>(const VkValidationFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCooperativeMatrixPropertiesNV>(const VkCooperativeMatrixPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCooperativeMatrixFeaturesNV>(const VkPhysicalDeviceCooperativeMatrixFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCooperativeMatrixPropertiesNV>(const VkPhysicalDeviceCooperativeMatrixPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCoverageReductionModeFeaturesNV>(const VkPhysicalDeviceCoverageReductionModeFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineCoverageReductionStateCreateInfoNV>(const VkPipelineCoverageReductionStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkFramebufferMixedSamplesCombinationNV>(const VkFramebufferMixedSamplesCombinationNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT>(const VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceYcbcrImageArraysFeaturesEXT>(const VkPhysicalDeviceYcbcrImageArraysFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProvokingVertexFeaturesEXT>(const VkPhysicalDeviceProvokingVertexFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceProvokingVertexPropertiesEXT>(const VkPhysicalDeviceProvokingVertexPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationProvokingVertexStateCreateInfoEXT>(const VkPipelineRasterizationProvokingVertexStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceFullScreenExclusiveInfoEXT>(const VkSurfaceFullScreenExclusiveInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceCapabilitiesFullScreenExclusiveEXT>(const VkSurfaceCapabilitiesFullScreenExclusiveEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSurfaceFullScreenExclusiveWin32InfoEXT>(const VkSurfaceFullScreenExclusiveWin32InfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkHeadlessSurfaceCreateInfoEXT>(const VkHeadlessSurfaceCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceLineRasterizationFeaturesEXT>(const VkPhysicalDeviceLineRasterizationFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceLineRasterizationPropertiesEXT>(const VkPhysicalDeviceLineRasterizationPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineRasterizationLineStateCreateInfoEXT>(const VkPipelineRasterizationLineStateCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderAtomicFloatFeaturesEXT>(const VkPhysicalDeviceShaderAtomicFloatFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceIndexTypeUint8FeaturesEXT>(const VkPhysicalDeviceIndexTypeUint8FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExtendedDynamicStateFeaturesEXT>(const VkPhysicalDeviceExtendedDynamicStateFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT>(const VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT>(const VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV>(const VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV>(const VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGraphicsShaderGroupCreateInfoNV>(const VkGraphicsShaderGroupCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGraphicsPipelineShaderGroupsCreateInfoNV>(const VkGraphicsPipelineShaderGroupsCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindShaderGroupIndirectCommandNV>(const VkBindShaderGroupIndirectCommandNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindIndexBufferIndirectCommandNV>(const VkBindIndexBufferIndirectCommandNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkBindVertexBufferIndirectCommandNV>(const VkBindVertexBufferIndirectCommandNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSetStateFlagsIndirectCommandNV>(const VkSetStateFlagsIndirectCommandNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkIndirectCommandsStreamNV>(const VkIndirectCommandsStreamNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkIndirectCommandsLayoutTokenNV>(const VkIndirectCommandsLayoutTokenNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkIndirectCommandsLayoutCreateInfoNV>(const VkIndirectCommandsLayoutCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeneratedCommandsInfoNV>(const VkGeneratedCommandsInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkGeneratedCommandsMemoryRequirementsInfoNV>(const VkGeneratedCommandsMemoryRequirementsInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceInheritedViewportScissorFeaturesNV>(const VkPhysicalDeviceInheritedViewportScissorFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferInheritanceViewportScissorInfoNV>(const VkCommandBufferInheritanceViewportScissorInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT>(const VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceTexelBufferAlignmentPropertiesEXT>(const VkPhysicalDeviceTexelBufferAlignmentPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRenderPassTransformBeginInfoQCOM>(const VkRenderPassTransformBeginInfoQCOM& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCommandBufferInheritanceRenderPassTransformInfoQCOM>(const VkCommandBufferInheritanceRenderPassTransformInfoQCOM& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDeviceMemoryReportFeaturesEXT>(const VkPhysicalDeviceDeviceMemoryReportFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceMemoryReportCallbackDataEXT>(const VkDeviceMemoryReportCallbackDataEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceDeviceMemoryReportCreateInfoEXT>(const VkDeviceDeviceMemoryReportCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRobustness2FeaturesEXT>(const VkPhysicalDeviceRobustness2FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRobustness2PropertiesEXT>(const VkPhysicalDeviceRobustness2PropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSamplerCustomBorderColorCreateInfoEXT>(const VkSamplerCustomBorderColorCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCustomBorderColorPropertiesEXT>(const VkPhysicalDeviceCustomBorderColorPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceCustomBorderColorFeaturesEXT>(const VkPhysicalDeviceCustomBorderColorFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePrivateDataFeaturesEXT>(const VkPhysicalDevicePrivateDataFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDevicePrivateDataCreateInfoEXT>(const VkDevicePrivateDataCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPrivateDataSlotCreateInfoEXT>(const VkPrivateDataSlotCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevicePipelineCreationCacheControlFeaturesEXT>(const VkPhysicalDevicePipelineCreationCacheControlFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDiagnosticsConfigFeaturesNV>(const VkPhysicalDeviceDiagnosticsConfigFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDeviceDiagnosticsConfigCreateInfoNV>(const VkDeviceDiagnosticsConfigCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV>(const VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV>(const VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineFragmentShadingRateEnumStateCreateInfoNV>(const VkPipelineFragmentShadingRateEnumStateCreateInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureGeometryMotionTrianglesDataNV>(const VkAccelerationStructureGeometryMotionTrianglesDataNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureMotionInfoNV>(const VkAccelerationStructureMotionInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureMatrixMotionInstanceNV>(const VkAccelerationStructureMatrixMotionInstanceNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSRTDataNV>(const VkSRTDataNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureSRTMotionInstanceNV>(const VkAccelerationStructureSRTMotionInstanceNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRayTracingMotionBlurFeaturesNV>(const VkPhysicalDeviceRayTracingMotionBlurFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT>(const VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentDensityMap2FeaturesEXT>(const VkPhysicalDeviceFragmentDensityMap2FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceFragmentDensityMap2PropertiesEXT>(const VkPhysicalDeviceFragmentDensityMap2PropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyCommandTransformInfoQCOM>(const VkCopyCommandTransformInfoQCOM& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceImageRobustnessFeaturesEXT>(const VkPhysicalDeviceImageRobustnessFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDevice4444FormatsFeaturesEXT>(const VkPhysicalDevice4444FormatsFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkDirectFBSurfaceCreateInfoEXT>(const VkDirectFBSurfaceCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMutableDescriptorTypeFeaturesVALVE>(const VkPhysicalDeviceMutableDescriptorTypeFeaturesVALVE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMutableDescriptorTypeListVALVE>(const VkMutableDescriptorTypeListVALVE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMutableDescriptorTypeCreateInfoVALVE>(const VkMutableDescriptorTypeCreateInfoVALVE& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT>(const VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkVertexInputBindingDescription2EXT>(const VkVertexInputBindingDescription2EXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkVertexInputAttributeDescription2EXT>(const VkVertexInputAttributeDescription2EXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceDrmPropertiesEXT>(const VkPhysicalDeviceDrmPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportMemoryZirconHandleInfoFUCHSIA>(const VkImportMemoryZirconHandleInfoFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryZirconHandlePropertiesFUCHSIA>(const VkMemoryZirconHandlePropertiesFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryGetZirconHandleInfoFUCHSIA>(const VkMemoryGetZirconHandleInfoFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkImportSemaphoreZirconHandleInfoFUCHSIA>(const VkImportSemaphoreZirconHandleInfoFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkSemaphoreGetZirconHandleInfoFUCHSIA>(const VkSemaphoreGetZirconHandleInfoFUCHSIA& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceInvocationMaskFeaturesHUAWEI>(const VkPhysicalDeviceInvocationMaskFeaturesHUAWEI& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMemoryGetRemoteAddressInfoNV>(const VkMemoryGetRemoteAddressInfoNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExternalMemoryRDMAFeaturesNV>(const VkPhysicalDeviceExternalMemoryRDMAFeaturesNV& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceExtendedDynamicState2FeaturesEXT>(const VkPhysicalDeviceExtendedDynamicState2FeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkScreenSurfaceCreateInfoQNX>(const VkScreenSurfaceCreateInfoQNX& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceColorWriteEnableFeaturesEXT>(const VkPhysicalDeviceColorWriteEnableFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPipelineColorWriteCreateInfoEXT>(const VkPipelineColorWriteCreateInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceGlobalPriorityQueryFeaturesEXT>(const VkPhysicalDeviceGlobalPriorityQueryFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkQueueFamilyGlobalPriorityPropertiesEXT>(const VkQueueFamilyGlobalPriorityPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMultiDrawFeaturesEXT>(const VkPhysicalDeviceMultiDrawFeaturesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceMultiDrawPropertiesEXT>(const VkPhysicalDeviceMultiDrawPropertiesEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMultiDrawInfoEXT>(const VkMultiDrawInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkMultiDrawIndexedInfoEXT>(const VkMultiDrawIndexedInfoEXT& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureBuildRangeInfoKHR>(const VkAccelerationStructureBuildRangeInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureGeometryTrianglesDataKHR>(const VkAccelerationStructureGeometryTrianglesDataKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureGeometryAabbsDataKHR>(const VkAccelerationStructureGeometryAabbsDataKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureGeometryInstancesDataKHR>(const VkAccelerationStructureGeometryInstancesDataKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureBuildGeometryInfoKHR>(const VkAccelerationStructureBuildGeometryInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureCreateInfoKHR>(const VkAccelerationStructureCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkWriteDescriptorSetAccelerationStructureKHR>(const VkWriteDescriptorSetAccelerationStructureKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceAccelerationStructureFeaturesKHR>(const VkPhysicalDeviceAccelerationStructureFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceAccelerationStructurePropertiesKHR>(const VkPhysicalDeviceAccelerationStructurePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureDeviceAddressInfoKHR>(const VkAccelerationStructureDeviceAddressInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureVersionInfoKHR>(const VkAccelerationStructureVersionInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyAccelerationStructureToMemoryInfoKHR>(const VkCopyAccelerationStructureToMemoryInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyMemoryToAccelerationStructureInfoKHR>(const VkCopyMemoryToAccelerationStructureInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkCopyAccelerationStructureInfoKHR>(const VkCopyAccelerationStructureInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkAccelerationStructureBuildSizesInfoKHR>(const VkAccelerationStructureBuildSizesInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRayTracingShaderGroupCreateInfoKHR>(const VkRayTracingShaderGroupCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRayTracingPipelineInterfaceCreateInfoKHR>(const VkRayTracingPipelineInterfaceCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkRayTracingPipelineCreateInfoKHR>(const VkRayTracingPipelineCreateInfoKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRayTracingPipelineFeaturesKHR>(const VkPhysicalDeviceRayTracingPipelineFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRayTracingPipelinePropertiesKHR>(const VkPhysicalDeviceRayTracingPipelinePropertiesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkStridedDeviceAddressRegionKHR>(const VkStridedDeviceAddressRegionKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkTraceRaysIndirectCommandKHR>(const VkTraceRaysIndirectCommandKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
-template <> std::string ToString<VkPhysicalDeviceRayQueryFeaturesKHR>(const VkPhysicalDeviceRayQueryFeaturesKHR& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExtent2D>(std::string& strBuf, const VkExtent2D& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExtent3D>(std::string& strBuf, const VkExtent3D& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkOffset2D>(std::string& strBuf, const VkOffset2D& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkOffset3D>(std::string& strBuf, const VkOffset3D& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRect2D>(std::string& strBuf, const VkRect2D& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferMemoryBarrier>(std::string& strBuf, const VkBufferMemoryBarrier& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDispatchIndirectCommand>(std::string& strBuf, const VkDispatchIndirectCommand& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDrawIndexedIndirectCommand>(std::string& strBuf, const VkDrawIndexedIndirectCommand& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDrawIndirectCommand>(std::string& strBuf, const VkDrawIndirectCommand& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageSubresourceRange>(std::string& strBuf, const VkImageSubresourceRange& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageMemoryBarrier>(std::string& strBuf, const VkImageMemoryBarrier& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryBarrier>(std::string& strBuf, const VkMemoryBarrier& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCacheHeaderVersionOne>(std::string& strBuf, const VkPipelineCacheHeaderVersionOne& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAllocationCallbacks>(std::string& strBuf, const VkAllocationCallbacks& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkApplicationInfo>(std::string& strBuf, const VkApplicationInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFormatProperties>(std::string& strBuf, const VkFormatProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageFormatProperties>(std::string& strBuf, const VkImageFormatProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkInstanceCreateInfo>(std::string& strBuf, const VkInstanceCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryHeap>(std::string& strBuf, const VkMemoryHeap& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryType>(std::string& strBuf, const VkMemoryType& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFeatures>(std::string& strBuf, const VkPhysicalDeviceFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceLimits>(std::string& strBuf, const VkPhysicalDeviceLimits& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMemoryProperties>(std::string& strBuf, const VkPhysicalDeviceMemoryProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSparseProperties>(std::string& strBuf, const VkPhysicalDeviceSparseProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProperties>(std::string& strBuf, const VkPhysicalDeviceProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueueFamilyProperties>(std::string& strBuf, const VkQueueFamilyProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceQueueCreateInfo>(std::string& strBuf, const VkDeviceQueueCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceCreateInfo>(std::string& strBuf, const VkDeviceCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExtensionProperties>(std::string& strBuf, const VkExtensionProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkLayerProperties>(std::string& strBuf, const VkLayerProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubmitInfo>(std::string& strBuf, const VkSubmitInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMappedMemoryRange>(std::string& strBuf, const VkMappedMemoryRange& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryAllocateInfo>(std::string& strBuf, const VkMemoryAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryRequirements>(std::string& strBuf, const VkMemoryRequirements& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseMemoryBind>(std::string& strBuf, const VkSparseMemoryBind& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseBufferMemoryBindInfo>(std::string& strBuf, const VkSparseBufferMemoryBindInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageOpaqueMemoryBindInfo>(std::string& strBuf, const VkSparseImageOpaqueMemoryBindInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageSubresource>(std::string& strBuf, const VkImageSubresource& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageMemoryBind>(std::string& strBuf, const VkSparseImageMemoryBind& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageMemoryBindInfo>(std::string& strBuf, const VkSparseImageMemoryBindInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindSparseInfo>(std::string& strBuf, const VkBindSparseInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageFormatProperties>(std::string& strBuf, const VkSparseImageFormatProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageMemoryRequirements>(std::string& strBuf, const VkSparseImageMemoryRequirements& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFenceCreateInfo>(std::string& strBuf, const VkFenceCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreCreateInfo>(std::string& strBuf, const VkSemaphoreCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkEventCreateInfo>(std::string& strBuf, const VkEventCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueryPoolCreateInfo>(std::string& strBuf, const VkQueryPoolCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferCreateInfo>(std::string& strBuf, const VkBufferCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferViewCreateInfo>(std::string& strBuf, const VkBufferViewCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageCreateInfo>(std::string& strBuf, const VkImageCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubresourceLayout>(std::string& strBuf, const VkSubresourceLayout& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkComponentMapping>(std::string& strBuf, const VkComponentMapping& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageViewCreateInfo>(std::string& strBuf, const VkImageViewCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkShaderModuleCreateInfo>(std::string& strBuf, const VkShaderModuleCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCacheCreateInfo>(std::string& strBuf, const VkPipelineCacheCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSpecializationMapEntry>(std::string& strBuf, const VkSpecializationMapEntry& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSpecializationInfo>(std::string& strBuf, const VkSpecializationInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineShaderStageCreateInfo>(std::string& strBuf, const VkPipelineShaderStageCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkComputePipelineCreateInfo>(std::string& strBuf, const VkComputePipelineCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkVertexInputBindingDescription>(std::string& strBuf, const VkVertexInputBindingDescription& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkVertexInputAttributeDescription>(std::string& strBuf, const VkVertexInputAttributeDescription& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineVertexInputStateCreateInfo>(std::string& strBuf, const VkPipelineVertexInputStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineInputAssemblyStateCreateInfo>(std::string& strBuf, const VkPipelineInputAssemblyStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineTessellationStateCreateInfo>(std::string& strBuf, const VkPipelineTessellationStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkViewport>(std::string& strBuf, const VkViewport& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportStateCreateInfo>(std::string& strBuf, const VkPipelineViewportStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationStateCreateInfo>(std::string& strBuf, const VkPipelineRasterizationStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineMultisampleStateCreateInfo>(std::string& strBuf, const VkPipelineMultisampleStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkStencilOpState>(std::string& strBuf, const VkStencilOpState& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineDepthStencilStateCreateInfo>(std::string& strBuf, const VkPipelineDepthStencilStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineColorBlendAttachmentState>(std::string& strBuf, const VkPipelineColorBlendAttachmentState& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineColorBlendStateCreateInfo>(std::string& strBuf, const VkPipelineColorBlendStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineDynamicStateCreateInfo>(std::string& strBuf, const VkPipelineDynamicStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGraphicsPipelineCreateInfo>(std::string& strBuf, const VkGraphicsPipelineCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPushConstantRange>(std::string& strBuf, const VkPushConstantRange& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineLayoutCreateInfo>(std::string& strBuf, const VkPipelineLayoutCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerCreateInfo>(std::string& strBuf, const VkSamplerCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyDescriptorSet>(std::string& strBuf, const VkCopyDescriptorSet& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorBufferInfo>(std::string& strBuf, const VkDescriptorBufferInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorPoolSize>(std::string& strBuf, const VkDescriptorPoolSize& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorPoolCreateInfo>(std::string& strBuf, const VkDescriptorPoolCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetAllocateInfo>(std::string& strBuf, const VkDescriptorSetAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetLayoutBinding>(std::string& strBuf, const VkDescriptorSetLayoutBinding& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetLayoutCreateInfo>(std::string& strBuf, const VkDescriptorSetLayoutCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentDescription>(std::string& strBuf, const VkAttachmentDescription& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentReference>(std::string& strBuf, const VkAttachmentReference& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFramebufferCreateInfo>(std::string& strBuf, const VkFramebufferCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassDescription>(std::string& strBuf, const VkSubpassDescription& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassDependency>(std::string& strBuf, const VkSubpassDependency& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassCreateInfo>(std::string& strBuf, const VkRenderPassCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandPoolCreateInfo>(std::string& strBuf, const VkCommandPoolCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferAllocateInfo>(std::string& strBuf, const VkCommandBufferAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferInheritanceInfo>(std::string& strBuf, const VkCommandBufferInheritanceInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferBeginInfo>(std::string& strBuf, const VkCommandBufferBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferCopy>(std::string& strBuf, const VkBufferCopy& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageSubresourceLayers>(std::string& strBuf, const VkImageSubresourceLayers& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferImageCopy>(std::string& strBuf, const VkBufferImageCopy& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkClearDepthStencilValue>(std::string& strBuf, const VkClearDepthStencilValue& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkClearAttachment>(std::string& strBuf, const VkClearAttachment& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkClearRect>(std::string& strBuf, const VkClearRect& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageBlit>(std::string& strBuf, const VkImageBlit& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageCopy>(std::string& strBuf, const VkImageCopy& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageResolve>(std::string& strBuf, const VkImageResolve& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassBeginInfo>(std::string& strBuf, const VkRenderPassBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSubgroupProperties>(std::string& strBuf, const VkPhysicalDeviceSubgroupProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindBufferMemoryInfo>(std::string& strBuf, const VkBindBufferMemoryInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindImageMemoryInfo>(std::string& strBuf, const VkBindImageMemoryInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevice16BitStorageFeatures>(std::string& strBuf, const VkPhysicalDevice16BitStorageFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryDedicatedRequirements>(std::string& strBuf, const VkMemoryDedicatedRequirements& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryDedicatedAllocateInfo>(std::string& strBuf, const VkMemoryDedicatedAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryAllocateFlagsInfo>(std::string& strBuf, const VkMemoryAllocateFlagsInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupRenderPassBeginInfo>(std::string& strBuf, const VkDeviceGroupRenderPassBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupCommandBufferBeginInfo>(std::string& strBuf, const VkDeviceGroupCommandBufferBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupSubmitInfo>(std::string& strBuf, const VkDeviceGroupSubmitInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupBindSparseInfo>(std::string& strBuf, const VkDeviceGroupBindSparseInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindBufferMemoryDeviceGroupInfo>(std::string& strBuf, const VkBindBufferMemoryDeviceGroupInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindImageMemoryDeviceGroupInfo>(std::string& strBuf, const VkBindImageMemoryDeviceGroupInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceGroupProperties>(std::string& strBuf, const VkPhysicalDeviceGroupProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupDeviceCreateInfo>(std::string& strBuf, const VkDeviceGroupDeviceCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferMemoryRequirementsInfo2>(std::string& strBuf, const VkBufferMemoryRequirementsInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageMemoryRequirementsInfo2>(std::string& strBuf, const VkImageMemoryRequirementsInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageSparseMemoryRequirementsInfo2>(std::string& strBuf, const VkImageSparseMemoryRequirementsInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryRequirements2>(std::string& strBuf, const VkMemoryRequirements2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageMemoryRequirements2>(std::string& strBuf, const VkSparseImageMemoryRequirements2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFeatures2>(std::string& strBuf, const VkPhysicalDeviceFeatures2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProperties2>(std::string& strBuf, const VkPhysicalDeviceProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFormatProperties2>(std::string& strBuf, const VkFormatProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageFormatProperties2>(std::string& strBuf, const VkImageFormatProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceImageFormatInfo2>(std::string& strBuf, const VkPhysicalDeviceImageFormatInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueueFamilyProperties2>(std::string& strBuf, const VkQueueFamilyProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMemoryProperties2>(std::string& strBuf, const VkPhysicalDeviceMemoryProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSparseImageFormatProperties2>(std::string& strBuf, const VkSparseImageFormatProperties2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSparseImageFormatInfo2>(std::string& strBuf, const VkPhysicalDeviceSparseImageFormatInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePointClippingProperties>(std::string& strBuf, const VkPhysicalDevicePointClippingProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkInputAttachmentAspectReference>(std::string& strBuf, const VkInputAttachmentAspectReference& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassInputAttachmentAspectCreateInfo>(std::string& strBuf, const VkRenderPassInputAttachmentAspectCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageViewUsageCreateInfo>(std::string& strBuf, const VkImageViewUsageCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineTessellationDomainOriginStateCreateInfo>(std::string& strBuf, const VkPipelineTessellationDomainOriginStateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassMultiviewCreateInfo>(std::string& strBuf, const VkRenderPassMultiviewCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMultiviewFeatures>(std::string& strBuf, const VkPhysicalDeviceMultiviewFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMultiviewProperties>(std::string& strBuf, const VkPhysicalDeviceMultiviewProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVariablePointersFeatures>(std::string& strBuf, const VkPhysicalDeviceVariablePointersFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProtectedMemoryFeatures>(std::string& strBuf, const VkPhysicalDeviceProtectedMemoryFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProtectedMemoryProperties>(std::string& strBuf, const VkPhysicalDeviceProtectedMemoryProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceQueueInfo2>(std::string& strBuf, const VkDeviceQueueInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkProtectedSubmitInfo>(std::string& strBuf, const VkProtectedSubmitInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerYcbcrConversionCreateInfo>(std::string& strBuf, const VkSamplerYcbcrConversionCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerYcbcrConversionInfo>(std::string& strBuf, const VkSamplerYcbcrConversionInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindImagePlaneMemoryInfo>(std::string& strBuf, const VkBindImagePlaneMemoryInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImagePlaneMemoryRequirementsInfo>(std::string& strBuf, const VkImagePlaneMemoryRequirementsInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSamplerYcbcrConversionFeatures>(std::string& strBuf, const VkPhysicalDeviceSamplerYcbcrConversionFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerYcbcrConversionImageFormatProperties>(std::string& strBuf, const VkSamplerYcbcrConversionImageFormatProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorUpdateTemplateEntry>(std::string& strBuf, const VkDescriptorUpdateTemplateEntry& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorUpdateTemplateCreateInfo>(std::string& strBuf, const VkDescriptorUpdateTemplateCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalMemoryProperties>(std::string& strBuf, const VkExternalMemoryProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalImageFormatInfo>(std::string& strBuf, const VkPhysicalDeviceExternalImageFormatInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalImageFormatProperties>(std::string& strBuf, const VkExternalImageFormatProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalBufferInfo>(std::string& strBuf, const VkPhysicalDeviceExternalBufferInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalBufferProperties>(std::string& strBuf, const VkExternalBufferProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceIDProperties>(std::string& strBuf, const VkPhysicalDeviceIDProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalMemoryImageCreateInfo>(std::string& strBuf, const VkExternalMemoryImageCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalMemoryBufferCreateInfo>(std::string& strBuf, const VkExternalMemoryBufferCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportMemoryAllocateInfo>(std::string& strBuf, const VkExportMemoryAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalFenceInfo>(std::string& strBuf, const VkPhysicalDeviceExternalFenceInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalFenceProperties>(std::string& strBuf, const VkExternalFenceProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportFenceCreateInfo>(std::string& strBuf, const VkExportFenceCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportSemaphoreCreateInfo>(std::string& strBuf, const VkExportSemaphoreCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalSemaphoreInfo>(std::string& strBuf, const VkPhysicalDeviceExternalSemaphoreInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalSemaphoreProperties>(std::string& strBuf, const VkExternalSemaphoreProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMaintenance3Properties>(std::string& strBuf, const VkPhysicalDeviceMaintenance3Properties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetLayoutSupport>(std::string& strBuf, const VkDescriptorSetLayoutSupport& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderDrawParametersFeatures>(std::string& strBuf, const VkPhysicalDeviceShaderDrawParametersFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVulkan11Features>(std::string& strBuf, const VkPhysicalDeviceVulkan11Features& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVulkan11Properties>(std::string& strBuf, const VkPhysicalDeviceVulkan11Properties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVulkan12Features>(std::string& strBuf, const VkPhysicalDeviceVulkan12Features& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkConformanceVersion>(std::string& strBuf, const VkConformanceVersion& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVulkan12Properties>(std::string& strBuf, const VkPhysicalDeviceVulkan12Properties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageFormatListCreateInfo>(std::string& strBuf, const VkImageFormatListCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentDescription2>(std::string& strBuf, const VkAttachmentDescription2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentReference2>(std::string& strBuf, const VkAttachmentReference2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassDescription2>(std::string& strBuf, const VkSubpassDescription2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassDependency2>(std::string& strBuf, const VkSubpassDependency2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassCreateInfo2>(std::string& strBuf, const VkRenderPassCreateInfo2& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassBeginInfo>(std::string& strBuf, const VkSubpassBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassEndInfo>(std::string& strBuf, const VkSubpassEndInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevice8BitStorageFeatures>(std::string& strBuf, const VkPhysicalDevice8BitStorageFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDriverProperties>(std::string& strBuf, const VkPhysicalDeviceDriverProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderAtomicInt64Features>(std::string& strBuf, const VkPhysicalDeviceShaderAtomicInt64Features& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderFloat16Int8Features>(std::string& strBuf, const VkPhysicalDeviceShaderFloat16Int8Features& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFloatControlsProperties>(std::string& strBuf, const VkPhysicalDeviceFloatControlsProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetLayoutBindingFlagsCreateInfo>(std::string& strBuf, const VkDescriptorSetLayoutBindingFlagsCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDescriptorIndexingFeatures>(std::string& strBuf, const VkPhysicalDeviceDescriptorIndexingFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDescriptorIndexingProperties>(std::string& strBuf, const VkPhysicalDeviceDescriptorIndexingProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetVariableDescriptorCountAllocateInfo>(std::string& strBuf, const VkDescriptorSetVariableDescriptorCountAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorSetVariableDescriptorCountLayoutSupport>(std::string& strBuf, const VkDescriptorSetVariableDescriptorCountLayoutSupport& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassDescriptionDepthStencilResolve>(std::string& strBuf, const VkSubpassDescriptionDepthStencilResolve& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDepthStencilResolveProperties>(std::string& strBuf, const VkPhysicalDeviceDepthStencilResolveProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceScalarBlockLayoutFeatures>(std::string& strBuf, const VkPhysicalDeviceScalarBlockLayoutFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageStencilUsageCreateInfo>(std::string& strBuf, const VkImageStencilUsageCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerReductionModeCreateInfo>(std::string& strBuf, const VkSamplerReductionModeCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSamplerFilterMinmaxProperties>(std::string& strBuf, const VkPhysicalDeviceSamplerFilterMinmaxProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVulkanMemoryModelFeatures>(std::string& strBuf, const VkPhysicalDeviceVulkanMemoryModelFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceImagelessFramebufferFeatures>(std::string& strBuf, const VkPhysicalDeviceImagelessFramebufferFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFramebufferAttachmentImageInfo>(std::string& strBuf, const VkFramebufferAttachmentImageInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFramebufferAttachmentsCreateInfo>(std::string& strBuf, const VkFramebufferAttachmentsCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassAttachmentBeginInfo>(std::string& strBuf, const VkRenderPassAttachmentBeginInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceUniformBufferStandardLayoutFeatures>(std::string& strBuf, const VkPhysicalDeviceUniformBufferStandardLayoutFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures>(std::string& strBuf, const VkPhysicalDeviceShaderSubgroupExtendedTypesFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures>(std::string& strBuf, const VkPhysicalDeviceSeparateDepthStencilLayoutsFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentReferenceStencilLayout>(std::string& strBuf, const VkAttachmentReferenceStencilLayout& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentDescriptionStencilLayout>(std::string& strBuf, const VkAttachmentDescriptionStencilLayout& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceHostQueryResetFeatures>(std::string& strBuf, const VkPhysicalDeviceHostQueryResetFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTimelineSemaphoreFeatures>(std::string& strBuf, const VkPhysicalDeviceTimelineSemaphoreFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTimelineSemaphoreProperties>(std::string& strBuf, const VkPhysicalDeviceTimelineSemaphoreProperties& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreTypeCreateInfo>(std::string& strBuf, const VkSemaphoreTypeCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkTimelineSemaphoreSubmitInfo>(std::string& strBuf, const VkTimelineSemaphoreSubmitInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreWaitInfo>(std::string& strBuf, const VkSemaphoreWaitInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreSignalInfo>(std::string& strBuf, const VkSemaphoreSignalInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceBufferDeviceAddressFeatures>(std::string& strBuf, const VkPhysicalDeviceBufferDeviceAddressFeatures& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferDeviceAddressInfo>(std::string& strBuf, const VkBufferDeviceAddressInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferOpaqueCaptureAddressCreateInfo>(std::string& strBuf, const VkBufferOpaqueCaptureAddressCreateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryOpaqueCaptureAddressAllocateInfo>(std::string& strBuf, const VkMemoryOpaqueCaptureAddressAllocateInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceMemoryOpaqueCaptureAddressInfo>(std::string& strBuf, const VkDeviceMemoryOpaqueCaptureAddressInfo& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceCapabilitiesKHR>(std::string& strBuf, const VkSurfaceCapabilitiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceFormatKHR>(std::string& strBuf, const VkSurfaceFormatKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSwapchainCreateInfoKHR>(std::string& strBuf, const VkSwapchainCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentInfoKHR>(std::string& strBuf, const VkPresentInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageSwapchainCreateInfoKHR>(std::string& strBuf, const VkImageSwapchainCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindImageMemorySwapchainInfoKHR>(std::string& strBuf, const VkBindImageMemorySwapchainInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAcquireNextImageInfoKHR>(std::string& strBuf, const VkAcquireNextImageInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupPresentCapabilitiesKHR>(std::string& strBuf, const VkDeviceGroupPresentCapabilitiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupPresentInfoKHR>(std::string& strBuf, const VkDeviceGroupPresentInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceGroupSwapchainCreateInfoKHR>(std::string& strBuf, const VkDeviceGroupSwapchainCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayModeParametersKHR>(std::string& strBuf, const VkDisplayModeParametersKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayModeCreateInfoKHR>(std::string& strBuf, const VkDisplayModeCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayModePropertiesKHR>(std::string& strBuf, const VkDisplayModePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPlaneCapabilitiesKHR>(std::string& strBuf, const VkDisplayPlaneCapabilitiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPlanePropertiesKHR>(std::string& strBuf, const VkDisplayPlanePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPropertiesKHR>(std::string& strBuf, const VkDisplayPropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplaySurfaceCreateInfoKHR>(std::string& strBuf, const VkDisplaySurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPresentInfoKHR>(std::string& strBuf, const VkDisplayPresentInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkXlibSurfaceCreateInfoKHR>(std::string& strBuf, const VkXlibSurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkXcbSurfaceCreateInfoKHR>(std::string& strBuf, const VkXcbSurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWaylandSurfaceCreateInfoKHR>(std::string& strBuf, const VkWaylandSurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAndroidSurfaceCreateInfoKHR>(std::string& strBuf, const VkAndroidSurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWin32SurfaceCreateInfoKHR>(std::string& strBuf, const VkWin32SurfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportMemoryWin32HandleInfoKHR>(std::string& strBuf, const VkImportMemoryWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportMemoryWin32HandleInfoKHR>(std::string& strBuf, const VkExportMemoryWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryWin32HandlePropertiesKHR>(std::string& strBuf, const VkMemoryWin32HandlePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryGetWin32HandleInfoKHR>(std::string& strBuf, const VkMemoryGetWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportMemoryFdInfoKHR>(std::string& strBuf, const VkImportMemoryFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryFdPropertiesKHR>(std::string& strBuf, const VkMemoryFdPropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryGetFdInfoKHR>(std::string& strBuf, const VkMemoryGetFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWin32KeyedMutexAcquireReleaseInfoKHR>(std::string& strBuf, const VkWin32KeyedMutexAcquireReleaseInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportSemaphoreWin32HandleInfoKHR>(std::string& strBuf, const VkImportSemaphoreWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportSemaphoreWin32HandleInfoKHR>(std::string& strBuf, const VkExportSemaphoreWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkD3D12FenceSubmitInfoKHR>(std::string& strBuf, const VkD3D12FenceSubmitInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreGetWin32HandleInfoKHR>(std::string& strBuf, const VkSemaphoreGetWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportSemaphoreFdInfoKHR>(std::string& strBuf, const VkImportSemaphoreFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreGetFdInfoKHR>(std::string& strBuf, const VkSemaphoreGetFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePushDescriptorPropertiesKHR>(std::string& strBuf, const VkPhysicalDevicePushDescriptorPropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRectLayerKHR>(std::string& strBuf, const VkRectLayerKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentRegionKHR>(std::string& strBuf, const VkPresentRegionKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentRegionsKHR>(std::string& strBuf, const VkPresentRegionsKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSharedPresentSurfaceCapabilitiesKHR>(std::string& strBuf, const VkSharedPresentSurfaceCapabilitiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportFenceWin32HandleInfoKHR>(std::string& strBuf, const VkImportFenceWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportFenceWin32HandleInfoKHR>(std::string& strBuf, const VkExportFenceWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFenceGetWin32HandleInfoKHR>(std::string& strBuf, const VkFenceGetWin32HandleInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportFenceFdInfoKHR>(std::string& strBuf, const VkImportFenceFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFenceGetFdInfoKHR>(std::string& strBuf, const VkFenceGetFdInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePerformanceQueryFeaturesKHR>(std::string& strBuf, const VkPhysicalDevicePerformanceQueryFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePerformanceQueryPropertiesKHR>(std::string& strBuf, const VkPhysicalDevicePerformanceQueryPropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceCounterKHR>(std::string& strBuf, const VkPerformanceCounterKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceCounterDescriptionKHR>(std::string& strBuf, const VkPerformanceCounterDescriptionKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueryPoolPerformanceCreateInfoKHR>(std::string& strBuf, const VkQueryPoolPerformanceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAcquireProfilingLockInfoKHR>(std::string& strBuf, const VkAcquireProfilingLockInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceQuerySubmitInfoKHR>(std::string& strBuf, const VkPerformanceQuerySubmitInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSurfaceInfo2KHR>(std::string& strBuf, const VkPhysicalDeviceSurfaceInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceCapabilities2KHR>(std::string& strBuf, const VkSurfaceCapabilities2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceFormat2KHR>(std::string& strBuf, const VkSurfaceFormat2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayProperties2KHR>(std::string& strBuf, const VkDisplayProperties2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPlaneProperties2KHR>(std::string& strBuf, const VkDisplayPlaneProperties2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayModeProperties2KHR>(std::string& strBuf, const VkDisplayModeProperties2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPlaneInfo2KHR>(std::string& strBuf, const VkDisplayPlaneInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPlaneCapabilities2KHR>(std::string& strBuf, const VkDisplayPlaneCapabilities2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePortabilitySubsetFeaturesKHR>(std::string& strBuf, const VkPhysicalDevicePortabilitySubsetFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePortabilitySubsetPropertiesKHR>(std::string& strBuf, const VkPhysicalDevicePortabilitySubsetPropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderClockFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceShaderClockFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderTerminateInvocationFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceShaderTerminateInvocationFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFragmentShadingRateAttachmentInfoKHR>(std::string& strBuf, const VkFragmentShadingRateAttachmentInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineFragmentShadingRateStateCreateInfoKHR>(std::string& strBuf, const VkPipelineFragmentShadingRateStateCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShadingRateFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceFragmentShadingRateFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShadingRatePropertiesKHR>(std::string& strBuf, const VkPhysicalDeviceFragmentShadingRatePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShadingRateKHR>(std::string& strBuf, const VkPhysicalDeviceFragmentShadingRateKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceProtectedCapabilitiesKHR>(std::string& strBuf, const VkSurfaceProtectedCapabilitiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePresentWaitFeaturesKHR>(std::string& strBuf, const VkPhysicalDevicePresentWaitFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR>(std::string& strBuf, const VkPhysicalDevicePipelineExecutablePropertiesFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineInfoKHR>(std::string& strBuf, const VkPipelineInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineExecutablePropertiesKHR>(std::string& strBuf, const VkPipelineExecutablePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineExecutableInfoKHR>(std::string& strBuf, const VkPipelineExecutableInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineExecutableStatisticKHR>(std::string& strBuf, const VkPipelineExecutableStatisticKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineExecutableInternalRepresentationKHR>(std::string& strBuf, const VkPipelineExecutableInternalRepresentationKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineLibraryCreateInfoKHR>(std::string& strBuf, const VkPipelineLibraryCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentIdKHR>(std::string& strBuf, const VkPresentIdKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePresentIdFeaturesKHR>(std::string& strBuf, const VkPhysicalDevicePresentIdFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryBarrier2KHR>(std::string& strBuf, const VkMemoryBarrier2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferMemoryBarrier2KHR>(std::string& strBuf, const VkBufferMemoryBarrier2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageMemoryBarrier2KHR>(std::string& strBuf, const VkImageMemoryBarrier2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDependencyInfoKHR>(std::string& strBuf, const VkDependencyInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreSubmitInfoKHR>(std::string& strBuf, const VkSemaphoreSubmitInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferSubmitInfoKHR>(std::string& strBuf, const VkCommandBufferSubmitInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubmitInfo2KHR>(std::string& strBuf, const VkSubmitInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSynchronization2FeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceSynchronization2FeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueueFamilyCheckpointProperties2NV>(std::string& strBuf, const VkQueueFamilyCheckpointProperties2NV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCheckpointData2NV>(std::string& strBuf, const VkCheckpointData2NV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceShaderSubgroupUniformControlFlowFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceZeroInitializeWorkgroupMemoryFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceWorkgroupMemoryExplicitLayoutFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferCopy2KHR>(std::string& strBuf, const VkBufferCopy2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyBufferInfo2KHR>(std::string& strBuf, const VkCopyBufferInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageCopy2KHR>(std::string& strBuf, const VkImageCopy2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyImageInfo2KHR>(std::string& strBuf, const VkCopyImageInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferImageCopy2KHR>(std::string& strBuf, const VkBufferImageCopy2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyBufferToImageInfo2KHR>(std::string& strBuf, const VkCopyBufferToImageInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyImageToBufferInfo2KHR>(std::string& strBuf, const VkCopyImageToBufferInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageBlit2KHR>(std::string& strBuf, const VkImageBlit2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBlitImageInfo2KHR>(std::string& strBuf, const VkBlitImageInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageResolve2KHR>(std::string& strBuf, const VkImageResolve2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkResolveImageInfo2KHR>(std::string& strBuf, const VkResolveImageInfo2KHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugReportCallbackCreateInfoEXT>(std::string& strBuf, const VkDebugReportCallbackCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationStateRasterizationOrderAMD>(std::string& strBuf, const VkPipelineRasterizationStateRasterizationOrderAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugMarkerObjectNameInfoEXT>(std::string& strBuf, const VkDebugMarkerObjectNameInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugMarkerObjectTagInfoEXT>(std::string& strBuf, const VkDebugMarkerObjectTagInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugMarkerMarkerInfoEXT>(std::string& strBuf, const VkDebugMarkerMarkerInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDedicatedAllocationImageCreateInfoNV>(std::string& strBuf, const VkDedicatedAllocationImageCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDedicatedAllocationBufferCreateInfoNV>(std::string& strBuf, const VkDedicatedAllocationBufferCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDedicatedAllocationMemoryAllocateInfoNV>(std::string& strBuf, const VkDedicatedAllocationMemoryAllocateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTransformFeedbackFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceTransformFeedbackFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTransformFeedbackPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceTransformFeedbackPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationStateStreamCreateInfoEXT>(std::string& strBuf, const VkPipelineRasterizationStateStreamCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageViewHandleInfoNVX>(std::string& strBuf, const VkImageViewHandleInfoNVX& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageViewAddressPropertiesNVX>(std::string& strBuf, const VkImageViewAddressPropertiesNVX& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkTextureLODGatherFormatPropertiesAMD>(std::string& strBuf, const VkTextureLODGatherFormatPropertiesAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkShaderResourceUsageAMD>(std::string& strBuf, const VkShaderResourceUsageAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkShaderStatisticsInfoAMD>(std::string& strBuf, const VkShaderStatisticsInfoAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkStreamDescriptorSurfaceCreateInfoGGP>(std::string& strBuf, const VkStreamDescriptorSurfaceCreateInfoGGP& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCornerSampledImageFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceCornerSampledImageFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalImageFormatPropertiesNV>(std::string& strBuf, const VkExternalImageFormatPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalMemoryImageCreateInfoNV>(std::string& strBuf, const VkExternalMemoryImageCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportMemoryAllocateInfoNV>(std::string& strBuf, const VkExportMemoryAllocateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportMemoryWin32HandleInfoNV>(std::string& strBuf, const VkImportMemoryWin32HandleInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExportMemoryWin32HandleInfoNV>(std::string& strBuf, const VkExportMemoryWin32HandleInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWin32KeyedMutexAcquireReleaseInfoNV>(std::string& strBuf, const VkWin32KeyedMutexAcquireReleaseInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkValidationFlagsEXT>(std::string& strBuf, const VkValidationFlagsEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkViSurfaceCreateInfoNN>(std::string& strBuf, const VkViSurfaceCreateInfoNN& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTextureCompressionASTCHDRFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceTextureCompressionASTCHDRFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageViewASTCDecodeModeEXT>(std::string& strBuf, const VkImageViewASTCDecodeModeEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceASTCDecodeFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceASTCDecodeFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkConditionalRenderingBeginInfoEXT>(std::string& strBuf, const VkConditionalRenderingBeginInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceConditionalRenderingFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceConditionalRenderingFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferInheritanceConditionalRenderingInfoEXT>(std::string& strBuf, const VkCommandBufferInheritanceConditionalRenderingInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkViewportWScalingNV>(std::string& strBuf, const VkViewportWScalingNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportWScalingStateCreateInfoNV>(std::string& strBuf, const VkPipelineViewportWScalingStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceCapabilities2EXT>(std::string& strBuf, const VkSurfaceCapabilities2EXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayPowerInfoEXT>(std::string& strBuf, const VkDisplayPowerInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceEventInfoEXT>(std::string& strBuf, const VkDeviceEventInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayEventInfoEXT>(std::string& strBuf, const VkDisplayEventInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSwapchainCounterCreateInfoEXT>(std::string& strBuf, const VkSwapchainCounterCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRefreshCycleDurationGOOGLE>(std::string& strBuf, const VkRefreshCycleDurationGOOGLE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPastPresentationTimingGOOGLE>(std::string& strBuf, const VkPastPresentationTimingGOOGLE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentTimeGOOGLE>(std::string& strBuf, const VkPresentTimeGOOGLE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentTimesInfoGOOGLE>(std::string& strBuf, const VkPresentTimesInfoGOOGLE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX>(std::string& strBuf, const VkPhysicalDeviceMultiviewPerViewAttributesPropertiesNVX& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkViewportSwizzleNV>(std::string& strBuf, const VkViewportSwizzleNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportSwizzleStateCreateInfoNV>(std::string& strBuf, const VkPipelineViewportSwizzleStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDiscardRectanglePropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceDiscardRectanglePropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineDiscardRectangleStateCreateInfoEXT>(std::string& strBuf, const VkPipelineDiscardRectangleStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceConservativeRasterizationPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceConservativeRasterizationPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationConservativeStateCreateInfoEXT>(std::string& strBuf, const VkPipelineRasterizationConservativeStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDepthClipEnableFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceDepthClipEnableFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationDepthClipStateCreateInfoEXT>(std::string& strBuf, const VkPipelineRasterizationDepthClipStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkXYColorEXT>(std::string& strBuf, const VkXYColorEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkHdrMetadataEXT>(std::string& strBuf, const VkHdrMetadataEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkIOSSurfaceCreateInfoMVK>(std::string& strBuf, const VkIOSSurfaceCreateInfoMVK& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMacOSSurfaceCreateInfoMVK>(std::string& strBuf, const VkMacOSSurfaceCreateInfoMVK& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugUtilsLabelEXT>(std::string& strBuf, const VkDebugUtilsLabelEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugUtilsObjectNameInfoEXT>(std::string& strBuf, const VkDebugUtilsObjectNameInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugUtilsMessengerCallbackDataEXT>(std::string& strBuf, const VkDebugUtilsMessengerCallbackDataEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugUtilsMessengerCreateInfoEXT>(std::string& strBuf, const VkDebugUtilsMessengerCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDebugUtilsObjectTagInfoEXT>(std::string& strBuf, const VkDebugUtilsObjectTagInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAndroidHardwareBufferUsageANDROID>(std::string& strBuf, const VkAndroidHardwareBufferUsageANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAndroidHardwareBufferPropertiesANDROID>(std::string& strBuf, const VkAndroidHardwareBufferPropertiesANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAndroidHardwareBufferFormatPropertiesANDROID>(std::string& strBuf, const VkAndroidHardwareBufferFormatPropertiesANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportAndroidHardwareBufferInfoANDROID>(std::string& strBuf, const VkImportAndroidHardwareBufferInfoANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryGetAndroidHardwareBufferInfoANDROID>(std::string& strBuf, const VkMemoryGetAndroidHardwareBufferInfoANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkExternalFormatANDROID>(std::string& strBuf, const VkExternalFormatANDROID& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceInlineUniformBlockFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceInlineUniformBlockFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceInlineUniformBlockPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceInlineUniformBlockPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWriteDescriptorSetInlineUniformBlockEXT>(std::string& strBuf, const VkWriteDescriptorSetInlineUniformBlockEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDescriptorPoolInlineUniformBlockCreateInfoEXT>(std::string& strBuf, const VkDescriptorPoolInlineUniformBlockCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSampleLocationEXT>(std::string& strBuf, const VkSampleLocationEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSampleLocationsInfoEXT>(std::string& strBuf, const VkSampleLocationsInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAttachmentSampleLocationsEXT>(std::string& strBuf, const VkAttachmentSampleLocationsEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSubpassSampleLocationsEXT>(std::string& strBuf, const VkSubpassSampleLocationsEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassSampleLocationsBeginInfoEXT>(std::string& strBuf, const VkRenderPassSampleLocationsBeginInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineSampleLocationsStateCreateInfoEXT>(std::string& strBuf, const VkPipelineSampleLocationsStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSampleLocationsPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceSampleLocationsPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMultisamplePropertiesEXT>(std::string& strBuf, const VkMultisamplePropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceBlendOperationAdvancedFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceBlendOperationAdvancedPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineColorBlendAdvancedStateCreateInfoEXT>(std::string& strBuf, const VkPipelineColorBlendAdvancedStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCoverageToColorStateCreateInfoNV>(std::string& strBuf, const VkPipelineCoverageToColorStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCoverageModulationStateCreateInfoNV>(std::string& strBuf, const VkPipelineCoverageModulationStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderSMBuiltinsPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceShaderSMBuiltinsPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderSMBuiltinsFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceShaderSMBuiltinsFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDrmFormatModifierPropertiesEXT>(std::string& strBuf, const VkDrmFormatModifierPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDrmFormatModifierPropertiesListEXT>(std::string& strBuf, const VkDrmFormatModifierPropertiesListEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceImageDrmFormatModifierInfoEXT>(std::string& strBuf, const VkPhysicalDeviceImageDrmFormatModifierInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageDrmFormatModifierListCreateInfoEXT>(std::string& strBuf, const VkImageDrmFormatModifierListCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageDrmFormatModifierExplicitCreateInfoEXT>(std::string& strBuf, const VkImageDrmFormatModifierExplicitCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImageDrmFormatModifierPropertiesEXT>(std::string& strBuf, const VkImageDrmFormatModifierPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkValidationCacheCreateInfoEXT>(std::string& strBuf, const VkValidationCacheCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkShaderModuleValidationCacheCreateInfoEXT>(std::string& strBuf, const VkShaderModuleValidationCacheCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkShadingRatePaletteNV>(std::string& strBuf, const VkShadingRatePaletteNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportShadingRateImageStateCreateInfoNV>(std::string& strBuf, const VkPipelineViewportShadingRateImageStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShadingRateImageFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceShadingRateImageFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShadingRateImagePropertiesNV>(std::string& strBuf, const VkPhysicalDeviceShadingRateImagePropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCoarseSampleLocationNV>(std::string& strBuf, const VkCoarseSampleLocationNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCoarseSampleOrderCustomNV>(std::string& strBuf, const VkCoarseSampleOrderCustomNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportCoarseSampleOrderStateCreateInfoNV>(std::string& strBuf, const VkPipelineViewportCoarseSampleOrderStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRayTracingShaderGroupCreateInfoNV>(std::string& strBuf, const VkRayTracingShaderGroupCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRayTracingPipelineCreateInfoNV>(std::string& strBuf, const VkRayTracingPipelineCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeometryTrianglesNV>(std::string& strBuf, const VkGeometryTrianglesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeometryAABBNV>(std::string& strBuf, const VkGeometryAABBNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeometryDataNV>(std::string& strBuf, const VkGeometryDataNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeometryNV>(std::string& strBuf, const VkGeometryNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureInfoNV>(std::string& strBuf, const VkAccelerationStructureInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureCreateInfoNV>(std::string& strBuf, const VkAccelerationStructureCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindAccelerationStructureMemoryInfoNV>(std::string& strBuf, const VkBindAccelerationStructureMemoryInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWriteDescriptorSetAccelerationStructureNV>(std::string& strBuf, const VkWriteDescriptorSetAccelerationStructureNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureMemoryRequirementsInfoNV>(std::string& strBuf, const VkAccelerationStructureMemoryRequirementsInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRayTracingPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceRayTracingPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkTransformMatrixKHR>(std::string& strBuf, const VkTransformMatrixKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAabbPositionsKHR>(std::string& strBuf, const VkAabbPositionsKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureInstanceKHR>(std::string& strBuf, const VkAccelerationStructureInstanceKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceRepresentativeFragmentTestFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRepresentativeFragmentTestStateCreateInfoNV>(std::string& strBuf, const VkPipelineRepresentativeFragmentTestStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceImageViewImageFormatInfoEXT>(std::string& strBuf, const VkPhysicalDeviceImageViewImageFormatInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFilterCubicImageViewImageFormatPropertiesEXT>(std::string& strBuf, const VkFilterCubicImageViewImageFormatPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceQueueGlobalPriorityCreateInfoEXT>(std::string& strBuf, const VkDeviceQueueGlobalPriorityCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportMemoryHostPointerInfoEXT>(std::string& strBuf, const VkImportMemoryHostPointerInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryHostPointerPropertiesEXT>(std::string& strBuf, const VkMemoryHostPointerPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalMemoryHostPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceExternalMemoryHostPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCompilerControlCreateInfoAMD>(std::string& strBuf, const VkPipelineCompilerControlCreateInfoAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCalibratedTimestampInfoEXT>(std::string& strBuf, const VkCalibratedTimestampInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderCorePropertiesAMD>(std::string& strBuf, const VkPhysicalDeviceShaderCorePropertiesAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceMemoryOverallocationCreateInfoAMD>(std::string& strBuf, const VkDeviceMemoryOverallocationCreateInfoAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceVertexAttributeDivisorPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkVertexInputBindingDivisorDescriptionEXT>(std::string& strBuf, const VkVertexInputBindingDivisorDescriptionEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineVertexInputDivisorStateCreateInfoEXT>(std::string& strBuf, const VkPipelineVertexInputDivisorStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceVertexAttributeDivisorFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPresentFrameTokenGGP>(std::string& strBuf, const VkPresentFrameTokenGGP& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCreationFeedbackEXT>(std::string& strBuf, const VkPipelineCreationFeedbackEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCreationFeedbackCreateInfoEXT>(std::string& strBuf, const VkPipelineCreationFeedbackCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceComputeShaderDerivativesFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceComputeShaderDerivativesFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMeshShaderFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceMeshShaderFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMeshShaderPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceMeshShaderPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDrawMeshTasksIndirectCommandNV>(std::string& strBuf, const VkDrawMeshTasksIndirectCommandNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceFragmentShaderBarycentricFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderImageFootprintFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceShaderImageFootprintFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineViewportExclusiveScissorStateCreateInfoNV>(std::string& strBuf, const VkPipelineViewportExclusiveScissorStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExclusiveScissorFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceExclusiveScissorFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueueFamilyCheckpointPropertiesNV>(std::string& strBuf, const VkQueueFamilyCheckpointPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCheckpointDataNV>(std::string& strBuf, const VkCheckpointDataNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL>(std::string& strBuf, const VkPhysicalDeviceShaderIntegerFunctions2FeaturesINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkInitializePerformanceApiInfoINTEL>(std::string& strBuf, const VkInitializePerformanceApiInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueryPoolPerformanceQueryCreateInfoINTEL>(std::string& strBuf, const VkQueryPoolPerformanceQueryCreateInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceMarkerInfoINTEL>(std::string& strBuf, const VkPerformanceMarkerInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceStreamMarkerInfoINTEL>(std::string& strBuf, const VkPerformanceStreamMarkerInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceOverrideInfoINTEL>(std::string& strBuf, const VkPerformanceOverrideInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPerformanceConfigurationAcquireInfoINTEL>(std::string& strBuf, const VkPerformanceConfigurationAcquireInfoINTEL& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePCIBusInfoPropertiesEXT>(std::string& strBuf, const VkPhysicalDevicePCIBusInfoPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDisplayNativeHdrSurfaceCapabilitiesAMD>(std::string& strBuf, const VkDisplayNativeHdrSurfaceCapabilitiesAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSwapchainDisplayNativeHdrCreateInfoAMD>(std::string& strBuf, const VkSwapchainDisplayNativeHdrCreateInfoAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImagePipeSurfaceCreateInfoFUCHSIA>(std::string& strBuf, const VkImagePipeSurfaceCreateInfoFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMetalSurfaceCreateInfoEXT>(std::string& strBuf, const VkMetalSurfaceCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentDensityMapFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceFragmentDensityMapFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentDensityMapPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceFragmentDensityMapPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassFragmentDensityMapCreateInfoEXT>(std::string& strBuf, const VkRenderPassFragmentDensityMapCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSubgroupSizeControlFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceSubgroupSizeControlFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceSubgroupSizeControlPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceSubgroupSizeControlPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineShaderStageRequiredSubgroupSizeCreateInfoEXT>(std::string& strBuf, const VkPipelineShaderStageRequiredSubgroupSizeCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderCoreProperties2AMD>(std::string& strBuf, const VkPhysicalDeviceShaderCoreProperties2AMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCoherentMemoryFeaturesAMD>(std::string& strBuf, const VkPhysicalDeviceCoherentMemoryFeaturesAMD& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceShaderImageAtomicInt64FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMemoryBudgetPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceMemoryBudgetPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMemoryPriorityFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceMemoryPriorityFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryPriorityAllocateInfoEXT>(std::string& strBuf, const VkMemoryPriorityAllocateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceDedicatedAllocationImageAliasingFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceBufferDeviceAddressFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceBufferDeviceAddressFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBufferDeviceAddressCreateInfoEXT>(std::string& strBuf, const VkBufferDeviceAddressCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceToolPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceToolPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkValidationFeaturesEXT>(std::string& strBuf, const VkValidationFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCooperativeMatrixPropertiesNV>(std::string& strBuf, const VkCooperativeMatrixPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCooperativeMatrixFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceCooperativeMatrixFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCooperativeMatrixPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceCooperativeMatrixPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCoverageReductionModeFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceCoverageReductionModeFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineCoverageReductionStateCreateInfoNV>(std::string& strBuf, const VkPipelineCoverageReductionStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkFramebufferMixedSamplesCombinationNV>(std::string& strBuf, const VkFramebufferMixedSamplesCombinationNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceFragmentShaderInterlockFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceYcbcrImageArraysFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceYcbcrImageArraysFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProvokingVertexFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceProvokingVertexFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceProvokingVertexPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceProvokingVertexPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationProvokingVertexStateCreateInfoEXT>(std::string& strBuf, const VkPipelineRasterizationProvokingVertexStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceFullScreenExclusiveInfoEXT>(std::string& strBuf, const VkSurfaceFullScreenExclusiveInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceCapabilitiesFullScreenExclusiveEXT>(std::string& strBuf, const VkSurfaceCapabilitiesFullScreenExclusiveEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSurfaceFullScreenExclusiveWin32InfoEXT>(std::string& strBuf, const VkSurfaceFullScreenExclusiveWin32InfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkHeadlessSurfaceCreateInfoEXT>(std::string& strBuf, const VkHeadlessSurfaceCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceLineRasterizationFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceLineRasterizationFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceLineRasterizationPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceLineRasterizationPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineRasterizationLineStateCreateInfoEXT>(std::string& strBuf, const VkPipelineRasterizationLineStateCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderAtomicFloatFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceShaderAtomicFloatFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceIndexTypeUint8FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceIndexTypeUint8FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExtendedDynamicStateFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceExtendedDynamicStateFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceShaderAtomicFloat2FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceShaderDemoteToHelperInvocationFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceDeviceGeneratedCommandsPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceDeviceGeneratedCommandsFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGraphicsShaderGroupCreateInfoNV>(std::string& strBuf, const VkGraphicsShaderGroupCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGraphicsPipelineShaderGroupsCreateInfoNV>(std::string& strBuf, const VkGraphicsPipelineShaderGroupsCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindShaderGroupIndirectCommandNV>(std::string& strBuf, const VkBindShaderGroupIndirectCommandNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindIndexBufferIndirectCommandNV>(std::string& strBuf, const VkBindIndexBufferIndirectCommandNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkBindVertexBufferIndirectCommandNV>(std::string& strBuf, const VkBindVertexBufferIndirectCommandNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSetStateFlagsIndirectCommandNV>(std::string& strBuf, const VkSetStateFlagsIndirectCommandNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkIndirectCommandsStreamNV>(std::string& strBuf, const VkIndirectCommandsStreamNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkIndirectCommandsLayoutTokenNV>(std::string& strBuf, const VkIndirectCommandsLayoutTokenNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkIndirectCommandsLayoutCreateInfoNV>(std::string& strBuf, const VkIndirectCommandsLayoutCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeneratedCommandsInfoNV>(std::string& strBuf, const VkGeneratedCommandsInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkGeneratedCommandsMemoryRequirementsInfoNV>(std::string& strBuf, const VkGeneratedCommandsMemoryRequirementsInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceInheritedViewportScissorFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceInheritedViewportScissorFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferInheritanceViewportScissorInfoNV>(std::string& strBuf, const VkCommandBufferInheritanceViewportScissorInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceTexelBufferAlignmentFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceTexelBufferAlignmentPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceTexelBufferAlignmentPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRenderPassTransformBeginInfoQCOM>(std::string& strBuf, const VkRenderPassTransformBeginInfoQCOM& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCommandBufferInheritanceRenderPassTransformInfoQCOM>(std::string& strBuf, const VkCommandBufferInheritanceRenderPassTransformInfoQCOM& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDeviceMemoryReportFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceDeviceMemoryReportFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceMemoryReportCallbackDataEXT>(std::string& strBuf, const VkDeviceMemoryReportCallbackDataEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceDeviceMemoryReportCreateInfoEXT>(std::string& strBuf, const VkDeviceDeviceMemoryReportCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRobustness2FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceRobustness2FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRobustness2PropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceRobustness2PropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSamplerCustomBorderColorCreateInfoEXT>(std::string& strBuf, const VkSamplerCustomBorderColorCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCustomBorderColorPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceCustomBorderColorPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceCustomBorderColorFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceCustomBorderColorFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePrivateDataFeaturesEXT>(std::string& strBuf, const VkPhysicalDevicePrivateDataFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDevicePrivateDataCreateInfoEXT>(std::string& strBuf, const VkDevicePrivateDataCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPrivateDataSlotCreateInfoEXT>(std::string& strBuf, const VkPrivateDataSlotCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevicePipelineCreationCacheControlFeaturesEXT>(std::string& strBuf, const VkPhysicalDevicePipelineCreationCacheControlFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDiagnosticsConfigFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceDiagnosticsConfigFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDeviceDiagnosticsConfigCreateInfoNV>(std::string& strBuf, const VkDeviceDiagnosticsConfigCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceFragmentShadingRateEnumsFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV>(std::string& strBuf, const VkPhysicalDeviceFragmentShadingRateEnumsPropertiesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineFragmentShadingRateEnumStateCreateInfoNV>(std::string& strBuf, const VkPipelineFragmentShadingRateEnumStateCreateInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureGeometryMotionTrianglesDataNV>(std::string& strBuf, const VkAccelerationStructureGeometryMotionTrianglesDataNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureMotionInfoNV>(std::string& strBuf, const VkAccelerationStructureMotionInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureMatrixMotionInstanceNV>(std::string& strBuf, const VkAccelerationStructureMatrixMotionInstanceNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSRTDataNV>(std::string& strBuf, const VkSRTDataNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureSRTMotionInstanceNV>(std::string& strBuf, const VkAccelerationStructureSRTMotionInstanceNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRayTracingMotionBlurFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceRayTracingMotionBlurFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceYcbcr2Plane444FormatsFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentDensityMap2FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceFragmentDensityMap2FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceFragmentDensityMap2PropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceFragmentDensityMap2PropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyCommandTransformInfoQCOM>(std::string& strBuf, const VkCopyCommandTransformInfoQCOM& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceImageRobustnessFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceImageRobustnessFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDevice4444FormatsFeaturesEXT>(std::string& strBuf, const VkPhysicalDevice4444FormatsFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkDirectFBSurfaceCreateInfoEXT>(std::string& strBuf, const VkDirectFBSurfaceCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMutableDescriptorTypeFeaturesVALVE>(std::string& strBuf, const VkPhysicalDeviceMutableDescriptorTypeFeaturesVALVE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMutableDescriptorTypeListVALVE>(std::string& strBuf, const VkMutableDescriptorTypeListVALVE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMutableDescriptorTypeCreateInfoVALVE>(std::string& strBuf, const VkMutableDescriptorTypeCreateInfoVALVE& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceVertexInputDynamicStateFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkVertexInputBindingDescription2EXT>(std::string& strBuf, const VkVertexInputBindingDescription2EXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkVertexInputAttributeDescription2EXT>(std::string& strBuf, const VkVertexInputAttributeDescription2EXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceDrmPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceDrmPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportMemoryZirconHandleInfoFUCHSIA>(std::string& strBuf, const VkImportMemoryZirconHandleInfoFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryZirconHandlePropertiesFUCHSIA>(std::string& strBuf, const VkMemoryZirconHandlePropertiesFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryGetZirconHandleInfoFUCHSIA>(std::string& strBuf, const VkMemoryGetZirconHandleInfoFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkImportSemaphoreZirconHandleInfoFUCHSIA>(std::string& strBuf, const VkImportSemaphoreZirconHandleInfoFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkSemaphoreGetZirconHandleInfoFUCHSIA>(std::string& strBuf, const VkSemaphoreGetZirconHandleInfoFUCHSIA& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceInvocationMaskFeaturesHUAWEI>(std::string& strBuf, const VkPhysicalDeviceInvocationMaskFeaturesHUAWEI& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMemoryGetRemoteAddressInfoNV>(std::string& strBuf, const VkMemoryGetRemoteAddressInfoNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExternalMemoryRDMAFeaturesNV>(std::string& strBuf, const VkPhysicalDeviceExternalMemoryRDMAFeaturesNV& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceExtendedDynamicState2FeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceExtendedDynamicState2FeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkScreenSurfaceCreateInfoQNX>(std::string& strBuf, const VkScreenSurfaceCreateInfoQNX& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceColorWriteEnableFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceColorWriteEnableFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPipelineColorWriteCreateInfoEXT>(std::string& strBuf, const VkPipelineColorWriteCreateInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceGlobalPriorityQueryFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceGlobalPriorityQueryFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkQueueFamilyGlobalPriorityPropertiesEXT>(std::string& strBuf, const VkQueueFamilyGlobalPriorityPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMultiDrawFeaturesEXT>(std::string& strBuf, const VkPhysicalDeviceMultiDrawFeaturesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceMultiDrawPropertiesEXT>(std::string& strBuf, const VkPhysicalDeviceMultiDrawPropertiesEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMultiDrawInfoEXT>(std::string& strBuf, const VkMultiDrawInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkMultiDrawIndexedInfoEXT>(std::string& strBuf, const VkMultiDrawIndexedInfoEXT& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureBuildRangeInfoKHR>(std::string& strBuf, const VkAccelerationStructureBuildRangeInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureGeometryTrianglesDataKHR>(std::string& strBuf, const VkAccelerationStructureGeometryTrianglesDataKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureGeometryAabbsDataKHR>(std::string& strBuf, const VkAccelerationStructureGeometryAabbsDataKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureGeometryInstancesDataKHR>(std::string& strBuf, const VkAccelerationStructureGeometryInstancesDataKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureBuildGeometryInfoKHR>(std::string& strBuf, const VkAccelerationStructureBuildGeometryInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureCreateInfoKHR>(std::string& strBuf, const VkAccelerationStructureCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkWriteDescriptorSetAccelerationStructureKHR>(std::string& strBuf, const VkWriteDescriptorSetAccelerationStructureKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceAccelerationStructureFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceAccelerationStructureFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceAccelerationStructurePropertiesKHR>(std::string& strBuf, const VkPhysicalDeviceAccelerationStructurePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureDeviceAddressInfoKHR>(std::string& strBuf, const VkAccelerationStructureDeviceAddressInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureVersionInfoKHR>(std::string& strBuf, const VkAccelerationStructureVersionInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyAccelerationStructureToMemoryInfoKHR>(std::string& strBuf, const VkCopyAccelerationStructureToMemoryInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyMemoryToAccelerationStructureInfoKHR>(std::string& strBuf, const VkCopyMemoryToAccelerationStructureInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkCopyAccelerationStructureInfoKHR>(std::string& strBuf, const VkCopyAccelerationStructureInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkAccelerationStructureBuildSizesInfoKHR>(std::string& strBuf, const VkAccelerationStructureBuildSizesInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRayTracingShaderGroupCreateInfoKHR>(std::string& strBuf, const VkRayTracingShaderGroupCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRayTracingPipelineInterfaceCreateInfoKHR>(std::string& strBuf, const VkRayTracingPipelineInterfaceCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkRayTracingPipelineCreateInfoKHR>(std::string& strBuf, const VkRayTracingPipelineCreateInfoKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRayTracingPipelineFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceRayTracingPipelineFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRayTracingPipelinePropertiesKHR>(std::string& strBuf, const VkPhysicalDeviceRayTracingPipelinePropertiesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkStridedDeviceAddressRegionKHR>(std::string& strBuf, const VkStridedDeviceAddressRegionKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkTraceRaysIndirectCommandKHR>(std::string& strBuf, const VkTraceRaysIndirectCommandKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
+template <> void ToString<VkPhysicalDeviceRayQueryFeaturesKHR>(std::string& strBuf, const VkPhysicalDeviceRayQueryFeaturesKHR& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);
 GFXRECON_END_NAMESPACE(util)
 GFXRECON_END_NAMESPACE(gfxrecon)
 
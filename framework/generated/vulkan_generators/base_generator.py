@@ -39,10 +39,12 @@
 # limitations under the License.
 
 import os, re, sys, json
+from contextlib import contextmanager
 from generator import (
     GeneratorOptions, OutputGenerator, noneStr, regSortFeatures, write
 )
 from vkconventions import VulkanConventions
+from registry_cache import getRegistryIndex
 
 
 # Turn a list of strings into a regexp string matching exactly those strings.
@@ -122,6 +124,104 @@ class ValueInfo():
         self.isDynamic = True if not arrayCapacity else False
 
 
+# ValueDecl - Class to store the parameter/struct member declaration parsed from the XML registry,
+# before any generator specific type substitutions have been applied.
+#
+# Members:
+#   name - Parameter/struct member name of the value.
+#   baseType - Undecorated typename of the value.
+#   fullType - Fully qualified typename of the value.
+#   arrayLength - The expression that specifies the number of elements in an array, or None if the value is not an array.
+#   arrayCapacity - The max size of a statically allocated array, or None for a dynamically allocated array.
+#   bitfieldWidth - The bitfield width declaration for the value, or None if the value is not a bitfield.
+#   arrayLengthTokens - Set of the identifiers and numbers in the array length expression.
+class ValueDecl():
+    """Contains the Vulkan API call parameter and struct member declarations from the XML registry"""
+
+    def __init__(
+        self,
+        name,
+        baseType,
+        fullType,
+        arrayLength=None,
+        arrayCapacity=None,
+        bitfieldWidth=None
+    ):
+        self.name = name
+        self.baseType = baseType
+        self.fullType = fullType
+        self.arrayLength = arrayLength
+        self.arrayCapacity = arrayCapacity
+        self.bitfieldWidth = bitfieldWidth
+
+        self.arrayLengthTokens = frozenset(
+            re.findall(r'\w+', arrayLength)
+        ) if arrayLength else None
+
+
+# CodeEmitter - Buffered writer for generated C++ code.
+#
+# Code fragments are collected in a list and written to the output file in large chunks,
+# instead of building each function with repeated string concatenation and writing it
+# separately. The emitter is file-like, so it can also be used as the file argument of write().
+#
+# Members:
+#   outFile - The file that buffered fragments are written to.
+#   indentSize - Number of spaces added for each indentation level.
+#   flushSize - Number of buffered characters that triggers a write to the output file.
+class CodeEmitter():
+    """Buffers generated C++ code and writes it to the output file in large chunks"""
+
+    def __init__(self, outFile, indentSize, flushSize=65536):
+        self.outFile = outFile
+        self.indentSize = indentSize
+        self.flushSize = flushSize
+        self.indentText = ''
+        self.fragments = []
+        self.size = 0
+
+    #
+    # Append text to the buffer, as is.
+    def write(self, text):
+        self.fragments.append(text)
+        self.size += len(text)
+        if self.size >= self.flushSize:
+            self.flush()
+
+    #
+    # Append a line of text at the current indentation level. Empty lines are not indented.
+    def line(self, text=''):
+        if text:
+            self.write(self.indentText + text + '\n')
+        else:
+            self.write('\n')
+
+    #
+    # Append a list of lines at the current indentation level.
+    def lines(self, lines):
+        for text in lines:
+            self.line(text)
+
+    #
+    # Increase the indentation level for the lines appended in a with statement.
+    @contextmanager
+    def indent(self, levels=1):
+        previous = self.indentText
+        self.indentText += ' ' * (self.indentSize * levels)
+        try:
+            yield
+        finally:
+            self.indentText = previous
+
+    #
+    # Write the buffered text to the output file.
+    def flush(self):
+        if self.fragments:
+            self.outFile.write(''.join(self.fragments))
+            self.fragments = []
+            self.size = 0
+
+
 # BaseGeneratorOptions - subclass of GeneratorOptions.
 #
 # Adds options used by FrameworkGenerator objects during C++ language
@@ -271,6 +371,25 @@ class BaseGenerator(OutputGenerator):
         'VkDescriptorUpdateTemplateKHR', 'VkSamplerYcbcrConversionKHR'
     ]
 
+    # Encoded sizes of the scalar types that are written to the capture file with the same representation as their
+    # in-memory values, keyed by the type name returned by makeInvocationTypeName.
+    TRIVIAL_VALUE_SIZES = {
+        'UInt8': 1,
+        'UInt16': 2,
+        'Int32': 4,
+        'UInt32': 4,
+        'Int64': 8,
+        'UInt64': 8,
+        'Float': 4,
+        'VkBool32': 4,
+        'VkSampleMask': 4,
+        'VkDeviceSize': 8,
+        'VkDeviceAddress': 8,
+        'Enum': 4,
+        'Flags': 4,
+        'Flags64': 8
+    }
+
     # Default C++ code indentation size.
     INDENT_SIZE = 4
 
@@ -285,6 +404,13 @@ class BaseGenerator(OutputGenerator):
     ):
         OutputGenerator.__init__(self, errFile, warnFile, diagFile)
 
+        # Per-instance copies of the lists that are extended with the contents of the JSON
+        # configuration files, so that generators running in the same process do not share them.
+        self.APICALL_BLACKLIST = list(self.APICALL_BLACKLIST)
+        self.STRUCT_BLACKLIST = list(self.STRUCT_BLACKLIST)
+        self.PLATFORM_TYPES = dict(self.PLATFORM_TYPES)
+        self.PLATFORM_STRUCTS = list(self.PLATFORM_STRUCTS)
+
         # Typenames
         self.structNames = set()  # Set of Vulkan struct typenames
         self.handleNames = set()  # Set of Vulkan handle typenames
@@ -299,16 +425,20 @@ class BaseGenerator(OutputGenerator):
         self.processStructs = processStructs  # Populate the featureStructMembers map
         self.featureBreak = featureBreak  # Insert a line break between features
 
+        # Optional TimingReport recording the time spent generating the target
+        self.timingReport = None
+
+        # CodeEmitter buffering the output file, from beginFile to endFile
+        self.emitter = None
+
         # Command parameter and struct member data for the current feature
         if self.processStructs:
             self.featureStructMembers = dict(
             )  # Map of struct names to lists of per-member ValueInfo
             self.featureStructAliases = dict(
             )  # Map of struct names to aliases
-            self.extensionStructsWithHandles = dict(
-            )  # Map of extension struct names to a Boolean value indicating that a struct member has a handle type
-            self.extensionStructsWithHandlePtrs = dict(
-            )  # Map of extension struct names to a Boolean value indicating that a struct member with a handle type is a pointer
+            self.checkedExtensionStructs = set(
+            )  # Set of extension struct names that have been checked by checkStructPNextHandles
         if self.processCmds:
             self.featureCmdParams = dict(
             )  # Map of cmd names to lists of per-parameter ValueInfo
@@ -329,6 +459,13 @@ class BaseGenerator(OutputGenerator):
     def beginFile(self, genOpts):
         OutputGenerator.beginFile(self, genOpts)
 
+        if self.timingReport:
+            self.outFile = self.timingReport.beginOutput(self.outFile)
+
+        # All output, including the text written with write(), goes through the emitter
+        self.emitter = CodeEmitter(self.outFile, self.INDENT_SIZE)
+        self.outFile = self.emitter
+
         if genOpts.blacklists:
             self.__loadBlacklists(genOpts.blacklists)
         if genOpts.platformTypes:
@@ -359,8 +496,17 @@ class BaseGenerator(OutputGenerator):
             self.newline()
             write('#endif', file=self.outFile)
 
+        self.emitter.flush()
+        self.outFile = self.emitter.outFile
+        self.emitter = None
+
         # Finish processing in superclass
-        OutputGenerator.endFile(self)
+        if self.timingReport:
+            self.outFile = self.timingReport.endOutput()
+            with self.timingReport.phase('file_close'):
+                OutputGenerator.endFile(self)
+        else:
+            OutputGenerator.endFile(self)
 
     # Method override
     def beginFeature(self, interface, emit):
@@ -388,7 +534,12 @@ class BaseGenerator(OutputGenerator):
             if (self.featureExtraProtect is not None):
                 write('#ifdef', self.featureExtraProtect, file=self.outFile)
 
-            self.generateFeature()
+            if self.timingReport:
+                self.timingReport.beginFeature()
+                self.generateFeature()
+                self.timingReport.endFeature()
+            else:
+                self.generateFeature()
 
             if (self.featureExtraProtect is not None):
                 write(
@@ -499,17 +650,13 @@ class BaseGenerator(OutputGenerator):
     #  params - list of <param> or <member> tags to process
     def makeValueInfo(self, params):
         values = []
+        decls = []
         for param in params:
-            # Get name
-            elem = param.find('name')
-            name = noneStr(elem.text)
-            nameTail = noneStr(elem.tail)
+            decl = self.getValueDecl(param, params)
+            decls.append(decl)
 
-            # Get type info
-            elem = param.find('type')
-            baseType = noneStr(elem.text)
-            fullType = (noneStr(param.text) + baseType
-                        + noneStr(elem.tail)).strip()
+            baseType = decl.baseType
+            fullType = decl.fullType
 
             # Check for platform specific type definitions that need to be converted to a recognized trace format type.
             platformBaseType = None
@@ -521,47 +668,86 @@ class BaseGenerator(OutputGenerator):
                 fullType = fullType.replace(baseType, typeInfo['replaceWith'])
                 baseType = typeInfo['baseType']
 
-            # Get array length, always use altlen when available to avoid parsing latexmath
-            if 'altlen' in param.attrib:
-                arrayLength = param.attrib.get('altlen')
-            else:
-                arrayLength = self.getArrayLen(param)
-
-            arrayCapacity = None
-            if self.isStaticArray(param):
-                arrayCapacity = arrayLength
-                arrayLength = self.getStaticArrayLen(
-                    name, params, arrayCapacity
-                )
-
-            # Get bitfield width
-            bitfieldWidth = None
-            if ':' in nameTail:
-                bitfieldWidth = nameTail
-
             values.append(
                 ValueInfo(
-                    name=name,
+                    name=decl.name,
                     baseType=baseType,
                     fullType=fullType,
                     pointerCount=self.getPointerCount(fullType),
-                    arrayLength=arrayLength,
-                    arrayCapacity=arrayCapacity,
+                    arrayLength=decl.arrayLength,
+                    arrayCapacity=decl.arrayCapacity,
                     platformBaseType=platformBaseType,
                     platformFullType=platformFullType,
-                    bitfieldWidth=bitfieldWidth
+                    bitfieldWidth=decl.bitfieldWidth
                 )
             )
 
-        # Link array values to their corresponding length values
-        for arrayValue in [v for v in values if v.arrayLength]:
-            for v in values:
-                if re.search(r'\b{}\b'.format(v.name), arrayValue.arrayLength):
-                    arrayValue.arrayLengthValue = v
-                    break
+        # Link array values to their corresponding length values, which are the first
+        # values with a name matching one of the identifiers in the length expression
+        for arrayValue, decl in zip(values, decls):
+            if decl.arrayLengthTokens:
+                for v in values:
+                    if v.name in decl.arrayLengthTokens:
+                        arrayValue.arrayLengthValue = v
+                        break
 
         return values
 
+    #
+    # Retrieve the ValueDecl for a <param> or <member> tag.  The declaration does not depend
+    # on the generator, so it is parsed once and cached with the registry, where it can be
+    # shared by all of the generators that process the same tag.
+    #  param - <param> or <member> tag to process
+    #  params - list of <param> or <member> tags, from the same command or struct as param
+    def getValueDecl(self, param, params):
+        cache = getRegistryIndex(self.registry).valueDecls
+        decl = cache.get(param)
+        if decl is None:
+            decl = self.makeValueDecl(param, params)
+            cache[param] = decl
+        return decl
+
+    #
+    # Parse a <param> or <member> tag into a ValueDecl object
+    #  param - <param> or <member> tag to process
+    #  params - list of <param> or <member> tags, from the same command or struct as param
+    def makeValueDecl(self, param, params):
+        # Get name
+        elem = param.find('name')
+        name = noneStr(elem.text)
+        nameTail = noneStr(elem.tail)
+
+        # Get type info
+        elem = param.find('type')
+        baseType = noneStr(elem.text)
+        fullType = (noneStr(param.text) + baseType
+                    + noneStr(elem.tail)).strip()
+
+        # Get array length, always use altlen when available to avoid parsing latexmath
+        if 'altlen' in param.attrib:
+            arrayLength = param.attrib.get('altlen')
+        else:
+            arrayLength = self.getArrayLen(param)
+
+        arrayCapacity = None
+        if self.isStaticArray(param):
+            arrayCapacity = arrayLength
+            arrayLength = self.getStaticArrayLen(name, params, arrayCapacity)
+
+        # Get bitfield width
+        bitfieldWidth = None
+        if ':' in nameTail:
+            bitfieldWidth = nameTail
+
+        return ValueDecl(
+            name=name,
+            baseType=baseType,
+            fullType=fullType,
+            arrayLength=arrayLength,
+            arrayCapacity=arrayCapacity,
+            bitfieldWidth=bitfieldWidth
+        )
+
     #
     # Check for struct type
     def isStruct(self, baseType):
@@ -723,63 +909,53 @@ class BaseGenerator(OutputGenerator):
             if not self.isCmdBlackListed(key)
         ]
 
+    #
+    # Determines if a struct is encoded as a sequence of scalar values with the same representation as the struct's
+    # in-memory layout, allowing it to be encoded and decoded as a single block of memory.  This excludes structs with
+    # pointers, arrays, handles, and bit fields.  Nested struct members are only allowed when their encoded size is
+    # listed in structSizes.  Returns the encoded size of the struct, or None if the struct does not qualify.  The
+    # encoded size only matches the size of the struct when the struct has no padding, which must be checked by the
+    # generated code.
+    def getTrivialStructSize(self, typename, values, structSizes=None):
+        size = 0
+        for value in values:
+            if (
+                value.isPointer or value.isArray or value.bitfieldWidth
+                or self.isGenericStructHandleValue(typename, value.name)
+            ):
+                return None
+
+            if self.isStruct(value.baseType):
+                valueSize = structSizes.get(value.baseType) if structSizes else None
+            else:
+                valueSize = self.TRIVIAL_VALUE_SIZES.get(
+                    self.makeInvocationTypeName(value.baseType)
+                )
+            if not valueSize:
+                return None
+            size += valueSize
+        return size
+
     #
     # Determines if the specified struct type can reference pNext extension structs that contain handles.
+    # The handle members of each extension struct are found once for the registry, which is shared by all
+    # generators.  A handle pointer is only reported for an extension struct that was checked by a previous
+    # call, which matches the results of the per-generator cache that was previously used for the check.
     def checkStructPNextHandles(self, typename):
+        index = getRegistryIndex(self.registry)
         foundHandles = False
         foundHandlePtrs = False
-        validExtensionStructs = self.registry.validextensionstructs.get(
-            typename
-        )
-        if validExtensionStructs:
-            # Need to search the XML tree for pNext structures that have not been processed yet.
-            for structName in validExtensionStructs:
-                # Check for cached results from a previous check for this struct
-                if structName in self.extensionStructsWithHandles:
-                    if self.extensionStructsWithHandles[structName]:
-                        foundHandles = True
-                    if self.extensionStructsWithHandlePtrs[structName]:
-                        foundHandlePtrs = True
-                else:
-                    # If a pre-existing result was not found, check the XML registry for the struct
-                    hasHandles = False
-                    hasHandlePtrs = False
-                    typeInfo = self.registry.lookupElementInfo(
-                        structName, self.registry.typedict
-                    )
-                    if typeInfo:
-                        memberInfos = [
-                            member for member in
-                            typeInfo.elem.findall('.//member/type')
-                        ]
-                        if memberInfos:
-                            for memberInfo in memberInfos:
-                                found = self.registry.tree.find(
-                                    "types/type/[name='" + memberInfo.text
-                                    + "'][@category='handle']"
-                                )
-                                if found:
-                                    hasHandles = True
-                                    self.extensionStructsWithHandles[structName
-                                                                     ] = True
-                                    if memberInfo.tail and (
-                                        '*' in memberInfo.tail
-                                    ):
-                                        self.extensionStructsWithHandlePtrs[
-                                            structName] = True
-                                        hasHandlePtrs = True
-                                    else:
-                                        self.extensionStructsWithHandlePtrs[
-                                            structName] = False
-
-                    if hasHandles:
-                        foundHandles = True
-                        if hasHandlePtrs:
-                            fountHandlePtrs = True
-                    else:
-                        self.extensionStructsWithHandles[structName] = False
-                        self.extensionStructsWithHandlePtrs[structName] = False
-
+        for structName in index.extensionStructs.get(typename, []):
+            hasHandles, lastHandleIsPtr = index.structHandles.get(
+                structName, (False, False)
+            )
+            if hasHandles:
+                foundHandles = True
+                if lastHandleIsPtr and (
+                    structName in self.checkedExtensionStructs
+                ):
+                    foundHandlePtrs = True
+            self.checkedExtensionStructs.add(structName)
         return foundHandles, foundHandlePtrs
 
     #
@@ -26,7 +26,7 @@ from base_generator import *
 
 
 # Eliminates JSON blackLists and platformTypes files, which are not necessary for
-# pNext switch statement generation.
+# pNext decode table generation.
 class DecodePNextStructGeneratorOptions(BaseGeneratorOptions):
     """Options for Vulkan API pNext structure decoding C++ code generation"""
 
@@ -73,6 +73,7 @@ class DecodePNextStructGenerator(BaseGenerator):
         write('#include "decode/custom_vulkan_struct_decoders.h"', file=self.outFile)
         write('#include "decode/decode_allocator.h"', file=self.outFile)
         write('#include "decode/pnext_node.h"', file=self.outFile)
+        write('#include "decode/pnext_struct_decode_table.h"', file=self.outFile)
         write('#include "decode/pnext_typed_node.h"', file=self.outFile)
         write('#include "generated/generated_vulkan_struct_decoders.h"', file=self.outFile)
         write('#include "util/logging.h"', file=self.outFile)
@@ -82,6 +83,26 @@ class DecodePNextStructGenerator(BaseGenerator):
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
         self.newline()
+        write('template <typename T>', file=self.outFile)
+        write('static PNextNode* AllocatePNextNode()', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    return DecodeAllocator::Allocate<PNextTypedNode<T>>();', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('static constexpr PNextStructDecodeInfo kPNextStructDecodeInfos[] = {', file=self.outFile)
+    # yapf: enable
+
+    # Method override
+    # yapf: disable
+    def endFile(self):
+        write('};', file=self.outFile)
+        self.newline()
+        write('PNextStructDecodeTable& GetPNextStructDecodeTable()', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    static PNextStructDecodeTable table(kPNextStructDecodeInfos);', file=self.outFile)
+        write('    return table;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
         write('size_t DecodePNextStruct(const uint8_t* parameter_buffer, size_t buffer_size,  PNextNode** pNext)', file=self.outFile)
         write('{', file=self.outFile)
         write('    assert(pNext != nullptr);', file=self.outFile)
@@ -111,17 +132,17 @@ class DecodePNextStructGenerator(BaseGenerator):
         write('        {', file=self.outFile)
         write('            const VkStructureType* sType = reinterpret_cast<const VkStructureType*>(parameter_buffer + stype_offset);', file=self.outFile)
         self.newline()
-        write('            switch (*sType)', file=self.outFile)
+        write('            const PNextStructDecodeInfo* decode_info = GetPNextStructDecodeTable().Find(*sType);', file=self.outFile)
+        self.newline()
+        write('            if (decode_info != nullptr)', file=self.outFile)
+        write('            {', file=self.outFile)
+        write('                (*pNext) = decode_info->allocate();', file=self.outFile)
+        write('                bytes_read = (*pNext)->Decode(parameter_buffer, buffer_size);', file=self.outFile)
+        write('            }', file=self.outFile)
+        write('            else', file=self.outFile)
         write('            {', file=self.outFile)
-        write('            default:', file=self.outFile)
         write('                // TODO: This may need to be a fatal error', file=self.outFile)
         write('                GFXRECON_LOG_ERROR("Failed to decode pNext value with unrecognized VkStructurType = %d", (*sType));', file=self.outFile)
-        write('                break;', file=self.outFile)
-    # yapf: enable
-
-    # Method override
-    # yapf: disable
-    def endFile(self):
         write('            }', file=self.outFile)
         write('        }', file=self.outFile)
         write('    }', file=self.outFile)
@@ -165,9 +186,6 @@ class DecodePNextStructGenerator(BaseGenerator):
     # yapf: disable
     def generateFeature(self):
         for struct in self.sTypeValues:
-            write('            case {}:'.format(self.sTypeValues[struct]), file=self.outFile)
-            write('                (*pNext) = DecodeAllocator::Allocate<PNextTypedNode<Decoded_{}>>();'.format(struct), file=self.outFile)
-            write('                bytes_read = (*pNext)->Decode(parameter_buffer, buffer_size);'.format(struct), file=self.outFile)
-            write('                break;', file=self.outFile)
+            write('    {{ {}, AllocatePNextNode<Decoded_{}> }},'.format(self.sTypeValues[struct], struct), file=self.outFile)
         self.sTypeValues = dict()
     # yapf: enable
@@ -26,7 +26,7 @@ from base_generator import *
 
 
 # Eliminates JSON blackLists and platformTypes files, which are not necessary for
-# pNext switch statement generation.
+# pNext encode table generation.
 class EncodePNextStructGeneratorOptions(BaseGeneratorOptions):
     """Options for Vulkan API pNext structure encoding C++ code generation"""
 
@@ -73,6 +73,7 @@ class EncodePNextStructGenerator(BaseGenerator):
         write('#include "generated/generated_vulkan_struct_encoders.h"', file=self.outFile)
         self.newline()
         write('#include "encode/parameter_encoder.h"', file=self.outFile)
+        write('#include "encode/pnext_struct_encode_table.h"', file=self.outFile)
         write('#include "encode/struct_pointer_encoder.h"', file=self.outFile)
         write('#include "encode/trace_manager.h"', file=self.outFile)
         write('#include "util/defines.h"', file=self.outFile)
@@ -81,51 +82,67 @@ class EncodePNextStructGenerator(BaseGenerator):
         self.newline()
         write('#include <cassert>', file=self.outFile)
         write('#include <cstdio>', file=self.outFile)
-        write('#include <memory>', file=self.outFile)
         self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(encode)', file=self.outFile)
         self.newline()
+        write('template <typename T>', file=self.outFile)
+        write('static void EncodePNextStructPtr(ParameterEncoder* encoder, const void* value)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    EncodeStructPtr(encoder, reinterpret_cast<const T*>(value));', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
+        write('static constexpr PNextStructEncodeInfo kPNextStructEncodeInfos[] = {', file=self.outFile)
+        write('    // Ignore the structures added to the pnext chain by the loader.', file=self.outFile)
+        write('    { VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO, nullptr },', file=self.outFile)
+        write('    { VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO, nullptr },', file=self.outFile)
+    # yapf: enable
+
+    # Method override
+    # yapf: disable
+    def endFile(self):
+        write('};', file=self.outFile)
+        self.newline()
+        write('PNextStructEncodeTable& GetPNextStructEncodeTable()', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    static PNextStructEncodeTable table(kPNextStructEncodeInfos);', file=self.outFile)
+        write('    return table;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
         write('void EncodePNextStruct(ParameterEncoder* encoder, const void* value)', file=self.outFile)
         write('{', file=self.outFile)
         write('    assert(encoder != nullptr);', file=self.outFile)
         self.newline()
-        write('    auto base = reinterpret_cast<const VkBaseInStructure*>(value);', file=self.outFile)
+        write('    PNextStructEncodeTable& encode_table = GetPNextStructEncodeTable();', file=self.outFile)
+        write('    auto                    base         = reinterpret_cast<const VkBaseInStructure*>(value);', file=self.outFile)
         self.newline()
-        write('    // Ignore the structures added to the pnext chain by the loader.', file=self.outFile)
-        write('    while ((base != nullptr) && ((base->sType == VK_STRUCTURE_TYPE_LOADER_INSTANCE_CREATE_INFO) ||', file=self.outFile)
-        write('                                 (base->sType == VK_STRUCTURE_TYPE_LOADER_DEVICE_CREATE_INFO)))', file=self.outFile)
+        write('    while (base != nullptr)', file=self.outFile)
         write('    {', file=self.outFile)
-        write('        base = base->pNext;', file=self.outFile)
-        write('    }', file=self.outFile)
+        write('        const PNextStructEncodeInfo* encode_info = encode_table.Find(base->sType);', file=self.outFile)
         self.newline()
-        write('    if (base != nullptr)', file=self.outFile)
-        write('    {', file=self.outFile)
-        write('        switch (base->sType)', file=self.outFile)
+        write('        if (encode_info == nullptr)', file=self.outFile)
         write('        {', file=self.outFile)
-        write('        default:', file=self.outFile)
+        write('            // pNext is unrecognized.  Write warning message to indicate it will be omitted from the capture and check to see if it points to a recognized value.', file=self.outFile)
+        write('            // The warning is only written the first time that the structure type is encountered.', file=self.outFile)
+        write('            if (encode_table.MarkUnrecognized(base->sType))', file=self.outFile)
         write('            {', file=self.outFile)
-        write('                // pNext is unrecognized.  Write warning message to indicate it will be omitted from the capture and check to see if it points to a recognized value.', file=self.outFile)
-        write('                int32_t message_size = std::snprintf(nullptr, 0, "A pNext value with unrecognized VkStructureType = %d was omitted from the capture file, which may cause replay to fail.", base->sType);', file=self.outFile)
-        write('                std::unique_ptr<char[]> message = std::make_unique<char[]>(message_size + 1); // Add 1 for null-terminator.', file=self.outFile)
-        write('                std::snprintf(message.get(), (message_size + 1), "A pNext value with unrecognized VkStructureType = %d was omitted from the capture file, which may cause replay to fail.", base->sType);', file=self.outFile)
-        write('                TraceManager::Get()->WriteDisplayMessageCmd(message.get());', file=self.outFile)
-        write('                GFXRECON_LOG_WARNING("%s", message.get());', file=self.outFile)
-        write('                EncodePNextStruct(encoder, base->pNext);', file=self.outFile)
+        write('                char message[256];', file=self.outFile)
+        write('                std::snprintf(message, sizeof(message), "A pNext value with unrecognized VkStructureType = %d was omitted from the capture file, which may cause replay to fail.", base->sType);', file=self.outFile)
+        write('                TraceManager::Get()->WriteDisplayMessageCmd(message);', file=self.outFile)
+        write('                GFXRECON_LOG_WARNING("%s", message);', file=self.outFile)
         write('            }', file=self.outFile)
-        write('            break;', file=self.outFile)
-    # yapf: enable
-
-    # Method override
-    # yapf: disable
-    def endFile(self):
         write('        }', file=self.outFile)
+        write('        else if (encode_info->encode != nullptr)', file=self.outFile)
+        write('        {', file=self.outFile)
+        write('            encode_info->encode(encoder, base);', file=self.outFile)
+        write('            return;', file=self.outFile)
+        write('        }', file=self.outFile)
+        self.newline()
+        write('        base = base->pNext;', file=self.outFile)
         write('    }', file=self.outFile)
-        write('    else', file=self.outFile)
-        write('    {', file=self.outFile)
-        write('        // pNext was either NULL or an ignored loader specific struct.  Write an encoding for a NULL pointer.', file=self.outFile)
-        write('        encoder->EncodeStructPtrPreamble(nullptr);', file=self.outFile)
-        write('    }', file=self.outFile)
+        self.newline()
+        write('    // pNext was either NULL or only contained unrecognized and ignored loader specific structs.  Write an encoding for a NULL pointer.', file=self.outFile)
+        write('    encoder->EncodeStructPtrPreamble(nullptr);', file=self.outFile)
         write('}', file=self.outFile)
         self.newline()
         write('GFXRECON_END_NAMESPACE(encode)', file=self.outFile)
@@ -157,8 +174,6 @@ class EncodePNextStructGenerator(BaseGenerator):
     # yapf: disable
     def generateFeature(self):
         for struct in self.sTypeValues:
-            write('        case {}:'.format(self.sTypeValues[struct]), file=self.outFile)
-            write('            EncodeStructPtr(encoder, reinterpret_cast<const {}*>(base));'.format(struct), file=self.outFile)
-            write('            break;', file=self.outFile)
+            write('    {{ {}, EncodePNextStructPtr<{}> }},'.format(self.sTypeValues[struct], struct), file=self.outFile)
         self.sTypeValues = dict()
     # yapf: enable
@@ -38,9 +38,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import argparse, cProfile, pdb, os, string, sys, time
+import argparse, cProfile, contextlib, glob, inspect, json, pdb, os, pstats, string, sys, time
 from reg import *
 from generator import write
+from registry_cache import getRegistryCacheFile, loadRegistryCache, saveRegistryCache
+from timing_report import HOTSPOT_COUNT, TimingReport
 
 # API Call Decoders
 from vulkan_decoder_body_generator import VulkanDecoderBodyGenerator, VulkanDecoderBodyGeneratorOptions
@@ -60,6 +62,8 @@ from vulkan_referenced_resource_consumer_header_generator import VulkanReference
 from vulkan_referenced_resource_consumer_body_generator import VulkanReferencedResourceBodyGenerator, VulkanReferencedResourceBodyGeneratorOptions
 from vulkan_struct_handle_mappers_header_generator import VulkanStructHandleMappersHeaderGenerator, VulkanStructHandleMappersHeaderGeneratorOptions
 from vulkan_struct_handle_mappers_body_generator import VulkanStructHandleMappersBodyGenerator, VulkanStructHandleMappersBodyGeneratorOptions
+from vulkan_handle_id_consumer_header_generator import VulkanHandleIdConsumerHeaderGenerator, VulkanHandleIdConsumerHeaderGeneratorOptions
+from vulkan_handle_id_consumer_body_generator import VulkanHandleIdConsumerBodyGenerator, VulkanHandleIdConsumerBodyGeneratorOptions
 from vulkan_feature_util_body_generator import VulkanFeatureUtilBodyGenerator, VulkanFeatureUtilBodyGeneratorOptions
 
 # API Call Encoders
@@ -90,6 +94,10 @@ from vulkan_state_table_header_generator import VulkanStateTableHeaderGenerator,
 # Simple timer functions
 startTime = None
 
+# Error/warning and diagnostic files, replaced when run as a script
+errWarn = sys.stderr
+diag = None
+
 
 def startTimer(timeit):
     global startTime
@@ -105,6 +113,15 @@ def endTimer(timeit, msg):
         startTime = None
 
 
+# Return a context manager that records the time spent in a block of code for
+# the named phase of the generator's timing report, if it has one.
+def timePhase(gen, name):
+    timingReport = getattr(gen, 'timingReport', None)
+    if timingReport:
+        return timingReport.phase(name)
+    return contextlib.nullcontext()
+
+
 # JSON files for customizing code generation
 defaultBlacklists = 'blacklists.json'
 defaultPlatformTypes = 'platform_types.json'
@@ -379,6 +396,30 @@ def makeGenOpts(args):
         )
     ]
 
+    genOpts['generated_vulkan_handle_id_consumer.h'] = [
+        VulkanHandleIdConsumerHeaderGenerator,
+        VulkanHandleIdConsumerHeaderGeneratorOptions(
+            filename='generated_vulkan_handle_id_consumer.h',
+            directory=directory,
+            blacklists=blacklists,
+            prefixText=prefixStrings + vkPrefixStrings,
+            protectFile=True,
+            protectFeature=False
+        )
+    ]
+
+    genOpts['generated_vulkan_handle_id_consumer.cpp'] = [
+        VulkanHandleIdConsumerBodyGenerator,
+        VulkanHandleIdConsumerBodyGeneratorOptions(
+            filename='generated_vulkan_handle_id_consumer.cpp',
+            directory=directory,
+            blacklists=blacklists,
+            prefixText=prefixStrings + vkPrefixStrings,
+            protectFile=False,
+            protectFeature=False
+        )
+    ]
+
     genOpts['generated_vulkan_feature_util.cpp'] = [
         VulkanFeatureUtilBodyGenerator,
         VulkanFeatureUtilBodyGeneratorOptions(
@@ -654,6 +695,8 @@ def genTarget(args):
             # yapf: enable
 
         gen = createGenerator(errFile=errWarn, warnFile=errWarn, diagFile=diag)
+        if args.timingReport:
+            gen.timingReport = TimingReport(args.target)
 
         return (gen, options)
     else:
@@ -665,11 +708,144 @@ def genTarget(args):
         return None
 
 
-# -feature name
-# -extension name
-# For both, "name" may be a single name, or a space-separated list
-# of names, or a regular expression.
-if __name__ == '__main__':
+# Return the list of files that the output of a target is generated from: the
+# registry, the Python modules of the generator directory, the registry Python
+# modules defining the generator base classes, and the JSON configuration files
+# referenced by the options. Every module of the generator directory is an
+# input, as the generators also depend on helper modules that are not part of
+# their class hierarchy. Returns None for an unknown target.
+def getTargetInputs(args):
+    makeGenOpts(args)
+
+    if args.target not in genOpts:
+        return None
+
+    createGenerator = genOpts[args.target][0]
+    options = genOpts[args.target][1]
+
+    classes = [Registry]
+    classes += inspect.getmro(createGenerator)
+    classes += inspect.getmro(type(options))
+    classes += inspect.getmro(type(options.conventions))
+
+    generatorDir = os.path.dirname(os.path.abspath(__file__))
+
+    inputs = [args.registry]
+    inputs += sorted(glob.glob(os.path.join(generatorDir, '*.py')))
+    for cls in classes:
+        module = sys.modules.get(cls.__module__)
+        if module and hasattr(module, '__file__'):
+            inputs.append(module.__file__)
+
+    for config in [
+        'blacklists', 'platformTypes', 'replayOverrides', 'captureOverrides'
+    ]:
+        filename = getattr(options, config, None)
+        if filename:
+            inputs.append(filename)
+
+    result = []
+    for filename in inputs:
+        filename = os.path.normpath(os.path.abspath(filename))
+        if filename not in result:
+            result.append(filename)
+    return result
+
+
+# Create a Registry object for the generator and parse the XML registry file.
+# The returned Registry object can be reused to generate additional targets
+# with bindRegistry, avoiding the cost of parsing the XML for each target.
+# When a registry cache directory is specified, the parsed registry is loaded
+# from the cache if available, and written to the cache otherwise.
+def loadRegistry(args, gen, options):
+    with timePhase(gen, 'registry_load'):
+        reg = parseRegistry(args, gen, options)
+
+    if (args.validate):
+        reg.validateGroups()
+
+    return reg
+
+
+# Create a Registry object and populate it from the registry cache or XML file.
+def parseRegistry(args, gen, options):
+    reg = Registry(gen, options)
+
+    cacheFile = None
+    if args.registryCache:
+        cacheFile = getRegistryCacheFile(args.registryCache, args.registry)
+
+        startTimer(args.time)
+        loaded = loadRegistryCache(cacheFile, reg)
+        endTimer(args.time, '* Time to load registry cache =')
+
+        if loaded:
+            return reg
+
+    startTimer(args.time)
+    tree = etree.parse(args.registry)
+    endTimer(args.time, '* Time to make ElementTree =')
+
+    startTimer(args.time)
+    reg.loadElementTree(tree)
+    endTimer(args.time, '* Time to parse ElementTree =')
+
+    if cacheFile:
+        startTimer(args.time)
+        if not saveRegistryCache(cacheFile, reg):
+            write(
+                '* Failed to write registry cache',
+                cacheFile,
+                file=sys.stderr
+            )
+        endTimer(args.time, '* Time to write registry cache =')
+
+    return reg
+
+
+# Attach a new generator and its options to a previously loaded Registry
+# object, mirroring the setup performed by the Registry constructor.
+def bindRegistry(reg, gen, options):
+    reg.gen = gen
+    reg.genOpts = options
+    gen.registry = reg
+    gen.genOpts = options
+    options.registry = reg
+
+
+# Generate code for a registry and generator that have been bound together.
+def genRegistry(args, reg, options):
+    if (args.dump):
+        write('* Dumping registry to regdump.txt', file=sys.stderr)
+        reg.dumpReg(filehandle=open('regdump.txt', 'w', encoding='utf-8'))
+
+    if (args.debug):
+        pdb.run('reg.apiGen()', globals(), {'reg': reg})
+    else:
+        profile = cProfile.Profile() if args.profile else None
+
+        startTimer(args.time)
+        with timePhase(reg.gen, 'generate'):
+            if profile:
+                profile.runcall(reg.apiGen)
+            else:
+                reg.apiGen()
+        endTimer(args.time, '* Time to generate ' + options.filename + ' =')
+
+        if profile:
+            timingReport = getattr(reg.gen, 'timingReport', None)
+            if timingReport:
+                timingReport.addProfile(profile)
+            else:
+                stats = pstats.Stats(profile, stream=sys.stderr)
+                stats.sort_stats('cumulative').print_stats(HOTSPOT_COUNT)
+
+    if not args.quiet:
+        write('* Generated', options.filename, file=sys.stderr)
+
+
+# Create the command line argument parser for the script.
+def makeArgParser():
     parser = argparse.ArgumentParser()
 
     parser.add_argument('-debug', action='store_true', help='Enable debugging')
@@ -703,7 +879,23 @@ if __name__ == '__main__':
         default='vk.xml',
         help='Use specified registry file instead of vk.xml'
     )
+    parser.add_argument(
+        '-registry-cache',
+        action='store',
+        dest='registryCache',
+        default=None,
+        help=
+        'Store the parsed registry in the specified directory and load it from there on later runs'
+    )
     parser.add_argument('-time', action='store_true', help='Enable timing')
+    parser.add_argument(
+        '-timing-report',
+        action='store',
+        dest='timingReport',
+        default=None,
+        help=
+        'Write a JSON report of the time spent in each phase of generation to the specified file; with -profile, the report includes the top cumulative cProfile entries'
+    )
     parser.add_argument(
         '-validate', action='store_true', help='Enable group validation'
     )
@@ -739,7 +931,15 @@ if __name__ == '__main__':
         'Specify directory containing JSON configuration files for generators'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+# -feature name
+# -extension name
+# For both, "name" may be a single name, or a space-separated list
+# of names, or a regular expression.
+if __name__ == '__main__':
+    args = makeArgParser().parse_args()
 
     # create error/warning & diagnostic files
     if (args.errfile):
@@ -754,29 +954,11 @@ if __name__ == '__main__':
 
     (gen, options) = genTarget(args)
 
-    reg = Registry(gen, options)
-
-    startTimer(args.time)
-    tree = etree.parse(args.registry)
-    endTimer(args.time, '* Time to make ElementTree =')
+    reg = loadRegistry(args, gen, options)
 
-    startTimer(args.time)
-    reg.loadElementTree(tree)
-    endTimer(args.time, '* Time to parse ElementTree =')
+    genRegistry(args, reg, options)
 
-    if (args.validate):
-        reg.validateGroups()
-
-    if (args.dump):
-        write('* Dumping registry to regdump.txt', file=sys.stderr)
-        reg.dumpReg(filehandle=open('regdump.txt', 'w', encoding='utf-8'))
-
-    if (args.debug):
-        pdb.run('reg.apiGen()')
-    else:
-        startTimer(args.time)
-        reg.apiGen()
-        endTimer(args.time, '* Time to generate ' + options.filename + ' =')
-
-    if not args.quiet:
-        write('* Generated', options.filename, file=sys.stderr)
+    if (args.timingReport):
+        with open(args.timingReport, 'w', encoding='utf-8') as f:
+            json.dump(gen.timingReport.toDict(), f, indent=4)
+            f.write('\n')
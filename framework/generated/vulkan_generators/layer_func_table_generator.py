@@ -75,6 +75,9 @@ class LayerFuncTableGenerator(BaseGenerator):
             'vkEnumerateDeviceExtensionProperties'
         ]
 
+        # Function table entries, which are written in order of name at the end of the file.
+        self.funcTableEntries = dict()
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
@@ -86,21 +89,46 @@ class LayerFuncTableGenerator(BaseGenerator):
         self.newline()
         write('#include "vulkan/vulkan.h"', file=self.outFile)
         self.newline()
-        write('#include <unordered_map>', file=self.outFile)
+        write('#include <algorithm>', file=self.outFile)
+        write('#include <cstring>', file=self.outFile)
+        write('#include <iterator>', file=self.outFile)
         self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         self.newline()
-        write('const std::unordered_map<std::string, PFN_vkVoidFunction> func_table = {', file=self.outFile)
+        write('struct LayerFuncTableEntry', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    const char*        name;', file=self.outFile)
+        write('    PFN_vkVoidFunction func;', file=self.outFile)
+        write('};', file=self.outFile)
+        self.newline()
     # yapf: enable
 
     # Method override
+    # yapf: disable
     def endFile(self):
+        # The table is a constant initialized array that is sorted by name, so that it does not need to be constructed
+        # when the layer is loaded, and lookups do not allocate memory.
+        write('// Sorted by name, for binary search with GetLayerFunc().', file=self.outFile)
+        write('const LayerFuncTableEntry func_table[] = {', file=self.outFile)
+        for cmd in sorted(self.funcTableEntries):
+            write(self.funcTableEntries[cmd], file=self.outFile)
         write('};', file=self.outFile)
         self.newline()
+        write('inline PFN_vkVoidFunction GetLayerFunc(const char* name)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    auto entry = std::lower_bound(', file=self.outFile)
+        write('        std::begin(func_table), std::end(func_table), name, [](const LayerFuncTableEntry& lhs, const char* rhs) {', file=self.outFile)
+        write('            return (std::strcmp(lhs.name, rhs) < 0);', file=self.outFile)
+        write('        });', file=self.outFile)
+        self.newline()
+        write('    return ((entry != std::end(func_table)) && (std::strcmp(entry->name, name) == 0)) ? entry->func : nullptr;', file=self.outFile)
+        write('}', file=self.outFile)
+        self.newline()
         write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
 
         # Finish processing in superclass
         BaseGenerator.endFile(self)
+    # yapf: enable
 
     #
     # Indicates that the current feature has C++ code to generate.
@@ -119,5 +147,5 @@ class LayerFuncTableGenerator(BaseGenerator):
                 body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>({}) }},'.format(cmd, (' ' * align), cmd[2:])
             else:
                 body = '    {{ "{}",{}reinterpret_cast<PFN_vkVoidFunction>(encode::{}) }},'.format(cmd, (' ' * align), cmd[2:])
-            write(body, file=self.outFile)
+            self.funcTableEntries[cmd] = body
     # yapf: enable
@@ -0,0 +1,215 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import gc, glob, hashlib, os, pickle, sys, tempfile
+
+# Version of the cached data, to be incremented when the content of the cache changes.
+CACHE_VERSION = 3
+
+# Registry attributes that reference the generator, or that are only used while parsing
+# the XML, which are not stored in the cache.
+_excludedRegistryAttributes = [
+    'gen', 'genOpts', 'commandextensiontuple', 'commandextensionsuccesses',
+    'commandextensionerrors'
+]
+
+
+# RegistryIndex - Lookup tables derived from the complete XML registry.
+#
+# The tables are built once per Registry object and shared by all of the generators
+# using it, instead of being rebuilt from the XML tree by each generator.
+#
+# Members:
+#   structNames - Set of struct and union typenames.
+#   handleNames - Set of handle typenames.
+#   flagsTypes - Map of flags types to base flag type (VkFlags or VkFlags64).
+#   enumNames - Set of enumeration typenames, including aliases.
+#   enumAliases - Map of enum names to aliases.
+#   enumEnumerants - Map of enum names to a map of enumerant names to values.
+#   extensionStructs - Map of struct names to the list of structs that are valid in their pNext chain.
+#   structExtends - Map of extension struct names to the list of structs whose pNext chain may contain them.
+#   structHandles - Map of struct names to a (hasHandles, lastHandleIsPtr) tuple, indicating that the struct
+#     has members with a non-alias handle type, and that the last of those members is a pointer.
+#   valueDecls - Map of <param> and <member> tags to their parsed ValueDecl, populated by the generators.
+class RegistryIndex():
+    """Lookup tables derived from the Vulkan XML registry"""
+
+    def __init__(self, registry):
+        self.structNames = set()
+        self.handleNames = set()
+        self.flagsTypes = dict()
+        self.enumNames = set()
+        self.enumAliases = dict()
+        self.enumEnumerants = dict()
+        self.extensionStructs = dict()
+        self.structExtends = dict()
+        self.structHandles = dict()
+        self.valueDecls = dict()
+
+        flagsAliases = dict()
+        for name, typeinfo in registry.typedict.items():
+            elem = typeinfo.elem
+            category = elem.get('category')
+            if category == 'struct' or category == 'union':
+                self.structNames.add(name)
+            elif category == 'handle':
+                self.handleNames.add(name)
+            elif category == 'bitmask':
+                alias = elem.get('alias')
+                if alias:
+                    flagsAliases[name] = alias
+                else:
+                    self.flagsTypes[name] = elem.find('type').text
+            elif category == 'enum':
+                alias = elem.get('alias')
+                if alias:
+                    self.enumNames.add(name)
+                    self.enumAliases[name] = alias
+
+        # Flags aliases use the same base type as the aliased type
+        for name, alias in flagsAliases.items():
+            while alias in flagsAliases:
+                alias = flagsAliases[alias]
+            if alias in self.flagsTypes:
+                self.flagsTypes[name] = self.flagsTypes[alias]
+
+        for name, groupinfo in registry.groupdict.items():
+            self.enumNames.add(name)
+            enumerants = dict()
+            for elem in groupinfo.elem:
+                supported = elem.get('supported')
+                if not supported or not 'disabled' in supported:
+                    enumerant = elem.get('name')
+                    if enumerant and not elem.get('alias'):
+                        enumerants[enumerant] = elem.get('value')
+            self.enumEnumerants[name] = enumerants
+
+        for name, extensions in registry.validextensionstructs.items():
+            self.extensionStructs[name] = list(extensions)
+            for extension in extensions:
+                self.structExtends.setdefault(extension, []).append(name)
+
+        handleTypes = set(
+            name for name in self.handleNames
+            if not registry.typedict[name].elem.get('alias')
+        )
+        for name in self.structNames:
+            hasHandles = False
+            lastHandleIsPtr = False
+            for memberType in registry.typedict[name].elem.findall(
+                './/member/type'
+            ):
+                if memberType.text in handleTypes:
+                    hasHandles = True
+                    lastHandleIsPtr = bool(
+                        memberType.tail and ('*' in memberType.tail)
+                    )
+            self.structHandles[name] = (hasHandles, lastHandleIsPtr)
+
+
+# Return the RegistryIndex for a Registry object, building it on first use.
+def getRegistryIndex(registry):
+    index = getattr(registry, 'gfxreconIndex', None)
+    if index is None:
+        index = RegistryIndex(registry)
+        registry.gfxreconIndex = index
+    return index
+
+
+# Return the path of the cache file for a registry XML file.  The file name includes
+# a hash of the XML file and of the Python modules that process it, so a modified
+# registry, registry parser, or cache format will never load stale data.
+def getRegistryCacheFile(cacheDir, registryFile):
+    digest = hashlib.sha256()
+    digest.update('{} {}'.format(CACHE_VERSION, sys.version).encode('utf-8'))
+    for filename in [
+        registryFile, __file__,
+        sys.modules['reg'].__file__,
+        sys.modules['generator'].__file__
+    ]:
+        with open(filename, 'rb') as f:
+            digest.update(f.read())
+    return os.path.join(
+        cacheDir, 'registry_{}.pickle'.format(digest.hexdigest()[:32])
+    )
+
+
+# Restore the state of a parsed Registry object from a cache file, leaving the
+# generator and options bound to the registry unchanged.  Returns False if there
+# is no usable cache file.
+def loadRegistryCache(cacheFile, registry):
+    if not os.path.isfile(cacheFile):
+        return False
+
+    # The cache contains a large number of small objects; collecting them while
+    # they are being loaded only adds overhead.
+    gcEnabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(cacheFile, 'rb') as f:
+            state = pickle.load(f)
+    except Exception:
+        return False
+    finally:
+        if gcEnabled:
+            gc.enable()
+
+    registry.__dict__.update(state)
+    for name in ['commandextensionsuccesses', 'commandextensionerrors']:
+        if hasattr(registry, name):
+            setattr(registry, name, [])
+    return True
+
+
+# Write the state of a parsed Registry object, including its RegistryIndex, to a
+# cache file.  Cache files for other versions of the registry are removed.
+# Returns False if the registry could not be cached.
+def saveRegistryCache(cacheFile, registry):
+    getRegistryIndex(registry)
+
+    state = {
+        name: value
+        for name, value in registry.__dict__.items()
+        if name not in _excludedRegistryAttributes
+    }
+
+    cacheDir = os.path.dirname(cacheFile)
+    os.makedirs(cacheDir, exist_ok=True)
+
+    # Write to a temporary file that is renamed when complete, so that concurrent
+    # generator processes never observe a partially written cache.
+    fd, tempFile = tempfile.mkstemp(dir=cacheDir, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tempFile, cacheFile)
+    except Exception:
+        os.remove(tempFile)
+        return False
+
+    for filename in glob.glob(os.path.join(cacheDir, 'registry_*.pickle')):
+        if os.path.normcase(filename) != os.path.normcase(cacheFile):
+            try:
+                os.remove(filename)
+            except OSError:
+                pass
+    return True
@@ -0,0 +1,184 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import os, pstats, time
+from contextlib import contextmanager
+
+# Phases reported for each target, in report order:
+#   registry_load - Parsing the XML registry or loading it from the registry cache.
+#   feature_iteration - Registry traversal and generator processing outside of generateFeature,
+#     including the code generated by beginFile/endFile, excluding file writes.
+#   generate_feature - Total time spent in generateFeature, including file writes.
+#   string_assembly - Time spent in generateFeature, excluding file writes.
+#   file_write - Time spent writing to the output file and moving it to the output directory.
+PHASES = [
+    'registry_load', 'feature_iteration', 'generate_feature',
+    'string_assembly', 'file_write'
+]
+
+# Number of cProfile entries reported as hotspots.
+HOTSPOT_COUNT = 20
+
+
+# TimedOutput - File object wrapper that records the time spent writing and the number of
+# characters written to the wrapped file.
+class TimedOutput():
+    """Wrapper for a generator output file that records write times"""
+
+    def __init__(self, outFile):
+        self.outFile = outFile
+        self.writeTime = 0.0
+        self.writeSize = 0
+
+    def write(self, text):
+        start = time.perf_counter()
+        self.outFile.write(text)
+        self.writeTime += time.perf_counter() - start
+        self.writeSize += len(text)
+
+    def flush(self):
+        self.outFile.flush()
+
+
+# TimingReport - Per-phase timing information for the generation of a single target.
+class TimingReport():
+    """Collects the time spent in each phase of the generation of a target"""
+
+    def __init__(self, target):
+        self.target = target
+        self.times = dict()
+        self.featureCount = 0
+        self.featureWriteTime = 0.0
+        self.featureStart = None
+        self.featureWriteStart = None
+        self.output = None
+        self.writeTime = 0.0
+        self.writeSize = 0
+        self.hotspots = []
+
+    #
+    # Accumulate the time spent in a block of code for the named phase.
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.addTime(name, time.perf_counter() - start)
+
+    def addTime(self, name, seconds):
+        self.times[name] = self.times.get(name, 0.0) + seconds
+
+    #
+    # Wrap the generator output file to record the time spent writing to it.
+    def beginOutput(self, outFile):
+        self.output = TimedOutput(outFile)
+        return self.output
+
+    #
+    # Stop recording writes, returning the wrapped output file.
+    def endOutput(self):
+        output = self.output
+        self.output = None
+        self.writeTime += output.writeTime
+        self.writeSize += output.writeSize
+        return output.outFile
+
+    def beginFeature(self):
+        self.featureStart = time.perf_counter()
+        if self.output:
+            self.featureWriteStart = self.output.writeTime
+
+    def endFeature(self):
+        self.addTime('generate_feature', time.perf_counter() - self.featureStart)
+        if self.output:
+            self.featureWriteTime += self.output.writeTime - self.featureWriteStart
+        self.featureCount += 1
+
+    #
+    # Record the top cumulative entries from a cProfile.Profile object.
+    def addProfile(self, profile, count=HOTSPOT_COUNT):
+        stats = pstats.Stats(profile)
+        stats.sort_stats('cumulative')
+        for func in stats.fcn_list[:count]:
+            (callCount, primitiveCount, totalTime, cumulativeTime,
+             callers) = stats.stats[func]
+            (filename, line, name) = func
+            self.hotspots.append(
+                {
+                    'function':
+                    '{}:{}({})'.format(os.path.basename(filename), line, name),
+                    'calls': callCount,
+                    'tottime': totalTime,
+                    'cumtime': cumulativeTime
+                }
+            )
+
+    #
+    # Convert the report to a dictionary, suitable for JSON serialization.
+    def toDict(self):
+        generateTime = self.times.get('generate', 0.0)
+        featureTime = self.times.get('generate_feature', 0.0)
+        fileTime = self.times.get('file_close', 0.0)
+        writeTime = self.writeTime + fileTime
+
+        phases = {
+            'registry_load':
+            self.times.get('registry_load', 0.0),
+            'feature_iteration':
+            max(
+                generateTime - featureTime -
+                (writeTime - self.featureWriteTime), 0.0
+            ),
+            'generate_feature':
+            featureTime,
+            'string_assembly':
+            max(featureTime - self.featureWriteTime, 0.0),
+            'file_write':
+            writeTime
+        }
+
+        return {
+            'target': self.target,
+            'total_time': self.times.get('registry_load', 0.0) + generateTime,
+            'phases': {name: phases[name]
+                       for name in PHASES},
+            'feature_count': self.featureCount,
+            'output_size': self.writeSize,
+            'hotspots': self.hotspots
+        }
+
+
+# Combine the reports for multiple targets, adding the per-phase totals.
+#  reports - list of dictionaries created by TimingReport.toDict().
+def combineReports(reports):
+    totals = {name: 0.0 for name in PHASES}
+    for report in reports:
+        for name in PHASES:
+            totals[name] += report['phases'][name]
+
+    return {
+        'total_time': sum([report['total_time'] for report in reports]),
+        'phases': totals,
+        'output_size': sum([report['output_size'] for report in reports]),
+        'targets': reports
+    }
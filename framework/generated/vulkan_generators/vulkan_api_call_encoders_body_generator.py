@@ -138,13 +138,13 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
             proto = info[1]
             values = info[2]
 
-            cmddef = '' if first else '\n'
-            cmddef += self.makeCmdDecl(proto, values)
-            cmddef += '{\n'
-            cmddef += self.makeCmdBody(returnType, cmd, values)
-            cmddef += '}'
-
-            write(cmddef, file=self.outFile)
+            if not first:
+                self.emitter.line()
+            self.emitter.write(self.makeCmdDecl(proto, values))
+            self.emitter.line('{')
+            with self.emitter.indent():
+                self.emitCmdBody(returnType, cmd, values)
+            self.emitter.line('}')
             first = False
     # yapf: enable
 
@@ -188,7 +188,8 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
     #
     # Command definition
     # yapf: disable
-    def makeCmdBody(self, returnType, name, values):
+    def emitCmdBody(self, returnType, name, values):
+        emitter = self.emitter
         indent = ' ' * self.INDENT_SIZE
         isOverride = name in self.CAPTURE_OVERRIDES
         encodeAfter = False
@@ -196,128 +197,122 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
         hasOutputs = self.hasOutputs(returnType, values)
         argList = self.makeArgList(values)
 
-        body = ''
-
-        body += indent + 'auto state_lock = TraceManager::Get()->AcquireSharedStateLock();\n'
-        body += '\n'
+        emitter.line('auto state_lock = TraceManager::Get()->AcquireSharedStateLock();')
+        emitter.line()
 
         if hasOutputs or (returnType and returnType != 'void'):
             encodeAfter = True
 
         if hasOutputs and (returnType and returnType != 'void'):
             omitOutputParam = 'omit_output_data'
-            body += indent + 'bool omit_output_data = false;\n'
-            body += '\n'
+            emitter.line('bool omit_output_data = false;')
+            emitter.line()
 
-        body += indent + 'CustomEncoderPreCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), {});\n'.format(name, argList)
+        emitter.line('CustomEncoderPreCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), {});'.format(name, argList))
 
         if not encodeAfter:
-            body += self.makeParameterEncoding(name, values, returnType, indent, omitOutputParam)
+            self.emitParameterEncoding(name, values, returnType, omitOutputParam)
 
-        body += '\n'
+        emitter.line()
 
         if isOverride:
             # Capture overrides simply call the override function without handle unwrap/wrap
             # Construct the function call to dispatch to the next layer.
             callExpr = '{}({})'.format(self.CAPTURE_OVERRIDES[name], self.makeArgList(values))
             if returnType and returnType != 'void':
-                body += indent + '{} result = {};\n'.format(returnType, callExpr)
+                emitter.line('{} result = {};'.format(returnType, callExpr))
             else:
-                body += indent + '{};\n'.format(callExpr)
+                emitter.line('{};'.format(callExpr))
 
             if hasOutputs and (returnType and returnType != 'void'):
-                body += indent + 'if (result < 0)\n'
-                body += indent + '{\n'
-                body += indent + '    omit_output_data = true;\n'
-                body += indent + '}\n'
+                emitter.line('if (result < 0)')
+                emitter.line('{')
+                emitter.line('    omit_output_data = true;')
+                emitter.line('}')
         else:
             # Check for handles that need unwrapping.
             unwrapExpr, unwrappedArgList, needUnwrapMemory = self.makeHandleUnwrapping(name, values, indent)
             if unwrapExpr:
                 if needUnwrapMemory:
-                    body += indent + 'auto handle_unwrap_memory = TraceManager::Get()->GetHandleUnwrapMemory();\n'
-                body += unwrapExpr
-                body += '\n'
+                    emitter.line('auto handle_unwrap_memory = TraceManager::Get()->GetHandleUnwrapMemory();')
+                emitter.write(unwrapExpr)
+                emitter.line()
 
             # Construct the function call to dispatch to the next layer.
             callExpr = self.makeLayerDispatchCall(name, values, unwrappedArgList)
             if returnType and returnType != 'void':
-                body += indent + '{} result = {};\n'.format(returnType, callExpr)
+                emitter.line('{} result = {};'.format(returnType, callExpr))
             else:
-                body += indent + '{};\n'.format(callExpr)
+                emitter.line('{};'.format(callExpr))
 
             # Wrap newly created handles.
             wrapExpr = self.makeHandleWrapping(values, indent)
             if wrapExpr:
-                body += '\n'
+                emitter.line()
                 if returnType and returnType != 'void':
-                    body += indent + 'if (result >= 0)\n'
-                    body += indent + '{\n'
-                    body += '    ' + wrapExpr
-                    body += indent + '}\n'
+                    emitter.line('if (result >= 0)')
+                    emitter.line('{')
+                    emitter.write(indent + wrapExpr)
+                    emitter.line('}')
                     if hasOutputs:
-                        body += indent + 'else\n'
-                        body += indent + '{\n'
-                        body += indent + '    omit_output_data = true;\n'
-                        body += indent + '}\n'
+                        emitter.line('else')
+                        emitter.line('{')
+                        emitter.line('    omit_output_data = true;')
+                        emitter.line('}')
                 else:
-                    body += wrapExpr
+                    emitter.write(wrapExpr)
             elif hasOutputs and (returnType and returnType != 'void'):
-                body += indent + 'if (result < 0)\n'
-                body += indent + '{\n'
-                body += indent + '    omit_output_data = true;\n'
-                body += indent + '}\n'
+                emitter.line('if (result < 0)')
+                emitter.line('{')
+                emitter.line('    omit_output_data = true;')
+                emitter.line('}')
 
         if encodeAfter:
-            body += self.makeParameterEncoding(name, values, returnType, indent, omitOutputParam)
+            self.emitParameterEncoding(name, values, returnType, omitOutputParam)
 
-        body += '\n'
+        emitter.line()
         if returnType and returnType != 'void':
-            body += '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), result, {});\n'.format(name, argList)
+            emitter.line('CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), result, {});'.format(name, argList))
         else:
-            body += '    CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), {});\n'.format(name, argList)
+            emitter.line('CustomEncoderPostCall<format::ApiCallId::ApiCall_{}>::Dispatch(TraceManager::Get(), {});'.format(name, argList))
 
         cleanupExpr = self.makeHandleCleanup(name, values, indent)
         if cleanupExpr:
-            body += '\n'
-            body += cleanupExpr
+            emitter.line()
+            emitter.write(cleanupExpr)
 
         if returnType and returnType != 'void':
-            body += '\n'
-            body += '    return result;\n'
-
-        return body
+            emitter.line()
+            emitter.line('return result;')
     # yapf: enable
 
     # yapf: disable
-    def makeParameterEncoding(self, name, values, returnType, indent, omitOutputParam):
-        body = '\n'
-        body += indent + self.makeBeginApiCall(name, values)
-        body += indent + 'if (encoder)\n'
-        body += indent + '{\n'
-        indent += ' ' * self.INDENT_SIZE
+    def emitParameterEncoding(self, name, values, returnType, omitOutputParam):
+        emitter = self.emitter
+        emitter.line()
+        emitter.line(self.makeBeginApiCall(name, values))
+        emitter.line('if (encoder)')
+        emitter.line('{')
+        with emitter.indent():
+            for value in values:
+                methodCall = self.makeEncoderMethodCall(name, value, values, '', omitOutputParam)
+                emitter.line('{};'.format(methodCall))
 
-        for value in values:
-            methodCall = self.makeEncoderMethodCall(name, value, values, '', omitOutputParam)
-            body += indent + '{};\n'.format(methodCall)
+            if returnType and returnType != 'void':
+                methodCall = self.makeEncoderMethodCall(name, ValueInfo('result', returnType, returnType), [], '')
+                emitter.line('{};'.format(methodCall))
 
-        if returnType and returnType != 'void':
-            methodCall = self.makeEncoderMethodCall(name, ValueInfo('result', returnType, returnType), [], '')
-            body += indent + '{};\n'.format(methodCall)
-
-        # Determine the appropriate end call: Create handle call, destroy handle call, or general call.
-        body += indent + self.makeEndApiCall(name, values, returnType)
-        indent = indent[0:-self.INDENT_SIZE]
-        body += indent + '}\n'
-        return body
+            # Determine the appropriate end call: Create handle call, destroy handle call, or general call.
+            emitter.line(self.makeEndApiCall(name, values, returnType))
+        emitter.line('}')
     # yapf: enable
 
     # yapf: disable
     def makeBeginApiCall(self, name, values):
         if name.startswith('vkCreate') or name.startswith('vkAllocate') or name.startswith('vkDestroy') or name.startswith('vkFree') or self.retrievesHandles(values) or (values[0].baseType == 'VkCommandBuffer') or (name == 'vkReleasePerformanceConfigurationINTEL'):
-            return 'auto encoder = TraceManager::Get()->BeginTrackedApiCallTrace(format::ApiCallId::ApiCall_{});\n'.format(name)
+            return 'auto encoder = TraceManager::Get()->BeginTrackedApiCallTrace(format::ApiCallId::ApiCall_{});'.format(name)
         else:
-            return 'auto encoder = TraceManager::Get()->BeginApiCallTrace(format::ApiCallId::ApiCall_{});\n'.format(name)
+            return 'auto encoder = TraceManager::Get()->BeginApiCallTrace(format::ApiCallId::ApiCall_{});'.format(name)
     # yapf: enable
 
     def getStructHandleMemberInfo(self, members):
@@ -429,7 +424,7 @@ class VulkanApiCallEncodersBodyGenerator(BaseGenerator):
         else:
             decl += 'EndApiCallTrace()'
 
-        decl += ';\n'
+        decl += ';'
         return decl
     # yapf: enable
 
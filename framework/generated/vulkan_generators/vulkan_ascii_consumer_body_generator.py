@@ -132,7 +132,7 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
                         uint32_t tabCount = 0;
                         uint32_t tabSize = 4;
                         WriteApiCallToFile("{0}", toStringFlags, tabCount, tabSize,
-                            [&](std::stringstream& strStrm)
+                            [&](std::string& strBuf)
                             {{
                     '''.format(cmd))
                 cmddef += '\n'
@@ -154,7 +154,8 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
 
         # Handle function return value
         if not 'void' in returnType:
-            body = '            FieldToString(strStrm, true, "return", toStringFlags, tabCount, tabSize, \'"\' + ToString(returnValue, toStringFlags, tabCount, tabSize) + \'"\');\n'
+            body = '            FieldToString(strBuf, true, "return", toStringFlags, tabCount, tabSize);\n'
+            body += '            QuotedToString(strBuf, returnValue, toStringFlags, tabCount, tabSize);\n'
 
         # Handle function arguments
         for value in values:
@@ -165,33 +166,33 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
 
             # void data PointerDecoder requires custom handling
             if 'void' in value.fullType:
-                toString = 'DataPointerDecoderToString({0})'
+                toString = 'DataPointerDecoderToString(strBuf, {0})'
 
             # StringDecoder requires custom handling
             elif 'const char*' in value.fullType:
-                toString = 'StringDecoderToString({0})'
+                toString = 'StringDecoderToString(strBuf, {0})'
 
             # There's some repeated code in this if/else block...It's easier (imo) to reason
             #   about each case when they're all listed explictly
             elif value.isPointer:
                 if value.isArray:
                     if self.isHandle(value.baseType):
-                        toString = 'HandlePointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'HandlePointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                     elif self.isStruct(value.baseType):
-                        toString = 'PointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'PointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = 'EnumPointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'EnumPointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                     else:
-                        toString = 'PointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'PointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                 else:
                     if self.isHandle(value.baseType):
-                        toString = 'HandlePointerDecoderToString({0})'
+                        toString = 'HandlePointerDecoderToString(strBuf, {0})'
                     elif self.isStruct(value.baseType):
-                        toString = 'PointerDecoderToString({0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'PointerDecoderToString(strBuf, {0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = 'EnumPointerDecoderToString({0})'
+                        toString = 'EnumPointerDecoderToString(strBuf, {0})'
                     else:
-                        toString = 'PointerDecoderToString({0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'PointerDecoderToString(strBuf, {0}, toStringFlags, tabCount, tabSize)'
             else:
                 if value.isArray:
                     if self.isHandle(value.baseType):
@@ -199,22 +200,23 @@ class VulkanAsciiConsumerBodyGenerator(BaseGenerator):
                     elif self.isStruct(value.baseType):
                         toString = 'static_assert(false, "Unhandled static array of VkStructures in `vulkan_ascii_consumer_body_generator.py`")'
                     elif self.isEnum(value.baseType):
-                        toString = 'EnumPointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'EnumPointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                     else:
-                        toString = 'PointerDecoderArrayToString({1}, {0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'PointerDecoderArrayToString(strBuf, {1}, {0}, toStringFlags, tabCount, tabSize)'
                 else:
                     if self.isHandle(value.baseType):
-                        toString = 'HandleIdToString({0})'
+                        toString = 'HandleIdToString(strBuf, {0})'
                     elif self.isStruct(value.baseType):
-                        toString = 'ToString({0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ToString(strBuf, {0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = '\'"\' + ToString({0}, toStringFlags, tabCount, tabSize) + \'"\''
+                        toString = 'QuotedToString(strBuf, {0}, toStringFlags, tabCount, tabSize)'
                     else:
-                        toString = 'ToString({0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ToString(strBuf, {0}, toStringFlags, tabCount, tabSize)'
 
             firstField = 'true' if not body else 'false'
             valueName = ('[out]' if self.isOutputParameter(value) else '') + value.name
             toString = toString.format(value.name, value.arrayLength)
-            body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, valueName, toString)
+            body += '            FieldToString(strBuf, {0}, "{1}", toStringFlags, tabCount, tabSize);\n'.format(firstField, valueName)
+            body += '            {0};\n'.format(toString)
         return body
     # yapf: enable
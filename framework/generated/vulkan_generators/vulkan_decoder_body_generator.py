@@ -66,6 +66,10 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
         # Names of all Vulkan commands processed by the generator.
         self.cmdNames = []
 
+        # Names of all Vulkan commands, including the blacklisted commands that are decoded by VulkanDecoderBase or
+        # that are not decoded.
+        self.apiCallNames = []
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
@@ -86,6 +90,16 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
         self.newline()
         write('#include <cstddef>', file=self.outFile)
         self.newline()
+        write('#if defined(GFXRECON_DECODE_DIRECT_REPLAY_CONSUMER)', file=self.outFile)
+        write('#include "generated/generated_vulkan_replay_consumer.h"', file=self.outFile)
+        self.newline()
+        write('// The single consumer is always a VulkanReplayConsumer, which is called without virtual dispatch.', file=self.outFile)
+        write('#define GFXRECON_DECODE_SINGLE_CONSUMER_CALL(consumer, method) \\', file=self.outFile)
+        write('    static_cast<VulkanReplayConsumer*>(consumer)->VulkanReplayConsumer::method', file=self.outFile)
+        write('#else', file=self.outFile)
+        write('#define GFXRECON_DECODE_SINGLE_CONSUMER_CALL(consumer, method) (consumer)->method', file=self.outFile)
+        write('#endif', file=self.outFile)
+        self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
     # yapf: enable
@@ -94,7 +108,7 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
     # yapf: disable
     def endFile(self):
         self.newline()
-        # Generate the VulkanDecoder::DecodeFunctionCall method for all of the commands processed by the generator.
+        # Generate the decode function table and VulkanDecoder::DecodeFunctionCall method for all of the commands processed by the generator.
         self.generateDecodeCases()
         self.newline()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
@@ -116,6 +130,7 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
     # yapf: disable
     def generateFeature(self):
         first = True
+        self.apiCallNames.extend(self.featureCmdParams)
         for cmd in self.getFilteredCmdNames():
             self.cmdNames.append(cmd)
 
@@ -123,72 +138,80 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
             returnType = info[0]
             values = info[2]
 
-            cmddef = '' if first else '\n'
-            cmddef += 'size_t VulkanDecoder::Decode_{}(const uint8_t* parameter_buffer, size_t buffer_size)\n'.format(cmd)
-            cmddef += '{\n'
-            cmddef += '    size_t bytes_read = 0;\n'
-            cmddef += '\n'
-            cmddef += self.makeCmdBody(returnType, cmd, values)
-            cmddef += '\n'
-            cmddef += '    return bytes_read;\n'
-            cmddef += '}'
-
-            write(cmddef, file=self.outFile)
+            if not first:
+                self.emitter.line()
+            self.emitter.line('size_t VulkanDecoder::Decode_{}(const uint8_t* parameter_buffer, size_t buffer_size)'.format(cmd))
+            self.emitter.line('{')
+            with self.emitter.indent():
+                self.emitter.line('size_t bytes_read = 0;')
+                self.emitter.line()
+                self.emitCmdBody(returnType, cmd, values)
+                self.emitter.line()
+                self.emitter.line('return bytes_read;')
+            self.emitter.line('}')
             first = False
     # yapf: enable
 
     #
     # Generate C++ code for the decoder method body.
     # yapf: disable
-    def makeCmdBody(self, returnType, name, values):
-        body = ''
+    def emitCmdBody(self, returnType, name, values):
         argNames = []
 
         # Declarations for decoded types.
         for value in values:
             decodeType = self.makeDecodedParamType(value)
-            body += '    {} {};\n'.format(decodeType, value.name)
+            self.emitter.line('{} {};'.format(decodeType, value.name))
             if 'Decoder' in decodeType:
                 argNames.append('&{}'.format(value.name))
             else:
                 argNames.append(value.name)
 
         if returnType and returnType != 'void':
-            body += '    {} return_value;\n'.format(returnType)
+            self.emitter.line('{} return_value;'.format(returnType))
 
         # Blank line after declarations.
         if values or returnType:
-            body += '\n'
+            self.emitter.line()
 
         # Decode() method calls for pointer decoder wrappers.
         for value in values:
-            body += self.makeDecodeInvocation(value)
+            self.emitDecodeInvocation(value)
         if returnType and returnType != 'void':
-            body += self.makeDecodeInvocation(ValueInfo('return_value', returnType, returnType))
+            self.emitDecodeInvocation(ValueInfo('return_value', returnType, returnType))
 
         # Blank line after Decode() method invocations.
         if values or returnType:
-            body += '\n'
+            self.emitter.line()
 
         # Make the argument list for the API call
         arglist = ', '.join([argName for argName in argNames])
         if returnType and returnType != 'void':
             arglist = ', '.join(['return_value', arglist])
 
-        body += '    for (auto consumer : GetConsumers())\n'
-        body += '    {\n'
-        body += '        consumer->Process_{}({});\n'.format(name, arglist)
-        body += '    }\n'
-
-        return body
+        # Replay has a single consumer, which is called without iterating over the consumer list.
+        self.emitter.line('VulkanConsumer* single_consumer = GetSingleConsumer();')
+        self.emitter.line('if (single_consumer != nullptr)')
+        self.emitter.line('{')
+        with self.emitter.indent():
+            self.emitter.line('GFXRECON_DECODE_SINGLE_CONSUMER_CALL(single_consumer, Process_{})({});'.format(name, arglist))
+        self.emitter.line('}')
+        self.emitter.line('else')
+        self.emitter.line('{')
+        with self.emitter.indent():
+            self.emitter.line('for (auto consumer : GetConsumers())')
+            self.emitter.line('{')
+            with self.emitter.indent():
+                self.emitter.line('consumer->Process_{}({});'.format(name, arglist))
+            self.emitter.line('}')
+        self.emitter.line('}')
     # yapf: enable
 
     #
     # Generate parameter decode function/method invocation.
     # yapf: disable
-    def makeDecodeInvocation(self, value):
+    def emitDecodeInvocation(self, value):
         bufferArgs = '(parameter_buffer + bytes_read), (buffer_size - bytes_read)'
-        body = ''
 
         isStruct = False
         isString = False
@@ -211,49 +234,72 @@ class VulkanDecoderBodyGenerator(BaseGenerator):
             if typeName in self.EXTERNAL_OBJECT_TYPES and not value.isArray:
                 if value.pointerCount > 1:
                     # Pointer to a pointer to an unknown object type (void**), encoded as a pointer to a 64-bit integer ID.
-                    body += '    bytes_read += {}.DecodeVoidPtr({});\n'.format(value.name, bufferArgs)
+                    self.emitter.line('bytes_read += {}.DecodeVoidPtr({});'.format(value.name, bufferArgs))
                 else:
                     # Pointer to an unknown object type, encoded as a 64-bit integer ID.
-                    body += '    bytes_read += ValueDecoder::DecodeAddress({}, &{});\n'.format(bufferArgs, value.name)
+                    self.emitter.line('bytes_read += ValueDecoder::DecodeAddress({}, &{});'.format(bufferArgs, value.name))
             else:
                 if isStruct or isString or isHandle:
-                    body += '    bytes_read += {}.Decode({});\n'.format(value.name, bufferArgs)
+                    self.emitter.line('bytes_read += {}.Decode({});'.format(value.name, bufferArgs))
                 else:
-                    body += '    bytes_read += {}.Decode{}({});\n'.format(value.name, typeName, bufferArgs)
+                    self.emitter.line('bytes_read += {}.Decode{}({});'.format(value.name, typeName, bufferArgs))
         else:
             if isStruct:
-                body += '    bytes_read += DecodeStruct({}, &{});\n'.format(bufferArgs, value.name)
+                self.emitter.line('bytes_read += DecodeStruct({}, &{});'.format(bufferArgs, value.name))
             elif isFuncp:
-                body += '    bytes_read += ValueDecoder::DecodeAddress({}, &{});\n'.format(bufferArgs, value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeAddress({}, &{});'.format(bufferArgs, value.name))
             elif isHandle:
-                body += '    bytes_read += ValueDecoder::DecodeHandleIdValue({}, &{});\n'.format(bufferArgs, value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeHandleIdValue({}, &{});'.format(bufferArgs, value.name))
             else:
-                body += '    bytes_read += ValueDecoder::Decode{}Value({}, &{});\n'.format(typeName, bufferArgs, value.name)
-
-        return body
+                self.emitter.line('bytes_read += ValueDecoder::Decode{}Value({}, &{});'.format(typeName, bufferArgs, value.name))
     # yapf: enable
 
     #
-    # Generate the VulkanDecoder::DecodeFunctionCall method.
+    # Generate the table of decode functions and the VulkanDecoder::DecodeFunctionCall method.
     # yapf: disable
     def generateDecodeCases(self):
-        write('void VulkanDecoder::DecodeFunctionCall(format::ApiCallId             call_id,', file=self.outFile)
-        write('                                       const ApiCallInfo&            call_info,', file=self.outFile)
-        write('                                       const uint8_t*                parameter_buffer,', file=self.outFile)
-        write('                                       size_t                        buffer_size)', file=self.outFile)
-        write('{', file=self.outFile)
-        write('    switch(call_id)', file=self.outFile)
-        write('    {', file=self.outFile)
-        write('    default:', file=self.outFile)
-        write('        VulkanDecoderBase::DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);', file=self.outFile)
-        write('        break;', file=self.outFile)
-
-        for cmd in self.cmdNames:
-            cmddef = '    case format::ApiCallId::ApiCall_{}:\n'.format(cmd)
-            cmddef += '        Decode_{}(parameter_buffer, buffer_size);\n'.format(cmd)
-            cmddef += '        break;'
-            write(cmddef, file=self.outFile)
-
-        write('    }', file=self.outFile)
-        write('}\n', file=self.outFile)
+        emitter = self.emitter
+        emitter.line('constexpr VulkanDecoder::DecodeFunctionTable VulkanDecoder::MakeDecodeFunctionTable()')
+        emitter.line('{')
+        with emitter.indent():
+            emitter.line('DecodeFunctionTable table{};')
+            for cmd in self.cmdNames:
+                emitter.line('table.functions[format::ApiCallId::ApiCall_{cmd} - kFirstApiCallId] = &VulkanDecoder::Decode_{cmd};'.format(cmd=cmd))
+            for cmd in self.apiCallNames:
+                emitter.line('table.names[format::ApiCallId::ApiCall_{cmd} - kFirstApiCallId] = "{cmd}";'.format(cmd=cmd))
+            emitter.line('return table;')
+        emitter.line('}')
+        emitter.line()
+        emitter.line('const VulkanDecoder::DecodeFunctionTable VulkanDecoder::kDecodeFunctionTable = VulkanDecoder::MakeDecodeFunctionTable();')
+        emitter.line()
+        emitter.line('const char* VulkanDecoder::GetApiCallName(format::ApiCallId call_id)')
+        emitter.line('{')
+        with emitter.indent():
+            emitter.line('const uint32_t index = static_cast<uint32_t>(call_id) - kFirstApiCallId;')
+            emitter.line('return (index < kDecodeFunctionCount) ? kDecodeFunctionTable.names[index] : nullptr;')
+        emitter.line('}')
+        emitter.line()
+        emitter.line('void VulkanDecoder::DecodeFunctionCall(format::ApiCallId             call_id,')
+        emitter.line('                                       const ApiCallInfo&            call_info,')
+        emitter.line('                                       const uint8_t*                parameter_buffer,')
+        emitter.line('                                       size_t                        buffer_size)')
+        emitter.line('{')
+        with emitter.indent():
+            emitter.line('// IDs below the first Vulkan API call ID wrap around to indices that are outside of the table.')
+            emitter.line('const uint32_t index = static_cast<uint32_t>(call_id) - kFirstApiCallId;')
+            emitter.line('if (index < kDecodeFunctionCount)')
+            emitter.line('{')
+            with emitter.indent():
+                emitter.line('const DecodeFunction decode_function = kDecodeFunctionTable.functions[index];')
+                emitter.line('if (decode_function != nullptr)')
+                emitter.line('{')
+                with emitter.indent():
+                    emitter.line('(this->*decode_function)(parameter_buffer, buffer_size);')
+                    emitter.line('return;')
+                emitter.line('}')
+            emitter.line('}')
+            emitter.line()
+            emitter.line('VulkanDecoderBase::DecodeFunctionCall(call_id, call_info, parameter_buffer, buffer_size);')
+        emitter.line('}')
+        emitter.line()
     # yapf: enable
@@ -85,12 +85,30 @@ class VulkanDecoderHeaderGenerator(BaseGenerator):
         write('                                    const ApiCallInfo&            call_info,', file=self.outFile)
         write('                                    const uint8_t*                parameter_buffer,', file=self.outFile)
         write('                                    size_t                        buffer_size) override;\n', file=self.outFile)
+        write('    // Returns the name of the Vulkan API call with the specified ID, or nullptr if the ID is not a Vulkan API call ID.', file=self.outFile)
+        write('    static const char* GetApiCallName(format::ApiCallId call_id);\n', file=self.outFile)
         write('  private:', end='', file=self.outFile)
     # yapf: enable
 
     # Method override
     # yapf: disable
     def endFile(self):
+        self.newline()
+        write('    typedef size_t (VulkanDecoder::*DecodeFunction)(const uint8_t* parameter_buffer, size_t buffer_size);', file=self.outFile)
+        self.newline()
+        write('    // Decode functions are indexed by the API call ordinal, which is the API call ID minus the ID of the first Vulkan API call.', file=self.outFile)
+        write('    static constexpr uint32_t kFirstApiCallId      = format::ApiCallId::ApiCall_vkCreateInstance;', file=self.outFile)
+        write('    static constexpr uint32_t kDecodeFunctionCount = format::ApiCallId::ApiCall_VulkanLast - kFirstApiCallId;', file=self.outFile)
+        self.newline()
+        write('    struct DecodeFunctionTable', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        DecodeFunction functions[kDecodeFunctionCount];', file=self.outFile)
+        write('        const char*    names[kDecodeFunctionCount];', file=self.outFile)
+        write('    };', file=self.outFile)
+        self.newline()
+        write('    static constexpr DecodeFunctionTable MakeDecodeFunctionTable();', file=self.outFile)
+        self.newline()
+        write('    static const DecodeFunctionTable kDecodeFunctionTable;', file=self.outFile)
         write('};', file=self.outFile)
         self.newline()
         write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
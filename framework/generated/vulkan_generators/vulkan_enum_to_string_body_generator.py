@@ -111,20 +111,20 @@ class VulkanEnumToStringBodyGenerator(BaseGenerator):
         for enum in sorted(self.enumNames):
             if not enum in self.processedEnums and not enum in self.enumAliases:
                 self.processedEnums.add(enum)
-                body = 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
+                body = 'template <> void ToString<{0}>(std::string& strBuf, const {0}& value, ToStringFlags, uint32_t, uint32_t)\n'
                 body += '{{\n'
                 if len(self.enumEnumerants[enum]):
                     body += '    switch (value) {{\n'
                     for enumerant in self.enumEnumerants[enum]:
-                        body += '    case {0}: return "{0}";\n'.format(enumerant)
+                        body += '    case {0}: strBuf.append("{0}"); return;\n'.format(enumerant)
                     body += '    default: break;\n'
                     body += '    }}\n'
-                body += '    return "Unhandled {0}";\n'
+                body += '    strBuf.append("Unhandled {0}");\n'
                 body += '}}\n'
                 if 'Bits' in enum:
-                    body += '\ntemplate <> std::string ToString<{0}>(VkFlags vkFlags, ToStringFlags, uint32_t, uint32_t)\n'
+                    body += '\ntemplate <> void ToString<{0}>(std::string& strBuf, VkFlags vkFlags, ToStringFlags, uint32_t, uint32_t)\n'
                     body += '{{\n'
-                    body += '    return BitmaskToString<{0}>(vkFlags);\n'
+                    body += '    BitmaskToString<{0}>(strBuf, vkFlags);\n'
                     body += '}}\n'
                 write(body.format(enum), file=self.outFile)
     # yapf: enable
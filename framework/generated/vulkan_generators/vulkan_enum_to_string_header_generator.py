@@ -114,8 +114,8 @@ class VulkanEnumToStringHeaderGenerator(BaseGenerator):
             if not enum in self.processedEnums:
                 self.processedEnums.add(enum)
                 if not enum in self.enumAliases:
-                    body = 'template <> std::string ToString<{0}>(const {0}& value, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
+                    body = 'template <> void ToString<{0}>(std::string& strBuf, const {0}& value, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
                     if 'Bits' in enum:
-                        body += '\ntemplate <> std::string ToString<{0}>(VkFlags vkFlags, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
+                        body += '\ntemplate <> void ToString<{0}>(std::string& strBuf, VkFlags vkFlags, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'
                     write(body.format(enum), file=self.outFile)
     # yapf: enable
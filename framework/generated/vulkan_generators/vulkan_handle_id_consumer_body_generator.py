@@ -0,0 +1,252 @@
+#!/usr/bin/python3 -i
+#
+# Copyright (c) 2021 LunarG, Inc.
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+
+import os, re, sys
+from base_generator import *
+
+
+class VulkanHandleIdConsumerBodyGeneratorOptions(BaseGeneratorOptions):
+    """Options for generating a C++ class for collecting the handle IDs referenced by API call parameters"""
+
+    def __init__(
+        self,
+        blacklists=None,  # Path to JSON file listing apicalls and structs to ignore.
+        platformTypes=None,  # Path to JSON file listing platform (WIN32, X11, etc.) defined types.
+        filename=None,
+        directory='.',
+        prefixText='',
+        protectFile=False,
+        protectFeature=True
+    ):
+        BaseGeneratorOptions.__init__(
+            self, blacklists, platformTypes, filename, directory, prefixText,
+            protectFile, protectFeature
+        )
+
+
+# VulkanHandleIdConsumerBodyGenerator - subclass of BaseGenerator.
+# Generates C++ functions for adding the IDs of struct member handles to a list, and member definitions for the
+# VulkanHandleIdConsumer class, which collects the IDs of the handles referenced by API call parameters.
+class VulkanHandleIdConsumerBodyGenerator(BaseGenerator):
+    """Generate a C++ class for collecting the handle IDs referenced by API call parameters"""
+
+    def __init__(
+        self, errFile=sys.stderr, warnFile=sys.stderr, diagFile=sys.stdout
+    ):
+        BaseGenerator.__init__(
+            self,
+            processCmds=True,
+            processStructs=True,
+            featureBreak=False,
+            errFile=errFile,
+            warnFile=warnFile,
+            diagFile=diagFile
+        )
+        # Map of Vulkan structs containing handles to a list values for handle members or struct members
+        # that contain handles (eg. VkGraphicsPipelineCreateInfo contains a VkPipelineShaderStageCreateInfo
+        # member that contains handles).
+        self.structsWithHandles = dict()
+        self.pNextStructs = dict(
+        )  # Map of Vulkan structure types to sType value for structs that can be part of a pNext chain.
+        self.commandInfo = dict()  # Map of Vulkan commands to parameter info
+
+    # Method override
+    # yapf: disable
+    def beginFile(self, genOpts):
+        BaseGenerator.beginFile(self, genOpts)
+
+        write('#include "generated/generated_vulkan_handle_id_consumer.h"', file=self.outFile)
+        self.newline()
+        write('#include "decode/custom_vulkan_struct_decoders.h"', file=self.outFile)
+        write('#include "generated/generated_vulkan_struct_decoders.h"', file=self.outFile)
+        self.newline()
+        write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
+        write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
+    # yapf: enable
+
+    # Method override
+    # yapf: disable
+    def endFile(self):
+        # Generate the pNext handle ID code.
+        self.newline()
+        write('void AddPNextStructHandleIds(const void* value, const void* wrapper, std::vector<format::HandleId>* handle_ids)', file=self.outFile)
+        write('{', file=self.outFile)
+        write('    if ((value != nullptr) && (wrapper != nullptr))', file=self.outFile)
+        write('    {', file=self.outFile)
+        write('        const VkBaseInStructure* base = reinterpret_cast<const VkBaseInStructure*>(value);', file=self.outFile)
+        write('', file=self.outFile)
+        write('        switch (base->sType)', file=self.outFile)
+        write('        {', file=self.outFile)
+        write('        default:', file=self.outFile)
+        write('            break;', file=self.outFile)
+        for baseType in self.pNextStructs:
+            write('        case {}:'.format(self.pNextStructs[baseType]), file=self.outFile)
+            write('            AddStructHandleIds(reinterpret_cast<const Decoded_{}*>(wrapper), handle_ids);'.format(baseType), file=self.outFile)
+            write('            break;', file=self.outFile)
+        write('        }', file=self.outFile)
+        write('    }', file=self.outFile)
+        write('}', file=self.outFile)
+
+        for cmd, info in self.commandInfo.items():
+            returnType = info[0]
+            params = info[2]
+            handles = self.getParamListHandles(cmd, params)
+
+            if handles:
+                cmddef = '\n'
+                cmddef += self.makeConsumerFuncDecl(returnType, 'VulkanHandleIdConsumer::Process_' + cmd, params) + '\n'
+                cmddef += '{\n'
+                indent = self.INDENT_SIZE * ' '
+
+                # Add unreferenced parameter macros.
+                unrefCount = 0
+                for param in params:
+                    if not param in handles:
+                        cmddef += indent + 'GFXRECON_UNREFERENCED_PARAMETER({});\n'.format(param.name)
+                        unrefCount += 1
+                if unrefCount > 0:
+                    cmddef += '\n'
+
+                for handle in handles:
+                    cmddef += indent + self.makeHandleIdAddition(cmd, handle) + '\n'
+                cmddef += '}'
+
+                write(cmddef, file=self.outFile)
+
+        self.newline()
+        write('GFXRECON_END_NAMESPACE(decode)', file=self.outFile)
+        write('GFXRECON_END_NAMESPACE(gfxrecon)', file=self.outFile)
+
+        # Finish processing in superclass
+        BaseGenerator.endFile(self)
+    # yapf: enable
+
+    #
+    # Method override
+    def genStruct(self, typeinfo, typename, alias):
+        BaseGenerator.genStruct(self, typeinfo, typename, alias)
+
+        if not alias:
+            if self.checkStructMemberHandles(
+                typename, self.structsWithHandles
+            ):
+                # Track this struct if it can be present in a pNext chain, for generating the AddPNextStructHandleIds code.
+                parentStructs = typeinfo.elem.get('structextends')
+                if parentStructs:
+                    sType = self.makeStructureTypeEnum(typeinfo, typename)
+                    if sType:
+                        self.pNextStructs[typename] = sType
+
+    #
+    # Indicates that the current feature has C++ code to generate.
+    def needFeatureGeneration(self):
+        if self.featureStructMembers or self.featureCmdParams:
+            return True
+        return False
+
+    #
+    # Performs C++ code generation for the feature.
+    # yapf: disable
+    def generateFeature(self):
+        for struct in self.getFilteredStructNames():
+            if (struct in self.structsWithHandles) or (struct in self.GENERIC_HANDLE_STRUCTS):
+                handleMembers = dict()
+                genericHandleMembers = dict()
+
+                if struct in self.structsWithHandles:
+                    handleMembers = self.structsWithHandles[struct]
+                if struct in self.GENERIC_HANDLE_STRUCTS:
+                    genericHandleMembers = self.GENERIC_HANDLE_STRUCTS[struct]
+
+                body = '\n'
+                body += 'void AddStructHandleIds(const Decoded_{}* wrapper, std::vector<format::HandleId>* handle_ids)\n'.format(struct)
+                body += '{\n'
+                body += '    if (wrapper != nullptr)\n'
+                body += '    {'
+                body += self.makeStructHandleIdAdditions(handleMembers, genericHandleMembers)
+                body += '    }\n'
+                body += '}'
+
+                write(body, file=self.outFile)
+
+        for cmd in self.getFilteredCmdNames():
+            self.commandInfo[cmd] = self.featureCmdParams[cmd]
+    # yapf: enable
+
+    #
+    # Create list of parameters that have handle types, generic handle values, or are structs that contain handles.
+    def getParamListHandles(self, cmd, values):
+        handles = []
+        for value in values:
+            if self.isHandle(value.baseType) or self.isGenericCmdHandleValue(
+                cmd, value.name
+            ):
+                handles.append(value)
+            elif self.isStruct(value.baseType) and (
+                (value.baseType in self.structsWithHandles) or
+                (value.baseType in self.GENERIC_HANDLE_STRUCTS)
+            ):
+                handles.append(value)
+        return handles
+
+    #
+    # Generate an expression that adds the handle IDs referenced by an API call parameter to the consumer's list.
+    def makeHandleIdAddition(self, cmd, value):
+        if self.isStruct(value.baseType):
+            if value.isPointer or value.isArray:
+                return 'AddStructArrayHandleIds({}, GetHandleIdList());'.format(value.name)
+            return 'AddStructHandleIds(&{}, GetHandleIdList());'.format(value.name)
+        elif value.isPointer or value.isArray:
+            return 'AddHandleIds({}, GetHandleIdList());'.format(value.name)
+        return 'AddHandleId({}, GetHandleIdList());'.format(value.name)
+
+    #
+    # Generate expressions that add the IDs of struct member handles to a list.
+    # yapf: disable
+    def makeStructHandleIdAdditions(self, handleMembers, genericHandleMembers):
+        body = ''
+
+        for member in handleMembers:
+            body += '\n'
+
+            if 'pNext' in member.name:
+                body += '        if (wrapper->pNext)\n'
+                body += '        {\n'
+                body += '            AddPNextStructHandleIds(wrapper->pNext->GetPointer(), wrapper->pNext->GetMetaStructPointer(), handle_ids);\n'
+                body += '        }\n'
+            elif self.isStruct(member.baseType):
+                # This is a struct that includes handles.
+                if member.isArray or member.isPointer:
+                    body += '        AddStructArrayHandleIds(wrapper->{}, handle_ids);\n'.format(member.name)
+                else:
+                    body += '        AddStructHandleIds(wrapper->{}, handle_ids);\n'.format(member.name)
+            elif member.isArray or member.isPointer:
+                body += '        AddHandleIds(&wrapper->{}, handle_ids);\n'.format(member.name)
+            else:
+                body += '        AddHandleId(wrapper->{}, handle_ids);\n'.format(member.name)
+
+        for member in genericHandleMembers:
+            body += '\n'
+            body += '        AddHandleId(wrapper->{}, handle_ids);\n'.format(member)
+
+        return body
+    # yapf: enable
@@ -74,7 +74,7 @@ class VulkanPNextToStringBodyGenerator(BaseGenerator):
         GFXRECON_BEGIN_NAMESPACE(gfxrecon)
         GFXRECON_BEGIN_NAMESPACE(util)
 
-        std::string PNextToString(const void* pNext, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+        void PNextToString(std::string& strBuf, const void* pNext, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
         {
             if (pNext)
             {
@@ -84,12 +84,13 @@ class VulkanPNextToStringBodyGenerator(BaseGenerator):
         body += '\n'
         for struct in self.sTypeValues:
             body += '        case {0}:\n'.format(self.sTypeValues[struct])
-            body += '            return ToString(*reinterpret_cast<const {0}*>(pNext), toStringFlags, tabCount, tabSize);\n'.format(struct)
+            body += '            ToString(strBuf, *reinterpret_cast<const {0}*>(pNext), toStringFlags, tabCount, tabSize);\n'.format(struct)
+            body += '            return;\n'
         body += inspect.cleandoc('''
                 default: break;
                 }
             }
-            return "null";
+            strBuf.append("null");
         }
 
         GFXRECON_END_NAMESPACE(util)
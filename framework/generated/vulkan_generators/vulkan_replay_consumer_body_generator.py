@@ -147,13 +147,13 @@ class VulkanReplayConsumerBodyGenerator(BaseGenerator):
             returnType = info[0]
             values = info[2]
 
-            cmddef = '' if first else '\n'
-            cmddef += self.makeConsumerFuncDecl(returnType, 'VulkanReplayConsumer::Process_' + cmd, values) + '\n'
-            cmddef += '{\n'
-            cmddef += self.makeConsumerFuncBody(returnType, cmd, values)
-            cmddef += '}'
-
-            write(cmddef, file=self.outFile)
+            if not first:
+                self.emitter.line()
+            self.emitter.line(self.makeConsumerFuncDecl(returnType, 'VulkanReplayConsumer::Process_' + cmd, values))
+            self.emitter.line('{')
+            with self.emitter.indent():
+                self.emitConsumerFuncBody(returnType, cmd, values)
+            self.emitter.line('}')
             first = False
     # yapf: enable
 
@@ -179,10 +179,10 @@ class VulkanReplayConsumerBodyGenerator(BaseGenerator):
         return False
 
     #
-    # Return VulkanReplayConsumer class member function definition.
+    # Emit VulkanReplayConsumer class member function definition.
     # yapf: disable
-    def makeConsumerFuncBody(self, returnType, name, values):
-        body = ''
+    def emitConsumerFuncBody(self, returnType, name, values):
+        emitter = self.emitter
         isOverride = name in self.REPLAY_OVERRIDES
 
         args, preexpr, postexpr = self.makeBodyExpressions(returnType, name, values, isOverride)
@@ -209,24 +209,20 @@ class VulkanReplayConsumerBodyGenerator(BaseGenerator):
             callExpr = '{}({})'.format(dispatchfunc, arglist)
 
         if preexpr:
-            body += '\n'.join(['    ' + val if val else val for val in preexpr])
-            body += '\n'
-            body += '\n'
+            emitter.lines(preexpr)
+            emitter.line()
         if returnType == 'VkResult':
-            body += '    VkResult replay_result = {};\n'.format(callExpr)
-            body += '    CheckResult("{}", returnValue, replay_result);\n'.format(name)
+            emitter.line('VkResult replay_result = {};'.format(callExpr))
+            emitter.line('CheckResult("{}", returnValue, replay_result);'.format(name))
         else:
-            body += '    {};\n'.format(callExpr)
+            emitter.line('{};'.format(callExpr))
         if postexpr:
-            body += '\n'
-            body += '\n'.join(['    ' + val if val else val for val in postexpr])
-            body += '\n'
+            emitter.line()
+            emitter.lines(postexpr)
 
         cleanupExpr = self.makeRemoveHandleExpression(name, values)
         if cleanupExpr:
-            body += '    {}\n'.format(cleanupExpr)
-
-        return body
+            emitter.line(cleanupExpr)
     # yapf: enable
 
     #
@@ -96,10 +96,10 @@ class VulkanStateTableHeaderGenerator(BaseGenerator):
             handle_map = handle_name[0].lower() + handle_name[1:] + '_map_'
             insert_code += '    bool InsertWrapper(format::HandleId id, {0}* wrapper) {{ return InsertEntry(id, wrapper, {1}); }}\n'.format(handle_wrapper, handle_map)
             remove_code += '    bool RemoveWrapper(const {0}* wrapper) {{ return RemoveEntry(wrapper, {1}); }}\n'.format(handle_wrapper, handle_map)
-            visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ for (auto entry : {1}) {{ visitor(entry.second); }} }}\n'.format(handle_wrapper, handle_map)
+            visit_code += '    void VisitWrappers(std::function<void({0}*)> visitor) const {{ {1}.Visit(visitor); }}\n'.format(handle_wrapper, handle_map)
             get_code += '    {0}* Get{0}(format::HandleId id) {{ return GetWrapper<{0}>(id, {1}); }}\n'.format(handle_wrapper, handle_map)
             const_get_code += '    const {0}* Get{0}(format::HandleId id) const {{ return GetWrapper<{0}>(id, {1}); }}\n'.format(handle_wrapper, handle_map)
-            map_code += '    std::map<format::HandleId, {0}*> {1};\n'.format(handle_wrapper, handle_map)
+            map_code += '    HandleWrapperMap<{0}> {1};\n'.format(handle_wrapper, handle_map)
 
         self.newline()
         code = 'class VulkanStateTable : VulkanStateTableBase\n'
@@ -104,48 +104,42 @@ class VulkanStructDecodersBodyGenerator(BaseGenerator):
     def generateFeature(self):
         first = True
         for struct in self.getFilteredStructNames():
-            body = '' if first else '\n'
-            body += 'size_t DecodeStruct(const uint8_t* buffer, size_t buffer_size, Decoded_{}* wrapper)\n'.format(struct)
-            body += '{\n'
-            body += '    assert((wrapper != nullptr) && (wrapper->decoded_value != nullptr));\n'
-            body += '\n'
-            body += '    size_t bytes_read = 0;\n'
-            body += '    {}* value = wrapper->decoded_value;\n'.format(struct)
-            body += '\n'
-            body += self.makeDecodeStructBody(struct, self.featureStructMembers[struct])
-            body += '\n'
-            body += '    return bytes_read;\n'
-            body += '}'
-
-            write(body, file=self.outFile)
+            if not first:
+                self.emitter.line()
+            self.emitter.line('size_t DecodeStruct(const uint8_t* buffer, size_t buffer_size, Decoded_{}* wrapper)'.format(struct))
+            self.emitter.line('{')
+            with self.emitter.indent():
+                self.emitter.line('assert((wrapper != nullptr) && (wrapper->decoded_value != nullptr));')
+                self.emitter.line()
+                self.emitter.line('size_t bytes_read = 0;')
+                self.emitter.line('{}* value = wrapper->decoded_value;'.format(struct))
+                self.emitter.line()
+                self.emitDecodeStructBody(struct, self.featureStructMembers[struct])
+                self.emitter.line()
+                self.emitter.line('return bytes_read;')
+            self.emitter.line('}')
             first = False
     # yapf: enable
 
     #
     # Generate C++ code for the decoder method body.
     # yapf: disable
-    def makeDecodeStructBody(self, name, values):
-        body = ''
-
+    def emitDecodeStructBody(self, name, values):
         for value in values:
             # pNext fields require special treatment and are not processed by type name
             if 'pNext' in value.name:
-                body += '    bytes_read += DecodePNextStruct((buffer + bytes_read), (buffer_size - bytes_read), &(wrapper->{}));\n'.format(value.name)
-                body += '    value->pNext = wrapper->pNext ? wrapper->pNext->GetPointer() : nullptr;\n'
+                self.emitter.line('bytes_read += DecodePNextStruct((buffer + bytes_read), (buffer_size - bytes_read), &(wrapper->{}));'.format(value.name))
+                self.emitter.line('value->pNext = wrapper->pNext ? wrapper->pNext->GetPointer() : nullptr;')
             else:
-                body += self.makeDecodeInvocation(name, value)
-
-        return body
+                self.emitDecodeInvocation(name, value)
     # yapf: enable
 
     #
     # Generate the struct member decoder function call invocation.
     # yapf: disable
-    def makeDecodeInvocation(self, name, value):
+    def emitDecodeInvocation(self, name, value):
         bufferArgs = '(buffer + bytes_read), (buffer_size - bytes_read)'
 
-        body = ''
-
         isStruct = False
         isString = False
         isFuncp = False
@@ -166,54 +160,52 @@ class VulkanStructDecodersBodyGenerator(BaseGenerator):
         if value.isPointer or value.isArray:
             if typeName in self.EXTERNAL_OBJECT_TYPES and not value.isArray:
                 # Pointer to an unknown object type, encoded as a 64-bit integer ID.
-                body += '    bytes_read += ValueDecoder::DecodeAddress({}, &(wrapper->{}));\n'.format(bufferArgs, value.name)
-                body += '    value->{} = nullptr;\n'.format(value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeAddress({}, &(wrapper->{}));'.format(bufferArgs, value.name))
+                self.emitter.line('value->{} = nullptr;'.format(value.name))
             else:
                 isStaticArray = True if (value.isArray and not value.isDynamic) else False
                 accessOp = '.'
 
                 if isStruct:
-                    body += '    wrapper->{} = DecodeAllocator::Allocate<{}>();\n'.format(value.name, self.makeDecodedParamType(value))
+                    self.emitter.line('wrapper->{} = DecodeAllocator::Allocate<{}>();'.format(value.name, self.makeDecodedParamType(value)))
                     accessOp = '->'
 
                 if isStaticArray:
                     # The pointer decoder will write directly to the struct member's memory.
-                    body += '    wrapper->{name}{}SetExternalMemory(value->{name}, {arraylen});\n'.format(accessOp, name=value.name, arraylen=value.arrayCapacity)
+                    self.emitter.line('wrapper->{name}{}SetExternalMemory(value->{name}, {arraylen});'.format(accessOp, name=value.name, arraylen=value.arrayCapacity))
 
                 if isStruct or isString or isHandle:
-                    body += '    bytes_read += wrapper->{}{}Decode({});\n'.format(value.name, accessOp, bufferArgs)
+                    self.emitter.line('bytes_read += wrapper->{}{}Decode({});'.format(value.name, accessOp, bufferArgs))
                 else:
-                    body += '    bytes_read += wrapper->{}.Decode{}({});\n'.format(value.name, typeName, bufferArgs)
+                    self.emitter.line('bytes_read += wrapper->{}.Decode{}({});'.format(value.name, typeName, bufferArgs))
 
                 if not isStaticArray:
                     if isHandle:
                         # Point the real struct's member pointer to the handle pointer decoder's handle memory.
-                        body += '    value->{} = nullptr;\n'.format(value.name)
+                        self.emitter.line('value->{} = nullptr;'.format(value.name))
                     else:
                         # Point the real struct's member pointer to the pointer decoder's memory.
-                        body += '    value->{name} = wrapper->{name}{}GetPointer();\n'.format(accessOp, name=value.name)
+                        self.emitter.line('value->{name} = wrapper->{name}{}GetPointer();'.format(accessOp, name=value.name))
         else:
             if isStruct:
-                body += '    wrapper->{} = DecodeAllocator::Allocate<{}>();\n'.format(value.name, self.makeDecodedParamType(value))
-                body += '    wrapper->{name}->decoded_value = &(value->{name});\n'.format(name=value.name)
-                body += '    bytes_read += DecodeStruct({}, wrapper->{});\n'.format(bufferArgs, value.name)
+                self.emitter.line('wrapper->{} = DecodeAllocator::Allocate<{}>();'.format(value.name, self.makeDecodedParamType(value)))
+                self.emitter.line('wrapper->{name}->decoded_value = &(value->{name});'.format(name=value.name))
+                self.emitter.line('bytes_read += DecodeStruct({}, wrapper->{});'.format(bufferArgs, value.name))
             elif isFuncp:
-                body += '    bytes_read += ValueDecoder::DecodeAddress({}, &(wrapper->{}));\n'.format(bufferArgs, value.name)
-                body += '    value->{} = nullptr;\n'.format(value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeAddress({}, &(wrapper->{}));'.format(bufferArgs, value.name))
+                self.emitter.line('value->{} = nullptr;'.format(value.name))
             elif isHandle:
-                body += '    bytes_read += ValueDecoder::DecodeHandleIdValue({}, &(wrapper->{}));\n'.format(bufferArgs, value.name)
-                body += '    value->{} = VK_NULL_HANDLE;\n'.format(value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeHandleIdValue({}, &(wrapper->{}));'.format(bufferArgs, value.name))
+                self.emitter.line('value->{} = VK_NULL_HANDLE;'.format(value.name))
             elif self.isGenericStructHandleValue(name, value.name):
-                body += '    bytes_read += ValueDecoder::DecodeUInt64Value({}, &(wrapper->{}));\n'.format(bufferArgs, value.name)
-                body += '    value->{} = 0;\n'.format(value.name)
+                self.emitter.line('bytes_read += ValueDecoder::DecodeUInt64Value({}, &(wrapper->{}));'.format(bufferArgs, value.name))
+                self.emitter.line('value->{} = 0;'.format(value.name))
             elif value.bitfieldWidth:
                 # Bit fields need to be read into a tempoaray and then assigned to the struct member.
                 tempParamName = 'temp_{}'.format(value.name)
-                body += '    {} {};\n'.format(value.baseType, tempParamName)
-                body += '    bytes_read += ValueDecoder::Decode{}Value({}, &{});\n'.format(typeName, bufferArgs, tempParamName)
-                body += '    value->{} = {};\n'.format(value.name, tempParamName)
+                self.emitter.line('{} {};'.format(value.baseType, tempParamName))
+                self.emitter.line('bytes_read += ValueDecoder::Decode{}Value({}, &{});'.format(typeName, bufferArgs, tempParamName))
+                self.emitter.line('value->{} = {};'.format(value.name, tempParamName))
             else:
-                body += '    bytes_read += ValueDecoder::Decode{}Value({}, &(value->{}));\n'.format(typeName, bufferArgs, value.name)
-
-        return body
+                self.emitter.line('bytes_read += ValueDecoder::Decode{}Value({}, &(value->{}));'.format(typeName, bufferArgs, value.name))
     # yapf: enable
@@ -72,9 +72,16 @@ class VulkanStructDecodersForwardGenerator(BaseGenerator):
         write('#include "vulkan/vulkan.h"', file=self.outFile)
         self.newline()
         write('#include <cstdint>', file=self.outFile)
+        write('#include <type_traits>', file=self.outFile)
         self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(decode)', file=self.outFile)
+        self.newline()
+        write('// Identifies the decoded struct types for Vulkan structs that are encoded with the same layout as the struct,', file=self.outFile)
+        write('// allowing arrays of the structs to be decoded with a single copy.', file=self.outFile)
+        write('template <typename T>', file=self.outFile)
+        write('struct IsTriviallyDecodable : std::false_type', file=self.outFile)
+        write('{};', file=self.outFile)
     # yapf: enable
 
     # Method override
@@ -106,4 +113,16 @@ class VulkanStructDecodersForwardGenerator(BaseGenerator):
 
         for struct in self.getFilteredStructNames():
             write('size_t DecodeStruct(const uint8_t* parameter_buffer, size_t buffer_size, Decoded_{}* wrapper);'.format(struct), file=self.outFile)
+
+        trivialStructs = dict()
+        for struct in self.getFilteredStructNames():
+            size = self.getTrivialStructSize(struct, self.featureStructMembers[struct])
+            if size:
+                trivialStructs[struct] = size
+
+        if trivialStructs:
+            self.newline()
+            for struct, size in trivialStructs.items():
+                # Structs with padding do not match the encoded layout and must be decoded member by member.
+                write('template <> struct IsTriviallyDecodable<Decoded_{}> : std::integral_constant<bool, sizeof({}) == {}> {{}};'.format(struct, struct, size), file=self.outFile)
     # yapf: enable
@@ -62,6 +62,10 @@ class VulkanStructEncodersHeaderGenerator(BaseGenerator):
             diagFile=diagFile
         )
 
+        # Map of trivially encodable struct names to their encoded sizes, including structs from previously processed
+        # features, which may be nested in the structs of later features.
+        self.trivialStructSizes = dict()
+
     # Method override
     # yapf: disable
     def beginFile(self, genOpts):
@@ -74,10 +78,17 @@ class VulkanStructEncodersHeaderGenerator(BaseGenerator):
         write('#include "vulkan/vulkan.h"', file=self.outFile)
         self.newline()
         write('#include <cstdint>', file=self.outFile)
+        write('#include <type_traits>', file=self.outFile)
         self.newline()
         write('GFXRECON_BEGIN_NAMESPACE(gfxrecon)', file=self.outFile)
         write('GFXRECON_BEGIN_NAMESPACE(encode)', file=self.outFile)
         self.newline()
+        write('// Identifies the Vulkan structs that are encoded with the same layout as the struct, allowing arrays of the', file=self.outFile)
+        write('// structs to be encoded with a single write.', file=self.outFile)
+        write('template <typename T>', file=self.outFile)
+        write('struct IsTriviallyEncodable : std::false_type', file=self.outFile)
+        write('{};', file=self.outFile)
+        self.newline()
         write('void EncodePNextStruct(ParameterEncoder* encoder, const void* value);', file=self.outFile)
     # yapf: enable
 
@@ -105,4 +116,17 @@ class VulkanStructEncodersHeaderGenerator(BaseGenerator):
     def generateFeature(self):
         for struct in self.getFilteredStructNames():
             write('void EncodeStruct(ParameterEncoder* encoder, const {}& value);'.format(struct), file=self.outFile)
+
+        trivialStructs = dict()
+        for struct in self.getFilteredStructNames():
+            size = self.getTrivialStructSize(struct, self.featureStructMembers[struct], self.trivialStructSizes)
+            if size:
+                trivialStructs[struct] = size
+                self.trivialStructSizes[struct] = size
+
+        if trivialStructs:
+            self.newline()
+            for struct, size in trivialStructs.items():
+                # Structs with padding do not match the encoded layout and must be encoded member by member.
+                write('template <> struct IsTriviallyEncodable<{}> : std::integral_constant<bool, sizeof({}) == {}> {{}};'.format(struct, struct, size), file=self.outFile)
     # yapf: enable
@@ -115,10 +115,10 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
         for struct in self.getFilteredStructNames():
             if not struct in self.customImplementationRequired:
                 body = inspect.cleandoc('''
-                    template <> std::string ToString<{0}>(const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+                    template <> void ToString<{0}>(std::string& strBuf, const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
                     {{
-                        return ObjectToString(toStringFlags, tabCount, tabSize,
-                            [&](std::stringstream& strStrm)
+                        ObjectToString(strBuf, toStringFlags, tabCount, tabSize,
+                            [&](std::string& fieldBuf)
                             {{
                     '''.format(struct))
                 body += '\n'
@@ -145,18 +145,18 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
 
             # pNext requires custom handling
             if 'pNext' in value.name:
-                toString = 'PNextToString(obj.pNext, toStringFlags, tabCount, tabSize)'
+                toString = 'PNextToString(fieldBuf, obj.pNext, toStringFlags, tabCount, tabSize)'
 
             # Function pointers and void data pointers simply write the address
             elif 'pfn' in value.name or 'void' in value.fullType:
-                toString = '"\\"" + PtrToString(obj.{0}) + "\\""'
+                toString = 'QuotedPtrToString(fieldBuf, obj.{0})'
 
             # C strings require custom handling
             elif 'const char*' in value.fullType:
                 if 'const char* const*' in value.fullType:
-                    toString = 'CStrArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                    toString = 'CStrArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                 else:
-                    toString = '(obj.{0} ? ("\\"" + std::string(obj.{0}) + "\\"") : "null")'
+                    toString = 'CStrToString(fieldBuf, obj.{0})'
 
             # There's some repeated code in this if/else block...for instance, arrays of
             #   structs, enums, and primitives all route through ArrayToString()...It's
@@ -164,48 +164,49 @@ class VulkanStructToStringBodyGenerator(BaseGenerator):
             elif value.isPointer:
                 if value.isArray:
                     if self.isHandle(value.baseType):
-                        toString = 'VkHandleArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'VkHandleArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isStruct(value.baseType):
-                        toString = 'ArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = 'VkEnumArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'VkEnumArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     else:
-                        toString = 'ArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                 else:
                     if self.isHandle(value.baseType):
                         toString = 'static_assert(false, "Unhandled pointer to VkHandle in `vulkan_struct_to_string_body_generator.py`")'
                     elif self.isStruct(value.baseType):
-                        toString = '(obj.{0} ? ToString(*obj.{0}, toStringFlags, tabCount, tabSize) : "null")'
+                        toString = 'PointerToString(fieldBuf, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
                         toString = 'static_assert(false, "Unhandled pointer to VkEnum in `vulkan_struct_to_string_body_generator.py`")'
                     else:
-                        toString = '(obj.{0} ? ToString(*obj.{0}, toStringFlags, tabCount, tabSize) : "null")'
+                        toString = 'PointerToString(fieldBuf, obj.{0}, toStringFlags, tabCount, tabSize)'
             else:
                 if value.isArray:
                     if self.isHandle(value.baseType):
-                        toString = 'VkHandleArrayToString(obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'VkHandleArrayToString(fieldBuf, obj.{1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isStruct(value.baseType):
-                        toString = 'ArrayToString({1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ArrayToString(fieldBuf, {1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = 'ArrayToString({1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ArrayToString(fieldBuf, {1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif 'char' in value.baseType:
-                        toString = '\'"\' + std::string(obj.{0}) + \'"\''
+                        toString = 'CStrToString(fieldBuf, obj.{0})'
                     elif 'UUID' in value.arrayLength or 'LUID' in value.arrayLength:
-                        toString = '\'"\' + UIDToString({1}, obj.{0}) + \'"\''
+                        toString = 'QuotedUIDToString(fieldBuf, {1}, obj.{0})'
                     else:
-                        toString = 'ArrayToString({1}, obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ArrayToString(fieldBuf, {1}, obj.{0}, toStringFlags, tabCount, tabSize)'
                 else:
                     if self.isHandle(value.baseType):
-                        toString = '\'"\' + VkHandleToString(obj.{0}) + \'"\''
+                        toString = 'QuotedVkHandleToString(fieldBuf, obj.{0})'
                     elif self.isStruct(value.baseType):
-                        toString = 'ToString(obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ToString(fieldBuf, obj.{0}, toStringFlags, tabCount, tabSize)'
                     elif self.isEnum(value.baseType):
-                        toString = '\'"\' + ToString(obj.{0}, toStringFlags, tabCount, tabSize) + \'"\''
+                        toString = 'QuotedToString(fieldBuf, obj.{0}, toStringFlags, tabCount, tabSize)'
                     else:
-                        toString = 'ToString(obj.{0}, toStringFlags, tabCount, tabSize)'
+                        toString = 'ToString(fieldBuf, obj.{0}, toStringFlags, tabCount, tabSize)'
 
             firstField = 'true' if not body else 'false'
             toString = toString.format(value.name, value.arrayLength)
-            body += '            FieldToString(strStrm, {0}, "{1}", toStringFlags, tabCount, tabSize, {2});\n'.format(firstField, value.name, toString)
+            body += '            FieldToString(fieldBuf, {0}, "{1}", toStringFlags, tabCount, tabSize);\n'.format(firstField, value.name)
+            body += '            {0};\n'.format(toString)
         return body
     # yapf: enable
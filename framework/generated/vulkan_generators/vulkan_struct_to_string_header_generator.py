@@ -107,7 +107,7 @@ class VulkanStructToStringHeaderGenerator(BaseGenerator):
     # yapf: disable
     def generateFeature(self):
         for struct in self.getFilteredStructNames():
-            body = 'template <> std::string ToString<{0}>(const {0}& obj, ToStringFlags toStriingFlags, uint32_t tabCount, uint32_t tabSize);'.format(
+            body = 'template <> void ToString<{0}>(std::string& strBuf, const {0}& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize);'.format(
                 struct
             )
             write(body, file=self.outFile)
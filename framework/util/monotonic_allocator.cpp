@@ -23,6 +23,8 @@
 
 #include "util/monotonic_allocator.h"
 
+#include <algorithm>
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
@@ -39,10 +41,13 @@ void MonotonicAllocator::Clear(bool free_system_memory)
     if (free_system_memory)
     {
         memory_blocks_.clear();
+        oversized_allocations_.clear();
+        recycled_oversized_allocations_.clear();
+    }
+    else
+    {
+        RecycleOversizedAllocations();
     }
-
-    // Free oversized allocations
-    oversized_allocations_.clear();
 
     current_block_            = 0;
     current_block_free_bytes_ = block_size_;
@@ -76,14 +81,13 @@ void* MonotonicAllocator::Allocate(size_t object_bytes, size_t alignment_bytes)
         if (result == nullptr)
         {
             memory_blocks_.emplace_back(new unsigned char[block_size_]);
+            ++system_allocation_count_;
             result = AllocateToBlock(object_bytes, alignment_bytes);
         }
     }
     else
     {
-        // Custom allocation
-        oversized_allocations_.emplace_back(new unsigned char[object_bytes]);
-        result = oversized_allocations_.back().get();
+        result = AllocateOversized(object_bytes);
     }
 
     return result;
@@ -101,5 +105,57 @@ void* MonotonicAllocator::AllocateToBlock(size_t object_bytes, size_t alignment_
     return result;
 }
 
+void* MonotonicAllocator::AllocateOversized(size_t object_bytes)
+{
+    // Reuse the smallest recycled allocation that is large enough for the object.
+    auto recycled =
+        std::lower_bound(recycled_oversized_allocations_.begin(),
+                         recycled_oversized_allocations_.end(),
+                         object_bytes,
+                         [](const OversizedAllocation& allocation, size_t size) { return allocation.size < size; });
+
+    if (recycled != recycled_oversized_allocations_.end())
+    {
+        oversized_allocations_.emplace_back(std::move(*recycled));
+        recycled_oversized_allocations_.erase(recycled);
+    }
+    else
+    {
+        // Custom allocation
+        oversized_allocations_.push_back(
+            { std::unique_ptr<unsigned char[]>(new unsigned char[object_bytes]), object_bytes });
+        ++system_allocation_count_;
+    }
+
+    return oversized_allocations_.back().memory.get();
+}
+
+void MonotonicAllocator::RecycleOversizedAllocations()
+{
+    for (auto& allocation : oversized_allocations_)
+    {
+        recycled_oversized_allocations_.emplace_back(std::move(allocation));
+    }
+    oversized_allocations_.clear();
+
+    std::sort(recycled_oversized_allocations_.begin(),
+              recycled_oversized_allocations_.end(),
+              [](const OversizedAllocation& lhs, const OversizedAllocation& rhs) { return lhs.size < rhs.size; });
+
+    // Keep the smallest allocations that fit within the recycling limit, and free the rest.
+    size_t recycled_bytes = 0;
+    size_t recycled_count = 0;
+    for (const auto& allocation : recycled_oversized_allocations_)
+    {
+        if ((recycled_bytes + allocation.size) > kMaxRecycledOversizedBytes)
+        {
+            break;
+        }
+        recycled_bytes += allocation.size;
+        ++recycled_count;
+    }
+    recycled_oversized_allocations_.resize(recycled_count);
+}
+
 GFXRECON_END_NAMESPACE(util)
 GFXRECON_END_NAMESPACE(gfxrecon)
@@ -40,7 +40,7 @@ class MonotonicAllocator
     // fit requested allocations, and blocks are freed using an appropriate call to Clear or upon destruction of this
     // MonotonicAllocator
     MonotonicAllocator(size_t block_size) :
-        block_size_(block_size), current_block_(0), current_block_free_bytes_(block_size)
+        block_size_(block_size), current_block_(0), current_block_free_bytes_(block_size), system_allocation_count_(0)
     {}
 
     ~MonotonicAllocator() { Clear(true); }
@@ -70,13 +70,19 @@ class MonotonicAllocator
     }
 
     // "Frees" all previously allocated objects. Depending on free_system_memory, system memory blocks are either
-    // reused for new calls to Allocate or freed and re-created as needed. Oversized allocations are freed from system
-    // memory
+    // reused for new calls to Allocate or freed and re-created as needed. When system memory is not freed, oversized
+    // allocations are also kept for reuse by later oversized allocations of the same or smaller size, up to a total of
+    // kMaxRecycledOversizedBytes.
     void Clear(bool free_system_memory);
 
+    // Returns the number of memory blocks and oversized allocations that have been allocated from system memory.
+    size_t GetSystemAllocationCount() const { return system_allocation_count_; }
+
   private:
     void* Allocate(size_t object_bytes, size_t alignment_bytes);
     void* AllocateToBlock(size_t object_bytes, size_t alignment_bytes);
+    void* AllocateOversized(size_t object_bytes);
+    void  RecycleOversizedAllocations();
 
   private:
     struct Destructor
@@ -85,13 +91,23 @@ class MonotonicAllocator
         void (*destroy)(const void*);
     };
 
+    struct OversizedAllocation
+    {
+        std::unique_ptr<unsigned char[]> memory;
+        size_t                           size;
+    };
+
   private:
+    static const size_t kMaxRecycledOversizedBytes{ 64 * 1024 * 1024 };
+
     std::vector<std::unique_ptr<unsigned char[]>> memory_blocks_;
-    std::vector<std::unique_ptr<unsigned char[]>> oversized_allocations_;
+    std::vector<OversizedAllocation>              oversized_allocations_;
+    std::vector<OversizedAllocation>              recycled_oversized_allocations_; ///< Sorted by increasing size.
     std::vector<Destructor>                       destructors_;
     const size_t                                  block_size_;
     size_t                                        current_block_;
     size_t                                        current_block_free_bytes_;
+    size_t                                        system_allocation_count_;
 };
 
 GFXRECON_END_NAMESPACE(util)
@@ -23,10 +23,86 @@
 
 #include "util/shared_mutex.h"
 
+#include <cassert>
+
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
-thread_local std::atomic_bool SharedMutex::has_read_lock_{ false };
+thread_local std::vector<SharedMutex::ReadLockCount> SharedMutex::read_lock_counts_;
+std::atomic_size_t                                   SharedMutex::next_reader_slot_{ 0 };
+
+size_t SharedMutex::GetReaderSlot()
+{
+    // Slots are assigned round-robin, so threads only share a slot when there are more than kReaderSlotCount threads.
+    static thread_local size_t reader_slot = next_reader_slot_.fetch_add(1) % kReaderSlotCount;
+    return reader_slot;
+}
+
+size_t SharedMutex::GetReaderCount() const
+{
+    size_t reader_count = 0;
+
+    for (const auto& slot : reader_slots_)
+    {
+        reader_count += slot.count.load();
+    }
+
+    return reader_count;
+}
+
+size_t SharedMutex::GetReadLockCount() const
+{
+    for (const auto& entry : read_lock_counts_)
+    {
+        if (entry.mutex == this)
+        {
+            return entry.count;
+        }
+    }
+
+    return 0;
+}
+
+size_t& SharedMutex::GetReadLockCountRef()
+{
+    ReadLockCount* unused_entry = nullptr;
+
+    for (auto& entry : read_lock_counts_)
+    {
+        if (entry.mutex == this)
+        {
+            return entry.count;
+        }
+        else if ((entry.count == 0) && (unused_entry == nullptr))
+        {
+            unused_entry = &entry;
+        }
+    }
+
+    if (unused_entry != nullptr)
+    {
+        unused_entry->mutex = this;
+        return unused_entry->count;
+    }
+
+    read_lock_counts_.push_back({ this, 0 });
+    return read_lock_counts_.back().count;
+}
+
+void SharedMutex::RemoveReadLock()
+{
+    for (auto& entry : read_lock_counts_)
+    {
+        if (entry.mutex == this)
+        {
+            assert(entry.count > 0);
+            --entry.count;
+            return;
+        }
+    }
+
+    assert(false);
+}
 
 void SharedMutex::lock()
 {
@@ -35,40 +111,46 @@ void SharedMutex::lock()
     // Indicate to readers the writer is waiting.
     wait_for_writer_.store(true);
 
-    // Wait for readers.
-    while (reader_count_.load() > (has_read_lock_.load() ? 1u : 0u))
+    // Wait for readers, other than the read locks held by this thread.
+    const size_t read_lock_count = GetReadLockCount();
+    while (GetReaderCount() > read_lock_count)
     {
     }
 }
 
 void SharedMutex::unlock()
 {
-    writer_mutex.unlock();
+    // Clear the flag before releasing the mutex, so that it can't overwrite the flag set by the next writer.
     wait_for_writer_.store(false);
+    writer_mutex.unlock();
 }
 
 void SharedMutex::lock_shared()
 {
-    reader_count_.fetch_add(1);
-    has_read_lock_.store(true);
+    auto& reader_count = reader_slots_[GetReaderSlot()].count;
 
-    if (wait_for_writer_.load())
+    reader_count.fetch_add(1);
+
+    // A thread that already holds a read lock does not wait, as the writer is waiting for that lock to be released.
+    size_t& read_lock_count = GetReadLockCountRef();
+    if (wait_for_writer_.load() && (read_lock_count == 0))
     {
-        has_read_lock_.store(false);
-        reader_count_.fetch_sub(1);
+        reader_count.fetch_sub(1);
 
         writer_mutex.lock();
 
-        reader_count_.fetch_add(1);
-        has_read_lock_.store(true);
+        reader_count.fetch_add(1);
 
         writer_mutex.unlock();
     }
+
+    ++read_lock_count;
 }
 
 void SharedMutex::unlock_shared()
 {
-    reader_count_.fetch_sub(1);
+    RemoveReadLock();
+    reader_slots_[GetReaderSlot()].count.fetch_sub(1);
 }
 
 GFXRECON_END_NAMESPACE(util)
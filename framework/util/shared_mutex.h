@@ -27,16 +27,23 @@
 #include "util/defines.h"
 
 #include <atomic>
+#include <cstddef>
 #include <mutex>
+#include <vector>
 
 GFXRECON_BEGIN_NAMESPACE(gfxrecon)
 GFXRECON_BEGIN_NAMESPACE(util)
 
 // A shared (reader/writer) mutex implementation using std::mutex and std::atomic.
+//
+// Read locks are acquired for every intercepted API call, from every application thread, while write locks are rare.
+// To keep the read path free of contention, reader counts are spread across cache line sized slots, with each thread
+// assigned to a slot when it first acquires a read lock.  Readers only modify their own slot, and the writer sums all
+// of the slots when waiting for readers to finish.
 class SharedMutex
 {
   public:
-    SharedMutex() : reader_count_(0), wait_for_writer_(false) {}
+    SharedMutex() : wait_for_writer_(false) {}
 
     // Exclusive lock which waits for current readers in a spin lock then acquires the mutex. A thread's read lock can
     // be promoted to a write lock.
@@ -52,12 +59,46 @@ class SharedMutex
     SharedMutex& operator=(const SharedMutex&) = delete;
 
   private:
-    static thread_local std::atomic_bool has_read_lock_;
+    static const size_t kReaderSlotCount = 64;
+    static const size_t kCacheLineSize   = 64;
+
+    // The alignment also pads the slot to the size of a cache line.
+    struct alignas(kCacheLineSize) ReaderSlot
+    {
+        std::atomic_size_t count{ 0 };
+    };
+
+    struct ReadLockCount
+    {
+        const SharedMutex* mutex;
+        size_t             count;
+    };
+
+  private:
+    static size_t GetReaderSlot();
+
+    size_t GetReaderCount() const;
+
+    size_t GetReadLockCount() const;
+
+    // Returns the calling thread's read lock count for this mutex, adding an entry for the mutex if it has none.
+    size_t& GetReadLockCountRef();
+
+    void RemoveReadLock();
+
+  private:
+    // Number of read locks held by the current thread for each mutex, which an exclusive lock from the same thread does
+    // not wait for.  A thread only holds read locks on a few mutexes at a time, so the entries are searched linearly.
+    // Entries are kept when their count drops to zero, to avoid adding and removing an entry for every read lock, and
+    // are reused for other mutexes.  An entry with a count of zero has the same meaning for any mutex, so an entry for
+    // a destroyed mutex is also valid for a new mutex at the same address.
+    static thread_local std::vector<ReadLockCount> read_lock_counts_;
+    static std::atomic_size_t                      next_reader_slot_;
 
   private:
-    std::mutex         writer_mutex;
-    std::atomic_size_t reader_count_;
-    std::atomic_bool   wait_for_writer_;
+    std::mutex       writer_mutex;
+    ReaderSlot       reader_slots_[kReaderSlotCount];
+    std::atomic_bool wait_for_writer_;
 };
 
 GFXRECON_END_NAMESPACE(util)
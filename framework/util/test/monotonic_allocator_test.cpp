@@ -0,0 +1,80 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "util/monotonic_allocator.h"
+
+#include <cstdint>
+
+namespace
+{
+
+const size_t kBlockSize     = 1024;
+const size_t kOversizedSize = 4 * kBlockSize;
+
+} // namespace
+
+TEST_CASE("MonotonicAllocator reuses memory blocks after Clear", "[util][allocator]")
+{
+    gfxrecon::util::MonotonicAllocator allocator(kBlockSize);
+
+    for (int i = 0; i < 3; ++i)
+    {
+        REQUIRE(allocator.Allocate<uint32_t>(16) != nullptr);
+        REQUIRE(allocator.Allocate<uint8_t>(kBlockSize) != nullptr);
+        allocator.Clear(false);
+    }
+
+    REQUIRE(allocator.GetSystemAllocationCount() == 2);
+}
+
+TEST_CASE("MonotonicAllocator reuses oversized allocations after Clear", "[util][allocator]")
+{
+    gfxrecon::util::MonotonicAllocator allocator(kBlockSize);
+
+    uint8_t* first  = allocator.Allocate<uint8_t>(kOversizedSize);
+    uint8_t* second = allocator.Allocate<uint8_t>(kOversizedSize / 2);
+    REQUIRE(first != nullptr);
+    REQUIRE(second != nullptr);
+    REQUIRE(allocator.GetSystemAllocationCount() == 2);
+    allocator.Clear(false);
+
+    // The smallest recycled allocation that is large enough is reused.
+    REQUIRE(allocator.Allocate<uint8_t>(kOversizedSize / 2) == second);
+    REQUIRE(allocator.Allocate<uint8_t>(kOversizedSize / 2) == first);
+    REQUIRE(allocator.GetSystemAllocationCount() == 2);
+
+    // No recycled allocations are available until the next Clear.
+    REQUIRE(allocator.Allocate<uint8_t>(kOversizedSize) != nullptr);
+    REQUIRE(allocator.GetSystemAllocationCount() == 3);
+    allocator.Clear(false);
+
+    // Larger requests than any recycled allocation require new system memory.
+    REQUIRE(allocator.Allocate<uint8_t>(kOversizedSize * 2) != nullptr);
+    REQUIRE(allocator.GetSystemAllocationCount() == 4);
+
+    // Recycled allocations are released with the system memory.
+    allocator.Clear(true);
+    REQUIRE(allocator.Allocate<uint8_t>(kOversizedSize / 2) != nullptr);
+    REQUIRE(allocator.GetSystemAllocationCount() == 5);
+}
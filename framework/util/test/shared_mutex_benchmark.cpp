@@ -0,0 +1,124 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+// Capture read path microbenchmark.  The test case is hidden, and must be selected explicitly to run:
+//     gfxrecon_util_test [benchmark]
+//
+// Every intercepted API call acquires the capture manager's shared state lock and then calls down the chain through
+// the dispatch table referenced by the handle wrapper.  The benchmark mimics that sequence for command buffer
+// recording from multiple threads, with a different command buffer per thread.
+
+#include <catch2/catch.hpp>
+
+#include "util/shared_mutex.h"
+
+#include <chrono>
+#include <cstdint>
+#include <mutex>
+#include <shared_mutex>
+#include <thread>
+#include <vector>
+
+namespace
+{
+
+const size_t kCallsPerThread = 4 * 1024 * 1024;
+
+typedef void (*PFN_CmdDraw)(void*, uint32_t, uint32_t, uint32_t, uint32_t);
+
+struct BenchmarkDeviceTable
+{
+    PFN_CmdDraw CmdDraw{ nullptr };
+};
+
+struct BenchmarkCommandBufferWrapper
+{
+    void*                       handle{ nullptr };
+    const BenchmarkDeviceTable* layer_table_ref{ nullptr };
+    uint64_t                    draw_count{ 0 };
+};
+
+void CmdDraw(void* command_buffer, uint32_t, uint32_t, uint32_t, uint32_t)
+{
+    ++reinterpret_cast<BenchmarkCommandBufferWrapper*>(command_buffer)->draw_count;
+}
+
+gfxrecon::util::SharedMutex state_mutex;
+
+void RecordCommands(BenchmarkCommandBufferWrapper* wrapper)
+{
+    for (size_t i = 0; i < kCallsPerThread; ++i)
+    {
+        std::shared_lock<gfxrecon::util::SharedMutex> state_lock(state_mutex);
+        wrapper->layer_table_ref->CmdDraw(wrapper, 3, 1, 0, 0);
+    }
+}
+
+// Records commands from the specified number of threads, returning the elapsed time in nanoseconds.
+int64_t RecordFromThreads(size_t thread_count)
+{
+    BenchmarkDeviceTable                       table;
+    std::vector<BenchmarkCommandBufferWrapper> wrappers(thread_count);
+    std::vector<std::thread>                   threads;
+
+    table.CmdDraw = CmdDraw;
+    for (auto& wrapper : wrappers)
+    {
+        wrapper.handle          = &wrapper;
+        wrapper.layer_table_ref = &table;
+    }
+
+    auto start = std::chrono::high_resolution_clock::now();
+
+    for (size_t i = 0; i < thread_count; ++i)
+    {
+        threads.emplace_back(RecordCommands, &wrappers[i]);
+    }
+
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+
+    auto end = std::chrono::high_resolution_clock::now();
+
+    for (const auto& wrapper : wrappers)
+    {
+        REQUIRE(wrapper.draw_count == kCallsPerThread);
+    }
+
+    return std::chrono::duration_cast<std::chrono::nanoseconds>(end - start).count();
+}
+
+} // namespace
+
+TEST_CASE("SharedMutex read lock cost for multi-threaded command recording", "[.][benchmark][shared_mutex]")
+{
+    for (size_t thread_count : { 1, 2, 4, 8 })
+    {
+        auto elapsed = RecordFromThreads(thread_count);
+
+        WARN(thread_count << " threads recorded " << (thread_count * kCallsPerThread) << " commands in "
+                          << (elapsed / 1000000.0) << " ms, " << (static_cast<double>(elapsed) / kCallsPerThread)
+                          << " ns per command per thread");
+    }
+}
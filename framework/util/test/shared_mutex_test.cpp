@@ -0,0 +1,191 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "util/shared_mutex.h"
+
+#include <atomic>
+#include <chrono>
+#include <thread>
+#include <vector>
+
+namespace
+{
+
+const size_t kThreadCount         = 8;
+const size_t kIterationsPerThread = 10000;
+
+} // namespace
+
+TEST_CASE("SharedMutex allows concurrent readers", "[util][shared_mutex]")
+{
+    gfxrecon::util::SharedMutex mutex;
+    std::atomic_bool            reader_done{ false };
+
+    mutex.lock_shared();
+
+    // A second reader must not be blocked by the first.
+    std::thread reader([&]() {
+        mutex.lock_shared();
+        reader_done = true;
+        mutex.unlock_shared();
+    });
+    reader.join();
+
+    mutex.unlock_shared();
+
+    REQUIRE(reader_done);
+}
+
+TEST_CASE("SharedMutex exclusive lock waits for readers", "[util][shared_mutex]")
+{
+    gfxrecon::util::SharedMutex mutex;
+    std::atomic_bool            writer_done{ false };
+
+    mutex.lock_shared();
+
+    std::thread writer([&]() {
+        mutex.lock();
+        writer_done = true;
+        mutex.unlock();
+    });
+
+    std::this_thread::sleep_for(std::chrono::milliseconds(50));
+    REQUIRE(!writer_done);
+
+    mutex.unlock_shared();
+    writer.join();
+
+    REQUIRE(writer_done);
+}
+
+TEST_CASE("SharedMutex read lock can be promoted to an exclusive lock", "[util][shared_mutex]")
+{
+    gfxrecon::util::SharedMutex mutex;
+
+    mutex.lock_shared();
+    mutex.lock();
+    mutex.unlock();
+    mutex.unlock_shared();
+
+    // The mutex is still usable from other threads.
+    std::thread writer([&]() {
+        mutex.lock();
+        mutex.unlock();
+    });
+    writer.join();
+}
+
+TEST_CASE("SharedMutex tracks read locks separately for each mutex", "[util][shared_mutex]")
+{
+    gfxrecon::util::SharedMutex first_mutex;
+    gfxrecon::util::SharedMutex second_mutex;
+    std::atomic_bool            reader_locked{ false };
+    std::atomic_bool            reader_release{ false };
+    std::atomic_bool            writer_done{ false };
+    std::atomic_bool            writer_done_early{ false };
+
+    // Another thread holds a read lock on the second mutex.
+    std::thread reader([&]() {
+        second_mutex.lock_shared();
+        reader_locked = true;
+        while (!reader_release)
+        {
+            std::this_thread::yield();
+        }
+        second_mutex.unlock_shared();
+    });
+
+    while (!reader_locked)
+    {
+        std::this_thread::yield();
+    }
+
+    // A read lock held on the first mutex must not let this thread's exclusive lock of the second mutex skip the other
+    // thread's read lock.
+    first_mutex.lock_shared();
+
+    std::thread release([&]() {
+        std::this_thread::sleep_for(std::chrono::milliseconds(50));
+        writer_done_early = writer_done.load();
+        reader_release    = true;
+    });
+
+    second_mutex.lock();
+    writer_done = true;
+    second_mutex.unlock();
+
+    first_mutex.unlock_shared();
+
+    release.join();
+    reader.join();
+
+    REQUIRE(!writer_done_early);
+
+    // The exclusive lock of the first mutex does not wait for this thread's released read lock.
+    first_mutex.lock();
+    first_mutex.unlock();
+}
+
+TEST_CASE("SharedMutex excludes readers from writers across threads", "[util][shared_mutex]")
+{
+    gfxrecon::util::SharedMutex mutex;
+    size_t                      first  = 0;
+    size_t                      second = 0;
+    std::atomic_bool            mismatch{ false };
+    std::vector<std::thread>    threads;
+
+    for (size_t i = 0; i < kThreadCount; ++i)
+    {
+        threads.emplace_back([&, i]() {
+            for (size_t j = 0; j < kIterationsPerThread; ++j)
+            {
+                if (((i + j) % 8) == 0)
+                {
+                    mutex.lock();
+                    ++first;
+                    ++second;
+                    mutex.unlock();
+                }
+                else
+                {
+                    mutex.lock_shared();
+                    if (first != second)
+                    {
+                        mismatch = true;
+                    }
+                    mutex.unlock_shared();
+                }
+            }
+        });
+    }
+
+    for (auto& thread : threads)
+    {
+        thread.join();
+    }
+
+    REQUIRE(!mismatch);
+    REQUIRE(first == second);
+    REQUIRE(first == (kThreadCount * kIterationsPerThread) / 8);
+}
@@ -0,0 +1,165 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include <catch2/catch.hpp>
+
+#include "util/to_string.h"
+
+#include <cstdint>
+#include <limits>
+#include <string>
+
+struct TestObject
+{
+    uint32_t    value;
+    const char* name;
+};
+
+GFXRECON_BEGIN_NAMESPACE(gfxrecon)
+GFXRECON_BEGIN_NAMESPACE(util)
+
+template <>
+void ToString<TestObject>(
+    std::string& strBuf, const TestObject& obj, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize)
+{
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize, [&](std::string& fieldBuf) {
+        FieldToString(fieldBuf, true, "value", toStringFlags, tabCount, tabSize);
+        ToString(fieldBuf, obj.value, toStringFlags, tabCount, tabSize);
+        FieldToString(fieldBuf, false, "name", toStringFlags, tabCount, tabSize);
+        CStrToString(fieldBuf, obj.name);
+    });
+}
+
+GFXRECON_END_NAMESPACE(util)
+GFXRECON_END_NAMESPACE(gfxrecon)
+
+TEST_CASE("ObjectToString appends fields to the output buffer", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    const uint32_t values[] = { 1, 2 };
+    uint32_t       tabCount = 0;
+    std::string    strBuf   = "prefix";
+
+    ObjectToString(strBuf, kToString_Unformatted, tabCount, 4, [&](std::string& fieldBuf) {
+        FieldToString(fieldBuf, true, "a", kToString_Unformatted, tabCount, 4);
+        ToString(fieldBuf, 7, kToString_Unformatted, tabCount, 4);
+        FieldToString(fieldBuf, false, "b", kToString_Unformatted, tabCount, 4);
+        ArrayToString(fieldBuf, 2, values, kToString_Unformatted, tabCount, 4);
+    });
+
+    REQUIRE(strBuf == "prefix{\"a\":7,\"b\":[1,2]}");
+    REQUIRE(tabCount == 0);
+}
+
+TEST_CASE("ObjectToString formats nested output", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    const uint32_t values[] = { 1, 2 };
+    uint32_t       tabCount = 0;
+
+    auto str = ObjectToString(kToString_Formatted, tabCount, 4, [&](std::string& strBuf) {
+        FieldToString(strBuf, true, "a", kToString_Formatted, tabCount, 4);
+        ToString(strBuf, 7, kToString_Formatted, tabCount, 4);
+        FieldToString(strBuf, false, "b", kToString_Formatted, tabCount, 4);
+        ArrayToString(strBuf, 2, values, kToString_Formatted, tabCount, 4);
+    });
+
+    REQUIRE(str == "{\n    \"a\": 7,\n    \"b\": [\n        1,\n        2\n    ]\n}");
+}
+
+TEST_CASE("ToString appends to the output buffer", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    const TestObject  objects[] = { { 1, "one" }, { 2, nullptr } };
+    const char* const strs[]    = { "a", nullptr };
+    std::string       strBuf    = "prefix";
+
+    ToString(strBuf, 7);
+    ToString<TestObject>(strBuf, 3u);
+    QuotedToString(strBuf, 8);
+    PointerToString(strBuf, &objects[0], kToString_Unformatted);
+    PointerToString<TestObject>(strBuf, nullptr, kToString_Unformatted);
+    ArrayToString(strBuf, 2, objects, kToString_Unformatted);
+    CStrArrayToString(strBuf, 2, strs, kToString_Unformatted);
+
+    REQUIRE(strBuf == "prefix70\"8\"{\"value\":1,\"name\":\"one\"}null"
+                      "[{\"value\":1,\"name\":\"one\"},{\"value\":2,\"name\":null}][\"a\",null]");
+}
+
+TEST_CASE("ToString returns the same output as the appending overloads", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    const TestObject  object    = { 1, "one" };
+    const char* const strs[]    = { "a", "b" };
+    std::string       objectBuf = "prefix";
+    std::string       arrayBuf;
+
+    ToString(objectBuf, object);
+    CStrArrayToString(arrayBuf, 2, strs);
+
+    REQUIRE(ToString(7) == "7");
+    REQUIRE(ToString<TestObject>(3u) == "0");
+    REQUIRE("prefix" + ToString(object) == objectBuf);
+    REQUIRE(CStrArrayToString(2, strs) == arrayBuf);
+}
+
+TEST_CASE("ToString formats scalars like std::to_string", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    std::string strBuf;
+
+    ToString(strBuf, -7);
+    strBuf.push_back(',');
+    ToString(strBuf, std::numeric_limits<uint64_t>::max());
+    strBuf.push_back(',');
+    ToString(strBuf, std::numeric_limits<int64_t>::min());
+    strBuf.push_back(',');
+    ToString(strBuf, static_cast<uint8_t>(255));
+    strBuf.push_back(',');
+    ToString(strBuf, 0.5f);
+    strBuf.push_back(',');
+    ToString(strBuf, -1.25);
+
+    REQUIRE(strBuf == "-7,18446744073709551615,-9223372036854775808,255,0.500000,-1.250000");
+
+    // Values that do not fit in the stack buffer are still formatted.
+    REQUIRE(ToString(std::numeric_limits<double>::max()) == std::to_string(std::numeric_limits<double>::max()));
+}
+
+TEST_CASE("PtrToString formats addresses as hexadecimal", "[util][to_string]")
+{
+    using namespace gfxrecon::util;
+
+    const uint64_t address = 0xabc123;
+    std::string    strBuf  = "prefix";
+
+    PtrToString(strBuf, address);
+    QuotedPtrToString(strBuf, reinterpret_cast<const void*>(0x10));
+
+    REQUIRE(strBuf == "prefix0xabc123\"0x10\"");
+    REQUIRE(PtrToString(static_cast<const void*>(nullptr)) == "0x0");
+}
@@ -25,7 +25,9 @@
 
 #include "util/defines.h"
 
-#include <sstream>
+#include <cinttypes>
+#include <cstdint>
+#include <cstdio>
 #include <string>
 #include <utility>
 
@@ -41,14 +43,103 @@ enum ToStringFlagBits
 
 typedef uint32_t ToStringFlags;
 
+// The ToString() overloads that take a std::string& append to the end of the buffer, and are the ones that types
+//  specialize.  The overloads that return a std::string create a buffer and forward to them.
+// Size of the stack buffer that scalars are formatted into.  Values that do not fit, such as very large floating point
+//  values, are appended with std::to_string.
+const size_t kScalarStringBufferSize = 64;
+
+// The FormatScalar() overloads write the same text as the matching std::to_string() overloads to a caller provided
+//  buffer, returning the snprintf() result.
+inline int FormatScalar(char* buffer, size_t size, int value)
+{
+    return snprintf(buffer, size, "%d", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, unsigned value)
+{
+    return snprintf(buffer, size, "%u", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, long value)
+{
+    return snprintf(buffer, size, "%ld", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, unsigned long value)
+{
+    return snprintf(buffer, size, "%lu", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, long long value)
+{
+    return snprintf(buffer, size, "%lld", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, unsigned long long value)
+{
+    return snprintf(buffer, size, "%llu", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, float value)
+{
+    return snprintf(buffer, size, "%f", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, double value)
+{
+    return snprintf(buffer, size, "%f", value);
+}
+
+inline int FormatScalar(char* buffer, size_t size, long double value)
+{
+    return snprintf(buffer, size, "%Lf", value);
+}
+
+template <typename T>
+inline void ToString(std::string&  strBuf,
+                     const T&      obj,
+                     ToStringFlags toStringFlags = kToString_Default,
+                     uint32_t      tabCount      = 0,
+                     uint32_t      tabSize       = 4)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(toStringFlags);
+    GFXRECON_UNREFERENCED_PARAMETER(tabCount);
+    GFXRECON_UNREFERENCED_PARAMETER(tabSize);
+
+    char buffer[kScalarStringBufferSize];
+    int  length = FormatScalar(buffer, sizeof(buffer), obj);
+    if ((length >= 0) && (static_cast<size_t>(length) < sizeof(buffer)))
+    {
+        strBuf.append(buffer, static_cast<size_t>(length));
+    }
+    else
+    {
+        strBuf.append(std::to_string(obj));
+    }
+}
+
 template <typename T>
 inline std::string
 ToString(const T& obj, ToStringFlags toStringFlags = kToString_Default, uint32_t tabCount = 0, uint32_t tabSize = 4)
 {
+    std::string strBuf;
+    ToString(strBuf, obj, toStringFlags, tabCount, tabSize);
+    return strBuf;
+}
+
+template <typename T>
+inline void ToString(std::string&  strBuf,
+                     uint32_t      apiFlags,
+                     ToStringFlags toStringFlags = kToString_Default,
+                     uint32_t      tabCount      = 0,
+                     uint32_t      tabSize       = 4)
+{
+    GFXRECON_UNREFERENCED_PARAMETER(apiFlags);
     GFXRECON_UNREFERENCED_PARAMETER(toStringFlags);
     GFXRECON_UNREFERENCED_PARAMETER(tabCount);
     GFXRECON_UNREFERENCED_PARAMETER(tabSize);
-    return std::to_string(obj);
+    strBuf.push_back('0');
 }
 
 template <typename T>
@@ -57,19 +148,83 @@ inline std::string ToString(uint32_t      apiFlags,
                             uint32_t      tabCount      = 0,
                             uint32_t      tabSize       = 4)
 {
-    GFXRECON_UNREFERENCED_PARAMETER(apiFlags);
-    GFXRECON_UNREFERENCED_PARAMETER(toStringFlags);
-    GFXRECON_UNREFERENCED_PARAMETER(tabCount);
-    GFXRECON_UNREFERENCED_PARAMETER(tabSize);
-    return "0";
+    std::string strBuf;
+    ToString<T>(strBuf, apiFlags, toStringFlags, tabCount, tabSize);
+    return strBuf;
+}
+
+template <typename T>
+inline void QuotedToString(std::string&  strBuf,
+                           const T&      obj,
+                           ToStringFlags toStringFlags = kToString_Default,
+                           uint32_t      tabCount      = 0,
+                           uint32_t      tabSize       = 4)
+{
+    strBuf.push_back('"');
+    ToString(strBuf, obj, toStringFlags, tabCount, tabSize);
+    strBuf.push_back('"');
+}
+
+// Appends the address as hexadecimal digits with a 0x prefix.
+template <typename PtrType>
+inline void PtrToString(std::string& strBuf, PtrType ptr)
+{
+    char buffer[kScalarStringBufferSize];
+    int  length = snprintf(
+        buffer, sizeof(buffer), "0x%" PRIxPTR, reinterpret_cast<uintptr_t>(reinterpret_cast<const void*>(ptr)));
+    if (length > 0)
+    {
+        strBuf.append(buffer, static_cast<size_t>(length));
+    }
 }
 
 template <typename PtrType>
 inline std::string PtrToString(PtrType ptr)
 {
-    std::stringstream strStrm;
-    strStrm << "0x" << reinterpret_cast<const void*>(ptr);
-    return strStrm.str();
+    std::string strBuf;
+    PtrToString(strBuf, ptr);
+    return strBuf;
+}
+
+template <typename PtrType>
+inline void QuotedPtrToString(std::string& strBuf, PtrType ptr)
+{
+    strBuf.push_back('"');
+    PtrToString(strBuf, ptr);
+    strBuf.push_back('"');
+}
+
+// Appends the object that pObj points to, or null.
+template <typename T>
+inline void PointerToString(std::string&  strBuf,
+                            const T*      pObj,
+                            ToStringFlags toStringFlags = kToString_Default,
+                            uint32_t      tabCount      = 0,
+                            uint32_t      tabSize       = 4)
+{
+    if (pObj)
+    {
+        ToString(strBuf, *pObj, toStringFlags, tabCount, tabSize);
+    }
+    else
+    {
+        strBuf.append("null");
+    }
+}
+
+// Appends a C string surrounded by double quotes, or null.
+inline void CStrToString(std::string& strBuf, const char* str)
+{
+    if (str)
+    {
+        strBuf.push_back('"');
+        strBuf.append(str);
+        strBuf.push_back('"');
+    }
+    else
+    {
+        strBuf.append("null");
+    }
 }
 
 inline std::string GetNewlineString(ToStringFlags toStringFlags)
@@ -87,66 +242,139 @@ inline std::string GetTabString(ToStringFlags toStringFlags, uint32_t tabCount,
     return GetWhitespaceString(toStringFlags, tabCount * tabSize);
 }
 
+// The Append functions write directly to the end of an output buffer, without creating temporary strings.
+inline void AppendNewline(std::string& strBuf, ToStringFlags toStringFlags)
+{
+    if (toStringFlags & kToString_Formatted)
+    {
+        strBuf.push_back('\n');
+    }
+}
+
+inline void AppendWhitespace(std::string& strBuf, ToStringFlags toStringFlags, uint32_t count = 1)
+{
+    if (toStringFlags & kToString_Formatted)
+    {
+        strBuf.append((size_t)count, ' ');
+    }
+}
+
+inline void AppendTab(std::string& strBuf, ToStringFlags toStringFlags, uint32_t tabCount, uint32_t tabSize = 4)
+{
+    AppendWhitespace(strBuf, toStringFlags, tabCount * tabSize);
+}
+
+// Appends an object to the end of strBuf.  The toStringFunction appends the object's fields to the same buffer.
 template <typename ToStringFunctionType>
-inline std::string
-ObjectToString(ToStringFlags toStringFlags, uint32_t& tabCount, uint32_t tabSize, ToStringFunctionType toStringFunction)
+inline void ObjectToString(std::string&         strBuf,
+                           ToStringFlags        toStringFlags,
+                           uint32_t&            tabCount,
+                           uint32_t             tabSize,
+                           ToStringFunctionType toStringFunction)
 {
-    std::stringstream strStrm;
-    strStrm << '{';
-    strStrm << GetNewlineString(toStringFlags);
+    strBuf.push_back('{');
+    AppendNewline(strBuf, toStringFlags);
     ++tabCount;
-    toStringFunction(strStrm);
+    toStringFunction(strBuf);
     --tabCount;
-    strStrm << GetNewlineString(toStringFlags);
-    strStrm << GetTabString(toStringFlags, tabCount, tabSize);
-    strStrm << '}';
-    return strStrm.str();
+    AppendNewline(strBuf, toStringFlags);
+    AppendTab(strBuf, toStringFlags, tabCount, tabSize);
+    strBuf.push_back('}');
+}
+
+template <typename ToStringFunctionType>
+inline std::string
+ObjectToString(ToStringFlags toStringFlags, uint32_t& tabCount, uint32_t tabSize, ToStringFunctionType toStringFunction)
+{
+    std::string strBuf;
+    ObjectToString(strBuf, toStringFlags, tabCount, tabSize, toStringFunction);
+    return strBuf;
 }
 
-inline void FieldToString(std::stringstream& strStrm,
-                          bool               firstField,
-                          const std::string& fieldName,
-                          ToStringFlags      toStringFlags,
-                          uint32_t           tabCount,
-                          uint32_t           tabSize,
-                          const std::string& fieldString)
+// Appends the separator and name for an object field.  The caller appends the field's value after it.
+inline void FieldToString(std::string&  strBuf,
+                          bool          firstField,
+                          const char*   fieldName,
+                          ToStringFlags toStringFlags,
+                          uint32_t      tabCount,
+                          uint32_t      tabSize)
 {
     if (!firstField)
     {
-        strStrm << ',' << GetNewlineString(toStringFlags);
+        strBuf.push_back(',');
+        AppendNewline(strBuf, toStringFlags);
     }
-    strStrm << GetTabString(toStringFlags, tabCount, tabSize);
-    strStrm << "\"" << fieldName << "\":";
-    strStrm << GetWhitespaceString(toStringFlags);
-    strStrm << fieldString;
+    AppendTab(strBuf, toStringFlags, tabCount, tabSize);
+    strBuf.push_back('"');
+    strBuf.append(fieldName);
+    strBuf.append("\":");
+    AppendWhitespace(strBuf, toStringFlags);
 }
 
+// Appends an array to the end of strBuf.  The toStringFunction appends the element at a given index to the same buffer.
 template <typename ObjectType, typename ValidateArrayFunctionType, typename ToStringFunctionType>
-inline std::string ArrayToString(uint32_t                  count,
-                                 const ObjectType*         pObjs,
-                                 ToStringFlags             toStringFlags,
-                                 uint32_t                  tabCount,
-                                 uint32_t                  tabSize,
-                                 ValidateArrayFunctionType validateArrayFunction,
-                                 ToStringFunctionType      toStringFunction)
+inline void ArrayToString(std::string&              strBuf,
+                          uint32_t                  count,
+                          const ObjectType*         pObjs,
+                          ToStringFlags             toStringFlags,
+                          uint32_t                  tabCount,
+                          uint32_t                  tabSize,
+                          ValidateArrayFunctionType validateArrayFunction,
+                          ToStringFunctionType      toStringFunction)
 {
-    std::stringstream strStrm;
-    strStrm << '[';
+    strBuf.push_back('[');
     if (count && validateArrayFunction())
     {
-        strStrm << GetNewlineString(toStringFlags);
+        AppendNewline(strBuf, toStringFlags);
         for (uint32_t i = 0; i < count; ++i)
         {
             if (i)
             {
-                strStrm << ',' << GetNewlineString(toStringFlags);
+                strBuf.push_back(',');
+                AppendNewline(strBuf, toStringFlags);
             }
-            strStrm << GetTabString(toStringFlags, tabCount + 1, tabSize) << toStringFunction(i);
+            AppendTab(strBuf, toStringFlags, tabCount + 1, tabSize);
+            toStringFunction(strBuf, i);
         }
-        strStrm << GetNewlineString(toStringFlags) << GetTabString(toStringFlags, tabCount, tabSize);
+        AppendNewline(strBuf, toStringFlags);
+        AppendTab(strBuf, toStringFlags, tabCount, tabSize);
     }
-    strStrm << ']';
-    return strStrm.str();
+    strBuf.push_back(']');
+}
+
+template <typename ObjectType, typename ValidateArrayFunctionType, typename ToStringFunctionType>
+inline std::string ArrayToString(uint32_t                  count,
+                                 const ObjectType*         pObjs,
+                                 ToStringFlags             toStringFlags,
+                                 uint32_t                  tabCount,
+                                 uint32_t                  tabSize,
+                                 ValidateArrayFunctionType validateArrayFunction,
+                                 ToStringFunctionType      toStringFunction)
+{
+    std::string strBuf;
+    ArrayToString(strBuf, count, pObjs, toStringFlags, tabCount, tabSize, validateArrayFunction, toStringFunction);
+    return strBuf;
+}
+
+template <typename T>
+inline void ArrayToString(std::string&  strBuf,
+                          uint32_t      count,
+                          const T*      pObjs,
+                          ToStringFlags toStringFlags = kToString_Default,
+                          uint32_t      tabCount      = 0,
+                          uint32_t      tabSize       = 4)
+{
+    ArrayToString(
+        strBuf,
+        count,
+        pObjs,
+        toStringFlags,
+        tabCount,
+        tabSize,
+        [&]() { return pObjs != nullptr; },
+        [&](std::string& elementBuf, uint32_t i) {
+            ToString(elementBuf, pObjs[i], toStringFlags, tabCount + 1, tabSize);
+        });
 }
 
 template <typename T>
@@ -156,14 +384,27 @@ inline std::string ArrayToString(uint32_t      count,
                                  uint32_t      tabCount      = 0,
                                  uint32_t      tabSize       = 4)
 {
-    return ArrayToString(
+    std::string strBuf;
+    ArrayToString(strBuf, count, pObjs, toStringFlags, tabCount, tabSize);
+    return strBuf;
+}
+
+inline void CStrArrayToString(std::string&       strBuf,
+                              uint32_t           count,
+                              const char* const* ppStrs,
+                              ToStringFlags      toStringFlags = kToString_Default,
+                              uint32_t           tabCount      = 0,
+                              uint32_t           tabSize       = 4)
+{
+    ArrayToString(
+        strBuf,
         count,
-        pObjs,
+        ppStrs,
         toStringFlags,
         tabCount,
         tabSize,
-        [&]() { return pObjs != nullptr; },
-        [&](uint32_t i) { return ToString(pObjs[i], toStringFlags, tabCount + 1, tabSize); });
+        [&]() { return ppStrs != nullptr; },
+        [&](std::string& elementBuf, uint32_t i) { CStrToString(elementBuf, ppStrs[i]); });
 }
 
 inline std::string CStrArrayToString(uint32_t           count,
@@ -172,14 +413,9 @@ inline std::string CStrArrayToString(uint32_t           count,
                                      uint32_t           tabCount      = 0,
                                      uint32_t           tabSize       = 4)
 {
-    return ArrayToString(
-        count,
-        ppStrs,
-        toStringFlags,
-        tabCount,
-        tabSize,
-        [&]() { return ppStrs != nullptr; },
-        [&](uint32_t i) { return ppStrs[i] ? ('"' + std::string(ppStrs[i]) + '"') : "null"; });
+    std::string strBuf;
+    CStrArrayToString(strBuf, count, ppStrs, toStringFlags, tabCount, tabSize);
+    return strBuf;
 }
 
 GFXRECON_END_NAMESPACE(util)
@@ -203,11 +203,11 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetInstanceProcAddr(VkInstance instance
     {
         // Only check for a layer implementation of the requested function if it is available from the next level, or if
         // the instance handle is null and we can't determine if it is available from the next level.
-        const auto entry = func_table.find(pName);
+        const auto layer_func = GetLayerFunc(pName);
 
-        if (entry != func_table.end())
+        if (layer_func != nullptr)
         {
-            result = entry->second;
+            result = layer_func;
         }
     }
 
@@ -229,10 +229,10 @@ VKAPI_ATTR PFN_vkVoidFunction VKAPI_CALL GetDeviceProcAddr(VkDevice device, cons
             {
                 // Only check for a layer implementation of the requested function if it is available from the next
                 // level.
-                const auto entry = func_table.find(pName);
-                if (entry != func_table.end())
+                const auto layer_func = GetLayerFunc(pName);
+                if (layer_func != nullptr)
                 {
-                    result = entry->second;
+                    result = layer_func;
                 }
             }
         }
@@ -0,0 +1,159 @@
+/*
+** Copyright (c) 2021 LunarG, Inc.
+**
+** Permission is hereby granted, free of charge, to any person obtaining a
+** copy of this software and associated documentation files (the "Software"),
+** to deal in the Software without restriction, including without limitation
+** the rights to use, copy, modify, merge, publish, distribute, sublicense,
+** and/or sell copies of the Software, and to permit persons to whom the
+** Software is furnished to do so, subject to the following conditions:
+**
+** The above copyright notice and this permission notice shall be included in
+** all copies or substantial portions of the Software.
+**
+** THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+** IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+** FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+** AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+** LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+** FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
+** DEALINGS IN THE SOFTWARE.
+*/
+
+#include "project_version.h"
+
+#include "decode/block_index.h"
+#include "decode/file_processor.h"
+#include "format/format.h"
+#include "util/argument_parser.h"
+#include "util/logging.h"
+
+#include "vulkan/vulkan.h"
+
+#include <cinttypes>
+#include <cstdlib>
+#include <string>
+
+const char kHelpShortOption[] = "-h";
+const char kHelpLongOption[]  = "--help";
+const char kVersionOption[]   = "--version";
+const char kNoDebugPopup[]    = "--no-debug-popup";
+
+const char kOptions[] = "-h|--help,--version,--no-debug-popup";
+
+static void PrintUsage(const char* exe_name)
+{
+    std::string app_name     = exe_name;
+    size_t      dir_location = app_name.find_last_of("/\\");
+    if (dir_location >= 0)
+    {
+        app_name.replace(0, dir_location + 1, "");
+    }
+    GFXRECON_WRITE_CONSOLE("\n%s - Write a block index file for a GFXReconstruct capture file.\n", app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("Usage:");
+    GFXRECON_WRITE_CONSOLE("  %s [-h | --help] [--version] <file>\n", app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("Required arguments:");
+    GFXRECON_WRITE_CONSOLE("  <file>\t\tThe GFXReconstruct capture file to be indexed.  The");
+    GFXRECON_WRITE_CONSOLE("        \t\tindex is written to <file>%s.", GFXRECON_BLOCK_INDEX_FILE_EXTENSION);
+    GFXRECON_WRITE_CONSOLE("Optional arguments:");
+    GFXRECON_WRITE_CONSOLE("  -h\t\t\tPrint usage information and exit (same as --help).");
+    GFXRECON_WRITE_CONSOLE("  --version\t\tPrint version information and exit.");
+#if defined(WIN32) && defined(_DEBUG)
+    GFXRECON_WRITE_CONSOLE("  --no-debug-popup\tDisable the 'Abort, Retry, Ignore' message box");
+    GFXRECON_WRITE_CONSOLE("        \t\tdisplayed when abort() is called (Windows debug only).");
+#endif
+}
+
+static bool CheckOptionPrintUsage(const char* exe_name, const gfxrecon::util::ArgumentParser& arg_parser)
+{
+    if (arg_parser.IsOptionSet(kHelpShortOption) || arg_parser.IsOptionSet(kHelpLongOption))
+    {
+        PrintUsage(exe_name);
+        return true;
+    }
+
+    return false;
+}
+
+static bool CheckOptionPrintVersion(const char* exe_name, const gfxrecon::util::ArgumentParser& arg_parser)
+{
+    if (arg_parser.IsOptionSet(kVersionOption))
+    {
+        std::string app_name     = exe_name;
+        size_t      dir_location = app_name.find_last_of("/\\");
+
+        if (dir_location >= 0)
+        {
+            app_name.replace(0, dir_location + 1, "");
+        }
+
+        GFXRECON_WRITE_CONSOLE("%s version info:", app_name.c_str());
+        GFXRECON_WRITE_CONSOLE("  GFXReconstruct Version %s", GFXRECON_PROJECT_VERSION_STRING);
+        GFXRECON_WRITE_CONSOLE("  Vulkan Header Version %u.%u.%u",
+                               VK_VERSION_MAJOR(VK_HEADER_VERSION_COMPLETE),
+                               VK_VERSION_MINOR(VK_HEADER_VERSION_COMPLETE),
+                               VK_VERSION_PATCH(VK_HEADER_VERSION_COMPLETE));
+
+        return true;
+    }
+
+    return false;
+}
+
+int main(int argc, const char** argv)
+{
+    gfxrecon::util::Log::Init();
+
+    gfxrecon::util::ArgumentParser arg_parser(argc, argv, kOptions, "");
+
+    if (CheckOptionPrintUsage(argv[0], arg_parser) || CheckOptionPrintVersion(argv[0], arg_parser))
+    {
+        gfxrecon::util::Log::Release();
+        exit(0);
+    }
+    else if (arg_parser.IsInvalid() || (arg_parser.GetPositionalArgumentsCount() != 1))
+    {
+        PrintUsage(argv[0]);
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+    else
+    {
+#if defined(WIN32) && defined(_DEBUG)
+        if (arg_parser.IsOptionSet(kNoDebugPopup))
+        {
+            _set_abort_behavior(0, _WRITE_ABORT_MSG | _CALL_REPORTFAULT);
+        }
+#endif
+    }
+
+    const std::vector<std::string>& positional_arguments = arg_parser.GetPositionalArguments();
+    std::string                     input_filename       = positional_arguments[0];
+    gfxrecon::decode::FileProcessor file_processor;
+    gfxrecon::decode::BlockIndex    block_index;
+
+    std::string index_filename = gfxrecon::decode::BlockIndex::GetIndexFilename(input_filename);
+
+    if (!file_processor.Initialize(input_filename) || !file_processor.BuildBlockIndex(&block_index) ||
+        !block_index.WriteFile(index_filename))
+    {
+        GFXRECON_WRITE_CONSOLE("Failed to write block index file %s", index_filename.c_str());
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+
+    GFXRECON_WRITE_CONSOLE("Wrote block index file %s", index_filename.c_str());
+    GFXRECON_WRITE_CONSOLE("\tBlocks: %" PRIu64, block_index.GetBlockCount());
+    GFXRECON_WRITE_CONSOLE("\tFrames: %u", block_index.GetFrameCount());
+
+    auto state_marker_blocks = block_index.GetStateMarkerBlocks();
+    if (!state_marker_blocks.empty())
+    {
+        GFXRECON_WRITE_CONSOLE("\tState snapshot: blocks %" PRIu64 " to %" PRIu64,
+                               state_marker_blocks.front(),
+                               state_marker_blocks.back());
+    }
+
+    gfxrecon::util::Log::Release();
+    return 0;
+}
@@ -23,15 +23,18 @@
 #include "project_version.h"
 
 #include "decode/file_processor.h"
+#include "decode/pnext_struct_decode_table.h"
 #include "format/format.h"
 #include "format/format_util.h"
 #include "generated/generated_vulkan_consumer.h"
 #include "generated/generated_vulkan_decoder.h"
+#include "generated/generated_vulkan_enum_to_string.h"
 #include "util/argument_parser.h"
 #include "util/logging.h"
 
 #include "vulkan/vulkan.h"
 
+#include <algorithm>
 #include <cassert>
 #include <cstdlib>
 #include <limits>
@@ -476,6 +479,10 @@ int main(int argc, const char** argv)
 
         decoder.AddConsumer(&stats_consumer);
 
+        gfxrecon::decode::PNextStructDecodeTable& pnext_decode_table = gfxrecon::decode::GetPNextStructDecodeTable();
+        pnext_decode_table.ResetStatistics();
+        pnext_decode_table.EnableStatistics(true);
+
         file_processor.AddDecoder(&decoder);
         file_processor.ProcessAllFrames();
 
@@ -570,6 +577,30 @@ int main(int argc, const char** argv)
             GFXRECON_WRITE_CONSOLE("\tTotal graphics pipelines: %" PRIu64, stats_consumer.GetGraphicsPipelineCount());
             GFXRECON_WRITE_CONSOLE("\tTotal compute pipelines: %" PRIu64, stats_consumer.GetComputePipelineCount());
 
+            auto     pnext_statistics   = pnext_decode_table.GetStatistics();
+            uint64_t unrecognized_count = pnext_decode_table.GetUnrecognizedCount();
+            if (!pnext_statistics.empty() || (unrecognized_count > 0))
+            {
+                // Most frequently decoded struct types first.
+                std::stable_sort(
+                    pnext_statistics.begin(),
+                    pnext_statistics.end(),
+                    [](const std::pair<VkStructureType, uint64_t>& lhs,
+                       const std::pair<VkStructureType, uint64_t>& rhs) { return lhs.second > rhs.second; });
+
+                GFXRECON_WRITE_CONSOLE("\npNext struct info:");
+                for (const auto& entry : pnext_statistics)
+                {
+                    GFXRECON_WRITE_CONSOLE(
+                        "\t%s: %" PRIu64, gfxrecon::util::ToString(entry.first).c_str(), entry.second);
+                }
+
+                if (unrecognized_count > 0)
+                {
+                    GFXRECON_WRITE_CONSOLE("\tUnrecognized struct types: %" PRIu64, unrecognized_count);
+                }
+            }
+
             // TODO: This is the number of recorded draw calls, which will not reflect the number of draw calls executed
             // when recorded once to a command buffer that is submitted/replayed more than once.
             // GFXRECON_WRITE_CONSOLE("\nDraw/dispatch call info:");
@@ -23,7 +23,10 @@
 
 #include "project_version.h"
 
+#include "decode/api_call_filter.h"
+#include "decode/block_index.h"
 #include "decode/file_processor.h"
+#include "decode/vulkan_parallel_ascii_decoder.h"
 #include "format/format.h"
 #include "generated/generated_vulkan_ascii_consumer.h"
 #include "generated/generated_vulkan_decoder.h"
@@ -33,13 +36,26 @@
 #include "vulkan/vulkan_core.h"
 
 #include <cstdlib>
+#include <exception>
+#include <limits>
+#include <sstream>
+#include <string>
+#include <vector>
 
 const char kHelpShortOption[] = "-h";
 const char kHelpLongOption[]  = "--help";
 const char kVersionOption[]   = "--version";
 const char kNoDebugPopup[]    = "--no-debug-popup";
+const char kThreadsArgument[]   = "--threads";
+const char kCallsArgument[]     = "--calls";
+const char kThreadIdsArgument[] = "--thread-ids";
+const char kFramesArgument[]    = "--frames";
+const char kHandleIdsArgument[] = "--handle-ids";
 
-const char kOptions[] = "-h|--help,--version,--no-debug-popup";
+const uint32_t kMaxThreadCount = 64;
+
+const char kOptions[]   = "-h|--help,--version,--no-debug-popup";
+const char kArguments[] = "--threads,--calls,--thread-ids,--frames,--handle-ids";
 
 static void PrintUsage(const char* exe_name)
 {
@@ -51,13 +67,29 @@ static void PrintUsage(const char* exe_name)
     }
     GFXRECON_WRITE_CONSOLE("\n%s - A tool to convert GFXReconstruct capture files to text.\n", app_name.c_str());
     GFXRECON_WRITE_CONSOLE("Usage:");
-    GFXRECON_WRITE_CONSOLE("  %s [-h | --help] [--version] <file>\n", app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("  %s [-h | --help] [--version] [--threads <count>] [--calls <names>]", app_name.c_str());
+    GFXRECON_WRITE_CONSOLE("\t\t[--thread-ids <ids>] [--frames <first-last>] [--handle-ids <ids>] <file>\n");
     GFXRECON_WRITE_CONSOLE("Required arguments:");
     GFXRECON_WRITE_CONSOLE("  <file>\t\tPath to the GFXReconstruct capture file to be converted");
     GFXRECON_WRITE_CONSOLE("        \t\tto text.");
     GFXRECON_WRITE_CONSOLE("\nOptional arguments:");
     GFXRECON_WRITE_CONSOLE("  -h\t\t\tPrint usage information and exit (same as --help).");
     GFXRECON_WRITE_CONSOLE("  --version\t\tPrint version information and exit.");
+    GFXRECON_WRITE_CONSOLE("  --threads <count>\tNumber of worker threads used to convert API calls to");
+    GFXRECON_WRITE_CONSOLE("        \t\ttext.  The output is identical for any thread count.  The");
+    GFXRECON_WRITE_CONSOLE("        \t\tcount must be between 1 and %u.  Default is 1, which", kMaxThreadCount);
+    GFXRECON_WRITE_CONSOLE("        \t\tconverts the file on the main thread.");
+    GFXRECON_WRITE_CONSOLE("  --calls <names>\tOnly convert API calls with names that match one of the");
+    GFXRECON_WRITE_CONSOLE("        \t\tcomma separated names, which may contain '*' and '?'");
+    GFXRECON_WRITE_CONSOLE("        \t\twildcards (e.g. vkQueueSubmit*,vkCmdDraw*).");
+    GFXRECON_WRITE_CONSOLE("  --thread-ids <ids>\tOnly convert API calls from one of the comma separated");
+    GFXRECON_WRITE_CONSOLE("        \t\tcapture thread IDs.");
+    GFXRECON_WRITE_CONSOLE("  --frames <first-last>\tOnly convert API calls from the frame range, where");
+    GFXRECON_WRITE_CONSOLE("        \t\tthe first frame is frame 1.  A single frame number");
+    GFXRECON_WRITE_CONSOLE("        \t\tconverts one frame.");
+    GFXRECON_WRITE_CONSOLE("  --handle-ids <ids>\tOnly convert API calls with handle parameters or handle");
+    GFXRECON_WRITE_CONSOLE("        \t\tstruct members that reference one of the comma separated");
+    GFXRECON_WRITE_CONSOLE("        \t\thandle IDs.");
 #if defined(WIN32) && defined(_DEBUG)
     GFXRECON_WRITE_CONSOLE("  --no-debug-popup\tDisable the 'Abort, Retry, Ignore' message box");
     GFXRECON_WRITE_CONSOLE("        \t\tdisplayed when abort() is called (Windows debug only).");
@@ -100,11 +132,166 @@ static bool CheckOptionPrintVersion(const char* exe_name, const gfxrecon::util::
     return false;
 }
 
+// Returns false if the thread count is invalid.
+static bool GetThreadCount(const gfxrecon::util::ArgumentParser& arg_parser, uint32_t* thread_count)
+{
+    const auto& value = arg_parser.GetArgumentValue(kThreadsArgument);
+
+    *thread_count = 1;
+
+    if (!value.empty())
+    {
+        long long count = 0;
+
+        try
+        {
+            size_t end = 0;
+            count      = std::stoll(value, &end);
+
+            if (end != value.size())
+            {
+                count = 0;
+            }
+        }
+        catch (std::exception&)
+        {
+            count = 0;
+        }
+
+        if (count <= 0)
+        {
+            GFXRECON_LOG_ERROR("Invalid thread count \"%s\", which must be a number greater than 0", value.c_str());
+            return false;
+        }
+
+        if (count > kMaxThreadCount)
+        {
+            GFXRECON_LOG_WARNING("Thread count %lld exceeds the maximum of %u threads, which will be used instead",
+                                 count,
+                                 kMaxThreadCount);
+            count = kMaxThreadCount;
+        }
+
+        *thread_count = static_cast<uint32_t>(count);
+    }
+
+    return true;
+}
+
+static std::vector<std::string> SplitArgumentValue(const std::string& value)
+{
+    std::vector<std::string> values;
+    std::istringstream       value_input(value);
+
+    for (std::string entry; std::getline(value_input, entry, ',');)
+    {
+        if (!entry.empty())
+        {
+            values.push_back(entry);
+        }
+    }
+
+    return values;
+}
+
+// Returns false if the frame number is not a number between 1 and UINT32_MAX.
+static bool GetFrameNumber(const std::string& value, uint32_t* frame_number)
+{
+    long long number = 0;
+
+    try
+    {
+        size_t end = 0;
+        number     = std::stoll(value, &end);
+
+        if (end != value.size())
+        {
+            number = 0;
+        }
+    }
+    catch (std::exception&)
+    {
+        number = 0;
+    }
+
+    if ((number <= 0) || (number > std::numeric_limits<uint32_t>::max()))
+    {
+        return false;
+    }
+
+    *frame_number = static_cast<uint32_t>(number);
+    return true;
+}
+
+// Returns false if the filter options are invalid.
+static bool GetApiCallFilter(const gfxrecon::util::ArgumentParser& arg_parser,
+                             gfxrecon::decode::ApiCallFilter*      filter,
+                             bool*                                 filter_enabled)
+{
+    *filter_enabled = false;
+
+    try
+    {
+        for (const auto& name : SplitArgumentValue(arg_parser.GetArgumentValue(kCallsArgument)))
+        {
+            filter->AddApiCallNamePattern(name);
+            *filter_enabled = true;
+        }
+
+        for (const auto& thread_id : SplitArgumentValue(arg_parser.GetArgumentValue(kThreadIdsArgument)))
+        {
+            filter->AddThreadId(std::stoull(thread_id));
+            *filter_enabled = true;
+        }
+
+        for (const auto& handle_id : SplitArgumentValue(arg_parser.GetArgumentValue(kHandleIdsArgument)))
+        {
+            filter->AddHandleId(std::stoull(handle_id));
+            *filter_enabled = true;
+        }
+
+        const auto& frames = arg_parser.GetArgumentValue(kFramesArgument);
+        if (!frames.empty())
+        {
+            size_t   separator   = frames.find('-');
+            uint32_t first_frame = 0;
+            uint32_t last_frame  = 0;
+            bool     valid       = GetFrameNumber(frames.substr(0, separator), &first_frame);
+
+            if (separator == std::string::npos)
+            {
+                last_frame = first_frame;
+            }
+            else
+            {
+                valid = valid && GetFrameNumber(frames.substr(separator + 1), &last_frame);
+            }
+
+            if (!valid || (first_frame > last_frame))
+            {
+                GFXRECON_LOG_ERROR("Invalid frame range \"%s\"", frames.c_str());
+                return false;
+            }
+
+            // The FileProcessor frame numbering starts at 0.
+            filter->SetFrameRange(first_frame - 1, last_frame - 1);
+            *filter_enabled = true;
+        }
+    }
+    catch (std::exception&)
+    {
+        GFXRECON_LOG_ERROR("Invalid API call filter value, which must be a comma separated list of numbers");
+        return false;
+    }
+
+    return true;
+}
+
 int main(int argc, const char** argv)
 {
     gfxrecon::util::Log::Init();
 
-    gfxrecon::util::ArgumentParser arg_parser(argc, argv, kOptions, "");
+    gfxrecon::util::ArgumentParser arg_parser(argc, argv, kOptions, kArguments);
 
     if (CheckOptionPrintUsage(argv[0], arg_parser) || CheckOptionPrintVersion(argv[0], arg_parser))
     {
@@ -138,17 +325,61 @@ int main(int argc, const char** argv)
 
     output_filename += ".txt";
 
+    gfxrecon::decode::ApiCallFilter api_call_filter;
+    bool                            api_call_filter_enabled = false;
+    if (!GetApiCallFilter(arg_parser, &api_call_filter, &api_call_filter_enabled))
+    {
+        PrintUsage(argv[0]);
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+
+    uint32_t thread_count = 1;
+    if (!GetThreadCount(arg_parser, &thread_count))
+    {
+        PrintUsage(argv[0]);
+        gfxrecon::util::Log::Release();
+        exit(-1);
+    }
+
     gfxrecon::decode::FileProcessor file_processor;
     if (file_processor.Initialize(input_filename))
     {
-        gfxrecon::decode::VulkanDecoder       decoder;
-        gfxrecon::decode::VulkanAsciiConsumer ascii_consumer;
+        gfxrecon::decode::BlockIndex block_index;
+        if (api_call_filter_enabled)
+        {
+            file_processor.SetApiCallFilter(&api_call_filter);
+
+            // When a block index has been written for the file with gfxrecon-index, the frames that precede the frame
+            // range are skipped without reading their blocks.
+            uint32_t first_frame = api_call_filter.GetFirstFrame();
+            if ((first_frame > 0) && file_processor.ReadBlockIndex(&block_index))
+            {
+                file_processor.SetBlockIndex(&block_index);
+                file_processor.SeekToFrame(first_frame);
+            }
+        }
 
+        gfxrecon::decode::VulkanAsciiConsumer ascii_consumer;
         ascii_consumer.Initialize(output_filename);
-        decoder.AddConsumer(&ascii_consumer);
 
-        file_processor.AddDecoder(&decoder);
-        file_processor.ProcessAllFrames();
+        if (thread_count == 1)
+        {
+            gfxrecon::decode::VulkanDecoder decoder;
+            decoder.AddConsumer(&ascii_consumer);
+
+            file_processor.AddDecoder(&decoder);
+            file_processor.ProcessAllFrames();
+        }
+        else
+        {
+            // The file is read and decompressed on this thread, while API calls are converted on the worker threads.
+            gfxrecon::decode::VulkanParallelAsciiDecoder decoder(&ascii_consumer, thread_count);
+
+            file_processor.AddDecoder(&decoder);
+            file_processor.ProcessAllFrames();
+            decoder.Finish();
+        }
     }
 
     gfxrecon::util::Log::Release();